@@ -7,6 +7,7 @@ from routershell.lib.common.router_shell_log_control import RouterShellLoggerSet
 from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
 from routershell.lib.network_manager.network_operations.arp import Arp
 from routershell.lib.network_manager.network_operations.interface import Interface
+from routershell.lib.network_manager.network_operations.nat import Nat
 from routershell.lib.system.system_start_up import SystemStartUp
 
 
@@ -26,6 +27,7 @@ class ClearMode(CmdPrompt):
 
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['arp'], append_nested_sub_cmds=['all'] + Interface().get_os_network_interfaces())
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['router-db'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'nat', 'translation'], append_nested_sub_cmds=['*', 'inside', 'interface', 'protocol'])
     def clearmode_clear(self, args: list):
 
         self.log.debug(f"Entering clear({args})")
@@ -37,6 +39,23 @@ class ClearMode(CmdPrompt):
             
             return Arp().arp_clear(interface)
                 
+        if args[:3] == ['ip', 'nat', 'translation']:
+            filters = [] if args[3:] == ['*'] else args[3:]
+
+            if not filters:
+                confirmation = input("Clear all NAT translations? (yes/no): ").strip().lower()
+                if confirmation != 'yes':
+                    print("Command canceled.")
+                    return STATUS_OK
+
+            try:
+                inside_address, interface_name, protocol = Nat.parse_translation_filter(filters)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return STATUS_OK
+
+            return Nat().clear_nat_translations(inside_address, interface_name, protocol)
+
         if 'router-db' in args[0]:
             self.log.debug("Clear RouterShell DB command")
                        
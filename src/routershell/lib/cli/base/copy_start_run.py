@@ -3,9 +3,11 @@ import logging
 from routershell.lib.cli.common.router_prompt import PromptFeeder, RouterPrompt
 from routershell.lib.cli.config.config import Configure
 from routershell.lib.common.common import Common
+from routershell.lib.common.config_change_bus import ConfigChangeBus
 from routershell.lib.common.constants import STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import FilePath, StatusResult
+from routershell.lib.system.system_service_control.system_service_control import AsyncServiceControl
 
 
 class CopyStartRunError(Exception):
@@ -52,6 +54,10 @@ class CopyStartRun(RouterPrompt):
         directory under the project's root directory. The method then processes the configuration
         file using PromptFeeder and initializes the system with the loaded configuration.
 
+        The configuration is replayed as one `ConfigChangeBus` batch, each service is reloaded
+        at most once after the last line, and the daemons are then started concurrently by
+        `AsyncServiceControl`.
+
         Args:
             startup_config_fname (str, optional): The startup configuration file name.
                 If None, the default 'startup-config.cfg' is used.
@@ -70,6 +76,8 @@ class CopyStartRun(RouterPrompt):
 
         pf = PromptFeeder(PromptFeeder.process_file(prompt_file))
         self.log.debug(f'{pf.__str__()}')
-        self.start(pf)
+
+        with AsyncServiceControl().batch(), ConfigChangeBus().batch():
+            self.start(pf)
 
         return STATUS_OK
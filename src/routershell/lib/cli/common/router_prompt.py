@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from time import sleep
 
@@ -9,6 +10,7 @@ from prompt_toolkit.history import InMemoryHistory
 
 from routershell.lib.cli.common.command_class_interface import CmdPrompt
 from routershell.lib.cli.common.exec_priv_mode import ExecMode
+from routershell.lib.common.config_change_bus import ConfigChangeBus
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.string_formats import StringFormats
@@ -264,7 +266,8 @@ class RouterPrompt:
         
         _ = self.session.prompt(f'{self.get_prompt()}',
                                 completer=self.completer, 
-                                complete_in_thread=False)
+                                complete_in_thread=False,
+                                pre_run=self._schedule_config_changes)
         
         # Check if the input contains any remark symbols, if so, skip line
         if any(_.startswith(symbol) for symbol in RouterPrompt.PROMPT_REMARK_SYMBOL):
@@ -286,6 +289,16 @@ class RouterPrompt:
                     
         return _.split(' ')
 
+    def _schedule_config_changes(self) -> None:
+        """
+        Flush the pending configuration changes once the debounce window expires while the
+        prompt waits for the next command, a command entered earlier, e.g. pasted, postpones it.
+        """
+        time_to_flush = ConfigChangeBus().time_to_flush()
+
+        if time_to_flush is not None:
+            asyncio.get_running_loop().call_later(time_to_flush, ConfigChangeBus().poll)
+
     def register_top_lvl_cmds(self, class_name: CmdPrompt) -> StatusResult:
         """
         Register top-level commands for the router prompt session.
@@ -529,6 +542,8 @@ class RouterPrompt:
                 self.log.debug('EOFError received, exiting...')
                 break
 
+        ConfigChangeBus().poll(force=True)
+
         return STATUS_OK
 
     def _get_command(self) -> list:
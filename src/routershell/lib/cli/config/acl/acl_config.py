@@ -0,0 +1,85 @@
+import logging
+
+from routershell.lib.cli.common.command_class_interface import CmdPrompt
+from routershell.lib.cli.common.exec_priv_mode import ExecMode
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import AclName, StatusResult
+from routershell.lib.network_manager.network_operations.access_control_list import AccessControlList
+from routershell.lib.network_manager.network_operations.acl_ruleset import AclProtocol
+
+
+class AclConfig(CmdPrompt):
+    """
+    Access-list configuration mode (`ip access-list <name>`).
+
+    Rules are appended in the order entered and evaluated first match wins,
+    with an implicit deny after the last rule:
+
+        permit|deny <protocol> <source> [eq <port>] <destination> [eq <port>]
+        no permit|deny ...
+        description <text>
+    """
+
+    def __init__(self, acl_name: AclName) -> None:
+        super().__init__(global_commands=True, exec_mode=ExecMode.CONFIG_MODE)
+        
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ACL_CONFIG)
+        self._acl = AccessControlList()
+        self._acl_name = acl_name
+        self.log.debug(f'AclConfig Started - Access-List: {acl_name}')
+               
+    def aclconfig_help(self, args: list=None) -> None:
+        """
+        Display help for available commands.
+        """
+        for method_name in self.class_methods():
+            method = getattr(self, method_name)
+            print(f"{method.__doc__}")
+    
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[protocol.value for protocol in AclProtocol])
+    def aclconfig_permit(self, args: list[str], negate: bool=False) -> StatusResult:
+        """permit <protocol> <source> [eq <port>] <destination> [eq <port>]"""
+        return self._update_rule(['permit'] + args, negate)
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[protocol.value for protocol in AclProtocol])
+    def aclconfig_deny(self, args: list[str], negate: bool=False) -> StatusResult:
+        """deny <protocol> <source> [eq <port>] <destination> [eq <port>]"""
+        return self._update_rule(['deny'] + args, negate)
+
+    @CmdPrompt.register_sub_commands()
+    def aclconfig_description(self, args: list[str], negate: bool=False) -> StatusResult:
+        """description <text>"""
+        self.log.debug(f'aclconfig_description -> {args}')
+        return self._acl.update_acl_description(self._acl_name, None if negate else ' '.join(args))
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['permit', 'deny', 'description'])
+    def aclconfig_no(self, args: list[str]) -> StatusResult:
+        
+        self.log.debug(f"aclconfig_no() -> Line -> {args}")
+
+        match args[0] if args else None:
+            case 'permit':
+                return self.aclconfig_permit(args[1:], negate=True)
+            case 'deny':
+                return self.aclconfig_deny(args[1:], negate=True)
+            case 'description':
+                return self.aclconfig_description(args[1:], negate=True)
+            case _:
+                self.print_invalid_cmd_response(f"No negate option for {args}")
+                return STATUS_NOK
+
+    def _update_rule(self, args: list[str], negate: bool) -> StatusResult:
+        self.log.debug(f'_update_rule -> {args} -> negate: {negate}')
+
+        if negate:
+            result = self._acl.delete_acl_rule(self._acl_name, args)
+        else:
+            result = self._acl.add_acl_rule(self._acl_name, args)
+
+        if result:
+            print(f"Error: unable to {'remove' if negate else 'add'} rule: {' '.join(args)}")
+            return STATUS_NOK
+
+        return STATUS_OK
@@ -0,0 +1,32 @@
+import logging
+
+from routershell.lib.cli.config.acl.acl_config import AclConfig
+from routershell.lib.cli.config.configure_prompt import ConfigurePrompt
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import AclName
+
+
+class AclConfigCmdError(Exception):
+    """Custom exception for AclConfigCmd errors."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'AclConfigCmdError: {self.message}'
+   
+class AclConfigCmd(ConfigurePrompt):
+
+    def __init__(self, acl_name: AclName):
+        super().__init__(sub_cmd_name='acl')
+        self.register_top_lvl_cmds(AclConfig(acl_name))
+        
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ACL_CONFIG_CMD)
+        self.log.debug(f'Starting Access-List config Command for: {acl_name}')
+    
+    def intro(self) -> str:
+        return 'Starting Access-List Config....'
+                    
+    def help(self):
+        pass
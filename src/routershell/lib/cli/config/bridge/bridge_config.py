@@ -4,8 +4,10 @@ import logging
 from routershell.lib.cli.common.command_class_interface import CmdPrompt
 from routershell.lib.cli.common.exec_priv_mode import ExecMode
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.number_check import NumberChecker
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import BridgeName, StatusResult
+from routershell.lib.network_manager.common.mac import MacServiceLayer
 from routershell.lib.network_manager.common.phy import State
 from routershell.lib.network_manager.network_interfaces.bridge.bridge_factory import (
     BridgeInterface,
@@ -13,6 +15,7 @@ from routershell.lib.network_manager.network_interfaces.bridge.bridge_factory im
 )
 from routershell.lib.network_manager.network_interfaces.bridge.bridge_protocols import STP_STATE
 from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.mac_address_table import MacAddressTableBatch
 
 
 class BridgeConfigError(Exception):
@@ -160,6 +163,144 @@ class BridgeConfig(CmdPrompt):
         
         return STATUS_OK
 
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['filtering'])
+    def bridgeconfig_vlan(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        Enable or disable VLAN filtering, making the bridge VLAN-aware.
+
+        With VLAN filtering enabled the switchport access and trunk VLANs of the
+        bridge ports are programmed as bridge VLAN entries.
+
+        Args:
+            args (list, optional): list of arguments for the command.
+            negate (bool, optional): If True, disables VLAN filtering.
+
+        Returns:
+            StatusResult: Status of the command execution.
+        """
+        if not args or args[0] != 'filtering':
+            print("Usage: vlan filtering")
+            return STATUS_NOK
+
+        if self._bridge_config_cmd.set_vlan_filtering(not negate):
+            print(f"Unable to set VLAN filtering to bridge {self._bridge_name}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['address-table'], append_nested_sub_cmds=['aging-time', 'learning', 'static'])
+    def bridgeconfig_mac(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        Manage the MAC address table of the bridge.
+
+        mac address-table aging-time <seconds>
+        [no] mac address-table learning
+        mac address-table static <mac-address> interface <interface> [vlan <vlan-id>]
+        no mac address-table static <mac-address> [vlan <vlan-id>]
+
+        Args:
+            args (list, optional): list of arguments for the command.
+            negate (bool, optional): If True, negates the command.
+
+        Returns:
+            StatusResult: Status of the command execution.
+        """
+        match (args or [])[1:] if args and args[0] == 'address-table' else None:
+            case ['aging-time'] if negate:
+                status = self._bridge_config_cmd.set_mac_aging_time(MacAddressTableBatch.AGING_TIME_DEFAULT)
+
+            case ['aging-time', seconds] if not negate and NumberChecker.is_string_int(seconds) and \
+                    MacAddressTableBatch.AGING_TIME_MIN <= int(seconds) <= MacAddressTableBatch.AGING_TIME_MAX:
+                status = self._bridge_config_cmd.set_mac_aging_time(int(seconds))
+
+            case ['learning']:
+                status = self._bridge_config_cmd.set_mac_learning(not negate)
+
+            case ['static', mac_address, *options] if MacServiceLayer().is_valid_mac_address(mac_address):
+                _, mac_address = MacServiceLayer().format_mac_address(mac_address)
+
+                match options:
+                    case ['interface', interface_name] if not negate:
+                        status = self._bridge_config_cmd.add_static_mac_address(mac_address, interface_name)
+                    case ['interface', interface_name, 'vlan', vlan_id] if not negate and NumberChecker.is_string_int(vlan_id):
+                        status = self._bridge_config_cmd.add_static_mac_address(mac_address, interface_name, int(vlan_id))
+                    case [] if negate:
+                        status = self._bridge_config_cmd.del_static_mac_address(mac_address)
+                    case ['vlan', vlan_id] if negate and NumberChecker.is_string_int(vlan_id):
+                        status = self._bridge_config_cmd.del_static_mac_address(mac_address, int(vlan_id))
+                    case _:
+                        print("Usage: [no] mac address-table static <mac-address> interface <interface> [vlan <vlan-id>]")
+                        return STATUS_NOK
+
+            case _:
+                print("Usage: mac address-table [aging-time <seconds> | learning | static <mac-address> ...]")
+                return STATUS_NOK
+
+        if status:
+            print(f"Unable to update the MAC address table of bridge {self._bridge_name}")
+
+        return status
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['snooping', 'querier', 'router-port'])
+    def bridgeconfig_multicast(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        Manage IGMP/MLD snooping of the bridge.
+
+        [no] multicast snooping
+        [no] multicast querier
+        [no] multicast router-port <interface>
+
+        Args:
+            args (list, optional): list of arguments for the command.
+            negate (bool, optional): If True, negates the command.
+
+        Returns:
+            StatusResult: Status of the command execution.
+        """
+        match args or []:
+            case ['snooping']:
+                status = self._bridge_config_cmd.set_multicast_snooping(not negate)
+
+            case ['querier']:
+                status = self._bridge_config_cmd.set_multicast_querier(not negate)
+
+            case ['router-port', interface_name] if negate:
+                status = self._bridge_config_cmd.del_multicast_router_port(interface_name)
+
+            case ['router-port', interface_name]:
+                status = self._bridge_config_cmd.add_multicast_router_port(interface_name)
+
+            case _:
+                print("Usage: [no] multicast [snooping | querier | router-port <interface>]")
+                return STATUS_NOK
+
+        if status:
+            print(f"Unable to update the multicast settings of bridge {self._bridge_name}")
+
+        return status
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['bypass'])
+    def bridgeconfig_netfilter(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        Bypass iptables, ip6tables and arptables (br_netfilter) for the frames bridged by the bridge.
+
+        Args:
+            args (list, optional): list of arguments for the command.
+            negate (bool, optional): If True, bridged frames traverse netfilter again.
+
+        Returns:
+            StatusResult: Status of the command execution.
+        """
+        if args != ['bypass']:
+            print("Usage: [no] netfilter bypass")
+            return STATUS_NOK
+
+        if self._bridge_config_cmd.set_netfilter_bypass(not negate):
+            print(f"Unable to set netfilter bypass to bridge {self._bridge_name}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
     @CmdPrompt.register_sub_commands()
     def bridgeconfig_shutdown(self, args: list[str] = None, negate: bool = False) -> StatusResult:
         """
@@ -184,6 +325,10 @@ class BridgeConfig(CmdPrompt):
         return STATUS_OK
       
     @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['description', 'shutdown'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['vlan', 'filtering'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['mac', 'address-table'], append_nested_sub_cmds=['aging-time', 'learning', 'static'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['multicast'], append_nested_sub_cmds=['snooping', 'querier', 'router-port'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['netfilter', 'bypass'])
     def bridgeconfig_no(self, args: list[str]) -> StatusResult:
         """Negate commands like description, shutdown, stp, or protocol for the bridge.
         
@@ -204,6 +349,18 @@ class BridgeConfig(CmdPrompt):
         elif 'description' in args:
             self.log.debug(f"Remove protocol -> {args}")
             self.bridgeconfig_description(None, negate)        
+
+        elif args[0] == 'mac':
+            return self.bridgeconfig_mac(args[1:], negate)
+
+        elif args[0] == 'multicast':
+            return self.bridgeconfig_multicast(args[1:], negate)
+
+        elif args[0] == 'netfilter':
+            return self.bridgeconfig_netfilter(args[1:], negate)
+
+        elif 'vlan' in args:
+            return self.bridgeconfig_vlan(args[1:], negate)
         
         else:
             print(f'error: invalid command: {args}')
@@ -2,20 +2,37 @@ import logging
 
 from routershell.lib.cli.common.command_class_interface import CmdPrompt
 from routershell.lib.cli.common.exec_priv_mode import ExecMode
+from routershell.lib.cli.config.acl.acl_config_cmd import AclConfigCmd
 from routershell.lib.cli.config.bridge.bridge_config_cmd import BridgeConfigCmd
 from routershell.lib.cli.config.dhcp.pool.dhcp_pool_config_cmd import DhcpPoolConfigCmd
 from routershell.lib.cli.config.ethernet.ethernet_config_cmd import EthernetConfigCmd
+from routershell.lib.cli.config.ethernet.ethernet_range_config_cmd import (
+    EthernetRangeConfigCmd,
+    EthernetRangeConfigCmdError,
+)
 from routershell.lib.cli.config.loopback.loopback_config_cmd import LoopbackConfigCmd
+from routershell.lib.cli.config.port_channel.port_channel_config_cmd import (
+    PortChannelConfigCmd,
+    PortChannelConfigCmdError,
+)
 from routershell.lib.cli.config.vlan.vlan_config_cmd import VlanConfigCmd
 from routershell.lib.common.common import Common
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.range_list import RangeList
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import InterfaceName, StatusResult
 from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.network_operations.access_control_list import AccessControlList
 from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.dns_cache import DnsCache
 from routershell.lib.network_manager.network_operations.interface import Interface
 from routershell.lib.network_manager.network_operations.nat import Nat
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
+from routershell.lib.network_manager.network_operations.policy_routing import PolicyRouting
+from routershell.lib.network_manager.network_operations.port_channel import PortChannel
+from routershell.lib.network_manager.network_operations.route import Route
+from routershell.lib.network_manager.network_operations.track import Track, TrackType
+from routershell.lib.network_manager.network_operations.vlan import Vlan
 from routershell.lib.network_services.common.network_ports import NetworkPorts
 from routershell.lib.system.system import System
 
@@ -37,13 +54,29 @@ class ConfigCmd(CmdPrompt):
             print(f"{method.__doc__}")
         return STATUS_OK
     
-    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=Interface().get_os_network_interfaces() + [InterfaceType.LOOPBACK.value])         
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=Interface().get_os_network_interfaces() + [InterfaceType.LOOPBACK.value, InterfaceType.PORT_CHANNEL.value])         
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['range'])
     def configcmd_interface(self, args: list[str]=None) -> StatusResult:
         self.log.debug(f'configcmd_interface -> {args}')
         
         interface_name = args[0]
 
-        if Common().is_loopback_if_name_valid(interface_name, add_loopback_if_name=['lo']):
+        if interface_name == 'range':
+            try:
+                EthernetRangeConfigCmd(interface_range=''.join(args[1:])).start()
+            except EthernetRangeConfigCmdError as e:
+                print(f'{e}')
+                return STATUS_NOK
+
+        elif PortChannel.is_port_channel_name_valid(interface_name):
+            self.log.debug(f'configcmd_interface() -> Port-Channel: {interface_name}')
+            try:
+                PortChannelConfigCmd(interface_name).start()
+            except PortChannelConfigCmdError as e:
+                print(f'{e}')
+                return STATUS_NOK
+
+        elif Common().is_loopback_if_name_valid(interface_name, add_loopback_if_name=['lo']):
             self.log.debug(f'configcmd_interface() -> Loopback: {interface_name}')
             LoopbackConfigCmd(loopback_name=args).start()
             
@@ -70,9 +103,26 @@ class ConfigCmd(CmdPrompt):
 
     @CmdPrompt.register_sub_commands()         
     def configcmd_vlan(self, vlan_id: list[str], negate: bool=False) -> StatusResult:
+        '''
+        vlan <vlan-id> | <vlan-list>, e.g. vlan 100-199,300
+        '''
         self.log.info(f'configcmd_vlan -> {vlan_id}')
-                
-        VlanConfigCmd(int(vlan_id[0]), negate).start()        
+
+        try:
+            vlan_ids = RangeList.parse(''.join(vlan_id), Vlan.VLAN_DEFAULT_START, Vlan.VLAN_MAX_ID)
+        except ValueError as e:
+            print(f'Invalid vlan: {e}')
+            return STATUS_NOK
+
+        if len(vlan_ids) > 1:
+            if not negate and Vlan().add_vlan_ids(vlan_ids):
+                print(f"Unable to add vlan {''.join(vlan_id)}")
+                return STATUS_NOK
+
+            VlanConfigCmd(vlan_ids, negate).start()
+            return STATUS_OK
+
+        VlanConfigCmd(vlan_ids[0], negate).start()        
         return STATUS_OK
     
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['telnet-server', 'port', '23'])
@@ -212,6 +262,145 @@ class ConfigCmd(CmdPrompt):
 
         return STATUS_OK
 
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[track_type.value for track_type in TrackType])
+    def configcmd_track(self, args: list[str], negate: bool=False) -> StatusResult:
+        """
+        [no] track <track-id> interface <interface>
+        [no] track <track-id> icmp <target> [source <interface>] [interval <ms>] [threshold <count>]
+        [no] track <track-id> arp <target> interface <interface> [interval <ms>] [threshold <count>]
+        """
+        self.log.debug(f'configcmd_track() -> {args} -> negate: {negate}')
+
+        if negate:
+            if not args or not args[0].isdigit():
+                print("Error: Missing track ID.")
+                return STATUS_NOK
+
+            if Track().del_track(int(args[0])):
+                print(f"Error: Unable to remove track {args[0]}, remove the static routes following it first")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        try:
+            config = Track.parse_track(args)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return STATUS_NOK
+
+        if Track().add_track(config):
+            print(f"Error: Unable to configure track {config.track_id}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['access-list'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['dns', 'cache'], append_nested_sub_cmds=['size', 'negative', 'ttl', 'forward-max'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['flow-offload'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['nat', 'inside', 'source', 'static'], append_nested_sub_cmds=['tcp', 'udp'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['policy'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['route'], append_nested_sub_cmds=['default', 'table'])
+    def configcmd_ip(self, args: list[str], negate: bool=False) -> StatusResult:
+        """
+        [no] ip access-list <acl-name>
+        [no] ip dns cache size <entries> | negative | ttl <seconds> | forward-max <queries>
+        [no] ip flow-offload
+        [no] ip nat inside source static <inside-ip> <outside-ip>
+        [no] ip nat inside source static tcp|udp <inside-ip> <inside-port> <outside-ip> <outside-port>
+        [no] ip policy <priority> [from <prefix>] [fwmark <mark>[/<mask>]] [iif <interface>] table <table>
+        [no] ip route [table <table>] <prefix>|default <next-hop-ip>|<interface> [weight <weight>] [metric <metric>] [track <track-id>]
+        """
+        self.log.debug(f'configcmd_ip() -> {args} -> negate: {negate}')
+
+        if args[:1] == ['access-list']:
+            if len(args) < 2:
+                print("Error: Missing access-list name.")
+                return STATUS_NOK
+
+            acl_name = args[1]
+
+            if AccessControlList().update_acl(acl_name, negate):
+                print(f"Error: Unable to {'delete' if negate else 'create'} access-list {acl_name}")
+                return STATUS_NOK
+
+            if not negate:
+                AclConfigCmd(acl_name).start()
+
+            return STATUS_OK
+
+        if args[:2] == ['dns', 'cache']:
+            try:
+                setting, value = DnsCache.parse_cache_setting(args[2:], negate)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return STATUS_NOK
+
+            if DnsCache().set_cache_setting(setting, value):
+                print(f"Error: Unable to {'reset' if negate else 'set'} DNS cache {setting.value}")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        if args[:1] == ['flow-offload']:
+            if Nat().set_flow_offload(negate):
+                print(f"Error: Unable to {'disable' if negate else 'enable'} flow offload")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        if args[:4] == ['nat', 'inside', 'source', 'static']:
+            try:
+                mapping = Nat.parse_static_mapping(args[4:])
+            except ValueError as e:
+                print(f"Error: {e}")
+                return STATUS_NOK
+
+            if Nat().create_static_nat(mapping, negate):
+                print(f"Error: Unable to {'remove' if negate else 'add'} static NAT: {' '.join(args[4:])}")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        if args[:1] == ['route']:
+            try:
+                route = Route.parse_static_route(args[1:])
+            except ValueError as e:
+                print(f"Error: {e}")
+                return STATUS_NOK
+
+            if Route().add_static_route(route, negate):
+                print(f"Error: Unable to {'remove' if negate else 'add'} static route: {' '.join(args[1:])}")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        if args[:1] == ['policy']:
+            if negate:
+                if len(args) < 2 or not args[1].isdigit():
+                    print("Error: Missing policy priority.")
+                    return STATUS_NOK
+
+                if PolicyRouting().del_policy(int(args[1])):
+                    print(f"Error: Unable to remove policy {args[1]}")
+                    return STATUS_NOK
+
+                return STATUS_OK
+
+            try:
+                rule = PolicyRouting.parse_policy(args[1:])
+            except ValueError as e:
+                print(f"Error: {e}")
+                return STATUS_NOK
+
+            if PolicyRouting().add_policy(rule):
+                print(f"Error: Unable to add policy {rule.priority}")
+                return STATUS_NOK
+
+            return STATUS_OK
+
+        print(f"Error: Invalid subcommand: {' '.join(args)}")
+        return STATUS_NOK
+
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['pool-name'])
     def configcmd_dhcp(self, args:list[str], negate: bool=False) -> StatusResult:
         if 'pool-name' in args:
@@ -222,6 +411,14 @@ class ConfigCmd(CmdPrompt):
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['bridge'] , 
                                      append_nested_sub_cmds=Bridge().get_bridge_list_os())
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['system'], append_nested_sub_cmds=['telnet-server', 'ssh-server'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['interface'], append_nested_sub_cmds=[InterfaceType.PORT_CHANNEL.value])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'access-list'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'dns', 'cache'], append_nested_sub_cmds=['size', 'negative', 'ttl', 'forward-max'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'flow-offload'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'nat', 'inside', 'source', 'static'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'policy'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['ip', 'route'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['track'])
     def configcmd_no(self, args: list) -> StatusResult:
                 
         if args[0] == 'bridge':
@@ -231,9 +428,23 @@ class ConfigCmd(CmdPrompt):
                 print(f"Unable to destroy bridge: {bridge_name}")
                 return STATUS_NOK
 
+        if args[0] == 'interface' and len(args) > 1 and PortChannel.is_port_channel_name_valid(args[1]):
+            self.log.debug(f"configcmd_no() -> port-channel: {args[1]}")
+            if PortChannel().del_port_channel(args[1]):
+                print(f"Unable to delete {args[1]}, remove its members first")
+                return STATUS_NOK
+
         if args[0] == 'system':
             self.log.debug(f"configcmd_no() -> system: {args[1]}")
             self.configcmd_system(args=args, negate=True)
 
+        if args[0] == 'ip':
+            self.log.debug(f"configcmd_no() -> ip: {args[1:]}")
+            return self.configcmd_ip(args[1:], negate=True)
+
+        if args[0] == 'track':
+            self.log.debug(f"configcmd_no() -> track: {args[1:]}")
+            return self.configcmd_track(args[1:], negate=True)
+
         return STATUS_OK
 
@@ -100,3 +100,38 @@ class DhcpPoolConfig(CmdPrompt):
             return STATUS_NOK        
         return self._dhcp_pool_fact.add_option(dhcp_option=args[0],
                                                   value=args[1])
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['alert'])
+    def dhcppoolconfig_utilization(self, args: list[str], negate: bool = False) -> StatusResult:
+        """
+        Raise a utilization alert when the pool occupancy exceeds a percent.
+
+        Syntax:
+            utilization alert <1-100>
+            no utilization alert
+
+        Returns:
+            StatusResult: STATUS_OK if the alert was updated successfully, STATUS_NOK otherwise.
+        """
+        if negate:
+            if args != ['alert']:
+                self.log.error('Usage: no utilization alert')
+                return STATUS_NOK
+            return self._dhcp_pool_fact.set_utilization_alert(None)
+
+        if len(args) != 2 or args[0] != 'alert' or not args[1].isdigit():
+            self.log.error('Usage: utilization alert <1-100>')
+            return STATUS_NOK
+
+        return self._dhcp_pool_fact.set_utilization_alert(int(args[1]))
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['utilization', 'alert'])
+    def dhcppoolconfig_no(self, args: list[str]) -> StatusResult:
+        """
+        Negate a DHCP pool setting.
+        """
+        if args[:1] == ['utilization']:
+            return self.dhcppoolconfig_utilization(args[1:], negate=True)
+
+        print(f"No negate option for {' '.join(args)}")
+        return STATUS_NOK
@@ -4,17 +4,22 @@ from routershell.lib.cli.common.command_class_interface import CmdPrompt
 from routershell.lib.cli.common.exec_priv_mode import ExecMode
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.number_check import NumberChecker
+from routershell.lib.common.range_list import RangeList
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.string_formats import StringFormats
 from routershell.lib.common.types import StatusResult
 from routershell.lib.network_manager.common.interface import InterfaceType
-from routershell.lib.network_manager.common.phy import Duplex, Speed, State
+from routershell.lib.network_manager.common.phy import CoalesceProfile, Duplex, Offload, PhyServiceLayer, Speed, State
 from routershell.lib.network_manager.network_interfaces.ethernet.ethernet_interface import EthernetInterface
+from routershell.lib.network_manager.network_operations.acl_ruleset import AclDirection
 from routershell.lib.network_manager.network_operations.arp import Encapsulate
 from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.bridge_vlan import SwitchportMode
+from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinityBatch
 from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client import DHCPStackVersion
 from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DHCPServer
 from routershell.lib.network_manager.network_operations.nat import NATDirection
+from routershell.lib.network_manager.network_operations.vlan import Vlan
 
 
 class EthernetConfigError(Exception):
@@ -94,6 +99,7 @@ class EthernetConfig(CmdPrompt):
                                      append_nested_sub_cmds=DHCPServer().get_dhcp_pool_name_list())
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['nat', 'inside', 'pool-name'])
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['nat', 'outside', 'pool-name'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['access-group'])
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['bridge', 'group'])
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['switchport', 'access-vlan-id'])        
     def ethernetconfig_ip(self, args: list[str], negate=False) -> StatusResult:
@@ -144,6 +150,22 @@ class EthernetConfig(CmdPrompt):
             self.log.debug(f"Set static-arp on Interface {self._interface_name} -> negate: {negate}") 
             return self.eth_interface_obj.add_static_arp(inet_address=ipv4_addr_arp, mac_addr=mac_addr_arp, negate=negate)
     
+        elif args[:1] == ['access-group']:
+            '''[no] [ip access-group <acl-name> in | out]'''
+            if len(args) != 3:
+                print("Error: expected 'ip access-group <acl-name> in | out'.")
+                return STATUS_NOK
+
+            try:
+                acl_direction = AclDirection(args[2])
+            except ValueError:
+                print(f"Error: Invalid access-group direction '{args[2]}'. Use 'in' or 'out'.")
+                return STATUS_NOK
+
+            if self.eth_interface_obj.set_access_group(args[1], acl_direction, negate):
+                self.log.error(f"Unable to set access-group {args[1]} {acl_direction.value} on interface: {self._interface_name}")
+                return STATUS_NOK
+
         elif "nat" in args:
             
             if args[1] in ['inside', 'outside']:
@@ -330,6 +352,137 @@ class EthernetConfig(CmdPrompt):
 
         return STATUS_OK
     
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['group'])
+    def ethernetconfig_channel(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        [no] channel group <port-channel-name>
+        """
+        if not args or args[0] != 'group' or len(args) != 2:
+            self.print_invalid_cmd_response(args)
+            return STATUS_NOK
+
+        port_channel_name = args[1]
+
+        if negate:
+            status = self.eth_interface_obj.del_port_channel_group(port_channel_name)
+        else:
+            status = self.eth_interface_obj.set_port_channel_group(port_channel_name)
+
+        if status:
+            self.print_error_response(f"unable to {'remove' if negate else 'add'} interface {self._interface_name} "
+                                      f"{'from' if negate else 'to'} {port_channel_name}")
+
+        return status
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['affinity'], append_nested_sub_cmds=['auto', 'cpus', 'rfs-flow-entries'])
+    def ethernetconfig_cpu(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        [no] cpu affinity [auto | cpus <cpu-list>] [rfs-flow-entries <entries>]
+        """
+        if not args or args[0] != 'affinity':
+            self.print_invalid_cmd_response(args)
+            return STATUS_NOK
+
+        if negate:
+            status = self.eth_interface_obj.set_cpu_affinity(negate=True)
+
+        else:
+            cpus, rfs_flow_entries, options = None, None, args[1:]
+
+            try:
+                while options:
+                    match options:
+                        case ['auto', *options]:
+                            cpus = None
+                        case ['cpus', cpu_list, *options]:
+                            cpus = RangeList.parse(cpu_list, 0, CpuAffinityBatch.MAX_CPU)
+                        case ['rfs-flow-entries', entries, *options] if NumberChecker.is_string_int(entries) and int(entries) > 0:
+                            rfs_flow_entries = int(entries)
+                        case _:
+                            raise ValueError(f"Invalid option: {' '.join(options)}")
+
+            except ValueError as e:
+                self.print_error_response(f'{e}')
+                return STATUS_NOK
+
+            status = self.eth_interface_obj.set_cpu_affinity(cpus, rfs_flow_entries)
+
+        if status:
+            self.print_error_response(f'unable to set cpu affinity on interface {self._interface_name}')
+
+        return status
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[o.value for o in Offload])
+    def ethernetconfig_offload(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        [no] offload <gro | gso | tso | lro>
+        """
+        offload_values = {o.value: o for o in Offload}
+
+        if not args or len(args) != 1 or args[0].lower() not in offload_values:
+            print(f"Usage: [no] offload <{' | '.join(offload_values)}>")
+            return STATUS_NOK
+
+        offload = offload_values[args[0].lower()]
+
+        if self.eth_interface_obj.set_offload(offload, negate):
+            self.print_error_response(f'unable to {"disable" if negate else "enable"} {offload.value} '
+                                      f'on interface {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['rx', 'tx'])
+    def ethernetconfig_ring(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        ring [rx <descriptors | max>] [tx <descriptors | max>]
+        no ring [rx] [tx]
+        """
+        sizes = {}
+        options = list(args or [])
+
+        while options:
+            match options:
+                case [('rx' | 'tx') as direction, *options] if negate:
+                    sizes[direction] = direction
+                case [('rx' | 'tx') as direction, size, *options] if (
+                        size == PhyServiceLayer.RING_SIZE_MAX or (NumberChecker.is_string_int(size) and int(size) > 0)):
+                    sizes[direction] = size
+                case _:
+                    print("Usage: ring [rx <descriptors | max>] [tx <descriptors | max>]")
+                    return STATUS_NOK
+
+        if not negate and not sizes:
+            print("Usage: ring [rx <descriptors | max>] [tx <descriptors | max>]")
+            return STATUS_NOK
+
+        if self.eth_interface_obj.set_ring_size(sizes.get('rx'), sizes.get('tx'), negate):
+            self.print_error_response(f'unable to set ring size on interface {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[p.value for p in CoalesceProfile])
+    def ethernetconfig_coalesce(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        coalesce <adaptive | latency | throughput>
+        no coalesce
+        """
+        profile_values = {p.value: p for p in CoalesceProfile}
+
+        if negate:
+            return self.eth_interface_obj.set_coalesce(None)
+
+        if not args or len(args) != 1 or args[0].lower() not in profile_values:
+            print(f"Usage: coalesce <{' | '.join(profile_values)}>")
+            return STATUS_NOK
+
+        if self.eth_interface_obj.set_coalesce(profile_values[args[0].lower()]):
+            self.print_error_response(f'unable to set coalescing profile on interface {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
     @CmdPrompt.register_sub_commands()    
     def ethernetconfig_shutdown(self, args=None, negate=False) -> StatusResult:
 
@@ -340,9 +493,40 @@ class EthernetConfig(CmdPrompt):
         return STATUS_OK
     
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['access-vlan'])    
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['mode'], append_nested_sub_cmds=['access', 'trunk'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['trunk', 'allowed', 'vlan'], append_nested_sub_cmds=['add', 'remove', 'all'])
     def ethernetconfig_switchport(self, args=None, negate=False) -> StatusResult:
-        
-        if 'access-vlan' in args:
+        '''
+        [no] switchport access-vlan <vlan-id>
+        [no] switchport mode [access | trunk]
+        [no] switchport trunk allowed vlan [add | remove] <vlan-list> | all
+        '''
+        if args and args[0] == 'mode':
+            mode = SwitchportMode.ACCESS if negate or len(args) < 2 else None
+
+            if mode is None:
+                try:
+                    mode = SwitchportMode(args[1])
+                except ValueError:
+                    self.print_invalid_cmd_response(args)
+                    return STATUS_NOK
+
+            if self.eth_interface_obj.set_switchport_mode(mode):
+                self.print_error_response(f'unable to set switchport mode {mode.value}')
+                return STATUS_NOK
+
+        elif args and args[:3] == ['trunk', 'allowed', 'vlan']:
+            try:
+                vlan_ids, add, remove = Vlan.parse_trunk_allowed_vlans(args[3:], negate)
+            except ValueError as e:
+                self.print_error_response(f'{e}')
+                return STATUS_NOK
+
+            if self.eth_interface_obj.set_trunk_allowed_vlans(vlan_ids, add=add, remove=remove):
+                self.print_error_response('unable to set switchport trunk allowed vlan')
+                return STATUS_NOK
+
+        elif 'access-vlan' in args:
             vlan_id = args[1]
             self.log.info(f"Configuring switchport as access with vlan-id: {vlan_id}")
             
@@ -358,7 +542,7 @@ class EthernetConfig(CmdPrompt):
     def ethernetconfig_wireless(self, args=None, negate:bool=False) -> StatusResult:
        return STATUS_OK
     
-    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['shutdown', 'description', 'bridge', 'ip', 'switchport'])    
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['shutdown', 'description', 'bridge', 'channel', 'cpu', 'offload', 'ring', 'coalesce', 'ip', 'switchport'])    
     def ethernetconfig_no(self, args: list) -> StatusResult:
         
         self.log.debug(f"ethernetconfig_no() -> Line -> {args}")
@@ -373,6 +557,26 @@ class EthernetConfig(CmdPrompt):
             self.log.debug(f"Remove bridge -> ({args})")
             self.ethernetconfig_bridge(args[1:], negate=True)
         
+        elif start_cmd == 'channel':
+            self.log.debug(f"Remove channel group -> ({args})")
+            return self.ethernetconfig_channel(args[1:], negate=True)
+
+        elif start_cmd == 'cpu':
+            self.log.debug(f"Remove cpu affinity -> ({args})")
+            return self.ethernetconfig_cpu(args[1:], negate=True)
+
+        elif start_cmd == 'offload':
+            self.log.debug(f"Disable offload -> ({args})")
+            return self.ethernetconfig_offload(args[1:], negate=True)
+
+        elif start_cmd == 'ring':
+            self.log.debug(f"Remove ring size -> ({args})")
+            return self.ethernetconfig_ring(args[1:], negate=True)
+
+        elif start_cmd == 'coalesce':
+            self.log.debug(f"Remove coalescing profile -> ({args})")
+            return self.ethernetconfig_coalesce(args[1:], negate=True)
+
         elif start_cmd == 'ip':
             self.log.debug(f"Remove ip -> ({args})")
             self.ethernetconfig_ip(args[1:], negate=True)
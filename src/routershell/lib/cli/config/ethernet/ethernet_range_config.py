@@ -0,0 +1,168 @@
+import logging
+
+from routershell.lib.cli.common.command_class_interface import CmdPrompt
+from routershell.lib.cli.common.exec_priv_mode import ExecMode
+from routershell.lib.cli.config.ethernet.ethernet_config import EthernetConfig
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.number_check import NumberChecker
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.string_formats import StringFormats
+from routershell.lib.common.types import StatusResult
+from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.common.phy import State
+from routershell.lib.network_manager.network_interfaces.network_interface_factory import NetInterfaceFactory
+from routershell.lib.network_manager.network_operations.bridge_vlan import SwitchportMode
+from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
+from routershell.lib.network_manager.network_operations.vlan import Vlan
+
+
+class EthernetRangeConfig(CmdPrompt):
+    """
+    Configuration mode of `interface range <range>`.
+
+    `shutdown`, `description` and `switchport` are applied to the whole range at once,
+    see `InterfaceRange`; every other Ethernet command is replayed on each interface.
+    """
+
+    BATCHED_COMMANDS = ['shutdown', 'description', 'switchport']
+
+    def __init__(self, interface_range: InterfaceRange) -> None:
+        super().__init__(global_commands=True, exec_mode=ExecMode.PRIV_MODE)
+
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ETHERNET_CONFIG)
+        self._interface_range = interface_range
+        self._ethernet_configs: list[EthernetConfig] = []
+
+        self.log.debug(f'Ethernet range: {interface_range.get_interface_names()}')
+
+    def get_command_list(self) -> list:
+        prefix = f'{EthernetConfig.__name__.lower()}_'
+        ethernet_cmds = [name[len(prefix):] for name in dir(EthernetConfig) if name.startswith(prefix)]
+        return sorted(set(super().get_command_list() + ethernet_cmds))
+
+    def get_command_dict(self, skip_top_key: bool = False) -> dict:
+        cmd_dict = dict(CmdPrompt._nested_word_complete_cmd_dict.get(EthernetConfig.__name__.lower(), {}))
+        cmd_dict.update(CmdPrompt._nested_word_complete_cmd_dict.get(self.CLASS_NAME, {}))
+        return cmd_dict if skip_top_key else {self.CLASS_NAME: cmd_dict}
+
+    def execute(self, commands: list) -> StatusResult:
+        """
+        Run a batched range command, or replay an Ethernet command on every interface of the range.
+        """
+        if not commands:
+            return STATUS_NOK
+
+        if commands[0] in self.BATCHED_COMMANDS or (commands[0] == 'no' and commands[1:2] and commands[1] in self.BATCHED_COMMANDS):
+            return super().execute(commands)
+
+        if commands[0] in ('help', '?'):
+            return super().execute(commands)
+
+        status = STATUS_OK
+
+        for ethernet_config in self._get_ethernet_configs():
+            if ethernet_config.execute(commands):
+                status = STATUS_NOK
+
+        return status
+
+    def ethernetrangeconfig_help(self, args: list = None) -> None:
+        """
+        Display help for available commands.
+        """
+        for method_name in self.class_methods():
+            method = getattr(self, method_name)
+            print(f"{method.__doc__}")
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands()
+    def ethernetrangeconfig_description(self, args: list[str] | None, negate: bool = False) -> StatusResult:
+        """
+        [no] description <text>
+        """
+        description = "" if negate else StringFormats.list_to_string(args or [])
+
+        if self._interface_range.update_description(description):
+            self.print_error_response('unable to set description')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands()
+    def ethernetrangeconfig_shutdown(self, args: list[str] | None = None, negate: bool = False) -> StatusResult:
+        """
+        [no] shutdown
+        """
+        if self._interface_range.update_shutdown(State.UP if negate else State.DOWN):
+            self.print_error_response('unable to change interface state')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['access-vlan'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['mode'], append_nested_sub_cmds=['access', 'trunk'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['trunk', 'allowed', 'vlan'], append_nested_sub_cmds=['add', 'remove', 'all'])
+    def ethernetrangeconfig_switchport(self, args: list[str] | None = None, negate: bool = False) -> StatusResult:
+        """
+        [no] switchport access-vlan <vlan-id>
+        [no] switchport mode [access | trunk]
+        [no] switchport trunk allowed vlan [add | remove] <vlan-list> | all
+        """
+        args = args or []
+
+        if args[:1] == ['mode']:
+            try:
+                mode = SwitchportMode.ACCESS if negate or len(args) < 2 else SwitchportMode(args[1])
+            except ValueError:
+                self.print_invalid_cmd_response(args)
+                return STATUS_NOK
+
+            status = self._interface_range.set_switchport_mode(mode)
+
+        elif args[:3] == ['trunk', 'allowed', 'vlan']:
+            try:
+                vlan_ids, add, remove = Vlan.parse_trunk_allowed_vlans(args[3:], negate)
+            except ValueError as e:
+                self.print_error_response(f'{e}')
+                return STATUS_NOK
+
+            status = self._interface_range.set_trunk_allowed_vlans(vlan_ids, add=add, remove=remove)
+
+        elif args[:1] == ['access-vlan'] and not negate and len(args) == 2 and NumberChecker.is_string_int(args[1]):
+            status = self._interface_range.set_access_vlan(int(args[1]))
+
+        else:
+            self.print_invalid_cmd_response(args)
+            return STATUS_NOK
+
+        if status:
+            self.print_error_response(f"unable to set switchport {' '.join(args)}")
+
+        return status
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=BATCHED_COMMANDS)
+    def ethernetrangeconfig_no(self, args: list[str]) -> StatusResult:
+        """
+        no [shutdown | description | switchport ...]
+        """
+        match args[0]:
+            case 'shutdown':
+                return self.ethernetrangeconfig_shutdown(None, negate=True)
+            case 'description':
+                return self.ethernetrangeconfig_description(None, negate=True)
+            case 'switchport':
+                return self.ethernetrangeconfig_switchport(args[1:], negate=True)
+
+        self.print_invalid_cmd_response(f"No negate option for {args[0]}")
+        return STATUS_NOK
+
+    def _get_ethernet_configs(self) -> list[EthernetConfig]:
+        if not self._ethernet_configs:
+            self._ethernet_configs = [
+                EthernetConfig(eth_interface_obj=NetInterfaceFactory(interface_name, InterfaceType.ETHERNET)
+                               .getNetInterface(interface_name=interface_name))
+                for interface_name in self._interface_range.get_interface_names()]
+
+        return self._ethernet_configs
@@ -0,0 +1,41 @@
+import logging
+
+from routershell.lib.cli.config.configure_prompt import ConfigurePrompt
+from routershell.lib.cli.config.ethernet.ethernet_range_config import EthernetRangeConfig
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
+
+
+class EthernetRangeConfigCmdError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'EthernetRangeConfigCmdError: {self.message}'
+
+class EthernetRangeConfigCmd(ConfigurePrompt):
+    def __init__(self, interface_range: str):
+        super().__init__(sub_cmd_name=InterfaceType.ETHERNET.value)
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ETHERNET_CONFIG_CMD)
+        self.log.debug(f'EthernetRangeConfigCmd() -> Interface range: {interface_range}')
+
+        try:
+            if_range = InterfaceRange(InterfaceRange.parse(interface_range))
+        except ValueError as e:
+            raise EthernetRangeConfigCmdError(f'{e}')
+
+        missing = if_range.validate()
+
+        if missing:
+            raise EthernetRangeConfigCmdError(f"Invalid interface(s): {', '.join(missing)}")
+
+        self.register_top_lvl_cmds(EthernetRangeConfig(interface_range=if_range))
+
+    def intro(self) -> str:
+        return 'Starting Ethernet Range Configuration'
+
+    def help(self):
+        pass
@@ -0,0 +1,153 @@
+import logging
+
+from routershell.lib.cli.common.command_class_interface import CmdPrompt
+from routershell.lib.cli.common.exec_priv_mode import ExecMode
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import StatusResult
+from routershell.lib.network_manager.common.phy import State
+from routershell.lib.network_manager.network_interfaces.port_channel.port_channel_interface import PortChannelInterface
+from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.port_channel import BondMode, LacpRate, XmitHashPolicy
+
+
+class PortChannelConfig(CmdPrompt):
+    """
+    Configuration mode of `interface port-channel<N>`.
+    """
+
+    def __init__(self, port_channel_interface_obj: PortChannelInterface) -> None:
+        super().__init__(global_commands=True, exec_mode=ExecMode.PRIV_MODE)
+
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().PORT_CHANNEL_CONFIG)
+        self._pc = port_channel_interface_obj
+        self._interface_name = port_channel_interface_obj.get_interface_name()
+
+    def portchannelconfig_help(self, args: list = None) -> None:
+        """
+        Display help for available commands.
+        """
+        for method_name in self.class_methods():
+            method = getattr(self, method_name)
+            print(f"{method.__doc__}")
+
+    @CmdPrompt.register_sub_commands()
+    def portchannelconfig_description(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] description <text>
+        """
+        description = "" if negate or not args else " ".join(args)
+
+        if self._pc.set_description(description):
+            self.print_error_response(f'unable to set description on {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=[mode.value for mode in BondMode])
+    def portchannelconfig_mode(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] mode [802.3ad | balance-xor | active-backup]
+        """
+        try:
+            mode = BondMode.IEEE_802_3AD if negate else BondMode(args[0])
+        except (ValueError, IndexError, TypeError):
+            self.print_invalid_cmd_response(f"mode. Use {', '.join(mode.value for mode in BondMode)}")
+            return STATUS_NOK
+
+        if self._pc.set_mode(mode):
+            self.print_error_response(f'unable to set mode {mode.value} on {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['hash-policy'],
+                                     append_nested_sub_cmds=[policy.value for policy in XmitHashPolicy])
+    def portchannelconfig_xmit(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] xmit hash-policy [layer2 | layer2+3 | layer3+4 | encap2+3 | encap3+4]
+        """
+        try:
+            if not args or args[0] != 'hash-policy':
+                raise ValueError
+            policy = XmitHashPolicy.LAYER2 if negate else XmitHashPolicy(args[1])
+        except (ValueError, IndexError):
+            self.print_invalid_cmd_response(f"xmit hash-policy. Use {', '.join(policy.value for policy in XmitHashPolicy)}")
+            return STATUS_NOK
+
+        if self._pc.set_xmit_hash_policy(policy):
+            self.print_error_response(f'unable to set xmit hash-policy {policy.value} on {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['rate'], append_nested_sub_cmds=[rate.value for rate in LacpRate])
+    def portchannelconfig_lacp(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] lacp rate [slow | fast]
+        """
+        try:
+            if not args or args[0] != 'rate':
+                raise ValueError
+            rate = LacpRate.SLOW if negate else LacpRate(args[1])
+        except (ValueError, IndexError):
+            self.print_invalid_cmd_response("lacp rate. Use slow or fast")
+            return STATUS_NOK
+
+        if self._pc.set_lacp_rate(rate):
+            self.print_error_response(f'unable to set lacp rate {rate.value} on {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['group'], append_nested_sub_cmds=Bridge().get_bridge_list_os())
+    def portchannelconfig_bridge(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] bridge group <bridge-name>
+        """
+        if not args or args[0] != 'group' or len(args) != 2:
+            self.print_invalid_cmd_response(args)
+            return STATUS_NOK
+
+        status = self._pc.del_bridge_group(args[1]) if negate else self._pc.set_bridge_group(args[1])
+
+        if status:
+            self.print_error_response(f'unable to update bridge group {args[1]} on {self._interface_name}')
+
+        return status
+
+    @CmdPrompt.register_sub_commands()
+    def portchannelconfig_shutdown(self, args: list[str] = None, negate: bool = False) -> StatusResult:
+        """
+        [no] shutdown
+        """
+        if self._pc.set_shutdown_status(State.UP if negate else State.DOWN):
+            self.print_error_response(f'unable to change state of {self._interface_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['description', 'mode', 'bridge', 'shutdown'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['xmit', 'hash-policy'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['lacp', 'rate'])
+    def portchannelconfig_no(self, args: list[str]) -> StatusResult:
+        """
+        no [description | mode | xmit hash-policy | lacp rate | bridge group <bridge-name> | shutdown]
+        """
+        match args[0] if args else None:
+            case 'description':
+                return self.portchannelconfig_description(None, negate=True)
+            case 'mode':
+                return self.portchannelconfig_mode(None, negate=True)
+            case 'xmit':
+                return self.portchannelconfig_xmit(['hash-policy'], negate=True)
+            case 'lacp':
+                return self.portchannelconfig_lacp(['rate'], negate=True)
+            case 'bridge':
+                return self.portchannelconfig_bridge(args[1:], negate=True)
+            case 'shutdown':
+                return self.portchannelconfig_shutdown(None, negate=True)
+
+        self.print_invalid_cmd_response(f"No negate option for {args}")
+        return STATUS_NOK
@@ -0,0 +1,38 @@
+import logging
+
+from routershell.lib.cli.config.configure_prompt import ConfigurePrompt
+from routershell.lib.cli.config.port_channel.port_channel_config import PortChannelConfig
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName
+from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.network_interfaces.port_channel.port_channel_interface import (
+    PortChannelInterface,
+    PortChannelInterfaceError,
+)
+
+
+class PortChannelConfigCmdError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'PortChannelConfigCmdError: {self.message}'
+
+class PortChannelConfigCmd(ConfigurePrompt):
+    def __init__(self, port_channel_name: InterfaceName):
+        super().__init__(sub_cmd_name=InterfaceType.PORT_CHANNEL.value)
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().PORT_CHANNEL_CONFIG_CMD)
+        self.log.debug(f'PortChannelConfigCmd() -> {port_channel_name}')
+
+        try:
+            self.register_top_lvl_cmds(PortChannelConfig(PortChannelInterface(port_channel_name)))
+        except PortChannelInterfaceError as e:
+            raise PortChannelConfigCmdError(f'{e}')
+
+    def intro(self) -> str:
+        return 'Starting Port-Channel Config....'
+
+    def help(self):
+        pass
@@ -2,23 +2,26 @@ import logging
 
 from routershell.lib.cli.common.command_class_interface import CmdPrompt
 from routershell.lib.cli.common.exec_priv_mode import ExecMode
-from routershell.lib.common.constants import STATUS_NOK
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import StatusResult
-from routershell.lib.network_manager.network_interfaces.vlan.vlan_mangement import VlanMangement
+from routershell.lib.network_manager.network_interfaces.vlan.vlan_mangement import VlanMangement, VlanRangeMangement
 
 
 class VlanConfig(CmdPrompt):
 
-    def __init__(self, vlan_id: int, negate: bool=False) -> None:
+    def __init__(self, vlan_id: int | list[int], negate: bool=False) -> None:
         """
         Initializes Global instance.
+
+        Args:
+            vlan_id (int | list[int]): The VLAN ID, or the VLAN IDs of `vlan <vlan-list>`.
         """
         super().__init__(global_commands=True, exec_mode=ExecMode.CONFIG_MODE)
         
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().VLAN_MGT)
-        self._vlan_mgt = VlanMangement(vlan_id)
+        self._vlan_mgt = VlanRangeMangement(vlan_id) if isinstance(vlan_id, list) else VlanMangement(vlan_id)
         self._vlan_id = vlan_id
         self.log.debug(f'VlanConfig Started - VlanID: {vlan_id}')
                
@@ -34,7 +37,13 @@ class VlanConfig(CmdPrompt):
     def vlanconfig_name(self, args: list) -> StatusResult:
         self.log.debug(f'vlanconfig_name -> {args}')
         if len(args):
-            return self._vlan_mgt.set_name(args[0])
+            if self._vlan_mgt.set_name(args[0]):
+                if isinstance(self._vlan_mgt, VlanRangeMangement):
+                    self.print_error_response('a name can only be set on a single VLAN')
+                else:
+                    self.print_error_response(f'unable to set name {args[0]} on vlan {self._vlan_id}')
+                return STATUS_NOK
+            return STATUS_OK
         else:
             self.print_invalid_cmd_response(args)
             return STATUS_NOK
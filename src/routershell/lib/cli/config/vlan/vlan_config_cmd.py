@@ -16,7 +16,7 @@ class VlanConfigCmdError(Exception):
    
 class VlanConfigCmd(ConfigurePrompt):
 
-    def __init__(self, vlan_id:int, negate:bool = False):
+    def __init__(self, vlan_id: int | list[int], negate:bool = False):
         super().__init__(sub_cmd_name='vlan')
         self.register_top_lvl_cmds(VlanConfig(vlan_id, negate))
         
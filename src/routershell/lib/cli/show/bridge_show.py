@@ -4,7 +4,10 @@ import logging
 from tabulate import tabulate
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.number_check import NumberChecker
 from routershell.lib.common.types import StatusResult
+from routershell.lib.network_manager.common.bridge_fdb import BridgeFdb, BridgeFdbError, FdbFilter, FdbStatistics
+from routershell.lib.network_manager.common.mac import MacServiceLayer
 from routershell.lib.network_manager.common.run_commands import RunCommand
 from routershell.lib.network_manager.network_operations.bridge import Bridge
 
@@ -20,6 +23,96 @@ class BridgeShow(RunCommand):
     def bridge(self, arg=None):
         Bridge().get_bridge()
 
+    @staticmethod
+    def parse_mac_address_table_filter(args: list[str]) -> tuple[FdbFilter, bool]:
+        """
+        Parse `[bridge <name>] [interface <name>] [vlan <id>] [address <mac>] [dynamic | static] [count]`.
+
+        Returns:
+            tuple[FdbFilter, bool]: The filter and whether only the counts are requested.
+
+        Raises:
+            ValueError: On an invalid option.
+        """
+        options: dict[str, object] = {}
+        count = False
+
+        while args:
+            match args:
+                case ['bridge', bridge_name, *args]:
+                    options['bridge_name'] = bridge_name
+                case ['interface', interface_name, *args]:
+                    options['interface_name'] = interface_name
+                case ['vlan', vlan_id, *args] if NumberChecker.is_string_int(vlan_id):
+                    options['vlan_id'] = int(vlan_id)
+                case ['address', mac_address, *args] if MacServiceLayer().is_valid_mac_address(mac_address):
+                    options['mac_address'] = MacServiceLayer().format_mac_address(mac_address)[1]
+                case [(BridgeFdb.ENTRY_DYNAMIC | BridgeFdb.ENTRY_STATIC) as entry_type, *args]:
+                    options['entry_type'] = entry_type
+                case ['count', *args]:
+                    count = True
+                case _:
+                    raise ValueError(f"Invalid option: {' '.join(args)}")
+
+        return FdbFilter(**options), count
+
+    def show_mac_address_table(self, args: list[str] | None = None) -> StatusResult:
+        """
+        Print the MAC address tables of the bridges, or their entry counts, row by row as the
+        kernel dump is received.
+        """
+        try:
+            fdb_filter, count = self.parse_mac_address_table_filter(args or [])
+        except ValueError as e:
+            print(f"Error: {e}")
+            return STATUS_NOK
+
+        row = "{:<6} {:<19} {:<9} {:<16} {:<16} {:>6}"
+        statistics = FdbStatistics()
+
+        if not count:
+            print(row.format('Vlan', 'Mac Address', 'Type', 'Ports', 'Bridge', 'Age'))
+            print(row.format('----', '-----------', '----', '-----', '------', '---'))
+
+        try:
+            for entry in Bridge().get_mac_address_table(fdb_filter):
+                statistics.add(entry)
+
+                if not count:
+                    print(row.format('-' if entry.vlan_id is None else entry.vlan_id, entry.mac_address,
+                                     entry.entry_type, entry.interface_name, entry.bridge_name,
+                                     entry.age if entry.entry_type == BridgeFdb.ENTRY_DYNAMIC else '-'))
+
+        except BridgeFdbError as e:
+            print(f"Error: {e}")
+            return STATUS_NOK
+
+        if count:
+            for bridge_name, counts in sorted(statistics.bridges.items()):
+                print(f"Bridge {bridge_name}: " +
+                      ', '.join(f"{counts[entry_type]} {entry_type}" for entry_type in BridgeFdb.ENTRY_TYPES))
+
+        print(f"Total Mac Addresses: {statistics.entries}")
+        return STATUS_OK
+
+    def show_multicast_groups(self, bridge_name: str | None = None) -> StatusResult:
+        """
+        Print the multicast groups learned by IGMP/MLD snooping, or configured, and the multicast
+        router ports of the bridges.
+        """
+        entries, router_ports = Bridge().get_multicast_groups(bridge_name)
+
+        print(tabulate([[entry.bridge_name, entry.group, entry.interface_name,
+                         '-' if entry.vlan_id is None else entry.vlan_id, entry.state, entry.timer or '-']
+                        for entry in entries],
+                       headers=['Bridge', 'Group', 'Port', 'Vlan', 'State', 'Expires'], tablefmt='simple'))
+
+        for name, ports in sorted(router_ports.items()):
+            print(f"Bridge {name} multicast router ports: {', '.join(ports)}")
+
+        print(f"Total Multicast Groups: {len(entries)}")
+        return STATUS_OK
+
     def show_bridge_group_interface_table(self) -> StatusResult:
         
         json_data = self.run(['ip', '-json', 'addr'])
@@ -2,10 +2,14 @@ import logging
 
 from tabulate import tabulate
 
+from routershell.lib.cli.show.log_show import LogShow
 from routershell.lib.common.common import Common
 from routershell.lib.common.constants import STATUS_OK
+from routershell.lib.network_manager.common.mac import MacServiceLayer
 from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client import DHCPClient
+from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_pool_utilization import DhcpPoolUtilization
 from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DhcpServerManager
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DhcpLease, DnsmasqLeaseStore
 
 
 class DHCPClientShow:
@@ -16,15 +20,27 @@ class DHCPClientShow:
         self.log = logging.getLogger(self.__class__.__name__)
         self.args = args
     
-    def flow_log(self) -> list[str]:
+    def flow_log(self, args: list[str] | None = None) -> list[str]:
         """
         Retrieve DHCP client flow logs related to IPv4 address assignment from the system journal.
 
+        Syntax:
+            show dhcp client log [last <count> | follow]
+
         Returns:
             list[str]: A list of DHCP client flow log entries related to IPv4 address assignment.
         """
+        try:
+            count, follow = LogShow.parse_args(args)
+        except ValueError as e:
+            print(f"{e}, usage: show dhcp client log {LogShow.USAGE}")
+            return
+
+        if follow:
+            LogShow(DHCPClient.flow_log_reader(), 'show-dhcp-client-log').follow(count)
+            return
 
-        parsed_logs = [log for log in DHCPClient.get_flow_log() if log]
+        parsed_logs = [log for log in DHCPClient.get_flow_log(count, 'show-dhcp-client-log') if log]
         
         if parsed_logs:
             headers = list(parsed_logs[0].keys())
@@ -34,6 +50,33 @@ class DHCPClientShow:
         else:
             print("No valid log entries found.")
         
+    def client_status(self, args: list[str] | None = None) -> None:
+        """
+        Display the state and the lease of the DHCP client of each interface.
+
+        Syntax:
+            show ip dhcp client
+        """
+        clients = DHCPClient.get_client_status()
+
+        if not clients:
+            print("No DHCP clients started")
+            return
+
+        table_data = []
+
+        for client in clients:
+            lease = client.lease
+            table_data.append([client.interface_name, client.client, client.stack_version.value, client.state.value,
+                               (lease and lease.address) or '-',
+                               lease.lease_time if lease and lease.lease_time is not None else '-',
+                               Common().convert_timestamp(lease.renew) if lease else '-',
+                               Common().convert_timestamp(lease.expires) if lease else '-'])
+
+        headers = ['Interface', 'Client', 'Stack', 'State', 'Address', 'Lease (s)', 'Renew Time', 'Expiry Time']
+
+        print(tabulate(table_data, headers, tablefmt="simple"))
+
 
 class DHCPServerShow:
     """Command set for showing DHCPServer-Show-Command"""
@@ -47,21 +90,94 @@ class DHCPServerShow:
         """
         Display DHCP leases using tabulate.
         """
+        self._print_leases(DhcpServerManager().get_leases())
+
+    def binding(self, args: list[str]) -> None:
+        """
+        Display the DHCP leases, optionally filtered by an index of the lease store.
+
+        Syntax:
+            show ip dhcp binding [<mac-address> | <ip-address> | hostname <hostname> | pool <pool-name>]
+        """
+        store = DhcpServerManager().lease_store()
 
-        # Assuming DhcpServerManager().get_all_leases() returns a list of lease dictionaries
-        leases = DhcpServerManager().get_leases()
+        if not args:
+            leases = store.leases()
 
-        # Extract lease information for tabulation
-        table_data = [(lease['hostname'], lease['ip_address'], lease['mac_address'], Common().convert_timestamp(int(lease['expires']))) for lease in leases]
+        elif len(args) == 2 and args[0] == 'hostname':
+            leases = store.get_by_hostname(args[1])
 
-        # Define table headers
-        headers = ['Hostname', 'IP Address', 'MAC Address', 'Expiry Time']
+        elif len(args) == 2 and args[0] == 'pool':
+            leases = store.get_by_pool(args[1])
 
-        # Use tabulate to format the data as a table
-        formatted_table = tabulate(table_data, headers, tablefmt="simple")
+        elif len(args) == 1 and MacServiceLayer().is_valid_mac_address(args[0]):
+            leases = store.get_by_mac(MacServiceLayer().format_mac_address(args[0])[1])
 
-        # Print the formatted table
-        print(formatted_table)
+        elif len(args) == 1:
+            lease = store.get_by_ip(args[0])
+            leases = [lease] if lease else []
+
+        else:
+            print("Usage: show ip dhcp binding [<mac-address> | <ip-address> | hostname <hostname> | pool <pool-name>]")
+            return
+
+        self._print_leases(leases, store)
+
+    def utilization(self, args: list[str]) -> None:
+        """
+        Display the occupancy of the DHCP pools.
+
+        Syntax:
+            show ip dhcp pool [<pool-name>] utilization
+        """
+        if args[-1:] != ['utilization'] or len(args) > 2:
+            print("Usage: show ip dhcp pool [<pool-name>] utilization")
+            return
+
+        pool = args[0] if len(args) == 2 else None
+        reports = DhcpPoolUtilization().utilization(pool)
+
+        if not reports:
+            print(f"DHCP pool {pool} not found" if pool else "No DHCP pools configured")
+            return
+
+        table_data = []
+
+        for report in reports:
+            for range_ in report.ranges:
+                table_data.append([report.pool, f"{range_.start} - {range_.end}", range_.size, range_.leased,
+                                   range_.reserved, range_.free, f"{range_.percent:.1f}", range_.next_free or '-', ''])
+
+            alert = '' if report.alert_percent is None else f"{report.alert_percent}%"
+
+            if report.alert:
+                alert += ' EXCEEDED'
+
+            table_data.append([report.pool, 'Total', report.size, sum(r.leased for r in report.ranges),
+                               sum(r.reserved for r in report.ranges), report.free, f"{report.percent:.1f}",
+                               report.next_free or '-', alert])
+
+        headers = ['Pool', 'Range', 'Size', 'Leased', 'Reserved', 'Free', 'Used %', 'Next Free', 'Alert']
+
+        print(tabulate(table_data, headers, tablefmt="simple"))
+
+    def _print_leases(self, leases: list[DhcpLease], store: DnsmasqLeaseStore | None = None) -> None:
+        table_data = []
+
+        for lease in leases:
+            # A DHCPv6 client is identified by its DUID and IAID, it has no MAC address in the lease
+            client = lease.mac_address or f"{lease.client_id or '*'} iaid {lease.iaid}"
+            expires = Common().convert_timestamp(lease.expires) if lease.expires else 'Infinite'
+            row = [lease.hostname or '', lease.ip_address, client, expires]
+
+            if store:
+                row.append(store.pool_of(lease) or '')
+
+            table_data.append(row)
+
+        headers = ['Hostname', 'IP Address', 'MAC Address / DUID', 'Expiry Time'] + (['Pool'] if store else [])
+
+        print(tabulate(table_data, headers, tablefmt="simple"))
 
     def status(self) -> str:
         """
@@ -75,24 +191,22 @@ class DHCPServerShow:
         else:
             return 'Not Active'
 
-    def dhcp_lease_log(self) -> list[str]:
+    def dhcp_lease_log(self, args: list[str] | None = None) -> None:
         """
-        Get the DHCP-related log entries from the system journal.
+        Print the DHCP-related log entries from the system journal.
 
-        Returns:
-            list[str]: A list of DHCP-related log entries.
+        Syntax:
+            show dhcp server lease-log [last <count> | follow]
         """
-        for line in DhcpServerManager().lease_log():
-            print(line)
+        LogShow(DhcpServerManager().lease_log_reader(), 'show-dhcp-lease-log').show(args)
 
-    def dhcp_server_log(self) -> list[str]:
+    def dhcp_server_log(self, args: list[str] | None = None) -> None:
         """
-        Get the DHCP-related log entries from the system journal.
+        Print the DNSMasq server log entries from the system journal.
 
-        Returns:
-            list[str]: A list of DHCP-related log entries.
+        Syntax:
+            show dhcp server server-log [last <count> | follow]
         """
-        for line in DhcpServerManager().server_log():
-            print(line)
+        LogShow(DhcpServerManager().server_log_reader(), 'show-dhcp-server-log').show(args)
     
     
\ No newline at end of file
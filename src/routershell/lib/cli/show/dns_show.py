@@ -0,0 +1,57 @@
+import logging
+
+from routershell.lib.network_manager.network_operations.dns_cache import DnsCache
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_statistics import DNSMasqStatisticsError
+
+
+class DnsShow(DnsCache):
+
+    def __init__(self, args=None):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.args = args
+
+    def statistics(self, args=None):
+        self.log.debug("statistics()")
+
+        settings = self.get_settings()
+
+        print("DNS cache settings")
+        print(f"  Cache size:       {self._setting(settings.cache_size, 150)}")
+        print(f"  Negative caching: {'enabled' if settings.negative_cache else 'disabled'}")
+        print(f"  Minimum TTL:      {self._setting(settings.min_cache_ttl, 0)}")
+        print(f"  Forward max:      {self._setting(settings.forward_max, 150)}")
+
+        try:
+            statistics = self.get_statistics()
+        except DNSMasqStatisticsError as e:
+            print(f"Error: {e}")
+            return
+
+        hit_ratio = statistics.hit_ratio
+
+        print("DNS cache statistics")
+        print(f"  Cache size: {self._counter(statistics.cache_size)}")
+        print(f"  Insertions: {self._counter(statistics.insertions)}")
+        print(f"  Evictions:  {self._counter(statistics.evictions)}")
+        print(f"  Hits:       {self._counter(statistics.hits)}"
+              + (f" ({hit_ratio:.1%})" if hit_ratio is not None else ""))
+        print(f"  Misses:     {self._counter(statistics.misses)}")
+
+        if statistics.auth is not None:
+            print(f"  Authoritative: {statistics.auth}")
+
+        if statistics.servers:
+            row = "  {:<46} {:>10} {:>10}"
+            print(row.format('Upstream server', 'Queries', 'Failed'))
+
+            for server in statistics.servers:
+                print(row.format(*server))
+
+    @staticmethod
+    def _setting(value: int | None, default: int) -> str:
+        return f"{default} (default)" if value is None else str(value)
+
+    @staticmethod
+    def _counter(value: int | None) -> str:
+        return 'n/a' if value is None else str(value)
@@ -3,7 +3,10 @@ import logging
 
 from tabulate import tabulate
 
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinity
 from routershell.lib.network_manager.network_operations.interface import Interface
 
 
@@ -46,6 +49,24 @@ class InterfaceShow(Interface):
 
         print(table)
 
+    def show_interface_queues(self, interface_name: InterfaceName) -> StatusResult:
+        """
+        show interface <interface> queues
+
+        Display the IRQ, RPS/RFS and XPS settings and packet count of each queue of an interface,
+        followed by the interrupts and softirq receive processing of each CPU.
+        """
+        if not self.does_os_interface_exist(interface_name):
+            print(f"Interface {interface_name} does not exist")
+            return STATUS_NOK
+
+        queue_rows, cpu_rows = CpuAffinity().get_interface_queue_distribution(interface_name)
+
+        print(tabulate(queue_rows, headers='keys', tablefmt="simple"))
+        print()
+        print(tabulate(cpu_rows, headers='keys', tablefmt="simple"))
+        return STATUS_OK
+
     def show_ip_interface_brief(self):
         """
         Display a brief summary of IP interfaces.
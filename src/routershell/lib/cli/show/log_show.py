@@ -0,0 +1,89 @@
+import logging
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.types import StatusResult
+from routershell.lib.system.log_reader import LogReader
+
+
+class LogShow:
+    """
+    Show the entries of a log reader.
+
+    Syntax:
+        ... [last <count> | follow]
+    """
+
+    USAGE = "[last <count> | follow]"
+
+    def __init__(self, reader: LogReader, consumer: str):
+        """
+        Args:
+            reader (LogReader): The reader of the log source.
+            consumer (str): The consumer the reader keeps a cursor for, one per show command.
+        """
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.reader = reader
+        self.consumer = consumer
+
+    @staticmethod
+    def parse_args(args: list[str] | None) -> tuple[int, bool]:
+        """
+        Parse the `[last <count> | follow]` arguments.
+
+        Returns:
+            tuple[int, bool]: The number of last entries and whether to follow the log.
+
+        Raises:
+            ValueError: If the arguments are invalid.
+        """
+        args = args or []
+
+        if not args:
+            return LogReader.DEFAULT_LAST, False
+
+        if args == ['follow']:
+            return LogReader.DEFAULT_LAST, True
+
+        if len(args) == 2 and args[0] == 'last' and args[1].isdigit() and int(args[1]) > 0:
+            return int(args[1]), False
+
+        raise ValueError(f"Invalid log arguments: {' '.join(args)}")
+
+    def show(self, args: list[str] | None = None) -> StatusResult:
+        """
+        Print the last entries of the log, or follow it until interrupted (Ctrl-C).
+        """
+        try:
+            count, follow = self.parse_args(args)
+        except ValueError as e:
+            print(f"{e}, usage: {self.USAGE}")
+            return STATUS_NOK
+
+        if not follow:
+            entries = self.reader.last(self.consumer, count)
+
+            for entry in entries:
+                print(entry)
+
+            if not entries:
+                print("No log entries found.")
+
+            return STATUS_OK
+
+        return self.follow(count)
+
+    def follow(self, count: int = LogReader.DEFAULT_LAST) -> StatusResult:
+        """Print the last entries of the log and then each new entry, until interrupted (Ctrl-C)."""
+        entries = self.reader.follow(self.consumer, count)
+
+        try:
+            for entry in entries:
+                print(entry, flush=True)
+
+        except KeyboardInterrupt:
+            print()
+
+        finally:
+            entries.close()
+
+        return STATUS_OK
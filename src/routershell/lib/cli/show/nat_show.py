@@ -1,6 +1,10 @@
 import logging
 
+from routershell.lib.db.nat_db import NatDB
+from routershell.lib.network_manager.common.conntrack import ConntrackError, ConntrackStatistics
+from routershell.lib.network_manager.common.sysctl import SysCtl
 from routershell.lib.network_manager.network_operations.nat import Nat
+from routershell.lib.network_manager.network_operations.nat_ruleset import NatRuleset
 
 
 class NatShow(Nat):
@@ -13,3 +17,72 @@ class NatShow(Nat):
     def getNatTable(self, args=None):
         self.log.debug("getNatTable()")
         print(f"{self.getNatIpTable()}")
+
+    def flow_offload(self, args=None):
+        self.log.debug("flow_offload()")
+
+        if not NatDB().is_flow_offload_enabled():
+            print("IP flow offload is disabled")
+            return
+
+        counters = self.get_flow_offload_counters()
+        slow_path = counters.get(NatRuleset.NFT_SLOW_PATH_COUNTER, (0, 0))
+
+        try:
+            offloaded = str(self.count_offloaded_flows())
+        except ConntrackError as e:
+            self.log.error(f"Unable to count offloaded flows: {e}")
+            offloaded = '-'
+
+        print("IP flow offload is enabled")
+        print(f"  Flowtable: {NatRuleset.NFT_FLOWTABLE}" if counters else "  Flowtable: not installed")
+        print(f"  Offloaded flows:   {offloaded}")
+        print(f"  Slow path packets: {slow_path[0]} ({slow_path[1]} bytes)")
+
+    def translations(self, args=None):
+        self.log.debug(f"translations() -> {args}")
+
+        try:
+            inside_address, interface_name, protocol = self.parse_translation_filter(args or [])
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+
+        row = "{:<5} {:<21} {:<21} {:<21} {:<21}"
+        statistics = ConntrackStatistics()
+        print(row.format('Pro', 'Inside global', 'Inside local', 'Outside local', 'Outside global'))
+
+        try:
+            for entry in self.get_nat_translations(inside_address, interface_name, protocol):
+                statistics.add(entry)
+                print(row.format(entry.protocol_name(), *entry.translation()))
+
+        except ConntrackError as e:
+            print(f"Error: {e}")
+            return
+
+        print(f"Total number of translations: {statistics.entries}")
+
+    def statistics(self, args=None):
+        self.log.debug("statistics()")
+
+        statistics = ConntrackStatistics()
+
+        try:
+            for entry in self.get_nat_translations():
+                statistics.add(entry)
+
+        except ConntrackError as e:
+            print(f"Error: {e}")
+            return
+
+        print(f"Total active translations: {statistics.entries} "
+              f"({statistics.source_nat} source NAT, {statistics.destination_nat} destination NAT)")
+        print(f"  Offloaded: {statistics.offloaded}")
+
+        for protocol, count in sorted(statistics.protocols.items()):
+            print(f"  {protocol}: {count}")
+
+        print(f"  Packets: {statistics.packets}, Bytes: {statistics.bytes}")
+        print(f"Conntrack table: {SysCtl().read_sysctl('net.netfilter.nf_conntrack_count')} "
+              f"of {SysCtl().read_sysctl('net.netfilter.nf_conntrack_max')} entries")
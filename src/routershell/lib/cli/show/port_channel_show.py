@@ -0,0 +1,43 @@
+import logging
+
+from tabulate import tabulate
+
+from routershell.lib.common.constants import STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import StatusResult
+from routershell.lib.network_manager.network_operations.port_channel import PortChannel
+
+
+class PortChannelShow:
+    """Command set for showing port-channels (etherchannel)"""
+
+    FLAGS_LEGEND = ('Flags:  D - down        P - bundled in port-channel\n'
+                    '        H - hot-standby s - suspended\n'
+                    '        U - in use')
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().PORT_CHANNEL_SHOW)
+
+    def show_etherchannel_summary(self) -> StatusResult:
+        """
+        show etherchannel summary
+        """
+        print(self.FLAGS_LEGEND)
+        print()
+        print(self.format_summary(PortChannel().get_port_channel_summary_os()))
+        return STATUS_OK
+
+    @staticmethod
+    def format_summary(summary: list[dict]) -> str:
+        """
+        Render `PortChannelSummary.parse()` rows as the etherchannel summary table.
+        """
+        rows = [{
+            'Port-channel': f"{row['PortChannel']}({row['Flags']})",
+            'Mode': row['Mode'],
+            'Protocol': row['Protocol'],
+            'Ports': ' '.join(f'{port}({flag})' for port, flag in row['Ports']),
+        } for row in summary]
+
+        return tabulate(rows, headers='keys', tablefmt='simple')
@@ -4,9 +4,13 @@ import os
 import shutil
 
 from routershell.lib.common.constants import ROUTER_CONFIG_DIR, STATUS_NOK, STATUS_OK
+from routershell.lib.common.range_list import RangeList
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.db.router_config_db import RouterConfigurationDatabase
 from routershell.lib.db.system_db import SystemDatabase
+from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.network_operations.acl_ruleset import AclRule
+from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
 from routershell.lib.network_services.common.network_ports import NetworkPorts
 from routershell.lib.system.system_call import SystemCall
 
@@ -59,16 +63,20 @@ class RouterConfiguration:
             self.log.debug(f"Backup of startup configuration created: {backup_config_file}")
 
         # Save the new running configuration to the startup configuration file
-        running_config = self.get_running_configuration()
+        running_config = self.get_running_configuration(compress_ranges=True)
         with open(startup_config_file, 'w') as file:
             file.write('\n'.join(running_config))
 
         self.log.debug(f"Running configuration copied to startup configuration: {startup_config_file}")
                 
-    def get_running_configuration(self, verbose: bool = False, indent: int = 1) -> list[str]:
+    def get_running_configuration(self, verbose: bool = False, indent: int = 1, compress_ranges: bool = False) -> list[str]:
         """
         Generate the running configuration for the router CLI.
 
+        Args:
+            compress_ranges (bool): Emit VLANs and Ethernet interfaces with identical settings
+                as one `vlan <vlan-list>` / `interface range <range>` block.
+
         Returns:
             list[str]: list of CLI commands representing the running configuration.
         """
@@ -92,22 +100,25 @@ class RouterConfiguration:
         cmd_lines.extend(self._get_system_servers())
         
         # Generate CLI commands for global settings
-        global_settings_cmds = self._get_global_settings()
+        global_settings_cmds = self._get_global_settings(compress_ranges)
         cmd_lines.extend(global_settings_cmds)
 
+        # Generate CLI commands for access control list, ahead of the interfaces that reference them
+        acl_cmds = self._get_access_control_list()
+        cmd_lines.extend(acl_cmds)
+
         # Generate CLI commands for interface settings
-        interface_settings_cmds = self._get_interface_settings()
+        interface_settings_cmds = self._get_interface_settings(compress_ranges=compress_ranges)
         cmd_lines.extend(interface_settings_cmds)
 
-        # Generate CLI commands for access control list
-        acl_cmds = self._get_access_control_list()
-        cmd_lines.extend(acl_cmds)
+        # Generate CLI commands for tracks and static routes, after the interfaces they use
+        cmd_lines.extend(self._get_global_route_config())
 
         cmd_lines.append('end')
         
         return cmd_lines
 
-    def _get_global_settings(self) -> list[str]:
+    def _get_global_settings(self, compress_ranges: bool = False) -> list[str]:
             """
             Generate CLI commands for global settings.
 
@@ -119,8 +130,10 @@ class RouterConfiguration:
 
             cmd_lines.extend(self._get_global_rename_interface_config())
             cmd_lines.extend(self._get_global_bridge_config())
-            cmd_lines.extend(self._get_global_vlan_config())
+            cmd_lines.extend(self._get_global_port_channel_config())
+            cmd_lines.extend(self._get_global_vlan_config(compress_ranges=compress_ranges))
             cmd_lines.extend(self._get_global_nat_config())
+            cmd_lines.extend(self._get_global_dns_config())
             cmd_lines.extend(self._get_global_wifi_policy())
             cmd_lines.extend(self._get_global_dhcp_server_config())
 
@@ -192,12 +205,44 @@ class RouterConfiguration:
 
         return cmd_lines
 
-    def _get_global_vlan_config(self, indent: int = 1) -> list[str]:
+    def _get_global_port_channel_config(self, indent: int = 1) -> list[str]:
+        """
+        Generate CLI commands for port-channel configuration, ahead of the member interfaces.
+
+        Args:
+            indent (int, optional): The number of spaces to indent each line. Defaults to 1.
+
+        Returns:
+            list[str]: list of CLI commands for port-channel configuration.
+        """
+        status, port_channel_results = self.rcdb.get_port_channel_configuration()
+
+        if status == STATUS_NOK:
+            return []
+
+        cmd_lines = []
+
+        for port_channel_config in port_channel_results:
+            cmd_lines.extend([self.LINE_BREAK])
+            cmd_lines.extend(
+                ' ' * indent + line if i != 0 else line
+                for i, line in enumerate(filter(None, port_channel_config.values()))
+            )
+            cmd_lines.append('end')
+
+        if cmd_lines:
+            cmd_lines.extend([self.LINE_BREAK])
+
+        return cmd_lines
+
+    def _get_global_vlan_config(self, indent: int = 1, compress_ranges: bool = False) -> list[str]:
         """
         Generate CLI commands for global VLAN configuration.
 
         Args:
             indent (int, optional): The number of spaces to indent each line. Defaults to 1.
+            compress_ranges (bool): Emit VLANs that keep their default `Vlan<id>` name and
+                share a description as one `vlan <vlan-list>` block.
 
         Returns:
             list[str]: list of CLI commands for global VLAN configuration.
@@ -209,6 +254,9 @@ class RouterConfiguration:
 
         cmd_lines = []
 
+        if compress_ranges:
+            vlan_info_results = self._compress_vlan_configuration(vlan_info_results)
+
         for vlan_config in vlan_info_results:
             cmd_lines.extend([self.LINE_BREAK])
             cmd_lines.extend(
@@ -222,6 +270,39 @@ class RouterConfiguration:
 
         return cmd_lines
 
+    def _compress_vlan_configuration(self, vlan_configs: list[dict]) -> list[dict]:
+        """
+        Merge VLANs with their default name and the same description into one `vlan <vlan-list>` entry.
+
+        Args:
+            vlan_configs (list[dict]): The VLAN configuration, see `RouterConfigurationDatabase.get_vlan_configuration()`.
+
+        Returns:
+            list[dict]: The VLAN configuration, each range in place of its first VLAN.
+        """
+        ranges: dict[str | None, list[int]] = {}
+
+        for vlan_config in vlan_configs:
+            vlan_id = int(vlan_config['VlanID'].split()[-1])
+
+            if vlan_config['VlanName'] == f'name Vlan{vlan_id}':
+                ranges.setdefault(vlan_config['VlanDescription'], []).append(vlan_id)
+
+        compressed = []
+
+        for vlan_config in vlan_configs:
+            vlan_id = int(vlan_config['VlanID'].split()[-1])
+            vlan_ids = ranges.get(vlan_config['VlanDescription'], [])
+
+            if vlan_id not in vlan_ids or len(vlan_ids) == 1:
+                compressed.append(vlan_config)
+
+            elif vlan_id == vlan_ids[0]:
+                compressed.append({'VlanID': f'vlan {RangeList.compress(vlan_ids)}',
+                                   'VlanDescription': vlan_config['VlanDescription']})
+
+        return compressed
+
     def _get_global_rename_interface_config(self) -> list[str]:
         """
         Generate CLI commands for renaming interface configurations based on the database.
@@ -268,10 +349,47 @@ class RouterConfiguration:
             self.log.debug("Failed to retrieve global NAT configurations.")
             return []
          
-    def _get_interface_settings(self, indent: int = 1) -> list[str]:
+    def _get_global_dns_config(self) -> list[str]:
+        """
+        Get the DNS cache configuration from the database.
+
+        Returns:
+        list[str]: A list of `ip dns cache` commands.
+        """
+        status, results = self.rcdb.get_dns_configuration()
+        self.log.debug(f"_get_global_dns_config() -> {results}")
+
+        if status == STATUS_NOK or not results:
+            return []
+
+        cmd_lines = [result.get('DnsCommand') for result in results]
+        cmd_lines.append(self.LINE_BREAK)
+        return cmd_lines
+
+    def _get_global_route_config(self) -> list[str]:
+        """
+        Get the track and static route configuration from the database.
+
+        Returns:
+        list[str]: A list of `track` and `ip route` commands.
+        """
+        status, results = self.rcdb.get_route_configuration()
+        self.log.debug(f"_get_global_route_config() -> {results}")
+
+        if status == STATUS_NOK or not results:
+            return []
+
+        cmd_lines = [result.get('RouteCommand') for result in results]
+        cmd_lines.append(self.LINE_BREAK)
+        return cmd_lines
+
+    def _get_interface_settings(self, indent: int = 1, compress_ranges: bool = False) -> list[str]:
         """
         Generate CLI commands for interface settings.
 
+        Args:
+            compress_ranges (bool): Emit Ethernet interfaces with identical settings as one `interface range` block.
+
         Returns:
             list[str]: list of CLI commands for interface settings.
         """
@@ -280,6 +398,7 @@ class RouterConfiguration:
         interface = self.rcdb.get_interface_name_list()
 
         interface_cmd_lines = []
+        interface_blocks: list[tuple[str, list[str]]] = []
 
         for interface_name in interface:
             
@@ -312,7 +431,27 @@ class RouterConfiguration:
             status, if_ip_sp_acc_vlan_id_config = self.rcdb.get_interface_switchport_access_vlan(interface_name)
             for _config_line in if_ip_sp_acc_vlan_id_config:
                 temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
+
+            status, if_channel_group_config = self.rcdb.get_interface_channel_group_configuration(interface_name)
+            for _config_line in if_channel_group_config:
+                temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
+
+            status, if_nic_config = self.rcdb.get_interface_nic_configuration(interface_name)
+            for _config_line in if_nic_config:
+                temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
+
+            status, if_cpu_affinity_config = self.rcdb.get_interface_cpu_affinity_configuration(interface_name)
+            for _config_line in if_cpu_affinity_config:
+                temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
+
+            status, if_sp_trunk_config = self.rcdb.get_interface_switchport_trunk_configuration(interface_name)
+            for _config_line in if_sp_trunk_config:
+                temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
                      
+            status, if_access_group_config = self.rcdb.get_interface_access_group_configuration(interface_name)
+            for _config_line in if_access_group_config:
+                temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
+
             status, if_ds_pol_config = self.rcdb.get_interface_dhcp_server_polices(interface_name)
             for _config_line in if_ds_pol_config:
                 temp_interface_cmd_lines.extend(' ' * indent + line for line in filter(None, _config_line.values()))
@@ -329,21 +468,85 @@ class RouterConfiguration:
 
             self.log.debug(f'Interface-Config: {start_temp_interface_cmd_lines}')
             
-            interface_cmd_lines.extend(start_temp_interface_cmd_lines)
+            interface_blocks.append((interface_name, start_temp_interface_cmd_lines))
+
+        if compress_ranges:
+            interface_blocks = self._compress_interface_blocks(interface_blocks)
+
+        for _, block in interface_blocks:
+            interface_cmd_lines.extend(block)
 
         cmd_lines.extend(interface_cmd_lines)
 
         return cmd_lines
 
-    def _get_access_control_list(self) -> list[str]:
+    def _compress_interface_blocks(self, interface_blocks: list[tuple[str, list[str]]]) -> list[tuple[str, list[str]]]:
+        """
+        Merge Ethernet interfaces with identical settings into one `interface range` block.
+
+        Args:
+            interface_blocks (list[tuple[str, list[str]]]): Interface name and its `interface <name>` block.
+
+        Returns:
+            list[tuple[str, list[str]]]: The blocks, each range in place of its first interface.
+        """
+        ethernet = set(self.rcdb.get_interface_name_list(InterfaceType.ETHERNET))
+        groups: dict[tuple[str, ...], list[str]] = {}
+
+        for interface_name, block in interface_blocks:
+            if interface_name in ethernet:
+                groups.setdefault(tuple(block[1:]), []).append(interface_name)
+
+        compressed = []
+
+        for interface_name, block in interface_blocks:
+            interface_names = groups.get(tuple(block[1:]), []) if interface_name in ethernet else []
+            interface_range = InterfaceRange.compress(interface_names) if len(interface_names) > 1 else None
+
+            if interface_range is None:
+                compressed.append((interface_name, block))
+
+            elif interface_name == interface_names[0]:
+                compressed.append((interface_range, [f'interface range {interface_range}'] + block[1:]))
+
+        return compressed
+
+    def _get_access_control_list(self, indent: int = 1) -> list[str]:
         """
         Generate CLI commands for access control lists.
 
+        Args:
+            indent (int, optional): The number of spaces to indent each rule. Defaults to 1.
+
         Returns:
             list[str]: list of CLI commands for access control lists.
         """
         cmd_lines = []
-        
+
+        status, acl_results = self.rcdb.get_acl_configuration()
+
+        if status:
+            return cmd_lines
+
+        acl_name = None
+
+        for acl_config in acl_results:
+            if acl_config['PolicyName'] != acl_name:
+                if acl_name is not None:
+                    cmd_lines.extend(['end', self.LINE_BREAK])
+
+                acl_name = acl_config['PolicyName']
+                cmd_lines.append(f'ip access-list {acl_name}')
+
+                if acl_config['Description']:
+                    cmd_lines.append(' ' * indent + f"description {acl_config['Description']}")
+
+            if acl_config['Sequence'] is not None:
+                cmd_lines.append(' ' * indent + AclRule.from_db_row(acl_config).cli())
+
+        if acl_name is not None:
+            cmd_lines.extend(['end', self.LINE_BREAK])
+
         return cmd_lines
 
     def _get_system_telnet_server(self) -> list[str]:
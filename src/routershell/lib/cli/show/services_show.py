@@ -0,0 +1,39 @@
+import logging
+
+from tabulate import tabulate
+
+from routershell.lib.common.common import Common
+from routershell.lib.system.system_service_control.system_service_control import AsyncServiceControl
+
+
+class ServicesShow:
+    """Command set for showing Services-Show-Command"""
+
+    def __init__(self, args=None):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.args = args
+
+    def services(self, args: list[str] | None = None) -> None:
+        """
+        Display the last action on each daemon controlled by RouterShell and its start latency.
+
+        Syntax:
+            show services
+        """
+        services = AsyncServiceControl().get_status()
+
+        if not services:
+            print("No services started")
+            return
+
+        table_data = []
+
+        for service in services:
+            table_data.append([service.service_name, service.action.value, service.state.value,
+                               service.main_pid or '-', Common().convert_timestamp(service.issued),
+                               f'{service.latency * 1000:.0f}' if service.latency is not None else '-'])
+
+        headers = ['Service', 'Action', 'State', 'PID', 'Issued', 'Latency (ms)']
+
+        print(tabulate(table_data, headers, tablefmt="simple"))
@@ -6,11 +6,15 @@ from routershell.lib.cli.common.prompt_response import PromptResponse
 from routershell.lib.cli.show.arp_show import ArpShow
 from routershell.lib.cli.show.bridge_show import BridgeShow
 from routershell.lib.cli.show.dhcp_show import DHCPClientShow, DHCPServerShow
+from routershell.lib.cli.show.dns_show import DnsShow
 from routershell.lib.cli.show.dump_db_show import DbDumpShow
 from routershell.lib.cli.show.interface_show import InterfaceShow
 from routershell.lib.cli.show.ip_route_show import RouteShow
 from routershell.lib.cli.show.nat_show import NatShow
+from routershell.lib.cli.show.port_channel_show import PortChannelShow
 from routershell.lib.cli.show.router_configuration import RouterConfiguration
+from routershell.lib.cli.show.services_show import ServicesShow
+from routershell.lib.cli.show.track_show import TrackShow
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.string_formats import StringFormats
@@ -46,6 +50,7 @@ class Show(CmdPrompt):
         STATUS_OK
     
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['group'])      
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['multicast', 'groups'], append_nested_sub_cmds=['bridge'])
     def show_bridge(self, args: list=None) -> None:
                 
         if not args:
@@ -53,11 +58,46 @@ class Show(CmdPrompt):
             
         elif 'group' in args:
             BridgeShow().show_bridge_group_interface_table()    
+
+        elif args[:2] == ['multicast', 'groups']:
+            match args[2:]:
+                case []:
+                    return BridgeShow().show_multicast_groups()
+                case ['bridge', bridge_name]:
+                    return BridgeShow().show_multicast_groups(bridge_name)
+                case _:
+                    print("Usage: show bridge multicast groups [bridge <name>]")
+                    return STATUS_NOK
             
         STATUS_OK
 
-    @CmdPrompt.register_sub_commands(nested_sub_cmds=['client' , 'log'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['address-table'],
+                                     append_nested_sub_cmds=['bridge', 'interface', 'vlan', 'address', 'dynamic', 'static', 'count'])
+    def show_mac(self, args: list=None) -> None:
+        """mac address-table\t\tDisplay the MAC address tables of the bridges."""
+
+        if args and args[0] == 'address-table':
+            return BridgeShow().show_mac_address_table(args[1:])
+
+        print("Usage: show mac address-table [bridge <name>] [interface <name>] [vlan <id>] [address <mac>] "
+              "[dynamic | static] [count]")
+        return STATUS_NOK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['summary'])
+    def show_etherchannel(self, args: list=None) -> None:
+
+        if args and 'summary' in args:
+            PortChannelShow().show_etherchannel_summary()
+
+        else:
+            print("Usage: show etherchannel summary")
+
+        STATUS_OK
+
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['client' , 'log'], append_nested_sub_cmds=['last', 'follow'])
     @CmdPrompt.register_sub_commands(nested_sub_cmds=['server', 'leases' , 'lease-log', 'server-log', 'status'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['server', 'lease-log'], append_nested_sub_cmds=['last', 'follow'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['server', 'server-log'], append_nested_sub_cmds=['last', 'follow'])
     def show_dhcp(self, args: list=None) -> None:
         self.log.debug(f'show_dhcp: {args}')
         
@@ -66,18 +106,18 @@ class Show(CmdPrompt):
             print(CmdPrompt.get_help(str_hash))
         
         elif 'client' and 'log' in args:
-            DHCPClientShow().flow_log()
+            DHCPClientShow().flow_log(args[args.index('log') + 1:])
         
         elif 'server' and 'leases' in args:
             print(DHCPServerShow().leases())
             STATUS_OK
 
         elif 'server' and 'lease-log' in args:
-            DHCPServerShow().dhcp_lease_log()
+            DHCPServerShow().dhcp_lease_log(args[args.index('lease-log') + 1:])
             STATUS_OK
         
         elif 'server' and 'server-log' in args:                
-            print(DHCPServerShow().dhcp_server_log())
+            DHCPServerShow().dhcp_server_log(args[args.index('server-log') + 1:])
             STATUS_OK            
 
         elif 'server' and 'status' in args: 
@@ -107,6 +147,9 @@ class Show(CmdPrompt):
         elif 'statistic' in args:
             print(InterfaceShow().show_interface_statistics())
             STATUS_OK
+
+        elif len(args) == 2 and args[1] == 'queues':
+            return InterfaceShow().show_interface_queues(args[0])
               
         else:
             PromptResponse.print_invalid_cmd_response(args)
@@ -139,7 +182,13 @@ class Show(CmdPrompt):
         
         return STATUS_OK
 
-    @CmdPrompt.register_sub_commands()
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['flow-offload'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['nat', 'translations'], append_nested_sub_cmds=['inside', 'interface', 'protocol'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['nat', 'statistics'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['dhcp', 'binding'], append_nested_sub_cmds=['hostname', 'pool'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['dhcp', 'client'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['dhcp', 'pool', 'utilization'])
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['dns', 'statistics'])
     def show_ip(self, args: list) -> None:
         """ip\t\t\t\tDisplay information about IP addresses."""
         
@@ -148,6 +197,34 @@ class Show(CmdPrompt):
         if '?'in args:
             str_hash = StringFormats.generate_hash_from_list(args[:-1])
             print(CmdPrompt.get_help(str_hash))
+
+        elif 'flow-offload' in args:
+            NatShow().flow_offload()
+            STATUS_OK
+
+        elif args[:2] == ['nat', 'translations']:
+            NatShow().translations(args[2:])
+            STATUS_OK
+
+        elif args[:2] == ['nat', 'statistics']:
+            NatShow().statistics()
+            STATUS_OK
+
+        elif args[:2] == ['dhcp', 'binding']:
+            DHCPServerShow().binding(args[2:])
+            STATUS_OK
+
+        elif args[:2] == ['dhcp', 'client']:
+            DHCPClientShow().client_status(args[2:])
+            STATUS_OK
+
+        elif args[:2] == ['dhcp', 'pool']:
+            DHCPServerShow().utilization(args[2:])
+            STATUS_OK
+
+        elif args[:2] == ['dns', 'statistics']:
+            DnsShow().statistics()
+            STATUS_OK
         
         else:
             print('Not Working Yet')
@@ -166,7 +243,34 @@ class Show(CmdPrompt):
             RouteShow().route()
             STATUS_OK
         
+    @CmdPrompt.register_sub_commands()
+    def show_track(self, args: list) -> None:
+
+        self.log.debug(f'show_track: {args}')
+
+        if '?' in args:
+            str_hash = StringFormats.generate_hash_from_list(args[:-1])
+            print(CmdPrompt.get_help(str_hash))
+
+        else:
+            TrackShow().tracks(args)
+            STATUS_OK
+
+    @CmdPrompt.register_sub_commands()
+    def show_services(self, args: list) -> None:
+
+        self.log.debug(f'show_services: {args}')
+
+        if '?' in args:
+            str_hash = StringFormats.generate_hash_from_list(args[:-1])
+            print(CmdPrompt.get_help(str_hash))
+
+        else:
+            ServicesShow().services(args)
+            STATUS_OK
+
     @CmdPrompt.register_sub_commands(extend_nested_sub_cmds=['configuration', 'system-commands'])      
+    @CmdPrompt.register_sub_commands(nested_sub_cmds=['configuration'], append_nested_sub_cmds=['compressed'])
     def show_running(self, args: list) -> None:
 
         self.log.debug(f'show_running: {args}')
@@ -176,7 +280,7 @@ class Show(CmdPrompt):
             print(CmdPrompt.get_help(str_hash))
 
         elif 'configuration' in args:
-            for line in RouterConfiguration().get_running_configuration():
+            for line in RouterConfiguration().get_running_configuration(compress_ranges='compressed' in args):
                 print(line)
                 
         elif 'system-commands' in args:
@@ -201,7 +201,7 @@ class ShowMode(cmd2.Cmd, GlobalUserCommand, RouterPrompt):
                 return
                             
             elif dhcp_server_get_option == 'server-log':
-                print(DHCPServerShow().dhcp_server_log())
+                DHCPServerShow().dhcp_server_log()
                 return            
 
             elif dhcp_server_get_option == 'status':
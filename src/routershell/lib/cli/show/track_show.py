@@ -0,0 +1,62 @@
+import datetime
+import logging
+
+from routershell.lib.network_manager.common.rtnetlink import Rtnetlink
+from routershell.lib.network_manager.network_operations.track import Track, TrackStatus, TrackType
+
+
+class TrackShow(Track):
+
+    def __init__(self, args=None):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.args = args
+
+    def tracks(self, args=None):
+        self.log.debug(f"tracks() -> {args}")
+
+        try:
+            track_id = int(args[0]) if args else None
+        except ValueError:
+            print(f"Error: Invalid track ID: {args[0]}")
+            return
+
+        statuses = [status for status in self.get_status() if track_id in (None, status.config.track_id)]
+
+        if not statuses:
+            print("No tracks configured" if track_id is None else f"Track {track_id} is not configured")
+            return
+
+        for status in statuses:
+            self._print_track(status)
+
+    @staticmethod
+    def _timestamp(epoch: float) -> str:
+        return datetime.datetime.fromtimestamp(epoch).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+
+    def _print_track(self, status: TrackStatus) -> None:
+        config = status.config
+
+        print(f"Track {config.track_id}")
+
+        if config.track_type is TrackType.INTERFACE:
+            print(f"  Interface {config.interface_name} carrier")
+        else:
+            print(f"  {config.track_type.value.upper()} probe of {config.target}"
+                  f"{f' via {config.interface_name}' if config.interface_name else ''}, "
+                  f"interval {config.interval} ms, threshold {config.threshold}")
+
+        print(f"  State is {status.state.value}")
+        print(f"    {status.changes} change{'' if status.changes == 1 else 's'}, "
+              f"last change {self._timestamp(status.transitions[-1][0])}")
+
+        print("  Transitions:")
+        for epoch, state in reversed(status.transitions):
+            print(f"    {self._timestamp(epoch)}  {state.value}")
+
+        if status.routes:
+            print("  Tracked by:")
+            for route in status.routes:
+                print(f"    ip route {'' if route.table == Rtnetlink.RT_TABLE_MAIN else f'table {route.table} '}"
+                      f"{route.destination} {route.next_hop}"
+                      f"{'' if route.weight is None else f' weight {route.weight}'} metric {route.metric}")
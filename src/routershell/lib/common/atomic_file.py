@@ -0,0 +1,71 @@
+import hashlib
+import os
+import tempfile
+
+from routershell.lib.common.types import FilePath
+
+
+class AtomicFile:
+    """
+    Replace files atomically and only when their content changes, so a reader (or a daemon
+    watching the file) never sees a partial file nor a rewrite of identical content.
+    """
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """The SHA-256 hex digest of a text."""
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @staticmethod
+    def read(path: FilePath) -> str | None:
+        """
+        Returns:
+            str | None: The content of the file, None if it does not exist.
+        """
+        try:
+            with open(path) as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def write_if_changed(cls, path: FilePath, text: str, mode: int = 0o644) -> bool:
+        """
+        Write a file through a temporary file renamed over it, unless its content hashes the same.
+
+        Args:
+            path (FilePath): The file to write, its directory is created if missing.
+            text (str): The content of the file.
+            mode (int): The permissions of a written file.
+
+        Returns:
+            bool: True if the file was written, False if its content was already `text`.
+
+        Raises:
+            OSError: If the file can not be written.
+        """
+        current = cls.read(path)
+
+        if current is not None and cls.digest(current) == cls.digest(text):
+            return False
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'w') as file:
+                file.write(text)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.chmod(temporary, mode)
+            os.replace(temporary, path)
+
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+
+        return True
@@ -0,0 +1,77 @@
+class BitmapAllocator:
+    """
+    Allocate the integers of an inclusive range, lowest free value first.
+
+    The allocation state is one bit per value held in a Python int, the lowest free value
+    is found with a few big-integer operations instead of a scan of the allocated values.
+    """
+
+    def __init__(self, first: int, last: int):
+        """
+        Args:
+            first (int): The smallest value of the range.
+            last (int): The largest value of the range.
+
+        Raises:
+            ValueError: If the range is empty.
+        """
+        if first > last:
+            raise ValueError(f"Empty range: {first}-{last}")
+
+        self.first = first
+        self.last = last
+        self._bits = 0
+
+    def __contains__(self, value: int) -> bool:
+        return self.first <= value <= self.last and bool(self._bits >> (value - self.first) & 1)
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def size(self) -> int:
+        """The number of values in the range."""
+        return self.last - self.first + 1
+
+    def next_free(self) -> int | None:
+        """
+        Return the lowest free value without allocating it.
+
+        Returns:
+            int | None: The lowest free value, None when the range is exhausted.
+        """
+        # The lowest clear bit is the only bit set in ~bits & (bits + 1)
+        offset = (~self._bits & (self._bits + 1)).bit_length() - 1
+
+        return self.first + offset if offset < self.size() else None
+
+    def allocate(self) -> int | None:
+        """
+        Allocate the lowest free value.
+
+        Returns:
+            int | None: The allocated value, None when the range is exhausted.
+        """
+        value = self.next_free()
+
+        if value is not None:
+            self._bits |= 1 << (value - self.first)
+
+        return value
+
+    def reserve(self, value: int) -> bool:
+        """
+        Mark a value allocated, values outside the range are ignored.
+
+        Returns:
+            bool: True if the value was free and is now allocated.
+        """
+        if not self.first <= value <= self.last or value in self:
+            return False
+
+        self._bits |= 1 << (value - self.first)
+        return True
+
+    def release(self, value: int) -> None:
+        """Return a value to the free values, values outside the range are ignored."""
+        if self.first <= value <= self.last:
+            self._bits &= ~(1 << (value - self.first))
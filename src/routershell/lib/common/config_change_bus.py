@@ -0,0 +1,184 @@
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import StatusResult
+
+
+class ConfigChangeTopic(Enum):
+    """
+    The configuration changes published by the DB facades.
+
+    - `DHCP_POOL`: A DHCP pool, its ranges, reservations, options or interfaces changed, keyed by pool name.
+    - `DNS`: A DNS cache setting changed.
+    - `TELNET_SERVER`: The telnet server was enabled, disabled or moved to another port.
+    """
+    DHCP_POOL = 'dhcp-pool'
+    DNS = 'dns'
+    TELNET_SERVER = 'telnet-server'
+
+
+ConfigChanges = dict[ConfigChangeTopic, set[str | None]]
+"""The pending changes of a flush: the keys changed per topic, None for a change without key."""
+
+ConfigChangeHandler = Callable[[ConfigChanges], StatusResult]
+
+
+class ConfigChangeBus(metaclass=Singleton):
+    """
+    Coalesce the configuration changes stored in the DB into one reload per daemon.
+
+    The DB facades publish a change after each successful write, the services subscribe a handler
+    per daemon to the topics of their configuration. Changes are collected and each handler is
+    called once per flush with every key changed since the previous flush, so replaying the
+    configuration of 20 DHCP pools reloads dnsmasq once instead of 20 times.
+
+    Changes are flushed:
+        - at the end of a `batch()`, e.g. the startup configuration replay;
+        - by `poll()` once no change was published for `DEBOUNCE_WINDOW` seconds, the CLI polls
+          while waiting for the next command.
+
+    Handlers run on the thread that flushes, the CLI thread, as the RouterShell DB connection
+    can not be shared across threads.
+    """
+
+    DEBOUNCE_WINDOW = 0.5
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().CONFIG_CHANGE_BUS)
+
+        self._subscribers: list[tuple[frozenset[ConfigChangeTopic], ConfigChangeHandler]] = []
+        self._pending: ConfigChanges = {}
+        self._last_change = 0.0
+        self._batch_depth = 0
+        self._flushing = False
+
+    def subscribe(self, topics: list[ConfigChangeTopic], handler: ConfigChangeHandler) -> None:
+        """
+        Subscribe a handler to the changes of one or more topics, subscribing the same handler
+        again replaces its topics. Handlers are called in the order they were first subscribed.
+
+        Args:
+            topics (list[ConfigChangeTopic]): The topics of the daemon configuration.
+            handler (ConfigChangeHandler): Called once per flush with the pending changes of its topics.
+        """
+        subscription = (frozenset(topics), handler)
+
+        for index, (_, subscribed) in enumerate(self._subscribers):
+            if subscribed == handler:
+                self._subscribers[index] = subscription
+                return
+
+        self._subscribers.append(subscription)
+
+    def publish(self, topic: ConfigChangeTopic, key: str | None = None) -> None:
+        """
+        Record a configuration change, the debounce window restarts.
+
+        Args:
+            topic (ConfigChangeTopic): The changed configuration.
+            key (str | None): What changed within the topic, e.g. the DHCP pool name.
+        """
+        self.log.debug(f"publish() -> {topic.value}: {key}")
+        self._pending.setdefault(topic, set()).add(key)
+        self._last_change = time.monotonic()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer the flush of the changes published within the block to its end, nested batches
+        are flushed with the outermost one.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield
+
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                self.flush()
+
+    def is_batching(self) -> bool:
+        """
+        Returns:
+            bool: True within a `batch()`.
+        """
+        return self._batch_depth > 0
+
+    def time_to_flush(self) -> float | None:
+        """
+        Returns:
+            float | None: The seconds left until the pending changes are due, None without
+                          pending changes or within a batch.
+        """
+        if not self._pending or self.is_batching():
+            return None
+
+        return max(0.0, self._last_change + self.DEBOUNCE_WINDOW - time.monotonic())
+
+    def poll(self, force: bool = False) -> StatusResult:
+        """
+        Flush the pending changes once the debounce window expired.
+
+        Args:
+            force (bool): Flush without waiting for the debounce window.
+
+        Returns:
+            StatusResult: STATUS_OK if nothing was due or every handler succeeded, STATUS_NOK otherwise.
+        """
+        time_to_flush = self.time_to_flush()
+
+        if time_to_flush is None or (time_to_flush and not force):
+            return STATUS_OK
+
+        return self.flush()
+
+    def flush(self) -> StatusResult:
+        """
+        Call each subscribed handler once with the pending changes of its topics.
+
+        Returns:
+            StatusResult: STATUS_OK if every handler succeeded, STATUS_NOK otherwise.
+        """
+        if self._flushing:
+            # A handler writing to the DB publishes again, the change is flushed next time
+            return STATUS_OK
+
+        pending, self._pending = self._pending, {}
+
+        if not pending:
+            return STATUS_OK
+
+        self.log.debug(f"flush() -> {', '.join(f'{t.value}: {sorted(map(str, k))}' for t, k in pending.items())}")
+
+        status = STATUS_OK
+        self._flushing = True
+
+        try:
+            for topics, handler in self._subscribers:
+                changes = {topic: keys for topic, keys in pending.items() if topic in topics}
+
+                if not changes:
+                    continue
+
+                try:
+                    if handler(changes):
+                        self.log.error(f"Unable to apply {', '.join(t.value for t in changes)} configuration changes")
+                        status = STATUS_NOK
+
+                except Exception as e:
+                    self.log.error(f"Unable to apply {', '.join(t.value for t in changes)} configuration changes: {e}")
+                    status = STATUS_NOK
+
+        finally:
+            self._flushing = False
+
+        return status
@@ -24,11 +24,20 @@ SYSV_BOOT_LOG_FILE = Path("/var/log/boot")
 
 DNSMASQ_CONFIG_DIR = Path("/etc/dnsmasq.d")
 DNSMASQ_LEASE_FILE_PATH = Path("/var/lib/misc/dnsmasq.leases")
+DNSMASQ_HOSTS_DIR = Path("/etc/dnsmasq-hosts.d")
+DNSMASQ_OPTS_DIR = Path("/etc/dnsmasq-opts.d")
 HOSTAPD_CONF_DIR = Path("/etc/hostapd")
 HOSTAPD_CONF_FILE = "hostapd.conf"
 TELNET_SYSV_CONFIG_FILE = Path("/etc/xinetd.d/telnet")
 
 PROC_SYS_NET_IPV4_CONF_DIR = Path("/proc/sys/net/ipv4/conf")
+PROC_SYS_NET_CORE_DIR = Path("/proc/sys/net/core")
+PROC_SYS_NET_BRIDGE_DIR = Path("/proc/sys/net/bridge")
+PROC_IRQ_DIR = Path("/proc/irq")
+PROC_INTERRUPTS_FILE = Path("/proc/interrupts")
+PROC_SOFTNET_STAT_FILE = Path("/proc/net/softnet_stat")
+SYS_CLASS_NET_DIR = Path("/sys/class/net")
+SYS_CPU_ONLINE_FILE = Path("/sys/devices/system/cpu/online")
 
 ROUTER_SHELL_DB = 'routershell.db'
 ROUTER_SHELL_DB_FILE_ENV = 'ROUTERSHELL_DB_FILE'
@@ -0,0 +1,207 @@
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class _Node(Generic[T]):
+    __slots__ = ('start', 'end', 'values', 'max_end', 'height', 'left', 'right')
+
+    def __init__(self, start: int, end: int, value: T):
+        self.start = start
+        self.end = end
+        self.values = [value]
+        self.max_end = end
+        self.height = 1
+        self.left: _Node[T] | None = None
+        self.right: _Node[T] | None = None
+
+
+class IntervalTree(Generic[T]):
+    """
+    The inclusive integer intervals of a set, queried for the intervals overlapping an interval.
+
+    The intervals are the keys of an AVL tree ordered by (start, end), each node holding the
+    largest end of its subtree, so a subtree ending before the queried interval is skipped.
+    Insert and remove are O(log n), an overlap query is O(log n + k) for k overlapping intervals.
+    Equal intervals share a node, each keeping its own value.
+    """
+
+    def __init__(self):
+        self._root: _Node[T] | None = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[tuple[int, int, T]]:
+        """Iterate the (start, end, value) intervals in (start, end) order."""
+        stack = []
+        node = self._root
+
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+
+            for value in node.values:
+                yield node.start, node.end, value
+
+            node = node.right
+
+    def insert(self, start: int, end: int, value: T) -> None:
+        """
+        Add an interval.
+
+        Raises:
+            ValueError: If the interval is empty.
+        """
+        if start > end:
+            raise ValueError(f"Empty interval: {start}-{end}")
+
+        self._root = self._insert(self._root, start, end, value)
+        self._len += 1
+
+    def remove(self, start: int, end: int, value: T) -> bool:
+        """
+        Remove an interval holding a value.
+
+        Returns:
+            bool: True if the interval was found and removed.
+        """
+        self._root, removed = self._remove(self._root, start, end, value)
+
+        if removed:
+            self._len -= 1
+
+        return removed
+
+    def overlapping(self, start: int, end: int) -> list[tuple[int, int, T]]:
+        """
+        Return the (start, end, value) intervals sharing at least one integer with [start, end].
+        """
+        found = []
+        stack = [self._root] if self._root else []
+
+        while stack:
+            node = stack.pop()
+
+            if node.max_end < start:
+                continue
+
+            if node.left:
+                stack.append(node.left)
+
+            # The right subtree only holds intervals starting after this one
+            if node.start <= end:
+                if node.end >= start:
+                    found.extend((node.start, node.end, value) for value in node.values)
+
+                if node.right:
+                    stack.append(node.right)
+
+        return sorted(found, key=lambda interval: (interval[0], interval[1]))
+
+    @staticmethod
+    def _height(node: _Node[T] | None) -> int:
+        return node.height if node else 0
+
+    @classmethod
+    def _update(cls, node: _Node[T]) -> _Node[T]:
+        node.height = 1 + max(cls._height(node.left), cls._height(node.right))
+        node.max_end = max(node.end,
+                           node.left.max_end if node.left else node.end,
+                           node.right.max_end if node.right else node.end)
+        return node
+
+    @classmethod
+    def _rotate_right(cls, node: _Node[T]) -> _Node[T]:
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = cls._update(node)
+        return cls._update(pivot)
+
+    @classmethod
+    def _rotate_left(cls, node: _Node[T]) -> _Node[T]:
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = cls._update(node)
+        return cls._update(pivot)
+
+    @classmethod
+    def _balance(cls, node: _Node[T]) -> _Node[T]:
+        cls._update(node)
+        balance = cls._height(node.left) - cls._height(node.right)
+
+        if balance > 1:
+            if cls._height(node.left.left) < cls._height(node.left.right):
+                node.left = cls._rotate_left(node.left)
+            return cls._rotate_right(node)
+
+        if balance < -1:
+            if cls._height(node.right.right) < cls._height(node.right.left):
+                node.right = cls._rotate_right(node.right)
+            return cls._rotate_left(node)
+
+        return node
+
+    @classmethod
+    def _insert(cls, node: _Node[T] | None, start: int, end: int, value: T) -> _Node[T]:
+        if node is None:
+            return _Node(start, end, value)
+
+        if (start, end) == (node.start, node.end):
+            node.values.append(value)
+            return node
+
+        if (start, end) < (node.start, node.end):
+            node.left = cls._insert(node.left, start, end, value)
+        else:
+            node.right = cls._insert(node.right, start, end, value)
+
+        return cls._balance(node)
+
+    @classmethod
+    def _remove(cls, node: _Node[T] | None, start: int, end: int, value: T) -> tuple[_Node[T] | None, bool]:
+        if node is None:
+            return None, False
+
+        if (start, end) < (node.start, node.end):
+            node.left, removed = cls._remove(node.left, start, end, value)
+
+        elif (start, end) > (node.start, node.end):
+            node.right, removed = cls._remove(node.right, start, end, value)
+
+        else:
+            if value not in node.values:
+                return node, False
+
+            node.values.remove(value)
+
+            if node.values:
+                return node, True
+
+            if not node.left or not node.right:
+                return node.left or node.right, True
+
+            # Replace the node by its in-order successor
+            successor = node.right
+
+            while successor.left:
+                successor = successor.left
+
+            node.start, node.end, node.values = successor.start, successor.end, successor.values
+            node.right = cls._remove_min(node.right)
+            removed = True
+
+        return cls._balance(node), removed
+
+    @classmethod
+    def _remove_min(cls, node: _Node[T]) -> _Node[T] | None:
+        if not node.left:
+            return node.right
+
+        node.left = cls._remove_min(node.left)
+        return cls._balance(node)
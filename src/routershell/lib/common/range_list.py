@@ -0,0 +1,71 @@
+class RangeList:
+    """
+    Parse and render compressed integer lists such as VLAN lists (`10,20-30,100`).
+    """
+
+    @staticmethod
+    def parse(text: str, minimum: int, maximum: int) -> list[int]:
+        """
+        Parse a comma separated list of integers and inclusive ranges.
+
+        Args:
+            text (str): The list, e.g. `100-199,300`.
+            minimum (int): The smallest accepted value.
+            maximum (int): The largest accepted value.
+
+        Returns:
+            list[int]: The sorted, de-duplicated values.
+
+        Raises:
+            ValueError: If the list is malformed or a value is out of range.
+        """
+        values: set[int] = set()
+
+        for item in text.split(','):
+            start, _, end = item.strip().partition('-')
+
+            if not start.isdigit() or (end and not end.isdigit()):
+                raise ValueError(f"Invalid range: '{item}'")
+
+            first, last = int(start), int(end or start)
+
+            if first > last or first < minimum or last > maximum:
+                raise ValueError(f"Range '{item}' is outside {minimum}-{maximum}")
+
+            values.update(range(first, last + 1))
+
+        return sorted(values)
+
+    @staticmethod
+    def spans(values: list[int]) -> list[tuple[int, int]]:
+        """
+        Group integers into consecutive (first, last) spans.
+
+        Args:
+            values (list[int]): The values, in any order.
+
+        Returns:
+            list[tuple[int, int]]: The inclusive spans in ascending order.
+        """
+        spans: list[tuple[int, int]] = []
+
+        for value in sorted(set(values)):
+            if spans and spans[-1][1] == value - 1:
+                spans[-1] = (spans[-1][0], value)
+            else:
+                spans.append((value, value))
+
+        return spans
+
+    @staticmethod
+    def compress(values: list[int]) -> str:
+        """
+        Render integers as a compressed list.
+
+        Args:
+            values (list[int]): The values, in any order.
+
+        Returns:
+            str: e.g. `10,20-30,100`.
+        """
+        return ','.join(str(first) if first == last else f'{first}-{last}' for first, last in RangeList.spans(values))
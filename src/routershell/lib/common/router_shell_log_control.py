@@ -23,6 +23,7 @@ class RouterShellLoggerSettings:
 
     ROUTERCLI = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     CMD_PROMPT = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    CONFIG_CHANGE_BUS = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     TELNET_SERVER = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
@@ -34,6 +35,7 @@ class RouterShellLoggerSettings:
     SYSTEM_SHUT_DOWN = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     SYSTEM_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     SYSTEM_SERVICE_CTRL = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    SYSTEM_LOG_READER = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     LINUX_SYSTEM = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
@@ -54,11 +56,19 @@ class RouterShellLoggerSettings:
     BRIDGE_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     BRIDGE_CONFIG_CMD = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
+    PORT_CHANNEL = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    PORT_CHANNEL_INTERFACE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    PORT_CHANNEL_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    PORT_CHANNEL_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    PORT_CHANNEL_CONFIG_CMD = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    PORT_CHANNEL_SHOW = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+
     DHCPD = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DHCP_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     DHCP_CLIENT = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DHCP_CLIENT_FACTORY = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    DHCP_CLIENT_JOBS = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DHCP_CLIENT_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DHCP_SUPPORTED_CLIENTS_ABC = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DHCP_CLIENT_UDHCPC = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
@@ -81,16 +91,32 @@ class RouterShellLoggerSettings:
     DNSMASQ_GLOBAL_SERVICE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DNSMASQ_INTERFACE_SERVICE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     DNSMASQ_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    DNSMASQ_LEASE_STORE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    DNSMASQ_STATISTICS = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    DNS_CACHE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    DNS_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     INTERFACE_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     IF_SHOW = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     ROUTE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    ROUTE_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     IP_ROUTE_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    RTNETLINK = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    TRACK = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    TRACK_MONITOR = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     NAT = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     NAT_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     NAT_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    CONNTRACK = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    ETHTOOL_NETLINK = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    BRIDGE_FDB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+
+    ACL = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    ACL_DB = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    ACL_CONFIG = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    ACL_CONFIG_CMD = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
     HARDWARE_NETWORK = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
@@ -128,6 +154,7 @@ class RouterShellLoggerSettings:
     MAC = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     INTERFACE = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     PHY = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
+    CPU_AFFINITY = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     RUN = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
     SYSCTL = logging.DEBUG if GLOBAL_DEBUG else logging.INFO
 
@@ -15,6 +15,7 @@ LogLevelName: TypeAlias = str
 PredicateResult = NewType("PredicateResult", bool)
 StatusResult = NewType("StatusResult", bool)
 
+AclName: TypeAlias = str
 BridgeName: TypeAlias = str
 ClientIdText: TypeAlias = str
 ClientName: TypeAlias = str
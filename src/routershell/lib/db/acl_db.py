@@ -0,0 +1,170 @@
+import logging
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import AclName, InetCidrText, InterfaceName, PredicateResult, StatusResult
+from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
+
+
+class AccessControlListDB:
+
+    rsdb = DB()
+
+    def __init__(cls):
+        cls.log = logging.getLogger(cls.__class__.__name__)
+        cls.log.setLevel(RSLS().ACL_DB)
+
+        if not cls.rsdb:
+            cls.log.debug("Connecting RouterShell Database")
+            cls.rsdb = DB()
+
+    def acl_exists(cls, acl_name: AclName) -> PredicateResult:
+        """
+        Check if an access-list with the given name exists.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            PredicateResult: True if the access-list exists, False otherwise.
+        """
+        return not cls.rsdb.select_acl_policy_row_id(acl_name).status
+
+    def add_acl(cls, acl_name: AclName) -> StatusResult:
+        """
+        Add an access-list to the DB, succeeding when it already exists.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            StatusResult: STATUS_OK if the access-list exists after the call, STATUS_NOK otherwise.
+        """
+        if cls.acl_exists(acl_name):
+            return STATUS_OK
+
+        result = cls.rsdb.insert_acl_policy(acl_name)
+
+        if result.status:
+            cls.log.error(f"Failed to add access-list {acl_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def delete_acl(cls, acl_name: AclName) -> StatusResult:
+        """
+        Delete an access-list with its rules and interface bindings.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            StatusResult: STATUS_OK if the access-list was deleted, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_acl_policy(acl_name)
+
+        if result.status:
+            cls.log.error(f"Failed to delete access-list {acl_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def update_acl_description(cls, acl_name: AclName, description: str | None) -> StatusResult:
+        """
+        Set or remove the description of an access-list.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            description (str | None): The description, None to remove it.
+
+        Returns:
+            StatusResult: STATUS_OK if the description was updated, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.update_acl_policy_description(acl_name, description)
+
+        if result.status:
+            cls.log.error(f"Failed to update access-list {acl_name} description: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def add_acl_rule(cls, acl_name: AclName, sequence: int, action: str, protocol: str,
+                     source: InetCidrText | None, source_port: int | None,
+                     destination: InetCidrText | None, destination_port: int | None) -> StatusResult:
+        """
+        Add a rule to an access-list.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was added, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_acl_rule(acl_name, sequence, action, protocol,
+                                          source, source_port, destination, destination_port)
+
+        if result.status:
+            cls.log.error(f"Failed to add rule {sequence} to access-list {acl_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def delete_acl_rule(cls, acl_name: AclName, sequence: int) -> StatusResult:
+        """
+        Delete a rule from an access-list by sequence number.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was deleted, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_acl_rule(acl_name, sequence)
+
+        if result.status:
+            cls.log.error(f"Failed to delete rule {sequence} from access-list {acl_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_acl_rules(cls) -> list[dict]:
+        """
+        Retrieve every access-list and its rules ordered by name and sequence.
+
+        Returns:
+            list[dict]: One dict per rule, see `RouterShellDB.select_acl_rules()`.
+        """
+        return [result.result for result in cls.rsdb.select_acl_rules()]
+
+    def add_interface_access_group(cls, acl_name: AclName, interface_name: InterfaceName, direction: str) -> StatusResult:
+        """
+        Bind an access-list to an interface direction.
+
+        Returns:
+            StatusResult: STATUS_OK if the binding was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_acl_interface_direction(acl_name, interface_name, direction)
+
+        if result.status:
+            cls.log.error(f"Failed to add access-group {acl_name} {direction} to {interface_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def delete_interface_access_group(cls, acl_name: AclName, interface_name: InterfaceName, direction: str) -> StatusResult:
+        """
+        Remove an access-list binding from an interface direction.
+
+        Returns:
+            StatusResult: STATUS_OK if the binding was removed, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_acl_interface_direction(acl_name, interface_name, direction)
+
+        if result.status:
+            cls.log.error(f"Failed to delete access-group {acl_name} {direction} from {interface_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_interface_access_groups(cls) -> list[dict]:
+        """
+        Retrieve every access-list to interface binding.
+
+        Returns:
+            list[dict]: One dict per binding with the keys `PolicyName`, `InterfaceName` and `Direction`.
+        """
+        return [result.result for result in cls.rsdb.select_acl_interface_bindings()]
@@ -179,7 +179,13 @@ class BridgeDatabase:
                         stp_status: STP_STATE | None = None,
                         management_inet: str | None = None,
                         description: str | None = None,
-                        shutdown_status: State | None = None) -> StatusResult:
+                        shutdown_status: State | None = None,
+                        vlan_filtering: bool | None = None,
+                        aging_time: int | None = None,
+                        mac_learning: bool | None = None,
+                        multicast_snooping: bool | None = None,
+                        multicast_querier: bool | None = None,
+                        netfilter_bypass: bool | None = None) -> StatusResult:
         """
         Update an existing bridge in the Bridges, Interfaces, and InterfaceIpAddress tables.
 
@@ -190,6 +196,12 @@ class BridgeDatabase:
             management_inet (str | None): The management IP address for the bridge (if changing).
             description (str | None): The new description for the bridge interface (if changing).
             shutdown_status (bool | None): The new shutdown status for the bridge interface (if changing).
+            vlan_filtering (bool | None): The new VLAN filtering state of the bridge (if changing).
+            aging_time (int | None): The new MAC address table aging time in seconds (if changing).
+            mac_learning (bool | None): The new MAC learning state of the bridge ports (if changing).
+            multicast_snooping (bool | None): The new IGMP/MLD snooping state (if changing).
+            multicast_querier (bool | None): The new IGMP/MLD querier state (if changing).
+            netfilter_bypass (bool | None): The new br_netfilter bypass state (if changing).
 
         Returns:
             StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
@@ -200,10 +212,136 @@ class BridgeDatabase:
             stp_status=stp_status,
             management_inet=management_inet,
             description=description,
-            shutdown_status=shutdown_status
+            shutdown_status=shutdown_status,
+            vlan_filtering=vlan_filtering,
+            aging_time=aging_time,
+            mac_learning=mac_learning,
+            multicast_snooping=multicast_snooping,
+            multicast_querier=multicast_querier,
+            netfilter_bypass=netfilter_bypass
         )
         
         cls.log.debug(f"update_bridge_db() -> BridgeName: {bridge_name}, Result: {result.reason}, Status: {result.status}")
 
         return result.status
 
+    def get_mac_address_table_db(cls, bridge_name: BridgeName) -> dict:
+        """
+        Retrieve the MAC address table settings and static entries of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+
+        Returns:
+            dict: {'AgingTime': int, 'MacLearning': bool, 'StaticMacAddresses': [{'MacAddress', 'InterfaceName',
+                'VlanID'}, ...]}, empty if the bridge does not exist.
+        """
+        result = cls.rsdb.select_bridge_mac_address_table(bridge_name)
+
+        if result.status:
+            cls.log.debug(f"get_mac_address_table_db() -> {result.reason}")
+            return {}
+
+        return result.result
+
+    def add_static_mac_address_db(cls, bridge_name: BridgeName, mac_address: str,
+                                  interface_name: InterfaceName, vlan_id: int | None = None) -> StatusResult:
+        """
+        Add or replace a static MAC address entry of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            mac_address (str): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            interface_name (str): The bridge port the address is forwarded to.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            StatusResult: STATUS_OK if the entry was stored, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.insert_bridge_static_mac_address(bridge_name, mac_address, interface_name, vlan_id).status
+
+    def del_static_mac_address_db(cls, bridge_name: BridgeName, mac_address: str,
+                                  vlan_id: int | None = None) -> InterfaceName | None:
+        """
+        Delete a static MAC address entry of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            mac_address (str): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            InterfaceName | None: The bridge port of the deleted entry, None if the entry does not exist.
+        """
+        result = cls.rsdb.delete_bridge_static_mac_address(bridge_name, mac_address, vlan_id)
+
+        if result.status:
+            cls.log.debug(f"del_static_mac_address_db() -> {result.reason}")
+            return None
+
+        return result.result['InterfaceName']
+
+    def get_multicast_db(cls, bridge_name: BridgeName) -> dict:
+        """
+        Retrieve the multicast snooping settings, router ports and netfilter bypass state of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+
+        Returns:
+            dict: {'McastSnooping': bool, 'McastQuerier': bool, 'NetfilterBypass': bool, 'RouterPorts': [str, ...]},
+                empty if the bridge does not exist.
+        """
+        result = cls.rsdb.select_bridge_multicast(bridge_name)
+
+        if result.status:
+            cls.log.debug(f"get_multicast_db() -> {result.reason}")
+            return {}
+
+        return result.result
+
+    def get_netfilter_bypass_bridges_db(cls) -> list[BridgeName]:
+        """
+        Retrieve the names of the bridges whose frames bypass br_netfilter.
+
+        Returns:
+            list[BridgeName]: The bridge names, empty if none or on error.
+        """
+        result = cls.rsdb.select_netfilter_bypass_bridges()
+
+        if result.status:
+            cls.log.debug(f"get_netfilter_bypass_bridges_db() -> {result.reason}")
+            return []
+
+        return result.result
+
+    def add_multicast_router_port_db(cls, bridge_name: BridgeName, interface_name: InterfaceName) -> StatusResult:
+        """
+        Add a multicast router port to a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if the port was stored, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.insert_bridge_multicast_router_port(bridge_name, interface_name).status
+
+    def del_multicast_router_port_db(cls, bridge_name: BridgeName, interface_name: InterfaceName) -> StatusResult:
+        """
+        Delete a multicast router port of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if the port was deleted, STATUS_NOK if it is not a router port.
+        """
+        result = cls.rsdb.delete_bridge_multicast_router_port(bridge_name, interface_name)
+
+        if result.status:
+            cls.log.debug(f"del_multicast_router_port_db() -> {result.reason}")
+
+        return result.status
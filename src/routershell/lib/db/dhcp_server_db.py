@@ -1,5 +1,6 @@
 import logging
 
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChangeTopic
 from routershell.lib.common.constants import STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import (
@@ -19,6 +20,9 @@ from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_config_gen import DHC
 class DHCPServerDatabase:
     """
     A class for interacting with the DHCP server database.
+
+    A successful change of a DHCP pool is published as a `ConfigChangeTopic.DHCP_POOL` change
+    keyed by the pool name, dnsmasq applies the changes of a batch at once.
     """
     def __init__(self):
         """
@@ -140,7 +144,7 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().insert_dhcp_pool_subnet(dhcp_pool_name, inet_subnet_cidr).status
+        return self._publish_pool_change(DB().insert_dhcp_pool_subnet(dhcp_pool_name, inet_subnet_cidr).status, dhcp_pool_name)
 
     def add_dhcp_subnet_inet_address_range_db(self, inet_subnet_cidr: InetCidrText, 
                                               inet_address_start: InetAddressText, 
@@ -158,10 +162,11 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().insert_dhcp_subnet_inet_address_range(inet_subnet_cidr, 
-                                                          inet_address_start, 
-                                                          inet_address_end, 
-                                                          inet_address_subnet_cidr).status
+        status = DB().insert_dhcp_subnet_inet_address_range(inet_subnet_cidr, 
+                                                            inet_address_start, 
+                                                            inet_address_end, 
+                                                            inet_address_subnet_cidr).status
+        return self._publish_subnet_change(status, inet_subnet_cidr)
 
     def add_dhcp_subnet_reservation_db(self, inet_subnet_cidr: InetCidrText, hw_address: MacAddressText, inet_address: InetAddressText) -> StatusResult:
         """
@@ -175,7 +180,8 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().insert_dhcp_subnet_reservation(inet_subnet_cidr, hw_address, inet_address).status
+        status = DB().insert_dhcp_subnet_reservation(inet_subnet_cidr, hw_address, inet_address).status
+        return self._publish_subnet_change(status, inet_subnet_cidr)
 
     def add_dhcp_subnet_option_db(self, inet_subnet_cidr: InetCidrText, dhcp_option: str, option_value: str) -> StatusResult:
         """
@@ -189,7 +195,8 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().insert_dhcp_subnet_option(inet_subnet_cidr, dhcp_option, option_value).status
+        status = DB().insert_dhcp_subnet_option(inet_subnet_cidr, dhcp_option, option_value).status
+        return self._publish_subnet_change(status, inet_subnet_cidr)
 
     def add_dhcp_subnet_reservation_option_db(self, inet_subnet_cidr: InetCidrText, hw_address: MacAddressText, dhcp_option: str, option_value: str) -> StatusResult:
         """
@@ -204,7 +211,8 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().insert_dhcp_subnet_reservation_option(inet_subnet_cidr, hw_address, dhcp_option, option_value).status
+        status = DB().insert_dhcp_subnet_reservation_option(inet_subnet_cidr, hw_address, dhcp_option, option_value).status
+        return self._publish_subnet_change(status, inet_subnet_cidr)
     
     def del_dhcp_pool_name(self, dhcp_pool_name: DhcpPoolName) -> StatusResult:
         """
@@ -216,7 +224,7 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().delete_dhcp_pool_name(dhcp_pool_name).status
+        return self._publish_pool_change(DB().delete_dhcp_pool_name(dhcp_pool_name).status, dhcp_pool_name)
 
     def update_dhcp_pool_name_interface(self, dhcp_pool_name: DhcpPoolName, interface_name: InterfaceName, negate: bool=False) -> StatusResult:
         """
@@ -229,7 +237,8 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        return DB().update_dhcp_pool_name_interface(dhcp_pool_name, interface_name, negate).status
+        status = DB().update_dhcp_pool_name_interface(dhcp_pool_name, interface_name, negate).status
+        return self._publish_pool_change(status, dhcp_pool_name)
 
     def update_dhcp_pool_mode_db(self, dhcp_pool_name: DhcpPoolName, mode: DHCPv6Modes) -> StatusResult:
         """
@@ -242,7 +251,33 @@ class DHCPServerDatabase:
         Returns:
             StatusResult: STATUS_OK if the update is successful, STATUS_NOK otherwise.
         """
-        return DB().update_dhcp_pool_dhcp_version_mode(dhcp_pool_name, mode.value).status
+        return self._publish_pool_change(DB().update_dhcp_pool_dhcp_version_mode(dhcp_pool_name, mode.value).status, dhcp_pool_name)
+
+    def update_dhcp_pool_utilization_alert_db(self, dhcp_pool_name: DhcpPoolName, percent: int | None) -> StatusResult:
+        """
+        Update the occupancy percent raising a utilization alert for a DHCP pool.
+
+        Args:
+            dhcp_pool_name (str): The name of the DHCP pool.
+            percent (int | None): The occupancy percent, None to disable the alert.
+
+        Returns:
+            StatusResult: STATUS_OK if the update is successful, STATUS_NOK otherwise.
+        """
+        return DB().update_dhcp_pool_utilization_alert(dhcp_pool_name, percent).status
+
+    def get_dhcp_pool_utilization_alert_db(self, dhcp_pool_name: DhcpPoolName) -> int | None:
+        """
+        Retrieve the occupancy percent raising a utilization alert for a DHCP pool.
+
+        Args:
+            dhcp_pool_name (str): The name of the DHCP pool.
+
+        Returns:
+            int | None: The occupancy percent, None if the alert is disabled or the pool does not exist.
+        """
+        result = DB().select_dhcp_pool_utilization_alert(dhcp_pool_name)
+        return result.result['UtilizationAlert'] if result.status == STATUS_OK else None
 
     '''
                                 DHCP-DNSMasq - Configuration Building
@@ -360,4 +395,18 @@ class DHCPServerDatabase:
 
         return results
 
-    
\ No newline at end of file
+    def _publish_pool_change(self, status: StatusResult, dhcp_pool_name: DhcpPoolName) -> StatusResult:
+        if status == STATUS_OK:
+            ConfigChangeBus().publish(ConfigChangeTopic.DHCP_POOL, dhcp_pool_name)
+        return status
+
+    def _publish_subnet_change(self, status: StatusResult, inet_subnet_cidr: InetCidrText) -> StatusResult:
+        if status == STATUS_OK:
+            result = DB().select_dhcp_pool_name_via_dhcp_pool_subnet(inet_subnet_cidr)
+
+            if result.status == STATUS_OK:
+                ConfigChangeBus().publish(ConfigChangeTopic.DHCP_POOL, result.result['DhcpPoolname'])
+            else:
+                self.log.error(result.reason)
+
+        return status
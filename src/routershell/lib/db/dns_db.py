@@ -0,0 +1,50 @@
+import logging
+
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChangeTopic
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import StatusResult
+from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
+
+
+class DnsDB:
+
+    rsdb = DB()
+
+    def __init__(cls):
+        cls.log = logging.getLogger(cls.__class__.__name__)
+        cls.log.setLevel(RSLS().DNS_DB)
+
+        if not cls.rsdb:
+            cls.log.debug("Connecting RouterShell Database")
+            cls.rsdb = DB()
+
+    def set_setting(cls, column: str, value: int | bool | None) -> StatusResult:
+        """
+        Store a DNS setting in the DNS database and publish the change.
+
+        Args:
+            column (str): The setting column, one of `RouterShellDB.DNS_SETTINGS_COLUMNS`.
+            value (int | bool | None): The value of the setting, None for the dnsmasq default.
+
+        Returns:
+            StatusResult: STATUS_OK if the setting was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.update_dns_setting(column, value)
+
+        if result.status:
+            cls.log.error(f"Failed to store DNS setting {column}: {result.reason}")
+            return STATUS_NOK
+
+        ConfigChangeBus().publish(ConfigChangeTopic.DNS, column)
+        return STATUS_OK
+
+    def get_settings(cls) -> dict:
+        """
+        Retrieve the DNS settings from the DNS database.
+
+        Returns:
+            dict: The keys `CacheSize`, `NegativeCache`, `MinCacheTtl` and `ForwardMax`,
+                  None for a setting left to the dnsmasq default.
+        """
+        return cls.rsdb.select_dns_settings().result
@@ -102,6 +102,44 @@ class InterfaceDatabase:
         result = cls.rsdb.update_interface_shutdown(interface_name, shutdown_status)
         return result.status
 
+    def get_db_existing_interfaces(cls, interface_names: list[InterfaceName]) -> list[InterfaceName]:
+        """
+        Return which of the given interfaces exist in the 'Interfaces' table, in one query.
+
+        Args:
+            interface_names (list[str]): The interface names to look up.
+
+        Returns:
+            list[str]: The existing interface names.
+        """
+        return cls.rsdb.select_existing_interfaces(interface_names)
+
+    def update_db_range_shutdown_status(cls, interface_names: list[InterfaceName], shutdown_status: bool) -> StatusResult:
+        """
+        Update the shutdown status of several interfaces in one transaction.
+
+        Args:
+            interface_names (list[str]): The names of the interfaces to update.
+            shutdown_status (bool): The new shutdown status.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_interfaces_shutdown(interface_names, shutdown_status).status
+
+    def update_db_range_description(cls, interface_names: list[InterfaceName], description: str) -> StatusResult:
+        """
+        Update the description of several interfaces in one transaction.
+
+        Args:
+            interface_names (list[str]): The names of the interfaces to update.
+            description (str): The new description.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_interfaces_description(interface_names, description).status
+
     def update_db_duplex(cls, interface_name: InterfaceName, duplex: str) -> StatusResult:
         """
         Update the duplex status of an interface in the 'Interfaces' table.
@@ -153,6 +191,89 @@ class InterfaceDatabase:
         result = cls.rsdb.update_interface_speed(interface_name, speed)
         return result.status
 
+    def update_db_nic_options(cls, interface_name: InterfaceName, options: dict[str, object]) -> StatusResult:
+        """
+        Update the offload, ring size and coalescing settings of an interface in the 'InterfaceSubOptions' table.
+
+        Args:
+            interface_name (str): The name of the interface to update.
+            options (dict[str, object]): {column: value}, e.g. {'Gro': True, 'RingRx': 'max', 'Coalesce': None},
+                None resets a setting to the driver default.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_interface_nic_options(interface_name, options).status
+
+    def get_db_nic_options(cls, interface_name: InterfaceName) -> dict[str, object]:
+        """
+        Get the offload, ring size and coalescing settings of an interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            dict[str, object]: {column: value}, None where not configured, empty on error.
+        """
+        result = cls.rsdb.select_interface_nic_options(interface_name)
+        return result.result if not result.status else {}
+
+    def update_db_cpu_affinity(cls, interface_name: InterfaceName, cpu_list: str, rfs_flow_entries: int | None = None) -> StatusResult:
+        """
+        Update the CPU affinity of an interface in the 'InterfaceCpuAffinity' table.
+
+        Args:
+            interface_name (str): The name of the interface to update.
+            cpu_list (str): 'auto' or the CPUs the queues are spread over, e.g. '0-3,8'.
+            rfs_flow_entries (int | None): The RFS flow table size, None for the default.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_interface_cpu_affinity(interface_name, cpu_list, rfs_flow_entries).status
+
+    def del_db_cpu_affinity(cls, interface_name: InterfaceName) -> StatusResult:
+        """
+        Remove the CPU affinity of an interface from the 'InterfaceCpuAffinity' table.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            StatusResult: STATUS_OK if the removal was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.delete_interface_cpu_affinity(interface_name).status
+
+    def get_db_cpu_affinities(cls) -> list[dict]:
+        """
+        Get the CPU affinity of every interface that has one.
+
+        Returns:
+            list[dict]: One {'InterfaceName', 'CpuList', 'RfsFlowEntries'} row per interface, empty on error.
+        """
+        return [result.result for result in cls.rsdb.select_interface_cpu_affinities() if result.status == STATUS_OK]
+
+    def get_db_saved_rps_sock_flow_entries(cls) -> int | None:
+        """
+        Get net.core.rps_sock_flow_entries from before RouterShell enabled RFS.
+
+        Returns:
+            int | None: The saved value, None when not saved.
+        """
+        return cls.rsdb.select_saved_rps_sock_flow_entries().result['SavedRpsSockFlowEntries']
+
+    def update_db_saved_rps_sock_flow_entries(cls, entries: int | None) -> StatusResult:
+        """
+        Save net.core.rps_sock_flow_entries from before RouterShell enabled RFS.
+
+        Args:
+            entries (int | None): The saved value, None once it is restored.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_saved_rps_sock_flow_entries(entries).status
+
     def update_db_inet_address(
         cls, interface_name, inet_address_cidr, secondary=False, negate=False) -> StatusResult:
         """
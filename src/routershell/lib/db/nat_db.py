@@ -2,7 +2,7 @@ import logging
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
-from routershell.lib.common.types import InterfaceName, NatPoolName, PredicateResult, StatusResult
+from routershell.lib.common.types import InetAddressText, InterfaceName, NatPoolName, PredicateResult, StatusResult
 from routershell.lib.db.sqlite_db.router_shell_db import Result
 from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
 
@@ -194,7 +194,25 @@ class NatDB:
             return STATUS_NOK
 
     def delete_inside_interface(cls, pool_name: NatPoolName, interface_name: InterfaceName) -> StatusResult:
-        pass
+        """
+        Remove an inside interface from a NAT pool configuration DB.
+
+        Args:
+            pool_name (str): The name of the NAT pool.
+            interface_name (str): The name of the inside interface to remove.
+
+        Returns:
+            StatusResult: STATUS_OK if the inside interface is removed successfully, STATUS_NOK otherwise.
+        """
+        cls.log.debug(f"delete_inside_interface({pool_name}, {interface_name})")
+
+        result = cls.rsdb.delete_interface_nat_direction(interface_name, pool_name)
+
+        if result.status:
+            cls.log.error(f"Failed to delete inside interface '{interface_name}' from '{pool_name}': {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
     
     def add_outside_interface(cls, nat_pool_name: NatPoolName, interface_name: InterfaceName) -> StatusResult:
         """
@@ -231,6 +249,114 @@ class NatDB:
             cls.log.error(f"An error occurred while inserting outside interface to '{nat_pool_name}': {e}")
             return STATUS_NOK
                     
-    def delete_outside_interface(cls, pool_name: NatPoolName, interface_name: InterfaceName) -> str:
-        pass
-    
\ No newline at end of file
+    def delete_outside_interface(cls, pool_name: NatPoolName, interface_name: InterfaceName) -> StatusResult:
+        """
+        Remove an outside interface from a NAT pool configuration DB.
+
+        Args:
+            pool_name (str): The name of the NAT pool.
+            interface_name (str): The name of the outside interface to remove.
+
+        Returns:
+            StatusResult: STATUS_OK if the outside interface is removed successfully, STATUS_NOK otherwise.
+        """
+        cls.log.debug(f"delete_outside_interface({pool_name}, {interface_name})")
+
+        result = cls.rsdb.delete_interface_nat_direction(interface_name, pool_name)
+
+        if result.status:
+            cls.log.error(f"Failed to delete outside interface '{interface_name}' from '{pool_name}': {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_nat_direction_bindings(cls) -> list[dict]:
+        """
+        Retrieve every NAT pool to interface binding from the NAT database.
+
+        Returns:
+            list[dict]: One dict per binding with the keys `NatPoolName`, `InterfaceName` and `Direction`.
+        """
+        return [result.result for result in cls.rsdb.select_nat_direction_bindings()]
+
+    def add_static_mapping(cls, protocol: str, inside_address: InetAddressText, inside_port: int | None,
+                           outside_address: InetAddressText, outside_port: int | None) -> StatusResult:
+        """
+        Add a static NAT mapping (1:1 static NAT or port forward) to the NAT database.
+
+        Returns:
+            StatusResult: STATUS_OK if the mapping was added, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_nat_static_mapping(protocol, inside_address, inside_port, outside_address, outside_port)
+
+        if result.status:
+            cls.log.error(f"Failed to add static NAT mapping: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def delete_static_mapping(cls, protocol: str, inside_address: InetAddressText, inside_port: int | None,
+                              outside_address: InetAddressText, outside_port: int | None) -> StatusResult:
+        """
+        Remove a static NAT mapping from the NAT database.
+
+        Returns:
+            StatusResult: STATUS_OK if the mapping was removed, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_nat_static_mapping(protocol, inside_address, inside_port, outside_address, outside_port)
+
+        if result.status:
+            cls.log.error(f"Failed to delete static NAT mapping: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_static_mappings(cls) -> list[dict]:
+        """
+        Retrieve every static NAT mapping from the NAT database.
+
+        Returns:
+            list[dict]: One dict per mapping with the keys `Protocol`, `InsideAddress`, `InsidePort`,
+                        `OutsideAddress` and `OutsidePort`.
+        """
+        return [result.result for result in cls.rsdb.select_nat_static_mappings()]
+
+    def set_flow_offload(cls, enable: bool) -> StatusResult:
+        """
+        Enable or disable NAT flow offload in the NAT database.
+
+        Returns:
+            StatusResult: STATUS_OK if the setting was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.update_nat_flow_offload(enable)
+
+        if result.status:
+            cls.log.error(f"Failed to {'enable' if enable else 'disable'} NAT flow offload: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def is_flow_offload_enabled(cls) -> PredicateResult:
+        """
+        Check if NAT flow offload is enabled.
+
+        Returns:
+            PredicateResult: True if flow offload is enabled, False otherwise.
+        """
+        return cls.rsdb.select_nat_flow_offload().result['FlowOffload']
+
+    def reset_db(cls) -> StatusResult:
+        """
+        Remove every NAT pool, NAT interface binding and static NAT mapping from the NAT database
+        and disable flow offload.
+
+        Returns:
+            StatusResult: STATUS_OK if the NAT database was reset, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_all_nat_configuration()
+
+        if result.status:
+            cls.log.error(f"Failed to reset NAT DB: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
@@ -0,0 +1,122 @@
+import logging
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, PredicateResult, StatusResult
+from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
+
+
+class PortChannelDatabase:
+
+    rsdb = DB()
+
+    def __init__(cls):
+        cls.log = logging.getLogger(cls.__class__.__name__)
+        cls.log.setLevel(RSLS().PORT_CHANNEL_DB)
+
+        if not cls.rsdb:
+            cls.log.debug("Connecting RouterShell Database")
+            cls.rsdb = DB()
+
+    def does_port_channel_exist_db(cls, port_channel_name: InterfaceName) -> PredicateResult:
+        """
+        Check if a port-channel with the given name exists in the database.
+
+        Args:
+            port_channel_name (str): The name of the port-channel.
+
+        Returns:
+            PredicateResult: True if the port-channel exists, False otherwise.
+        """
+        return cls.rsdb.port_channel_exist_db(port_channel_name).status
+
+    def add_port_channel_db(cls, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Add a new port-channel, with the default bonding settings, to the database.
+
+        Args:
+            port_channel_name (str): The name of the port-channel.
+
+        Returns:
+            StatusResult: STATUS_OK if the port-channel was added, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_interface_port_channel(port_channel_name)
+
+        if result.status:
+            cls.log.debug(f"Port-channel {port_channel_name} FAILED add to DB: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_port_channel_db(cls, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Delete a port-channel without members from the database.
+
+        Args:
+            port_channel_name (str): The name of the port-channel.
+
+        Returns:
+            StatusResult: STATUS_OK if the port-channel was deleted, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.delete_interface_port_channel(port_channel_name)
+
+        if result.status:
+            cls.log.error(f"Unable to delete port-channel: {port_channel_name} from DB, error: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def update_port_channel_db(cls, port_channel_name: InterfaceName,
+                               mode: str | None = None,
+                               xmit_hash_policy: str | None = None,
+                               lacp_rate: str | None = None) -> StatusResult:
+        """
+        Update the bonding settings of a port-channel, None leaves a setting unchanged.
+
+        Returns:
+            StatusResult: STATUS_OK if the update was successful, STATUS_NOK otherwise.
+        """
+        return cls.rsdb.update_port_channel(port_channel_name, mode, xmit_hash_policy, lacp_rate).status
+
+    def get_port_channel_db(cls, port_channel_name: InterfaceName) -> dict | None:
+        """
+        Get the bonding settings of a port-channel.
+
+        Returns:
+            dict | None: {'Mode', 'XmitHashPolicy', 'LacpRate', 'ShutdownStatus'}, None if it does not exist.
+        """
+        result = cls.rsdb.select_port_channel(port_channel_name)
+        return None if result.status else result.result
+
+    def get_port_channel_members_db(cls, port_channel_name: InterfaceName) -> list[InterfaceName]:
+        """
+        Get the member interfaces of a port-channel.
+
+        Returns:
+            list[InterfaceName]: The member interfaces, in the order they were added.
+        """
+        return cls.rsdb.select_port_channel_members(port_channel_name)
+
+    def update_interface_port_channel_group_db(cls, interface_name: InterfaceName,
+                                               port_channel_name: InterfaceName, remove: bool = False) -> StatusResult:
+        """
+        Add an interface to, or remove it from, a port-channel in the database.
+
+        Args:
+            interface_name (str): The member interface.
+            port_channel_name (str): The port-channel.
+            remove (bool): Remove the interface from the port-channel.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if remove:
+            result = cls.rsdb.delete_interface_port_channel_group(interface_name, port_channel_name)
+        else:
+            result = cls.rsdb.insert_interface_port_channel_group(interface_name, port_channel_name)
+
+        if result.status:
+            cls.log.error(f"Unable to update interface {interface_name} port-channel {port_channel_name}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
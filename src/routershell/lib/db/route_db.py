@@ -0,0 +1,142 @@
+import logging
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InetAddressText, InetCidrText, InterfaceName, StatusResult
+from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
+
+
+class RouteDatabase:
+
+    rsdb = DB()
+
+    def __init__(cls):
+        cls.log = logging.getLogger(cls.__class__.__name__)
+        cls.log.setLevel(RSLS().ROUTE_DB)
+
+        if not cls.rsdb:
+            cls.log.debug("Connecting RouterShell Database")
+            cls.rsdb = DB()
+
+    def add_track(cls, track_id: int, track_type: str, interface_name: InterfaceName | None,
+                  target: InetAddressText | None, interval: int, threshold: int) -> StatusResult:
+        """
+        Add a track to the DB, replacing the settings of an existing track with the same ID.
+
+        Returns:
+            StatusResult: STATUS_OK if the track was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_track(track_id, track_type, interface_name, target, interval, threshold)
+
+        if result.status:
+            cls.log.error(f"Failed to add track {track_id}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_track(cls, track_id: int) -> StatusResult:
+        """
+        Remove a track from the DB.
+
+        Returns:
+            StatusResult: STATUS_OK if the track was removed, STATUS_NOK if it does not exist.
+        """
+        result = cls.rsdb.delete_track(track_id)
+
+        if result.status:
+            cls.log.error(f"Failed to delete track {track_id}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_tracks(cls) -> list[dict]:
+        """
+        Retrieve every track from the DB.
+
+        Returns:
+            list[dict]: One dict per track with the keys `TrackID`, `Type`, `InterfaceName`, `Target`,
+                        `Interval` and `Threshold`.
+        """
+        return [result.result for result in cls.rsdb.select_tracks()]
+
+    def add_static_route(cls, route_table: int, destination: InetCidrText, next_hop: str, metric: int,
+                         weight: int | None, track_id: int | None) -> StatusResult:
+        """
+        Add a static route to the DB, replacing the weight and track of an existing identical route.
+
+        Returns:
+            StatusResult: STATUS_OK if the route was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_static_route(route_table, destination, next_hop, metric, weight, track_id)
+
+        if result.status:
+            cls.log.error(f"Failed to add static route {destination} {next_hop}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_static_route(cls, route_table: int, destination: InetCidrText, next_hop: str, metric: int) -> StatusResult:
+        """
+        Remove a static route from the DB.
+
+        Returns:
+            StatusResult: STATUS_OK if the route was removed, STATUS_NOK if it does not exist.
+        """
+        result = cls.rsdb.delete_static_route(route_table, destination, next_hop, metric)
+
+        if result.status:
+            cls.log.error(f"Failed to delete static route {destination} {next_hop}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_static_routes(cls) -> list[dict]:
+        """
+        Retrieve every static route from the DB.
+
+        Returns:
+            list[dict]: One dict per route with the keys `RouteTable`, `Destination`, `NextHop`, `Metric`,
+                        `Weight` and `TrackID`.
+        """
+        return [result.result for result in cls.rsdb.select_static_routes()]
+
+    def add_policy_route(cls, priority: int, source: InetCidrText | None, fwmark: int | None, fwmask: int | None,
+                         input_interface: InterfaceName | None, route_table: int) -> StatusResult:
+        """
+        Add a policy routing rule to the DB, replacing an existing rule with the same priority.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was stored, STATUS_NOK otherwise.
+        """
+        result = cls.rsdb.insert_policy_route(priority, source, fwmark, fwmask, input_interface, route_table)
+
+        if result.status:
+            cls.log.error(f"Failed to add policy route {priority}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_policy_route(cls, priority: int) -> StatusResult:
+        """
+        Remove a policy routing rule from the DB.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was removed, STATUS_NOK if it does not exist.
+        """
+        result = cls.rsdb.delete_policy_route(priority)
+
+        if result.status:
+            cls.log.error(f"Failed to delete policy route {priority}: {result.reason}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_policy_routes(cls) -> list[dict]:
+        """
+        Retrieve every policy routing rule from the DB.
+
+        Returns:
+            list[dict]: One dict per rule with the keys `Priority`, `Source`, `FwMark`, `FwMask`,
+                        `InputInterface` and `RouteTable`.
+        """
+        return [result.result for result in cls.rsdb.select_policy_routes()]
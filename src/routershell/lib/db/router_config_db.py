@@ -2,6 +2,7 @@ import logging
 from itertools import count
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.range_list import RangeList
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import InterfaceName
 from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB as DB
@@ -161,6 +162,126 @@ class RouterConfigurationDatabase:
         
         return STATUS_OK, if_switch_port_access_vlan_id
 
+    def get_interface_switchport_trunk_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict[str, str]]]:
+        """
+        Retrieve the switchport mode and allowed trunk VLANs of an interface, the VLANs
+        rendered as a compressed list (e.g. `10,20-30,100`).
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            tuple[bool, list[dict[str, str]]]: STATUS_OK and the configuration lines, STATUS_NOK and [] on error.
+        """
+        result = cls.rsdb.select_interface_switchport_trunk(interface_name)
+
+        if result.status:
+            cls.log.debug(f"Error retrieving switchport trunk, skipping: {result.reason}")
+            return STATUS_NOK, []
+
+        if result.result['Mode'] != 'trunk':
+            return STATUS_OK, []
+
+        config = [{'SwitchportMode': 'switchport mode trunk'}]
+
+        if result.result['VlanIDs']:
+            config.append({'TrunkAllowedVlans': f"switchport trunk allowed vlan {RangeList.compress(result.result['VlanIDs'])}"})
+
+        return STATUS_OK, config
+
+    def get_interface_channel_group_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict[str, str]]]:
+        """
+        Retrieve the port-channel membership of an interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            tuple[bool, list[dict[str, str]]]: STATUS_OK and [{'ChannelGroup': 'channel group <port-channel>'}]
+                or [] if the interface is not a member, STATUS_NOK and [] on error.
+        """
+        result = cls.rsdb.select_interface_channel_group(interface_name)
+
+        if result.status:
+            cls.log.debug(f"Error retrieving channel group, skipping: {result.reason}")
+            return STATUS_NOK, []
+
+        return STATUS_OK, [result.result] if result.result else []
+
+    def get_interface_nic_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict[str, str]]]:
+        """
+        Retrieve the offload, ring size and coalescing settings of an interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            tuple[bool, list[dict[str, str]]]: STATUS_OK and [{'Gro': '[no] offload gro'}, ...,
+                {'Ring': 'ring rx <size> tx <size>'}, {'Coalesce': 'coalesce <profile>'}] for the configured
+                settings, STATUS_NOK and [] on error.
+        """
+        result = cls.rsdb.select_interface_nic_options(interface_name)
+
+        if result.status:
+            cls.log.debug(f"Error retrieving NIC options, skipping: {result.reason}")
+            return STATUS_NOK, []
+
+        options = result.result
+        config = []
+
+        for column in ('Gro', 'Gso', 'Tso', 'Lro'):
+            if options.get(column) is not None:
+                config.append({column: f"{'' if options[column] else 'no '}offload {column.lower()}"})
+
+        ring = ' '.join(f'{direction} {options[column]}' for direction, column in (('rx', 'RingRx'), ('tx', 'RingTx'))
+                        if options.get(column) is not None)
+
+        if ring:
+            config.append({'Ring': f'ring {ring}'})
+
+        if options.get('Coalesce'):
+            config.append({'Coalesce': f"coalesce {options['Coalesce']}"})
+
+        return STATUS_OK, config
+
+    def get_interface_cpu_affinity_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict[str, str]]]:
+        """
+        Retrieve the CPU affinity of an interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            tuple[bool, list[dict[str, str]]]: STATUS_OK and [{'CpuAffinity': 'cpu affinity ...'}]
+                or [] if not configured, STATUS_NOK and [] on error.
+        """
+        result = cls.rsdb.select_interface_cpu_affinity(interface_name)
+
+        if result.status:
+            cls.log.debug(f"Error retrieving cpu affinity, skipping: {result.reason}")
+            return STATUS_NOK, []
+
+        return STATUS_OK, [result.result] if result.result else []
+
+    def get_interface_access_group_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict[str, str]]]:
+        """
+        Retrieve the access-groups bound to a specific interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            tuple[bool, list[dict[str, str]]]: STATUS_OK and the `ip access-group` commands, STATUS_NOK and an empty list on error.
+        """
+        if_access_group_result = cls.rsdb.select_interface_access_group_configuration(interface_name)
+
+        if any(result.status for result in if_access_group_result):
+            error_messages = [result.reason for result in if_access_group_result if result.status]
+            cls.log.debug(f"Error retrieving access-group, skipping: {', '.join(error_messages)}")
+            return STATUS_NOK, []
+
+        return STATUS_OK, [result.result for result in if_access_group_result]
+
     def get_interface_ip_static_arp_configuration(cls, interface_name: InterfaceName) -> tuple[bool, list[dict]]:
         """
         Retrieve IP static ARP configuration for a specific interface.
@@ -268,6 +389,23 @@ class RouterConfigurationDatabase:
 
         return STATUS_OK, bridge_config_list
 
+    def get_port_channel_configuration(cls) -> tuple[bool, list[dict]]:
+        """
+        Retrieve port-channel configuration data.
+
+        Returns:
+            tuple[bool, list[dict]]: STATUS_OK and a dictionary of configuration lines per port-channel,
+                STATUS_NOK and [] on error.
+        """
+        port_channel_result = cls.rsdb.select_global_port_channel_configuration()
+
+        if any(result.status for result in port_channel_result):
+            cls.log.debug(f"Error retrieving port-channel configuration, skipping: "
+                          f"{', '.join(result.reason for result in port_channel_result if result.status)}")
+            return STATUS_NOK, []
+
+        return STATUS_OK, [result.result for result in port_channel_result]
+
     def get_vlan_configuration(cls) -> tuple[bool, list[dict]]:
         """
         Retrieve VLAN configuration data.
@@ -320,6 +458,51 @@ class RouterConfigurationDatabase:
             cls.log.error("Failed to retrieve NAT configurations.")
             return STATUS_NOK, []
 
+    def get_dns_configuration(cls) -> tuple[bool, list[dict]]:
+        """
+        Get the DNS cache configurations.
+
+        Returns:
+        tuple[bool, list[dict]]: A tuple containing a boolean indicating success and a list of DNS configurations as dictionaries.
+        """
+        cls.log.debug('get_dns_configuration()')
+
+        dns_result = cls.rsdb.select_global_dns_configuration()
+
+        if all(result.status == STATUS_OK for result in dns_result):
+            return STATUS_OK, [result.result for result in dns_result]
+
+        cls.log.error("Failed to retrieve DNS configurations.")
+        return STATUS_NOK, []
+
+    def get_route_configuration(cls) -> tuple[bool, list[dict]]:
+        """
+        Get the track and static route configurations.
+
+        Returns:
+        tuple[bool, list[dict]]: A tuple containing a boolean indicating success and a list of route configurations as dictionaries.
+        """
+        cls.log.debug('get_route_configuration()')
+
+        route_result = cls.rsdb.select_global_route_configuration()
+
+        if all(result.status == STATUS_OK for result in route_result):
+            return STATUS_OK, [result.result for result in route_result]
+
+        cls.log.error("Failed to retrieve route configurations.")
+        return STATUS_NOK, []
+
+    def get_acl_configuration(cls) -> tuple[bool, list[dict]]:
+        """
+        Get the access-list configurations.
+
+        Returns:
+        tuple[bool, list[dict]]: STATUS_OK and one dict per access-list rule ordered by name and sequence,
+                                 see `RouterShellDB.select_acl_rules()`.
+        """
+        cls.log.debug('get_acl_configuration()')
+        return STATUS_OK, [result.result for result in cls.rsdb.select_acl_rules()]
+
     def get_dhcp_server_configuration(cls) -> tuple[bool, list[dict]]:
         """
         Retrieve global DHCP server configuration data, including pool details, reservations, and subnet options.
@@ -61,9 +61,32 @@ CREATE TABLE IF NOT EXISTS InterfaceSubOptions (
     Speed VARCHAR(5) DEFAULT 'auto',                    -- Speed [10 | 100 | 1000 | 10000 | auto]
     ProxyArp BOOLEAN DEFAULT TRUE,
     DropGratuitousArp BOOLEAN DEFAULT TRUE,
+    Gro BOOLEAN DEFAULT NULL,                           -- Offloads, NULL = driver default
+    Gso BOOLEAN DEFAULT NULL,
+    Tso BOOLEAN DEFAULT NULL,
+    Lro BOOLEAN DEFAULT NULL,
+    RingRx VARCHAR(5) DEFAULT NULL,                     -- Ring size [<descriptors> | max], NULL = driver default
+    RingTx VARCHAR(5) DEFAULT NULL,
+    Coalesce VARCHAR(10) DEFAULT NULL,                  -- Coalescing profile [adaptive | latency | throughput]
     CONSTRAINT FK_InterfaceSubOptions_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
 );
 
+DROP TABLE IF EXISTS InterfaceCpuAffinity;
+CREATE TABLE IF NOT EXISTS InterfaceCpuAffinity (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Interfaces_FK INT UNIQUE,
+    CpuList VARCHAR(256) DEFAULT 'auto',                -- auto | CPUs the queues are spread over (0-3,8)
+    RfsFlowEntries INT DEFAULT NULL,                    -- RFS flow table size, NULL = default
+    CONSTRAINT FK_InterfaceCpuAffinity_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS CpuAffinitySettings;
+CREATE TABLE IF NOT EXISTS CpuAffinitySettings (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    SavedRpsSockFlowEntries INT DEFAULT NULL            -- net.core.rps_sock_flow_entries before RFS was enabled, NULL = not saved
+);
+INSERT INTO CpuAffinitySettings DEFAULT VALUES;
+
 DROP TABLE IF EXISTS InterfaceStaticArp;
 CREATE TABLE IF NOT EXISTS InterfaceStaticArp (
     ID INTEGER PRIMARY KEY NOT NULL,
@@ -104,10 +127,56 @@ CREATE TABLE IF NOT EXISTS Bridges (
     BridgeName VARCHAR(50) UNIQUE,
     Protocol VARCHAR(15),               -- Bridge Protocol
     StpStatus BOOLEAN,                  -- STB STATUS ENABLE = 1 , DISABLE = 0
+    VlanFiltering BOOLEAN DEFAULT FALSE, -- VLAN-aware bridge, port VLANs are bridge VLAN entries
+    AgingTime INT DEFAULT 300,          -- MAC address table aging time in seconds (kernel default 300)
+    MacLearning BOOLEAN DEFAULT TRUE,   -- Learn source MAC addresses on the bridge ports
+    McastSnooping BOOLEAN DEFAULT TRUE, -- IGMP/MLD snooping, multicast is flooded to every port when disabled
+    McastQuerier BOOLEAN DEFAULT FALSE, -- Send IGMP/MLD general queries on the bridge
+    NetfilterBypass BOOLEAN DEFAULT FALSE, -- Bridged frames skip iptables/ip6tables/arptables (br_netfilter)
     Interfaces_FK INT,                  -- Interface used for managment of bridge (inet-address) 
     CONSTRAINT FK_Bridges_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
 );
 
+DROP TABLE IF EXISTS BridgeStaticMacAddresses;
+CREATE TABLE IF NOT EXISTS BridgeStaticMacAddresses (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Bridges_FK INT,
+    MacAddress VARCHAR(17),             -- xx:xx:xx:xx:xx:xx
+    InterfaceName VARCHAR(50),          -- Bridge port the address is forwarded to
+    VlanID INT DEFAULT NULL,            -- NULL on a bridge without VLAN filtering
+    UNIQUE (Bridges_FK, MacAddress, VlanID),
+    CONSTRAINT FK_BridgeStaticMacAddresses_Bridges FOREIGN KEY (Bridges_FK) REFERENCES Bridges(ID) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS BridgeMulticastRouterPorts;
+CREATE TABLE IF NOT EXISTS BridgeMulticastRouterPorts (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Bridges_FK INT,
+    InterfaceName VARCHAR(50),          -- Bridge port towards a multicast router, always receives all groups
+    UNIQUE (Bridges_FK, InterfaceName),
+    CONSTRAINT FK_BridgeMulticastRouterPorts_Bridges FOREIGN KEY (Bridges_FK) REFERENCES Bridges(ID) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS PortChannels;
+CREATE TABLE IF NOT EXISTS PortChannels (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    PortChannelName VARCHAR(50) UNIQUE,
+    Mode VARCHAR(16) DEFAULT '802.3ad',         -- Bonding mode: 802.3ad | balance-xor | active-backup
+    XmitHashPolicy VARCHAR(10) DEFAULT 'layer2',-- Transmit hash policy (802.3ad, balance-xor)
+    LacpRate VARCHAR(4) DEFAULT 'slow',         -- LACPDU rate requested from the partner (802.3ad)
+    Interfaces_FK INT,                          -- The port-channel (bond) interface
+    CONSTRAINT FK_PortChannels_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS PortChannelGroups;
+CREATE TABLE IF NOT EXISTS PortChannelGroups (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Interfaces_FK INT UNIQUE,                   -- Member interface
+    PortChannels_FK INT,
+    CONSTRAINT FK_PortChannelGroups_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE,
+    CONSTRAINT FK_PortChannelGroups_PortChannels FOREIGN KEY (PortChannels_FK) REFERENCES PortChannels(ID) ON DELETE CASCADE
+);
+
 DROP TABLE IF EXISTS Vlans;
 CREATE TABLE IF NOT EXISTS Vlans (
     ID INTEGER PRIMARY KEY NOT NULL,
@@ -127,6 +196,23 @@ CREATE TABLE IF NOT EXISTS VlanInterfaces (
     CONSTRAINT FK_VlansInterfaces_Bridges FOREIGN KEY (Bridge_FK) REFERENCES Bridges(ID) ON DELETE CASCADE
 );
 
+DROP TABLE IF EXISTS Switchports;
+CREATE TABLE IF NOT EXISTS Switchports (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Interfaces_FK INT UNIQUE,
+    Mode VARCHAR(6) DEFAULT 'access',   -- access | trunk
+    CONSTRAINT FK_Switchports_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS SwitchportTrunkVlans;
+CREATE TABLE IF NOT EXISTS SwitchportTrunkVlans (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Interfaces_FK INT,
+    VlanID INT,                         -- Allowed VLAN, none configured allows every VLAN in Vlans
+    UNIQUE (Interfaces_FK, VlanID),
+    CONSTRAINT FK_SwitchportTrunkVlans_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
+);
+
 DROP TABLE IF EXISTS Nats;
 CREATE TABLE IF NOT EXISTS Nats (
     ID INTEGER PRIMARY KEY NOT NULL,
@@ -143,6 +229,68 @@ CREATE TABLE IF NOT EXISTS NatDirections (
     CONSTRAINT FK_NatDirections_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
 );
 
+DROP TABLE IF EXISTS NatStaticMappings;
+CREATE TABLE IF NOT EXISTS NatStaticMappings (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Protocol VARCHAR(4),                    -- ip (1:1 static NAT) | tcp | udp (port forward)
+    InsideAddress VARCHAR(45),              -- Inside local address
+    InsidePort INT,                         -- Inside local port, NULL for 1:1 static NAT
+    OutsideAddress VARCHAR(45),             -- Inside global (outside) address
+    OutsidePort INT,                        -- Inside global (outside) port, NULL for 1:1 static NAT
+    CONSTRAINT UQ_NatStaticMappings_Outside UNIQUE (Protocol, OutsideAddress, OutsidePort)
+);
+
+DROP TABLE IF EXISTS NatSettings;
+CREATE TABLE IF NOT EXISTS NatSettings (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    FlowOffload BOOLEAN DEFAULT FALSE       -- ip flow-offload: nftables flowtable over the NAT interfaces
+);
+INSERT INTO NatSettings DEFAULT VALUES;
+
+DROP TABLE IF EXISTS DnsSettings;
+CREATE TABLE IF NOT EXISTS DnsSettings (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    CacheSize INT DEFAULT NULL,             -- ip dns cache size: dnsmasq cache-size, NULL for the dnsmasq default (150)
+    NegativeCache BOOLEAN DEFAULT TRUE,     -- no ip dns cache negative: dnsmasq no-negcache
+    MinCacheTtl INT DEFAULT NULL,           -- ip dns cache ttl: dnsmasq min-cache-ttl
+    ForwardMax INT DEFAULT NULL             -- ip dns cache forward-max: dnsmasq dns-forward-max, NULL for the dnsmasq default (150)
+);
+INSERT INTO DnsSettings DEFAULT VALUES;
+
+DROP TABLE IF EXISTS Tracks;
+CREATE TABLE IF NOT EXISTS Tracks (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    TrackID INT UNIQUE,                     -- track <track-id>
+    Type VARCHAR(10),                       -- interface (carrier) | icmp (echo probe) | arp (next-hop probe)
+    InterfaceName VARCHAR(50),              -- Tracked interface, or the source interface of the probe
+    Target VARCHAR(45),                     -- Probe target address, NULL for an interface track
+    Interval INT DEFAULT 1000,              -- Probe interval in milliseconds
+    Threshold INT DEFAULT 3                 -- Consecutive missed probes before the track goes down
+);
+
+DROP TABLE IF EXISTS StaticRoutes;
+CREATE TABLE IF NOT EXISTS StaticRoutes (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    RouteTable INT DEFAULT 254,             -- Routing table, 254 = main
+    Destination VARCHAR(50),                -- Destination prefix a.b.c.d/len
+    NextHop VARCHAR(50),                    -- Next-hop address or outgoing interface
+    Metric INT DEFAULT 0,
+    Weight INT DEFAULT NULL,                -- Multipath next-hop weight, NULL for a single path route
+    TrackID INT DEFAULT NULL,               -- Installed only while the track is up, NULL when untracked
+    CONSTRAINT UQ_StaticRoutes UNIQUE (RouteTable, Destination, NextHop, Metric)
+);
+
+DROP TABLE IF EXISTS PolicyRoutes;
+CREATE TABLE IF NOT EXISTS PolicyRoutes (
+    ID INTEGER PRIMARY KEY NOT NULL,
+    Priority INT UNIQUE,                    -- ip policy <priority>, rules are matched in ascending priority
+    Source VARCHAR(50) DEFAULT NULL,        -- Source prefix a.b.c.d/len
+    FwMark INT DEFAULT NULL,                -- Firewall mark
+    FwMask INT DEFAULT NULL,                -- Firewall mark mask, NULL for an exact match
+    InputInterface VARCHAR(50) DEFAULT NULL,
+    RouteTable INT                          -- Routing table looked up on a match
+);
+
 DROP TABLE IF EXISTS DHCPClient;
 CREATE TABLE IF NOT EXISTS DHCPClient (
     ID INTEGER PRIMARY KEY NOT NULL,
@@ -156,6 +304,7 @@ CREATE TABLE IF NOT EXISTS DHCPServer (
     ID INTEGER PRIMARY KEY NOT NULL,
     Interfaces_FK INT,
     DhcpPoolname VARCHAR(50) UNIQUE,
+    UtilizationAlert INT DEFAULT NULL,      -- Pool occupancy percent raising a utilization alert, NULL when disabled
     CONSTRAINT FK_DHCP_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE
 );
 
@@ -260,6 +409,7 @@ CREATE TABLE IF NOT EXISTS DHCPOptions (
 DROP TABLE IF EXISTS FirewallPolicies;
 CREATE TABLE IF NOT EXISTS FireWallPolicies (
     ID INTEGER PRIMARY KEY NOT NULL,
+    PolicyName VARCHAR(64) UNIQUE,          -- Access-list name (ip access-list <name>)
     Description VARCHAR(255)                -- Description of the policy
 );
 
@@ -268,8 +418,10 @@ CREATE TABLE IF NOT EXISTS FWDirectionInterfaces (
     ID INTEGER PRIMARY KEY NOT NULL,
     FirewallPolicy_FK INT,                  -- Foreign key to link with FirewallPolicies
     Interfaces_FK INT,
-    Direction VARCHAR(8),                   -- Direction (inbound or outbound)
-    CONSTRAINT FK_FirewallRules_FWPolicies FOREIGN KEY (FirewallPolicy_FK) REFERENCES FirewallPolicies(ID) ON DELETE CASCADE
+    Direction VARCHAR(8),                   -- Direction (in or out)
+    CONSTRAINT FK_FirewallRules_FWPolicies FOREIGN KEY (FirewallPolicy_FK) REFERENCES FirewallPolicies(ID) ON DELETE CASCADE,
+    CONSTRAINT FK_FWDirectionInterfaces_Interfaces FOREIGN KEY (Interfaces_FK) REFERENCES Interfaces(ID) ON DELETE CASCADE,
+    CONSTRAINT UQ_FWDirectionInterfaces_Interface_Direction UNIQUE (Interfaces_FK, Direction)
 );
 
 DROP TABLE IF EXISTS FirewallRules;
@@ -277,12 +429,13 @@ CREATE TABLE IF NOT EXISTS FirewallRules (
     ID INTEGER PRIMARY KEY NOT NULL,
     Description VARCHAR(255),               -- Description of the rule
     FirewallPolicy_FK INT,                  -- Foreign key to link with FirewallPolicies
+    Sequence INT,                           -- Evaluation order within the policy (first match wins)
     SourceIP VARCHAR(45),                   -- Source IP or network
     SourcePort INT,                         -- Source port (optional)
     DestinationIP VARCHAR(45),              -- Destination IP or network
     DestinationPort INT,                    -- Destination port (optional)
     Protocol VARCHAR(10),                   -- Protocol (e.g., TCP, UDP, ICMP, any)
-    Action VARCHAR(10),                     -- Action (allow, deny)
+    Action VARCHAR(10),                     -- Action (permit, deny)
     CONSTRAINT FK_FirewallRules_FWPolicies FOREIGN KEY (FirewallPolicy_FK) REFERENCES FirewallPolicies(ID) ON DELETE CASCADE
 );
 
@@ -17,6 +17,7 @@ from routershell.lib.common.constants import (
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.singleton import Singleton
 from routershell.lib.common.types import (
+    AclName,
     BridgeName,
     DbFilePath,
     DhcpPoolName,
@@ -97,6 +98,7 @@ class RouterShellDB(metaclass=Singleton):
 
     ROW_ID_NOT_FOUND = 0
     FK_NOT_FOUND = -1
+    INTERFACE_NIC_OPTION_COLUMNS = ('Gro', 'Gso', 'Tso', 'Lro', 'RingRx', 'RingTx', 'Coalesce')
 
     @staticmethod
     def default_db_file_path() -> DbFilePath:
@@ -616,6 +618,9 @@ class RouterShellDB(metaclass=Singleton):
                 (bridge_interface_row_id,)
             )
 
+            # Delete the static MAC addresses and multicast router ports of the bridge
+            self._delete_bridge_settings(cursor, bridge_interface_row_id)
+
             # Delete from Bridges table
             cursor.execute(
                 "DELETE FROM Bridges WHERE Interfaces_FK = ?",
@@ -644,7 +649,13 @@ class RouterShellDB(metaclass=Singleton):
                       stp_status: STP_STATE | None = None,
                       management_inet: str | None = None,
                       description: str | None = None,
-                      shutdown_status: State | None = None) -> Result:
+                      shutdown_status: State | None = None,
+                      vlan_filtering: bool | None = None,
+                      aging_time: int | None = None,
+                      mac_learning: bool | None = None,
+                      multicast_snooping: bool | None = None,
+                      multicast_querier: bool | None = None,
+                      netfilter_bypass: bool | None = None) -> Result:
         """
         Update an existing bridge in the Bridges, Interfaces, and InterfaceIpAddress tables.
 
@@ -655,6 +666,12 @@ class RouterShellDB(metaclass=Singleton):
             management_inet (str | None): The management IP address for the bridge (if changing).
             description (str | None): The new description for the bridge interface (if changing).
             shutdown_status (bool | None): The new shutdown status for the bridge interface (if changing).
+            vlan_filtering (bool | None): The new VLAN filtering state of the bridge (if changing).
+            aging_time (int | None): The new MAC address table aging time in seconds (if changing).
+            mac_learning (bool | None): The new MAC learning state of the bridge ports (if changing).
+            multicast_snooping (bool | None): The new IGMP/MLD snooping state (if changing).
+            multicast_querier (bool | None): The new IGMP/MLD querier state (if changing).
+            netfilter_bypass (bool | None): The new br_netfilter bypass state (if changing).
 
         Returns:
             Result: A Result object with the status of the update.
@@ -684,6 +701,30 @@ class RouterShellDB(metaclass=Singleton):
                 update_columns.append("StpStatus = ?")
                 parameters.append(stp_status.value)
 
+            if vlan_filtering is not None:
+                update_columns.append("VlanFiltering = ?")
+                parameters.append(vlan_filtering)
+
+            if aging_time is not None:
+                update_columns.append("AgingTime = ?")
+                parameters.append(aging_time)
+
+            if mac_learning is not None:
+                update_columns.append("MacLearning = ?")
+                parameters.append(mac_learning)
+
+            if multicast_snooping is not None:
+                update_columns.append("McastSnooping = ?")
+                parameters.append(multicast_snooping)
+
+            if multicast_querier is not None:
+                update_columns.append("McastQuerier = ?")
+                parameters.append(multicast_querier)
+
+            if netfilter_bypass is not None:
+                update_columns.append("NetfilterBypass = ?")
+                parameters.append(netfilter_bypass)
+
             if update_columns:
                 update_query = f"UPDATE Bridges SET {', '.join(update_columns)} WHERE Interfaces_FK = ?"
                 parameters.append(interface_id)
@@ -734,15 +775,259 @@ class RouterShellDB(metaclass=Singleton):
         except sqlite3.Error as e:
             return Result(status=STATUS_NOK, reason=str(e))
 
+    def select_bridge_mac_address_table(self, bridge_name: BridgeName) -> Result:
+        """
+        Retrieve the MAC address table settings and static entries of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+
+        Returns:
+            Result: STATUS_OK with result {'AgingTime': int, 'MacLearning': bool,
+                'StaticMacAddresses': [{'MacAddress': str, 'InterfaceName': str, 'VlanID': int | None}, ...]},
+                STATUS_NOK if the bridge does not exist or on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT ID, AgingTime, MacLearning FROM Bridges WHERE BridgeName = ?", (bridge_name,))
+            bridge_row = cursor.fetchone()
+
+            if not bridge_row:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Bridge {bridge_name} does not exist")
+
+            cursor.execute("""
+                SELECT MacAddress, InterfaceName, VlanID FROM BridgeStaticMacAddresses
+                WHERE Bridges_FK = ? ORDER BY VlanID, MacAddress
+                """, (bridge_row[0],))
+
+            return Result(status=STATUS_OK, row_id=bridge_row[0],
+                          result={'AgingTime': bridge_row[1],
+                                  'MacLearning': bool(bridge_row[2]),
+                                  'StaticMacAddresses': [{'MacAddress': row[0], 'InterfaceName': row[1], 'VlanID': row[2]}
+                                                         for row in cursor.fetchall()]})
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving MAC address table of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def insert_bridge_static_mac_address(self, bridge_name: BridgeName, mac_address: str,
+                                         interface_name: InterfaceName, vlan_id: int | None = None) -> Result:
+        """
+        Insert or replace a static MAC address entry of a bridge in the 'BridgeStaticMacAddresses' table.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            mac_address (str): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            interface_name (str): The bridge port the address is forwarded to.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            Result: A Result object with the status of the insert.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT ID FROM Bridges WHERE BridgeName = ?", (bridge_name,))
+            bridge_row = cursor.fetchone()
+
+            if not bridge_row:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Bridge {bridge_name} does not exist")
+
+            cursor.execute(
+                "DELETE FROM BridgeStaticMacAddresses WHERE Bridges_FK = ? AND MacAddress = ? AND VlanID IS ?",
+                (bridge_row[0], mac_address, vlan_id))
+            cursor.execute(
+                "INSERT INTO BridgeStaticMacAddresses (Bridges_FK, MacAddress, InterfaceName, VlanID) VALUES (?, ?, ?, ?)",
+                (bridge_row[0], mac_address, interface_name, vlan_id))
+            self.connection.commit()
+
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            error_message = f"Error inserting static MAC address {mac_address} of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_bridge_static_mac_address(self, bridge_name: BridgeName, mac_address: str, vlan_id: int | None = None) -> Result:
+        """
+        Delete a static MAC address entry of a bridge from the 'BridgeStaticMacAddresses' table.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            mac_address (str): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            Result: STATUS_OK with result {'InterfaceName': str} of the deleted entry,
+                STATUS_NOK if the entry does not exist or on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT S.ID, S.InterfaceName FROM BridgeStaticMacAddresses S JOIN Bridges B ON S.Bridges_FK = B.ID
+                WHERE B.BridgeName = ? AND S.MacAddress = ? AND S.VlanID IS ?
+                """, (bridge_name, mac_address, vlan_id))
+            row = cursor.fetchone()
+
+            if not row:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Static MAC address {mac_address} of bridge {bridge_name} does not exist")
+
+            cursor.execute("DELETE FROM BridgeStaticMacAddresses WHERE ID = ?", (row[0],))
+            self.connection.commit()
+
+            return Result(status=STATUS_OK, row_id=row[0], result={'InterfaceName': row[1]})
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            error_message = f"Error deleting static MAC address {mac_address} of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def select_bridge_multicast(self, bridge_name: BridgeName) -> Result:
+        """
+        Retrieve the multicast snooping settings, router ports and netfilter bypass state of a bridge.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+
+        Returns:
+            Result: STATUS_OK with result {'McastSnooping': bool, 'McastQuerier': bool, 'NetfilterBypass': bool,
+                'RouterPorts': [str, ...]}, STATUS_NOK if the bridge does not exist or on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT ID, McastSnooping, McastQuerier, NetfilterBypass FROM Bridges WHERE BridgeName = ?",
+                           (bridge_name,))
+            bridge_row = cursor.fetchone()
+
+            if not bridge_row:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Bridge {bridge_name} does not exist")
+
+            cursor.execute("SELECT InterfaceName FROM BridgeMulticastRouterPorts WHERE Bridges_FK = ? ORDER BY InterfaceName",
+                           (bridge_row[0],))
+
+            return Result(status=STATUS_OK, row_id=bridge_row[0],
+                          result={'McastSnooping': bool(bridge_row[1]),
+                                  'McastQuerier': bool(bridge_row[2]),
+                                  'NetfilterBypass': bool(bridge_row[3]),
+                                  'RouterPorts': [row[0] for row in cursor.fetchall()]})
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving multicast settings of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def select_netfilter_bypass_bridges(self) -> Result:
+        """
+        Retrieve the names of the bridges whose frames bypass br_netfilter.
+
+        Returns:
+            Result: STATUS_OK with result [str, ...], STATUS_NOK on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT BridgeName FROM Bridges WHERE NetfilterBypass ORDER BY BridgeName")
+
+            return Result(status=STATUS_OK, result=[row[0] for row in cursor.fetchall()])
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving netfilter bypass bridges: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def insert_bridge_multicast_router_port(self, bridge_name: BridgeName, interface_name: InterfaceName) -> Result:
+        """
+        Insert a multicast router port of a bridge in the 'BridgeMulticastRouterPorts' table.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            Result: A Result object with the status of the insert, STATUS_OK if the port is already a router port.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT ID FROM Bridges WHERE BridgeName = ?", (bridge_name,))
+            bridge_row = cursor.fetchone()
+
+            if not bridge_row:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Bridge {bridge_name} does not exist")
+
+            cursor.execute(
+                "INSERT OR IGNORE INTO BridgeMulticastRouterPorts (Bridges_FK, InterfaceName) VALUES (?, ?)",
+                (bridge_row[0], interface_name))
+            self.connection.commit()
+
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            error_message = f"Error inserting multicast router port {interface_name} of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_bridge_multicast_router_port(self, bridge_name: BridgeName, interface_name: InterfaceName) -> Result:
+        """
+        Delete a multicast router port of a bridge from the 'BridgeMulticastRouterPorts' table.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            Result: STATUS_OK if deleted, STATUS_NOK if the port is not a router port or on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                DELETE FROM BridgeMulticastRouterPorts
+                WHERE Bridges_FK = (SELECT ID FROM Bridges WHERE BridgeName = ?) AND InterfaceName = ?
+                """, (bridge_name, interface_name))
+            self.connection.commit()
+
+            if cursor.rowcount == 0:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Interface {interface_name} is not a multicast router port of bridge {bridge_name}")
+
+            return Result(status=STATUS_OK)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            error_message = f"Error deleting multicast router port {interface_name} of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
     def delete_bridge(self, bridge_name:BridgeName) -> Result:
         
-        if not self.bridge_exist_db(bridge_name).status:
+        bridge_result = self.bridge_exist_db(bridge_name)
+
+        if not bridge_result.status:
             return Result(status=STATUS_OK, reason=f"No need to delete bridge: {bridge_name}, does not exists")
         
         if self.is_bridge_in_bridge_group(bridge_name).status:
             return Result(status=STATUS_NOK, reason=f"Unable te delete bridge: {bridge_name}, still attached to a bridge group")
+
+        try:
+            cursor = self.connection.cursor()
+            self._delete_bridge_settings(cursor, bridge_result.row_id)
+            cursor.execute("DELETE FROM Bridges WHERE ID = ?", (bridge_result.row_id,))
+            self.connection.commit()
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            return Result(status=STATUS_NOK, reason=f"Error deleting settings of bridge {bridge_name}: {e}")
         
         return self.delete_interface(interface_name=bridge_name)
+
+    def _delete_bridge_settings(self, cursor: sqlite3.Cursor, bridge_id: int) -> None:
+        """
+        Delete the static MAC addresses and multicast router ports of a bridge, foreign keys are not enforced.
+        """
+        cursor.execute("DELETE FROM BridgeStaticMacAddresses WHERE Bridges_FK = ?", (bridge_id,))
+        cursor.execute("DELETE FROM BridgeMulticastRouterPorts WHERE Bridges_FK = ?", (bridge_id,))
         
     '''
                         VLAN DATABASE
@@ -1162,120 +1447,384 @@ class RouterShellDB(metaclass=Singleton):
             self.log.error(error_message)
             return Result(status=STATUS_NOK, row_id=None, reason=error_message)
 
-    def select_interfaces_by_vlan_id(self, vlan_id: int) -> list[Result]:
+    def update_switchport_mode(self, interface_names: list[InterfaceName], mode: str) -> Result:
         """
-        Retrieves a list of interfaces associated with a given VLAN ID from the database.
-        The list contains Result objects with interface information.
-        The interface information includes the interface name, VLAN ID
-        If the VLAN ID is not found, an empty list is returned.
-        If an error occurs, an empty list is returned.
+        Insert or update the switchport mode of one or more interfaces in the Switchports table, in one transaction.
+
+        Args:
+            interface_names (list[InterfaceName]): The names of the interfaces.
+            mode (str): access | trunk.
+
+        Returns:
+            Result: A Result object with the status of the update.
         """
         try:
             cursor = self.connection.cursor()
 
-            # Query to retrieve the interfaces linked to the specified VLAN ID
-            cursor.execute(
-                """
-                SELECT I.InterfaceName, VI.VlanID,
-                FROM VlanInterfaces VI
-                JOIN Interfaces I ON VI.Interfaces_FK = I.ID
-                JOIN Vlans V ON VI.VlanID = V.ID
-                WHERE VI.VlanID = ?
-                """, 
-                (vlan_id,)
-            )
-            
-            rows = cursor.fetchall()
-            
-            if not rows:
-                self.log.info(f"No interfaces found for VLAN ID {vlan_id}.")
-                return []
+            cursor.executemany("""
+                INSERT INTO Switchports (Interfaces_FK, Mode)
+                SELECT ID, ? FROM Interfaces WHERE InterfaceName = ?
+                ON CONFLICT (Interfaces_FK) DO UPDATE SET Mode = excluded.Mode
+                """, [(mode, interface_name) for interface_name in interface_names])
 
-            # Create a list of Result objects to return
-            result_list = [
-                Result(
-                    status=STATUS_OK,
-                    row_id=row[1],
-                    reason=f"Interface '{row[0]}' linked to VLAN '{row[2]}'",
-                    result={
-                        "InterfaceName": row[0],
-                        "VlanID": row[1],
-                    }
-                )
-                for row in rows
-            ]
+            if cursor.rowcount < len(interface_names):
+                self.connection.rollback()
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Interface(s) not found: {', '.join(interface_names)}")
 
-            return result_list
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
 
         except sqlite3.Error as e:
-            self.log.error(f"Database error retrieving interfaces by VLAN ID: {str(e)}")
-            return []
-
-        except Exception as e:
-            self.log.error(f"Unexpected error retrieving interfaces by VLAN ID: {str(e)}")
-            return []
-
-
-    '''
-                        NAT DATABASE
-    '''
+            self.connection.rollback()
+            self.log.error(f"Error updating switchport mode of {', '.join(interface_names)}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
 
-    def global_nat_pool_name_exists(self, pool_name: NatPoolName) -> Result:
+    def update_switchport_trunk_vlans(self, interface_names: list[InterfaceName], vlan_ids: list[int],
+                                      add: bool = False, remove: bool = False) -> Result:
         """
-        Check if a NAT pool with the given name exists in the NAT database.
+        Set, extend or reduce the VLANs allowed on one or more trunk ports in one transaction.
 
         Args:
-            pool_name (str): The name of the NAT pool to check for existence.
+            interface_names (list[InterfaceName]): The names of the interfaces.
+            vlan_ids (list[int]): The VLAN IDs.
+            add (bool): Add the VLANs to the allowed list instead of replacing it.
+            remove (bool): Remove the VLANs from the allowed list instead of replacing it.
 
         Returns:
-            Result: A Result object with the status and a boolean value indicating if the NAT pool exists.
-                    `status`: True is successful, False otherwise
-                    `row_id`: Row-ID of the found NAT Pool, Row-ID of 0 is Not Found
-
-        This method queries the NAT database to determine whether a NAT pool with the provided name exists.
-        If any matching pool is found, it returns a Result with STATUS_OK and True; otherwise, it returns
-        a Result with STATUS_OK and False.
-
+            Result: A Result object with the status of the update.
         """
         try:
             cursor = self.connection.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM Nats WHERE NatPoolName = ?", (pool_name,))
-            result = cursor.fetchone()
 
-            if result and result[0] > 0:
-                self.log.debug(
-                    f"global_nat_pool_name_exists({pool_name}) Exists")
-                return Result(True, row_id=result[0])
+            interface_ids = []
+
+            for interface_name in interface_names:
+                cursor.execute("SELECT ID FROM Interfaces WHERE InterfaceName = ?", (interface_name,))
+                row = cursor.fetchone()
+
+                if row is None:
+                    return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Interface '{interface_name}' not found")
+
+                interface_ids.append(row[0])
+
+            rows = [(interface_id, vlan_id) for interface_id in interface_ids for vlan_id in vlan_ids]
+
+            if remove:
+                cursor.executemany("DELETE FROM SwitchportTrunkVlans WHERE Interfaces_FK = ? AND VlanID = ?", rows)
             else:
-                self.log.debug(
-                    f"global_nat_pool_name_exists({pool_name}) NOT Exists")
-                return Result(False, row_id=0)
+                if not add:
+                    cursor.executemany("DELETE FROM SwitchportTrunkVlans WHERE Interfaces_FK = ?",
+                                       [(interface_id,) for interface_id in interface_ids])
+
+                cursor.executemany("INSERT OR IGNORE INTO SwitchportTrunkVlans (Interfaces_FK, VlanID) VALUES (?, ?)", rows)
+
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=interface_ids[0] if interface_ids else self.ROW_ID_NOT_FOUND)
 
         except sqlite3.Error as e:
-            error_message = f"Error checking NAT pool existence: {e}"
-            return Result(False, row_id=0, reason=error_message)
+            self.connection.rollback()
+            self.log.error(f"Error updating trunk VLANs of {', '.join(interface_names)}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
 
-    def insert_global_nat_pool(self, nat_pool_name: NatPoolName) -> Result:
+    def update_vlan_interfaces(self, vlan_id: int, interface_names: list[InterfaceName]) -> Result:
         """
-        Insert a new global NAT configuration into the 'Nats' table.
+        Set the access VLAN of one or more interfaces in the VlanInterfaces table, in one transaction.
 
         Args:
-            nat_pool_name (str): The name of the NAT pool.
+            vlan_id (int): The access VLAN ID.
+            interface_names (list[InterfaceName]): The names of the interfaces.
 
         Returns:
-            Result: A Result object with the status of the insertion and the row ID.
-                    - 'status' STATUS_OK if successful, STATUS_NOK otherwise
+            Result: A Result object with the status of the update.
         """
-        self.log.debug(f"insert_global_nat_pool({nat_pool_name})")
-
         try:
             cursor = self.connection.cursor()
-            cursor.execute(
-                "INSERT INTO Nats (NatPoolName) VALUES (?)", (nat_pool_name,))
-            self.connection.commit()
 
-            row_id = cursor.lastrowid
+            cursor.executemany("""
+                DELETE FROM VlanInterfaces WHERE Interfaces_FK = (SELECT ID FROM Interfaces WHERE InterfaceName = ?)
+                """, [(interface_name,) for interface_name in interface_names])
+
+            cursor.executemany("""
+                INSERT INTO VlanInterfaces (VlanID, Interfaces_FK, Bridge_FK)
+                SELECT ?, ID, ? FROM Interfaces WHERE InterfaceName = ?
+                """, [(vlan_id, RouterShellDB.FK_NOT_FOUND, interface_name) for interface_name in interface_names])
+
+            if cursor.rowcount < len(interface_names):
+                self.connection.rollback()
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Interface(s) not found: {', '.join(interface_names)}")
+
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error(f"Error linking VLAN {vlan_id} to {', '.join(interface_names)}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
+
+    def select_bridge_port_vlans(self, bridge_name: BridgeName) -> list[Result]:
+        """
+        Retrieve the switchport mode and VLAN membership of the ports of a bridge.
+
+        An access port reports its VlanInterfaces VLAN, a trunk port reports one row per
+        allowed VLAN; a trunk without an allowed list reports every VLAN in Vlans.
+
+        Args:
+            bridge_name (BridgeName): The name of the bridge.
+
+        Returns:
+            list[Result]: Result objects with 'InterfaceName', 'Mode' and 'VlanID' (None when the port has no VLAN).
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                WITH Ports AS (
+                    SELECT I.ID, I.InterfaceName, COALESCE(S.Mode, 'access') AS Mode
+                    FROM BridgeGroups BG
+                    JOIN Bridges B ON BG.Bridges_FK = B.ID
+                    JOIN Interfaces I ON BG.Interfaces_FK = I.ID
+                    LEFT JOIN Switchports S ON S.Interfaces_FK = I.ID
+                    WHERE B.BridgeName = ?
+                )
+                SELECT P.InterfaceName, P.Mode, VI.VlanID
+                FROM Ports P LEFT JOIN VlanInterfaces VI ON VI.Interfaces_FK = P.ID
+                WHERE P.Mode = 'access'
+                UNION ALL
+                SELECT P.InterfaceName, P.Mode, TV.VlanID
+                FROM Ports P JOIN SwitchportTrunkVlans TV ON TV.Interfaces_FK = P.ID
+                WHERE P.Mode = 'trunk'
+                UNION ALL
+                SELECT P.InterfaceName, P.Mode, V.VlanID
+                FROM Ports P JOIN Vlans V
+                WHERE P.Mode = 'trunk' AND NOT EXISTS (SELECT 1 FROM SwitchportTrunkVlans TV WHERE TV.Interfaces_FK = P.ID)
+                ORDER BY 1, 3
+                """, (bridge_name,))
+
+            return [Result(status=STATUS_OK, row_id=None,
+                           result={'InterfaceName': row[0], 'Mode': row[1], 'VlanID': row[2]})
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving port VLANs of bridge {bridge_name}: {e}"
+            self.log.error(error_message)
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+
+    def select_bridge_vlan_filtering(self, interface_name: InterfaceName) -> Result:
+        """
+        Retrieve the bridge of a bridge port and whether it filters VLANs.
+
+        Args:
+            interface_name (InterfaceName): A bridge port, or the bridge itself.
+
+        Returns:
+            Result: STATUS_OK with result {'BridgeName': str, 'VlanFiltering': bool},
+                    STATUS_NOK if the interface is not part of a bridge.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT B.BridgeName, B.VlanFiltering
+                FROM Bridges B
+                LEFT JOIN BridgeGroups BG ON BG.Bridges_FK = B.ID
+                LEFT JOIN Interfaces I ON BG.Interfaces_FK = I.ID
+                WHERE I.InterfaceName = ? OR B.BridgeName = ?
+                LIMIT 1
+                """, (interface_name, interface_name))
+            row = cursor.fetchone()
+
+            if row is None:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Interface '{interface_name}' is not part of a bridge")
+
+            return Result(status=STATUS_OK, row_id=None,
+                          result={'BridgeName': row[0], 'VlanFiltering': bool(row[1])})
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error retrieving bridge of {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
+
+    def insert_vlan_ids(self, vlan_ids: list[int]) -> Result:
+        """
+        Insert VLAN IDs with their default name (Vlan<vlan-id>) into the 'Vlans' table in one transaction.
+
+        VLAN IDs that already exist keep their name and description.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs.
+
+        Returns:
+            Result: A Result object with the status of the insert.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("INSERT OR IGNORE INTO Vlans (VlanID, VlanName) VALUES (?, ?)",
+                               [(vlan_id, f'Vlan{vlan_id}') for vlan_id in vlan_ids])
+            self.connection.commit()
+
+            self.log.debug(f"insert_vlan_ids() -> {len(vlan_ids)} VLAN(s)")
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error("Error inserting VLAN IDs: %s", e)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
+
+    def update_vlan_descriptions(self, vlan_ids: list[int], vlan_description: str) -> Result:
+        """
+        Update the description of several VLANs in one transaction.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs.
+            vlan_description (str): The new description.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("UPDATE Vlans SET VlanDescription = ? WHERE VlanID = ?",
+                               [(vlan_description, vlan_id) for vlan_id in vlan_ids])
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error("Error updating VLAN descriptions: %s", e)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=str(e))
+
+    def select_vlan_filtering_bridges(self) -> list[Result]:
+        """
+        Retrieve the names of the bridges with VLAN filtering enabled.
+
+        Returns:
+            list[Result]: Result objects with 'BridgeName'.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT BridgeName FROM Bridges WHERE VlanFiltering")
+
+            return [Result(status=STATUS_OK, row_id=None, result={'BridgeName': row[0]}) for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving vlan-filtering bridges: {e}"
+            self.log.error(error_message)
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+
+    def select_interfaces_by_vlan_id(self, vlan_id: int) -> list[Result]:
+        """
+        Retrieves a list of interfaces associated with a given VLAN ID from the database.
+        The list contains Result objects with interface information.
+        The interface information includes the interface name, VLAN ID
+        If the VLAN ID is not found, an empty list is returned.
+        If an error occurs, an empty list is returned.
+        """
+        try:
+            cursor = self.connection.cursor()
+
+            # Query to retrieve the interfaces linked to the specified VLAN ID
+            cursor.execute(
+                """
+                SELECT I.InterfaceName, VI.VlanID,
+                FROM VlanInterfaces VI
+                JOIN Interfaces I ON VI.Interfaces_FK = I.ID
+                JOIN Vlans V ON VI.VlanID = V.ID
+                WHERE VI.VlanID = ?
+                """, 
+                (vlan_id,)
+            )
+            
+            rows = cursor.fetchall()
+            
+            if not rows:
+                self.log.info(f"No interfaces found for VLAN ID {vlan_id}.")
+                return []
+
+            # Create a list of Result objects to return
+            result_list = [
+                Result(
+                    status=STATUS_OK,
+                    row_id=row[1],
+                    reason=f"Interface '{row[0]}' linked to VLAN '{row[2]}'",
+                    result={
+                        "InterfaceName": row[0],
+                        "VlanID": row[1],
+                    }
+                )
+                for row in rows
+            ]
+
+            return result_list
+
+        except sqlite3.Error as e:
+            self.log.error(f"Database error retrieving interfaces by VLAN ID: {str(e)}")
+            return []
+
+        except Exception as e:
+            self.log.error(f"Unexpected error retrieving interfaces by VLAN ID: {str(e)}")
+            return []
+
+
+    '''
+                        NAT DATABASE
+    '''
+
+    def global_nat_pool_name_exists(self, pool_name: NatPoolName) -> Result:
+        """
+        Check if a NAT pool with the given name exists in the NAT database.
+
+        Args:
+            pool_name (str): The name of the NAT pool to check for existence.
+
+        Returns:
+            Result: A Result object with the status and a boolean value indicating if the NAT pool exists.
+                    `status`: True is successful, False otherwise
+                    `row_id`: Row-ID of the found NAT Pool, Row-ID of 0 is Not Found
+
+        This method queries the NAT database to determine whether a NAT pool with the provided name exists.
+        If any matching pool is found, it returns a Result with STATUS_OK and True; otherwise, it returns
+        a Result with STATUS_OK and False.
+
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM Nats WHERE NatPoolName = ?", (pool_name,))
+            result = cursor.fetchone()
+
+            if result and result[0] > 0:
+                self.log.debug(
+                    f"global_nat_pool_name_exists({pool_name}) Exists")
+                return Result(True, row_id=result[0])
+            else:
+                self.log.debug(
+                    f"global_nat_pool_name_exists({pool_name}) NOT Exists")
+                return Result(False, row_id=0)
+
+        except sqlite3.Error as e:
+            error_message = f"Error checking NAT pool existence: {e}"
+            return Result(False, row_id=0, reason=error_message)
+
+    def insert_global_nat_pool(self, nat_pool_name: NatPoolName) -> Result:
+        """
+        Insert a new global NAT configuration into the 'Nats' table.
+
+        Args:
+            nat_pool_name (str): The name of the NAT pool.
+
+        Returns:
+            Result: A Result object with the status of the insertion and the row ID.
+                    - 'status' STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        self.log.debug(f"insert_global_nat_pool({nat_pool_name})")
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "INSERT INTO Nats (NatPoolName) VALUES (?)", (nat_pool_name,))
+            self.connection.commit()
+
+            row_id = cursor.lastrowid
             self.log.debug(
                 f"Inserted global NAT pool '{nat_pool_name}' with row ID: {row_id}")
 
@@ -1464,15 +2013,21 @@ class RouterShellDB(metaclass=Singleton):
         try:
             nat_pool_result = self.select_global_nat_row_id(nat_pool_name)
 
-            if not nat_pool_result.status:
+            if nat_pool_result.status:
                 return nat_pool_result
 
             nat_pool_id = nat_pool_result.row_id
 
             cursor = self.connection.cursor()
-            cursor.execute("DELETE FROM NatDirections WHERE NAT_FK = ? AND INTERFACE_FK = ?",
-                           (nat_pool_id, interface_name))
+            cursor.execute("""
+                DELETE FROM NatDirections
+                WHERE NAT_FK = ? AND Interfaces_FK = (SELECT ID FROM Interfaces WHERE InterfaceName = ?)
+            """, (nat_pool_id, interface_name))
             self.connection.commit()
+
+            if cursor.rowcount == 0:
+                return Result(STATUS_NOK, reason=f"No NAT direction found for interface: {interface_name} in NAT pool: {nat_pool_name}")
+
             return Result(STATUS_OK)
 
         except sqlite3.Error as e:
@@ -1735,67 +2290,875 @@ class RouterShellDB(metaclass=Singleton):
             self.log.error(error_message)
             return Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
 
-    '''
-                        DHCP-SERVER DATABASE
-    '''
-
-    def select_dhcp_server_pool_list(self) -> list['Result']:
+    def select_nat_direction_bindings(self) -> list[Result]:
         """
-        Retrieve a list of DHCP server pool names from the 'DHCPServer' table.
+        Select every NAT pool to interface binding from the 'NatDirections' table.
 
-        Returns:
-            list[Result]: A list of Result objects, each representing a row from the 'DHCPServer' table.
-                          Each Result contains a dictionary with the key 'DhcpPoolname' and its value.
+        This is the complete NAT state used to compile the NAT ruleset, so all pools
+        and directions are returned in one query.
 
-        Note:
-        - This method assumes that the 'DHCPServer' table exists with the specified schema.
+        Returns:
+            list[Result]: A list of Result objects. Each `result` contains:
+                * `NatPoolName`: The name of the NAT pool.
+                * `InterfaceName`: The name of the interface bound to the pool.
+                * `Direction`: The NAT direction (inside | outside).
+            An empty list is returned when no bindings exist or on error.
         """
         try:
-            # Define the SQL query to retrieve DHCP server pool names.
-            query = "SELECT ID, DhcpPoolname FROM DHCPServer;"
             cursor = self.connection.cursor()
-            cursor.execute(query)
-
-            # Fetch all rows from the executed query
-            rows = cursor.fetchall()
-
-            # Build Result objects for each DHCP server pool name.
-            results = [
-                Result(
-                    status=STATUS_OK,
-                    row_id=row[0],
-                    reason=f"Retrieved DHCP server pool '{row[1]}' successfully",
-                    result={"DhcpPoolname": row[1]}
-                )
-                for row in rows
-            ]
+            cursor.execute("""
+                SELECT N.NatPoolName, I.InterfaceName, ND.Direction
+                FROM NatDirections AS ND
+                JOIN Interfaces AS I ON ND.Interfaces_FK = I.ID
+                JOIN Nats AS N ON ND.NAT_FK = N.ID
+                ORDER BY N.NatPoolName, ND.Direction, I.InterfaceName
+            """)
 
-            return results
+            return [Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND,
+                           result={'NatPoolName': row[0], 'InterfaceName': row[1], 'Direction': row[2]})
+                    for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
-            error_message = f"Failed to retrieve DHCP server pool names. Error: {str(e)}"
-            self.log.error(error_message)
-            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+            self.log.error(f"Error selecting NAT direction bindings: {e}")
+            return []
 
-    def insert_dhcp_pool_name(self, dhcp_pool_name: DhcpPoolName) -> Result:
+    def insert_nat_static_mapping(self, protocol: str, inside_address: InetAddressText, inside_port: int | None,
+                                  outside_address: InetAddressText, outside_port: int | None) -> Result:
         """
-        Inserts a DHCP pool name into the DHCPServer table.
+        Insert a static NAT mapping into the 'NatStaticMappings' table.
 
         Args:
-            dhcp_pool_name (str): The name of the DHCP pool to insert.
+            protocol (str): ip (1:1 static NAT) | tcp | udp (port forward).
+            inside_address (str): The inside local address.
+            inside_port (int | None): The inside local port, None for 1:1 static NAT.
+            outside_address (str): The inside global (outside) address.
+            outside_port (int | None): The inside global (outside) port, None for 1:1 static NAT.
 
         Returns:
-            Result: A Result object representing the outcome of the operation.
-
-        Note:
-        - 'status' attribute in the returned Result object will be STATUS_OK for successful insertions, and STATUS_NOK for failed ones.
-        - 'row_id' represents the unique identifier of the inserted row if the insertion is successful, or 0 if it fails.
-        - 'reason' in the Result object provides additional information about the operation, which is particularly useful for error messages.
+            Result: A Result object with the status of the insertion.
         """
         try:
-            query = "INSERT INTO DHCPServer (DhcpPoolname) VALUES (?)"
             cursor = self.connection.cursor()
-            cursor.execute(query, (dhcp_pool_name,))
+            cursor.execute("""
+                INSERT INTO NatStaticMappings (Protocol, InsideAddress, InsidePort, OutsideAddress, OutsidePort)
+                VALUES (?, ?, ?, ?, ?)
+                """, (protocol, inside_address, inside_port, outside_address, outside_port))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting static NAT mapping: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_nat_static_mapping(self, protocol: str, inside_address: InetAddressText, inside_port: int | None,
+                                  outside_address: InetAddressText, outside_port: int | None) -> Result:
+        """
+        Delete a static NAT mapping from the 'NatStaticMappings' table.
+
+        Args:
+            protocol (str): ip (1:1 static NAT) | tcp | udp (port forward).
+            inside_address (str): The inside local address.
+            inside_port (int | None): The inside local port, None for 1:1 static NAT.
+            outside_address (str): The inside global (outside) address.
+            outside_port (int | None): The inside global (outside) port, None for 1:1 static NAT.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                DELETE FROM NatStaticMappings
+                WHERE Protocol = ? AND InsideAddress = ? AND InsidePort IS ?
+                AND OutsideAddress = ? AND OutsidePort IS ?
+                """, (protocol, inside_address, inside_port, outside_address, outside_port))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason="No matching static NAT mapping found for deletion")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting static NAT mapping: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_nat_static_mappings(self) -> list[Result]:
+        """
+        Select every static NAT mapping from the 'NatStaticMappings' table.
+
+        Returns:
+            list[Result]: A list of Result objects. Each `result` contains the keys
+                `Protocol`, `InsideAddress`, `InsidePort`, `OutsideAddress` and `OutsidePort`.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT Protocol, InsideAddress, InsidePort, OutsideAddress, OutsidePort
+                FROM NatStaticMappings
+                ORDER BY ID
+            """)
+
+            columns = [column[0] for column in cursor.description]
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result=dict(zip(columns, row, strict=True)))
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting static NAT mappings: {e}")
+            return []
+
+    def update_nat_flow_offload(self, enable: bool) -> Result:
+        """
+        Enable or disable NAT flow offload in the 'NatSettings' table.
+
+        Args:
+            enable (bool): True to enable flow offload, False to disable it.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("UPDATE NatSettings SET FlowOffload = ?", (enable,))
+            self.connection.commit()
+            return Result(STATUS_OK)
+
+        except sqlite3.Error as e:
+            error_message = f"Error updating NAT flow offload: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_nat_flow_offload(self) -> Result:
+        """
+        Select the NAT flow offload setting from the 'NatSettings' table.
+
+        Returns:
+            Result: A Result object, `result` contains the key `FlowOffload`.
+                    Result.status = STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT FlowOffload FROM NatSettings LIMIT 1")
+            row = cursor.fetchone()
+
+            return Result(STATUS_OK, result={'FlowOffload': bool(row and row[0])})
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting NAT flow offload: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message, result={'FlowOffload': False})
+
+    def delete_all_nat_configuration(self) -> Result:
+        """
+        Delete every NAT pool, NAT interface binding and static NAT mapping from the NAT tables
+        and disable flow offload.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+                    Result.status = STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM NatDirections")
+            cursor.execute("DELETE FROM NatStaticMappings")
+            cursor.execute("DELETE FROM Nats")
+            cursor.execute("UPDATE NatSettings SET FlowOffload = FALSE")
+            self.connection.commit()
+            return Result(STATUS_OK, reason="NAT configuration deleted successfully")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting NAT configuration: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    '''
+                        DNS DATABASE
+    '''
+
+    DNS_SETTINGS_COLUMNS = ('CacheSize', 'NegativeCache', 'MinCacheTtl', 'ForwardMax')
+
+    def update_dns_setting(self, column: str, value: int | bool | None) -> Result:
+        """
+        Update a DNS setting in the 'DnsSettings' table.
+
+        Args:
+            column (str): The setting column, one of `DNS_SETTINGS_COLUMNS`.
+            value (int | bool | None): The value of the setting, None for the dnsmasq default.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        if column not in self.DNS_SETTINGS_COLUMNS:
+            return Result(STATUS_NOK, reason=f"Invalid DNS setting: {column}")
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"UPDATE DnsSettings SET {column} = ?", (value,))
+            self.connection.commit()
+            return Result(STATUS_OK)
+
+        except sqlite3.Error as e:
+            error_message = f"Error updating DNS setting {column}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_dns_settings(self) -> Result:
+        """
+        Select the DNS settings from the 'DnsSettings' table.
+
+        Returns:
+            Result: A Result object, `result` contains the keys of `DNS_SETTINGS_COLUMNS`.
+                    Result.status = STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        defaults = {'CacheSize': None, 'NegativeCache': True, 'MinCacheTtl': None, 'ForwardMax': None}
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"SELECT {', '.join(self.DNS_SETTINGS_COLUMNS)} FROM DnsSettings LIMIT 1")
+            row = cursor.fetchone()
+
+            if not row:
+                return Result(STATUS_OK, result=defaults)
+
+            settings = dict(zip(self.DNS_SETTINGS_COLUMNS, row, strict=True))
+            settings['NegativeCache'] = bool(settings['NegativeCache'])
+            return Result(STATUS_OK, result=settings)
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting DNS settings: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message, result=defaults)
+
+    '''
+                        ROUTING DATABASE
+    '''
+
+    def insert_track(self, track_id: int, track_type: str, interface_name: InterfaceName | None,
+                     target: InetAddressText | None, interval: int, threshold: int) -> Result:
+        """
+        Insert or replace a track in the 'Tracks' table.
+
+        Args:
+            track_id (int): The track ID.
+            track_type (str): interface | icmp | arp.
+            interface_name (str | None): The tracked interface, or the source interface of the probe.
+            target (str | None): The probe target address, None for an interface track.
+            interval (int): The probe interval in milliseconds.
+            threshold (int): The consecutive missed probes before the track goes down.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO Tracks (TrackID, Type, InterfaceName, Target, Interval, Threshold)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (TrackID) DO UPDATE SET
+                    Type = excluded.Type, InterfaceName = excluded.InterfaceName, Target = excluded.Target,
+                    Interval = excluded.Interval, Threshold = excluded.Threshold
+                """, (track_id, track_type, interface_name, target, interval, threshold))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting track {track_id}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_track(self, track_id: int) -> Result:
+        """
+        Delete a track from the 'Tracks' table.
+
+        Args:
+            track_id (int): The track ID.
+
+        Returns:
+            Result: A Result object with the status of the deletion, STATUS_NOK if the track does not exist.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM Tracks WHERE TrackID = ?", (track_id,))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Track {track_id} not found")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting track {track_id}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_tracks(self) -> list[Result]:
+        """
+        Select every track from the 'Tracks' table.
+
+        Returns:
+            list[Result]: A list of Result objects ordered by track ID. Each `result` contains the keys
+                `TrackID`, `Type`, `InterfaceName`, `Target`, `Interval` and `Threshold`.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT TrackID, Type, InterfaceName, Target, Interval, Threshold
+                FROM Tracks
+                ORDER BY TrackID
+            """)
+
+            columns = [column[0] for column in cursor.description]
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result=dict(zip(columns, row, strict=True)))
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting tracks: {e}")
+            return []
+
+    def insert_static_route(self, route_table: int, destination: InetCidrText, next_hop: str, metric: int,
+                            weight: int | None, track_id: int | None) -> Result:
+        """
+        Insert or replace a static route in the 'StaticRoutes' table.
+
+        Args:
+            route_table (int): The routing table.
+            destination (str): The destination prefix.
+            next_hop (str): The next-hop address or outgoing interface.
+            metric (int): The route metric.
+            weight (int | None): The multipath next-hop weight, None for a single path route.
+            track_id (int | None): The track the route follows, None when untracked.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO StaticRoutes (RouteTable, Destination, NextHop, Metric, Weight, TrackID)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (RouteTable, Destination, NextHop, Metric) DO UPDATE SET
+                    Weight = excluded.Weight, TrackID = excluded.TrackID
+                """, (route_table, destination, next_hop, metric, weight, track_id))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting static route {destination} {next_hop}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_static_route(self, route_table: int, destination: InetCidrText, next_hop: str, metric: int) -> Result:
+        """
+        Delete a static route from the 'StaticRoutes' table.
+
+        Args:
+            route_table (int): The routing table.
+            destination (str): The destination prefix.
+            next_hop (str): The next-hop address or outgoing interface.
+            metric (int): The route metric.
+
+        Returns:
+            Result: A Result object with the status of the deletion, STATUS_NOK if the route does not exist.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                DELETE FROM StaticRoutes WHERE RouteTable = ? AND Destination = ? AND NextHop = ? AND Metric = ?
+                """, (route_table, destination, next_hop, metric))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Static route {destination} {next_hop} metric {metric} "
+                                             f"table {route_table} not found")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting static route {destination} {next_hop}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_static_routes(self) -> list[Result]:
+        """
+        Select every static route from the 'StaticRoutes' table.
+
+        Returns:
+            list[Result]: A list of Result objects in configuration order. Each `result` contains the keys
+                `RouteTable`, `Destination`, `NextHop`, `Metric`, `Weight` and `TrackID`.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT RouteTable, Destination, NextHop, Metric, Weight, TrackID
+                FROM StaticRoutes
+                ORDER BY ID
+            """)
+
+            columns = [column[0] for column in cursor.description]
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result=dict(zip(columns, row, strict=True)))
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting static routes: {e}")
+            return []
+
+    def insert_policy_route(self, priority: int, source: InetCidrText | None, fwmark: int | None,
+                            fwmask: int | None, input_interface: InterfaceName | None, route_table: int) -> Result:
+        """
+        Insert or replace a policy routing rule in the 'PolicyRoutes' table.
+
+        Args:
+            priority (int): The rule priority.
+            source (str | None): The source prefix to match.
+            fwmark (int | None): The firewall mark to match.
+            fwmask (int | None): The firewall mark mask, None for an exact match.
+            input_interface (str | None): The incoming interface to match.
+            route_table (int): The routing table looked up on a match.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO PolicyRoutes (Priority, Source, FwMark, FwMask, InputInterface, RouteTable)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (Priority) DO UPDATE SET
+                    Source = excluded.Source, FwMark = excluded.FwMark, FwMask = excluded.FwMask,
+                    InputInterface = excluded.InputInterface, RouteTable = excluded.RouteTable
+                """, (priority, source, fwmark, fwmask, input_interface, route_table))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting policy route {priority}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_policy_route(self, priority: int) -> Result:
+        """
+        Delete a policy routing rule from the 'PolicyRoutes' table.
+
+        Args:
+            priority (int): The rule priority.
+
+        Returns:
+            Result: A Result object with the status of the deletion, STATUS_NOK if the rule does not exist.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM PolicyRoutes WHERE Priority = ?", (priority,))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Policy route {priority} not found")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting policy route {priority}: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_policy_routes(self) -> list[Result]:
+        """
+        Select every policy routing rule from the 'PolicyRoutes' table.
+
+        Returns:
+            list[Result]: A list of Result objects ordered by priority. Each `result` contains the keys
+                `Priority`, `Source`, `FwMark`, `FwMask`, `InputInterface` and `RouteTable`.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT Priority, Source, FwMark, FwMask, InputInterface, RouteTable
+                FROM PolicyRoutes
+                ORDER BY Priority
+            """)
+
+            columns = [column[0] for column in cursor.description]
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result=dict(zip(columns, row, strict=True)))
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting policy routes: {e}")
+            return []
+
+    '''
+                        FIREWALL ACCESS-LIST DATABASE
+    '''
+
+    def select_acl_policy_row_id(self, acl_name: AclName) -> Result:
+        """
+        Select the row ID of an access-list from the 'FireWallPolicies' table.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            Result: A Result object with the row ID of the access-list.
+                    Result.status = STATUS_OK if found, STATUS_NOK otherwise
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT ID FROM FireWallPolicies WHERE PolicyName = ?", (acl_name,))
+            row = cursor.fetchone()
+
+            if row:
+                return Result(STATUS_OK, row_id=row[0])
+
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Access-list {acl_name} not found")
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting access-list: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def insert_acl_policy(self, acl_name: AclName) -> Result:
+        """
+        Insert a new access-list into the 'FireWallPolicies' table.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            Result: A Result object with the status of the insertion and the row ID of the access-list.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("INSERT INTO FireWallPolicies (PolicyName) VALUES (?)", (acl_name,))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting access-list: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def update_acl_policy_description(self, acl_name: AclName, description: str | None) -> Result:
+        """
+        Update the description of an access-list in the 'FireWallPolicies' table.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            description (str | None): The description, None to remove it.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("UPDATE FireWallPolicies SET Description = ? WHERE PolicyName = ?", (description, acl_name))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Access-list {acl_name} not found")
+
+        except sqlite3.Error as e:
+            error_message = f"Error updating access-list description: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def delete_acl_policy(self, acl_name: AclName) -> Result:
+        """
+        Delete an access-list, its rules and its interface bindings.
+
+        Args:
+            acl_name (str): The name of the access-list.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+                    Result.status = STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        policy_result = self.select_acl_policy_row_id(acl_name)
+
+        if policy_result.status:
+            return policy_result
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM FirewallRules WHERE FirewallPolicy_FK = ?", (policy_result.row_id,))
+            cursor.execute("DELETE FROM FWDirectionInterfaces WHERE FirewallPolicy_FK = ?", (policy_result.row_id,))
+            cursor.execute("DELETE FROM FireWallPolicies WHERE ID = ?", (policy_result.row_id,))
+            self.connection.commit()
+            return Result(STATUS_OK, reason="Access-list deleted successfully")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting access-list: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def insert_acl_rule(self, acl_name: AclName, sequence: int, action: str, protocol: str,
+                        source: InetCidrText | None, source_port: int | None,
+                        destination: InetCidrText | None, destination_port: int | None) -> Result:
+        """
+        Insert a rule into the 'FirewallRules' table of an access-list.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            sequence (int): The evaluation order of the rule within the access-list.
+            action (str): permit | deny.
+            protocol (str): ip | tcp | udp | icmp.
+            source (str | None): Source network in CIDR notation, None for any.
+            source_port (int | None): Source port, None for any.
+            destination (str | None): Destination network in CIDR notation, None for any.
+            destination_port (int | None): Destination port, None for any.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        policy_result = self.select_acl_policy_row_id(acl_name)
+
+        if policy_result.status:
+            return policy_result
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO FirewallRules (FirewallPolicy_FK, Sequence, Action, Protocol,
+                                           SourceIP, SourcePort, DestinationIP, DestinationPort)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (policy_result.row_id, sequence, action, protocol,
+                      source, source_port, destination, destination_port))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting access-list rule: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_acl_rule(self, acl_name: AclName, sequence: int) -> Result:
+        """
+        Delete a rule from an access-list by sequence number.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            sequence (int): The sequence number of the rule.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                DELETE FROM FirewallRules
+                WHERE Sequence = ?
+                AND FirewallPolicy_FK = (SELECT ID FROM FireWallPolicies WHERE PolicyName = ?)
+                """, (sequence, acl_name))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Access-list {acl_name} has no rule with sequence {sequence}")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting access-list rule: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_acl_rules(self) -> list[Result]:
+        """
+        Select every access-list rule, ordered by access-list name and sequence.
+
+        Returns:
+            list[Result]: A list of Result objects. Each `result` contains the keys
+                `PolicyName`, `Description`, `Sequence`, `Action`, `Protocol`, `SourceIP`,
+                `SourcePort`, `DestinationIP` and `DestinationPort`. Access-lists without
+                rules are returned once with `Sequence` set to None.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT P.PolicyName, P.Description, R.Sequence, R.Action, R.Protocol,
+                       R.SourceIP, R.SourcePort, R.DestinationIP, R.DestinationPort
+                FROM FireWallPolicies AS P
+                LEFT JOIN FirewallRules AS R ON R.FirewallPolicy_FK = P.ID
+                ORDER BY P.PolicyName, R.Sequence
+            """)
+
+            columns = [column[0] for column in cursor.description]
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result=dict(zip(columns, row, strict=True)))
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting access-list rules: {e}")
+            return []
+
+    def insert_acl_interface_direction(self, acl_name: AclName, interface_name: InterfaceName, direction: str) -> Result:
+        """
+        Bind an access-list to an interface direction in the 'FWDirectionInterfaces' table.
+
+        An interface carries at most one access-list per direction; an existing binding
+        for the same direction is replaced.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            interface_name (str): The name of the interface.
+            direction (str): in | out.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        policy_result = self.select_acl_policy_row_id(acl_name)
+
+        if policy_result.status:
+            return policy_result
+
+        interface_result = self.interface_exists(interface_name)
+
+        if not interface_result.status:
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Interface {interface_name} does not exists")
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO FWDirectionInterfaces (FirewallPolicy_FK, Interfaces_FK, Direction)
+                VALUES (?, ?, ?)
+                """, (policy_result.row_id, interface_result.row_id, direction))
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting access-group: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_acl_interface_direction(self, acl_name: AclName, interface_name: InterfaceName, direction: str) -> Result:
+        """
+        Remove an access-list binding from an interface direction.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            interface_name (str): The name of the interface.
+            direction (str): in | out.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                DELETE FROM FWDirectionInterfaces
+                WHERE Direction = ?
+                AND FirewallPolicy_FK = (SELECT ID FROM FireWallPolicies WHERE PolicyName = ?)
+                AND Interfaces_FK = (SELECT ID FROM Interfaces WHERE InterfaceName = ?)
+                """, (direction, acl_name, interface_name))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(STATUS_OK)
+
+            return Result(STATUS_NOK, reason=f"Access-group {acl_name} {direction} not found on {interface_name}")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting access-group: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def select_acl_interface_bindings(self) -> list[Result]:
+        """
+        Select every access-list to interface binding.
+
+        Returns:
+            list[Result]: A list of Result objects. Each `result` contains the keys
+                `PolicyName`, `InterfaceName` and `Direction`.
+            An empty list is returned on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT P.PolicyName, I.InterfaceName, D.Direction
+                FROM FWDirectionInterfaces AS D
+                JOIN FireWallPolicies AS P ON D.FirewallPolicy_FK = P.ID
+                JOIN Interfaces AS I ON D.Interfaces_FK = I.ID
+                ORDER BY D.Direction, I.InterfaceName
+            """)
+
+            return [Result(STATUS_OK, row_id=self.ROW_ID_NOT_FOUND,
+                           result={'PolicyName': row[0], 'InterfaceName': row[1], 'Direction': row[2]})
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting access-group bindings: {e}")
+            return []
+
+    '''
+                        DHCP-SERVER DATABASE
+    '''
+
+    def select_dhcp_server_pool_list(self) -> list['Result']:
+        """
+        Retrieve a list of DHCP server pool names from the 'DHCPServer' table.
+
+        Returns:
+            list[Result]: A list of Result objects, each representing a row from the 'DHCPServer' table.
+                          Each Result contains a dictionary with the key 'DhcpPoolname' and its value.
+
+        Note:
+        - This method assumes that the 'DHCPServer' table exists with the specified schema.
+        """
+        try:
+            # Define the SQL query to retrieve DHCP server pool names.
+            query = "SELECT ID, DhcpPoolname FROM DHCPServer;"
+            cursor = self.connection.cursor()
+            cursor.execute(query)
+
+            # Fetch all rows from the executed query
+            rows = cursor.fetchall()
+
+            # Build Result objects for each DHCP server pool name.
+            results = [
+                Result(
+                    status=STATUS_OK,
+                    row_id=row[0],
+                    reason=f"Retrieved DHCP server pool '{row[1]}' successfully",
+                    result={"DhcpPoolname": row[1]}
+                )
+                for row in rows
+            ]
+
+            return results
+
+        except sqlite3.Error as e:
+            error_message = f"Failed to retrieve DHCP server pool names. Error: {str(e)}"
+            self.log.error(error_message)
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+
+    def insert_dhcp_pool_name(self, dhcp_pool_name: DhcpPoolName) -> Result:
+        """
+        Inserts a DHCP pool name into the DHCPServer table.
+
+        Args:
+            dhcp_pool_name (str): The name of the DHCP pool to insert.
+
+        Returns:
+            Result: A Result object representing the outcome of the operation.
+
+        Note:
+        - 'status' attribute in the returned Result object will be STATUS_OK for successful insertions, and STATUS_NOK for failed ones.
+        - 'row_id' represents the unique identifier of the inserted row if the insertion is successful, or 0 if it fails.
+        - 'reason' in the Result object provides additional information about the operation, which is particularly useful for error messages.
+        """
+        try:
+            query = "INSERT INTO DHCPServer (DhcpPoolname) VALUES (?)"
+            cursor = self.connection.cursor()
+            cursor.execute(query, (dhcp_pool_name,))
             self.connection.commit()
             row_id = cursor.lastrowid
             return Result(status=STATUS_OK, row_id=row_id, reason=f"Inserted '{dhcp_pool_name}' pool successfully.")
@@ -2225,40 +3588,91 @@ class RouterShellDB(metaclass=Singleton):
 
     def update_dhcp_pool_dhcp_version_mode(self, dhcp_pool_name: DhcpPoolName, mode: str) -> Result:
         """
-        Update the DHCP version mode for a specific DHCP pool.
+        Update the DHCP version mode for a specific DHCP pool.
+
+        Parameters:
+            dhcp_pool_name (str): The name of the DHCP pool.
+            mode (str): The DHCP version mode to set.
+
+        Returns:
+            Result: A Result object representing the outcome of the operation.
+        """
+        try:
+            query = """
+                UPDATE DHCPv6ServerOption
+                SET Mode = ?
+                WHERE DHCPv6ServerOption.DHCPVersionServerOptions_FK IN (
+                    SELECT DHCPVersionServerOptions.ID
+                    FROM DHCPVersionServerOptions
+                    JOIN DHCPSubnet ON DHCPVersionServerOptions.DHCPSubnet_FK = DHCPSubnet.ID
+                    JOIN DHCPServer ON DHCPSubnet.DHCPServer_FK = DHCPServer.ID
+                    JOIN Interfaces ON DHCPServer.Interfaces_FK = Interfaces.ID
+                    WHERE DHCPServer.DhcpPoolname = ?
+                );
+            """
+
+            cursor = self.connection.cursor()
+            cursor.execute(query, (mode, dhcp_pool_name,))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Updated DHCP version mode for DHCP pool '{dhcp_pool_name}' to '{mode}' successfully.")
+            else:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Failed to update DHCP version mode for DHCP pool '{dhcp_pool_name}' to '{mode}'.")
+
+        except sqlite3.Error as e:
+            error_message = f"Failed to update DHCP version mode. Error: {str(e)}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def update_dhcp_pool_utilization_alert(self, dhcp_pool_name: DhcpPoolName, percent: int | None) -> Result:
+        """
+        Update the occupancy percent raising a utilization alert for a DHCP pool.
+
+        Parameters:
+            dhcp_pool_name (str): The name of the DHCP pool.
+            percent (int | None): The occupancy percent, None to disable the alert.
+
+        Returns:
+            Result: A Result object representing the outcome of the operation.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("UPDATE DHCPServer SET UtilizationAlert = ? WHERE DhcpPoolname = ?", (percent, dhcp_pool_name))
+            self.connection.commit()
+
+            if cursor.rowcount > 0:
+                return Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Updated utilization alert of DHCP pool '{dhcp_pool_name}' to '{percent}' successfully.")
+            else:
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"DHCP pool '{dhcp_pool_name}' not found.")
+
+        except sqlite3.Error as e:
+            error_message = f"Failed to update DHCP pool utilization alert. Error: {str(e)}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def select_dhcp_pool_utilization_alert(self, dhcp_pool_name: DhcpPoolName) -> Result:
+        """
+        Retrieve the occupancy percent raising a utilization alert for a DHCP pool.
 
         Parameters:
             dhcp_pool_name (str): The name of the DHCP pool.
-            mode (str): The DHCP version mode to set.
 
         Returns:
-            Result: A Result object representing the outcome of the operation.
+            Result: A Result object with the 'UtilizationAlert' percent (None when disabled) if the pool exists.
         """
         try:
-            query = """
-                UPDATE DHCPv6ServerOption
-                SET Mode = ?
-                WHERE DHCPv6ServerOption.DHCPVersionServerOptions_FK IN (
-                    SELECT DHCPVersionServerOptions.ID
-                    FROM DHCPVersionServerOptions
-                    JOIN DHCPSubnet ON DHCPVersionServerOptions.DHCPSubnet_FK = DHCPSubnet.ID
-                    JOIN DHCPServer ON DHCPSubnet.DHCPServer_FK = DHCPServer.ID
-                    JOIN Interfaces ON DHCPServer.Interfaces_FK = Interfaces.ID
-                    WHERE DHCPServer.DhcpPoolname = ?
-                );
-            """
-
             cursor = self.connection.cursor()
-            cursor.execute(query, (mode, dhcp_pool_name,))
-            self.connection.commit()
+            cursor.execute("SELECT ID, UtilizationAlert FROM DHCPServer WHERE DhcpPoolname = ?", (dhcp_pool_name,))
+            sql_result = cursor.fetchone()
 
-            if cursor.rowcount > 0:
-                return Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Updated DHCP version mode for DHCP pool '{dhcp_pool_name}' to '{mode}' successfully.")
+            if sql_result:
+                return Result(status=STATUS_OK, row_id=sql_result[0], result={'UtilizationAlert': sql_result[1]})
             else:
-                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Failed to update DHCP version mode for DHCP pool '{dhcp_pool_name}' to '{mode}'.")
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"DHCP pool '{dhcp_pool_name}' not found.")
 
         except sqlite3.Error as e:
-            error_message = f"Failed to update DHCP version mode. Error: {str(e)}"
+            error_message = f"Failed to retrieve DHCP pool utilization alert. Error: {str(e)}"
             self.log.error(error_message)
             return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
 
@@ -2470,6 +3884,36 @@ class RouterShellDB(metaclass=Singleton):
         except sqlite3.Error as e:
             return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Failed to retrieve DHCP subnet information. Error: {str(e)}")
 
+    def select_dhcp_pool_name_via_dhcp_pool_subnet(self, inet_subnet_cidr: InetCidrText) -> Result:
+        """
+        Retrieve the DHCP pool name a subnet belongs to from the database.
+
+        Args:
+            inet_subnet_cidr (str): The subnet CIDR of the DHCP pool.
+
+        Returns:
+            Result: A Result object containing the DHCP pool name if found, or an error message if not found.
+        """
+        try:
+            cursor = self.connection.cursor()
+
+            query = "SELECT DHCPServer.ID, DHCPServer.DhcpPoolname FROM DHCPServer " \
+                    "JOIN DHCPSubnet ON DHCPSubnet.DHCPServer_FK = DHCPServer.ID " \
+                    "WHERE DHCPSubnet.InetSubnet = ?"
+
+            cursor.execute(query, (inet_subnet_cidr,))
+            sql_result = cursor.fetchone()
+
+            if sql_result:
+                pool_id, dhcp_pool_name = sql_result
+
+                return Result(status=STATUS_OK, row_id=pool_id, result={'DhcpPoolname': dhcp_pool_name})
+            else:
+                return Result(status=STATUS_NOK, reason="DHCP pool not found for subnet: " + inet_subnet_cidr)
+
+        except sqlite3.Error as e:
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"Failed to retrieve DHCP pool name. Error: {str(e)}")
+
     def dhcp_pool_dhcp_version(self, dhcp_pool_name: DhcpPoolName) -> Result:
         """
         Retrieve the DHCP version for a specified DHCP pool.
@@ -3054,6 +4498,89 @@ class RouterShellDB(metaclass=Singleton):
                 f"Error updating shutdown status for interface {interface_name}: {e}")
             return Result(status=STATUS_NOK, row_id=existing_result.row_id, reason=f"{e}")
 
+    def select_existing_interfaces(self, interface_names: list[InterfaceName]) -> list[InterfaceName]:
+        """
+        Return which of the given interfaces exist in the 'Interfaces' table, in one query.
+
+        Args:
+            interface_names (list[InterfaceName]): The interface names to look up.
+
+        Returns:
+            list[InterfaceName]: The existing interface names, empty on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"SELECT InterfaceName FROM Interfaces WHERE InterfaceName IN ({', '.join('?' * len(interface_names))})",
+                tuple(interface_names))
+
+            return [row[0] for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting interfaces: {e}")
+            return []
+
+    def update_interfaces_shutdown(self, interface_names: list[InterfaceName], shutdown_status: bool) -> Result:
+        """
+        Update the shutdown status of several interfaces in the 'Interfaces' table in one transaction.
+
+        Args:
+            interface_names (list[InterfaceName]): The names of the interfaces to update.
+            shutdown_status (bool): True =  shutdown interface
+                                    False = no shutdown interface
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("UPDATE Interfaces SET ShutdownStatus = ? WHERE InterfaceName = ?",
+                               [(shutdown_status, interface_name) for interface_name in interface_names])
+
+            if cursor.rowcount < len(interface_names):
+                self.connection.rollback()
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Not all interfaces found: {interface_names}")
+
+            self.connection.commit()
+
+            self.log.debug(f"Shutdown status ({shutdown_status}) updated for {len(interface_names)} interface(s)")
+            return Result(status=STATUS_OK, row_id=cursor.rowcount)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error(f"Error updating shutdown status for interfaces {interface_names}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"{e}")
+
+    def update_interfaces_description(self, interface_names: list[InterfaceName], description: str) -> Result:
+        """
+        Update the description of several interfaces in the 'Interfaces' table in one transaction.
+
+        Args:
+            interface_names (list[InterfaceName]): The names of the interfaces to update.
+            description (str): The new description.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("UPDATE Interfaces SET Description = ? WHERE InterfaceName = ?",
+                               [(description, interface_name) for interface_name in interface_names])
+
+            if cursor.rowcount < len(interface_names):
+                self.connection.rollback()
+                return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND,
+                              reason=f"Not all interfaces found: {interface_names}")
+
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=cursor.rowcount)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error(f"Error updating description for interfaces {interface_names}: {e}")
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=f"{e}")
+
     def update_interface_duplex(self, interface_name: InterfaceName, duplex: str) -> Result:
         """
         Update the duplex setting of an interface in the 'InterfaceSubOptions' table.
@@ -3138,62 +4665,299 @@ class RouterShellDB(metaclass=Singleton):
                     (interface_id, mac_address)
                 )
 
-            self.connection.commit()
-            self.log.debug(
-                f"MAC address setting updated for interface: {interface_name}")
-            return Result(status=STATUS_OK, row_id=interface_id)
+            self.connection.commit()
+            self.log.debug(
+                f"MAC address setting updated for interface: {interface_name}")
+            return Result(status=STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.log.error(
+                f"Error updating MAC address setting for interface {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=interface_id, reason=str(e))
+
+    def update_interface_speed(self, interface_name: InterfaceName, speed: str) -> Result:
+        """
+        Update the speed setting of an interface in the 'InterfaceSubOptions' table.
+
+        Args:
+            interface_name (str): The name of the interface to update.
+            speed (str): Speed setting, one of ['10', '100', '1000', '10000', 'auto'].
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        existing_result = self.interface_exists(interface_name)
+
+        if not existing_result.status:
+            self.log.error(f"Interface: {interface_name} does not exists.")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+
+        try:
+            interface_id = existing_result.row_id
+
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT ID FROM InterfaceSubOptions WHERE Interfaces_FK = ?", (interface_id,))
+
+            sub_options_row = cursor.fetchone()
+
+            if sub_options_row:
+                cursor.execute(
+                    "UPDATE InterfaceSubOptions SET Speed = ? WHERE Interfaces_FK = ?",
+                    (speed, interface_id)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO InterfaceSubOptions (Interfaces_FK, Speed) VALUES (?, ?)",
+                    (interface_id, speed)
+                )
+
+            self.connection.commit()
+            self.log.debug(
+                f"Speed {speed} setting updated for interface: {interface_name}")
+            return Result(status=STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.log.error(
+                f"Error updating speed: {speed} setting for interface {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=interface_id, reason=f"{e}")
+
+    def update_interface_nic_options(self, interface_name: InterfaceName, options: dict[str, object]) -> Result:
+        """
+        Update the offload, ring size and coalescing settings of an interface in the 'InterfaceSubOptions' table.
+
+        Args:
+            interface_name (str): The name of the interface to update.
+            options (dict[str, object]): {column: value} with columns from INTERFACE_NIC_OPTION_COLUMNS,
+                None resets a setting to the driver default.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        if not set(options) <= set(self.INTERFACE_NIC_OPTION_COLUMNS):
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Invalid NIC options: {list(options)}")
+
+        existing_result = self.interface_exists(interface_name)
+
+        if not existing_result.status:
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+
+        interface_id = existing_result.row_id
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT ID FROM InterfaceSubOptions WHERE Interfaces_FK = ?", (interface_id,))
+
+            if not cursor.fetchone():
+                cursor.execute("INSERT INTO InterfaceSubOptions (Interfaces_FK) VALUES (?)", (interface_id,))
+
+            if options:
+                cursor.execute(
+                    f"UPDATE InterfaceSubOptions SET {', '.join(f'{column} = ?' for column in options)} WHERE Interfaces_FK = ?",
+                    (*options.values(), interface_id)
+                )
+
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error(f"Error updating NIC options of interface {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=interface_id, reason=f"{e}")
+
+    def select_interface_nic_options(self, interface_name: InterfaceName) -> Result:
+        """
+        Select the offload, ring size and coalescing settings of an interface.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            Result: result {column: value} for INTERFACE_NIC_OPTION_COLUMNS, None where not configured;
+                empty if the interface has no sub options.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f'''
+                SELECT {', '.join(f'InterfaceSubOptions.{column}' for column in self.INTERFACE_NIC_OPTION_COLUMNS)}
+                FROM InterfaceSubOptions
+                JOIN Interfaces ON Interfaces.ID = InterfaceSubOptions.Interfaces_FK
+                WHERE Interfaces.InterfaceName = ?
+            ''', (interface_name,))
+
+            row = cursor.fetchone()
+            return Result(status=STATUS_OK, row_id=None,
+                          result=dict(zip(self.INTERFACE_NIC_OPTION_COLUMNS, row, strict=True)) if row else {})
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting NIC options of interface {interface_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def update_interface_cpu_affinity(self, interface_name: InterfaceName, cpu_list: str, rfs_flow_entries: int | None) -> Result:
+        """
+        Insert or update the CPU affinity of an interface in the 'InterfaceCpuAffinity' table.
+
+        Args:
+            interface_name (str): The name of the interface to update.
+            cpu_list (str): 'auto' or the CPUs the queues are spread over, e.g. '0-3,8'.
+            rfs_flow_entries (int | None): The RFS flow table size, None for the default.
+
+        Returns:
+            Result: A Result object with the status of the update.
+        """
+        existing_result = self.interface_exists(interface_name)
+
+        if not existing_result.status:
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+
+        interface_id = existing_result.row_id
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT ID FROM InterfaceCpuAffinity WHERE Interfaces_FK = ?", (interface_id,))
+
+            if cursor.fetchone():
+                cursor.execute(
+                    "UPDATE InterfaceCpuAffinity SET CpuList = ?, RfsFlowEntries = ? WHERE Interfaces_FK = ?",
+                    (cpu_list, rfs_flow_entries, interface_id)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO InterfaceCpuAffinity (Interfaces_FK, CpuList, RfsFlowEntries) VALUES (?, ?, ?)",
+                    (interface_id, cpu_list, rfs_flow_entries)
+                )
+
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error updating cpu affinity of interface {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=interface_id, reason=f"{e}")
+
+    def delete_interface_cpu_affinity(self, interface_name: InterfaceName) -> Result:
+        """
+        Delete the CPU affinity of an interface from the 'InterfaceCpuAffinity' table.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            Result: A Result object with the status of the deletion, STATUS_OK if nothing was configured.
+        """
+        existing_result = self.interface_exists(interface_name)
+
+        if not existing_result.status:
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM InterfaceCpuAffinity WHERE Interfaces_FK = ?", (existing_result.row_id,))
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=existing_result.row_id)
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error deleting cpu affinity of interface {interface_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"{e}")
+
+    def select_interface_cpu_affinity(self, interface_name: InterfaceName) -> Result:
+        """
+        Select the CPU affinity of an interface as its configuration line.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            Result: result {'CpuAffinity': 'cpu affinity auto | cpus <cpu-list> [rfs-flow-entries <n>]'},
+                empty if the interface has no CPU affinity.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('''
+                SELECT 'cpu affinity '
+                    || CASE WHEN a.CpuList = 'auto' THEN 'auto' ELSE 'cpus ' || a.CpuList END
+                    || CASE WHEN a.RfsFlowEntries IS NULL THEN '' ELSE ' rfs-flow-entries ' || a.RfsFlowEntries END
+                FROM InterfaceCpuAffinity a
+                JOIN Interfaces ON Interfaces.ID = a.Interfaces_FK
+                WHERE Interfaces.InterfaceName = ?
+            ''', (interface_name,))
+
+            row = cursor.fetchone()
+            return Result(status=STATUS_OK, row_id=None, result={'CpuAffinity': row[0]} if row else {})
 
         except sqlite3.Error as e:
-            self.log.error(
-                f"Error updating MAC address setting for interface {interface_name}: {e}")
-            return Result(status=STATUS_NOK, row_id=interface_id, reason=str(e))
+            error_message = f"Error selecting cpu affinity of interface {interface_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
 
-    def update_interface_speed(self, interface_name: InterfaceName, speed: str) -> Result:
+    def update_saved_rps_sock_flow_entries(self, entries: int | None) -> Result:
         """
-        Update the speed setting of an interface in the 'InterfaceSubOptions' table.
+        Save net.core.rps_sock_flow_entries from before RFS was enabled in the 'CpuAffinitySettings' table.
 
         Args:
-            interface_name (str): The name of the interface to update.
-            speed (str): Speed setting, one of ['10', '100', '1000', '10000', 'auto'].
+            entries (int | None): The saved value, None once it is restored.
 
         Returns:
             Result: A Result object with the status of the update.
         """
-        existing_result = self.interface_exists(interface_name)
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("UPDATE CpuAffinitySettings SET SavedRpsSockFlowEntries = ?", (entries,))
+            self.connection.commit()
+            return Result(STATUS_OK)
 
-        if not existing_result.status:
-            self.log.error(f"Interface: {interface_name} does not exists.")
-            return Result(status=STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+        except sqlite3.Error as e:
+            error_message = f"Error updating saved rps_sock_flow_entries: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
 
-        try:
-            interface_id = existing_result.row_id
+    def select_saved_rps_sock_flow_entries(self) -> Result:
+        """
+        Select the saved net.core.rps_sock_flow_entries from the 'CpuAffinitySettings' table.
 
+        Returns:
+            Result: A Result object, `result` contains the key `SavedRpsSockFlowEntries`, None when not saved.
+                    Result.status = STATUS_OK if successful, STATUS_NOK otherwise
+        """
+        try:
             cursor = self.connection.cursor()
-            cursor.execute(
-                "SELECT ID FROM InterfaceSubOptions WHERE Interfaces_FK = ?", (interface_id,))
+            cursor.execute("SELECT SavedRpsSockFlowEntries FROM CpuAffinitySettings LIMIT 1")
+            row = cursor.fetchone()
 
-            sub_options_row = cursor.fetchone()
+            return Result(STATUS_OK, result={'SavedRpsSockFlowEntries': row[0] if row else None})
 
-            if sub_options_row:
-                cursor.execute(
-                    "UPDATE InterfaceSubOptions SET Speed = ? WHERE Interfaces_FK = ?",
-                    (speed, interface_id)
-                )
-            else:
-                cursor.execute(
-                    "INSERT INTO InterfaceSubOptions (Interfaces_FK, Speed) VALUES (?, ?)",
-                    (interface_id, speed)
-                )
+        except sqlite3.Error as e:
+            error_message = f"Error selecting saved rps_sock_flow_entries: {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message, result={'SavedRpsSockFlowEntries': None})
 
-            self.connection.commit()
-            self.log.debug(
-                f"Speed {speed} setting updated for interface: {interface_name}")
-            return Result(status=STATUS_OK, row_id=interface_id)
+    def select_interface_cpu_affinities(self) -> list[Result]:
+        """
+        Select the CPU affinity of every interface that has one.
+
+        Returns:
+            list[Result]: One result {'InterfaceName', 'CpuList', 'RfsFlowEntries'} per interface,
+                a single STATUS_NOK result on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('''
+                SELECT Interfaces.InterfaceName, a.CpuList, a.RfsFlowEntries
+                FROM InterfaceCpuAffinity a
+                JOIN Interfaces ON Interfaces.ID = a.Interfaces_FK
+                ORDER BY Interfaces.InterfaceName
+            ''')
+
+            return [Result(status=STATUS_OK, row_id=None,
+                           result={'InterfaceName': row[0], 'CpuList': row[1], 'RfsFlowEntries': row[2]})
+                    for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
-            self.log.error(
-                f"Error updating speed: {speed} setting for interface {interface_name}: {e}")
-            return Result(status=STATUS_NOK, row_id=interface_id, reason=f"{e}")
+            error_message = f"Error selecting interface cpu affinities: {e}"
+            self.log.error(error_message)
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
 
     def update_interface_description(self, interface_name: InterfaceName, description: str) -> Result:
         """
@@ -3549,64 +5313,353 @@ class RouterShellDB(metaclass=Singleton):
                 self.log.debug(
                     f"Static ARP entry added for interface: {interface_name}")
 
-            return Result(STATUS_OK, row_id=existing_entry[0] if existing_entry else cursor.lastrowid)
+            return Result(STATUS_OK, row_id=existing_entry[0] if existing_entry else cursor.lastrowid)
+
+        except sqlite3.Error as e:
+            self.log.error(
+                f"Error creating or updating static ARP entry for interface {interface_name}: {e}")
+            return Result(STATUS_NOK, row_id=0, reason=str(e))
+
+    def delete_interface_static_arp(self, interface_name: InterfaceName, ip_address: InetAddressText) -> Result:
+        """
+        Delete a static ARP record from the 'InterfaceStaticArp' table.
+
+        Args:
+            interface_name (str): The name of the interface to associate with the static ARP record.
+            ip_address (str): The IP address to delete.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        self.log.debug(
+            f"delete_interface_static_arp() If: {interface_name} , IP: {ip_address}")
+
+        existing_result = self.interface_exists(interface_name)
+
+        if not existing_result.status:
+            return Result(STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+
+        try:
+            interface_id = existing_result.row_id
+
+            cursor = self.connection.cursor()
+
+            self.log.debug(
+                f"delete_interface_static_arp() Deleting Row -> Interface-FK: {interface_name} , IP: {ip_address}")
+
+            cursor.execute(
+                "DELETE FROM InterfaceStaticArp WHERE Interfaces_FK = ? AND IpAddress = ?",
+                (interface_id, ip_address)
+            )
+
+            self.connection.commit()
+
+            self.log.debug(
+                f"Static ARP record deleted for interface: {interface_name}")
+
+            return Result(STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.log.error(
+                f"Error deleting static ARP record for interface {interface_name}: {e}")
+            return Result(STATUS_NOK, row_id=interface_id, reason=str(e))
+
+    def insert_interface_bridge_group(self, interface_name: InterfaceName, bridge_name: BridgeName) -> Result:
+        """
+        Insert an interface into a bridge group in the 'BridgeGroups' table.
+
+        Args:
+            interface_name (str): The name of the interface.
+            bridge_name (str): The name of the bridge group.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        interface_result = self.interface_exists(interface_name)
+
+        if not interface_result.status:
+            self.log.debug(f''
+                f"insert_interface_bridge_group() -> interface: {interface_name} does not exist, Exiting")
+            return Result(STATUS_NOK, reason=f"Interface: {interface_name} does not exist")
+
+        bridge_result = self.bridge_exist_db(bridge_name)
+
+        if not bridge_result.status:
+            self.log.debug(
+                f"insert_interface_bridge_group() -> Bridge group: {bridge_name} does not exist, Exiting")
+            return Result(STATUS_NOK, reason=f"Bridge group: {bridge_name} does not exist")
+
+        interface_id = interface_result.row_id
+        bridge_id = bridge_result.row_id
+
+        self.log.debug(f'insert_interface_bridge_group() -> InterfaceRowID: {interface_id} BridgeRowID:{bridge_id}')
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "INSERT INTO BridgeGroups (Interfaces_FK, Bridges_FK) VALUES (?, ?)",
+                (interface_id, bridge_id)
+            )
+            row_id = cursor.lastrowid
+            self.connection.commit()
+            return Result(STATUS_OK, row_id=row_id, reason="Interface added to the bridge group successfully")
+
+        except sqlite3.Error as e:
+            error_message = f"Error inserting data into 'BridgeGroups': {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, self.ROW_ID_NOT_FOUND, reason=error_message)
+
+    def delete_interface_bridge_group(self, interface_name: InterfaceName, bridge_name: BridgeName) -> Result:
+        """
+        Remove an interface from a bridge group in the 'BridgeGroups' table.
+
+        Args:
+            interface_name (str): The name of the interface.
+            bridge_name (str): The name of the bridge group.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        # Look up the interface and bridge group by name
+        interface_result = self.interface_exists(interface_name)
+
+        if not interface_result.status:
+            return Result(STATUS_NOK, 
+                          reason=f"Unable to delelte Interface: {interface_name} from bridge-group {interface_name} interface does not exist")
+
+        bridge_result = self.bridge_exist_db(bridge_name)
+
+        if not bridge_result.status:
+            return Result(STATUS_NOK, 
+                          reason=f"Unable to delelte bridge-group: {bridge_name} from interface {interface_name}, bridge does not exist")
+
+        interface_id = interface_result.row_id
+        bridge_id = bridge_result.row_id
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "DELETE FROM BridgeGroups WHERE Interfaces_FK = ? AND Bridges_FK = ?",
+                (interface_id, bridge_id)
+            )
+            self.connection.commit()
+            return Result(STATUS_OK, reason="Interface removed from the bridge group successfully")
+
+        except sqlite3.Error as e:
+            error_message = f"Error deleting data from 'BridgeGroups': {e}"
+            self.log.error(error_message)
+            return Result(STATUS_NOK, reason=error_message)
+
+    def port_channel_exist_db(self, port_channel_name: InterfaceName) -> Result:
+        """
+        Check if a port-channel with the given name exists in the 'PortChannels' table.
+
+        Args:
+            port_channel_name (str): The name of the port-channel.
+
+        Returns:
+            Result: status True and the 'PortChannels' row-id if the port-channel exists, False otherwise.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT pc.ID
+                FROM PortChannels pc
+                JOIN Interfaces i ON pc.Interfaces_FK = i.ID
+                WHERE i.InterfaceName = ? AND i.InterfaceType = ?
+            """, (port_channel_name, InterfaceType.PORT_CHANNEL.value))
+
+            row = cursor.fetchone()
+
+            if row:
+                return Result(status=True, row_id=row[0])
+
+            return Result(status=False, reason=f"Port-channel '{port_channel_name}' does not exist")
+
+        except sqlite3.Error as e:
+            return Result(status=False, reason=str(e))
+
+    def insert_interface_port_channel(self, port_channel_name: InterfaceName, shutdown_status: bool = True) -> Result:
+        """
+        Insert a new port-channel interface into the 'Interfaces' and 'PortChannels' tables.
+
+        Args:
+            port_channel_name (str): The name of the port-channel interface.
+            shutdown_status (bool): True if the interface is shutdown, False otherwise.
+
+        Returns:
+            Result: A Result object with the status of the insertion.
+        """
+        if self.port_channel_exist_db(port_channel_name).status:
+            return Result(status=STATUS_NOK, reason=f"Port-channel '{port_channel_name}' already exists")
+
+        try:
+            cursor = self.connection.cursor()
+
+            cursor.execute(
+                "INSERT INTO Interfaces (InterfaceName, InterfaceType, ShutdownStatus) VALUES (?, ?, ?)",
+                (port_channel_name, InterfaceType.PORT_CHANNEL.value, shutdown_status)
+            )
+            interface_id = cursor.lastrowid
+
+            cursor.execute(
+                "INSERT INTO PortChannels (PortChannelName, Interfaces_FK) VALUES (?, ?)",
+                (port_channel_name, interface_id)
+            )
+            self.connection.commit()
+
+            self.log.debug(f"Port-channel {port_channel_name} inserted with interface ID {interface_id}")
+            return Result(status=STATUS_OK, row_id=interface_id)
+
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            self.log.error(f"Error inserting port-channel {port_channel_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"{e}")
+
+    def delete_interface_port_channel(self, port_channel_name: InterfaceName) -> Result:
+        """
+        Delete a port-channel from the 'PortChannels' and 'Interfaces' tables.
+
+        The port-channel must not have member interfaces.
+
+        Args:
+            port_channel_name (str): The name of the port-channel interface.
+
+        Returns:
+            Result: A Result object with the status of the deletion.
+        """
+        port_channel_result = self.port_channel_exist_db(port_channel_name)
+
+        if not port_channel_result.status:
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Port-channel {port_channel_name} does not exist")
+
+        if self.select_port_channel_members(port_channel_name):
+            return Result(status=STATUS_NOK, row_id=0,
+                          reason=f"Port-channel {port_channel_name} has members, need to remove them before deleting it")
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT Interfaces_FK FROM PortChannels WHERE ID = ?", (port_channel_result.row_id,))
+            interface_id = cursor.fetchone()[0]
+
+            cursor.execute("DELETE FROM BridgeGroups WHERE Interfaces_FK = ?", (interface_id,))
+            cursor.execute("DELETE FROM PortChannels WHERE ID = ?", (port_channel_result.row_id,))
+            cursor.execute("DELETE FROM Interfaces WHERE ID = ?", (interface_id,))
+            self.connection.commit()
+
+            return Result(status=STATUS_OK, row_id=interface_id)
 
         except sqlite3.Error as e:
-            self.log.error(
-                f"Error creating or updating static ARP entry for interface {interface_name}: {e}")
-            return Result(STATUS_NOK, row_id=0, reason=str(e))
+            self.connection.rollback()
+            self.log.error(f"Error deleting port-channel {port_channel_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"{e}")
 
-    def delete_interface_static_arp(self, interface_name: InterfaceName, ip_address: InetAddressText) -> Result:
+    def update_port_channel(self, port_channel_name: InterfaceName,
+                            mode: str | None = None,
+                            xmit_hash_policy: str | None = None,
+                            lacp_rate: str | None = None) -> Result:
         """
-        Delete a static ARP record from the 'InterfaceStaticArp' table.
+        Update the bonding settings of a port-channel in the 'PortChannels' table.
 
         Args:
-            interface_name (str): The name of the interface to associate with the static ARP record.
-            ip_address (str): The IP address to delete.
+            port_channel_name (str): The name of the port-channel interface.
+            mode (str | None): The bonding mode. Defaults to None (unchanged).
+            xmit_hash_policy (str | None): The transmit hash policy. Defaults to None (unchanged).
+            lacp_rate (str | None): The LACP rate. Defaults to None (unchanged).
 
         Returns:
-            Result: A Result object with the status of the deletion.
+            Result: A Result object with the status of the update.
         """
-        self.log.debug(
-            f"delete_interface_static_arp() If: {interface_name} , IP: {ip_address}")
+        port_channel_result = self.port_channel_exist_db(port_channel_name)
 
-        existing_result = self.interface_exists(interface_name)
+        if not port_channel_result.status:
+            return Result(status=STATUS_NOK, row_id=0, reason=f"Port-channel {port_channel_name} does not exist")
 
-        if not existing_result.status:
-            return Result(STATUS_NOK, row_id=0, reason=f"Interface: {interface_name} does not exist")
+        columns = {column: value for column, value in (('Mode', mode),
+                                                      ('XmitHashPolicy', xmit_hash_policy),
+                                                      ('LacpRate', lacp_rate)) if value is not None}
+
+        if not columns:
+            return Result(status=STATUS_OK, row_id=port_channel_result.row_id)
 
         try:
-            interface_id = existing_result.row_id
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"UPDATE PortChannels SET {', '.join(f'{column} = ?' for column in columns)} WHERE ID = ?",
+                (*columns.values(), port_channel_result.row_id)
+            )
+            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=port_channel_result.row_id)
+
+        except sqlite3.Error as e:
+            self.log.error(f"Error updating port-channel {port_channel_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"{e}")
+
+    def select_port_channel(self, port_channel_name: InterfaceName) -> Result:
+        """
+        Select the bonding settings of a port-channel.
 
+        Args:
+            port_channel_name (str): The name of the port-channel interface.
+
+        Returns:
+            Result: result {'Mode', 'XmitHashPolicy', 'LacpRate', 'ShutdownStatus'} if the port-channel exists.
+        """
+        try:
             cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT pc.Mode, pc.XmitHashPolicy, pc.LacpRate, i.ShutdownStatus
+                FROM PortChannels pc
+                JOIN Interfaces i ON pc.Interfaces_FK = i.ID
+                WHERE pc.PortChannelName = ?
+            """, (port_channel_name,))
 
-            self.log.debug(
-                f"delete_interface_static_arp() Deleting Row -> Interface-FK: {interface_name} , IP: {ip_address}")
+            row = cursor.fetchone()
 
-            cursor.execute(
-                "DELETE FROM InterfaceStaticArp WHERE Interfaces_FK = ? AND IpAddress = ?",
-                (interface_id, ip_address)
-            )
+            if not row:
+                return Result(status=STATUS_NOK, row_id=0, reason=f"Port-channel {port_channel_name} does not exist")
 
-            self.connection.commit()
+            return Result(status=STATUS_OK, row_id=0, result={'Mode': row[0], 'XmitHashPolicy': row[1],
+                                                              'LacpRate': row[2], 'ShutdownStatus': bool(row[3])})
 
-            self.log.debug(
-                f"Static ARP record deleted for interface: {interface_name}")
+        except sqlite3.Error as e:
+            self.log.error(f"Error selecting port-channel {port_channel_name}: {e}")
+            return Result(status=STATUS_NOK, row_id=0, reason=f"{e}")
 
-            return Result(STATUS_OK, row_id=interface_id)
+    def select_port_channel_members(self, port_channel_name: InterfaceName) -> list[InterfaceName]:
+        """
+        Select the member interfaces of a port-channel.
+
+        Args:
+            port_channel_name (str): The name of the port-channel interface.
+
+        Returns:
+            list[InterfaceName]: The member interface names, empty on error.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT i.InterfaceName
+                FROM PortChannelGroups pcg
+                JOIN PortChannels pc ON pcg.PortChannels_FK = pc.ID
+                JOIN Interfaces i ON pcg.Interfaces_FK = i.ID
+                WHERE pc.PortChannelName = ?
+                ORDER BY pcg.ID
+            """, (port_channel_name,))
+
+            return [row[0] for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
-            self.log.error(
-                f"Error deleting static ARP record for interface {interface_name}: {e}")
-            return Result(STATUS_NOK, row_id=interface_id, reason=str(e))
+            self.log.error(f"Error selecting members of port-channel {port_channel_name}: {e}")
+            return []
 
-    def insert_interface_bridge_group(self, interface_name: InterfaceName, bridge_name: BridgeName) -> Result:
+    def insert_interface_port_channel_group(self, interface_name: InterfaceName, port_channel_name: InterfaceName) -> Result:
         """
-        Insert an interface into a bridge group in the 'BridgeGroups' table.
+        Insert an interface into a port-channel in the 'PortChannelGroups' table.
 
         Args:
-            interface_name (str): The name of the interface.
-            bridge_name (str): The name of the bridge group.
+            interface_name (str): The name of the member interface.
+            port_channel_name (str): The name of the port-channel.
 
         Returns:
             Result: A Result object with the status of the insertion.
@@ -3614,75 +5667,57 @@ class RouterShellDB(metaclass=Singleton):
         interface_result = self.interface_exists(interface_name)
 
         if not interface_result.status:
-            self.log.debug(f''
-                f"insert_interface_bridge_group() -> interface: {interface_name} does not exist, Exiting")
             return Result(STATUS_NOK, reason=f"Interface: {interface_name} does not exist")
 
-        bridge_result = self.bridge_exist_db(bridge_name)
-
-        if not bridge_result.status:
-            self.log.debug(
-                f"insert_interface_bridge_group() -> Bridge group: {bridge_name} does not exist, Exiting")
-            return Result(STATUS_NOK, reason=f"Bridge group: {bridge_name} does not exist")
-
-        interface_id = interface_result.row_id
-        bridge_id = bridge_result.row_id
+        port_channel_result = self.port_channel_exist_db(port_channel_name)
 
-        self.log.debug(f'insert_interface_bridge_group() -> InterfaceRowID: {interface_id} BridgeRowID:{bridge_id}')
+        if not port_channel_result.status:
+            return Result(STATUS_NOK, reason=f"Port-channel: {port_channel_name} does not exist")
 
         try:
             cursor = self.connection.cursor()
             cursor.execute(
-                "INSERT INTO BridgeGroups (Interfaces_FK, Bridges_FK) VALUES (?, ?)",
-                (interface_id, bridge_id)
+                "INSERT INTO PortChannelGroups (Interfaces_FK, PortChannels_FK) VALUES (?, ?)",
+                (interface_result.row_id, port_channel_result.row_id)
             )
             row_id = cursor.lastrowid
             self.connection.commit()
-            return Result(STATUS_OK, row_id=row_id, reason="Interface added to the bridge group successfully")
+            return Result(STATUS_OK, row_id=row_id, reason="Interface added to the port-channel successfully")
 
         except sqlite3.Error as e:
-            error_message = f"Error inserting data into 'BridgeGroups': {e}"
+            error_message = f"Error inserting data into 'PortChannelGroups': {e}"
             self.log.error(error_message)
             return Result(STATUS_NOK, self.ROW_ID_NOT_FOUND, reason=error_message)
 
-    def delete_interface_bridge_group(self, interface_name: InterfaceName, bridge_name: BridgeName) -> Result:
+    def delete_interface_port_channel_group(self, interface_name: InterfaceName, port_channel_name: InterfaceName) -> Result:
         """
-        Remove an interface from a bridge group in the 'BridgeGroups' table.
+        Remove an interface from a port-channel in the 'PortChannelGroups' table.
 
         Args:
-            interface_name (str): The name of the interface.
-            bridge_name (str): The name of the bridge group.
+            interface_name (str): The name of the member interface.
+            port_channel_name (str): The name of the port-channel.
 
         Returns:
             Result: A Result object with the status of the deletion.
         """
-        # Look up the interface and bridge group by name
         interface_result = self.interface_exists(interface_name)
+        port_channel_result = self.port_channel_exist_db(port_channel_name)
 
-        if not interface_result.status:
-            return Result(STATUS_NOK, 
-                          reason=f"Unable to delelte Interface: {interface_name} from bridge-group {interface_name} interface does not exist")
-
-        bridge_result = self.bridge_exist_db(bridge_name)
-
-        if not bridge_result.status:
-            return Result(STATUS_NOK, 
-                          reason=f"Unable to delelte bridge-group: {bridge_name} from interface {interface_name}, bridge does not exist")
-
-        interface_id = interface_result.row_id
-        bridge_id = bridge_result.row_id
+        if not interface_result.status or not port_channel_result.status:
+            return Result(STATUS_NOK,
+                          reason=f"Unable to delete interface {interface_name} from port-channel {port_channel_name}")
 
         try:
             cursor = self.connection.cursor()
             cursor.execute(
-                "DELETE FROM BridgeGroups WHERE Interfaces_FK = ? AND Bridges_FK = ?",
-                (interface_id, bridge_id)
+                "DELETE FROM PortChannelGroups WHERE Interfaces_FK = ? AND PortChannels_FK = ?",
+                (interface_result.row_id, port_channel_result.row_id)
             )
             self.connection.commit()
-            return Result(STATUS_OK, reason="Interface removed from the bridge group successfully")
+            return Result(STATUS_OK, reason="Interface removed from the port-channel successfully")
 
         except sqlite3.Error as e:
-            error_message = f"Error deleting data from 'BridgeGroups': {e}"
+            error_message = f"Error deleting data from 'PortChannelGroups': {e}"
             self.log.error(error_message)
             return Result(STATUS_NOK, reason=error_message)
 
@@ -4958,7 +6993,7 @@ class RouterShellDB(metaclass=Singleton):
                 WHERE
                     Interfaces.InterfaceName = ?
                     
-                AND Interfaces.InterfaceType != '{InterfaceType.BRIDGE.value}';
+                AND Interfaces.InterfaceType NOT IN ('{InterfaceType.BRIDGE.value}', '{InterfaceType.PORT_CHANNEL.value}');
 
                 ''', (interface_name,))
 
@@ -5066,6 +7101,40 @@ class RouterShellDB(metaclass=Singleton):
             self.log.error(error_message)
             return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
 
+    def select_interface_access_group_configuration(self, interface_name: InterfaceName) -> list[Result]:
+        """
+        Retrieve the access-groups bound to a specific interface.
+
+        Parameters:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            list[Result]: A list of Result objects, each containing the `IpAccessGroup` command.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('''
+                SELECT
+                    'ip access-group ' || FireWallPolicies.PolicyName || ' ' || FWDirectionInterfaces.Direction AS IpAccessGroup
+
+                FROM Interfaces
+
+                JOIN FWDirectionInterfaces ON Interfaces.ID = FWDirectionInterfaces.Interfaces_FK
+                JOIN FireWallPolicies ON FireWallPolicies.ID = FWDirectionInterfaces.FirewallPolicy_FK
+
+                WHERE Interfaces.InterfaceName = ?
+
+                ORDER BY FWDirectionInterfaces.Direction;
+                ''', (interface_name,))
+
+            return [Result(status=STATUS_OK, row_id=self.ROW_ID_NOT_FOUND, result={'IpAccessGroup': row[0]})
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting interface access-group: {e}"
+            self.log.error(error_message)
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+
     def select_interface_dhcp_client_configuration(self, interface_name: InterfaceName) -> list[Result]:
         """
         Retrieve DHCP client configuration information associated with a specific interface.
@@ -5261,6 +7330,37 @@ class RouterShellDB(metaclass=Singleton):
 
             return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
 
+    def select_interface_switchport_trunk(self, interface_name: InterfaceName) -> Result:
+        """
+        Retrieve the switchport mode and allowed trunk VLANs of an interface.
+
+        Args:
+            interface_name (InterfaceName): The name of the interface.
+
+        Returns:
+            Result: STATUS_OK with result {'Mode': str | None, 'VlanIDs': list[int]}.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT S.Mode, TV.VlanID
+                FROM Interfaces I
+                LEFT JOIN Switchports S ON S.Interfaces_FK = I.ID
+                LEFT JOIN SwitchportTrunkVlans TV ON TV.Interfaces_FK = I.ID
+                WHERE I.InterfaceName = ?
+                ORDER BY TV.VlanID
+                """, (interface_name,))
+            rows = cursor.fetchall()
+
+            return Result(status=STATUS_OK, row_id=None,
+                          result={'Mode': rows[0][0] if rows else None,
+                                  'VlanIDs': [row[1] for row in rows if row[1] is not None]})
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving switchport trunk of {interface_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
     def select_global_bridge_configuration(self) -> list[Result]:
         """
         Retrieve bridge configuration data from the 'Bridges' table.
@@ -5275,7 +7375,14 @@ class RouterShellDB(metaclass=Singleton):
                 'inet management '  || InterfaceIpAddress.IpAddress AS InetMgt,
                 'protocol '         || Bridges.Protocol AS Protocol,    
                 CASE WHEN Bridges.StpStatus = 1 THEN 'stp enable' ELSE 'stp disable' END AS StpStatus,
-                CASE WHEN Interfaces.ShutdownStatus THEN 'shutdown' ELSE 'no shutdown' END AS Shutdown
+                CASE WHEN Bridges.VlanFiltering THEN 'vlan filtering' END AS VlanFiltering,
+                CASE WHEN Bridges.AgingTime != 300 THEN 'mac address-table aging-time ' || Bridges.AgingTime END AS AgingTime,
+                CASE WHEN NOT Bridges.MacLearning THEN 'no mac address-table learning' END AS MacLearning,
+                CASE WHEN NOT Bridges.McastSnooping THEN 'no multicast snooping' END AS McastSnooping,
+                CASE WHEN Bridges.McastQuerier THEN 'multicast querier' END AS McastQuerier,
+                CASE WHEN Bridges.NetfilterBypass THEN 'netfilter bypass' END AS NetfilterBypass,
+                CASE WHEN Interfaces.ShutdownStatus THEN 'shutdown' ELSE 'no shutdown' END AS Shutdown,
+                Bridges.ID
             FROM
                 Bridges
             LEFT JOIN
@@ -5291,27 +7398,141 @@ class RouterShellDB(metaclass=Singleton):
             # Fetch all rows from the result set
             rows = cursor.fetchall()
 
-            result_list = [
+            result_list = []
+
+            for row in rows:
+                cursor.execute(
+                    "SELECT MacAddress, InterfaceName, VlanID FROM BridgeStaticMacAddresses WHERE Bridges_FK = ? "
+                    "ORDER BY VlanID, MacAddress", (row[12],))
+
+                static_mac_addresses = {
+                    f'StaticMac:{mac_address}:{vlan_id}':
+                        f"mac address-table static {mac_address} interface {interface_name}"
+                        f"{'' if vlan_id is None else f' vlan {vlan_id}'}"
+                    for mac_address, interface_name, vlan_id in cursor.fetchall()
+                }
+
+                cursor.execute(
+                    "SELECT InterfaceName FROM BridgeMulticastRouterPorts WHERE Bridges_FK = ? ORDER BY InterfaceName",
+                    (row[12],))
+
+                router_ports = {
+                    f'McastRouterPort:{interface_name}': f"multicast router-port {interface_name}"
+                    for (interface_name,) in cursor.fetchall()
+                }
+
+                result_list.append(
+                    Result(status=STATUS_OK, row_id=None,
+                           result={
+                               'BridgeName': row[0],
+                               'Description': row[1],
+                               'InetMgt': row[2],
+                               'Protocol': row[3],
+                               'StpStatus': row[4],
+                               'VlanFiltering': row[5],
+                               'AgingTime': row[6],
+                               'MacLearning': row[7],
+                               **static_mac_addresses,
+                               'McastSnooping': row[8],
+                               'McastQuerier': row[9],
+                               **router_ports,
+                               'NetfilterBypass': row[10],
+                               'Shutdown': row[11]
+                           }
+                           ))
+
+            return result_list
+
+        except sqlite3.Error as e:
+            error_message = f"Error retrieving data from 'Bridges': {e}"
+            self.log.error(error_message)
+
+            return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
+
+    def select_global_port_channel_configuration(self) -> list[Result]:
+        """
+        Retrieve port-channel configuration data from the 'PortChannels' table.
+
+        `xmit hash-policy` is only emitted for modes that hash (802.3ad, balance-xor)
+        and `lacp rate` only for 802.3ad.
+
+        Returns:
+            list[Result]: A list of Result objects containing port-channel configuration data.
+        """
+        query = '''
+            SELECT
+                'interface '        || PortChannels.PortChannelName AS PortChannelName,
+                'description '      || Interfaces.Description AS Description,
+                'mode '             || PortChannels.Mode AS Mode,
+                CASE WHEN PortChannels.Mode IN ('802.3ad', 'balance-xor')
+                     THEN 'xmit hash-policy ' || PortChannels.XmitHashPolicy END AS XmitHashPolicy,
+                CASE WHEN PortChannels.Mode = '802.3ad' THEN 'lacp rate ' || PortChannels.LacpRate END AS LacpRate,
+                'bridge group '     || Bridges.BridgeName AS BridgeGroup,
+                CASE WHEN Interfaces.ShutdownStatus THEN 'shutdown' ELSE 'no shutdown' END AS Shutdown
+            FROM
+                PortChannels
+            JOIN
+                Interfaces ON PortChannels.Interfaces_FK = Interfaces.ID
+            LEFT JOIN
+                BridgeGroups ON Interfaces.ID = BridgeGroups.Interfaces_FK
+            LEFT JOIN
+                Bridges ON Bridges.ID = BridgeGroups.Bridges_FK
+            ORDER BY
+                PortChannels.ID;
+        '''
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query)
+
+            return [
                 Result(status=STATUS_OK, row_id=None,
                        result={
-                           'BridgeName': row[0],
+                           'PortChannelName': row[0],
                            'Description': row[1],
-                           'InetMgt': row[2],
-                           'Protocol': row[3],
-                           'StpStatus': row[4],
-                           'Shutdown': row[5]
+                           'Mode': row[2],
+                           'XmitHashPolicy': row[3],
+                           'LacpRate': row[4],
+                           'BridgeGroup': row[5],
+                           'Shutdown': row[6]
                        }
-                       ) for row in rows
+                       ) for row in cursor.fetchall()
             ]
 
-            return result_list
-
         except sqlite3.Error as e:
-            error_message = f"Error retrieving data from 'Bridges': {e}"
+            error_message = f"Error retrieving data from 'PortChannels': {e}"
             self.log.error(error_message)
 
             return [Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)]
 
+    def select_interface_channel_group(self, interface_name: InterfaceName) -> Result:
+        """
+        Select the port-channel an interface is a member of.
+
+        Args:
+            interface_name (str): The name of the interface.
+
+        Returns:
+            Result: result {'ChannelGroup': 'channel group <port-channel>'}, empty if the interface is not a member.
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute('''
+                SELECT 'channel group ' || PortChannels.PortChannelName
+                FROM PortChannelGroups
+                JOIN PortChannels ON PortChannels.ID = PortChannelGroups.PortChannels_FK
+                JOIN Interfaces ON Interfaces.ID = PortChannelGroups.Interfaces_FK
+                WHERE Interfaces.InterfaceName = ?
+            ''', (interface_name,))
+
+            row = cursor.fetchone()
+            return Result(status=STATUS_OK, row_id=None, result={'ChannelGroup': row[0]} if row else {})
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting channel group of interface {interface_name}: {e}"
+            self.log.error(error_message)
+            return Result(status=STATUS_NOK, row_id=self.ROW_ID_NOT_FOUND, reason=error_message)
+
     def select_global_vlan_configuration(self) -> list[Result]:
         """
         Retrieve VLAN configuration data from the 'Vlans' table.
@@ -5354,18 +7575,34 @@ class RouterShellDB(metaclass=Singleton):
 
     def select_global_nat_configuration(self) -> list[Result]:
         """
-        Select distinct NAT pool names from the 'Nats' table.
+        Select distinct NAT pool names from the 'Nats' table, the static NAT mappings
+        from the 'NatStaticMappings' table and the flow offload setting from the
+        'NatSettings' table as configuration commands.
 
         Returns:
-        list[Result]: A list of Result objects with the selected NAT pool names.
+        list[Result]: A list of Result objects with the selected NAT pool names and static NAT mappings.
         """
         self.log.debug("select_global_nat_configuration()")
 
         try:
             cursor = self.connection.cursor()
 
-            cursor.execute(
-                "SELECT DISTINCT 'ip nat ' || NatPoolName AS IpNatPoolName FROM Nats")
+            cursor.execute("""
+                SELECT DISTINCT 'ip nat ' || NatPoolName AS IpNatPoolName FROM Nats
+
+                UNION ALL
+
+                SELECT 'ip nat inside source static ' ||
+                    CASE WHEN Protocol = 'ip'
+                        THEN InsideAddress || ' ' || OutsideAddress
+                        ELSE Protocol || ' ' || InsideAddress || ' ' || InsidePort || ' ' || OutsideAddress || ' ' || OutsidePort
+                    END AS IpNatPoolName
+                FROM NatStaticMappings
+
+                UNION ALL
+
+                SELECT 'ip flow-offload' AS IpNatPoolName FROM NatSettings WHERE FlowOffload
+                """)
 
             rows = cursor.fetchall()
 
@@ -5382,6 +7619,105 @@ class RouterShellDB(metaclass=Singleton):
             self.log.error(error_message)
             return [Result(STATUS_NOK, reason=error_message)]
 
+    def select_global_dns_configuration(self) -> list[Result]:
+        """
+        Select the DNS settings from the 'DnsSettings' table as configuration commands,
+        default values omitted.
+
+        Returns:
+        list[Result]: A list of Result objects, `result` contains the key `DnsCommand`.
+        """
+        self.log.debug("select_global_dns_configuration()")
+
+        try:
+            cursor = self.connection.cursor()
+
+            cursor.execute("""
+                SELECT 'ip dns cache size ' || CacheSize AS DnsCommand FROM DnsSettings WHERE CacheSize IS NOT NULL
+
+                UNION ALL
+
+                SELECT 'no ip dns cache negative' AS DnsCommand FROM DnsSettings WHERE NOT NegativeCache
+
+                UNION ALL
+
+                SELECT 'ip dns cache ttl ' || MinCacheTtl AS DnsCommand FROM DnsSettings WHERE MinCacheTtl IS NOT NULL
+
+                UNION ALL
+
+                SELECT 'ip dns cache forward-max ' || ForwardMax AS DnsCommand FROM DnsSettings WHERE ForwardMax IS NOT NULL
+                """)
+
+            return [Result(STATUS_OK, row_id=None, result={'DnsCommand': row[0]}) for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting global DNS configuration: {e}"
+            self.log.error(error_message)
+            return [Result(STATUS_NOK, reason=error_message)]
+
+    def select_global_route_configuration(self) -> list[Result]:
+        """
+        Select the tracks from the 'Tracks' table, the policy routing rules from the 'PolicyRoutes'
+        table and the static routes from the 'StaticRoutes' table as configuration commands,
+        default values omitted.
+
+        Returns:
+        list[Result]: A list of Result objects, `result` contains the key `RouteCommand`.
+        """
+        self.log.debug("select_global_route_configuration()")
+
+        try:
+            cursor = self.connection.cursor()
+
+            cursor.execute("""
+                SELECT RouteCommand FROM (
+                    SELECT 0 AS Section, TrackID AS Position,
+                        'track ' || TrackID || ' ' || Type ||
+                        CASE Type
+                            WHEN 'interface' THEN ' ' || InterfaceName
+                            WHEN 'icmp' THEN ' ' || Target || IFNULL(' source ' || InterfaceName, '')
+                            ELSE ' ' || Target || ' interface ' || InterfaceName
+                        END ||
+                        CASE WHEN Type != 'interface' AND Interval != 1000 THEN ' interval ' || Interval ELSE '' END ||
+                        CASE WHEN Type != 'interface' AND Threshold != 3 THEN ' threshold ' || Threshold ELSE '' END
+                        AS RouteCommand
+                    FROM Tracks
+
+                    UNION ALL
+
+                    SELECT 1 AS Section, Priority AS Position,
+                        'ip policy ' || Priority ||
+                        IFNULL(' from ' || Source, '') ||
+                        CASE WHEN FwMark IS NOT NULL THEN ' fwmark ' || printf('0x%x', FwMark) ELSE '' END ||
+                        CASE WHEN FwMask IS NOT NULL THEN printf('/0x%x', FwMask) ELSE '' END ||
+                        IFNULL(' iif ' || InputInterface, '') ||
+                        ' table ' || RouteTable
+                        AS RouteCommand
+                    FROM PolicyRoutes
+
+                    UNION ALL
+
+                    SELECT 2 AS Section, ID AS Position,
+                        'ip route ' ||
+                        CASE WHEN RouteTable != 254 THEN 'table ' || RouteTable || ' ' ELSE '' END ||
+                        Destination || ' ' || NextHop ||
+                        IFNULL(' weight ' || Weight, '') ||
+                        CASE WHEN Metric THEN ' metric ' || Metric ELSE '' END ||
+                        IFNULL(' track ' || TrackID, '')
+                        AS RouteCommand
+                    FROM StaticRoutes
+                )
+                ORDER BY Section, Position
+                """)
+
+            return [Result(status=STATUS_OK, row_id=None, result={'RouteCommand': row[0]})
+                    for row in cursor.fetchall()]
+
+        except sqlite3.Error as e:
+            error_message = f"Error selecting global route configurations: {e}"
+            self.log.error(error_message)
+            return [Result(STATUS_NOK, reason=error_message)]
+
     def select_global_dhcp_server_configuration(self) -> list[Result]:
         """
         Retrieve a list of global DHCP server configurations.
@@ -5397,7 +7733,8 @@ class RouterShellDB(metaclass=Singleton):
             query = """
                 SELECT DISTINCT
                     'dhcp pool-name '   || DHCPServer.DhcpPoolname AS DhcpServerPollName,
-                    'subnet '           || DHCPSubnet.InetSubnet AS DHCPSubnetSubnet
+                    'subnet '           || DHCPSubnet.InetSubnet AS DHCPSubnetSubnet,
+                    'utilization alert ' || DHCPServer.UtilizationAlert AS DhcpServerUtilizationAlert
                 FROM DHCPServer
                 LEFT JOIN DHCPSubnet ON DHCPServer.ID = DHCPSubnet.DHCPServer_FK;
             """
@@ -5414,6 +7751,7 @@ class RouterShellDB(metaclass=Singleton):
                     result={
                         "DhcpServerPoolName": row[0],
                         "DHCPSubnetSubnet": row[1],
+                        "DhcpServerUtilizationAlert": row[2],
                     },
                 )
                 for row in rows
@@ -1,5 +1,6 @@
 import logging
 
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChangeTopic
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK, Status
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import HostnameText, StatusResult
@@ -96,7 +97,8 @@ class SystemDatabase:
 
     def set_telnet_server_status(cls, telnet_server_status: bool, port: int) -> StatusResult:
         """
-        Sets the status of the Telnet server and updates the port configuration.
+        Sets the status of the Telnet server and updates the port configuration, the change
+        is published for the telnet service to apply.
 
         Parameters:
         telnet_server_status (bool): The desired status of the Telnet server (True to enable, False to disable).
@@ -106,6 +108,10 @@ class SystemDatabase:
         StatusResult: The status indicating whether the update was successful.
         """
         result = cls.rsdb.update_global_telnet_server(telnet_server_status, port)
+
+        if result.status == STATUS_OK:
+            ConfigChangeBus().publish(ConfigChangeTopic.TELNET_SERVER)
+
         return result.status
 
     def get_ssh_server_status(cls) -> tuple[bool, dict]:
@@ -182,4 +182,84 @@ class VlanDatabase:
         """
         Retrieves a list of interfaces associated with a given VLAN ID.
         """
-        return []
\ No newline at end of file
+        return []
+
+    def add_vlan_ids(self, vlan_ids: list[int]) -> StatusResult:
+        """
+        Add VLAN IDs, named Vlan<vlan-id> unless they already exist, in one transaction.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.rsdb.insert_vlan_ids(vlan_ids).status
+
+    def update_vlans_description(self, vlan_ids: list[int], vlan_description: str) -> StatusResult:
+        """
+        Update the description of several VLANs in one transaction.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.rsdb.update_vlan_descriptions(vlan_ids, vlan_description).status
+
+    def add_interfaces_to_vlan(self, vlan_id: int, interface_names: list[InterfaceName]) -> StatusResult:
+        """
+        Set the access VLAN of one or more interfaces in one transaction.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.rsdb.update_vlan_interfaces(vlan_id, interface_names).status
+
+    def update_switchport_mode(self, interface_names: list[InterfaceName], mode: str) -> StatusResult:
+        """
+        Set the switchport mode (access | trunk) of one or more interfaces.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.rsdb.update_switchport_mode(interface_names, mode).status
+
+    def update_trunk_allowed_vlans(self, interface_names: list[InterfaceName], vlan_ids: list[int],
+                                   add: bool = False, remove: bool = False) -> StatusResult:
+        """
+        Set, extend or reduce the VLANs allowed on one or more trunk ports.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.rsdb.update_switchport_trunk_vlans(interface_names, vlan_ids, add, remove).status
+
+    def get_vlan_filtering_bridges(self) -> list[str]:
+        """
+        Retrieve the names of the bridges with VLAN filtering enabled.
+
+        Returns:
+            list[str]: The bridge names.
+        """
+        return [result.result['BridgeName'] for result in self.rsdb.select_vlan_filtering_bridges()
+                if result.status == STATUS_OK]
+
+    def get_bridge_port_vlans(self, bridge_name: str) -> list[dict]:
+        """
+        Retrieve the switchport mode and VLAN membership of the ports of a bridge.
+
+        Returns:
+            list[dict]: One {'InterfaceName', 'Mode', 'VlanID'} row per port VLAN.
+        """
+        return [result.result for result in self.rsdb.select_bridge_port_vlans(bridge_name)
+                if result.status == STATUS_OK]
+
+    def get_bridge_vlan_filtering(self, interface_name: InterfaceName) -> tuple[str, bool] | None:
+        """
+        Retrieve the bridge of a bridge port and whether it filters VLANs.
+
+        Returns:
+            tuple[str, bool] | None: (bridge name, VLAN filtering), None if the interface is not bridged.
+        """
+        result = self.rsdb.select_bridge_vlan_filtering(interface_name)
+
+        if result.status:
+            return None
+
+        return result.result['BridgeName'], result.result['VlanFiltering']
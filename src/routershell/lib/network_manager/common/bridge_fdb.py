@@ -0,0 +1,268 @@
+import itertools
+import logging
+import os
+import socket
+import struct
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import BridgeName, InterfaceName, MacAddressText
+from routershell.lib.network_manager.common.netlink import Netlink
+
+
+class BridgeFdbError(Exception):
+    """Raised when the kernel rejects a bridge forwarding database netlink request."""
+    def __init__(self, message: str, error_code: int = 0):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'BridgeFdbError: {self.message}'
+
+
+class FdbEntry(NamedTuple):
+    """
+    A bridge forwarding database (MAC address table) entry.
+
+    Attributes:
+        mac_address (MacAddressText): The MAC address, `xx:xx:xx:xx:xx:xx`.
+        vlan_id (int | None): The VLAN of the entry, None on a bridge without VLAN filtering.
+        interface_name (InterfaceName): The bridge port, or the bridge itself for its own addresses.
+        bridge_name (BridgeName): The bridge owning the entry.
+        entry_type (str): `dynamic` (learned), `static` or `self` (address of the bridge or a port).
+        age (int): Seconds since the address was last seen, 0 for static and self entries.
+    """
+    mac_address: MacAddressText
+    vlan_id: int | None
+    interface_name: InterfaceName
+    bridge_name: BridgeName
+    entry_type: str
+    age: int = 0
+
+
+class FdbFilter(NamedTuple):
+    """
+    Select MAC address table entries while they are streamed. Unset fields match everything.
+
+    The bridge and the port are also filtered by the kernel, see `BridgeFdb.dump()`.
+
+    Attributes:
+        bridge_name (BridgeName | None): The bridge.
+        interface_name (InterfaceName | None): The bridge port.
+        vlan_id (int | None): The VLAN.
+        mac_address (MacAddressText | None): The MAC address, `xx:xx:xx:xx:xx:xx`.
+        entry_type (str | None): `dynamic`, `static` or `self`.
+    """
+    bridge_name: BridgeName | None = None
+    interface_name: InterfaceName | None = None
+    vlan_id: int | None = None
+    mac_address: MacAddressText | None = None
+    entry_type: str | None = None
+
+    def matches(self, entry: FdbEntry) -> bool:
+        return ((self.bridge_name is None or entry.bridge_name == self.bridge_name) and
+                (self.interface_name is None or entry.interface_name == self.interface_name) and
+                (self.vlan_id is None or entry.vlan_id == self.vlan_id) and
+                (self.mac_address is None or entry.mac_address == self.mac_address.lower()) and
+                (self.entry_type is None or entry.entry_type == self.entry_type))
+
+
+class FdbStatistics:
+    """
+    Count streamed MAC address table entries per bridge and type, kept in constant memory.
+    """
+
+    def __init__(self):
+        self.entries = 0
+        self.bridges: dict[BridgeName, dict[str, int]] = {}
+
+    def add(self, entry: FdbEntry) -> None:
+        self.entries += 1
+        counts = self.bridges.setdefault(entry.bridge_name, {t: 0 for t in BridgeFdb.ENTRY_TYPES})
+        counts[entry.entry_type] += 1
+
+
+class BridgeFdb(Netlink):
+    """
+    Read the bridge forwarding databases over rtnetlink (RTM_GETNEIGH, AF_BRIDGE).
+
+    The dump is decoded one netlink datagram at a time and yielded as it arrives, so
+    memory use does not depend on the number of learned addresses. The bridge and the
+    port are passed to the kernel (strict dump checking), which then only walks their
+    entries instead of every bridge of the system.
+    """
+
+    NETLINK_ROUTE = 0
+    SOL_NETLINK = 270
+    NETLINK_GET_STRICT_CHK = 12
+
+    RTM_NEWNEIGH = 28
+    RTM_GETNEIGH = 30
+
+    NDA_LLADDR = 2
+    NDA_CACHEINFO = 3
+    NDA_VLAN = 5
+    NDA_MASTER = 9
+
+    NUD_NOARP = 0x40
+    NUD_PERMANENT = 0x80
+
+    USER_HZ = 100
+
+    ENTRY_DYNAMIC = 'dynamic'
+    ENTRY_STATIC = 'static'
+    ENTRY_SELF = 'self'
+    ENTRY_TYPES = (ENTRY_DYNAMIC, ENTRY_STATIC, ENTRY_SELF)
+
+    _NDMSG = struct.Struct('=BBHiHBB')
+    _NDA_CACHEINFO = struct.Struct('=IIII')
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().BRIDGE_FDB)
+        self._sequence = itertools.count(1)
+
+    def dump(self, fdb_filter: FdbFilter | None = None) -> Iterator[FdbEntry]:
+        """
+        Stream the MAC address tables of the bridges.
+
+        Args:
+            fdb_filter (FdbFilter | None): Yield only matching entries. Defaults to every entry.
+
+        Yields:
+            FdbEntry: One entry at a time. Addresses of the port devices themselves (not owned
+                by a bridge) are skipped.
+
+        Raises:
+            BridgeFdbError: If the socket can not be opened, read or written, the bridge or port
+                does not exist, or the kernel rejects the dump.
+        """
+        fdb_filter = fdb_filter or FdbFilter()
+        names: dict[int, str] = {}
+
+        try:
+            bridge_index = socket.if_nametoindex(fdb_filter.bridge_name) if fdb_filter.bridge_name else 0
+            port_index = socket.if_nametoindex(fdb_filter.interface_name) if fdb_filter.interface_name else 0
+        except OSError as e:
+            raise BridgeFdbError(f"unknown interface: {e}", e.errno or 0)
+
+        with self._open_socket() as sock:
+            self._send(sock, self.build_request(next(self._sequence), bridge_index, port_index))
+
+            while True:
+                datagram = self._recv(sock)
+
+                if not datagram:
+                    return
+
+                for message_type, payload in self.iter_messages(datagram):
+                    if message_type == self.NLMSG_DONE:
+                        return
+
+                    if message_type == self.NLMSG_ERROR:
+                        raise BridgeFdbError(f"dump rejected: {os.strerror(self._error_code(payload))}",
+                                             self._error_code(payload))
+
+                    if message_type != self.RTM_NEWNEIGH:
+                        continue
+
+                    entry = self.parse_entry(payload, names)
+
+                    if entry and fdb_filter.matches(entry):
+                        yield entry
+
+    @classmethod
+    def build_request(cls, sequence: int, bridge_index: int = 0, port_index: int = 0) -> bytes:
+        """
+        Build an AF_BRIDGE RTM_GETNEIGH dump request.
+
+        Args:
+            sequence (int): The netlink sequence number.
+            bridge_index (int): Only dump the entries of this bridge, 0 for every bridge.
+            port_index (int): Only dump the entries of this bridge port, 0 for every port.
+
+        Returns:
+            bytes: The netlink message.
+        """
+        body = cls._NDMSG.pack(socket.AF_BRIDGE, 0, 0, port_index, 0, 0, 0)
+
+        if bridge_index:
+            body += cls._attribute(cls.NDA_MASTER, struct.pack('=I', bridge_index))
+
+        header = cls._NLMSGHDR.pack(cls._NLMSGHDR.size + len(body), cls.RTM_GETNEIGH,
+                                    cls.NLM_F_REQUEST | cls.NLM_F_DUMP, sequence, 0)
+        return header + body
+
+    @classmethod
+    def parse_entry(cls, payload: memoryview | bytes, names: dict[int, str] | None = None) -> FdbEntry | None:
+        """
+        Decode an RTM_NEWNEIGH payload (ndmsg and attributes).
+
+        Args:
+            payload (memoryview | bytes): The message payload.
+            names (dict[int, str] | None): Interface index to name cache, filled as indexes are resolved.
+
+        Returns:
+            FdbEntry | None: The entry, None if it is not owned by a bridge.
+        """
+        names = {} if names is None else names
+        family, _, _, port_index, state, _, _ = cls._NDMSG.unpack_from(payload)
+        attributes = cls._attributes(payload, cls._NDMSG.size)
+
+        if family != socket.AF_BRIDGE or cls.NDA_MASTER not in attributes or cls.NDA_LLADDR not in attributes:
+            return None
+
+        if state & cls.NUD_PERMANENT:
+            entry_type = cls.ENTRY_SELF
+        elif state & cls.NUD_NOARP:
+            entry_type = cls.ENTRY_STATIC
+        else:
+            entry_type = cls.ENTRY_DYNAMIC
+
+        age = 0
+
+        if entry_type == cls.ENTRY_DYNAMIC and cls.NDA_CACHEINFO in attributes:
+            age = cls._NDA_CACHEINFO.unpack_from(attributes[cls.NDA_CACHEINFO])[2] // cls.USER_HZ
+
+        return FdbEntry(':'.join(f'{octet:02x}' for octet in bytes(attributes[cls.NDA_LLADDR])),
+                        struct.unpack('=H', attributes[cls.NDA_VLAN])[0] if cls.NDA_VLAN in attributes else None,
+                        cls._interface_name(port_index, names),
+                        cls._interface_name(struct.unpack('=I', attributes[cls.NDA_MASTER])[0], names),
+                        entry_type, age)
+
+    @staticmethod
+    def _interface_name(index: int, names: dict[int, str]) -> str:
+        if index not in names:
+            try:
+                names[index] = socket.if_indextoname(index)
+            except OSError:
+                names[index] = str(index)
+        return names[index]
+
+    def _open_socket(self) -> socket.socket:
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_ROUTE)
+            sock.bind((0, 0))
+        except OSError as e:
+            raise BridgeFdbError(f"unable to open rtnetlink socket: {e}", e.errno or 0)
+
+        try:
+            sock.setsockopt(self.SOL_NETLINK, self.NETLINK_GET_STRICT_CHK, 1)
+        except OSError:
+            self.log.debug("Strict netlink checking not supported, filtering the MAC address table in user space")
+
+        return sock
+
+    def _send(self, sock: socket.socket, request: bytes) -> None:
+        try:
+            sock.send(request)
+        except OSError as e:
+            raise BridgeFdbError(f"unable to send rtnetlink request: {e}", e.errno or 0)
+
+    def _recv(self, sock: socket.socket) -> bytes:
+        try:
+            return sock.recv(self.RECV_BUFFER_SIZE)
+        except OSError as e:
+            raise BridgeFdbError(f"unable to read rtnetlink socket: {e}", e.errno or 0)
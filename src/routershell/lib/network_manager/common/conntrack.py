@@ -0,0 +1,436 @@
+import errno
+import ipaddress
+import itertools
+import logging
+import os
+import socket
+import struct
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InetAddressText, StatusResult
+from routershell.lib.network_manager.common.netlink import Netlink
+
+
+class ConntrackError(Exception):
+    """Raised when the kernel rejects a conntrack netlink request."""
+    def __init__(self, message: str, error_code: int = 0):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'ConntrackError: {self.message}'
+
+
+class ConntrackTuple(NamedTuple):
+    """
+    One direction (original or reply) of a conntrack entry.
+
+    Attributes:
+        protocol (int): IP protocol number.
+        source (InetAddressText): Source address.
+        destination (InetAddressText): Destination address.
+        source_port (int | None): TCP/UDP source port, ICMP id.
+        destination_port (int | None): TCP/UDP destination port, None for ICMP.
+        icmp_type_code (tuple[int, int] | None): ICMP type and code, None for TCP/UDP.
+    """
+    protocol: int
+    source: InetAddressText
+    destination: InetAddressText
+    source_port: int | None = None
+    destination_port: int | None = None
+    icmp_type_code: tuple[int, int] | None = None
+
+
+class ConntrackEntry(NamedTuple):
+    """
+    An IPv4 conntrack entry as dumped by ctnetlink.
+
+    Attributes:
+        original (ConntrackTuple): The tuple of the connection initiator.
+        reply (ConntrackTuple): The tuple expected in the reply direction, rewritten by NAT.
+        status (int): `IPS_*` status bits.
+        timeout (int): Seconds until the entry expires.
+        packets (int): Packets in both directions, 0 unless `nf_conntrack_acct` is enabled.
+        bytes (int): Bytes in both directions, 0 unless `nf_conntrack_acct` is enabled.
+    """
+    original: ConntrackTuple
+    reply: ConntrackTuple
+    status: int = 0
+    timeout: int = 0
+    packets: int = 0
+    bytes: int = 0
+
+    def is_nat(self) -> bool:
+        return bool(self.status & (Conntrack.IPS_SRC_NAT | Conntrack.IPS_DST_NAT))
+
+    def is_offloaded(self) -> bool:
+        return bool(self.status & Conntrack.IPS_OFFLOAD)
+
+    def protocol_name(self) -> str:
+        return Conntrack.PROTOCOL_NAMES.get(self.original.protocol, str(self.original.protocol))
+
+    def translation(self) -> tuple[str, str, str, str]:
+        """
+        Render the entry as a NAT translation.
+
+        Returns:
+            tuple[str, str, str, str]: inside global, inside local, outside local and outside global
+                `address[:port]`. An entry initiated from outside (static NAT / port forward) is
+                read from the reply tuple.
+        """
+        original, reply = self.original, self.reply
+
+        if self.status & Conntrack.IPS_DST_NAT and not self.status & Conntrack.IPS_SRC_NAT:
+            return (_endpoint(original.destination, original.destination_port),
+                    _endpoint(reply.source, reply.source_port),
+                    _endpoint(original.source, original.source_port),
+                    _endpoint(original.source, original.source_port))
+
+        return (_endpoint(reply.destination, reply.destination_port),
+                _endpoint(original.source, original.source_port),
+                _endpoint(original.destination, original.destination_port),
+                _endpoint(reply.source, reply.source_port))
+
+    def inside_addresses(self) -> tuple[InetAddressText, InetAddressText]:
+        """
+        Returns:
+            tuple[InetAddressText, InetAddressText]: The inside local and inside global address.
+        """
+        if self.status & Conntrack.IPS_DST_NAT and not self.status & Conntrack.IPS_SRC_NAT:
+            return self.reply.source, self.original.destination
+        return self.original.source, self.reply.destination
+
+
+class ConntrackFilter(NamedTuple):
+    """
+    Select conntrack entries while they are streamed. Unset fields match everything.
+
+    Attributes:
+        inside_address (InetAddressText | None): Inside local address.
+        networks (list[ipaddress.IPv4Network] | None): Networks of an interface; an entry matches
+            when its inside local or inside global address is within one of them.
+        protocol (int | None): IP protocol number.
+        nat_only (bool): Only entries rewritten by NAT.
+    """
+    inside_address: InetAddressText | None = None
+    networks: list[ipaddress.IPv4Network] | None = None
+    protocol: int | None = None
+    nat_only: bool = True
+
+    def matches(self, entry: ConntrackEntry) -> bool:
+        if self.nat_only and not entry.is_nat():
+            return False
+
+        if self.protocol is not None and entry.original.protocol != self.protocol:
+            return False
+
+        inside_local, inside_global = entry.inside_addresses()
+
+        if self.inside_address is not None and inside_local != self.inside_address:
+            return False
+
+        if self.networks is not None:
+            addresses = (ipaddress.IPv4Address(inside_local), ipaddress.IPv4Address(inside_global))
+            if not any(address in network for network in self.networks for address in addresses):
+                return False
+
+        return True
+
+
+class ConntrackStatistics:
+    """
+    Aggregate counters of streamed conntrack entries, kept in constant memory.
+    """
+
+    def __init__(self):
+        self.entries = 0
+        self.source_nat = 0
+        self.destination_nat = 0
+        self.offloaded = 0
+        self.packets = 0
+        self.bytes = 0
+        self.protocols: dict[str, int] = {}
+
+    def add(self, entry: ConntrackEntry) -> None:
+        self.entries += 1
+        self.source_nat += bool(entry.status & Conntrack.IPS_SRC_NAT)
+        self.destination_nat += bool(entry.status & Conntrack.IPS_DST_NAT)
+        self.offloaded += entry.is_offloaded()
+        self.packets += entry.packets
+        self.bytes += entry.bytes
+        self.protocols[entry.protocol_name()] = self.protocols.get(entry.protocol_name(), 0) + 1
+
+
+class Conntrack(Netlink):
+    """
+    Read and delete IPv4 conntrack entries over ctnetlink (NETLINK_NETFILTER).
+
+    Dumps are decoded one netlink datagram at a time and yielded as they arrive, so
+    memory use does not depend on the size of the connection table. Entries are deleted
+    by their original tuple on a second socket while the dump is still running.
+    """
+
+    NETLINK_NETFILTER = 12
+    NFNL_SUBSYS_CTNETLINK = 1
+    IPCTNL_MSG_CT_GET = 1
+    IPCTNL_MSG_CT_DELETE = 2
+
+    CTA_TUPLE_ORIG = 1
+    CTA_TUPLE_REPLY = 2
+    CTA_STATUS = 3
+    CTA_TIMEOUT = 7
+    CTA_COUNTERS_ORIG = 9
+    CTA_COUNTERS_REPLY = 10
+
+    CTA_TUPLE_IP = 1
+    CTA_TUPLE_PROTO = 2
+    CTA_IP_V4_SRC = 1
+    CTA_IP_V4_DST = 2
+    CTA_PROTO_NUM = 1
+    CTA_PROTO_SRC_PORT = 2
+    CTA_PROTO_DST_PORT = 3
+    CTA_PROTO_ICMP_ID = 4
+    CTA_PROTO_ICMP_TYPE = 5
+    CTA_PROTO_ICMP_CODE = 6
+    CTA_COUNTERS_PACKETS = 1
+    CTA_COUNTERS_BYTES = 2
+
+    IPS_SRC_NAT = 1 << 4
+    IPS_DST_NAT = 1 << 5
+    IPS_OFFLOAD = 1 << 14
+
+    PROTOCOL_ICMP = 1
+    PROTOCOL_NUMBERS = {'icmp': 1, 'tcp': 6, 'udp': 17}
+    PROTOCOL_NAMES = {number: name for name, number in PROTOCOL_NUMBERS.items()}
+
+    _NFGENMSG = struct.Struct('=BBH')
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().CONNTRACK)
+        self._sequence = itertools.count(1)
+
+    def dump(self, conntrack_filter: ConntrackFilter | None = None) -> Iterator[ConntrackEntry]:
+        """
+        Stream the IPv4 conntrack table.
+
+        Args:
+            conntrack_filter (ConntrackFilter | None): Yield only matching entries. Defaults to every entry.
+
+        Yields:
+            ConntrackEntry: One entry at a time, in kernel hash order.
+
+        Raises:
+            ConntrackError: If the socket can not be opened or read, e.g. ENOBUFS on a large table,
+                or the kernel rejects the dump.
+        """
+        with self._open_socket() as sock:
+            self._send(sock, self.build_request(self.IPCTNL_MSG_CT_GET, self.NLM_F_DUMP, next(self._sequence)))
+
+            while True:
+                datagram = self._recv(sock)
+
+                if not datagram:
+                    return
+
+                for message_type, payload in self.iter_messages(datagram):
+                    if message_type == self.NLMSG_DONE:
+                        return
+
+                    if message_type == self.NLMSG_ERROR:
+                        raise ConntrackError(f"dump rejected: {os.strerror(self._error_code(payload))}",
+                                             self._error_code(payload))
+
+                    entry = self.parse_entry(payload)
+
+                    if entry and (conntrack_filter is None or conntrack_filter.matches(entry)):
+                        yield entry
+
+    def delete(self, entries: Iterator[ConntrackEntry]) -> int:
+        """
+        Delete conntrack entries by their original tuple.
+
+        Args:
+            entries (Iterator[ConntrackEntry]): The entries to delete, typically a running `dump()`.
+
+        Returns:
+            int: The number of entries deleted. Entries that expired in the meantime are skipped.
+
+        Raises:
+            ConntrackError: If the socket can not be opened, read or written, or a delete is rejected.
+        """
+        deleted = 0
+
+        with self._open_socket() as sock:
+            for entry in entries:
+                sequence = next(self._sequence)
+                self._send(sock, self.build_request(self.IPCTNL_MSG_CT_DELETE, self.NLM_F_ACK, sequence,
+                                                    self.encode_tuple(self.CTA_TUPLE_ORIG, entry.original)))
+
+                for message_type, payload in self.iter_messages(self._recv(sock)):
+                    if message_type != self.NLMSG_ERROR:
+                        continue
+
+                    error_code = self._error_code(payload)
+
+                    if error_code == 0:
+                        deleted += 1
+                    elif error_code != errno.ENOENT:
+                        raise ConntrackError(f"delete rejected: {os.strerror(error_code)}", error_code)
+
+        return deleted
+
+    def clear(self, conntrack_filter: ConntrackFilter) -> StatusResult:
+        """
+        Delete every conntrack entry matching the filter.
+
+        Args:
+            conntrack_filter (ConntrackFilter): The entries to delete.
+
+        Returns:
+            StatusResult: STATUS_OK if the matching entries were deleted, STATUS_NOK otherwise.
+        """
+        try:
+            deleted = self.delete(self.dump(conntrack_filter))
+        except (ConntrackError, OSError) as e:
+            self.log.error(f"Unable to clear conntrack entries: {e}")
+            return STATUS_NOK
+
+        self.log.debug(f"clear() -> {conntrack_filter} -> deleted: {deleted}")
+        return STATUS_OK
+
+    @classmethod
+    def build_request(cls, message_type: int, flags: int, sequence: int, attributes: bytes = b'') -> bytes:
+        """
+        Build a ctnetlink request for the IPv4 table.
+
+        Args:
+            message_type (int): `IPCTNL_MSG_CT_*`.
+            flags (int): `NLM_F_*` flags in addition to NLM_F_REQUEST.
+            sequence (int): The netlink sequence number.
+            attributes (bytes): Encoded netlink attributes.
+
+        Returns:
+            bytes: The netlink message.
+        """
+        body = cls._NFGENMSG.pack(socket.AF_INET, 0, 0) + attributes
+        header = cls._NLMSGHDR.pack(cls._NLMSGHDR.size + len(body),
+                                    (cls.NFNL_SUBSYS_CTNETLINK << 8) | message_type,
+                                    cls.NLM_F_REQUEST | flags, sequence, 0)
+        return header + body
+
+    @classmethod
+    def encode_tuple(cls, attribute_type: int, conntrack_tuple: ConntrackTuple) -> bytes:
+        """
+        Encode a `CTA_TUPLE_ORIG`/`CTA_TUPLE_REPLY` nested attribute.
+        """
+        ip = (cls._attribute(cls.CTA_IP_V4_SRC, socket.inet_aton(conntrack_tuple.source)) +
+              cls._attribute(cls.CTA_IP_V4_DST, socket.inet_aton(conntrack_tuple.destination)))
+
+        proto = cls._attribute(cls.CTA_PROTO_NUM, struct.pack('B', conntrack_tuple.protocol))
+
+        if conntrack_tuple.icmp_type_code is not None:
+            proto += (cls._attribute(cls.CTA_PROTO_ICMP_ID, struct.pack('>H', conntrack_tuple.source_port or 0)) +
+                      cls._attribute(cls.CTA_PROTO_ICMP_TYPE, struct.pack('B', conntrack_tuple.icmp_type_code[0])) +
+                      cls._attribute(cls.CTA_PROTO_ICMP_CODE, struct.pack('B', conntrack_tuple.icmp_type_code[1])))
+
+        elif conntrack_tuple.source_port is not None:
+            proto += (cls._attribute(cls.CTA_PROTO_SRC_PORT, struct.pack('>H', conntrack_tuple.source_port)) +
+                      cls._attribute(cls.CTA_PROTO_DST_PORT, struct.pack('>H', conntrack_tuple.destination_port)))
+
+        return cls._attribute(attribute_type | cls.NLA_F_NESTED,
+                              cls._attribute(cls.CTA_TUPLE_IP | cls.NLA_F_NESTED, ip) +
+                              cls._attribute(cls.CTA_TUPLE_PROTO | cls.NLA_F_NESTED, proto))
+
+    @classmethod
+    def parse_entry(cls, payload: memoryview | bytes) -> ConntrackEntry | None:
+        """
+        Decode an `IPCTNL_MSG_CT_NEW` payload (nfgenmsg and attributes).
+
+        Returns:
+            ConntrackEntry | None: The entry, None if it is not an IPv4 entry.
+        """
+        attributes = cls._attributes(payload, cls._NFGENMSG.size)
+
+        if cls.CTA_TUPLE_ORIG not in attributes or cls.CTA_TUPLE_REPLY not in attributes:
+            return None
+
+        original = cls._parse_tuple(attributes[cls.CTA_TUPLE_ORIG])
+        reply = cls._parse_tuple(attributes[cls.CTA_TUPLE_REPLY])
+
+        if original is None or reply is None:
+            return None
+
+        packets = byte_count = 0
+
+        for counters_type in (cls.CTA_COUNTERS_ORIG, cls.CTA_COUNTERS_REPLY):
+            if counters_type in attributes:
+                counters = cls._attributes(attributes[counters_type])
+                packets += struct.unpack('>Q', counters[cls.CTA_COUNTERS_PACKETS])[0] \
+                    if cls.CTA_COUNTERS_PACKETS in counters else 0
+                byte_count += struct.unpack('>Q', counters[cls.CTA_COUNTERS_BYTES])[0] \
+                    if cls.CTA_COUNTERS_BYTES in counters else 0
+
+        return ConntrackEntry(original, reply,
+                              cls._unpack_be32(attributes.get(cls.CTA_STATUS)),
+                              cls._unpack_be32(attributes.get(cls.CTA_TIMEOUT)),
+                              packets, byte_count)
+
+    @classmethod
+    def _parse_tuple(cls, payload: memoryview) -> ConntrackTuple | None:
+        tuple_attributes = cls._attributes(payload)
+        ip = cls._attributes(tuple_attributes.get(cls.CTA_TUPLE_IP, b''))
+        proto = cls._attributes(tuple_attributes.get(cls.CTA_TUPLE_PROTO, b''))
+
+        if cls.CTA_IP_V4_SRC not in ip or cls.CTA_IP_V4_DST not in ip or cls.CTA_PROTO_NUM not in proto:
+            return None
+
+        protocol = proto[cls.CTA_PROTO_NUM][0]
+        source = socket.inet_ntoa(bytes(ip[cls.CTA_IP_V4_SRC]))
+        destination = socket.inet_ntoa(bytes(ip[cls.CTA_IP_V4_DST]))
+
+        if protocol == cls.PROTOCOL_ICMP:
+            icmp_id = struct.unpack('>H', proto[cls.CTA_PROTO_ICMP_ID])[0] if cls.CTA_PROTO_ICMP_ID in proto else 0
+            type_code = (proto[cls.CTA_PROTO_ICMP_TYPE][0] if cls.CTA_PROTO_ICMP_TYPE in proto else 0,
+                         proto[cls.CTA_PROTO_ICMP_CODE][0] if cls.CTA_PROTO_ICMP_CODE in proto else 0)
+            return ConntrackTuple(protocol, source, destination, icmp_id, None, type_code)
+
+        if cls.CTA_PROTO_SRC_PORT in proto and cls.CTA_PROTO_DST_PORT in proto:
+            return ConntrackTuple(protocol, source, destination,
+                                  struct.unpack('>H', proto[cls.CTA_PROTO_SRC_PORT])[0],
+                                  struct.unpack('>H', proto[cls.CTA_PROTO_DST_PORT])[0])
+
+        return ConntrackTuple(protocol, source, destination)
+
+    @staticmethod
+    def _unpack_be32(payload: memoryview | None) -> int:
+        return struct.unpack('>I', payload)[0] if payload is not None else 0
+
+    def _open_socket(self) -> socket.socket:
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_NETFILTER)
+            sock.bind((0, 0))
+        except OSError as e:
+            raise ConntrackError(f"unable to open ctnetlink socket: {e}", e.errno or 0)
+
+        return sock
+
+    def _send(self, sock: socket.socket, request: bytes) -> None:
+        try:
+            sock.send(request)
+        except OSError as e:
+            raise ConntrackError(f"unable to send ctnetlink request: {e}", e.errno or 0)
+
+    def _recv(self, sock: socket.socket) -> bytes:
+        try:
+            return sock.recv(self.RECV_BUFFER_SIZE)
+        except OSError as e:
+            raise ConntrackError(f"unable to read ctnetlink socket: {e}", e.errno or 0)
+
+
+def _endpoint(address: InetAddressText, port: int | None) -> str:
+    return address if port is None else f'{address}:{port}'
@@ -0,0 +1,319 @@
+import itertools
+import logging
+import os
+import socket
+import struct
+from typing import NamedTuple
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName
+from routershell.lib.network_manager.common.netlink import Netlink
+
+
+class EthtoolError(Exception):
+    """Raised when the kernel rejects an ethtool netlink request."""
+    def __init__(self, message: str, error_code: int = 0):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'EthtoolError: {self.message}'
+
+
+class EthtoolFeatures(NamedTuple):
+    """
+    The netdev features of an interface, by ethtool feature name (`rx-gro`, `tx-tcp-segmentation`).
+
+    Attributes:
+        hw (frozenset[str]): Features that can be changed.
+        wanted (frozenset[str]): Features requested by the user.
+        active (frozenset[str]): Features currently enabled.
+        nochange (frozenset[str]): Features that can never be changed.
+    """
+    hw: frozenset[str] = frozenset()
+    wanted: frozenset[str] = frozenset()
+    active: frozenset[str] = frozenset()
+    nochange: frozenset[str] = frozenset()
+
+
+class EthtoolRings(NamedTuple):
+    """
+    Ring buffer sizes of an interface, 0 when the driver does not report a value.
+    """
+    rx: int = 0
+    tx: int = 0
+    rx_max: int = 0
+    tx_max: int = 0
+
+
+class EthtoolNetlink(Netlink):
+    """
+    Read and change features (offloads), ring sizes and interrupt coalescing over the
+    ethtool generic netlink family, one request per setting group instead of one
+    `ethtool` process per setting.
+    """
+
+    NETLINK_GENERIC = 16
+    GENL_ID_CTRL = 0x10
+    CTRL_CMD_GETFAMILY = 3
+    CTRL_ATTR_FAMILY_ID = 1
+    CTRL_ATTR_FAMILY_NAME = 2
+
+    ETHTOOL_GENL_NAME = 'ethtool'
+    ETHTOOL_GENL_VERSION = 1
+
+    ETHTOOL_MSG_FEATURES_GET = 11
+    ETHTOOL_MSG_FEATURES_SET = 12
+    ETHTOOL_MSG_RINGS_GET = 15
+    ETHTOOL_MSG_RINGS_SET = 16
+    ETHTOOL_MSG_COALESCE_GET = 19
+    ETHTOOL_MSG_COALESCE_SET = 20
+
+    ETHTOOL_A_HEADER = 1
+    ETHTOOL_A_HEADER_DEV_NAME = 2
+    ETHTOOL_A_HEADER_FLAGS = 3
+    ETHTOOL_FLAG_OMIT_REPLY = 1 << 1
+
+    ETHTOOL_A_BITSET_NOMASK = 1
+    ETHTOOL_A_BITSET_BITS = 3
+    ETHTOOL_A_BITSET_BITS_BIT = 1
+    ETHTOOL_A_BITSET_BIT_NAME = 2
+    ETHTOOL_A_BITSET_BIT_VALUE = 3
+
+    ETHTOOL_A_FEATURES_HW = 2
+    ETHTOOL_A_FEATURES_WANTED = 3
+    ETHTOOL_A_FEATURES_ACTIVE = 4
+    ETHTOOL_A_FEATURES_NOCHANGE = 5
+
+    ETHTOOL_A_RINGS_RX_MAX = 2
+    ETHTOOL_A_RINGS_TX_MAX = 5
+    ETHTOOL_A_RINGS_RX = 6
+    ETHTOOL_A_RINGS_TX = 9
+
+    ETHTOOL_A_COALESCE_RX_USECS = 2
+    ETHTOOL_A_COALESCE_RX_MAX_FRAMES = 3
+    ETHTOOL_A_COALESCE_TX_USECS = 6
+    ETHTOOL_A_COALESCE_TX_MAX_FRAMES = 7
+    ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX = 11
+    ETHTOOL_A_COALESCE_USE_ADAPTIVE_TX = 12
+
+    COALESCE_U8_ATTRIBUTES = (ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX, ETHTOOL_A_COALESCE_USE_ADAPTIVE_TX)
+
+    _GENLMSGHDR = struct.Struct('=BBH')
+
+    _family_id: int | None = None
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ETHTOOL_NETLINK)
+        self._sequence = itertools.count(1)
+
+    def get_features(self, interface_name: InterfaceName) -> EthtoolFeatures:
+        """
+        Raises:
+            EthtoolError: If the request is rejected.
+        """
+        attributes = self._attributes(self._request(self.ETHTOOL_MSG_FEATURES_GET, self.encode_header(interface_name))[0])
+
+        return EthtoolFeatures(*(self.parse_bitset(attributes.get(attribute_type, b''))
+                                 for attribute_type in (self.ETHTOOL_A_FEATURES_HW, self.ETHTOOL_A_FEATURES_WANTED,
+                                                        self.ETHTOOL_A_FEATURES_ACTIVE, self.ETHTOOL_A_FEATURES_NOCHANGE)))
+
+    def set_features(self, interface_name: InterfaceName, features: dict[str, bool]) -> None:
+        """
+        Enable or disable features in one request, features that are not listed are left unchanged.
+
+        Raises:
+            EthtoolError: If the request is rejected.
+        """
+        self._request(self.ETHTOOL_MSG_FEATURES_SET,
+                      self.encode_header(interface_name, self.ETHTOOL_FLAG_OMIT_REPLY) +
+                      self._attribute(self.ETHTOOL_A_FEATURES_WANTED | self.NLA_F_NESTED, self.encode_bitset(features)))
+
+    def get_rings(self, interface_name: InterfaceName) -> EthtoolRings:
+        """
+        Raises:
+            EthtoolError: If the request is rejected, EOPNOTSUPP if the driver has no ring settings.
+        """
+        attributes = self._attributes(self._request(self.ETHTOOL_MSG_RINGS_GET, self.encode_header(interface_name))[0])
+
+        return EthtoolRings(*(self._unpack_u32(attributes.get(attribute_type))
+                              for attribute_type in (self.ETHTOOL_A_RINGS_RX, self.ETHTOOL_A_RINGS_TX,
+                                                     self.ETHTOOL_A_RINGS_RX_MAX, self.ETHTOOL_A_RINGS_TX_MAX)))
+
+    def set_rings(self, interface_name: InterfaceName, rx: int | None = None, tx: int | None = None) -> None:
+        """
+        Raises:
+            EthtoolError: If the request is rejected.
+        """
+        attributes = self.encode_header(interface_name)
+
+        for attribute_type, size in ((self.ETHTOOL_A_RINGS_RX, rx), (self.ETHTOOL_A_RINGS_TX, tx)):
+            if size is not None:
+                attributes += self._attribute(attribute_type, struct.pack('=I', size))
+
+        self._request(self.ETHTOOL_MSG_RINGS_SET, attributes)
+
+    def get_coalesce(self, interface_name: InterfaceName) -> dict[int, int]:
+        """
+        Returns:
+            dict[int, int]: {ETHTOOL_A_COALESCE_*: value}, the parameters supported by the driver.
+
+        Raises:
+            EthtoolError: If the request is rejected, EOPNOTSUPP if the driver has no coalescing settings.
+        """
+        payload = self._request(self.ETHTOOL_MSG_COALESCE_GET, self.encode_header(interface_name))[0]
+
+        return {attribute_type: value[0] if len(value) == 1 else self._unpack_u32(value)
+                for attribute_type, value in self.iter_attributes(payload)
+                if attribute_type != self.ETHTOOL_A_HEADER and len(value) in (1, 4)}
+
+    def set_coalesce(self, interface_name: InterfaceName, settings: dict[int, int]) -> None:
+        """
+        Raises:
+            EthtoolError: If the request is rejected.
+        """
+        attributes = self.encode_header(interface_name)
+
+        for attribute_type, value in settings.items():
+            attributes += self._attribute(attribute_type, struct.pack(
+                '=B' if attribute_type in self.COALESCE_U8_ATTRIBUTES else '=I', value))
+
+        self._request(self.ETHTOOL_MSG_COALESCE_SET, attributes)
+
+    @classmethod
+    def build_request(cls, family_id: int, command: int, sequence: int, attributes: bytes = b'',
+                      version: int = ETHTOOL_GENL_VERSION) -> bytes:
+        """
+        Build a generic netlink request, the kernel acknowledges every request.
+
+        Args:
+            family_id (int): The generic netlink family id.
+            command (int): `ETHTOOL_MSG_*` or `CTRL_CMD_*`.
+            sequence (int): The netlink sequence number.
+            attributes (bytes): Encoded netlink attributes.
+            version (int): The family version.
+
+        Returns:
+            bytes: The netlink message.
+        """
+        body = cls._GENLMSGHDR.pack(command, version, 0) + attributes
+        header = cls._NLMSGHDR.pack(cls._NLMSGHDR.size + len(body), family_id,
+                                    cls.NLM_F_REQUEST | cls.NLM_F_ACK, sequence, 0)
+        return header + body
+
+    @classmethod
+    def encode_header(cls, interface_name: InterfaceName, flags: int = 0) -> bytes:
+        """
+        Encode the `ETHTOOL_A_*_HEADER` nest selecting the device.
+        """
+        header = cls._attribute(cls.ETHTOOL_A_HEADER_DEV_NAME, interface_name.encode() + b'\0')
+
+        if flags:
+            header += cls._attribute(cls.ETHTOOL_A_HEADER_FLAGS, struct.pack('=I', flags))
+
+        return cls._attribute(cls.ETHTOOL_A_HEADER | cls.NLA_F_NESTED, header)
+
+    @classmethod
+    def encode_bitset(cls, bits: dict[str, bool]) -> bytes:
+        """
+        Encode a verbose bitset changing only the named bits.
+        """
+        encoded = b''
+
+        for name, value in bits.items():
+            bit = cls._attribute(cls.ETHTOOL_A_BITSET_BIT_NAME, name.encode() + b'\0')
+
+            if value:
+                bit += cls._attribute(cls.ETHTOOL_A_BITSET_BIT_VALUE, b'')
+
+            encoded += cls._attribute(cls.ETHTOOL_A_BITSET_BITS_BIT | cls.NLA_F_NESTED, bit)
+
+        return cls._attribute(cls.ETHTOOL_A_BITSET_BITS | cls.NLA_F_NESTED, encoded)
+
+    @classmethod
+    def parse_bitset(cls, payload: memoryview | bytes) -> frozenset[str]:
+        """
+        Decode a verbose bitset.
+
+        Returns:
+            frozenset[str]: The names of the bits that are set.
+        """
+        attributes = cls._attributes(payload)
+        nomask = cls.ETHTOOL_A_BITSET_NOMASK in attributes
+        names = set()
+
+        for attribute_type, bit_payload in cls.iter_attributes(attributes.get(cls.ETHTOOL_A_BITSET_BITS, b'')):
+            if attribute_type != cls.ETHTOOL_A_BITSET_BITS_BIT:
+                continue
+
+            bit = cls._attributes(bit_payload)
+
+            if cls.ETHTOOL_A_BITSET_BIT_NAME in bit and (nomask or cls.ETHTOOL_A_BITSET_BIT_VALUE in bit):
+                names.add(bytes(bit[cls.ETHTOOL_A_BITSET_BIT_NAME]).rstrip(b'\0').decode())
+
+        return frozenset(names)
+
+    @staticmethod
+    def _unpack_u32(payload: memoryview | None) -> int:
+        return struct.unpack('=I', payload)[0] if payload is not None else 0
+
+    def _request(self, command: int, attributes: bytes) -> list[memoryview]:
+        """
+        Send an ethtool request and collect the reply payloads (attributes following the genlmsghdr).
+        """
+        with self._open_socket() as sock:
+            return self._transact(sock, self._resolve_family(sock), command, attributes)
+
+    def _resolve_family(self, sock: socket.socket) -> int:
+        if EthtoolNetlink._family_id is None:
+            payloads = self._transact(sock, self.GENL_ID_CTRL, self.CTRL_CMD_GETFAMILY,
+                                      self._attribute(self.CTRL_ATTR_FAMILY_NAME, self.ETHTOOL_GENL_NAME.encode() + b'\0'),
+                                      version=1)
+            family_id = self._attributes(payloads[0]).get(self.CTRL_ATTR_FAMILY_ID) if payloads else None
+
+            if family_id is None:
+                raise EthtoolError("ethtool netlink family is not available")
+
+            EthtoolNetlink._family_id = struct.unpack('=H', family_id)[0]
+
+        return EthtoolNetlink._family_id
+
+    def _transact(self, sock: socket.socket, family_id: int, command: int, attributes: bytes,
+                  version: int = ETHTOOL_GENL_VERSION) -> list[memoryview]:
+        self._send(sock, self.build_request(family_id, command, next(self._sequence), attributes, version))
+        payloads = []
+
+        while True:
+            for message_type, payload in self.iter_messages(self._recv(sock)):
+                if message_type == self.NLMSG_ERROR:
+                    error_code = self._error_code(payload)
+
+                    if error_code:
+                        raise EthtoolError(f"request {command} rejected: {os.strerror(error_code)}", error_code)
+
+                    return payloads
+
+                payloads.append(payload[self._GENLMSGHDR.size:])
+
+    def _open_socket(self) -> socket.socket:
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_GENERIC)
+            sock.bind((0, 0))
+        except OSError as e:
+            raise EthtoolError(f"unable to open generic netlink socket: {e}", e.errno or 0)
+
+        return sock
+
+    def _send(self, sock: socket.socket, request: bytes) -> None:
+        try:
+            sock.send(request)
+        except OSError as e:
+            raise EthtoolError(f"unable to send ethtool netlink request: {e}", e.errno or 0)
+
+    def _recv(self, sock: socket.socket) -> bytes:
+        try:
+            return sock.recv(self.RECV_BUFFER_SIZE)
+        except OSError as e:
+            raise EthtoolError(f"unable to read generic netlink socket: {e}", e.errno or 0)
@@ -229,8 +229,7 @@ class InetServiceLayer(MacServiceLayer):
     
     def set_inet_address_loopback(self, loopback_name: InterfaceName, inet_address_cidr: InetCidrText) -> StatusResult:
         """
-        Set an internet address (IPv4 or IPv6) on a loopback interface. 
-        Appending to the local loopback (lo) interface 
+        Set an internet address (IPv4 or IPv6) on a loopback interface (a dummy interface).
 
         Args:
             loopback_name (str): The name of the loopback interface.
@@ -253,8 +252,7 @@ class InetServiceLayer(MacServiceLayer):
             self.log.error(f"set_inet_address_loopback() -> Invalid IP address: {inet_address_cidr}")
             return STATUS_NOK
 
-        lo_name = f'lo:{loopback_name}'
-        cmd = ['ip', 'addr', 'add', inet_address_cidr, 'label', lo_name, 'dev', 'lo']
+        cmd = ['ip', 'addr', 'add', inet_address_cidr, 'dev', loopback_name]
 
         if ip_version == 6:
             cmd.insert(1, '-6')
@@ -294,8 +292,7 @@ class InetServiceLayer(MacServiceLayer):
             self.log.error(f"del_inet_address_loopback() -> Invalid IP address: {inet_address_cidr}")
             return STATUS_NOK
 
-        lo_name = f'lo:{loopback_name}'
-        cmd = ['ip', 'addr', 'del', inet_address_cidr, 'label', lo_name, 'dev', 'lo']
+        cmd = ['ip', 'addr', 'del', inet_address_cidr, 'dev', loopback_name]
 
         if ip_version == 6:
             cmd.insert(1, '-6')
@@ -342,8 +339,7 @@ class InetServiceLayer(MacServiceLayer):
             return STATUS_NOK
 
         # Delete old IP address
-        lo_name = f'lo:{loopback_name}'
-        del_cmd = ['ip', 'addr', 'del', old_inet_address_cidr, 'label', lo_name, 'dev', 'lo']
+        del_cmd = ['ip', 'addr', 'del', old_inet_address_cidr, 'dev', loopback_name]
         if old_ip_version == 6:
             del_cmd.insert(1, '-6')
         
@@ -356,7 +352,7 @@ class InetServiceLayer(MacServiceLayer):
             return STATUS_NOK
 
         # Add new IP address
-        add_cmd = ['ip', 'addr', 'add', new_inet_address_cidr, 'label', lo_name, 'dev', 'lo']
+        add_cmd = ['ip', 'addr', 'add', new_inet_address_cidr, 'dev', loopback_name]
         if new_ip_version == 6:
             add_cmd.insert(1, '-6')
 
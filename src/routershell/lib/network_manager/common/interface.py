@@ -28,6 +28,7 @@ class InterfaceType(Enum):
         LOOPBACK (str): Loopback interface type.
         VIRTUAL (str): Virtual interface type.
         BRIDGE (str): Bridge interface type.
+        PORT_CHANNEL (str): Link aggregation (bonding) interface type.
         WIRELESS_WIFI (str): Wireless Wi-Fi interface type.
         WIRELESS_CELL (str): Wireless cellular interface type.
         UNKNOWN (str): Unknown or undefined interface type.
@@ -39,6 +40,7 @@ class InterfaceType(Enum):
     LOOPBACK = 'loopback'
     VIRTUAL = 'vir'
     BRIDGE = 'br'
+    PORT_CHANNEL = 'port-channel'
     WIRELESS_WIFI = 'wifi'
     WIRELESS_CELL = 'cell'
     UNKNOWN = 'UNKNOWN'
@@ -86,6 +88,9 @@ class InterfaceLayer(PhyServiceLayer):
             elif re.search(r"\bGENERAL\.TYPE:\s*bridge\b", output.stdout):
                 return InterfaceType.BRIDGE
 
+            elif re.search(r"\bGENERAL\.TYPE:\s*bond\b", output.stdout):
+                return InterfaceType.PORT_CHANNEL
+
             elif re.search(r"\bGENERAL\.TYPE:\s*tun\b", output.stdout):
                 return InterfaceType.VIRTUAL
 
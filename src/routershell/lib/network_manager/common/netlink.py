@@ -0,0 +1,74 @@
+import struct
+from collections.abc import Iterator
+
+
+class Netlink:
+    """
+    Netlink message and attribute framing shared by the netlink clients (ctnetlink, ethtool).
+    """
+
+    NLM_F_REQUEST = 0x1
+    NLM_F_ACK = 0x4
+    NLM_F_DUMP = 0x300
+    NLMSG_ERROR = 2
+    NLMSG_DONE = 3
+
+    NLA_F_NESTED = 0x8000
+    NLA_TYPE_MASK = 0x3fff
+
+    RECV_BUFFER_SIZE = 65536
+
+    _NLMSGHDR = struct.Struct('=IHHII')
+    _NLATTR = struct.Struct('=HH')
+
+    @classmethod
+    def iter_messages(cls, datagram: bytes) -> Iterator[tuple[int, memoryview]]:
+        """
+        Split a netlink datagram into messages.
+
+        Yields:
+            tuple[int, memoryview]: The message type and the payload following the `nlmsghdr`.
+        """
+        view = memoryview(datagram)
+        offset = 0
+
+        while offset + cls._NLMSGHDR.size <= len(view):
+            length, message_type, _, _, _ = cls._NLMSGHDR.unpack_from(view, offset)
+
+            if length < cls._NLMSGHDR.size:
+                return
+
+            yield message_type, view[offset + cls._NLMSGHDR.size:offset + length]
+            offset += (length + 3) & ~3
+
+    @classmethod
+    def iter_attributes(cls, payload: memoryview | bytes, offset: int = 0) -> Iterator[tuple[int, memoryview]]:
+        """
+        Walk netlink attributes in order, repeated attribute types included.
+
+        Yields:
+            tuple[int, memoryview]: The attribute type (without flags) and payload.
+        """
+        view = memoryview(payload)
+
+        while offset + cls._NLATTR.size <= len(view):
+            length, attribute_type = cls._NLATTR.unpack_from(view, offset)
+
+            if length < cls._NLATTR.size:
+                return
+
+            yield attribute_type & cls.NLA_TYPE_MASK, view[offset + cls._NLATTR.size:offset + length]
+            offset += (length + 3) & ~3
+
+    @classmethod
+    def _attributes(cls, payload: memoryview | bytes, offset: int = 0) -> dict[int, memoryview]:
+        return dict(cls.iter_attributes(payload, offset))
+
+    @classmethod
+    def _attribute(cls, attribute_type: int, payload: bytes) -> bytes:
+        length = cls._NLATTR.size + len(payload)
+        return cls._NLATTR.pack(length, attribute_type) + payload + b'\0' * (-length % 4)
+
+    @staticmethod
+    def _error_code(payload: memoryview) -> int:
+        return -struct.unpack_from('=i', payload)[0]
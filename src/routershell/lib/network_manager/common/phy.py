@@ -4,6 +4,7 @@ from enum import Enum
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.network_manager.common.ethtool_netlink import EthtoolError, EthtoolNetlink
 from routershell.lib.network_manager.common.run_commands import RunCommand
 
 
@@ -78,10 +79,91 @@ class Speed(Enum):
     Example (wireless, loopback, vlan, bridges, only ethernet interfaces)
     """   
         
+class Offload(Enum):
+    GRO = 'gro'
+    """
+    Generic Receive Offload: merge received packets of a flow before the stack processes them.
+    """
+
+    GSO = 'gso'
+    """
+    Generic Segmentation Offload: segment large transmitted packets as late as possible.
+    """
+
+    TSO = 'tso'
+    """
+    TCP Segmentation Offload: the NIC segments large TCP packets.
+    """
+
+    LRO = 'lro'
+    """
+    Large Receive Offload: the NIC merges received packets. Not suitable for forwarding,
+    the kernel disables it while IP forwarding is on.
+    """
+
+    def feature_names(self) -> tuple[str, ...]:
+        """
+        Returns:
+            tuple[str, ...]: The ethtool features switched by the offload.
+        """
+        return {
+            Offload.GRO: ('rx-gro',),
+            Offload.GSO: ('tx-generic-segmentation',),
+            Offload.TSO: ('tx-tcp-segmentation', 'tx-tcp-ecn-segmentation',
+                          'tx-tcp-mangleid-segmentation', 'tx-tcp6-segmentation'),
+            Offload.LRO: ('rx-lro',),
+        }[self]
+
+class CoalesceProfile(Enum):
+    ADAPTIVE = 'adaptive'
+    """
+    ADAPTIVE: The driver tunes the interrupt rate to the load.
+    """
+
+    LATENCY = 'latency'
+    """
+    LATENCY: One interrupt per packet, lowest latency at the highest CPU cost.
+    """
+
+    THROUGHPUT = 'throughput'
+    """
+    THROUGHPUT: Batch packets per interrupt, fewer interrupts at the cost of latency.
+    """
+
+    def settings(self) -> dict[int, int]:
+        """
+        Returns:
+            dict[int, int]: {ETHTOOL_A_COALESCE_*: value}
+        """
+        return {
+            CoalesceProfile.ADAPTIVE: {
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX: 1,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_TX: 1,
+            },
+            CoalesceProfile.LATENCY: {
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_TX: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_RX_USECS: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_RX_MAX_FRAMES: 1,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_TX_USECS: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_TX_MAX_FRAMES: 1,
+            },
+            CoalesceProfile.THROUGHPUT: {
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_TX: 0,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_RX_USECS: 100,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_RX_MAX_FRAMES: 128,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_TX_USECS: 100,
+                EthtoolNetlink.ETHTOOL_A_COALESCE_TX_MAX_FRAMES: 128,
+            },
+        }[self]
+
 class PhyServiceLayer(RunCommand):
     """
     A class for configuring network settings using iproute2.
     """
+    RING_SIZE_MAX = 'max'
+
     def __init__(self):
         super().__init__()
         self.log = logging.getLogger(self.__class__.__name__)
@@ -184,6 +266,101 @@ class PhyServiceLayer(RunCommand):
 
         return status == STATUS_OK
 
+    def set_offload(self, interface_name: InterfaceName, offload: Offload, enable: bool) -> StatusResult:
+        """
+        Enable or disable an offload over ethtool netlink.
+
+        Only the features the driver allows to change are requested, an offload the
+        interface can not change at all is an error.
+
+        Args:
+            interface_name (str): The name of the network interface.
+            offload (Offload): The offload.
+            enable (bool): True to enable, False to disable.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        try:
+            changeable = EthtoolNetlink().get_features(interface_name).hw
+            features = {name: enable for name in offload.feature_names() if name in changeable}
+
+            if not features:
+                self.log.error(f"Offload {offload.value} can not be changed on interface {interface_name}")
+                return STATUS_NOK
+
+            EthtoolNetlink().set_features(interface_name, features)
+
+        except EthtoolError as e:
+            self.log.error(f"Unable to set offload {offload.value} on interface {interface_name}: {e}")
+            return STATUS_NOK
+
+        self.log.debug(f"set_offload() -> {interface_name} -> {features}")
+        return STATUS_OK
+
+    def set_ring_size(self, interface_name: InterfaceName, rx: int | str | None = None, tx: int | str | None = None) -> StatusResult:
+        """
+        Set the RX and/or TX ring buffer size over ethtool netlink.
+
+        Args:
+            interface_name (str): The name of the network interface.
+            rx (int | str | None): Descriptors, `max` for the hardware maximum, None to keep the current size.
+            tx (int | str | None): Descriptors, `max` for the hardware maximum, None to keep the current size.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        try:
+            rings = EthtoolNetlink().get_rings(interface_name)
+
+            rx = rings.rx_max if rx == self.RING_SIZE_MAX else rx
+            tx = rings.tx_max if tx == self.RING_SIZE_MAX else tx
+
+            if (rx is not None and not 0 < rx <= rings.rx_max) or (tx is not None and not 0 < tx <= rings.tx_max):
+                self.log.error(f"Ring size rx: {rx} tx: {tx} outside of the interface {interface_name} maximum "
+                               f"rx: {rings.rx_max} tx: {rings.tx_max}")
+                return STATUS_NOK
+
+            if (rx is None or rx == rings.rx) and (tx is None or tx == rings.tx):
+                return STATUS_OK
+
+            EthtoolNetlink().set_rings(interface_name, rx, tx)
+
+        except EthtoolError as e:
+            self.log.error(f"Unable to set ring size on interface {interface_name}: {e}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def set_coalesce_profile(self, interface_name: InterfaceName, profile: CoalesceProfile) -> StatusResult:
+        """
+        Apply an interrupt coalescing profile over ethtool netlink.
+
+        Parameters the driver does not support are left out of the request.
+
+        Args:
+            interface_name (str): The name of the network interface.
+            profile (CoalesceProfile): The profile.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        try:
+            supported = EthtoolNetlink().get_coalesce(interface_name)
+            settings = {attribute: value for attribute, value in profile.settings().items() if attribute in supported}
+
+            if not settings:
+                self.log.error(f"Interface {interface_name} does not support coalescing profile {profile.value}")
+                return STATUS_NOK
+
+            EthtoolNetlink().set_coalesce(interface_name, settings)
+
+        except EthtoolError as e:
+            self.log.error(f"Unable to set coalescing profile {profile.value} on interface {interface_name}: {e}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
     def set_mtu(self, interface_name: InterfaceName, mtu_size: int) -> StatusResult:
         """
         Set the Maximum Transmission Unit (MTU) size for a network interface using iproute2.
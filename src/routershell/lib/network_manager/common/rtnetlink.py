@@ -0,0 +1,297 @@
+import ipaddress
+import itertools
+import logging
+import os
+import socket
+import struct
+from typing import NamedTuple
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName
+from routershell.lib.network_manager.common.netlink import Netlink
+
+
+class RtnetlinkError(Exception):
+    """Raised when the kernel rejects an rtnetlink request."""
+    def __init__(self, message: str, error_code: int = 0):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'RtnetlinkError: {self.message}'
+
+
+class LinkEvent(NamedTuple):
+    """
+    A link notification (RTM_NEWLINK / RTM_DELLINK) or link dump entry.
+
+    Attributes:
+        index (int): The interface index.
+        interface_name (InterfaceName): The interface name.
+        admin_up (bool): The interface is administratively up (IFF_UP).
+        carrier (bool): The interface has carrier (IFF_LOWER_UP).
+        deleted (bool): The interface was removed.
+    """
+    index: int
+    interface_name: InterfaceName
+    admin_up: bool
+    carrier: bool
+    deleted: bool = False
+
+    def is_up(self) -> bool:
+        return self.admin_up and self.carrier and not self.deleted
+
+
+class RouteEvent(NamedTuple):
+    """
+    An IPv4 route notification (RTM_NEWROUTE / RTM_DELROUTE).
+
+    Attributes:
+        destination (str): The destination prefix, `a.b.c.d/len`.
+        table (int): The routing table.
+        metric (int): The route metric (priority).
+        gateway (str | None): The next-hop address, None for a device route.
+        interface_index (int): The outgoing interface index, 0 if not set.
+        deleted (bool): The route was removed.
+    """
+    destination: str
+    table: int
+    metric: int
+    gateway: str | None
+    interface_index: int
+    deleted: bool = False
+
+
+class Rtnetlink(Netlink):
+    """
+    Link and IPv4 route events, and IPv4 route changes, over rtnetlink (NETLINK_ROUTE).
+
+    `open_monitor()` subscribes to the link and IPv4 route multicast groups, the kernel
+    then pushes carrier and route changes as they happen instead of being polled.
+    `change_route()` adds or deletes a route with one request, without an `ip` process.
+    """
+
+    NETLINK_ROUTE = 0
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_ROUTE = 0x40
+
+    RTM_NEWLINK = 16
+    RTM_DELLINK = 17
+    RTM_GETLINK = 18
+    RTM_NEWROUTE = 24
+    RTM_DELROUTE = 25
+
+    NLM_F_REPLACE = 0x100
+    NLM_F_CREATE = 0x400
+
+    IFLA_IFNAME = 3
+    IFF_UP = 0x1
+    IFF_LOWER_UP = 0x10000
+
+    RTA_DST = 1
+    RTA_OIF = 4
+    RTA_GATEWAY = 5
+    RTA_PRIORITY = 6
+    RTA_MULTIPATH = 9
+    RTA_TABLE = 15
+
+    RT_TABLE_UNSPEC = 0
+    RT_TABLE_MAIN = 254
+    RTPROT_STATIC = 4
+    RT_SCOPE_UNIVERSE = 0
+    RT_SCOPE_LINK = 253
+    RTN_UNICAST = 1
+
+    _IFINFOMSG = struct.Struct('=BxHiII')
+    _RTMSG = struct.Struct('=BBBBBBBBI')
+    _RTNEXTHOP = struct.Struct('=HBBi')
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().RTNETLINK)
+        self._sequence = itertools.count(1)
+
+    def open_monitor(self) -> socket.socket:
+        """
+        Open a non-blocking rtnetlink socket subscribed to link and IPv4 route events.
+
+        Raises:
+            RtnetlinkError: If the socket can not be opened.
+        """
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_ROUTE)
+            sock.bind((0, self.RTMGRP_LINK | self.RTMGRP_IPV4_ROUTE))
+            sock.setblocking(False)
+        except OSError as e:
+            raise RtnetlinkError(f"unable to open rtnetlink monitor socket: {e}", e.errno or 0)
+
+        return sock
+
+    def get_links(self) -> dict[int, LinkEvent]:
+        """
+        Dump the links of the system.
+
+        Returns:
+            dict[int, LinkEvent]: The links by interface index.
+
+        Raises:
+            RtnetlinkError: If the dump fails.
+        """
+        links: dict[int, LinkEvent] = {}
+
+        for message_type, payload in self._transact(self.build_link_dump_request(next(self._sequence))):
+            link = self.parse_link(message_type, payload)
+
+            if link:
+                links[link.index] = link
+
+        return links
+
+    def change_route(self, add: bool, destination: str, gateway: str | None = None,
+                     interface_name: InterfaceName | None = None, metric: int = 0, table: int = RT_TABLE_MAIN,
+                     nexthops: list[tuple[str | None, InterfaceName | None, int]] | None = None) -> None:
+        """
+        Add (create or replace) or delete an IPv4 route.
+
+        Args:
+            add (bool): True to add the route, False to delete it.
+            destination (str): The destination prefix, `a.b.c.d/len`.
+            gateway (str | None): The next-hop address, None for a device route.
+            interface_name (InterfaceName | None): The outgoing interface, required for a device route.
+            metric (int): The route metric.
+            table (int): The routing table, the main table by default.
+            nexthops (list[tuple[str | None, InterfaceName | None, int]] | None): The (gateway, interface, weight)
+                next hops of a multipath route, in place of `gateway` and `interface_name`.
+
+        Raises:
+            RtnetlinkError: If an interface does not exist or the kernel rejects the change.
+        """
+        try:
+            interface_index = socket.if_nametoindex(interface_name) if interface_name else 0
+            multipath = [(hop_gateway, socket.if_nametoindex(hop_interface) if hop_interface else 0, weight)
+                         for hop_gateway, hop_interface, weight in nexthops or []]
+        except OSError as e:
+            raise RtnetlinkError(f"unknown interface {interface_name or nexthops}: {e}", e.errno or 0)
+
+        self._transact(self.build_route_request(next(self._sequence), add, destination, gateway, interface_index,
+                                                metric, table, multipath))
+
+    @classmethod
+    def build_link_dump_request(cls, sequence: int) -> bytes:
+        body = cls._IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+        return cls._NLMSGHDR.pack(cls._NLMSGHDR.size + len(body), cls.RTM_GETLINK,
+                                  cls.NLM_F_REQUEST | cls.NLM_F_DUMP, sequence, 0) + body
+
+    @classmethod
+    def build_route_request(cls, sequence: int, add: bool, destination: str, gateway: str | None = None,
+                            interface_index: int = 0, metric: int = 0, table: int = RT_TABLE_MAIN,
+                            nexthops: list[tuple[str | None, int, int]] | None = None) -> bytes:
+        """
+        Build an RTM_NEWROUTE (create or replace) or RTM_DELROUTE request.
+
+        `nexthops` lists the (gateway, interface index, weight) next hops of a multipath route (RTA_MULTIPATH),
+        traffic is spread over them by flow hash in proportion to their weight.
+        """
+        network = ipaddress.IPv4Network(destination)
+        scope = (cls.RT_SCOPE_UNIVERSE if gateway or any(hop_gateway for hop_gateway, _, _ in nexthops or [])
+                 else cls.RT_SCOPE_LINK)
+
+        # Table IDs above 255 are carried by RTA_TABLE only
+        body = cls._RTMSG.pack(socket.AF_INET, network.prefixlen, 0, 0, table if table < 256 else cls.RT_TABLE_UNSPEC,
+                               cls.RTPROT_STATIC, scope, cls.RTN_UNICAST, 0)
+
+        if network.prefixlen:
+            body += cls._attribute(cls.RTA_DST, network.network_address.packed)
+
+        if gateway:
+            body += cls._attribute(cls.RTA_GATEWAY, ipaddress.IPv4Address(gateway).packed)
+
+        if interface_index:
+            body += cls._attribute(cls.RTA_OIF, struct.pack('=I', interface_index))
+
+        if nexthops:
+            multipath = b''
+
+            for hop_gateway, hop_index, weight in nexthops:
+                attributes = cls._attribute(cls.RTA_GATEWAY, ipaddress.IPv4Address(hop_gateway).packed) if hop_gateway else b''
+                multipath += cls._RTNEXTHOP.pack(cls._RTNEXTHOP.size + len(attributes), 0, weight - 1, hop_index) + attributes
+
+            body += cls._attribute(cls.RTA_MULTIPATH, multipath)
+
+        body += cls._attribute(cls.RTA_PRIORITY, struct.pack('=I', metric))
+        body += cls._attribute(cls.RTA_TABLE, struct.pack('=I', table))
+
+        message_type, flags = ((cls.RTM_NEWROUTE, cls.NLM_F_CREATE | cls.NLM_F_REPLACE) if add
+                               else (cls.RTM_DELROUTE, 0))
+
+        return cls._NLMSGHDR.pack(cls._NLMSGHDR.size + len(body), message_type,
+                                  cls.NLM_F_REQUEST | cls.NLM_F_ACK | flags, sequence, 0) + body
+
+    @classmethod
+    def parse_link(cls, message_type: int, payload: memoryview | bytes) -> LinkEvent | None:
+        """
+        Decode an RTM_NEWLINK / RTM_DELLINK payload, None for any other message.
+        """
+        if message_type not in (cls.RTM_NEWLINK, cls.RTM_DELLINK):
+            return None
+
+        _, _, index, flags, _ = cls._IFINFOMSG.unpack_from(payload)
+        name = cls._attributes(payload, cls._IFINFOMSG.size).get(cls.IFLA_IFNAME)
+
+        return LinkEvent(index, bytes(name).rstrip(b'\0').decode() if name else str(index),
+                         bool(flags & cls.IFF_UP), bool(flags & cls.IFF_LOWER_UP),
+                         message_type == cls.RTM_DELLINK)
+
+    @classmethod
+    def parse_route(cls, message_type: int, payload: memoryview | bytes) -> RouteEvent | None:
+        """
+        Decode an IPv4 RTM_NEWROUTE / RTM_DELROUTE payload, None for any other message.
+        """
+        if message_type not in (cls.RTM_NEWROUTE, cls.RTM_DELROUTE):
+            return None
+
+        family, dst_len, _, _, table, _, _, _, _ = cls._RTMSG.unpack_from(payload)
+
+        if family != socket.AF_INET:
+            return None
+
+        attributes = cls._attributes(payload, cls._RTMSG.size)
+        destination = ipaddress.IPv4Address(bytes(attributes[cls.RTA_DST])) if cls.RTA_DST in attributes else '0.0.0.0'
+
+        return RouteEvent(f'{destination}/{dst_len}',
+                          struct.unpack('=I', attributes[cls.RTA_TABLE])[0] if cls.RTA_TABLE in attributes else table,
+                          struct.unpack('=I', attributes[cls.RTA_PRIORITY])[0] if cls.RTA_PRIORITY in attributes else 0,
+                          str(ipaddress.IPv4Address(bytes(attributes[cls.RTA_GATEWAY]))) if cls.RTA_GATEWAY in attributes else None,
+                          struct.unpack('=I', attributes[cls.RTA_OIF])[0] if cls.RTA_OIF in attributes else 0,
+                          message_type == cls.RTM_DELROUTE)
+
+    def _transact(self, request: bytes) -> list[tuple[int, memoryview]]:
+        """
+        Send a request and collect the replies until NLMSG_DONE or the acknowledgement.
+        """
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_ROUTE)
+            sock.bind((0, 0))
+        except OSError as e:
+            raise RtnetlinkError(f"unable to open rtnetlink socket: {e}", e.errno or 0)
+
+        messages = []
+
+        with sock:
+            sock.send(request)
+
+            while True:
+                for message_type, payload in self.iter_messages(sock.recv(self.RECV_BUFFER_SIZE)):
+                    if message_type == self.NLMSG_DONE:
+                        return messages
+
+                    if message_type == self.NLMSG_ERROR:
+                        error_code = self._error_code(payload)
+
+                        if error_code:
+                            raise RtnetlinkError(f"request rejected: {os.strerror(error_code)}", error_code)
+
+                        return messages
+
+                    messages.append((message_type, payload))
@@ -96,7 +96,8 @@ class RunCommand:
         with open(RunCommand.log_cmd, "a") as log_file:
             log_file.write(log_entry + "\n")
     
-    def run(self, command: list[str], suppress_error: bool = False, shell: bool = False, sudo: bool = True) -> RunResult:
+    def run(self, command: list[str], suppress_error: bool = False, shell: bool = False, sudo: bool = True,
+            stdin: str | None = None) -> RunResult:
         """
         Run a command in the Linux environment and log the result.
 
@@ -105,6 +106,8 @@ class RunCommand:
             suppress_error (bool, optional): If True, suppress logging of errors. Defaults to False.
             shell (bool, optional): If True, execute the command using a shell. Defaults to False.
             sudo (bool, optional): If True, prepend 'sudo' to the command. Defaults to True.
+            stdin (str | None, optional): Text written to the command's standard input, used to feed
+                batch documents (e.g. `nft -f -`, `iptables-restore`) in a single process. Defaults to None.
 
         Returns:
             RunResult: A named tuple containing stdout, stderr, exit_code, and the command.
@@ -115,7 +118,8 @@ class RunCommand:
             if sudo:
                 command = ['sudo'] + command
                             
-            process = subprocess.run(command, shell=shell, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            process = subprocess.run(command, shell=shell, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                     input=stdin.encode("utf-8") if stdin is not None else None)
 
             exit_code = process.returncode
             stdout = process.stdout.decode("utf-8")
@@ -0,0 +1,220 @@
+import fcntl
+import ipaddress
+import os
+import socket
+import struct
+from abc import ABC, abstractmethod
+
+from routershell.lib.common.types import InterfaceName
+
+
+class TrackProbeError(Exception):
+    """Raised when a reachability probe socket can not be opened."""
+    def __init__(self, message: str, error_code: int = 0):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'TrackProbeError: {self.message}'
+
+
+class TrackProbe(ABC):
+    """
+    A lightweight reachability probe of a target: one small request per interval on a
+    non-blocking socket, the replies are read when the socket becomes readable.
+    """
+
+    def __init__(self, target: str, interface_name: InterfaceName | None = None):
+        self.target = str(ipaddress.IPv4Address(target))
+        self.interface_name = interface_name
+        self.sequence = 0
+        self.socket: socket.socket | None = None
+
+    def fileno(self) -> int:
+        return self.socket.fileno()
+
+    def send(self) -> None:
+        """
+        Send one probe, errors (e.g. no route while the link is down) count as a missed reply.
+        """
+        self.sequence = (self.sequence + 1) & 0xffff
+
+        try:
+            self._send()
+        except OSError:
+            pass
+
+    def receive(self) -> bool:
+        """
+        Read the pending replies.
+
+        Returns:
+            bool: True if a reply of the target was received.
+        """
+        replied = False
+
+        while True:
+            try:
+                data = self.socket.recv(2048)
+            except OSError:
+                return replied
+
+            replied = self._is_reply(data) or replied
+
+    def close(self) -> None:
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+
+    @abstractmethod
+    def _send(self) -> None:
+        """
+        Send one probe request to the target.
+        """
+
+    @abstractmethod
+    def _is_reply(self, data: bytes) -> bool:
+        """
+        Returns:
+            bool: True if the datagram is a reply of the target to one of our probes.
+        """
+
+
+class IcmpProbe(TrackProbe):
+    """
+    ICMP echo probe, optionally bound to a source interface.
+
+    A raw socket is used when permitted, otherwise an unprivileged ICMP datagram ("ping") socket
+    (net.ipv4.ping_group_range), the kernel then sets the identifier and strips the IP header.
+    """
+
+    ICMP_ECHO_REPLY = 0
+    ICMP_ECHO_REQUEST = 8
+
+    _ICMP_HEADER = struct.Struct('!BBHHH')
+
+    def __init__(self, target: str, interface_name: InterfaceName | None = None):
+        super().__init__(target, interface_name)
+        self.identifier = (os.getpid() ^ id(self)) & 0xffff
+
+        try:
+            try:
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            except PermissionError:
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+
+            self.socket.setblocking(False)
+
+            if interface_name:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, interface_name.encode())
+
+        except OSError as e:
+            self.close()
+            raise TrackProbeError(f"unable to open ICMP probe socket: {e}", e.errno or 0)
+
+    @classmethod
+    def build_echo_request(cls, identifier: int, sequence: int, payload: bytes = b'routershell') -> bytes:
+        header = cls._ICMP_HEADER.pack(cls.ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+        return cls._ICMP_HEADER.pack(cls.ICMP_ECHO_REQUEST, 0, cls.checksum(header + payload),
+                                     identifier, sequence) + payload
+
+    @staticmethod
+    def checksum(data: bytes) -> int:
+        if len(data) % 2:
+            data += b'\0'
+
+        total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+        total = (total >> 16) + (total & 0xffff)
+        total += total >> 16
+        return ~total & 0xffff
+
+    def _send(self) -> None:
+        self.socket.sendto(self.build_echo_request(self.identifier, self.sequence), (self.target, 0))
+
+    def receive(self) -> bool:
+        if self.socket.type == socket.SOCK_RAW:
+            return super().receive()
+
+        replied = False
+
+        while True:
+            try:
+                data, (address, _) = self.socket.recvfrom(2048)
+            except OSError:
+                return replied
+
+            replied = (address == self.target and len(data) >= self._ICMP_HEADER.size
+                       and data[0] == self.ICMP_ECHO_REPLY) or replied
+
+    def _is_reply(self, data: bytes) -> bool:
+        header_length = (data[0] & 0x0f) * 4
+
+        if len(data) < header_length + self._ICMP_HEADER.size or socket.inet_ntoa(data[12:16]) != self.target:
+            return False
+
+        icmp_type, _, _, identifier, _ = self._ICMP_HEADER.unpack_from(data, header_length)
+        return icmp_type == self.ICMP_ECHO_REPLY and identifier == self.identifier
+
+
+class ArpProbe(TrackProbe):
+    """
+    ARP request probe of a next hop on the link, over a packet socket of the interface.
+    """
+
+    ETH_P_ARP = 0x0806
+    ETH_P_IP = 0x0800
+    ARPHRD_ETHER = 1
+    ARPOP_REQUEST = 1
+    ARPOP_REPLY = 2
+
+    SIOCGIFADDR = 0x8915
+    SIOCGIFHWADDR = 0x8927
+
+    BROADCAST = b'\xff' * 6
+
+    _ARP = struct.Struct('!HHBBH6s4s6s4s')
+
+    def __init__(self, target: str, interface_name: InterfaceName):
+        super().__init__(target, interface_name)
+
+        try:
+            self.socket = socket.socket(socket.AF_PACKET, socket.SOCK_DGRAM, socket.htons(self.ETH_P_ARP))
+            self.socket.bind((interface_name, self.ETH_P_ARP))
+            self.socket.setblocking(False)
+        except OSError as e:
+            self.close()
+            raise TrackProbeError(f"unable to open ARP probe socket on {interface_name}: {e}", e.errno or 0)
+
+    @classmethod
+    def build_request(cls, sender_mac: bytes, sender_address: str, target: str) -> bytes:
+        return cls._ARP.pack(cls.ARPHRD_ETHER, cls.ETH_P_IP, 6, 4,
+                             cls.ARPOP_REQUEST, sender_mac, socket.inet_aton(sender_address),
+                             b'\0' * 6, socket.inet_aton(target))
+
+    def _send(self) -> None:
+        self.socket.sendto(self.build_request(self._interface_mac(), self._interface_address(), self.target),
+                           (self.interface_name, self.ETH_P_ARP, 0, 0, self.BROADCAST))
+
+    def _is_reply(self, data: bytes) -> bool:
+        if len(data) < self._ARP.size:
+            return False
+
+        _, _, _, _, operation, _, sender_address, _, _ = self._ARP.unpack_from(data)
+        return operation == self.ARPOP_REPLY and socket.inet_ntoa(sender_address) == self.target
+
+    def _interface_mac(self) -> bytes:
+        request = struct.pack('256s', self.interface_name.encode()[:15])
+        return fcntl.ioctl(self.socket.fileno(), self.SIOCGIFHWADDR, request)[18:24]
+
+    def _interface_address(self) -> str:
+        """
+        The IPv4 address of the interface, 0.0.0.0 (an ARP probe) when it has none.
+        """
+        request = struct.pack('256s', self.interface_name.encode()[:15])
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            try:
+                return socket.inet_ntoa(fcntl.ioctl(sock.fileno(), self.SIOCGIFADDR, request)[20:24])
+            except OSError:
+                return '0.0.0.0'
@@ -2,10 +2,12 @@ import logging
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
-from routershell.lib.common.types import BridgeName, InetAddressText, PredicateResult, StatusResult
+from routershell.lib.common.types import BridgeName, InetAddressText, MacAddressText, PredicateResult, StatusResult
 from routershell.lib.network_manager.common.phy import State
 from routershell.lib.network_manager.network_interfaces.bridge.bridge_protocols import STP_STATE, BridgeProtocol
 from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.mac_address_table import StaticMacAddress
+from routershell.lib.network_manager.network_operations.vlan import Vlan
 
 
 class BridgeInterface:
@@ -148,6 +150,193 @@ class BridgeInterface:
         
         return STATUS_OK
     
+    def set_vlan_filtering(self, enable: bool) -> StatusResult:
+        """
+        Enable or disable VLAN filtering (VLAN-aware bridge) for the bridge.
+
+        When enabled, the access and trunk VLANs of the bridge ports are programmed
+        as bridge VLAN entries instead of per-VLAN subinterfaces.
+
+        Args:
+            enable (bool): True to enable VLAN filtering, False to disable it.
+
+        Returns:
+            StatusResult: STATUS_OK if VLAN filtering was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set vlan filtering to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, vlan_filtering=enable):
+            self.log.error(f'set_vlan_filtering() -> Failed to set vlan filtering {enable} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        if enable and Vlan().apply_bridge_vlans(self._bridge_name):
+            self.log.error(f'set_vlan_filtering() -> Failed to program port VLANs of bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        self.log.debug(f'set_vlan_filtering() -> vlan filtering {enable} is set for bridge {self._bridge_name}')
+        return STATUS_OK
+
+    def set_mac_aging_time(self, seconds: int) -> StatusResult:
+        """
+        Set the MAC address table aging time of the bridge.
+
+        Args:
+            seconds (int): Seconds a learned address is kept without traffic from it.
+
+        Returns:
+            StatusResult: STATUS_OK if the aging time was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set mac aging time to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, aging_time=seconds):
+            self.log.error(f'set_mac_aging_time() -> Failed to set aging time {seconds} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def set_mac_learning(self, enable: bool) -> StatusResult:
+        """
+        Enable or disable MAC learning on the ports of the bridge.
+
+        Args:
+            enable (bool): True to learn source MAC addresses.
+
+        Returns:
+            StatusResult: STATUS_OK if MAC learning was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set mac learning to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, mac_learning=enable):
+            self.log.error(f'set_mac_learning() -> Failed to set mac learning {enable} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def add_static_mac_address(self, mac_address: MacAddressText, interface_name: str, vlan_id: int | None = None) -> StatusResult:
+        """
+        Add a static MAC address table entry to the bridge.
+
+        Args:
+            mac_address (MacAddressText): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            interface_name (str): The bridge port the address is forwarded to.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            StatusResult: STATUS_OK if the entry was successfully added, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to add static mac address to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        return Bridge().add_static_mac_address(self._bridge_name, StaticMacAddress(mac_address, interface_name, vlan_id))
+
+    def del_static_mac_address(self, mac_address: MacAddressText, vlan_id: int | None = None) -> StatusResult:
+        """
+        Delete a static MAC address table entry from the bridge.
+
+        Args:
+            mac_address (MacAddressText): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            StatusResult: STATUS_OK if the entry was successfully deleted, STATUS_NOK otherwise.
+        """
+        return Bridge().del_static_mac_address(self._bridge_name, mac_address, vlan_id)
+
+    def set_multicast_snooping(self, enable: bool) -> StatusResult:
+        """
+        Enable or disable IGMP/MLD snooping on the bridge.
+
+        Args:
+            enable (bool): True to forward multicast groups only to the ports that joined them.
+
+        Returns:
+            StatusResult: STATUS_OK if multicast snooping was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set multicast snooping to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, multicast_snooping=enable):
+            self.log.error(f'set_multicast_snooping() -> Failed to set multicast snooping {enable} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def set_multicast_querier(self, enable: bool) -> StatusResult:
+        """
+        Enable or disable the IGMP/MLD querier of the bridge.
+
+        Args:
+            enable (bool): True to send general queries when no multicast router is on the segment.
+
+        Returns:
+            StatusResult: STATUS_OK if the querier was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set multicast querier to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, multicast_querier=enable):
+            self.log.error(f'set_multicast_querier() -> Failed to set multicast querier {enable} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def add_multicast_router_port(self, interface_name: str) -> StatusResult:
+        """
+        Make a bridge port a permanent multicast router port.
+
+        Args:
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if the router port was successfully added, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to add multicast router port to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        return Bridge().add_multicast_router_port(self._bridge_name, interface_name)
+
+    def del_multicast_router_port(self, interface_name: str) -> StatusResult:
+        """
+        Return a multicast router port of the bridge to router port learning.
+
+        Args:
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if the router port was successfully deleted, STATUS_NOK otherwise.
+        """
+        return Bridge().del_multicast_router_port(self._bridge_name, interface_name)
+
+    def set_netfilter_bypass(self, enable: bool) -> StatusResult:
+        """
+        Bypass br_netfilter (iptables, ip6tables and arptables) for the frames bridged by the bridge.
+
+        Args:
+            enable (bool): True to bypass netfilter.
+
+        Returns:
+            StatusResult: STATUS_OK if the netfilter bypass was successfully set, STATUS_NOK otherwise.
+        """
+        if not self.does_bridge_exist():
+            self.log.error(f'Unable to set netfilter bypass to bridge: {self._bridge_name} does not exists')
+            return STATUS_NOK
+
+        if Bridge().update_bridge(bridge_name=self._bridge_name, netfilter_bypass=enable):
+            self.log.error(f'set_netfilter_bypass() -> Failed to set netfilter bypass {enable} to bridge {self._bridge_name}')
+            return STATUS_NOK
+
+        return STATUS_OK
+
     def set_bridge_protocol(self, protocol: BridgeProtocol) -> StatusResult:
         """
         Set the bridge protocol for the bridge.
@@ -2,12 +2,25 @@ import logging
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
-from routershell.lib.common.types import InetAddressText, InterfaceName, MacAddressText, NatPoolName, StatusResult
+from routershell.lib.common.types import (
+    AclName,
+    InetAddressText,
+    InterfaceName,
+    MacAddressText,
+    NatPoolName,
+    StatusResult,
+)
 from routershell.lib.network_manager.common.interface import InterfaceType
-from routershell.lib.network_manager.common.phy import Duplex, Speed, State
+from routershell.lib.network_manager.common.phy import CoalesceProfile, Duplex, Offload, Speed, State
 from routershell.lib.network_manager.network_interfaces.bridge.bridge_group_interface_abc import BridgeGroup
+from routershell.lib.network_manager.network_interfaces.port_channel.port_channel_group_interface_abc import (
+    PortChannelGroup,
+)
 from routershell.lib.network_manager.network_interfaces.vlan.vlan_switchport_interface_abc import VlanSwitchport
+from routershell.lib.network_manager.network_operations.access_control_list import AccessControlList
+from routershell.lib.network_manager.network_operations.acl_ruleset import AclDirection
 from routershell.lib.network_manager.network_operations.arp import Encapsulate
+from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinity
 from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_clinet_interface_abc import DHCPInterfaceClient
 from routershell.lib.network_manager.network_operations.interface import Interface
 from routershell.lib.network_manager.network_operations.nat import NATDirection
@@ -17,10 +30,11 @@ class EthernetInterfaceError(Exception):
     def __init__(self, message):
         super().__init__(message)
 
-class EthernetInterface(BridgeGroup, DHCPInterfaceClient, VlanSwitchport):
+class EthernetInterface(BridgeGroup, PortChannelGroup, DHCPInterfaceClient, VlanSwitchport):
 
     def __init__(self, ethernet_name: InterfaceName):
         BridgeGroup.__init__(self, ethernet_name)
+        PortChannelGroup.__init__(self, ethernet_name)
         DHCPInterfaceClient.__init__(self, ethernet_name)
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().ETHERNET_INTERFACE)        
@@ -140,6 +154,60 @@ class EthernetInterface(BridgeGroup, DHCPInterfaceClient, VlanSwitchport):
         """
         return Interface().update_interface_duplex(self._interface_name, duplex)
     
+    def set_offload(self, offload: Offload, negate: bool = False) -> StatusResult:
+        """
+        Enable or disable an offload (GRO, GSO, TSO, LRO) on the interface.
+
+        Args:
+            offload (Offload): The offload.
+            negate (bool): If True, the offload is disabled.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return Interface().update_interface_offload(self._interface_name, offload, not negate)
+
+    def set_ring_size(self, rx: str | None = None, tx: str | None = None, negate: bool = False) -> StatusResult:
+        """
+        Set the RX/TX ring buffer sizes of the interface.
+
+        Args:
+            rx (str | None): Descriptors or `max`, None to leave unchanged.
+            tx (str | None): Descriptors or `max`, None to leave unchanged.
+            negate (bool): Remove the ring sizes from the configuration.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return Interface().update_interface_ring_size(self._interface_name, rx, tx, negate)
+
+    def set_coalesce(self, profile: CoalesceProfile | None) -> StatusResult:
+        """
+        Apply an interrupt coalescing profile to the interface.
+
+        Args:
+            profile (CoalesceProfile | None): The profile, None removes it from the configuration.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return Interface().update_interface_coalesce(self._interface_name, profile)
+
+    def set_cpu_affinity(self, cpus: list[int] | None = None, rfs_flow_entries: int | None = None,
+                         negate: bool = False) -> StatusResult:
+        """
+        Spread the interrupts and queues (IRQ affinity, RPS/RFS, XPS) of the interface across CPUs.
+
+        Args:
+            cpus (list[int] | None): The CPUs to use, None for every online CPU (auto).
+            rfs_flow_entries (int | None): The RFS flow table size, None for the default.
+            negate (bool): Return the interface to the kernel defaults.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return CpuAffinity().update_interface_cpu_affinity(self._interface_name, cpus, rfs_flow_entries, negate)
+
     def add_inet_address(self, inet_address, secondary_address:bool=False, negate:bool=False) -> StatusResult:
         """
         Add or modify an IP address on the network interface.
@@ -173,6 +241,23 @@ class EthernetInterface(BridgeGroup, DHCPInterfaceClient, VlanSwitchport):
         return InterfaceType.ETHERNET
         
     
+    def set_access_group(self, acl_name: AclName, direction: AclDirection, negate: bool = False) -> StatusResult:
+        """
+        Apply or remove an access-list on the interface.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            direction (AclDirection): The direction of the access-group (in or out).
+            negate (bool): If True, remove the access-group; otherwise, apply it.
+
+        Returns:
+            StatusResult: STATUS_OK if the access-group was successfully updated, STATUS_NOK otherwise.
+        """
+        if AccessControlList().set_interface_access_group(self._interface_name, acl_name, direction, negate):
+            self.log.error(f'Unable to set access-group {acl_name} {direction.value} Negate: {negate}')
+            return STATUS_NOK
+        return STATUS_OK
+
     def set_nat_domain_direction(self, nat_pool_name: NatPoolName, nat_direction: NATDirection, negate: bool = False) -> StatusResult:
         """
         Set the NAT domain direction on the specified NAT pool.
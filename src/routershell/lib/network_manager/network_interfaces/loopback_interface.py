@@ -48,7 +48,7 @@ class LoopbackInterface(NetworkInterface):
     def destroy(self) -> StatusResult:
         """
         Destroys the loopback interface by removing its database entry and 
-        deleting the OS-level dummy interface.
+        deleting the OS-level dummy interface with its addresses.
 
         Returns:
             StatusResult: STATUS_OK if the loopback interface was successfully destroyed,
@@ -58,7 +58,7 @@ class LoopbackInterface(NetworkInterface):
             self.log.error(f'Failed to delete interface {self.interface_name} from database')
             return STATUS_NOK
         
-        if Interface().destroy_os_dummy_interface(self.interface_name):
+        if Interface().destroy_os_loopback(self.interface_name):
             self.log.error(f'Failed to delete interface {self.interface_name} from OS')
             return STATUS_NOK
         
@@ -84,6 +84,7 @@ class LoopbackInterface(NetworkInterface):
 
             if Interface().set_inet_address_loopback(self.interface_name, next_available_127):
                 self.log.error(f'Unable to auto-assign: {next_available_127} to loopback: {self.get_interface_name()}')
+                Interface().release_loopback_address(next_available_127)
                 return STATUS_NOK
 
             self.log.debug(f'Auto Assign: {next_available_127} to loopback: {self.get_interface_name()} to OS')
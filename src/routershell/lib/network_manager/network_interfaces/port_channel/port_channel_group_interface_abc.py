@@ -0,0 +1,49 @@
+import logging
+from abc import ABC
+
+from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.network_manager.network_operations.port_channel import PortChannel
+
+
+class PortChannelGroup(ABC):
+    """
+    Abstract base class representing the port-channel membership of a network interface.
+
+    This class provides methods to add and remove a network interface to and from a port-channel.
+    """
+
+    def __init__(self, interface_name: InterfaceName):
+        """
+        Initializes the PortChannelGroup with a network interface name.
+
+        Args:
+            interface_name (str): The name of the network interface.
+        """
+        self._interface_name = interface_name
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def set_port_channel_group(self, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Adds the network interface to the specified port-channel.
+
+        Args:
+            port_channel_name (str): The name of the port-channel to add the interface to.
+
+        Returns:
+            StatusResult: STATUS_OK if the interface was successfully added to the port-channel,
+                  STATUS_NOK otherwise.
+        """
+        return PortChannel().add_interface_to_port_channel_group(self._interface_name, port_channel_name)
+
+    def del_port_channel_group(self, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Removes the network interface from the specified port-channel.
+
+        Args:
+            port_channel_name (str): The name of the port-channel to remove the interface from.
+
+        Returns:
+            StatusResult: STATUS_OK if the interface was successfully removed from the port-channel,
+                  STATUS_NOK otherwise.
+        """
+        return PortChannel().del_interface_from_port_channel_group(self._interface_name, port_channel_name)
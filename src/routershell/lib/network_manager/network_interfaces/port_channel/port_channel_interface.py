@@ -0,0 +1,60 @@
+import logging
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.network_manager.common.phy import State
+from routershell.lib.network_manager.network_interfaces.bridge.bridge_group_interface_abc import BridgeGroup
+from routershell.lib.network_manager.network_operations.interface import Interface
+from routershell.lib.network_manager.network_operations.port_channel import (
+    BondMode,
+    LacpRate,
+    PortChannel,
+    XmitHashPolicy,
+)
+
+
+class PortChannelInterfaceError(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+class PortChannelInterface(BridgeGroup):
+    """
+    A port-channel (`port-channel<N>`) interface, created when it is first configured.
+    """
+
+    def __init__(self, port_channel_name: InterfaceName):
+        """
+        Raises:
+            PortChannelInterfaceError: If the port-channel can not be created.
+        """
+        BridgeGroup.__init__(self, port_channel_name)
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().PORT_CHANNEL_INTERFACE)
+        self._interface_name = port_channel_name
+
+        if PortChannel().add_port_channel(port_channel_name):
+            raise PortChannelInterfaceError(f"Unable to create port-channel {port_channel_name}")
+
+    def get_interface_name(self) -> InterfaceName:
+        return self._interface_name
+
+    def set_mode(self, mode: BondMode) -> StatusResult:
+        return PortChannel().update_port_channel(self._interface_name, mode=mode)
+
+    def set_xmit_hash_policy(self, xmit_hash_policy: XmitHashPolicy) -> StatusResult:
+        return PortChannel().update_port_channel(self._interface_name, xmit_hash_policy=xmit_hash_policy)
+
+    def set_lacp_rate(self, lacp_rate: LacpRate) -> StatusResult:
+        return PortChannel().update_port_channel(self._interface_name, lacp_rate=lacp_rate)
+
+    def set_description(self, description: str) -> StatusResult:
+        return Interface().update_interface_description(self._interface_name, description)
+
+    def set_shutdown_status(self, state: State) -> StatusResult:
+        return Interface().update_shutdown(self._interface_name, state)
+
+    def destroy(self) -> StatusResult:
+        """
+        Delete the port-channel, it must not have members.
+        """
+        return PortChannel().del_port_channel(self._interface_name)
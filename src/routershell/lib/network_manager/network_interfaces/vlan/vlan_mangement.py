@@ -1,6 +1,6 @@
 import logging
 
-from routershell.lib.common.constants import STATUS_OK
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import StatusResult, VlanName
 from routershell.lib.network_manager.network_operations.vlan import Vlan
@@ -83,3 +83,43 @@ class VlanMangement:
     def destroy_vlan(self) -> StatusResult:
         return STATUS_OK
 
+class VlanRangeMangement:
+
+    def __init__(self, vlan_ids: list[int]):
+        """
+        Initialize the VlanRangeMangement with a range of VLAN IDs (`vlan 100-199,300`).
+
+        The VLANs are expected to be added already, see `Vlan.add_vlan_ids()`.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs to be managed.
+        """
+        self._vlan_ids = vlan_ids
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().VLAN_CONFIG_CMD)
+        self.log.debug(f'VlanRangeMangement() Started - VlanIDs: {len(vlan_ids)}')
+
+    def get_vlan_ids(self) -> list[int]:
+        return self._vlan_ids
+
+    def set_name(self, vlan_name: VlanName) -> StatusResult:
+        """
+        A VLAN name is unique, a range of VLANs keeps its `Vlan<id>` names.
+
+        Returns:
+            StatusResult: Always STATUS_NOK.
+        """
+        self.log.error(f'Unable to set name {vlan_name} on a range of VLANs')
+        return STATUS_NOK
+
+    def set_description(self, description: list[str] | None = None) -> StatusResult:
+        """
+        Set the description of every VLAN of the range in one database transaction.
+
+        Args:
+            description (list[str] | None): The description, empty if None.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return Vlan().update_vlans_description(self._vlan_ids, " ".join(description or []))
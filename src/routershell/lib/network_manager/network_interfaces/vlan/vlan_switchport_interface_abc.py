@@ -3,6 +3,7 @@ from abc import ABC
 
 from routershell.lib.common.constants import STATUS_OK
 from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.network_manager.network_operations.bridge_vlan import SwitchportMode
 from routershell.lib.network_manager.network_operations.vlan import Vlan
 
 
@@ -49,3 +50,29 @@ class VlanSwitchport(ABC):
         """
         print('Not Implemented yet')
         return STATUS_OK
+
+    def set_switchport_mode(self, mode: SwitchportMode) -> StatusResult:
+        """
+        Sets the switchport mode (access | trunk) of the interface.
+
+        Args:
+            mode (SwitchportMode): The switchport mode.
+
+        Returns:
+            StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
+        """
+        return Vlan().set_switchport_mode(self._interface_name, mode)
+
+    def set_trunk_allowed_vlans(self, vlan_ids: list[int], add: bool = False, remove: bool = False) -> StatusResult:
+        """
+        Sets, extends or reduces the VLANs allowed on the trunk.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs, an empty list allows every VLAN.
+            add (bool): Add the VLANs to the allowed list.
+            remove (bool): Remove the VLANs from the allowed list.
+
+        Returns:
+            StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
+        """
+        return Vlan().set_trunk_allowed_vlans(self._interface_name, vlan_ids, add, remove)
@@ -0,0 +1,297 @@
+import ipaddress
+import logging
+import shutil
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import AclName, InterfaceName, StatusResult
+from routershell.lib.db.acl_db import AccessControlListDB
+from routershell.lib.network_manager.network_operations.acl_ruleset import (
+    AclAction,
+    AclBinding,
+    AclDirection,
+    AclProtocol,
+    AclRule,
+    AclRuleset,
+)
+from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
+
+
+class AccessControlListError(Exception):
+    """Raised when an access-list rule can not be parsed."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+    def __str__(self):
+        return f'AccessControlListError: {self.message}'
+
+
+class AccessControlList(NetworkManager):
+    """
+    Manage IPv4 access-lists (`ip access-list`) and their interface bindings (`ip access-group`).
+
+    Every change is stored in the DB first, then all bound access-lists are compiled by
+    `AclRuleset` and committed with a single `nft -f -`.
+    """
+
+    SEQUENCE_STEP = 10
+
+    def __init__(self):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ACL)
+
+    @staticmethod
+    def parse_rule(sequence: int, args: list[str]) -> AclRule:
+        """
+        Parse an access-list rule.
+
+        Syntax:
+            permit|deny <protocol> <source> [eq <port>] <destination> [eq <port>]
+
+        where <protocol> is ip | tcp | udp | icmp and <source>/<destination> is
+        `any`, `host <A.B.C.D>` or `<A.B.C.D/len>`.
+
+        Args:
+            sequence (int): The sequence number assigned to the rule.
+            args (list[str]): The rule tokens.
+
+        Returns:
+            AclRule: The parsed rule.
+
+        Raises:
+            AccessControlListError: If the rule is malformed.
+        """
+        tokens = list(args)
+
+        try:
+            action = AclAction(tokens.pop(0))
+            protocol = AclProtocol(tokens.pop(0))
+        except (IndexError, ValueError):
+            raise AccessControlListError(f"expected 'permit|deny ip|tcp|udp|icmp ...', got: {' '.join(args)}")
+
+        source = AccessControlList._parse_address(tokens)
+        source_port = AccessControlList._parse_port(tokens, protocol)
+        destination = AccessControlList._parse_address(tokens)
+        destination_port = AccessControlList._parse_port(tokens, protocol)
+
+        if tokens:
+            raise AccessControlListError(f"unexpected arguments: {' '.join(tokens)}")
+
+        return AclRule(sequence, action, protocol, source, source_port, destination, destination_port)
+
+    def update_acl(self, acl_name: AclName, negate: bool = False) -> StatusResult:
+        """
+        Create or delete an access-list. Deleting removes its rules and interface bindings.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            negate (bool, optional): True to delete the access-list. Defaults to False.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"update_acl() -> {acl_name} -> negate: {negate}")
+
+        if not negate:
+            return AccessControlListDB().add_acl(acl_name)
+
+        if AccessControlListDB().delete_acl(acl_name):
+            return STATUS_NOK
+
+        return self.apply_acl_ruleset()
+
+    def update_acl_description(self, acl_name: AclName, description: str | None) -> StatusResult:
+        """
+        Set or remove (description=None) the description of an access-list.
+        """
+        return AccessControlListDB().update_acl_description(acl_name, description)
+
+    def add_acl_rule(self, acl_name: AclName, args: list[str]) -> StatusResult:
+        """
+        Append a rule to an access-list and re-apply the ruleset.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            args (list[str]): The rule tokens, see `parse_rule()`.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was added and applied, STATUS_NOK otherwise.
+        """
+        rules = self.get_acls().get(acl_name, [])
+        sequence = (max((rule.sequence for rule in rules), default=0) + self.SEQUENCE_STEP)
+
+        try:
+            rule = self.parse_rule(sequence, args)
+        except AccessControlListError as e:
+            self.log.error(f"Invalid access-list {acl_name} rule: {e}")
+            return STATUS_NOK
+
+        if any(existing._replace(sequence=sequence) == rule for existing in rules):
+            self.log.debug(f"Rule '{rule.cli()}' already in access-list {acl_name}")
+            return STATUS_OK
+
+        if AccessControlListDB().add_acl_rule(acl_name, rule.sequence, rule.action.value, rule.protocol.value,
+                                              rule.source, rule.source_port,
+                                              rule.destination, rule.destination_port):
+            return STATUS_NOK
+
+        if self._is_acl_bound(acl_name) and self.apply_acl_ruleset():
+            AccessControlListDB().delete_acl_rule(acl_name, rule.sequence)
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def delete_acl_rule(self, acl_name: AclName, args: list[str]) -> StatusResult:
+        """
+        Remove the rule matching `args` from an access-list and re-apply the ruleset.
+
+        Args:
+            acl_name (str): The name of the access-list.
+            args (list[str]): The rule tokens, see `parse_rule()`.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was removed, STATUS_NOK otherwise.
+        """
+        try:
+            rule = self.parse_rule(0, args)
+        except AccessControlListError as e:
+            self.log.error(f"Invalid access-list {acl_name} rule: {e}")
+            return STATUS_NOK
+
+        match = [existing for existing in self.get_acls().get(acl_name, []) if existing._replace(sequence=0) == rule]
+
+        if not match:
+            self.log.error(f"Rule '{rule.cli()}' not found in access-list {acl_name}")
+            return STATUS_NOK
+
+        if AccessControlListDB().delete_acl_rule(acl_name, match[0].sequence):
+            return STATUS_NOK
+
+        return self.apply_acl_ruleset() if self._is_acl_bound(acl_name) else STATUS_OK
+
+    def set_interface_access_group(self, interface_name: InterfaceName, acl_name: AclName,
+                                   direction: AclDirection, negate: bool = False) -> StatusResult:
+        """
+        Apply or remove an access-list on an interface direction.
+
+        Args:
+            interface_name (str): The name of the interface.
+            acl_name (str): The name of the access-list.
+            direction (AclDirection): in | out.
+            negate (bool, optional): True to remove the access-group. Defaults to False.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"set_interface_access_group() -> {interface_name} -> {acl_name} {direction.value} -> negate: {negate}")
+
+        acl_db = AccessControlListDB()
+
+        if negate:
+            if acl_db.delete_interface_access_group(acl_name, interface_name, direction.value):
+                return STATUS_NOK
+            return self.apply_acl_ruleset()
+
+        if not acl_db.acl_exists(acl_name):
+            self.log.error(f"Access-list {acl_name} does not exist")
+            return STATUS_NOK
+
+        if acl_db.add_interface_access_group(acl_name, interface_name, direction.value):
+            return STATUS_NOK
+
+        if self.apply_acl_ruleset():
+            acl_db.delete_interface_access_group(acl_name, interface_name, direction.value)
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_acls(self) -> dict[AclName, list[AclRule]]:
+        """
+        Read every access-list and its rules from the DB.
+
+        Returns:
+            dict[AclName, list[AclRule]]: Rules of each access-list ordered by sequence.
+        """
+        acls: dict[AclName, list[AclRule]] = {}
+
+        for row in AccessControlListDB().get_acl_rules():
+            rules = acls.setdefault(row['PolicyName'], [])
+
+            if row['Sequence'] is None:
+                continue
+
+            rules.append(AclRule.from_db_row(row))
+
+        return acls
+
+    def get_access_groups(self) -> list[AclBinding]:
+        """
+        Read every access-list interface binding from the DB.
+        """
+        return [AclBinding(row['PolicyName'], row['InterfaceName'], AclDirection(row['Direction']))
+                for row in AccessControlListDB().get_interface_access_groups()]
+
+    def apply_acl_ruleset(self) -> StatusResult:
+        """
+        Compile every bound access-list and commit it with a single `nft -f -`.
+
+        Returns:
+            StatusResult: STATUS_OK if the ruleset was committed, STATUS_NOK otherwise.
+        """
+        if not shutil.which('nft'):
+            self.log.error("nftables (nft) is required for access-lists")
+            return STATUS_NOK
+
+        ruleset = AclRuleset.compile(self.get_acls(), self.get_access_groups())
+        self.log.debug(f"apply_acl_ruleset()\n{ruleset}")
+
+        result = self.run(['nft', '-f', '-'], stdin=ruleset)
+
+        if result.exit_code:
+            self.log.error(f"Failed to apply access-list ruleset: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def _is_acl_bound(self, acl_name: AclName) -> bool:
+        return any(binding.acl_name == acl_name for binding in self.get_access_groups())
+
+    @staticmethod
+    def _parse_address(tokens: list[str]) -> str | None:
+        if not tokens:
+            raise AccessControlListError("missing address, expected 'any', 'host <address>' or '<network/len>'")
+
+        token = tokens.pop(0)
+
+        if token == 'any':
+            return None
+
+        try:
+            if token == 'host':
+                return f'{ipaddress.IPv4Address(tokens.pop(0))}/32'
+            return str(ipaddress.IPv4Network(token, strict=False))
+
+        except (IndexError, ValueError):
+            raise AccessControlListError(f"invalid address: {token}")
+
+    @staticmethod
+    def _parse_port(tokens: list[str], protocol: AclProtocol) -> int | None:
+        if not tokens or tokens[0] != 'eq':
+            return None
+
+        if protocol not in (AclProtocol.TCP, AclProtocol.UDP):
+            raise AccessControlListError(f"port match requires tcp or udp, got: {protocol.value}")
+
+        tokens.pop(0)
+
+        try:
+            port = int(tokens.pop(0))
+        except (IndexError, ValueError):
+            raise AccessControlListError("expected a port number after 'eq'")
+
+        if not 0 < port < 65536:
+            raise AccessControlListError(f"invalid port: {port}")
+
+        return port
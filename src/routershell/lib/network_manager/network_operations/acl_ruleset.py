@@ -0,0 +1,262 @@
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.types import AclName, InetCidrText, InterfaceName
+
+
+class AclAction(Enum):
+    """
+    Enumeration of access-list rule actions.
+
+    - `PERMIT`: The packet continues to the next access-group, if any.
+    - `DENY`: The packet is dropped.
+    """
+    PERMIT = 'permit'
+    DENY = 'deny'
+
+
+class AclDirection(Enum):
+    """
+    Enumeration of access-group directions.
+
+    - `IN`: Applied to packets received on the interface.
+    - `OUT`: Applied to packets sent out of the interface.
+    """
+    IN = 'in'
+    OUT = 'out'
+
+
+class AclProtocol(Enum):
+    """
+    Enumeration of access-list rule protocols. `IP` matches any IPv4 protocol.
+    """
+    IP = 'ip'
+    TCP = 'tcp'
+    UDP = 'udp'
+    ICMP = 'icmp'
+
+
+class AclRule(NamedTuple):
+    """
+    A single access-list rule as stored in the `FirewallRules` table.
+
+    Attributes:
+        sequence (int): Evaluation order within the access-list, first match wins.
+        action (AclAction): permit | deny.
+        protocol (AclProtocol): ip | tcp | udp | icmp.
+        source (InetCidrText | None): Source network, None for any.
+        source_port (int | None): TCP/UDP source port, None for any.
+        destination (InetCidrText | None): Destination network, None for any.
+        destination_port (int | None): TCP/UDP destination port, None for any.
+    """
+    sequence: int
+    action: AclAction
+    protocol: AclProtocol
+    source: InetCidrText | None = None
+    source_port: int | None = None
+    destination: InetCidrText | None = None
+    destination_port: int | None = None
+
+    @staticmethod
+    def from_db_row(row: dict) -> 'AclRule':
+        """
+        Build a rule from a `RouterShellDB.select_acl_rules()` result row.
+        """
+        return AclRule(row['Sequence'], AclAction(row['Action']), AclProtocol(row['Protocol']),
+                       row['SourceIP'], row['SourcePort'], row['DestinationIP'], row['DestinationPort'])
+
+    def cli(self) -> str:
+        """
+        Render the rule as an access-list configuration command.
+
+        Returns:
+            str: e.g. `permit tcp any host 192.168.1.10 eq 22`
+        """
+        line = [self.action.value, self.protocol.value,
+                AclRule._cli_address(self.source), *AclRule._cli_port(self.source_port),
+                AclRule._cli_address(self.destination), *AclRule._cli_port(self.destination_port)]
+        return ' '.join(line)
+
+    @staticmethod
+    def _cli_address(address: InetCidrText | None) -> str:
+        if address is None:
+            return 'any'
+        if address.endswith('/32'):
+            return f'host {address[:-3]}'
+        return address
+
+    @staticmethod
+    def _cli_port(port: int | None) -> list[str]:
+        return [] if port is None else ['eq', str(port)]
+
+
+class AclBinding(NamedTuple):
+    """
+    An access-list applied to an interface direction (`ip access-group <name> in|out`).
+    """
+    acl_name: AclName
+    interface_name: InterfaceName
+    direction: AclDirection
+
+
+class AclRuleset:
+    """
+    Compile access-lists and their interface bindings into a single `nft -f` document.
+
+    Each bound access-list becomes one chain. Consecutive rules with the same action
+    are order independent, so rules of the same shape (the same fields matched) within
+    such a run are folded into one named set and matched with a single lookup. The base
+    chains dispatch to the access-list chains through `iifname`/`oifname` verdict maps,
+    so the per-packet cost does not grow with the number of rules or interfaces.
+    """
+
+    NFT_FAMILY = 'inet'
+    NFT_TABLE = 'routershell_acl'
+
+    _FIELDS = (
+        ('source', 'ip saddr', 'ipv4_addr'),
+        ('destination', 'ip daddr', 'ipv4_addr'),
+        ('protocol', 'meta l4proto', 'inet_proto'),
+        ('source_port', 'th sport', 'inet_service'),
+        ('destination_port', 'th dport', 'inet_service'),
+    )
+
+    @staticmethod
+    def compile(acls: dict[AclName, list[AclRule]], bindings: list[AclBinding]) -> str:
+        """
+        Compile the bound access-lists into an nftables ruleset document.
+
+        The RouterShell table is declared, deleted and re-created within the document,
+        which nftables commits as one transaction.
+
+        Args:
+            acls (dict[AclName, list[AclRule]]): Rules of each access-list.
+            bindings (list[AclBinding]): Access-list interface bindings.
+
+        Returns:
+            str: The nftables ruleset document.
+        """
+        chain_ids = {acl_name: f'acl_{index}' for index, acl_name in
+                     enumerate(sorted({binding.acl_name for binding in bindings}))}
+
+        lines = AclRuleset._table_reset()
+        lines.append(f'table {AclRuleset.NFT_FAMILY} {AclRuleset.NFT_TABLE} {{')
+
+        for acl_name, chain_id in chain_ids.items():
+            lines.extend(AclRuleset.compile_acl(chain_id, acl_name, acls.get(acl_name, [])))
+
+        dispatch = {
+            'input': [(AclDirection.IN, 'iifname')],
+            'forward': [(AclDirection.IN, 'iifname'), (AclDirection.OUT, 'oifname')],
+            'output': [(AclDirection.OUT, 'oifname')],
+        }
+
+        for hook, matches in dispatch.items():
+            rules = []
+
+            for direction, field in matches:
+                elements = [f'"{binding.interface_name}" : jump {chain_ids[binding.acl_name]}'
+                            for binding in bindings if binding.direction is direction]
+                if elements:
+                    rules.append(f'{field} vmap {{ {", ".join(elements)} }}')
+
+            lines.extend(AclRuleset._chain(hook, f'type filter hook {hook} priority filter; policy accept;', rules))
+
+        lines.append('}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def compile_acl(chain_id: str, acl_name: AclName, rules: list[AclRule]) -> list[str]:
+        """
+        Compile one access-list into its named sets and chain.
+
+        Permitted packets `return` to the base chain so the access-group of the other
+        direction is still evaluated; an access-list with rules ends with an implicit deny.
+        The table is of the `inet` family, so non IPv4 packets (IPv6, including neighbor
+        discovery) `return` before the first rule and are never matched by the IPv4 rules.
+
+        Args:
+            chain_id (str): nftables identifier of the access-list chain.
+            acl_name (AclName): The access-list name, emitted as a comment.
+            rules (list[AclRule]): The rules ordered by sequence.
+
+        Returns:
+            list[str]: Lines of the nftables document.
+        """
+        set_lines: list[str] = []
+        chain_rules: list[str] = ['meta nfproto != ipv4 return'] if rules else []
+        set_count = 0
+
+        for action, run in AclRuleset._action_runs(rules):
+            verdict = 'return' if action is AclAction.PERMIT else 'drop'
+
+            for fields, elements in AclRuleset._shape_groups(run).items():
+                expressions = [expression for name, expression, _ in AclRuleset._FIELDS if name in fields]
+
+                if not fields:
+                    chain_rules.append(f'meta nfproto ipv4 {verdict}')
+
+                elif len(elements) == 1:
+                    matches = ' '.join(f'{expression} {value}' for expression, value in
+                                       zip(expressions, elements[0], strict=True))
+                    chain_rules.append(f'{matches} {verdict}')
+
+                else:
+                    set_name = f'{chain_id}_set_{set_count}'
+                    set_count += 1
+                    set_type = ' . '.join(nft_type for name, _, nft_type in AclRuleset._FIELDS if name in fields)
+                    flags = ' flags interval;' if {'source', 'destination'} & set(fields) else ''
+                    values = ', '.join(' . '.join(element) for element in elements)
+
+                    set_lines.extend([f'\tset {set_name} {{', f'\t\ttype {set_type};{flags}',
+                                      f'\t\telements = {{ {values} }}', '\t}'])
+                    chain_rules.append(f'{" . ".join(expressions)} @{set_name} {verdict}')
+
+        if rules:
+            chain_rules.append('meta nfproto ipv4 drop')
+
+        return [f'\t# ip access-list {acl_name}'] + set_lines + AclRuleset._chain(chain_id, None, chain_rules)
+
+    @staticmethod
+    def _action_runs(rules: list[AclRule]) -> list[tuple[AclAction, list[AclRule]]]:
+        runs: list[tuple[AclAction, list[AclRule]]] = []
+
+        for rule in sorted(rules, key=lambda rule: rule.sequence):
+            if runs and runs[-1][0] is rule.action:
+                runs[-1][1].append(rule)
+            else:
+                runs.append((rule.action, [rule]))
+
+        return runs
+
+    @staticmethod
+    def _shape_groups(rules: list[AclRule]) -> dict[tuple[str, ...], list[tuple[str, ...]]]:
+        groups: dict[tuple[str, ...], list[tuple[str, ...]]] = {}
+
+        for rule in rules:
+            values = {
+                'source': rule.source,
+                'destination': rule.destination,
+                'protocol': None if rule.protocol is AclProtocol.IP else rule.protocol.value,
+                'source_port': rule.source_port,
+                'destination_port': rule.destination_port,
+            }
+            fields = tuple(name for name, _, _ in AclRuleset._FIELDS if values[name] is not None)
+            element = tuple(str(values[name]) for name in fields)
+
+            elements = groups.setdefault(fields, [])
+            if element not in elements:
+                elements.append(element)
+
+        return groups
+
+    @staticmethod
+    def _table_reset() -> list[str]:
+        return [f'table {AclRuleset.NFT_FAMILY} {AclRuleset.NFT_TABLE}',
+                f'delete table {AclRuleset.NFT_FAMILY} {AclRuleset.NFT_TABLE}']
+
+    @staticmethod
+    def _chain(name: str, hook: str | None, rules: list[str]) -> list[str]:
+        header = [f'\t\t{hook}'] if hook else []
+        return [f'\tchain {name} {{'] + header + [f'\t\t{rule}' for rule in rules] + ['\t}']
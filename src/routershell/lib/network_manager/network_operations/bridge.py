@@ -1,17 +1,30 @@
 import json
 import logging
+from collections.abc import Iterator
 
 from routershell.lib.common.common import STATUS_NOK, STATUS_OK
+from routershell.lib.common.constants import PROC_SYS_NET_BRIDGE_DIR
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
-from routershell.lib.common.types import BridgeName, InterfaceName, PredicateResult, StatusResult
+from routershell.lib.common.types import BridgeName, InterfaceName, MacAddressText, PredicateResult, StatusResult
 from routershell.lib.db.bridge_db import BridgeDatabase
+from routershell.lib.network_manager.common.bridge_fdb import BridgeFdb, FdbEntry, FdbFilter
 from routershell.lib.network_manager.common.phy import State
 from routershell.lib.network_manager.common.run_commands import RunCommand
+from routershell.lib.network_manager.common.sysctl import SysCtl
 from routershell.lib.network_manager.network_interfaces.bridge.bridge_protocols import STP_STATE, BridgeProtocol
+from routershell.lib.network_manager.network_operations.bridge_multicast import BridgeMulticast, MdbEntry
+from routershell.lib.network_manager.network_operations.mac_address_table import (
+    MacAddressTableBatch,
+    StaticMacAddress,
+)
 
 
 class Bridge(RunCommand, BridgeDatabase):
 
+    BR_NETFILTER_SYSCTLS = ('net.bridge.bridge-nf-call-iptables',
+                            'net.bridge.bridge-nf-call-ip6tables',
+                            'net.bridge.bridge-nf-call-arptables')
+
     def __init__(self):
         super().__init__()
         BridgeDatabase().__init__()
@@ -83,7 +96,13 @@ class Bridge(RunCommand, BridgeDatabase):
                         stp_status: STP_STATE | None = None,
                         management_inet: str | None = None,
                         description: str | None = None,
-                        shutdown_status: State | None = None) -> StatusResult:
+                        shutdown_status: State | None = None,
+                        vlan_filtering: bool | None = None,
+                        aging_time: int | None = None,
+                        mac_learning: bool | None = None,
+                        multicast_snooping: bool | None = None,
+                        multicast_querier: bool | None = None,
+                        netfilter_bypass: bool | None = None) -> StatusResult:
         """
         Update the bridge configuration both on the operating system and in the database.
 
@@ -98,12 +117,19 @@ class Bridge(RunCommand, BridgeDatabase):
             management_inet (str | None): The management IP address for the bridge. Defaults to None.
             description (str | None): The new description for the bridge. Defaults to None.
             shutdown_status (State | None): The new shutdown status for the bridge. Defaults to None.
+            vlan_filtering (bool | None): Enable or disable VLAN filtering on the bridge. Defaults to None.
+            aging_time (int | None): The MAC address table aging time in seconds. Defaults to None.
+            mac_learning (bool | None): Enable or disable MAC learning on the bridge ports. Defaults to None.
+            multicast_snooping (bool | None): Enable or disable IGMP/MLD snooping. Defaults to None.
+            multicast_querier (bool | None): Enable or disable the IGMP/MLD querier. Defaults to None.
+            netfilter_bypass (bool | None): Bypass br_netfilter (iptables) for the bridged frames. Defaults to None.
 
         Returns:
             StatusResult: STATUS_OK if both OS and DB updates were successful, STATUS_NOK otherwise.
         """
         # Update the bridge on the operating system
-        if self._update_bridge_via_os(bridge_name, protocol, stp_status, management_inet, shutdown_status):
+        if self._update_bridge_via_os(bridge_name, protocol, stp_status, management_inet, shutdown_status, vlan_filtering,
+                                      aging_time, mac_learning, multicast_snooping, multicast_querier, netfilter_bypass):
             self.log.error(f"Failed to update bridge {bridge_name} on OS")
             return STATUS_NOK
 
@@ -114,7 +140,13 @@ class Bridge(RunCommand, BridgeDatabase):
             stp_status=stp_status,
             management_inet=management_inet,
             description=description,
-            shutdown_status=shutdown_status
+            shutdown_status=shutdown_status,
+            vlan_filtering=vlan_filtering,
+            aging_time=aging_time,
+            mac_learning=mac_learning,
+            multicast_snooping=multicast_snooping,
+            multicast_querier=multicast_querier,
+            netfilter_bypass=netfilter_bypass
         )
         
         if update_result:
@@ -122,13 +154,238 @@ class Bridge(RunCommand, BridgeDatabase):
                 f"Failed to update bridge {bridge_name} in DB with parameters: "
                 f"protocol={protocol}, stp_status={stp_status}, "
                 f"management_inet={management_inet}, description={description}, "
-                f"shutdown_status={shutdown_status}"
+                f"shutdown_status={shutdown_status}, vlan_filtering={vlan_filtering}, "
+                f"aging_time={aging_time}, mac_learning={mac_learning}, "
+                f"multicast_snooping={multicast_snooping}, multicast_querier={multicast_querier}, "
+                f"netfilter_bypass={netfilter_bypass}"
             )
             return STATUS_NOK
 
+        if netfilter_bypass is not None and self.apply_br_netfilter():
+            self.log.error(f"Failed to apply the br_netfilter settings of bridge {bridge_name}")
+            return STATUS_NOK
+
         self.log.debug(f"Bridge {bridge_name} successfully updated in both OS and DB")
         return STATUS_OK
 
+    def get_mac_address_table(self, fdb_filter: FdbFilter | None = None) -> Iterator[FdbEntry]:
+        """
+        Stream the MAC address tables of the bridges from the kernel.
+
+        Args:
+            fdb_filter (FdbFilter | None): Select the bridge, port, VLAN, address or entry type.
+                Defaults to every entry.
+
+        Yields:
+            FdbEntry: The matching entries.
+
+        Raises:
+            BridgeFdbError: If the MAC address table can not be read.
+        """
+        return BridgeFdb().dump(fdb_filter)
+
+    def add_static_mac_address(self, bridge_name: BridgeName, entry: StaticMacAddress) -> StatusResult:
+        """
+        Add or replace a static MAC address table entry of a bridge, in the OS and the DB.
+
+        The entry is only programmed while its port is a member of the bridge, it is
+        programmed when the port joins the bridge otherwise.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            entry (StaticMacAddress): The static entry.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if entry.interface_name in self._get_linked_interfaces(bridge_name):
+            if self._run_bridge_batch(MacAddressTableBatch.static_entries([entry])):
+                self.log.error(f"Failed to add static MAC address {entry.mac_address} to bridge {bridge_name}")
+                return STATUS_NOK
+
+        if self.add_static_mac_address_db(bridge_name, entry.mac_address, entry.interface_name, entry.vlan_id):
+            self.log.error(f"Failed to add static MAC address {entry.mac_address} of bridge {bridge_name} to DB")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_static_mac_address(self, bridge_name: BridgeName, mac_address: MacAddressText,
+                               vlan_id: int | None = None) -> StatusResult:
+        """
+        Delete a static MAC address table entry of a bridge, from the OS and then the DB.
+
+        The DB row is kept when the OS delete fails, so the running config still shows the entry the kernel holds.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            mac_address (MacAddressText): The MAC address, `xx:xx:xx:xx:xx:xx`.
+            vlan_id (int | None): The VLAN of the entry, None without VLAN filtering.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK if the entry does not exist or can not be deleted.
+        """
+        static_entries = self.get_mac_address_table_db(bridge_name).get('StaticMacAddresses', [])
+        interface_name = next((entry['InterfaceName'] for entry in static_entries
+                               if entry['MacAddress'] == mac_address and entry['VlanID'] == vlan_id), None)
+
+        if interface_name is None:
+            self.log.error(f"Static MAC address {mac_address} of bridge {bridge_name} does not exist")
+            return STATUS_NOK
+
+        if interface_name in self._get_linked_interfaces(bridge_name):
+            lines = MacAddressTableBatch.static_entries([StaticMacAddress(mac_address, interface_name, vlan_id)], remove=True)
+
+            if self._run_bridge_batch(lines):
+                self.log.error(f"Failed to delete static MAC address {mac_address} from bridge {bridge_name}")
+                return STATUS_NOK
+
+        if self.del_static_mac_address_db(bridge_name, mac_address, vlan_id) is None:
+            self.log.error(f"Failed to delete static MAC address {mac_address} of bridge {bridge_name} from DB")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def add_multicast_router_port(self, bridge_name: BridgeName, interface_name: InterfaceName) -> StatusResult:
+        """
+        Make a bridge port a permanent multicast router port, in the OS and the DB.
+
+        The port is only programmed while it is a member of the bridge, it is programmed
+        when the port joins the bridge otherwise.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if interface_name in self._get_linked_interfaces(bridge_name):
+            if self._run_bridge_batch(BridgeMulticast.router_ports([interface_name], enable=True)):
+                self.log.error(f"Failed to set multicast router port {interface_name} of bridge {bridge_name}")
+                return STATUS_NOK
+
+        if self.add_multicast_router_port_db(bridge_name, interface_name):
+            self.log.error(f"Failed to add multicast router port {interface_name} of bridge {bridge_name} to DB")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_multicast_router_port(self, bridge_name: BridgeName, interface_name: InterfaceName) -> StatusResult:
+        """
+        Return a multicast router port of a bridge to router port learning, in the DB and the OS.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str): The bridge port.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK if the port is not a router port or can not be updated.
+        """
+        if self.del_multicast_router_port_db(bridge_name, interface_name):
+            self.log.error(f"Interface {interface_name} is not a multicast router port of bridge {bridge_name}")
+            return STATUS_NOK
+
+        if interface_name in self._get_linked_interfaces(bridge_name):
+            if self._run_bridge_batch(BridgeMulticast.router_ports([interface_name], enable=False)):
+                self.log.error(f"Failed to clear multicast router port {interface_name} of bridge {bridge_name}")
+                return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_multicast_groups(self, bridge_name: BridgeName | None = None) -> tuple[list[MdbEntry], dict[BridgeName, list[InterfaceName]]]:
+        """
+        Read the multicast groups and router ports of the bridges from the kernel.
+
+        Args:
+            bridge_name (str | None): Only read this bridge. Defaults to every bridge.
+
+        Returns:
+            tuple[list[MdbEntry], dict[BridgeName, list[InterfaceName]]]: The group entries and the
+                router ports per bridge, empty on error.
+        """
+        result = self.run(['bridge', '-json', '-details', '-statistics', 'mdb', 'show'] + (['dev', bridge_name] if bridge_name else []),
+                          suppress_error=True)
+
+        if result.exit_code:
+            self.log.error(f"Failed to read the multicast groups: {result.stderr}")
+            return [], {}
+
+        try:
+            return BridgeMulticast.parse_mdb(result.stdout)
+
+        except ValueError as e:
+            self.log.error(f"Failed to parse the multicast groups: {e}")
+            return [], {}
+
+    def apply_br_netfilter(self) -> StatusResult:
+        """
+        Program the global br_netfilter sysctls from the bridges' netfilter bypass settings.
+
+        The kernel passes a bridged frame to iptables when the global `bridge-nf-call-*` sysctl
+        or the flag of its bridge is set, so a bridge can only bypass netfilter while the global
+        sysctls are cleared. Before clearing them, the flags of every other bridge of the OS,
+        including bridges RouterShell does not manage (docker0, virbr0), are set so they keep
+        filtering. The sysctls are set back to the kernel default when no bridge bypasses
+        netfilter, e.g. after the last bypassing bridge is deleted.
+
+        Returns:
+            StatusResult: STATUS_OK if successful or br_netfilter is not loaded, STATUS_NOK otherwise.
+        """
+        if not PROC_SYS_NET_BRIDGE_DIR.exists():
+            self.log.debug("br_netfilter is not loaded, bridged frames do not traverse netfilter")
+            return STATUS_OK
+
+        bypass_bridges = self.get_netfilter_bypass_bridges_db()
+
+        if bypass_bridges:
+            lines = [' '.join(['link', 'set', 'dev', bridge_name, 'type', 'bridge'] + self._nf_call_args(True))
+                     for bridge_name in self.get_bridge_list_os() if bridge_name not in bypass_bridges]
+            result = self.run(['ip', '-batch', '-'], stdin='\n'.join(lines) + '\n') if lines else None
+
+            if result and result.exit_code:
+                self.log.error(f"Failed to set the br_netfilter flags of the filtering bridges: {result.stderr}")
+                return STATUS_NOK
+
+        value = '0' if bypass_bridges else '1'
+
+        for sysctl_param in self.BR_NETFILTER_SYSCTLS:
+            if SysCtl().write_sysctl(sysctl_param, value):
+                self.log.error(f"Failed to write {sysctl_param}={value}")
+                return STATUS_NOK
+
+        return STATUS_OK
+
+    def apply_bridge_port_settings(self, bridge_name: BridgeName, interface_name: InterfaceName | None = None) -> StatusResult:
+        """
+        Program the MAC learning flag, the static MAC entries and the multicast router ports of the
+        bridge ports from the DB, with a single `bridge -batch -`.
+
+        Args:
+            bridge_name (str): The name of the bridge.
+            interface_name (str | None): Only program this port, e.g. when it joins the bridge. Defaults to every port.
+
+        Returns:
+            StatusResult: STATUS_OK if successful or nothing to program, STATUS_NOK otherwise.
+        """
+        settings = self.get_mac_address_table_db(bridge_name)
+        ports = [port for port in self._get_linked_interfaces(bridge_name) if interface_name in (None, port)]
+
+        if not settings or not ports:
+            return STATUS_OK
+
+        lines = [] if settings['MacLearning'] else MacAddressTableBatch.learning(ports, enable=False)
+        lines += MacAddressTableBatch.static_entries(
+            [StaticMacAddress(row['MacAddress'], row['InterfaceName'], row['VlanID'])
+             for row in settings['StaticMacAddresses'] if row['InterfaceName'] in ports])
+        lines += BridgeMulticast.router_ports(
+            [port for port in self.get_multicast_db(bridge_name).get('RouterPorts', []) if port in ports], enable=True)
+
+        if lines and self._run_bridge_batch(lines):
+            self.log.error(f"Failed to program the port settings of bridge {bridge_name}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
     def get_shutdown_status_os(self, bridge_name: BridgeName) -> State:
         """
         Retrieve the shutdown status of a bridge from the operating system.
@@ -208,7 +465,8 @@ class Bridge(RunCommand, BridgeDatabase):
         This method performs the following actions:
         1. Attempts to delete the bridge from the operating system using `_del_bridge_via_os`.
         2. If successful, proceeds to delete the bridge from the database using `del_bridge_db`.
-        3. Returns `STATUS_OK` if both operations are successful, or `STATUS_NOK` if any operation fails.
+        3. Re-applies the global br_netfilter sysctls, in case it was the last bridge bypassing netfilter.
+        4. Returns `STATUS_OK` if both operations are successful, or `STATUS_NOK` if any operation fails.
 
         Args:
             bridge_name (str): The name of the bridge to delete.
@@ -224,6 +482,10 @@ class Bridge(RunCommand, BridgeDatabase):
         if self.del_bridge_db(bridge_name):
             self.log.error(f"Failed to delete bridge {bridge_name} from DB")
             return STATUS_NOK
+
+        if self.apply_br_netfilter():
+            self.log.error(f"Failed to apply the br_netfilter settings after deleting bridge {bridge_name}")
+            return STATUS_NOK
         
         return STATUS_OK
     
@@ -282,7 +544,11 @@ class Bridge(RunCommand, BridgeDatabase):
         if self.update_interface_bridge_group_db(interface_name, bridge_group, remove=False):
             self.log.error(f"Failed to update interface {interface_name} bridge group {bridge_group} to DB")
             return STATUS_OK
-        
+
+        if self.apply_bridge_port_settings(bridge_group, interface_name):
+            self.log.error(f"Failed to program the bridge port settings of interface {interface_name}")
+            return STATUS_NOK
+
         return STATUS_OK
 
     def del_interface_to_bridge_group(self, interface_name: InterfaceName, bridge_group: BridgeName) -> StatusResult:
@@ -505,7 +771,7 @@ class Bridge(RunCommand, BridgeDatabase):
         Returns:
             list[str]: A list of interface names that are linked to the bridge.
         """
-        result = self.run(['ip','-json','show', 'master', bridge_name], suppress_error=True)
+        result = self.run(['ip', '-json', 'link', 'show', 'master', bridge_name], suppress_error=True)
         
         if result.exit_code:
             self.log.debug(f"Failed to retrieve linked interfaces for bridge {bridge_name}")
@@ -525,12 +791,19 @@ class Bridge(RunCommand, BridgeDatabase):
                             protocol: BridgeProtocol | None = None, 
                             stp_status: STP_STATE | None = None,
                             management_inet: str | None = None,
-                            shutdown_status: State | None = None) -> StatusResult:
+                            shutdown_status: State | None = None,
+                            vlan_filtering: bool | None = None,
+                            aging_time: int | None = None,
+                            mac_learning: bool | None = None,
+                            multicast_snooping: bool | None = None,
+                            multicast_querier: bool | None = None,
+                            netfilter_bypass: bool | None = None) -> StatusResult:
         """
         Update a bridge on the operating system with the specified parameters.
 
         This method updates the bridge's protocol, STP status, management IP address, 
-        and shutdown status on the operating system.
+        shutdown status, VLAN filtering, MAC aging time, port MAC learning, multicast snooping
+        and querier, and the per-bridge netfilter flags on the operating system.
 
         Args:
             bridge_name (str): The name of the bridge to update.
@@ -538,6 +811,12 @@ class Bridge(RunCommand, BridgeDatabase):
             stp_status (STP_STATE | None): The new STP status for the bridge. Defaults to None.
             management_inet (str | None): The management IP address for the bridge. Defaults to None.
             shutdown_status (State | None): The new shutdown status for the bridge. Defaults to None.
+            vlan_filtering (bool | None): Enable or disable VLAN filtering on the bridge. Defaults to None.
+            aging_time (int | None): The MAC address table aging time in seconds. Defaults to None.
+            mac_learning (bool | None): Enable or disable MAC learning on the bridge ports. Defaults to None.
+            multicast_snooping (bool | None): Enable or disable IGMP/MLD snooping. Defaults to None.
+            multicast_querier (bool | None): Enable or disable the IGMP/MLD querier. Defaults to None.
+            netfilter_bypass (bool | None): Clear (bypass) or set the bridge nf_call_* flags. Defaults to None.
 
         Returns:
             StatusResult: True if the bridge was successfully updated, False otherwise.
@@ -546,7 +825,9 @@ class Bridge(RunCommand, BridgeDatabase):
             self.log.debug(f"Bridge {bridge_name} does not exist on OS. No update performed.")
             return STATUS_NOK
 
-        if protocol is None and stp_status is None and management_inet is None and shutdown_status is None:
+        if protocol is None and stp_status is None and management_inet is None and shutdown_status is None \
+                and vlan_filtering is None and aging_time is None and mac_learning is None \
+                and multicast_snooping is None and multicast_querier is None and netfilter_bypass is None:
             self.log.debug('_update_bridge_via_os() - All Arguments None - no action needed')
             return STATUS_OK
         
@@ -559,6 +840,22 @@ class Bridge(RunCommand, BridgeDatabase):
             stp_command = '1' if stp_status == STP_STATE.STP_ENABLE else '0'
             cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type','bridge', 'stp_state', stp_command])
 
+        if vlan_filtering is not None:
+            cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type', 'bridge', 'vlan_filtering', '1' if vlan_filtering else '0'])
+
+        if aging_time is not None:
+            cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type', 'bridge', 'ageing_time',
+                        MacAddressTableBatch.ageing_time(aging_time)])
+
+        if multicast_snooping is not None:
+            cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type', 'bridge', 'mcast_snooping', '1' if multicast_snooping else '0'])
+
+        if multicast_querier is not None:
+            cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type', 'bridge', 'mcast_querier', '1' if multicast_querier else '0'])
+
+        if netfilter_bypass is not None:
+            cmd.append(['ip', 'link', 'set', 'dev', bridge_name, 'type', 'bridge'] + self._nf_call_args(not netfilter_bypass))
+
         if management_inet:
             cmd.append(['ip', 'addr', 'add', management_inet, 'dev', bridge_name])
         
@@ -574,6 +871,13 @@ class Bridge(RunCommand, BridgeDatabase):
                 self.log.error(f"Failed to update bridge {bridge_name} on OS: {result.stderr.strip()}")
                 return STATUS_NOK
 
+        if mac_learning is not None:
+            ports = self._get_linked_interfaces(bridge_name)
+
+            if ports and self._run_bridge_batch(MacAddressTableBatch.learning(ports, mac_learning)):
+                self.log.error(f"Failed to set MAC learning on the ports of bridge {bridge_name}")
+                return STATUS_NOK
+
         self.log.debug(f"Bridge {bridge_name} successfully updated on OS")
         return STATUS_OK
   
@@ -625,7 +929,7 @@ class Bridge(RunCommand, BridgeDatabase):
         """
         self.log.debug(f"_add_bridge_os() -> Adding bridge: {bridge_name} to OS")
         
-        result = self.run(['ip', 'link', 'add', 'name', bridge_name, 'type', 'bridge'])
+        result = self.run(['ip', 'link', 'add', 'name', bridge_name, 'type', 'bridge'] + self._nf_call_args(True))
         
         if result.exit_code:
             self.log.warning(f"Bridge {bridge_name} cannot be created - exit-code: {result.exit_code}")
@@ -633,4 +937,25 @@ class Bridge(RunCommand, BridgeDatabase):
 
         self.log.debug(f"_add_bridge_os() -> Added bridge: {bridge_name} to OS")
         return STATUS_OK
-                       
\ No newline at end of file
+                       
+
+    @staticmethod
+    def _nf_call_args(enable: bool) -> list[str]:
+        """
+        Return the `ip link ... type bridge` arguments that set or clear the bridge br_netfilter flags.
+        """
+        value = '1' if enable else '0'
+        return ['nf_call_iptables', value, 'nf_call_ip6tables', value, 'nf_call_arptables', value]
+
+    def _run_bridge_batch(self, lines: list[str]) -> StatusResult:
+        """
+        Run `bridge -batch -` lines in a single process.
+        """
+        self.log.debug("_run_bridge_batch() -> batch:\n" + '\n'.join(lines))
+        result = self.run(['bridge', '-batch', '-'], stdin='\n'.join(lines) + '\n')
+
+        if result.exit_code:
+            self.log.error(f"bridge batch failed, error: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
@@ -0,0 +1,81 @@
+import json
+from typing import NamedTuple
+
+from routershell.lib.common.types import BridgeName, InterfaceName
+
+
+class MdbEntry(NamedTuple):
+    """
+    A bridge multicast database (MDB) entry, a group learned by IGMP/MLD snooping or configured statically.
+
+    Attributes:
+        bridge_name (BridgeName): The bridge owning the entry.
+        group (str): The multicast group address.
+        interface_name (InterfaceName): The bridge port the group is forwarded to.
+        vlan_id (int | None): The VLAN of the entry, None on a bridge without VLAN filtering.
+        state (str): `temp` (learned, ages out) or `permanent`.
+        timer (str): Time left before a learned entry ages out, empty for permanent entries.
+    """
+    bridge_name: BridgeName
+    group: str
+    interface_name: InterfaceName
+    vlan_id: int | None
+    state: str
+    timer: str = ''
+
+
+class BridgeMulticast:
+    """
+    Compile multicast router ports into `bridge -batch` lines and decode `bridge -json -details -statistics mdb show`.
+
+    A bridge with IGMP/MLD snooping forwards a group only to the ports that joined it, router
+    ports (towards a multicast router) always receive every group.
+    """
+
+    MCAST_ROUTER_DISABLED = 0
+    MCAST_ROUTER_LEARN = 1
+    MCAST_ROUTER_PERMANENT = 2
+
+    @classmethod
+    def router_ports(cls, ports: list[InterfaceName], enable: bool) -> list[str]:
+        """
+        Return the `bridge -batch` lines that make bridge ports permanent multicast router ports,
+        or return them to router port learning from queries (the kernel default).
+
+        Args:
+            ports (list[InterfaceName]): The bridge ports.
+            enable (bool): True for a permanent router port.
+
+        Returns:
+            list[str]: One `link` line per port.
+        """
+        mcast_router = cls.MCAST_ROUTER_PERMANENT if enable else cls.MCAST_ROUTER_LEARN
+        return [f'link set dev {port} mcast_router {mcast_router}' for port in ports]
+
+    @staticmethod
+    def parse_mdb(output: str) -> tuple[list[MdbEntry], dict[BridgeName, list[InterfaceName]]]:
+        """
+        Decode the output of `bridge -json -details -statistics mdb show`.
+
+        Args:
+            output (str): The JSON output.
+
+        Returns:
+            tuple[list[MdbEntry], dict[BridgeName, list[InterfaceName]]]: The group entries, and the
+                multicast router ports per bridge.
+
+        Raises:
+            ValueError: If the output is not valid JSON.
+        """
+        entries: list[MdbEntry] = []
+        router_ports: dict[BridgeName, list[InterfaceName]] = {}
+
+        for block in json.loads(output or '[]'):
+            for entry in block.get('mdb', []):
+                entries.append(MdbEntry(entry.get('dev', ''), entry.get('grp', ''), entry.get('port', ''),
+                                        entry.get('vid'), entry.get('state', ''), entry.get('timer', '').strip()))
+
+            for bridge_name, ports in block.get('router', {}).items():
+                router_ports.setdefault(bridge_name, []).extend(port['port'] for port in ports if 'port' in port)
+
+        return entries, router_ports
@@ -0,0 +1,140 @@
+import json
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.range_list import RangeList
+from routershell.lib.common.types import BridgeName, InterfaceName
+
+
+class SwitchportMode(Enum):
+    """
+    Enumeration of switchport modes.
+
+    - `ACCESS`: One untagged VLAN, which is also the port VLAN ID (PVID).
+    - `TRUNK`: Tagged member of every allowed VLAN, untagged frames are dropped.
+    """
+    ACCESS = 'access'
+    TRUNK = 'trunk'
+
+
+class BridgePortVlans(NamedTuple):
+    """
+    The VLAN membership of a bridge port, as stored in the `Switchports`/`VlanInterfaces` tables.
+
+    Attributes:
+        interface_name (InterfaceName): The bridge port.
+        mode (SwitchportMode): access | trunk.
+        vlan_ids (list[int]): The access VLAN, or the VLANs allowed on the trunk.
+    """
+    interface_name: InterfaceName
+    mode: SwitchportMode
+    vlan_ids: list[int]
+
+
+class BridgeVlanBatch:
+    """
+    Compile the VLAN membership of the ports of a `vlan_filtering` bridge into one `bridge -batch` document.
+
+    The document only contains the difference between the kernel VLAN table and the
+    desired membership, with consecutive VLANs of the same kind collapsed into one
+    `vid <first>-<last>` range, so reprogramming a trunk of hundreds of VLANs is a
+    handful of lines executed by a single `bridge` process.
+    """
+
+    PVID = 'pvid'
+    UNTAGGED = 'untagged'
+
+    @staticmethod
+    def desired_vlans(port: BridgePortVlans) -> dict[int, frozenset[str]]:
+        """
+        Return the kernel VLAN entries of a port.
+
+        Returns:
+            dict[int, frozenset[str]]: VLAN ID to flags (`pvid`, `untagged`).
+        """
+        if port.mode is SwitchportMode.ACCESS:
+            return {vlan_id: frozenset({BridgeVlanBatch.PVID, BridgeVlanBatch.UNTAGGED}) for vlan_id in port.vlan_ids[:1]}
+        return {vlan_id: frozenset() for vlan_id in port.vlan_ids}
+
+    @staticmethod
+    def compile(bridge_name: BridgeName, ports: list[BridgePortVlans],
+                current: dict[InterfaceName, dict[int, frozenset[str]]]) -> str:
+        """
+        Compile the `bridge -batch` commands that move the kernel VLAN table to the desired membership.
+
+        VLANs are added before stale ones are deleted, so an access port moved to another
+        VLAN always has a PVID. The bridge device itself is made a tagged member of every
+        VLAN in use, so VLAN interfaces on top of the bridge receive their traffic; its
+        existing entries are left untouched.
+
+        Args:
+            bridge_name (BridgeName): The `vlan_filtering` bridge.
+            ports (list[BridgePortVlans]): The desired membership of the configured ports.
+            current (dict[InterfaceName, dict[int, frozenset[str]]]): The kernel VLAN table,
+                see `parse_bridge_vlan_show()`.
+
+        Returns:
+            str: The batch document, empty when the kernel is already up to date.
+        """
+        lines: list[str] = []
+        bridge_vlans: set[int] = set()
+
+        for port in ports:
+            desired = BridgeVlanBatch.desired_vlans(port)
+            existing = current.get(port.interface_name, {})
+            bridge_vlans.update(desired)
+
+            changed: dict[frozenset[str], list[int]] = {}
+            for vlan_id, flags in desired.items():
+                if existing.get(vlan_id) != flags:
+                    changed.setdefault(flags, []).append(vlan_id)
+
+            for flags, vlan_ids in sorted(changed.items(), key=lambda item: min(item[1])):
+                options = ''.join(f' {flag}' for flag in (BridgeVlanBatch.PVID, BridgeVlanBatch.UNTAGGED) if flag in flags)
+                lines.extend(f'vlan add dev {port.interface_name} vid {BridgeVlanBatch._vid(span)}{options}'
+                             for span in RangeList.spans(vlan_ids))
+
+            stale = [vlan_id for vlan_id in existing if vlan_id not in desired]
+            lines.extend(f'vlan del dev {port.interface_name} vid {BridgeVlanBatch._vid(span)}'
+                         for span in RangeList.spans(stale))
+
+        missing = [vlan_id for vlan_id in bridge_vlans if vlan_id not in current.get(bridge_name, {})]
+        lines.extend(f'vlan add dev {bridge_name} vid {BridgeVlanBatch._vid(span)} self'
+                     for span in RangeList.spans(missing))
+
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    @staticmethod
+    def parse_bridge_vlan_show(bridge_vlan_json: str) -> dict[InterfaceName, dict[int, frozenset[str]]]:
+        """
+        Parse `bridge -j vlan show` output.
+
+        Args:
+            bridge_vlan_json (str): The JSON output.
+
+        Returns:
+            dict[InterfaceName, dict[int, frozenset[str]]]: VLAN entries of each port, empty on parse error.
+        """
+        try:
+            ports = json.loads(bridge_vlan_json or '[]')
+        except ValueError:
+            return {}
+
+        table: dict[InterfaceName, dict[int, frozenset[str]]] = {}
+
+        for port in ports:
+            entries = table.setdefault(port['ifname'], {})
+
+            for vlan in port.get('vlans', []):
+                flags = frozenset(flag for flag, kernel_flag in ((BridgeVlanBatch.PVID, 'PVID'),
+                                                                 (BridgeVlanBatch.UNTAGGED, 'Egress Untagged'))
+                                  if kernel_flag in vlan.get('flags', []))
+
+                for vlan_id in range(vlan['vlan'], vlan.get('vlanEnd', vlan['vlan']) + 1):
+                    entries[vlan_id] = flags
+
+        return table
+
+    @staticmethod
+    def _vid(span: tuple[int, int]) -> str:
+        return str(span[0]) if span[0] == span[1] else f'{span[0]}-{span[1]}'
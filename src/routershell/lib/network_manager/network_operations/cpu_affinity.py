@@ -0,0 +1,520 @@
+import logging
+import os
+import re
+import shlex
+import shutil
+from pathlib import Path
+from typing import NamedTuple
+
+from routershell.lib.common.constants import (
+    PROC_INTERRUPTS_FILE,
+    PROC_IRQ_DIR,
+    PROC_SOFTNET_STAT_FILE,
+    PROC_SYS_NET_CORE_DIR,
+    STATUS_NOK,
+    STATUS_OK,
+    SYS_CLASS_NET_DIR,
+    SYS_CPU_ONLINE_FILE,
+)
+from routershell.lib.common.range_list import RangeList
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.db.interface_db import InterfaceDatabase
+from routershell.lib.network_manager.common.run_commands import RunCommand
+
+
+class CpuAffinityPlan(NamedTuple):
+    """
+    Where the interrupts and the receive/transmit work of one interface run.
+
+    An empty CPU list disables RPS (rps_cpus) or XPS (xps_cpus) on that queue.
+    """
+    irq_cpus: dict[int, list[int]]
+    rps_cpus: dict[str, list[int]]
+    rps_flow_cnt: dict[str, int]
+    xps_cpus: dict[str, list[int]]
+    rps_sock_flow_entries: int = 0
+
+
+class CpuAffinityBatch:
+    """
+    Compute the IRQ, RPS/RFS and XPS settings of an interface and compile them into a
+    single script of sysfs/procfs writes.
+
+    The queues are spread over the CPUs round-robin:
+    - A NIC with at least one queue per CPU keeps its hardware RSS spreading, each queue
+      interrupt is pinned to one CPU and RPS stays off.
+    - A NIC with fewer queues than CPUs pins each queue interrupt to the first CPU of its
+      group and steers the receive processing (RPS, with RFS flow tables) to the whole group.
+    """
+
+    DEFAULT_RFS_FLOW_ENTRIES = 32768
+    MAX_CPU = 4095
+
+    @staticmethod
+    def cpu_mask(cpus: list[int]) -> str:
+        """
+        Render CPUs as a kernel cpumask (`f`, `1,00000000`), in 32-bit comma separated words.
+        """
+        digits = f'{sum(1 << cpu for cpu in set(cpus)):x}'
+        words = []
+
+        while digits:
+            words.insert(0, digits[-8:])
+            digits = digits[:-8]
+
+        return ','.join(words)
+
+    @staticmethod
+    def parse_cpu_mask(mask: str) -> list[int]:
+        """
+        Parse a kernel cpumask such as `f` or `1,00000000` into CPU numbers.
+        """
+        value = int(mask.strip().replace(',', '') or '0', 16)
+        return [cpu for cpu in range(value.bit_length()) if value >> cpu & 1]
+
+    @staticmethod
+    def spread(queue_count: int, cpus: list[int]) -> list[list[int]]:
+        """
+        Assign CPUs to queues round-robin.
+
+        Args:
+            queue_count (int): The number of queues.
+            cpus (list[int]): The CPUs to spread over.
+
+        Returns:
+            list[list[int]]: The CPUs of each queue; with more CPUs than queues every CPU is
+                used by exactly one queue, otherwise each queue gets one CPU.
+        """
+        if not cpus:
+            return [[] for _ in range(queue_count)]
+
+        if len(cpus) >= queue_count:
+            return [cpus[queue::queue_count] for queue in range(queue_count)]
+
+        return [[cpus[queue % len(cpus)]] for queue in range(queue_count)]
+
+    @staticmethod
+    def rps_enabled(cpus: list[int], rx_queues: list[str]) -> bool:
+        """
+        RPS is used when the interface has fewer receive queues than CPUs.
+        """
+        return 0 < len(rx_queues) < len(cpus)
+
+    @staticmethod
+    def plan(cpus: list[int], rx_queues: list[str], tx_queues: list[str], irqs: list[int],
+             rfs_flow_entries: int = DEFAULT_RFS_FLOW_ENTRIES) -> CpuAffinityPlan:
+        """
+        Spread the queues of an interface over `cpus`.
+
+        Args:
+            cpus (list[int]): The CPUs to use.
+            rx_queues (list[str]): The receive queues (`rx-0`, ...), in queue order.
+            tx_queues (list[str]): The transmit queues (`tx-0`, ...), in queue order.
+            irqs (list[int]): The queue interrupts of the interface, in queue order.
+            rfs_flow_entries (int): The RFS socket flow table size, split across the RPS queues.
+
+        Returns:
+            CpuAffinityPlan: The settings to apply.
+        """
+        rps_enabled = CpuAffinityBatch.rps_enabled(cpus, rx_queues)
+        rx_groups = CpuAffinityBatch.spread(len(rx_queues), cpus)
+        flow_cnt = rfs_flow_entries // len(rx_queues) if rps_enabled else 0
+
+        return CpuAffinityPlan(
+            irq_cpus={irq: group[:1] for irq, group in zip(irqs, CpuAffinityBatch.spread(len(irqs), cpus), strict=True)},
+            rps_cpus={queue: group if rps_enabled else [] for queue, group in zip(rx_queues, rx_groups, strict=True)},
+            rps_flow_cnt={queue: flow_cnt for queue in rx_queues},
+            xps_cpus=dict(zip(tx_queues, CpuAffinityBatch.spread(len(tx_queues), cpus), strict=True)),
+            rps_sock_flow_entries=rfs_flow_entries if rps_enabled else 0,
+        )
+
+    @staticmethod
+    def reset(online_cpus: list[int], rx_queues: list[str], tx_queues: list[str], irqs: list[int]) -> CpuAffinityPlan:
+        """
+        The kernel defaults: interrupts allowed on every online CPU, RPS, RFS and XPS off.
+        """
+        return CpuAffinityPlan(
+            irq_cpus={irq: online_cpus for irq in irqs},
+            rps_cpus={queue: [] for queue in rx_queues},
+            rps_flow_cnt={queue: 0 for queue in rx_queues},
+            xps_cpus={queue: [] for queue in tx_queues},
+        )
+
+    @staticmethod
+    def writes(interface_name: InterfaceName, plan: CpuAffinityPlan) -> list[tuple[Path, str]]:
+        """
+        Compile a plan into (file, value) writes.
+        """
+        queues_dir = SYS_CLASS_NET_DIR / interface_name / 'queues'
+        writes = [(PROC_IRQ_DIR / str(irq) / 'smp_affinity', CpuAffinityBatch.cpu_mask(cpus))
+                  for irq, cpus in plan.irq_cpus.items()]
+
+        if plan.rps_sock_flow_entries:
+            writes.append((PROC_SYS_NET_CORE_DIR / 'rps_sock_flow_entries', str(plan.rps_sock_flow_entries)))
+
+        for queue, cpus in plan.rps_cpus.items():
+            writes.append((queues_dir / queue / 'rps_cpus', CpuAffinityBatch.cpu_mask(cpus)))
+            writes.append((queues_dir / queue / 'rps_flow_cnt', str(plan.rps_flow_cnt.get(queue, 0))))
+
+        writes.extend((queues_dir / queue / 'xps_cpus', CpuAffinityBatch.cpu_mask(cpus))
+                      for queue, cpus in plan.xps_cpus.items())
+
+        return writes
+
+    @staticmethod
+    def script(writes: list[tuple[Path, str]]) -> str:
+        """
+        Render writes as one `sh` script, every write is attempted and the script fails if any write failed.
+        """
+        lines = ['status=0']
+        lines.extend(f'echo {shlex.quote(value)} > {shlex.quote(str(path))} || status=1' for path, value in writes)
+        lines.append('exit $status')
+        return '\n'.join(lines) + '\n'
+
+
+class QueueStatistics:
+    """
+    Parsers for the per-queue and per-CPU counters of `show interface <interface> queues`.
+    """
+
+    ETHTOOL_QUEUE_PACKETS_RE = re.compile(
+        r'^\s*(?P<direction>rx|tx)[_-]?(?:queue[_-]?)?(?P<queue>\d+)[._](?:packets|pkts):\s*(?P<count>\d+)\s*$')
+
+    @staticmethod
+    def parse_proc_interrupts(text: str) -> dict[int, dict]:
+        """
+        Parse /proc/interrupts.
+
+        Returns:
+            dict[int, dict]: {irq: {'Counts': {cpu: count}, 'Description': str}}, numbered IRQs only.
+        """
+        lines = text.splitlines()
+
+        if not lines:
+            return {}
+
+        cpus = [int(column[3:]) for column in lines[0].split() if column.startswith('CPU')]
+        interrupts: dict[int, dict] = {}
+
+        for line in lines[1:]:
+            irq, _, rest = line.strip().partition(':')
+
+            if not irq.isdigit():
+                continue
+
+            fields = rest.split(None, len(cpus))
+            counts = [int(field) for field in fields[:len(cpus)] if field.isdigit()]
+
+            interrupts[int(irq)] = {
+                'Counts': dict(zip(cpus[:len(counts)], counts, strict=True)),
+                'Description': fields[len(cpus)].strip() if len(fields) > len(cpus) else '',
+            }
+
+        return interrupts
+
+    @staticmethod
+    def find_interface_irqs(interface_name: InterfaceName, interrupts: dict[int, dict], msi_irqs: list[int]) -> list[int]:
+        """
+        Find the queue interrupts of an interface: the IRQs named after it (`eth0-TxRx-0`),
+        otherwise the MSI interrupts of its device.
+        """
+        name_re = re.compile(rf'(^|[\s,]){re.escape(interface_name)}([-_.:@\s]|$)')
+        named = [irq for irq, interrupt in interrupts.items() if name_re.search(interrupt['Description'])]
+
+        if named:
+            return sorted(named)
+
+        return sorted(irq for irq in msi_irqs if irq in interrupts)
+
+    @staticmethod
+    def parse_softnet_stat(text: str) -> list[dict]:
+        """
+        Parse /proc/net/softnet_stat, one row per online CPU.
+
+        Returns:
+            list[dict]: [{'CPU', 'Processed', 'Dropped', 'TimeSqueeze', 'ReceivedRps'}]
+        """
+        rows = []
+
+        for index, line in enumerate(text.splitlines()):
+            fields = [int(field, 16) for field in line.split()]
+
+            if len(fields) < 10:
+                continue
+
+            rows.append({
+                'CPU': fields[12] if len(fields) > 12 else index,
+                'Processed': fields[0],
+                'Dropped': fields[1],
+                'TimeSqueeze': fields[2],
+                'ReceivedRps': fields[9],
+            })
+
+        return rows
+
+    @staticmethod
+    def parse_ethtool_queue_packets(text: str) -> dict[str, int]:
+        """
+        Pick the per-queue packet counters out of `ethtool -S`, driver naming varies
+        (`rx_queue_0_packets`, `rx-0.packets`, `rx0_packets`).
+
+        Returns:
+            dict[str, int]: {'rx-0': packets, 'tx-0': packets, ...}
+        """
+        packets = {}
+
+        for line in text.splitlines():
+            match = QueueStatistics.ETHTOOL_QUEUE_PACKETS_RE.match(line)
+
+            if match:
+                packets[f"{match.group('direction')}-{match.group('queue')}"] = int(match.group('count'))
+
+        return packets
+
+
+class CpuAffinity(RunCommand, InterfaceDatabase):
+    """
+    Per-interface IRQ affinity, RPS/RFS and XPS (`cpu affinity`).
+    """
+
+    QUEUE_RE = re.compile(r'^(rx|tx)-(\d+)$')
+
+    def __init__(self):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().CPU_AFFINITY)
+
+    def get_online_cpus(self) -> list[int]:
+        """
+        Returns:
+            list[int]: The online CPUs.
+        """
+        try:
+            return RangeList.parse(SYS_CPU_ONLINE_FILE.read_text().strip(), 0, CpuAffinityBatch.MAX_CPU)
+
+        except (OSError, ValueError) as e:
+            self.log.debug(f"Unable to read online CPUs, using cpu_count(): {e}")
+            return list(range(os.cpu_count() or 1))
+
+    def get_interface_queues(self, interface_name: InterfaceName) -> tuple[list[str], list[str]]:
+        """
+        Returns:
+            tuple[list[str], list[str]]: The receive and transmit queues of the interface, in queue order.
+        """
+        try:
+            names = os.listdir(SYS_CLASS_NET_DIR / interface_name / 'queues')
+
+        except OSError as e:
+            self.log.error(f"Unable to read the queues of interface {interface_name}: {e}")
+            return [], []
+
+        queues = sorted((match.group(1), int(match.group(2))) for match in map(self.QUEUE_RE.match, names) if match)
+        return ([f'rx-{n}' for kind, n in queues if kind == 'rx'],
+                [f'tx-{n}' for kind, n in queues if kind == 'tx'])
+
+    def get_interface_irqs(self, interface_name: InterfaceName) -> list[int]:
+        """
+        Returns:
+            list[int]: The queue interrupts of the interface, empty for virtual interfaces.
+        """
+        try:
+            msi_irqs = [int(irq) for irq in os.listdir(SYS_CLASS_NET_DIR / interface_name / 'device' / 'msi_irqs')]
+        except OSError:
+            msi_irqs = []
+
+        return QueueStatistics.find_interface_irqs(interface_name, self._read_interrupts(), msi_irqs)
+
+    def update_interface_cpu_affinity(self, interface_name: InterfaceName, cpus: list[int] | None = None,
+                                      rfs_flow_entries: int | None = None, negate: bool = False) -> StatusResult:
+        """
+        Spread the queues of an interface across CPUs and store the setting.
+
+        Args:
+            interface_name (str): The name of the interface.
+            cpus (list[int] | None): The CPUs to use, None for every online CPU (auto).
+            rfs_flow_entries (int | None): The RFS flow table size, None for the default.
+            negate (bool): Return the interface to the kernel defaults.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if negate:
+            if self.del_db_cpu_affinity(interface_name):
+                self.log.error(f"Unable to remove cpu affinity of interface {interface_name} from DB")
+                return STATUS_NOK
+
+            return self.reset_cpu_affinity(interface_name)
+
+        online_cpus = self.get_online_cpus()
+
+        if cpus is not None and (not cpus or not set(cpus) <= set(online_cpus)):
+            self.log.error(f"CPUs {cpus} are not online ({RangeList.compress(online_cpus)})")
+            return STATUS_NOK
+
+        if self.update_db_cpu_affinity(interface_name, 'auto' if cpus is None else RangeList.compress(cpus), rfs_flow_entries):
+            self.log.error(f"Unable to store cpu affinity of interface {interface_name} in DB")
+            return STATUS_NOK
+
+        return self.apply_cpu_affinity(interface_name, cpus or online_cpus,
+                                       rfs_flow_entries or CpuAffinityBatch.DEFAULT_RFS_FLOW_ENTRIES)
+
+    def apply_cpu_affinity(self, interface_name: InterfaceName, cpus: list[int], rfs_flow_entries: int) -> StatusResult:
+        """
+        Spread the queues of an interface across `cpus`, in one shell-out.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        rx_queues, tx_queues = self.get_interface_queues(interface_name)
+        plan = CpuAffinityBatch.plan(cpus, rx_queues, tx_queues, self.get_interface_irqs(interface_name), rfs_flow_entries)
+        return self._run_plan(interface_name, plan)
+
+    def reset_cpu_affinity(self, interface_name: InterfaceName) -> StatusResult:
+        """
+        Return the interrupts and queues of an interface to the kernel defaults.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        rx_queues, tx_queues = self.get_interface_queues(interface_name)
+        plan = CpuAffinityBatch.reset(self.get_online_cpus(), rx_queues, tx_queues, self.get_interface_irqs(interface_name))
+        return self._run_plan(interface_name, plan)
+
+    def get_rps_sock_flow_entries(self) -> int:
+        """
+        Size the global RFS socket flow table from the stored CPU affinity of every interface.
+
+        Returns:
+            int: The largest RFS flow table size of the interfaces that use RPS, 0 if none does.
+        """
+        online_cpus = self.get_online_cpus()
+        entries = [0]
+
+        for affinity in self.get_db_cpu_affinities():
+            try:
+                cpus = online_cpus if affinity['CpuList'] == 'auto' else RangeList.parse(affinity['CpuList'], 0, CpuAffinityBatch.MAX_CPU)
+
+            except ValueError as e:
+                self.log.error(f"Invalid cpu affinity of interface {affinity['InterfaceName']}: {e}")
+                continue
+
+            rx_queues, _ = self.get_interface_queues(affinity['InterfaceName'])
+
+            if CpuAffinityBatch.rps_enabled(cpus, rx_queues):
+                entries.append(affinity['RfsFlowEntries'] or CpuAffinityBatch.DEFAULT_RFS_FLOW_ENTRIES)
+
+        return max(entries)
+
+    def get_interface_queue_distribution(self, interface_name: InterfaceName) -> tuple[list[dict], list[dict]]:
+        """
+        Collect the per-queue settings and counters and the per-CPU load of an interface.
+
+        Returns:
+            tuple[list[dict], list[dict]]:
+                - [{'Queue', 'IRQ', 'IRQ CPUs', 'RPS/XPS CPUs', 'RFS Flows', 'Packets'}], the queue
+                  interrupts are matched to the queues in order (combined rx/tx channels)
+                - [{'CPU', 'Interrupts', 'Processed', 'Dropped', 'TimeSqueeze', 'ReceivedRps'}]
+        """
+        queues_dir = SYS_CLASS_NET_DIR / interface_name / 'queues'
+        rx_queues, tx_queues = self.get_interface_queues(interface_name)
+        interrupts = self._read_interrupts()
+        irqs = self.get_interface_irqs(interface_name)
+
+        packets = {}
+
+        if shutil.which('ethtool'):
+            result = self.run(['ethtool', '-S', interface_name], suppress_error=True, sudo=False)
+            packets = QueueStatistics.parse_ethtool_queue_packets(result.stdout) if not result.exit_code else {}
+
+        queue_rows = []
+
+        for queue in rx_queues + tx_queues:
+            index = int(queue[3:])
+            irq = irqs[index] if index < len(irqs) else None
+            steering = 'rps_cpus' if queue.startswith('rx') else 'xps_cpus'
+
+            queue_rows.append({
+                'Queue': queue,
+                'IRQ': irq if irq is not None else '-',
+                'IRQ CPUs': self._read_text(PROC_IRQ_DIR / str(irq) / 'smp_affinity_list') if irq is not None else '-',
+                'RPS/XPS CPUs': RangeList.compress(CpuAffinityBatch.parse_cpu_mask(self._read_text(queues_dir / queue / steering)))
+                                or '-',
+                'RFS Flows': self._read_int(queues_dir / queue / 'rps_flow_cnt') if queue.startswith('rx') else '-',
+                'Packets': packets.get(queue, '-'),
+            })
+
+        cpu_rows = []
+
+        for softnet in QueueStatistics.parse_softnet_stat(self._read_text(PROC_SOFTNET_STAT_FILE)):
+            cpu_rows.append({
+                'CPU': softnet['CPU'],
+                'Interrupts': sum(interrupts[irq]['Counts'].get(softnet['CPU'], 0) for irq in irqs),
+                'Processed': softnet['Processed'],
+                'Dropped': softnet['Dropped'],
+                'TimeSqueeze': softnet['TimeSqueeze'],
+                'ReceivedRps': softnet['ReceivedRps'],
+            })
+
+        return queue_rows, cpu_rows
+
+    def _read_interrupts(self) -> dict[int, dict]:
+        return QueueStatistics.parse_proc_interrupts(self._read_text(PROC_INTERRUPTS_FILE))
+
+    def _read_text(self, path: Path) -> str:
+        try:
+            return path.read_text().strip()
+
+        except OSError as e:
+            self.log.debug(f"Unable to read {path}: {e}")
+            return ''
+
+    def _read_int(self, path: Path) -> int:
+        text = self._read_text(path)
+        return int(text) if text.isdigit() else 0
+
+    def _run_plan(self, interface_name: InterfaceName, plan: CpuAffinityPlan) -> StatusResult:
+        """
+        Apply the plan of an interface together with the global rps_sock_flow_entries, which is
+        sized from every interface and only written when it changes. Its value from before RFS
+        was enabled is kept in the DB, so it is restored after a RouterShell restart too.
+        """
+        sock_flow_entries = PROC_SYS_NET_CORE_DIR / 'rps_sock_flow_entries'
+        current = self._read_int(sock_flow_entries)
+        entries = self.get_rps_sock_flow_entries()
+        previously_saved = saved = self.get_db_saved_rps_sock_flow_entries()
+
+        if entries and saved is None:
+            saved = current
+
+        elif not entries and saved is not None:
+            entries, saved = saved, None
+
+        else:
+            entries = entries or current
+
+        writes = CpuAffinityBatch.writes(interface_name, plan._replace(rps_sock_flow_entries=0))
+
+        if entries != current:
+            writes.insert(0, (sock_flow_entries, str(entries)))
+
+        if self._run_writes(interface_name, writes):
+            return STATUS_NOK
+
+        if saved != previously_saved and self.update_db_saved_rps_sock_flow_entries(saved):
+            self.log.error("Unable to store the saved rps_sock_flow_entries in DB")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def _run_writes(self, interface_name: InterfaceName, writes: list[tuple[Path, str]]) -> StatusResult:
+        if not writes:
+            return STATUS_OK
+
+        result = self.run(['sh', '-s'], stdin=CpuAffinityBatch.script(writes))
+
+        if result.exit_code:
+            self.log.error(f"Unable to apply cpu affinity of interface {interface_name}: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
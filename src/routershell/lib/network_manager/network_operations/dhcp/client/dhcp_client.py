@@ -1,16 +1,20 @@
 import logging
 import re
 
-from routershell.lib.common.constants import STATUS_NOK
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import InterfaceName, StatusResult
 from routershell.lib.db.dhcp_client_db import DHCPClientDatabase
+from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client_jobs import (
+    DHCPClientJobs,
+    DHCPClientJobStatus,
+)
 from routershell.lib.network_manager.network_operations.dhcp.client.supported_dhcp_clients import (
     DHCPClientFactory,
     DHCPClientOperations,
 )
 from routershell.lib.network_manager.network_operations.dhcp.common.dhcp_common import DHCPStackVersion, DHCPStatus
-from routershell.lib.system.init_system import InitSystemChecker, SysV
+from routershell.lib.system.log_reader import LogEntry, LogReader, SystemLogs
 
 
 class DHCPClientException(Exception):
@@ -42,9 +46,10 @@ class DHCPClient(DHCPClientDatabase):
         _last_status (DHCPClientStatus): The last status of the DHCP client.
 
     Methods:
-        start(): Start the DHCP client with the configured stack version.
+        start(): Start the DHCP client with the configured stack version in the background.
         stop(): Stop the DHCP client.
-        restart(): Restart the DHCP client service.
+        restart(): Restart the DHCP client service in the background.
+        get_client_status(): Get the state and lease of the DHCP client of every interface.
         get_flow_log(): Retrieve DHCP client flow logs from the system journal.
         get_last_status(): Get the last status of the DHCP client.
     """
@@ -76,16 +81,19 @@ class DHCPClient(DHCPClientDatabase):
                 
     def start(self) -> StatusResult:
         """
-        Start the DHCP client with the configured stack version.
+        Store the DHCP client and start it in the background, the external client blocks
+        until it obtained a lease. The progress is tracked by `DHCPClientJobs`, configuration
+        depending on the lease waits with `DHCPClientJobs().wait_ready()`.
 
         Returns:
-            StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
+            StatusResult: STATUS_OK if the DHCP client was stored and started, STATUS_NOK otherwise.
         """
         self.log.debug(f'Start DHCP client on interface {self._dhcp_client.get_interface()}')
-        if self._dhcp_client.start():
+        if self.update_db_dhcp_client(self._dhcp_client.get_interface(), self._dhcp_stack_version):
             return STATUS_NOK
-        
-        return self.update_db_dhcp_client(self._dhcp_client.get_interface(), self._dhcp_stack_version)
+
+        DHCPClientJobs().submit(self._dhcp_client, self._dhcp_client.start)
+        return STATUS_OK
         
     def stop(self) -> StatusResult:
         """
@@ -95,6 +103,8 @@ class DHCPClient(DHCPClientDatabase):
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
         self.log.debug(f'Stop DHCP client on interface {self._dhcp_client.get_interface()}')
+        DHCPClientJobs().discard(self._dhcp_client.get_interface())
+
         if self._dhcp_client.stop():
             return STATUS_NOK
         
@@ -102,34 +112,70 @@ class DHCPClient(DHCPClientDatabase):
     
     def restart(self) -> StatusResult:
         """
-        Restart the DHCP client service.
+        Restart the DHCP client service in the background, see `start()`.
 
         Returns:
-            StatusResult: STATUS_OK if the DHCP client service restart was successful, STATUS_NOK otherwise.
+            StatusResult: STATUS_OK once the restart was started.
         """        
-        return self._dhcp_client.restart()
+        DHCPClientJobs().submit(self._dhcp_client, self._dhcp_client.restart)
+        return STATUS_OK
 
     @staticmethod
-    def get_flow_log() -> list[dict]:
+    def get_client_status() -> list[DHCPClientJobStatus]:
+        """
+        Get the state and lease of the DHCP client of every interface.
+
+        Returns:
+            list[DHCPClientJobStatus]: One entry per interface, ordered by interface.
+        """
+        return DHCPClientJobs().get_status()
+
+    @staticmethod
+    def flow_log_reader() -> LogReader:
+        """The reader of the DHCP flow (DORA) entries of the system journal or syslog."""
+        return SystemLogs().reader('dhcp-flow', DHCPClientLogParser.IDENTIFIERS, DHCPClientLogParser.FLOW_PATTERN)
+
+    @staticmethod
+    def get_flow_log(count: int = LogReader.DEFAULT_LAST, consumer: str = 'dhcp-flow-log') -> list[dict]:
         """
         Retrieve DHCP client flow logs (DORA/SAAR) from the system journal.
 
+        Args:
+            count (int): The number of last flow entries.
+            consumer (str): The consumer whose cursor is advanced.
+
         Returns:
             list[dict]: A list of DHCP client flow log entries.
         """
-        isc = InitSystemChecker()
-        
-        if isc.is_sysv():
-            dhcp_msgs = SysV().get_messages("DHCP")
-            return [DHCPClientLogParser.parse_log_line(line) for line in dhcp_msgs if line.strip()]
-                    
-        elif isc.is_systemd():
-            return []
-            
-        return []
+        return [DHCPClientLogParser.parse_entry(entry) for entry in DHCPClient.flow_log_reader().last(consumer, count)]
 
 class DHCPClientLogParser:
-    
+
+    IDENTIFIERS = ('dnsmasq-dhcp',)
+    FLOW_PATTERN = r'DHCP(?:DISCOVER|OFFER|REQUEST|ACK)\('
+
+    # Example log line:
+    # Jul 26 14:48:41 Router daemon.info dnsmasq-dhcp[573]: DHCPDISCOVER(eth4) 192.168.100.90 94:c6:91:15:14:3e
+    LOG_LINE = re.compile(r"(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+"
+                          r"(?P<host>\w+).*"
+                          r"(?P<dhcp>DHCPDISCOVER|DHCPOFFER|DHCPREQUEST|DHCPACK)"
+                          r"\((?P<interface>\w+)\)\s+"
+                          r"(?P<ip_address>\d+\.\d+\.\d+\.\d+)?\s*"
+                          r"(?P<mac_address>[0-9a-f:]{17})")
+
+    @staticmethod
+    def parse_entry(entry: LogEntry) -> dict:
+        """
+        Parses a log entry of the system journal or syslog into its components.
+
+        Args:
+            entry (LogEntry): The log entry to parse.
+
+        Returns:
+            dict: A dictionary with the parsed components.
+        """
+        return DHCPClientLogParser.parse_log_line(str(entry))
+
     @staticmethod
     def parse_log_line(line: str) -> dict:
         """
@@ -141,16 +187,7 @@ class DHCPClientLogParser:
         Returns:
             dict: A dictionary with the parsed components.
         """
-        # Example log line:
-        # Jul 26 14:48:41 Router daemon.info dnsmasq-dhcp[573]: DHCPDISCOVER(eth4) 192.168.100.90 94:c6:91:15:14:3e
-        regex = (r"(?P<timestamp>\w+\s+\d+\s+\d+:\d+:\d+)\s+"
-                 r"(?P<host>\w+).*"
-                 r"(?P<dhcp>DHCPDISCOVER|DHCPOFFER|DHCPREQUEST|DHCPACK)"
-                 r"\((?P<interface>\w+)\)\s+"
-                 r"(?P<ip_address>\d+\.\d+\.\d+\.\d+)?\s*"
-                 r"(?P<mac_address>[0-9a-f:]{17})")
-                
-        match = re.match(regex, line)
+        match = DHCPClientLogParser.LOG_LINE.match(line)
         
         if match:
             return match.groupdict()
@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import InterfaceName, PredicateResult, StatusResult
+from routershell.lib.network_manager.network_operations.dhcp.client.supported_dhcp_clients import (
+    DHCPClientLease,
+    DHCPClientOperations,
+)
+from routershell.lib.network_manager.network_operations.dhcp.common.dhcp_common import DHCPStackVersion
+
+
+class DHCPClientState(Enum):
+    """
+    The state of the DHCP client of an interface.
+
+    - `REQUESTING`: The client was started and has not obtained a lease yet.
+    - `BOUND`: The client obtained a lease.
+    - `FAILED`: The client exited without a lease.
+    """
+    REQUESTING = 'Requesting'
+    BOUND = 'Bound'
+    FAILED = 'Failed'
+
+
+class DHCPClientJobStatus(NamedTuple):
+    """
+    A snapshot of the DHCP client of an interface for `show ip dhcp client`.
+
+    Attributes:
+        interface_name (InterfaceName): The interface.
+        stack_version (DHCPStackVersion): The DHCP stack version of the client.
+        client (str): The external DHCP client, e.g. `dhcpcd`.
+        state (DHCPClientState): The state of the client.
+        started (float): The epoch time the client was started.
+        finished (float | None): The epoch time the client obtained a lease or failed.
+        lease (DHCPClientLease | None): The lease of a bound client, when the client reports it.
+    """
+    interface_name: InterfaceName
+    stack_version: DHCPStackVersion
+    client: str
+    state: DHCPClientState
+    started: float
+    finished: float | None
+    lease: DHCPClientLease | None
+
+
+class _DHCPClientJob:
+
+    def __init__(self, client: DHCPClientOperations):
+        self.client = client
+        self.state = DHCPClientState.REQUESTING
+        self.started = time.time()
+        self.finished: float | None = None
+        self.ready = threading.Event()
+
+
+class DHCPClientJobs(metaclass=Singleton):
+    """
+    Run the external DHCP clients (udhcpc, dhcpcd, dhclient) in the background, one thread per
+    interface, so that the clients of several interfaces request their lease in parallel instead
+    of blocking the CLI, or the startup configuration, until each obtained a lease.
+
+    The state of each interface is tracked, configuration that depends on a DHCP address waits
+    on the readiness of the client with `wait_ready()` instead.
+    """
+
+    READY_TIMEOUT = 30.0
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DHCP_CLIENT_JOBS)
+
+        self._lock = threading.Lock()
+        self._jobs: dict[InterfaceName, _DHCPClientJob] = {}
+
+    def submit(self, client: DHCPClientOperations, action: Callable[[], StatusResult]) -> None:
+        """
+        Run a start or restart of a DHCP client in the background, replacing the job of the interface.
+
+        Args:
+            client (DHCPClientOperations): The DHCP client of the interface.
+            action (Callable[[], StatusResult]): The blocking operation, e.g. `client.start`.
+        """
+        interface_name = client.get_interface()
+        job = _DHCPClientJob(client)
+
+        with self._lock:
+            previous = self._jobs.get(interface_name)
+            self._jobs[interface_name] = job
+
+        if previous:
+            # Waiters of the replaced job re-check the new one
+            previous.ready.set()
+
+        self.log.debug(f"submit() -> {interface_name}: {client.get_dhcp_client().value}")
+        threading.Thread(target=self._run, args=(interface_name, job, action),
+                         name=f"dhcp-client-{interface_name}", daemon=True).start()
+
+    def _run(self, interface_name: InterfaceName, job: _DHCPClientJob, action: Callable[[], StatusResult]) -> None:
+        try:
+            failed = action()
+        except Exception as e:
+            self.log.error(f"DHCP client on interface {interface_name} failed: {e}")
+            failed = True
+
+        with self._lock:
+            if self._jobs.get(interface_name) is not job:
+                # Stopped or restarted meanwhile
+                return
+
+            job.state = DHCPClientState.FAILED if failed else DHCPClientState.BOUND
+            job.finished = time.time()
+
+        if failed:
+            self.log.error(f"DHCP client on interface {interface_name} did not obtain a lease")
+        else:
+            self.log.info(f"DHCP client on interface {interface_name} obtained a lease")
+
+        job.ready.set()
+
+    def discard(self, interface_name: InterfaceName) -> None:
+        """
+        Forget the job of an interface whose DHCP client is stopped, its waiters are released.
+        """
+        with self._lock:
+            job = self._jobs.pop(interface_name, None)
+
+        if job:
+            job.ready.set()
+
+    def get_state(self, interface_name: InterfaceName) -> DHCPClientState | None:
+        """
+        Returns:
+            DHCPClientState | None: The state of the DHCP client of the interface, None without a DHCP client.
+        """
+        with self._lock:
+            job = self._jobs.get(interface_name)
+            return job.state if job else None
+
+    def get_requesting(self) -> list[InterfaceName]:
+        """
+        Returns:
+            list[InterfaceName]: The interfaces whose DHCP client has not obtained a lease yet.
+        """
+        with self._lock:
+            return [interface_name for interface_name, job in self._jobs.items() if job.state == DHCPClientState.REQUESTING]
+
+    def wait_ready(self, interface_names: list[InterfaceName] | None = None,
+                   timeout: float = READY_TIMEOUT) -> PredicateResult:
+        """
+        Wait until the DHCP clients of the interfaces, of every interface when None, obtained
+        a lease or failed.
+
+        Args:
+            interface_names (list[InterfaceName] | None): The interfaces to wait for.
+            timeout (float): The maximum seconds to wait.
+
+        Returns:
+            PredicateResult: True if no client is requesting a lease anymore, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                pending = [job for interface_name, job in self._jobs.items()
+                           if job.state == DHCPClientState.REQUESTING
+                           and (interface_names is None or interface_name in interface_names)]
+
+            if not pending:
+                return True
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                self.log.warning(f"DHCP clients still requesting a lease: "
+                                 f"{', '.join(job.client.get_interface() for job in pending)}")
+                return False
+
+            pending[0].ready.wait(remaining)
+
+    def get_status(self) -> list[DHCPClientJobStatus]:
+        """
+        Returns:
+            list[DHCPClientJobStatus]: A snapshot of the DHCP client of every interface, ordered by interface.
+        """
+        with self._lock:
+            jobs = sorted(self._jobs.items())
+
+        status = []
+
+        for interface_name, job in jobs:
+            state, finished = job.state, job.finished
+            lease = job.client.get_lease(finished) if state == DHCPClientState.BOUND else None
+            status.append(DHCPClientJobStatus(interface_name, job.client.get_dhcp_stack_version(),
+                                              job.client.get_dhcp_client().value, state, job.started, finished, lease))
+
+        return status
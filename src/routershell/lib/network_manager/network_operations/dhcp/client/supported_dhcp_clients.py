@@ -1,9 +1,13 @@
+import calendar
 import ipaddress
 import logging
+import re
 import shutil
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 from ipaddress import ip_address
+from typing import NamedTuple
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
@@ -60,6 +64,37 @@ class SupportedDhcpClientsDHCPVersion(Enum):
     DHCLIENT_V4 = 'dhclient'
     DHCLIENT_V6 = 'dhclient'
 
+class DHCPClientLease(NamedTuple):
+    """
+    The DHCPv4 lease a DHCP client holds on an interface.
+
+    Attributes:
+        address (str | None): The leased address.
+        lease_time (int | None): The lease time in seconds.
+        renew (float | None): The epoch time the client renews the lease (T1).
+        rebind (float | None): The epoch time the client rebinds the lease (T2).
+        expires (float | None): The epoch time the lease expires.
+    """
+    address: str | None
+    lease_time: int | None
+    renew: float | None
+    rebind: float | None
+    expires: float | None
+
+    @classmethod
+    def from_times(cls, address: str | None, obtained: float, lease_time: int | None,
+                   renewal_time: int | None = None, rebinding_time: int | None = None) -> 'DHCPClientLease':
+        """
+        Build a lease from times relative to when it was obtained, T1 and T2 default to
+        0.5 and 0.875 of the lease time (RFC 2131).
+        """
+        if lease_time is None:
+            return cls(address, None, None, None, None)
+
+        renewal_time = lease_time * 0.5 if renewal_time is None else renewal_time
+        rebinding_time = lease_time * 0.875 if rebinding_time is None else rebinding_time
+        return cls(address, lease_time, obtained + renewal_time, obtained + rebinding_time, obtained + lease_time)
+
 class DHCPClientFactory:
     """
     A factory class to get the supported DHCP client based on the interface name and optional override.
@@ -394,6 +429,19 @@ class DHCPClientOperations(ABC, RunCommand):
         """
         return self._last_dhcp_client_status
 
+    def get_lease(self, obtained: float) -> DHCPClientLease | None:
+        """
+        Get the DHCPv4 lease the client holds on the interface.
+
+        Args:
+            obtained (float): The epoch time the client obtained the lease, for clients that only
+                              report times relative to it.
+
+        Returns:
+            DHCPClientLease | None: The lease, None when the client does not report its lease.
+        """
+        return None
+
     def _execute_command(self, command: list[str]) -> StatusResult:
         """
         Executes a shell command and logs the result.
@@ -442,10 +490,13 @@ class DHCPClientOperations_udhcpc(DHCPClientOperations):
         """
         Configure the interface with IPv4 settings using udhcpc.
 
+        udhcpc runs in the foreground until it is killed, with `-b` it returns once it obtained a
+        lease, or goes to the background when none is offered.
+
         Returns:
             StatusResult: STATUS_OK if the operation is successful, STATUS_NOK otherwise.
         """
-        return self._execute_command(['udhcpc', '-i', self._interface_name])
+        return self._execute_command(['udhcpc', '-i', self._interface_name, '-b'])
     
     def set_inet6(self) -> StatusResult:
         """
@@ -521,10 +572,12 @@ class DHCPClientOperations_udhcpc6(DHCPClientOperations):
         """
         Configure the interface with IPv6 settings using udhcpc6.
 
+        As udhcpc, udhcpc6 returns once it obtained a lease, or goes to the background, with `-b`.
+
         Returns:
             StatusResult: STATUS_OK if the operation is successful, STATUS_NOK otherwise.
         """
-        return self._execute_command(['udhcpc6', '-i', self._interface_name])
+        return self._execute_command(['udhcpc6', '-i', self._interface_name, '-b'])
     
     def start(self) -> StatusResult:
         """
@@ -604,6 +657,46 @@ class DHCPClientOperations_dhcpcd(DHCPClientOperations):
         """
         return self._execute_command(['dhcpcd', '-6', self._interface_name])
     
+    def get_lease(self, obtained: float) -> DHCPClientLease | None:
+        """
+        Get the DHCPv4 lease of the interface from `dhcpcd --dumplease`.
+        """
+        result: RunResult = self.run(['dhcpcd', '-4', '--dumplease', self._interface_name], suppress_error=True)
+
+        if result.exit_code:
+            return None
+
+        return self.parse_dumplease(result.stdout, obtained)
+
+    @staticmethod
+    def parse_dumplease(dump: str, obtained: float) -> DHCPClientLease | None:
+        """
+        Parse the `key='value'` lines of `dhcpcd --dumplease`.
+
+        Args:
+            dump (str): The output of `dhcpcd --dumplease`.
+            obtained (float): The epoch time the lease was obtained.
+
+        Returns:
+            DHCPClientLease | None: The lease, None without a leased address.
+        """
+        values = {}
+
+        for line in dump.splitlines():
+            key, separator, value = line.partition('=')
+
+            if separator:
+                values[key.strip()] = value.strip().strip("'\"")
+
+        if 'ip_address' not in values:
+            return None
+
+        def seconds(key: str) -> int | None:
+            return int(values[key]) if values.get(key, '').isdigit() else None
+
+        return DHCPClientLease.from_times(values['ip_address'], obtained, seconds('dhcp_lease_time'),
+                                          seconds('dhcp_renewal_time'), seconds('dhcp_rebinding_time'))
+
     def stop(self) -> StatusResult:
         """
         Stop the DHCP client (dhcpcd) on the interface.
@@ -635,6 +728,11 @@ class DHCPClientOperations_dhcpcd(DHCPClientOperations):
         return None
 
 class DHCPClientOperations_dhclient(DHCPClientOperations):
+
+    LEASE_FILE = '/var/lib/dhcp/dhclient.leases'
+    LEASE_BLOCK = re.compile(r'lease\s*\{(.*?)\}', re.DOTALL)
+    LEASE_FIELD = re.compile(r'^\s*(fixed-address|option dhcp-lease-time|renew|rebind|expire)\s+([^;]+);', re.MULTILINE)
+
     def __init__(self, interface_name: InterfaceName, dhcp_stack_version: DHCPStackVersion):
         """
         Initialize the DHCPClient_dhclient with a network interface name.
@@ -673,6 +771,48 @@ class DHCPClientOperations_dhclient(DHCPClientOperations):
         """
         return self._execute_command(['dhclient', '-6', self._interface_name])
         
+    def get_lease(self, obtained: float) -> DHCPClientLease | None:
+        """
+        Get the DHCPv4 lease of the interface from the dhclient lease file.
+        """
+        try:
+            with open(self.LEASE_FILE) as lease_file:
+                return self.parse_lease_file(lease_file.read(), self._interface_name)
+
+        except OSError as e:
+            self.log.debug(f"Unable to read {self.LEASE_FILE}: {e}")
+            return None
+
+    @classmethod
+    def parse_lease_file(cls, text: str, interface_name: InterfaceName) -> DHCPClientLease | None:
+        """
+        Parse the last lease of an interface in a dhclient lease file, dhclient appends
+        each new lease and writes the times in UTC.
+
+        Args:
+            text (str): The content of the lease file.
+            interface_name (str): The interface of the lease.
+
+        Returns:
+            DHCPClientLease | None: The lease, None when the interface has no lease.
+        """
+        leases = [block for block in cls.LEASE_BLOCK.findall(text) if f'interface "{interface_name}";' in block]
+
+        if not leases:
+            return None
+
+        fields = dict(cls.LEASE_FIELD.findall(leases[-1]))
+
+        def epoch(key: str) -> float | None:
+            if key not in fields:
+                return None
+            return float(calendar.timegm(time.strptime(fields[key].split(' ', 1)[1], '%Y/%m/%d %H:%M:%S')))
+
+        lease_time = fields.get('option dhcp-lease-time')
+
+        return DHCPClientLease(fields.get('fixed-address'), int(lease_time) if lease_time and lease_time.isdigit() else None,
+                               epoch('renew'), epoch('rebind'), epoch('expire'))
+
     def stop(self) -> StatusResult:
         """
         Stop the DHCP client (dhclient) on the interface.
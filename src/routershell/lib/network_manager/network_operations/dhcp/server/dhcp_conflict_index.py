@@ -0,0 +1,224 @@
+import ipaddress
+import logging
+import threading
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.interval_tree import IntervalTree
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import DhcpPoolName, InetAddressText, InetCidrText, MacAddressText
+from routershell.lib.db.dhcp_server_db import DHCPServerDatabase as DSD
+
+
+class DhcpEntryType(Enum):
+    SUBNET = 'subnet'
+    RANGE = 'range'
+    RESERVATION = 'reservation'
+
+
+class DhcpPoolEntry(NamedTuple):
+    """
+    A subnet, range or reservation of a DHCP pool, as held by the conflict index.
+
+    Attributes:
+        entry_type (DhcpEntryType): The kind of entry.
+        pool (DhcpPoolName): The DHCP pool of the entry.
+        start (InetAddressText): The first address of the entry.
+        end (InetAddressText): The last address of the entry, the start for a reservation.
+        hw_address (MacAddressText | None): The hardware address of a reservation.
+    """
+    entry_type: DhcpEntryType
+    pool: DhcpPoolName
+    start: InetAddressText
+    end: InetAddressText
+    hw_address: MacAddressText | None = None
+
+    def __str__(self) -> str:
+        if self.entry_type == DhcpEntryType.SUBNET:
+            network = ipaddress.summarize_address_range(ipaddress.ip_address(self.start), ipaddress.ip_address(self.end))
+            return f"subnet {next(network)} of DHCP pool {self.pool}"
+
+        if self.entry_type == DhcpEntryType.RANGE:
+            return f"range {self.start}-{self.end} of DHCP pool {self.pool}"
+
+        return f"reservation {self.start} ({self.hw_address}) of DHCP pool {self.pool}"
+
+
+class DhcpConflict(NamedTuple):
+    """
+    An entry rejected because it overlaps an entry of the DHCP configuration.
+
+    Attributes:
+        entry (DhcpPoolEntry): The entry being added.
+        existing (DhcpPoolEntry): The configured entry it overlaps.
+    """
+    entry: DhcpPoolEntry
+    existing: DhcpPoolEntry
+
+    def __str__(self) -> str:
+        return f"{self.entry} overlaps {self.existing}"
+
+
+class DhcpConflictIndex(metaclass=Singleton):
+    """
+    The subnets, ranges and reservations of every DHCP pool, one interval tree per address family
+    and entry type, loaded once from the DB and kept up to date as entries are added and removed.
+
+    An entry conflicts with:
+        - a subnet of another pool it overlaps,
+        - a range it overlaps, reservations excepted (a reservation may sit in a range of its own pool),
+        - a reservation of the same address,
+        - for a range, the reservations of other pools it holds.
+    Re-adding an indexed entry is not a conflict.
+    """
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DHCP_SERVER)
+
+        self._lock = threading.RLock()
+        self._trees: dict[tuple[int, DhcpEntryType], IntervalTree[DhcpPoolEntry]] = {}
+        self._loaded = False
+
+    def load(self) -> None:
+        """Rebuild the index from the DHCP pools of the DB."""
+        dsd = DSD()
+
+        with self._lock:
+            self._trees = {(version, entry_type): IntervalTree() for version in (4, 6) for entry_type in DhcpEntryType}
+            self._loaded = True
+
+            for pool in dsd.dhcp_pool_name_list():
+                subnet = dsd.get_dhcp_pool_subnet_name_db(pool)
+
+                if subnet:
+                    self._add(self._subnet_entry(pool, subnet))
+
+                for inet_range in dsd.get_dhcp_pool_inet_range_db(pool):
+                    if inet_range['inet_start'] and inet_range['inet_end']:
+                        self._add(self._range_entry(pool, inet_range['inet_start'], inet_range['inet_end']))
+
+                for reservation in dsd.get_dhcp_pool_reservation_db(pool):
+                    if reservation['inet_address']:
+                        self._add(self._reservation_entry(pool, reservation['mac_address'], reservation['inet_address']))
+
+            self.log.debug(f"DHCP conflict index loaded: "
+                           f"{sum(len(tree) for tree in self._trees.values())} entries")
+
+    def check_subnet(self, pool: DhcpPoolName, subnet_cidr: InetCidrText) -> list[DhcpConflict]:
+        """
+        Return the conflicts of a DHCP pool subnet, the subnets of other pools it overlaps.
+        """
+        return self._conflicts(self._subnet_entry(pool, subnet_cidr))
+
+    def check_range(self, pool: DhcpPoolName, inet_start: InetAddressText, inet_end: InetAddressText) -> list[DhcpConflict]:
+        """
+        Return the conflicts of a DHCP pool range: the subnets of other pools, the ranges
+        and the reservations of other pools it overlaps.
+        """
+        return self._conflicts(self._range_entry(pool, inet_start, inet_end))
+
+    def check_reservation(self, pool: DhcpPoolName, hw_address: MacAddressText,
+                          inet_address: InetAddressText) -> list[DhcpConflict]:
+        """
+        Return the conflicts of a DHCP pool reservation: the subnets and ranges of other pools
+        holding the address and the other reservations of the address.
+        """
+        return self._conflicts(self._reservation_entry(pool, hw_address, inet_address))
+
+    def add_subnet(self, pool: DhcpPoolName, subnet_cidr: InetCidrText) -> None:
+        """Index the subnet of a DHCP pool, replacing its previous subnet."""
+        entry = self._subnet_entry(pool, subnet_cidr)
+
+        with self._lock:
+            self._ensure_loaded()
+            tree = self._trees[(ipaddress.ip_address(entry.start).version, DhcpEntryType.SUBNET)]
+
+            for start, end, existing in list(tree):
+                if existing.pool == pool:
+                    tree.remove(start, end, existing)
+
+            self._add(entry)
+
+    def add_range(self, pool: DhcpPoolName, inet_start: InetAddressText, inet_end: InetAddressText) -> None:
+        """Index a range of a DHCP pool."""
+        self._add_once(self._range_entry(pool, inet_start, inet_end))
+
+    def add_reservation(self, pool: DhcpPoolName, hw_address: MacAddressText, inet_address: InetAddressText) -> None:
+        """Index a reservation of a DHCP pool."""
+        self._add_once(self._reservation_entry(pool, hw_address, inet_address))
+
+    def remove_pool(self, pool: DhcpPoolName) -> None:
+        """Remove the entries of a deleted DHCP pool."""
+        with self._lock:
+            self._ensure_loaded()
+
+            for tree in self._trees.values():
+                for start, end, entry in [interval for interval in tree if interval[2].pool == pool]:
+                    tree.remove(start, end, entry)
+
+    def _conflicts(self, entry: DhcpPoolEntry) -> list[DhcpConflict]:
+        with self._lock:
+            self._ensure_loaded()
+            conflicts = []
+
+            for existing in self._overlapping(entry, DhcpEntryType.SUBNET):
+                if existing.pool != entry.pool:
+                    conflicts.append(DhcpConflict(entry, existing))
+
+            if entry.entry_type == DhcpEntryType.SUBNET:
+                return conflicts
+
+            # Re-adding an entry is not a conflict, the DB keeps it once
+            for existing in self._overlapping(entry, DhcpEntryType.RANGE):
+                if existing != entry and (entry.entry_type == DhcpEntryType.RANGE or existing.pool != entry.pool):
+                    conflicts.append(DhcpConflict(entry, existing))
+
+            for existing in self._overlapping(entry, DhcpEntryType.RESERVATION):
+                if existing != entry and (entry.entry_type == DhcpEntryType.RESERVATION or existing.pool != entry.pool):
+                    conflicts.append(DhcpConflict(entry, existing))
+
+            return conflicts
+
+    def _overlapping(self, entry: DhcpPoolEntry, entry_type: DhcpEntryType) -> list[DhcpPoolEntry]:
+        start, end = ipaddress.ip_address(entry.start), ipaddress.ip_address(entry.end)
+        tree = self._trees[(start.version, entry_type)]
+
+        return [existing for _, _, existing in tree.overlapping(int(start), int(end))]
+
+    def _add_once(self, entry: DhcpPoolEntry) -> None:
+        with self._lock:
+            self._ensure_loaded()
+
+            if entry not in self._overlapping(entry, entry.entry_type):
+                self._add(entry)
+
+    def _add(self, entry: DhcpPoolEntry) -> None:
+        start, end = ipaddress.ip_address(entry.start), ipaddress.ip_address(entry.end)
+        self._trees[(start.version, entry.entry_type)].insert(int(start), int(end), entry)
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    @staticmethod
+    def _subnet_entry(pool: DhcpPoolName, subnet_cidr: InetCidrText) -> DhcpPoolEntry:
+        network = ipaddress.ip_network(subnet_cidr, strict=False)
+        return DhcpPoolEntry(DhcpEntryType.SUBNET, pool, str(network.network_address), str(network.broadcast_address))
+
+    @staticmethod
+    def _range_entry(pool: DhcpPoolName, inet_start: InetAddressText, inet_end: InetAddressText) -> DhcpPoolEntry:
+        start, end = ipaddress.ip_address(inet_start), ipaddress.ip_address(inet_end)
+
+        if start.version != end.version or start > end:
+            raise ValueError(f"Invalid range: {inet_start}-{inet_end}")
+
+        return DhcpPoolEntry(DhcpEntryType.RANGE, pool, str(start), str(end))
+
+    @staticmethod
+    def _reservation_entry(pool: DhcpPoolName, hw_address: MacAddressText,
+                           inet_address: InetAddressText) -> DhcpPoolEntry:
+        address = str(ipaddress.ip_address(inet_address))
+        return DhcpPoolEntry(DhcpEntryType.RESERVATION, pool, address, address,
+                             hw_address.lower() if hw_address else hw_address)
@@ -0,0 +1,370 @@
+import ipaddress
+import logging
+import os
+import select
+import threading
+from typing import NamedTuple
+
+from routershell.lib.common.bitmap_allocator import BitmapAllocator
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChanges, ConfigChangeTopic
+from routershell.lib.common.constants import STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import DhcpPoolName, InetAddressText, StatusResult
+from routershell.lib.db.dhcp_server_db import DHCPServerDatabase as DSD
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DhcpLease, DnsmasqLeaseStore
+
+
+class RangeUtilization(NamedTuple):
+    """
+    The occupancy of a DHCP pool range.
+
+    Attributes:
+        start (InetAddressText): The first address of the range.
+        end (InetAddressText): The last address of the range.
+        size (int): The number of addresses of the range.
+        leased (int): The addresses holding a lease.
+        reserved (int): The addresses reserved to a MAC address.
+        used (int): The addresses leased or reserved.
+        next_free (InetAddressText | None): The lowest address neither leased nor reserved.
+    """
+    start: InetAddressText
+    end: InetAddressText
+    size: int
+    leased: int
+    reserved: int
+    used: int
+    next_free: InetAddressText | None
+
+    @property
+    def free(self) -> int:
+        return self.size - self.used
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.used / self.size
+
+
+class PoolUtilization(NamedTuple):
+    """
+    The occupancy of a DHCP pool, the sum of its ranges.
+
+    Attributes:
+        pool (DhcpPoolName): The DHCP pool name.
+        ranges (list[RangeUtilization]): The occupancy of each range of the pool.
+        alert_percent (int | None): The configured occupancy raising an alert, None when disabled.
+    """
+    pool: DhcpPoolName
+    ranges: list[RangeUtilization]
+    alert_percent: int | None = None
+
+    @property
+    def size(self) -> int:
+        return sum(range_.size for range_ in self.ranges)
+
+    @property
+    def used(self) -> int:
+        return sum(range_.used for range_ in self.ranges)
+
+    @property
+    def free(self) -> int:
+        return self.size - self.used
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.used / self.size if self.size else 0.0
+
+    @property
+    def next_free(self) -> InetAddressText | None:
+        return next((range_.next_free for range_ in self.ranges if range_.next_free), None)
+
+    @property
+    def alert(self) -> bool:
+        return self.alert_percent is not None and self.percent >= self.alert_percent
+
+
+class _SparseAllocator:
+    """
+    The BitmapAllocator interface over a set, for ranges too large for one bit per address
+    (DHCPv6 ranges), which are only ever sparsely used.
+    """
+
+    def __init__(self, first: int, last: int):
+        self.first = first
+        self.last = last
+        self._values: set[int] = set()
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def size(self) -> int:
+        return self.last - self.first + 1
+
+    def next_free(self) -> int | None:
+        value = self.first
+
+        while value in self._values:
+            value += 1
+
+        return value if value <= self.last else None
+
+    def reserve(self, value: int) -> bool:
+        if not self.first <= value <= self.last or value in self._values:
+            return False
+
+        self._values.add(value)
+        return True
+
+    def release(self, value: int) -> None:
+        self._values.discard(value)
+
+
+class _PoolRange:
+    """
+    The leased and used (leased or reserved) addresses of a range, one bit per address.
+    """
+
+    # Larger ranges are tracked sparsely, a bitmap of a /64 would not fit in memory
+    BITMAP_MAX_SIZE = 1 << 24
+
+    def __init__(self, start: ipaddress.IPv4Address | ipaddress.IPv6Address,
+                 end: ipaddress.IPv4Address | ipaddress.IPv6Address):
+        allocator = BitmapAllocator if int(end) - int(start) < self.BITMAP_MAX_SIZE else _SparseAllocator
+
+        self.start = start
+        self.end = end
+        self.leased = allocator(int(start), int(end))
+        self.used = allocator(int(start), int(end))
+        self.reserved: set[int] = set()
+
+    def __contains__(self, value: int) -> bool:
+        return self.leased.first <= value <= self.leased.last
+
+    def reserve(self, value: int) -> None:
+        self.reserved.add(value)
+        self.used.reserve(value)
+
+    def lease(self, value: int) -> None:
+        self.leased.reserve(value)
+        self.used.reserve(value)
+
+    def release(self, value: int) -> None:
+        self.leased.release(value)
+
+        if value not in self.reserved:
+            self.used.release(value)
+
+    def utilization(self) -> RangeUtilization:
+        next_free = self.used.next_free()
+
+        return RangeUtilization(str(self.start), str(self.end), self.used.size(), len(self.leased),
+                                len(self.reserved), len(self.used),
+                                None if next_free is None else str(ipaddress.ip_address(next_free)))
+
+
+class DhcpPoolUtilization(metaclass=Singleton):
+    """
+    The occupancy of the DHCP pools, kept as per-range bitsets of the leased and reserved addresses.
+
+    The bitsets are built from the pool ranges and reservations of the DB and the leases of the
+    lease store, then updated from the leases the lease store adds and removes on each refresh.
+    They are rebuilt only when the pool configuration changes.
+
+    Once started, a daemon thread waits on the inotify descriptor of the lease store and refreshes
+    it, so the alerts are raised as dnsmasq rewrites the lease file, not only on a show command.
+    The thread never reads the DB, the pool configuration is reloaded on the CLI thread from the
+    `ConfigChangeTopic.DHCP_POOL` changes.
+    """
+
+    # Seconds between two refreshes of a lease file polled without inotify
+    POLL_INTERVAL = 5.0
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DHCP_SERVER_MANAGER)
+
+        self._lock = threading.RLock()
+        self._ranges: dict[DhcpPoolName, list[_PoolRange]] = {}
+        self._alert_percent: dict[DhcpPoolName, int | None] = {}
+        self._alerted: set[DhcpPoolName] = set()
+        self._config: dict | None = None
+        self._store = DnsmasqLeaseStore()
+        self._store.add_listener(self._leases_changed)
+        self._thread: threading.Thread | None = None
+        self._wake: tuple[int, int] | None = None
+
+    @staticmethod
+    def handle(changes: ConfigChanges) -> StatusResult:
+        """The `ConfigChangeBus` handler of the DHCP pool utilization."""
+        DhcpPoolUtilization().reload()
+        return STATUS_OK
+
+    def start(self) -> None:
+        """
+        Load the pool configuration and follow the lease file from a daemon thread, if not already.
+        """
+        ConfigChangeBus().subscribe([ConfigChangeTopic.DHCP_POOL], DhcpPoolUtilization.handle)
+        self.reload()
+
+        with self._lock:
+            if self._thread:
+                return
+
+            self._wake = os.pipe()
+            self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop following the lease file."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread:
+            os.write(self._wake[1], b'\0')
+            thread.join()
+
+            for fd in self._wake:
+                os.close(fd)
+
+    def reload(self) -> None:
+        """
+        Rebuild the range bitsets from the DB if the pool configuration changed, and raise the alerts it implies.
+        """
+        self.load(self._read_config())
+        self._check_alerts(self._reports())
+
+    def utilization(self, pool: DhcpPoolName | None = None) -> list[PoolUtilization]:
+        """
+        Retrieve the occupancy of a DHCP pool, or of every DHCP pool.
+
+        Args:
+            pool (DhcpPoolName | None): The DHCP pool, None for every pool.
+
+        Returns:
+            list[PoolUtilization]: The occupancy of the pools, empty if the pool does not exist.
+        """
+        self.load(self._read_config())
+        self._store.refresh()
+
+        reports = self._reports(pool)
+        self._check_alerts(reports)
+
+        return reports
+
+    def load(self, config: dict[DhcpPoolName, dict]) -> None:
+        """
+        Build the range bitsets of the DHCP pools, unless the configuration is unchanged.
+
+        Args:
+            config (dict[DhcpPoolName, dict]): Per pool, its 'ranges' as (start, end) address pairs,
+                its 'reservations' addresses and its 'alert' percent.
+        """
+        with self._lock:
+            if config == self._config:
+                return
+
+            self.log.debug(f"Rebuilding DHCP pool utilization of {len(config)} pools")
+
+            self._config = config
+            self._ranges = {}
+            self._alert_percent = {}
+
+            for pool, pool_config in config.items():
+                ranges = []
+
+                for start, end in pool_config['ranges']:
+                    try:
+                        start, end = ipaddress.ip_address(start), ipaddress.ip_address(end)
+                    except ValueError:
+                        self.log.error(f"Ignoring invalid range {start}-{end} of DHCP pool {pool}")
+                        continue
+
+                    if start.version != end.version or start > end:
+                        self.log.error(f"Ignoring invalid range {start}-{end} of DHCP pool {pool}")
+                        continue
+
+                    ranges.append(_PoolRange(start, end))
+
+                self._ranges[pool] = ranges
+                self._alert_percent[pool] = pool_config.get('alert')
+
+                for address in pool_config.get('reservations', []):
+                    self._apply(address, _PoolRange.reserve)
+
+            for lease in self._store.leases():
+                self._apply(lease.ip_address, _PoolRange.lease)
+
+    def _leases_changed(self, added: list[DhcpLease], removed: list[DhcpLease]) -> None:
+        with self._lock:
+            for lease in removed:
+                self._apply(lease.ip_address, _PoolRange.release)
+
+            for lease in added:
+                self._apply(lease.ip_address, _PoolRange.lease)
+
+        self._check_alerts(self._reports())
+
+    def _run(self) -> None:
+        wake = self._wake[0]
+
+        while True:
+            fileno = self._store.fileno()
+
+            try:
+                # Without inotify, the lease file is polled each POLL_INTERVAL
+                readable, _, _ = select.select([wake] if fileno is None else [wake, fileno], [], [],
+                                               self.POLL_INTERVAL if fileno is None else None)
+
+                if wake in readable:
+                    return
+
+                self._store.refresh()
+
+            except Exception:
+                self.log.exception("DHCP pool utilization failed to refresh the leases")
+
+                if wake in select.select([wake], [], [], self.POLL_INTERVAL)[0]:
+                    return
+
+    def _reports(self, pool: DhcpPoolName | None = None) -> list[PoolUtilization]:
+        with self._lock:
+            return [PoolUtilization(name, [range_.utilization() for range_ in ranges], self._alert_percent[name])
+                    for name, ranges in self._ranges.items() if pool is None or name == pool]
+
+    def _apply(self, address: InetAddressText, operation) -> None:
+        try:
+            value = int(ipaddress.ip_address(address))
+        except ValueError:
+            return
+
+        for ranges in self._ranges.values():
+            for range_ in ranges:
+                if value in range_:
+                    operation(range_, value)
+
+    def _check_alerts(self, reports: list[PoolUtilization]) -> None:
+        # Raised once when the occupancy crosses the threshold, re-armed when it falls back under it
+        with self._lock:
+            for report in reports:
+                if report.alert and report.pool not in self._alerted:
+                    self._alerted.add(report.pool)
+                    self.log.warning(f"DHCP pool {report.pool} utilization {report.percent:.1f}% exceeds "
+                                     f"the {report.alert_percent}% alert threshold, {report.free} addresses free")
+
+                elif not report.alert:
+                    self._alerted.discard(report.pool)
+
+    def _read_config(self) -> dict[DhcpPoolName, dict]:
+        dsd = DSD()
+
+        return {pool: {'ranges': [(inet_range['inet_start'], inet_range['inet_end'])
+                                  for inet_range in dsd.get_dhcp_pool_inet_range_db(pool)
+                                  if inet_range['inet_start'] and inet_range['inet_end']],
+                       'reservations': [reservation['inet_address']
+                                        for reservation in dsd.get_dhcp_pool_reservation_db(pool)
+                                        if reservation['inet_address']],
+                       'alert': dsd.get_dhcp_pool_utilization_alert_db(pool)}
+                for pool in dsd.dhcp_pool_name_list()}
@@ -1,8 +1,7 @@
 import logging
-import os
 
 from routershell.lib.common.common import STATUS_NOK, STATUS_OK
-from routershell.lib.common.constants import DNSMASQ_LEASE_FILE_PATH
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChanges, ConfigChangeTopic
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import (
     DhcpPoolName,
@@ -17,11 +16,17 @@ from routershell.lib.db.dhcp_server_db import DHCPServerDatabase as DSD
 from routershell.lib.network_manager.common.inet import InetServiceLayer, InetVersion
 from routershell.lib.network_manager.common.mac import MacServiceLayer
 from routershell.lib.network_manager.common.run_commands import RunCommand
+from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+    DhcpConflict,
+    DhcpConflictIndex,
+)
+from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_pool_utilization import DhcpPoolUtilization
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
-from routershell.lib.network_services.dhcp.common.dhcp_common import DHCPVersion
-from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqDeploy, DNSMasqInterfaceService
+from routershell.lib.network_services.dhcp.common.dhcp_common import DhcpOptionCatalog, DHCPVersion
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqConfigChanges
 from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_config_gen import DHCPv6Modes
-from routershell.lib.system.system_service_control.system_service_control import SysServCntrlAction
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DhcpLease, DnsmasqLeaseStore
+from routershell.lib.system.log_reader import LogReader, SystemLogs
 
 
 class InvalidDhcpServer(Exception):
@@ -37,6 +42,9 @@ class DHCPServer(NetworkManager):
         super().__init__()
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().DHCP_SERVER)
+
+        # The DHCP pool changes stored in the DB are applied to DNSMasq once per batch
+        ConfigChangeBus().subscribe(DNSMasqConfigChanges.TOPICS, DNSMasqConfigChanges.handle)
     
     def dhcp_pool_name_exists(self, dhcp_pool_name: DhcpPoolName) -> PredicateResult:
         """
@@ -116,7 +124,12 @@ class DHCPServer(NetworkManager):
         if not self.dhcp_pool_name_exists(dhcp_pool_name):
             self.log.debug(f"DHCP pool-name: {dhcp_pool_name} does not exist")
             return STATUS_NOK
-        return DSD().del_dhcp_pool_name(dhcp_pool_name)
+
+        if DSD().del_dhcp_pool_name(dhcp_pool_name):
+            return STATUS_NOK
+
+        DhcpConflictIndex().remove_pool(dhcp_pool_name)
+        return STATUS_OK
 
     def add_dhcp_pool_subnet(self, dhcp_pool_name: DhcpPoolName, dhcp_pool_subnet_cidr: InetCidrText) -> StatusResult:
         """
@@ -136,8 +149,15 @@ class DHCPServer(NetworkManager):
         if not self.is_valid_inet_subnet(dhcp_pool_subnet_cidr):
             self.log.error(f"Unable to add DHCP subnet to the DHCP server, subnet : {dhcp_pool_subnet_cidr} , is invalid subnet/CIDR")
             return STATUS_NOK
-                    
-        return DSD().add_dhcp_pool_subnet_db(dhcp_pool_name, dhcp_pool_subnet_cidr)
+
+        if self._has_conflicts(DhcpConflictIndex().check_subnet(dhcp_pool_name, dhcp_pool_subnet_cidr)):
+            return STATUS_NOK
+
+        if DSD().add_dhcp_pool_subnet_db(dhcp_pool_name, dhcp_pool_subnet_cidr):
+            return STATUS_NOK
+
+        DhcpConflictIndex().add_subnet(dhcp_pool_name, dhcp_pool_subnet_cidr)
+        return STATUS_OK
  
     def add_dhcp_pool_subnet_inet_range(self, dhcp_pool_name:DhcpPoolName, 
                                         dhcp_pool_subnet_cidr: InetCidrText, 
@@ -166,10 +186,23 @@ class DHCPServer(NetworkManager):
                            f"not within DHCP subnet-pool: {dhcp_pool_subnet_cidr}")
             return STATUS_NOK
 
-        return DSD().add_dhcp_subnet_inet_address_range_db(dhcp_pool_subnet_cidr, 
-                                                           inet_pool_start, 
-                                                           inet_pool_end, 
-                                                           inet_pool_subnet_cidr)
+        try:
+            conflicts = DhcpConflictIndex().check_range(dhcp_pool_name, inet_pool_start, inet_pool_end)
+        except ValueError as e:
+            self.log.error(f"Invalid inet pool range: ({inet_pool_start} - {inet_pool_end}): {e}")
+            return STATUS_NOK
+
+        if self._has_conflicts(conflicts):
+            return STATUS_NOK
+
+        if DSD().add_dhcp_subnet_inet_address_range_db(dhcp_pool_subnet_cidr, 
+                                                       inet_pool_start, 
+                                                       inet_pool_end, 
+                                                       inet_pool_subnet_cidr):
+            return STATUS_NOK
+
+        DhcpConflictIndex().add_range(dhcp_pool_name, inet_pool_start, inet_pool_end)
+        return STATUS_OK
     
     def add_dhcp_pool_reservation(self, dhcp_pool_name: DhcpPoolName, 
                                   inet_subnet_cidr: InetCidrText, 
@@ -189,8 +222,21 @@ class DHCPServer(NetworkManager):
         if not self.dhcp_pool_name_exists(dhcp_pool_name):
             self.log.critical(f"Unable to add a reservation to a DHCP pool, dhcp-pool-name : {dhcp_pool_name} , does not exist")
             return STATUS_NOK
+
+        try:
+            conflicts = DhcpConflictIndex().check_reservation(dhcp_pool_name, hw_address, inet_address)
+        except ValueError as e:
+            self.log.error(f"Invalid reservation address: {inet_address}: {e}")
+            return STATUS_NOK
+
+        if self._has_conflicts(conflicts):
+            return STATUS_NOK
         
-        return DSD().add_dhcp_subnet_reservation_db(inet_subnet_cidr, hw_address, inet_address)
+        if DSD().add_dhcp_subnet_reservation_db(inet_subnet_cidr, hw_address, inet_address):
+            return STATUS_NOK
+
+        DhcpConflictIndex().add_reservation(dhcp_pool_name, hw_address, inet_address)
+        return STATUS_OK
     
     def add_dhcp_pool_option(self, dhcp_pool_name: DhcpPoolName, inet_subnet_cidr: InetCidrText, dhcp_option: str, value: str) -> StatusResult:
         """
@@ -209,6 +255,19 @@ class DHCPServer(NetworkManager):
             self.log.critical(f"Unable to add DHCP option to a DHCP pool, dhcp-pool-name : {dhcp_pool_name} , does not exist")
             return STATUS_NOK
 
+        # Rejected here, DNSMasq would otherwise fail to load the option when it is restarted
+        errors = []
+
+        for catalog in DhcpOptionCatalog.for_version(DSD().dhcp_pool_name_dhcp_version_db(dhcp_pool_name)):
+            try:
+                catalog.encode(dhcp_option, value)
+                break
+            except ValueError as e:
+                errors.append(str(e))
+        else:
+            self.log.error(f"Unable to add DHCP option to DHCP pool {dhcp_pool_name}: {', '.join(errors)}")
+            return STATUS_NOK
+
         return DSD().add_dhcp_subnet_option_db(inet_subnet_cidr, dhcp_option, value)
 
     def add_dhcp_pool_to_interface(self, dhcp_pool_name: DhcpPoolName, interface_name: InterfaceName, negate:bool=False) -> StatusResult:
@@ -228,35 +287,10 @@ class DHCPServer(NetworkManager):
         
         # TODO Check interface IP address(es) are within the DHCP-pool-subnet range
 
-        # Get inet-subnet-cidr from dhcp-pool-name == interface-inet-address -> subnet-range
-        dhcp_pool_subnet = DSD().get_dhcp_pool_subnet_name_db(dhcp_pool_name)
-        
-        self.log.debug(f"add_dhcp_pool_to_interface() {dhcp_pool_name} -> {dhcp_pool_subnet}")
-        
-        DSD().update_dhcp_pool_name_interface(dhcp_pool_name, interface_name, negate)
+        self.log.debug(f"add_dhcp_pool_to_interface() {dhcp_pool_name} -> {interface_name}, negate: {negate}")
 
-        DMIS = DNSMasqInterfaceService(dhcp_pool_name, dhcp_pool_subnet)
-        
-        if negate:
-            if DMIS.clear_configurations():
-                self.log.error(f"Unable to remove DHCP Policy: {dhcp_pool_name} from router")
-                return STATUS_NOK
-            
-            return STATUS_OK
-        
-        if DMIS.build_interface_configuration():
-            self.log.error("Unable to build DNSMasq Configuration")
-            return STATUS_NOK
-        
-        if DMIS.deploy_configuration(DNSMasqDeploy.INTERFACE):
-            self.log.error("Unable to set DNSMasq interface configuration")
-            return STATUS_NOK
-        
-        if DMIS.control_service(SysServCntrlAction.RESTART):
-            self.log.error("Unable to restart DNSMasq")
-            return STATUS_NOK    
-        
-        return STATUS_OK
+        # DNSMasq is redeployed and reloaded from the published DHCP pool change, once per batch
+        return DSD().update_dhcp_pool_name_interface(dhcp_pool_name, interface_name, negate)
 
     def update_dhcp_pool_mode(self, dhcp_pool_name: DhcpPoolName, mode: DHCPv6Modes) -> StatusResult:
         """
@@ -284,6 +318,45 @@ class DHCPServer(NetworkManager):
 
         return DSD().update_dhcp_pool_mode_db(dhcp_pool_name, mode)
 
+    def update_dhcp_pool_utilization_alert(self, dhcp_pool_name: DhcpPoolName, percent: int | None) -> StatusResult:
+        """
+        Update the occupancy percent raising a utilization alert for a DHCP pool.
+
+        Parameters:
+            dhcp_pool_name (str): The name of the DHCP pool.
+            percent (int | None): The occupancy percent (1-100), None to disable the alert.
+
+        Returns:
+            StatusResult: STATUS_OK if the update is successful, STATUS_NOK otherwise.
+        """
+        if not self.dhcp_pool_name_exists(dhcp_pool_name):
+            self.log.error(f"Unable to update utilization alert. DHCP pool name '{dhcp_pool_name}' does not exist.")
+            return STATUS_NOK
+
+        if percent is not None and not 1 <= percent <= 100:
+            self.log.error(f"Invalid utilization alert percent: {percent}")
+            return STATUS_NOK
+
+        if DSD().update_dhcp_pool_utilization_alert_db(dhcp_pool_name, percent):
+            self.log.error(f"Unable to update utilization alert of DHCP pool '{dhcp_pool_name}' to DB")
+            return STATUS_NOK
+
+        # Follow the leases from now on, the alert is raised without waiting for a show command
+        DhcpPoolUtilization().start()
+        return STATUS_OK
+
+    def _has_conflicts(self, conflicts: list[DhcpConflict]) -> PredicateResult:
+        """
+        Log the conflicts of an entry with the DHCP configuration.
+
+        Returns:
+            PredicateResult: True if there is at least one conflict.
+        """
+        for conflict in conflicts:
+            self.log.error(f"DHCP configuration conflict: {conflict}")
+
+        return bool(conflicts)
+
 class DhcpPoolFactory:
 
     def __init__(self, dhcp_pool_name: DhcpPoolName):
@@ -477,6 +550,18 @@ class DhcpPoolFactory:
         
         return self.dhcp_srv_obj.update_dhcp_pool_mode(self.dhcp_pool_name, mode)
         
+    def set_utilization_alert(self, percent: int | None) -> StatusResult:
+        """
+        Raise a utilization alert when the occupancy of the pool exceeds `percent`.
+
+        Args:
+            percent (int | None): The occupancy percent (1-100), None to disable the alert.
+
+        Returns:
+            StatusResult: STATUS_OK if the alert was updated successfully, STATUS_NOK otherwise.
+        """
+        return self.dhcp_srv_obj.update_dhcp_pool_utilization_alert(self.dhcp_pool_name, percent)
+
     def _update_status(self, status: bool):
         """
         Update the status of the DhcpPoolFactory.
@@ -500,56 +585,40 @@ class DhcpServerManager(RunCommand):
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().DHCP_SERVER_MANAGER)
 
-    def get_leases(self) -> list[dict[str, str]]:
+        # The pool subnets of the lease store are read from the DB again after a DHCP pool changed
+        ConfigChangeBus().subscribe([ConfigChangeTopic.DHCP_POOL], DhcpServerManager.handle)
+
+    @staticmethod
+    def handle(changes: ConfigChanges) -> StatusResult:
+        """The `ConfigChangeBus` handler of the lease store pool index."""
+        DnsmasqLeaseStore().invalidate_pool_subnets()
+        return STATUS_OK
+
+    def lease_store(self) -> DnsmasqLeaseStore:
         """
-        Retrieve a list of DHCP leases from the dnsmasq leases file.
+        Retrieve the dnsmasq lease store, with the DHCP pools of the DB as its pool index.
+
+        The pool subnets are read from the DB on the first call and after a DHCP pool changed.
 
         Returns:
-            list[dict[str, str]]: A list of dictionaries containing lease information.
-                Each dictionary has the following keys:
-                - 'ip_address': The leased IP address.
-                - 'mac_address': The MAC address of the device.
-                - 'hostname': The hostname associated with the lease.
-                - 'expires': The expiration timestamp of the lease.
-        """        
-        try:
-            leases_path = DNSMASQ_LEASE_FILE_PATH
-
-            if os.path.exists(leases_path):
-                with open(leases_path) as leases_file:
-                    leases_raw = leases_file.readlines()
-
-                leases = []
-
-                for lease_raw in leases_raw:
-                    lease_info = lease_raw.split()
-                    if len(lease_info) >= 5:
-                        if "duid" not in lease_raw.lower():
-                            lease_dict = {
-                                "ip_address": lease_info[2],
-                                "mac_address": lease_info[1],
-                                "hostname": lease_info[3],
-                                "expires": lease_info[0],
-                            }
-                            leases.append(lease_dict)
-                            self.log.debug(f"Processed lease entry: {lease_dict}")
-                    else:
-                        lease_dict = {
-                            "malformed_entry": lease_raw.strip(),
-                        }
-                        leases.append(lease_dict)
-                        self.log.error(f"Processed malformed lease entry: {lease_dict}")
-
-                return leases
-
-            else:
-                self.log.debug(f"Leases file '{leases_path}' not found.")
-                return []
-
-        except Exception as e:
-            self.log.error(f"Error retrieving DHCP leases: {e}")
-            return []
-        
+            DnsmasqLeaseStore: The lease store, refreshed from the dnsmasq leases file on query.
+        """
+        store = DnsmasqLeaseStore()
+
+        if not store.pool_subnets_loaded():
+            store.set_pool_subnets({pool: DSD().get_dhcp_pool_subnet_name_db(pool) for pool in DSD().dhcp_pool_name_list()})
+
+        return store
+
+    def get_leases(self) -> list[DhcpLease]:
+        """
+        Retrieve the DHCP leases of the dnsmasq leases file.
+
+        Returns:
+            list[DhcpLease]: The DHCPv4 and DHCPv6 leases in leases file order.
+        """
+        return self.lease_store().leases()
+
     def status(self) -> StatusResult:
         """
         Get the status of dnsmasq.
@@ -587,36 +656,40 @@ class DhcpServerManager(RunCommand):
         self.log.debug(f"dnsmasq syntax test passed: {result.stdout}")
         return STATUS_OK
 
-    def lease_log(self) -> list[str]:
+    def lease_log_reader(self) -> LogReader:
+        """The reader of the DHCP entries (dnsmasq-dhcp) of the system journal or syslog."""
+        return SystemLogs().reader('dnsmasq-dhcp', ('dnsmasq-dhcp',))
+
+    def server_log_reader(self) -> LogReader:
+        """The reader of the DNSMasq server entries (dnsmasq) of the system journal or syslog."""
+        return SystemLogs().reader('dnsmasq', ('dnsmasq',))
+
+    def lease_log(self, count: int = LogReader.DEFAULT_LAST, consumer: str = 'dhcp-lease-log') -> list[str]:
         """
-        Get the DHCP-related log entries from the system journal.
+        Get the last DHCP-related log entries from the system journal, reading only the entries
+        logged since the previous call of the consumer.
+
+        Args:
+            count (int): The number of last entries.
+            consumer (str): The consumer whose cursor is advanced.
 
         Returns:
             list[str]: A list of DHCP-related log entries.
         """
-        result = self.run(['journalctl | grep dnsmasq-dhcp'], shell=True, sudo=False)
-        
-        if result.exit_code:
-            return []
-        
-        log_entries = result.stdout.split('\n')
-        return log_entries
+        return [str(entry) for entry in self.lease_log_reader().last(consumer, count)]
 
-    def server_log(self) -> list[str]:
+    def server_log(self, count: int = LogReader.DEFAULT_LAST, consumer: str = 'dhcp-server-log') -> list[str]:
         """
-        Get the DHCP-related log entries from the system journal.
+        Get the last DNSMasq server log entries from the system journal, reading only the entries
+        logged since the previous call of the consumer.
+
+        Args:
+            count (int): The number of last entries.
+            consumer (str): The consumer whose cursor is advanced.
 
         Returns:
-            list[str]: A list of DHCP-related log entries.
+            list[str]: A list of DNSMasq server log entries.
         """
-        command = 'journalctl | grep dnsmasq\\['
-
-        result = self.run(["journalctl | grep 'dnsmasq\\['"], shell=True, sudo=False)
-        
-        if result.exit_code:
-            return []
-        
-        log_entries = result.stdout.split('\n')
-        return log_entries
+        return [str(entry) for entry in self.server_log_reader().last(consumer, count)]
 
- 
\ No newline at end of file
+ 
@@ -0,0 +1,187 @@
+import logging
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.config_change_bus import ConfigChangeBus
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import StatusResult
+from routershell.lib.db.dns_db import DnsDB
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqConfigChanges, DNSMasqGlobalService
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_statistics import (
+    DNSMasqCacheStatistics,
+    DNSMasqStatistics,
+)
+
+
+class DnsCacheSetting(Enum):
+    """
+    The `ip dns cache` settings.
+
+    - `SIZE`: The number of names of the cache, dnsmasq `cache-size`.
+    - `NEGATIVE`: Cache negative answers, `no ip dns cache negative` renders dnsmasq `no-negcache`.
+    - `TTL`: The minimum time an answer stays in the cache, dnsmasq `min-cache-ttl`.
+    - `FORWARD_MAX`: The maximum concurrent queries forwarded upstream, dnsmasq `dns-forward-max`.
+    """
+    SIZE = 'size'
+    NEGATIVE = 'negative'
+    TTL = 'ttl'
+    FORWARD_MAX = 'forward-max'
+
+
+class DnsCacheSettings(NamedTuple):
+    """
+    The DNS cache settings, None for a setting left to the dnsmasq default.
+
+    Attributes:
+        cache_size (int | None): The number of names of the cache (dnsmasq default: 150).
+        negative_cache (bool): Whether negative answers are cached.
+        min_cache_ttl (int | None): The minimum TTL of the cached answers in seconds.
+        forward_max (int | None): The maximum concurrent queries forwarded upstream (dnsmasq default: 150).
+    """
+    cache_size: int | None = None
+    negative_cache: bool = True
+    min_cache_ttl: int | None = None
+    forward_max: int | None = None
+
+
+class DnsCache:
+    """
+    Tune the DNS cache of dnsmasq and read its counters.
+
+    A setting is stored in the DB and rendered into the global dnsmasq configuration, a
+    running dnsmasq is restarted to pick it up.
+    """
+
+    SETTING_COLUMNS = {
+        DnsCacheSetting.SIZE: 'CacheSize',
+        DnsCacheSetting.NEGATIVE: 'NegativeCache',
+        DnsCacheSetting.TTL: 'MinCacheTtl',
+        DnsCacheSetting.FORWARD_MAX: 'ForwardMax',
+    }
+
+    SETTING_RANGES = {
+        DnsCacheSetting.SIZE: (0, 10000),
+        DnsCacheSetting.TTL: (0, 3600),
+        DnsCacheSetting.FORWARD_MAX: (1, 10000),
+    }
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DNS_CACHE)
+        ConfigChangeBus().subscribe(DNSMasqConfigChanges.TOPICS, DNSMasqConfigChanges.handle)
+
+    @classmethod
+    def parse_cache_setting(cls, args: list[str], negate: bool = False) -> tuple[DnsCacheSetting, int | bool | None]:
+        """
+        Parse the arguments of `[no] ip dns cache`.
+
+        Syntax:
+            ip dns cache size <entries>
+            ip dns cache ttl <seconds>
+            ip dns cache forward-max <queries>
+            [no] ip dns cache negative
+            no ip dns cache size | ttl | forward-max
+
+        Returns:
+            tuple[DnsCacheSetting, int | bool | None]: The setting and its value, None to restore
+                                                       the dnsmasq default.
+
+        Raises:
+            ValueError: If the arguments are invalid.
+        """
+        if not args:
+            raise ValueError(f"Missing DNS cache setting: {' | '.join(setting.value for setting in DnsCacheSetting)}")
+
+        try:
+            setting = DnsCacheSetting(args[0])
+        except ValueError:
+            raise ValueError(f"Invalid DNS cache setting: {args[0]}") from None
+
+        if setting == DnsCacheSetting.NEGATIVE:
+            if len(args) != 1:
+                raise ValueError(f"Invalid arguments: {' '.join(args)}")
+            return setting, not negate
+
+        if negate:
+            return setting, None
+
+        low, high = cls.SETTING_RANGES[setting]
+
+        if len(args) != 2 or not args[1].isdigit() or not low <= int(args[1]) <= high:
+            raise ValueError(f"ip dns cache {setting.value} requires a value between {low} and {high}")
+
+        return setting, int(args[1])
+
+    def set_cache_setting(self, setting: DnsCacheSetting, value: int | bool | None) -> StatusResult:
+        """
+        Store a DNS cache setting and apply it to dnsmasq, the previous value is restored when
+        the configuration can not be applied. Within a `ConfigChangeBus` batch, e.g. the startup
+        configuration, the setting is applied with the other dnsmasq changes at the end of the batch.
+
+        Args:
+            setting (DnsCacheSetting): The setting.
+            value (int | bool | None): The value, None to restore the dnsmasq default.
+
+        Returns:
+            StatusResult: STATUS_OK if the setting was stored and applied, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"set_cache_setting() -> {setting.value}: {value}")
+
+        column = self.SETTING_COLUMNS[setting]
+        previous = DnsDB().get_settings()[column]
+
+        if previous == value:
+            return STATUS_OK
+
+        if DnsDB().set_setting(column, value):
+            return STATUS_NOK
+
+        if ConfigChangeBus().is_batching():
+            return STATUS_OK
+
+        if self.apply_configuration():
+            self.log.error(f"Failed to apply ip dns cache {setting.value}, restoring {previous}")
+            DnsDB().set_setting(column, previous)
+            self.apply_configuration()
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def apply_configuration(self) -> StatusResult:
+        """
+        Render the DNS settings into the global dnsmasq configuration and restart a running dnsmasq
+        when the configuration changed.
+
+        Returns:
+            StatusResult: STATUS_OK if the configuration was applied, STATUS_NOK otherwise.
+        """
+        service = DNSMasqGlobalService()
+
+        if service.build_configuration() or service.deploy_configuration():
+            return STATUS_NOK
+
+        return service.apply_configuration()
+
+    def get_settings(self) -> DnsCacheSettings:
+        """
+        Get the DNS cache settings.
+
+        Returns:
+            DnsCacheSettings: The settings, None for a setting left to the dnsmasq default.
+        """
+        settings = DnsDB().get_settings()
+        return DnsCacheSettings(settings['CacheSize'], settings['NegativeCache'],
+                                settings['MinCacheTtl'], settings['ForwardMax'])
+
+    def get_statistics(self) -> DNSMasqCacheStatistics:
+        """
+        Read the DNS cache counters of the running dnsmasq.
+
+        Returns:
+            DNSMasqCacheStatistics: The counters.
+
+        Raises:
+            DNSMasqStatisticsError: If dnsmasq did not answer.
+        """
+        return DNSMasqStatistics().get_statistics()
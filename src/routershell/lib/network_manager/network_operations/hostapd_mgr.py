@@ -4,6 +4,10 @@ from enum import Enum
 from routershell.lib.common.constants import HOSTAPD_CONF_DIR, STATUS_NOK, STATUS_OK
 from routershell.lib.common.types import BridgeName, FilePath, InterfaceName, SsidText, StatusResult
 from routershell.lib.network_manager.common.run_commands import RunCommand
+from routershell.lib.system.system_service_control.system_service_control import (
+    SysServCntrlAction,
+    SystemServiceControl,
+)
 
 
 class HostapdIEEE802Config(Enum):
@@ -522,8 +526,7 @@ class HostapdManager(RunCommand, HostapdConfigGenerator):
             StatusResult: True if the service starts successfully, False otherwise.
         """
         try:
-            result = self.run_command(["service", "hostapd", "start"])
-            return STATUS_OK if result.exit_code == STATUS_OK else STATUS_NOK
+            return SystemServiceControl().service_control('hostapd', SysServCntrlAction.START)
 
         except Exception as e:
             self.log.exception(f"Failed to start hostapd service: {e}")
@@ -544,8 +547,7 @@ class HostapdManager(RunCommand, HostapdConfigGenerator):
             StatusResult: True if the service restarts successfully, False otherwise.
         """
         try:
-            result = self.run_command(["service", "hostapd", "restart"])
-            return STATUS_OK if result.exit_code == STATUS_OK else STATUS_NOK
+            return SystemServiceControl().service_control('hostapd', SysServCntrlAction.RESTART)
 
         except Exception as e:
             self.log.exception(f"Failed to restart hostapd service: {e}")
@@ -559,8 +561,7 @@ class HostapdManager(RunCommand, HostapdConfigGenerator):
             StatusResult: True if the service stops successfully, False otherwise.
         """
         try:
-            result = self.run_command(["service", "hostapd", "stop"])
-            return STATUS_OK if result.exit_code == STATUS_OK else STATUS_NOK
+            return SystemServiceControl().service_control('hostapd', SysServCntrlAction.STOP)
 
         except Exception as e:
             self.log.exception(f"Failed to stop hostapd service: {e}")
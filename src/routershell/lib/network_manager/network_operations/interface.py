@@ -2,8 +2,10 @@ import ipaddress
 import json
 import logging
 import os
+import socket
 
-from routershell.lib.common.common import STATUS_NOK, STATUS_OK
+from routershell.lib.common.bitmap_allocator import BitmapAllocator
+from routershell.lib.common.common import STATUS_NOK, STATUS_OK, Common
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import (
     InetAddressText,
@@ -16,7 +18,7 @@ from routershell.lib.common.types import (
 )
 from routershell.lib.db.interface_db import InterfaceDatabase
 from routershell.lib.network_manager.common.interface import InterfaceType
-from routershell.lib.network_manager.common.phy import Duplex, Speed, State
+from routershell.lib.network_manager.common.phy import CoalesceProfile, Duplex, Offload, Speed, State
 from routershell.lib.network_manager.network_operations.arp import Arp, Encapsulate
 from routershell.lib.network_manager.network_operations.nat import Nat, NATDirection
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
@@ -85,15 +87,18 @@ class Interface(NetworkManager, InterfaceDatabase):
             iface_name = os_interface.get("ifname", "")
             link_type = os_interface.get("link_type", "")
 
+            # Loopbacks are dummy interfaces, link type ether
+            is_loopback = link_type == "loopback" or self.is_os_loopback(iface_name)
+
             if interface_type is None:
-                if link_type == "loopback":
+                if is_loopback:
                     continue
                 interfaces.append(iface_name)
             elif interface_type == InterfaceType.LOOPBACK:
-                if link_type == "loopback":
+                if is_loopback:
                     interfaces.append(iface_name)
             elif interface_type == InterfaceType.ETHERNET:
-                if link_type == "ether" and not self._is_wireless_os_interface(iface_name):
+                if link_type == "ether" and not is_loopback and not self._is_wireless_os_interface(iface_name):
                     interfaces.append(iface_name)
             elif interface_type == InterfaceType.WIRELESS_WIFI:
                 if self._is_wireless_os_interface(iface_name):
@@ -118,9 +123,8 @@ class Interface(NetworkManager, InterfaceDatabase):
         """
         Determine if a network interface with the specified name exists on the current system.
 
-        This method utilizes the 'ip -json address show' command to retrieve a list of all network interfaces
-        present on the system and subsequently verifies if the provided interface name is included in the
-        command's output. It also checks for labeled sub-interfaces of loopback.
+        The interface is looked up by name with a single ioctl, loopbacks being dummy interfaces
+        there is no address list to walk.
 
         Args:
             interface_name (str): The name of the network interface to be checked.
@@ -131,37 +135,14 @@ class Interface(NetworkManager, InterfaceDatabase):
             - True: The interface exists.
             - False: otherwise
         """
-        try:
-            result = self.run(['ip', '-json', 'address', 'show'], suppress_error=True)
-            
-            if result.exit_code:
-                self.log.debug(f"does_os_interface_exist() returned a non-zero exit code: {result.exit_code}")
-                return False
-            
-            interfaces = json.loads(result.stdout)
-            
-            for interface in interfaces:
-                ifname = interface.get("ifname", "")
-                
-                # Check for the main interface
-                if ifname == interface_name:
-                    if "loopback" in interface.get("link_type", "") and not include_loopbacks:
-                        continue
-                    return True
-                
-                # Check for labeled sub-interfaces under loopback (lo)
-                if ifname == "lo" and include_loopbacks:
-                    for addr_info in interface.get("addr_info", []):
-                        label = addr_info.get("label", "")
-                        if label == interface_name:
-                            return True
+        if not include_loopbacks and self.is_os_loopback(interface_name):
+            return False
 
+        if self.get_os_ifindex(interface_name) is None:
             self.log.debug(f"does_os_interface_exist() '{interface_name}' does not exist")
             return False
-                
-        except Exception as e:
-            self.log.error(f"Exception in does_os_interface_exist: {e}")
-            return False
+
+        return True
 
     def get_os_interface_type(self, interface_name: InterfaceName, include_loopback_labels: bool=True) -> InterfaceType:
         """
@@ -175,7 +156,7 @@ class Interface(NetworkManager, InterfaceDatabase):
         """
         
         if include_loopback_labels:
-            if interface_name in Interface().get_os_lo_labels():
+            if self.is_os_loopback(interface_name) and self.get_os_ifindex(interface_name) is not None:
                 self.log.debug(f'interface" {interface_name} is a type {InterfaceType.LOOPBACK.value}')
                 return InterfaceType.LOOPBACK
         
@@ -449,6 +430,79 @@ class Interface(NetworkManager, InterfaceDatabase):
         
         return STATUS_OK
             
+    def update_interface_offload(self, interface_name: InterfaceName, offload: Offload, enable: bool) -> StatusResult:
+        """
+        Enable or disable an offload (GRO, GSO, TSO, LRO) and update it in the database.
+
+        Args:
+            interface_name (str): The name of the network interface to configure.
+            offload (Offload): The offload.
+            enable (bool): True to enable, False to disable.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if self.set_offload(interface_name, offload, enable):
+            return STATUS_NOK
+
+        if self.update_db_nic_options(interface_name, {offload.name.capitalize(): enable}):
+            self.log.error(f"Unable to update interface: {interface_name} offload: {offload.value} via db")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def update_interface_ring_size(self, interface_name: InterfaceName, rx: str | None = None, tx: str | None = None,
+                                   negate: bool = False) -> StatusResult:
+        """
+        Set the RX/TX ring buffer sizes and update them in the database.
+
+        Args:
+            interface_name (str): The name of the network interface to configure.
+            rx (str | None): Descriptors or `max`, None to leave unchanged.
+            tx (str | None): Descriptors or `max`, None to leave unchanged.
+            negate (bool): Remove the ring sizes given (both when none is given) from the configuration,
+                the NIC keeps its current sizes.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if negate:
+            options = {column: None for column, size in (('RingRx', rx), ('RingTx', tx)) if size or not (rx or tx)}
+            return self.update_db_nic_options(interface_name, options)
+
+        if self.set_ring_size(interface_name,
+                              *(size if size in (None, self.RING_SIZE_MAX) else int(size) for size in (rx, tx))):
+            return STATUS_NOK
+
+        options = {column: size for column, size in (('RingRx', rx), ('RingTx', tx)) if size is not None}
+
+        if self.update_db_nic_options(interface_name, options):
+            self.log.error(f"Unable to update interface: {interface_name} ring size: {options} via db")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def update_interface_coalesce(self, interface_name: InterfaceName, profile: CoalesceProfile | None) -> StatusResult:
+        """
+        Apply an interrupt coalescing profile and update it in the database.
+
+        Args:
+            interface_name (str): The name of the network interface to configure.
+            profile (CoalesceProfile | None): The profile, None removes it from the configuration and
+                leaves the NIC settings as they are.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if profile is not None and self.set_coalesce_profile(interface_name, profile):
+            return STATUS_NOK
+
+        if self.update_db_nic_options(interface_name, {'Coalesce': profile.value if profile else None}):
+            self.log.error(f"Unable to update interface: {interface_name} coalescing profile via db")
+            return STATUS_NOK
+
+        return STATUS_OK
+
     def update_shutdown(self, interface_name: InterfaceName, state: State) -> StatusResult:
         """
         Set the shutdown status of a network interface.
@@ -879,12 +933,34 @@ class Interface(NetworkManager, InterfaceDatabase):
 
     # LoopBack Operations
 
-    def get_os_lo_labels(self) -> list[str]:
+    # Addresses auto-assigned to loopbacks, seeded from the addresses in use on the first allocation
+    LOOPBACK_ADDRESS_RANGE = (int(ipaddress.IPv4Address('127.0.0.1')), int(ipaddress.IPv4Address('127.255.255.254')))
+    _loopback_addresses: BitmapAllocator | None = None
+
+    @staticmethod
+    def is_os_loopback(interface_name: InterfaceName) -> PredicateResult:
+        """
+        Check if an interface is a loopback, `lo` or a loopback<id> dummy interface.
         """
-        Extract labels from the loopback interface labels
+        return interface_name == 'lo' or Common.is_loopback_if_name_valid(interface_name)
 
-        Args:
-            ip_lo_json (dict): The JSON data structure for the loopback interface.
+    @staticmethod
+    def get_os_ifindex(interface_name: InterfaceName) -> int | None:
+        """
+        Look up the ifindex of an interface with a single SIOCGIFINDEX ioctl.
+
+        Returns:
+            int | None: The ifindex, None if the interface does not exist.
+        """
+        try:
+            return socket.if_nametoindex(interface_name)
+        except OSError:
+            return None
+
+    def get_os_lo_labels(self) -> list[str]:
+        """
+        Extract the labels of the addresses on `lo`, the loopbacks of configurations created
+        before loopbacks became dummy interfaces.
 
         Returns:
             list[str]: A list of labels found in the loopback interface's address information.
@@ -895,11 +971,11 @@ class Interface(NetworkManager, InterfaceDatabase):
             result = self.run(['ip', '-json', 'address', 'show', 'dev', 'lo'], suppress_error=True)
             
             if result.exit_code:
-                self.log.debug(f"does_os_interface_exist() returned a non-zero exit code: {result.exit_code}")
+                self.log.debug(f"get_os_lo_labels() returned a non-zero exit code: {result.exit_code}")
                 return []
                             
         except Exception as e:
-            self.log.error(f"Exception in does_os_interface_exist: {e}")
+            self.log.error(f"Exception in get_os_lo_labels: {e}")
             return []
 
         interfaces = json.loads(result.stdout)
@@ -914,46 +990,94 @@ class Interface(NetworkManager, InterfaceDatabase):
 
         return labels
 
-    def create_os_loopback(self, loopback_name: InterfaceName, inet_address: InetAddressText) -> StatusResult:
+    def migrate_os_lo_labels(self, loopback_name: InterfaceName | None = None) -> StatusResult:
+        """
+        Move the addresses labeled `lo:<loopback>` on `lo` to the loopback dummy interface,
+        creating the dummy interface if needed. The addresses are added to the dummy interface
+        before they are removed from `lo`, in one `ip -batch`.
+
+        Args:
+            loopback_name (str, optional): Migrate this loopback only. Defaults to every labeled loopback.
+
+        Returns:
+            StatusResult: STATUS_OK if every address was moved, STATUS_NOK otherwise.
+        """
+        result = self.run(['ip', '-json', 'address', 'show', 'dev', 'lo'], suppress_error=True)
+
+        if result.exit_code:
+            return STATUS_NOK
+
+        moves: dict[InterfaceName, list[str]] = {}
+
+        for interface in json.loads(result.stdout):
+            for addr_info in interface.get("addr_info", []):
+                label = addr_info.get("label", "lo")
+
+                if not label.startswith("lo:") or loopback_name not in (None, label[3:]):
+                    continue
+
+                moves.setdefault(label[3:], []).append(f"{addr_info['local']}/{addr_info['prefixlen']}")
+
+        lines = []
+
+        for name, addresses in moves.items():
+            if self.get_os_ifindex(name) is None and self._create_os_loopback_link(name):
+                return STATUS_NOK
+
+            self.log.info(f"Migrating loopback {name} addresses {addresses} from lo")
+            lines += [f"address add {address} dev {name}" for address in addresses]
+            lines += [f"address del {address} dev lo" for address in addresses]
+
+        if lines and self.run(['ip', '-batch', '-'], stdin='\n'.join(lines) + '\n').exit_code:
+            self.log.error(f"Unable to migrate loopbacks {', '.join(moves)} from lo")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def _create_os_loopback_link(self, loopback_name: InterfaceName) -> StatusResult:
+        if self.create_os_dummy_interface(loopback_name):
+            return STATUS_NOK
+
+        if self.run(['ip', 'link', 'set', loopback_name, 'up'], suppress_error=True).exit_code:
+            self.log.error(f"Unable to bring up loopback {loopback_name}")
+            self.destroy_os_dummy_interface(loopback_name)
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def create_os_loopback(self, loopback_name: InterfaceName, inet_address: InetAddressText | None = None) -> StatusResult:
         """
-        Creates a loopback interface with the specified name (label) and IP address on the 'lo' device.
+        Creates a loopback as a dummy interface, moving the addresses of a label-based loopback
+        of the same name from 'lo', and optionally assigns it an address.
 
         Args:
-            loopback_name (str): The name (label) for the new loopback interface.
-            inet_address (str): The IP address to assign to the loopback interface.
+            loopback_name (str): The name for the new loopback interface.
+            inet_address (str, optional): The host address (/32 or /128) to assign to the loopback interface.
 
         Returns:
             StatusResult: STATUS_OK if the loopback interface was created successfully, otherwise STATUS_NOK.
         """
         
-        if loopback_name in self.get_os_lo_labels():
+        if self.get_os_ifindex(loopback_name) is not None:
             self.log.debug(f"Loopback interface {loopback_name} already exists.")
             return STATUS_NOK
         
-        try:
-            ip = ipaddress.ip_address(inet_address)
-            if ip.version == 4:
-                ip_ver_opt = 'addr'
-                cidr = '/32'
-            elif ip.version == 6:
-                ip_ver_opt = '-6 addr'
-                cidr = '/128'
-            else:
+        if inet_address:
+            try:
+                ip = ipaddress.ip_address(inet_address)
+            except ValueError:
                 self.log.error(f'inet address is invalid: {inet_address}')
                 return STATUS_NOK
-            
-        except ValueError:
-            self.log.error(f'inet address is invalid: {inet_address}')
+
+        if self._create_os_loopback_link(loopback_name):
             return STATUS_NOK
 
-        inet_address += cidr
+        if loopback_name in self.get_os_lo_labels():
+            self.migrate_os_lo_labels(loopback_name)
 
-        command = ['ip', ip_ver_opt, 'add', inet_address, 'label', f'lo:{loopback_name}', 'dev', 'lo']
-        
-        rtn = self.run(command, suppress_error=True)
-        
-        if rtn.exit_code != 0:
-            self.log.error(f"Failed to create loopback interface {loopback_name} with address {inet_address}: {rtn.stderr}")
+        if inet_address and self.set_inet_address_loopback(loopback_name, f"{ip}/{ip.max_prefixlen}"):
+            self.log.error(f"Failed to assign address {inet_address} to loopback interface {loopback_name}")
+            self.destroy_os_dummy_interface(loopback_name)
             return STATUS_NOK
         
         return STATUS_OK
@@ -984,47 +1108,30 @@ class Interface(NetworkManager, InterfaceDatabase):
         
         return STATUS_OK
     
-    def destroy_os_loopback(self, loopback_name: InterfaceName, inet_address: InetAddressText) -> StatusResult:
+    def destroy_os_loopback(self, loopback_name: InterfaceName) -> StatusResult:
         """
-        Destroys a loopback interface with the specified name (label) and IP address from the 'lo' device.
+        Destroys a loopback dummy interface with its addresses, returning its auto-assigned
+        address to the free loopback addresses.
 
         Args:
-            loopback_name (str): The name (label) for the loopback interface to be removed.
-            inet_address (str): The IP address assigned to the loopback interface.
+            loopback_name (str): The name for the loopback interface to be removed.
 
         Returns:
             StatusResult: STATUS_OK if the loopback interface was removed successfully, otherwise STATUS_NOK.
         """
         
-        if loopback_name not in self.get_os_lo_labels():
+        if self.get_os_ifindex(loopback_name) is None:
             self.log.debug(f"Loopback interface {loopback_name} does not exist.")
             return STATUS_NOK
         
-        try:
-            ip = ipaddress.ip_address(inet_address)
-            if ip.version == 4:
-                ip_ver_opt = 'addr'
-                cidr = '/32'
-            elif ip.version == 6:
-                ip_ver_opt = '-6 addr'
-                cidr = '/128'
-            else:
-                self.log.error(f'inet address is invalid: {inet_address}')
-                return STATUS_NOK
-            
-        except ValueError:
-            self.log.error(f'inet address is invalid: {inet_address}')
-            return STATUS_NOK
+        addresses = self.get_interface_ip_addresses(loopback_name, 'ipv4')
 
-        inet_address += cidr
-
-        command = ['ip', ip_ver_opt, 'del', inet_address, 'label', f'lo:{loopback_name}', 'dev', 'lo']
-        
-        rtn = self.run(command, suppress_error=True)
-        
-        if rtn.exit_code != 0:
-            self.log.error(f"Failed to destroy loopback interface {loopback_name} with address {inet_address}: {rtn.stderr}")
+        if self.destroy_os_dummy_interface(loopback_name):
+            self.log.error(f"Failed to destroy loopback interface {loopback_name}")
             return STATUS_NOK
+
+        for address in addresses:
+            self.release_loopback_address(address)
         
         return STATUS_OK
     
@@ -1047,47 +1154,79 @@ class Interface(NetworkManager, InterfaceDatabase):
     
     def get_next_loopback_address(self) -> str:
         """
-        Search the lo interface, retrieve a list of IPv4 addresses in the 127.x.x.x range,
-        and find the next available address in that range.
+        Allocate the lowest free address in the 127.x.x.x range.
+
+        The addresses in use are read from the OS once, later allocations, releases and the
+        addresses set or deleted with `set_inet_address_loopback()` / `del_inet_address_loopback()`
+        only update the in-memory bitmap.
 
         Returns:
-            str: The next available 127.x.x.x address in CIDR notation.
+            str: The next available 127.x.x.x address in CIDR notation (/32), None when the range is exhausted.
         """
-        try:
-            # Get the list of addresses on the loopback interface in JSON format
-            result = self.run(['ip', '-j', 'addr', 'show', 'dev', 'lo'], suppress_error=True)
+        if Interface._loopback_addresses is None:
+            allocator = BitmapAllocator(*self.LOOPBACK_ADDRESS_RANGE)
+            result = self.run(['ip', '-json', '-4', 'addr', 'show'], suppress_error=True, sudo=False)
 
-            if result.exit_code != 0:
+            if result.exit_code:
                 self.log.error(f"Error retrieving IP addresses: {result.stderr}")
                 return None
 
-            data = json.loads(result.stdout)
-
-            # Collect all 127.x.x.x addresses
-            addresses = [
-                ipaddress.ip_interface(f"{addr_info['local']}/{addr_info['prefixlen']}").ip
-                for iface in data if iface['ifname'] == 'lo'
-                for addr_info in iface.get('addr_info', [])
-                if addr_info['family'] == 'inet' and ipaddress.ip_interface(f"{addr_info['local']}/{addr_info['prefixlen']}").ip.is_loopback
-            ]
-
-            # Sort addresses and find the highest one
-            addresses.sort()
-            last_address = addresses[-1] if addresses else ipaddress.IPv4Address('127.0.0.0')
-
-            # Calculate the next available address
-            next_address = last_address + 1
-            if next_address.is_loopback:
-                next_address_cidr = f"{next_address}/8"
-                return next_address_cidr
-            else:
-                self.log.error("No more available 127.x.x.x addresses")
-                return None
+            for interface in json.loads(result.stdout):
+                for addr_info in interface.get('addr_info', []):
+                    allocator.reserve(int(ipaddress.IPv4Address(addr_info['local'])))
 
-        except Exception as e:
-            self.log.error(f"An error occurred: {e}")
+            Interface._loopback_addresses = allocator
+
+        next_address = Interface._loopback_addresses.allocate()
+
+        if next_address is None:
+            self.log.error("No more available 127.x.x.x addresses")
             return None
 
+        return f"{ipaddress.IPv4Address(next_address)}/32"
+
+    def release_loopback_address(self, inet_address: InetAddressText | InetCidrText) -> None:
+        """
+        Return an address to the free 127.x.x.x loopback addresses.
+        """
+        if Interface._loopback_addresses is not None:
+            Interface._loopback_addresses.release(int(ipaddress.ip_interface(inet_address).ip))
+
+    def reserve_loopback_address(self, inet_address: InetAddressText | InetCidrText) -> None:
+        """
+        Remove an address from the free 127.x.x.x loopback addresses, other addresses are ignored.
+
+        Before the first allocation there is nothing to do, the addresses in use are read from the OS then.
+        """
+        if Interface._loopback_addresses is not None:
+            Interface._loopback_addresses.reserve(int(ipaddress.ip_interface(inet_address).ip))
+
+    def set_inet_address_loopback(self, loopback_name: InterfaceName, inet_address_cidr: InetCidrText) -> StatusResult:
+        """
+        Set an address on a loopback interface, an explicit 127.x.x.x address is then never auto-assigned.
+
+        Returns:
+            StatusResult: STATUS_OK if the address was successfully set, STATUS_NOK otherwise.
+        """
+        if super().set_inet_address_loopback(loopback_name, inet_address_cidr):
+            return STATUS_NOK
+
+        self.reserve_loopback_address(inet_address_cidr)
+        return STATUS_OK
+
+    def del_inet_address_loopback(self, loopback_name: InterfaceName, inet_address_cidr: InetCidrText) -> StatusResult:
+        """
+        Delete an address from a loopback interface, returning a 127.x.x.x address to the free loopback addresses.
+
+        Returns:
+            StatusResult: STATUS_OK if the address was successfully removed, STATUS_NOK otherwise.
+        """
+        if super().del_inet_address_loopback(loopback_name, inet_address_cidr):
+            return STATUS_NOK
+
+        self.release_loopback_address(inet_address_cidr)
+        return STATUS_OK
+
     def update_interface_loopback_inet(self, loopback_name: InterfaceName, inet_address_cidr: InetCidrText | None = None, negate: bool = False) -> StatusResult:
         """
         Update or delete the inet address of a loopback interface.
@@ -1110,16 +1249,22 @@ class Interface(NetworkManager, InterfaceDatabase):
                     f"Inet: {inet_address_cidr}, Negate: {negate}")
 
         if negate:
-            if not self.del_inet_address_loopback(loopback_name, inet_address_cidr):
+            if self.destroy_os_loopback(loopback_name):
                 self.log.error(f"Unable to delete loopback: {loopback_name} address: {inet_address_cidr} from OS")
                 return STATUS_NOK
 
-            if not self.del_db_interface(loopback_name):
+            if self.del_db_interface(loopback_name):
                 self.log.error(f"Unable to delete loopback: {loopback_name} address: {inet_address_cidr} from DB")
                 return STATUS_NOK
 
         else:
-            if not inet_address_cidr:
+            if self.get_os_ifindex(loopback_name) is None and self.create_os_loopback(loopback_name):
+                self.log.error(f"Unable to create loopback: {loopback_name}")
+                return STATUS_NOK
+
+            auto_assigned = not inet_address_cidr and not self.get_interface_ip_addresses(loopback_name)
+
+            if auto_assigned:
                 inet_address_cidr = self.get_next_loopback_address()
                 if not inet_address_cidr:
                     self.log.error("Unable to get next available loopback address")
@@ -1127,8 +1272,11 @@ class Interface(NetworkManager, InterfaceDatabase):
 
                 self.log.debug(f'Auto-Assign Loopback: {loopback_name} - inet: {inet_address_cidr}')
 
-            if self.set_inet_address_loopback(loopback_name, inet_address_cidr):
+            if inet_address_cidr and self.set_inet_address_loopback(loopback_name, inet_address_cidr):
                 self.log.error(f"Unable to update loopback: {loopback_name} address: {inet_address_cidr} to OS")
+
+                if auto_assigned:
+                    self.release_loopback_address(inet_address_cidr)
                 return STATUS_NOK
 
             if self.add_db_interface(loopback_name, InterfaceType.LOOPBACK):
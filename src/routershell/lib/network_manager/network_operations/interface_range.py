@@ -0,0 +1,265 @@
+import logging
+import re
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.range_list import RangeList
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, StatusResult
+from routershell.lib.db.vlan_db import VlanDatabase
+from routershell.lib.network_manager.common.phy import State
+from routershell.lib.network_manager.network_operations.bridge_vlan import SwitchportMode
+from routershell.lib.network_manager.network_operations.interface import Interface
+from routershell.lib.network_manager.network_operations.vlan import Vlan
+
+
+class InterfaceRange(Interface):
+    """
+    Apply one configuration change to a range of interfaces (`interface range Gig0-47`).
+
+    The range is validated with one database query, each change is written in one
+    database transaction and the kernel side is applied as one batch
+    (`ip -batch -`, `bridge -batch -`) instead of one command per interface.
+    """
+
+    INTERFACE_NUMBER_RE = re.compile(r'^(?P<prefix>.*?)(?P<number>\d+)$')
+    INTERFACE_NUMBER_MAX = 9999
+
+    def __init__(self, interface_names: list[InterfaceName]):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().INTERFACE)
+        self._interface_names = interface_names
+
+    @staticmethod
+    def parse(text: str) -> list[InterfaceName]:
+        """
+        Expand an interface range such as `Gig0-47` or `Gig0-3,8,Gig10-11`.
+
+        The prefix of the first item applies to items given as bare numbers.
+
+        Args:
+            text (str): The interface range.
+
+        Returns:
+            list[InterfaceName]: The interface names, in range order.
+
+        Raises:
+            ValueError: If the range is malformed.
+        """
+        interface_names: list[InterfaceName] = []
+        prefix = None
+
+        for item in text.replace(' ', '').split(','):
+            match = re.match(r'^(?P<prefix>.*?[^\d-])?(?P<range>\d+(-\d+)?)$', item)
+
+            if not match or (match.group('prefix') is None and prefix is None):
+                raise ValueError(f"Invalid interface range: '{item}'")
+
+            prefix = match.group('prefix') or prefix
+
+            for number in RangeList.parse(match.group('range'), 0, InterfaceRange.INTERFACE_NUMBER_MAX):
+                interface_name = f'{prefix}{number}'
+
+                if interface_name not in interface_names:
+                    interface_names.append(interface_name)
+
+        return interface_names
+
+    @staticmethod
+    def compress(interface_names: list[InterfaceName]) -> str | None:
+        """
+        Render interface names as an interface range, e.g. `Gig0-3,8,eth1-2`.
+
+        Args:
+            interface_names (list[InterfaceName]): The interface names.
+
+        Returns:
+            str | None: The range, None if a name does not end in a plain number.
+        """
+        numbers: dict[str, list[int]] = {}
+
+        for interface_name in interface_names:
+            match = InterfaceRange.INTERFACE_NUMBER_RE.match(interface_name)
+
+            if not match or not match.group('prefix') or match.group('prefix')[-1] == '-' \
+                    or str(int(match.group('number'))) != match.group('number'):
+                return None
+
+            numbers.setdefault(match.group('prefix'), []).append(int(match.group('number')))
+
+        return ','.join(f'{prefix}{RangeList.compress(values)}' for prefix, values in numbers.items())
+
+    def get_interface_names(self) -> list[InterfaceName]:
+        return self._interface_names
+
+    def validate(self) -> list[InterfaceName]:
+        """
+        Check the whole range against the database with one query.
+
+        Returns:
+            list[InterfaceName]: The interfaces of the range that do not exist, empty if the range is valid.
+        """
+        existing = set(self.get_db_existing_interfaces(self._interface_names))
+        return [interface_name for interface_name in self._interface_names if interface_name not in existing]
+
+    def update_shutdown(self, state: State) -> StatusResult:
+        """
+        Set the shutdown state of every interface of the range.
+
+        The database is only updated once the kernel accepted the `ip -batch`.
+
+        Args:
+            state (State): State.UP or State.DOWN.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if self._run_ip_batch([f'link set dev {interface_name} {state.value}' for interface_name in self._interface_names]):
+            self.log.error(f"Unable to set interfaces {self._interface_names} to {state.value} via OS")
+            return STATUS_NOK
+
+        if self.update_db_range_shutdown_status(self._interface_names, state != State.UP):
+            self.log.error(f"Unable to set interfaces {self._interface_names} to {state.value} via db")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def update_description(self, description: str) -> StatusResult:
+        """
+        Set the description of every interface of the range.
+
+        Args:
+            description (str): The description.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return self.update_db_range_description(self._interface_names, description)
+
+    def set_access_vlan(self, vlan_id: int) -> StatusResult:
+        """
+        Set the access VLAN of every interface of the range.
+
+        Ports of vlan-filtering bridges are reprogrammed with one `bridge -batch` per
+        bridge, the legacy VLAN subinterfaces of the other interfaces are created with one
+        `ip -batch`. The database is only updated once the kernel accepted both; on a
+        failure the subinterfaces created and the bridge VLAN tables are rolled back.
+
+        Args:
+            vlan_id (int): The access VLAN ID.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if not Vlan.is_vlan_id_range_valid(vlan_id) or not Vlan().does_vlan_id_exist_db(vlan_id):
+            self.log.error(f"Invalid VLAN ID: {vlan_id}")
+            return STATUS_NOK
+
+        bridges, others = self._split_by_vlan_filtering_bridge()
+        subinterfaces = {interface_name: f'{interface_name}.{vlan_id}' for interface_name in others}
+        created = [name for name in subinterfaces.values() if not self.does_os_interface_exist(name)]
+
+        lines = [f'link add link {interface_name} name {name} type vlan id {vlan_id}'
+                 for interface_name, name in subinterfaces.items() if name in created]
+        lines.extend(f'link set dev {name} up' for name in subinterfaces.values())
+
+        if lines and self._run_ip_batch(lines):
+            self.log.error(f"Unable to add interfaces {others} to vlan-id: {vlan_id} to OS")
+            self._delete_subinterfaces(created)
+            return STATUS_NOK
+
+        access_vlans = {interface_name: vlan_id for interface_name in self._interface_names
+                        if interface_name not in subinterfaces}
+
+        if bridges and Vlan().apply_vlan_filtering_bridges(bridges, access_vlans):
+            self.log.error(f"Unable to set access vlan-id: {vlan_id} on bridges {bridges}")
+            self._rollback_access_vlan(bridges, created)
+            return STATUS_NOK
+
+        if VlanDatabase().add_interfaces_to_vlan(vlan_id, self._interface_names):
+            self.log.error(f"Unable to add interfaces {self._interface_names} to vlan-id: {vlan_id} to DB")
+            self._rollback_access_vlan(bridges, created)
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def set_switchport_mode(self, mode: SwitchportMode) -> StatusResult:
+        """
+        Set the switchport mode of every interface of the range.
+
+        Args:
+            mode (SwitchportMode): access | trunk.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if VlanDatabase().update_switchport_mode(self._interface_names, mode.value):
+            self.log.error(f"Unable to set switchport mode {mode.value} on interfaces {self._interface_names}")
+            return STATUS_NOK
+
+        return Vlan().apply_vlan_filtering_bridges(self._split_by_vlan_filtering_bridge()[0])
+
+    def set_trunk_allowed_vlans(self, vlan_ids: list[int], add: bool = False, remove: bool = False) -> StatusResult:
+        """
+        Set, extend or reduce the VLANs allowed on every trunk of the range.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs, already validated (see `RangeList.parse()`).
+            add (bool): Add the VLANs to the allowed list.
+            remove (bool): Remove the VLANs from the allowed list.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if VlanDatabase().update_trunk_allowed_vlans(self._interface_names, vlan_ids, add, remove):
+            self.log.error(f"Unable to update trunk allowed VLANs on interfaces {self._interface_names}")
+            return STATUS_NOK
+
+        return Vlan().apply_vlan_filtering_bridges(self._split_by_vlan_filtering_bridge()[0])
+
+    def _split_by_vlan_filtering_bridge(self) -> tuple[list[str], list[InterfaceName]]:
+        """
+        Returns:
+            tuple[list[str], list[InterfaceName]]: The vlan-filtering bridges of the range and
+                the interfaces that are not ports of a vlan-filtering bridge.
+        """
+        bridges: list[str] = []
+        others: list[InterfaceName] = []
+
+        for interface_name in self._interface_names:
+            bridge = VlanDatabase().get_bridge_vlan_filtering(interface_name)
+
+            if bridge and bridge[1]:
+                if bridge[0] not in bridges:
+                    bridges.append(bridge[0])
+            else:
+                others.append(interface_name)
+
+        return bridges, others
+
+    def _rollback_access_vlan(self, bridges: list[str], created: list[InterfaceName]) -> None:
+        """
+        Move the bridge VLAN tables back to the stored configuration and delete the created subinterfaces.
+        """
+        if bridges and Vlan().apply_vlan_filtering_bridges(bridges):
+            self.log.error(f"Unable to restore the VLANs of bridges {bridges}")
+
+        self._delete_subinterfaces(created)
+
+    def _delete_subinterfaces(self, names: list[InterfaceName]) -> None:
+        if not names:
+            return
+
+        # -force: a batch stopped midway did not create every subinterface, the missing ones fail
+        result = self.run(['ip', '-force', '-batch', '-'], stdin=''.join(f'link del dev {name}\n' for name in names),
+                          suppress_error=True)
+        self.log.debug(f"_delete_subinterfaces({result.exit_code}) -> {names}")
+
+    def _run_ip_batch(self, lines: list[str]) -> StatusResult:
+        result = self.run(['ip', '-batch', '-'], stdin='\n'.join(lines) + '\n')
+
+        if result.exit_code:
+            self.log.error(f"ip -batch failed: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
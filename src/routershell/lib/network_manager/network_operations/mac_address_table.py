@@ -0,0 +1,67 @@
+from typing import NamedTuple
+
+from routershell.lib.common.types import InterfaceName, MacAddressText
+
+
+class StaticMacAddress(NamedTuple):
+    """
+    A static MAC address table entry of a bridge, as stored in the `BridgeStaticMacAddresses` table.
+
+    Attributes:
+        mac_address (MacAddressText): The MAC address, `xx:xx:xx:xx:xx:xx`.
+        interface_name (InterfaceName): The bridge port the address is forwarded to.
+        vlan_id (int | None): The VLAN of the entry, None on a bridge without VLAN filtering.
+    """
+    mac_address: MacAddressText
+    interface_name: InterfaceName
+    vlan_id: int | None = None
+
+
+class MacAddressTableBatch:
+    """
+    Compile static MAC address table entries and port learning flags into `bridge -batch` lines.
+
+    Programming thousands of static entries is then a single `bridge` process instead of
+    one `bridge fdb` process per address.
+    """
+
+    AGING_TIME_DEFAULT = 300
+    AGING_TIME_MIN = 10
+    AGING_TIME_MAX = 1000000
+
+    @staticmethod
+    def static_entries(entries: list[StaticMacAddress], remove: bool = False) -> list[str]:
+        """
+        Return the `bridge -batch` lines that add (replace) or delete static entries.
+
+        Args:
+            entries (list[StaticMacAddress]): The entries.
+            remove (bool): Delete the entries instead of adding them.
+
+        Returns:
+            list[str]: One `fdb` line per entry.
+        """
+        action, flags = ('del', '') if remove else ('replace', ' static')
+        return [f'fdb {action} {entry.mac_address} dev {entry.interface_name} master{flags}'
+                f'{"" if entry.vlan_id is None else f" vlan {entry.vlan_id}"}' for entry in entries]
+
+    @staticmethod
+    def learning(ports: list[InterfaceName], enable: bool) -> list[str]:
+        """
+        Return the `bridge -batch` lines that enable or disable MAC learning on bridge ports.
+
+        Args:
+            ports (list[InterfaceName]): The bridge ports.
+            enable (bool): True to learn source addresses.
+
+        Returns:
+            list[str]: One `link` line per port.
+        """
+        return [f'link set dev {port} learning {"on" if enable else "off"}' for port in ports]
+
+    @staticmethod
+    def ageing_time(seconds: int) -> str:
+        """
+        Return the `ip link ... type bridge ageing_time` value (centiseconds) of an aging time in seconds.
+        """
+        return str(seconds * 100)
@@ -1,12 +1,21 @@
 import ipaddress
 import logging
+import shutil
+from collections.abc import Iterator
 from enum import Enum
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import InterfaceName, NatPoolName, StatusResult
 from routershell.lib.db.nat_db import NatDB
+from routershell.lib.network_manager.common.conntrack import Conntrack, ConntrackEntry, ConntrackFilter
 from routershell.lib.network_manager.common.sysctl import SysCtl
+from routershell.lib.network_manager.network_operations.nat_ruleset import (
+    NatPoolBinding,
+    NatRuleset,
+    NatRulesetBackend,
+    NatStaticMapping,
+)
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
 
 
@@ -147,6 +156,9 @@ class Nat(NetworkManager):
         """
         Create or destroy outside NAT (Source NAT) rule.
 
+        The interface binding is stored in the NAT DB and the complete NAT ruleset is
+        recompiled and applied in one transaction via `apply_nat_ruleset()`.
+
         Args:
             nat_pool_name (str): Name of the NAT pool.
             interface_name (str): Name of the external or outside facing interface.
@@ -168,32 +180,17 @@ class Nat(NetworkManager):
                             "with active inside interfaces. Delete inside interfaces first.")
             return STATUS_NOK
 
-        try:
-            create_destroy = '-D' if negate else '-A'
-            
-            command = f'iptables -t nat {create_destroy} POSTROUTING -o {interface_name} -j MASQUERADE'
-            result = self.run(command.split())
-            if result.exit_code:
-                self.log.error(f"Failed to {'destroy' if negate else 'create'} outside NAT rule: {result.stderr}")
-                self.log.error(command)
-                return STATUS_NOK
-
-            if not negate:
-                if NatDB().add_outside_interface(nat_pool_name, interface_name):
-                    self.log.error(f"Unable to add outside interface: {interface_name} to NAT pool: {nat_pool_name} via DB")
-                    return STATUS_NOK
-            else:
-                NatDB().delete_outside_interface(interface_name)
-
-            return STATUS_OK
-        except Exception as e:
-            self.log.error(f"An error occurred while {'destroying' if negate else 'creating'} outside NAT rule: {e} via OS")
-            return STATUS_NOK
+        return self._update_nat_binding(nat_pool_name, interface_name, NATDirection.OUTSIDE, negate)
 
     def create_inside_nat(self, nat_pool_name: NatPoolName, ifName_inside: InterfaceName, negate: bool = False) -> StatusResult:
         """
         Create or destroy inside NAT (Source NAT) rule.
 
+        The interface binding is stored in the NAT DB and the complete NAT ruleset is
+        recompiled and applied in one transaction via `apply_nat_ruleset()`. Inside and
+        outside interfaces may be bound in any order; forwarding rules are emitted once
+        both directions of a pool are present.
+
         Args:
             nat_pool_name (str): Name of the NAT pool.
             ifName_inside (str): Name of the internal interface.
@@ -208,132 +205,418 @@ class Nat(NetworkManager):
             self.log.error(f"NAT pool {nat_pool_name} not found.")
             return STATUS_NOK
 
-        if NatDB().is_interface_direction_in_nat_pool(ifName_inside, 
-                                                      nat_pool_name,
-                                                      NATDirection.INSIDE.value).status:
-            '''Not an error, just a check in case we are re-applying'''
-            self.log.debug(f"Interface {ifName_inside} is part of {NATDirection.INSIDE.value} NAT pool {nat_pool_name}")
+        return self._update_nat_binding(nat_pool_name, ifName_inside, NATDirection.INSIDE, negate)
+
+    def apply_nat_ruleset(self) -> StatusResult:
+        """
+        Compile the NAT state from the `Nats`/`NatDirections`/`NatStaticMappings`/`NatSettings` tables
+        and apply it atomically.
+
+        The ruleset is compiled by `NatRuleset` and committed with a single `nft -f -`
+        (or `iptables-restore --noflush`, see `get_nat_backend()`) invocation, so
+        reconfiguring NAT is one kernel transaction. The rules a previous apply left in the
+        other backend are then removed.
+
+        Returns:
+            StatusResult: STATUS_OK if the ruleset was committed, STATUS_NOK otherwise.
+        """
+        backend = self.get_nat_backend()
+        existing_jumps = self._get_iptables_jumps() if backend is NatRulesetBackend.IPTABLES else set()
+        flow_offload = NatDB().is_flow_offload_enabled()
+
+        if flow_offload and backend is NatRulesetBackend.IPTABLES:
+            self.log.warning("ip flow-offload requires nftables, connections are not offloaded")
+
+        ruleset = NatRuleset.compile(self.get_nat_pool_bindings(), backend, existing_jumps,
+                                     self.get_nat_static_mappings(), flow_offload)
+        self.log.debug(f"apply_nat_ruleset() -> backend: {backend.value}\n{ruleset}")
+
+        result = self.run(NatRuleset.apply_command(backend), stdin=ruleset)
+
+        if result.exit_code:
+            self.log.error(f"Failed to apply NAT ruleset via {backend.value}: {result.stderr}")
             return STATUS_NOK
-        
-        outside_nat_interfaces = NatDB().get_interface_direction_in_nat_pool_list(nat_pool_name, NATDirection.OUTSIDE.value)
-        
-        if len(outside_nat_interfaces) > 1:
-            self.log.error(f"More than 1 interfaces are defined in: {nat_pool}.  DataBase ERROR")
+
+        match backend:
+            case NatRulesetBackend.NFTABLES:
+                if shutil.which('iptables-save') and self._get_iptables_jumps():
+                    self._flush_backend(NatRulesetBackend.IPTABLES)
+            case NatRulesetBackend.IPTABLES:
+                if shutil.which('nft'):
+                    self._flush_backend(NatRulesetBackend.NFTABLES)
+
+        return STATUS_OK
+
+    def get_nat_backend(self) -> NatRulesetBackend:
+        """
+        Select the backend the NAT ruleset is applied through.
+
+        nftables is preferred, but an accept in the `routershell_nat` table does not override
+        a drop in another table or in iptables. When the iptables filter FORWARD policy is not
+        ACCEPT (docker, ufw), the NAT forward rules must be jumped to from that chain, so the
+        iptables backend is used.
+
+        Returns:
+            NatRulesetBackend: The backend to compile and apply the ruleset for.
+        """
+        backend = NatRuleset.detect_backend()
+
+        if backend is NatRulesetBackend.NFTABLES and shutil.which('iptables') and shutil.which('iptables-restore'):
+            result = self.run(['iptables', '-S', 'FORWARD'], suppress_error=True)
+            policy = NatRuleset.parse_iptables_chain_policy(result.stdout, 'FORWARD') if not result.exit_code else None
+
+            if policy not in (None, 'ACCEPT'):
+                self.log.debug(f"get_nat_backend() -> iptables FORWARD policy {policy}, using iptables")
+                return NatRulesetBackend.IPTABLES
+
+        return backend
+
+    def get_nat_pool_bindings(self) -> list[NatPoolBinding]:
+        """
+        Group the NAT DB interface bindings by NAT pool.
+
+        Returns:
+            list[NatPoolBinding]: One entry per NAT pool that has at least one interface bound.
+        """
+        pools: dict[NatPoolName, NatPoolBinding] = {}
+
+        for row in NatDB().get_nat_direction_bindings():
+            pool_name = row['NatPoolName']
+            binding = pools.setdefault(pool_name, NatPoolBinding(pool_name, [], []))
+
+            if row['Direction'] == NATDirection.INSIDE.value:
+                binding.inside_interfaces.append(row['InterfaceName'])
+            else:
+                binding.outside_interfaces.append(row['InterfaceName'])
+
+        return list(pools.values())
+
+    def get_nat_static_mappings(self) -> list[NatStaticMapping]:
+        """
+        Read every static NAT mapping from the NAT DB.
+
+        Returns:
+            list[NatStaticMapping]: The static NAT mappings.
+        """
+        return [NatStaticMapping(row['Protocol'], row['InsideAddress'], row['InsidePort'],
+                                 row['OutsideAddress'], row['OutsidePort'])
+                for row in NatDB().get_static_mappings()]
+
+    @staticmethod
+    def parse_static_mapping(args: list[str]) -> NatStaticMapping:
+        """
+        Parse the arguments of `ip nat inside source static`.
+
+        Syntax:
+            <inside-address> <outside-address>
+            tcp|udp <inside-address> <inside-port> <outside-address> <outside-port>
+
+        Args:
+            args (list[str]): The arguments following `static`.
+
+        Returns:
+            NatStaticMapping: The parsed mapping.
+
+        Raises:
+            ValueError: If the arguments are malformed.
+        """
+        if len(args) == 2:
+            return NatStaticMapping(NatRuleset.STATIC_PROTOCOL_IP,
+                                    str(ipaddress.IPv4Address(args[0])), None,
+                                    str(ipaddress.IPv4Address(args[1])), None)
+
+        if len(args) == 5 and args[0] in ('tcp', 'udp'):
+            inside_port, outside_port = int(args[2]), int(args[4])
+
+            if not (0 < inside_port < 65536 and 0 < outside_port < 65536):
+                raise ValueError(f"Invalid port: {args[2]} {args[4]}")
+
+            return NatStaticMapping(args[0],
+                                    str(ipaddress.IPv4Address(args[1])), inside_port,
+                                    str(ipaddress.IPv4Address(args[3])), outside_port)
+
+        raise ValueError("Expected '<inside-ip> <outside-ip>' or "
+                         "'tcp|udp <inside-ip> <inside-port> <outside-ip> <outside-port>'")
+
+    def create_static_nat(self, mapping: NatStaticMapping, negate: bool = False) -> StatusResult:
+        """
+        Create or destroy a static NAT mapping (1:1 static NAT or port forward).
+
+        The mapping is stored in the NAT DB and applied as a single map element update of
+        the live nftables ruleset; the complete ruleset is re-applied via `apply_nat_ruleset()`
+        when the element update can not be used (iptables backend, or the table is missing).
+
+        Args:
+            mapping (NatStaticMapping): The static NAT mapping.
+            negate (bool, optional): True to destroy the mapping, False to create it. Defaults to False.
+
+        Returns:
+            StatusResult: STATUS_OK if the mapping is created or destroyed successfully, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"create_static_nat() -> {mapping} -> negate: {negate}")
+
+        mappings = self.get_nat_static_mappings()
+
+        if negate and mapping not in mappings:
+            self.log.error(f"Static NAT mapping {mapping} not found.")
             return STATUS_NOK
 
-        outside_nat_interface = outside_nat_interfaces[0]
-        
-        if outside_nat_interface.status:
-            self.log.error(f'Unable to retrieve outside NAT interface: {outside_nat_interface.reason}')
+        if not negate and self._static_mapping_conflicts(mapping, mappings):
+            self.log.error(f"Static NAT mapping {mapping} conflicts with an existing mapping.")
             return STATUS_NOK
-            
-        outside_nat_interface = outside_nat_interface.result
-        
-        outside_nat_if_ip_addr = self.get_interface_ip_addresses(outside_nat_interface['InterfaceName'], 'ipv4')
-        
-        self.log.debug(f"NAT-Pool: {nat_pool_name} -> Out-NAT-ifName: {outside_nat_interface} -> Out-NAT-Inet: {outside_nat_if_ip_addr}")
 
-        if not outside_nat_if_ip_addr:
-            self.log.error(f"No IPv4 address assigned to outside NAT interface: {outside_nat_interface}")
+        if self._store_static_mapping(mapping, negate):
             return STATUS_NOK
-        
-        try:
-            create_destroy = '-D' if negate else '-A'
-            
-            command = f'iptables -t nat {create_destroy} PREROUTING -i {ifName_inside} -j DNAT --to-destination {outside_nat_if_ip_addr[0]}'
-            self.log.debug(f"create_inside_nat() -> cmd: {command}")
-            
-            result = self.run(command.split())
-            
-            if result.exit_code:
-                self.log.error(f"Failed to {'destroy' if negate else 'create'} inside NAT rule: {result.stderr}")
-                return STATUS_NOK
 
-            if negate:
-                if NatDB().delete_inside_interface(nat_pool_name, ifName_inside):
-                    self.log.error(f"Unable to destroy NAT pool: {nat_pool_name} from interface: {ifName_inside} inside interface to DB")
-                    return STATUS_NOK
+        if self._apply_static_mapping(mapping, negate):
+            self.log.error(f"Failed to {'destroy' if negate else 'create'} static NAT mapping {mapping} via OS")
+            self._store_static_mapping(mapping, not negate)
+            return STATUS_NOK
 
-            else:
-                if NatDB().add_inside_interface(nat_pool_name, ifName_inside):
-                    self.log.error(f"Unable to add NAT pool: {nat_pool_name} to interface: {ifName_inside} inside interface to DB")
-                    return STATUS_NOK
+        return STATUS_OK
 
-            return STATUS_OK
-        
-        except Exception as e:
-            self.log.error(f"An error occurred while {'destroying' if negate else 'creating'} inside NAT rule: {e}")
-            return STATUS_NOK
-    
-    def create_fw_nat_rule(self, in_ifName: InterfaceName, out_ifName: InterfaceName) -> StatusResult:
-        '''
-        sudo iptables -A INPUT -m state --state ESTABLISHED,RELATED -j ACCEPT
-        sudo iptables -A INPUT -i Gig0 -j ACCEPT
-        sudo iptables -A FORWARD -i Gig0 -o Gig1 -j ACCEPT
-        '''
+    def set_flow_offload(self, negate: bool = False) -> StatusResult:
+        """
+        Enable or disable `ip flow-offload` and re-apply the NAT ruleset.
 
-        # INPUT chain rules
-        input_rules = [
-             'iptables -A INPUT -m state --state ESTABLISHED,RELATED -j ACCEPT',
-            f'iptables -A INPUT -i {in_ifName} -j ACCEPT'
-        ]
+        Established TCP/UDP connections between the NAT inside and outside interfaces are
+        added to an nftables flowtable and forwarded from the ingress hook, bypassing the
+        forward path. Only available with the nftables backend.
 
-        # FORWARD chain rules
-        forward_rules = [
-            f'iptables -A FORWARD -i {in_ifName} -o {out_ifName} -j ACCEPT'
-        ]
+        Args:
+            negate (bool, optional): True to disable flow offload. Defaults to False.
 
-        for rule in input_rules + forward_rules:
-            
-            result = self.run([rule])
-            
-            if result.exit_code:
-                self.log.error(f"Unable to apply fire-wall NAT rule: {result.stderr}")    
-                return STATUS_NOK
+        Returns:
+            StatusResult: STATUS_OK if the setting was stored and applied, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"set_flow_offload() -> negate: {negate}")
+
+        if self.get_nat_backend() is not NatRulesetBackend.NFTABLES and not negate:
+            self.log.error("ip flow-offload requires the nftables backend (nft, iptables FORWARD policy ACCEPT)")
+            return STATUS_NOK
+
+        if NatDB().set_flow_offload(not negate):
+            return STATUS_NOK
+
+        if self.apply_nat_ruleset():
+            self.log.error(f"Failed to {'disable' if negate else 'enable'} flow offload via OS")
+            NatDB().set_flow_offload(negate)
+            return STATUS_NOK
 
         return STATUS_OK
 
+    def get_flow_offload_counters(self) -> dict[str, tuple[int, int]]:
+        """
+        Read the flow offload counters of the live NAT ruleset.
+
+        Returns:
+            dict[str, tuple[int, int]]: (packets, bytes) keyed by `NatRuleset.NFT_SLOW_PATH_COUNTER`,
+                the packets still evaluated by the forward chain, empty when flow offload is not applied.
+        """
+        if self.get_nat_backend() is not NatRulesetBackend.NFTABLES:
+            return {}
+
+        result = self.run(['nft', '-j', 'list', 'counters', 'table', NatRuleset.NFT_FAMILY, NatRuleset.NFT_TABLE],
+                          suppress_error=True)
+
+        return NatRuleset.parse_nft_counters(result.stdout) if not result.exit_code else {}
+
+    def count_offloaded_flows(self) -> int:
+        """
+        Count the connections offloaded to the flowtable, flagged `[OFFLOAD]` by conntrack.
+
+        Returns:
+            int: The number of offloaded connections.
+
+        Raises:
+            ConntrackError: If the conntrack table can not be read.
+        """
+        return sum(entry.is_offloaded() for entry in Conntrack().dump())
+
+    @staticmethod
+    def parse_translation_filter(args: list[str]) -> tuple[str | None, InterfaceName | None, str | None]:
+        """
+        Parse the filter arguments of `show ip nat translations` and `clear ip nat translation`.
+
+        Syntax:
+            [inside <inside-ip>] [interface <interface-name>] [protocol tcp|udp|icmp]
+
+        Args:
+            args (list[str]): The arguments following `translations`/`translation`.
+
+        Returns:
+            tuple[str | None, InterfaceName | None, str | None]: The inside address, interface and protocol.
+
+        Raises:
+            ValueError: If the arguments are malformed.
+        """
+        options: dict[str, str] = {}
+        tokens = list(args)
+
+        while tokens:
+            keyword = tokens.pop(0)
+
+            if keyword not in ('inside', 'interface', 'protocol') or not tokens:
+                raise ValueError("Expected '[inside <ip>] [interface <name>] [protocol tcp|udp|icmp]'")
+
+            options[keyword] = tokens.pop(0)
+
+        if 'inside' in options:
+            options['inside'] = str(ipaddress.IPv4Address(options['inside']))
+
+        if options.get('protocol', 'tcp') not in Conntrack.PROTOCOL_NUMBERS:
+            raise ValueError(f"Invalid protocol: {options['protocol']}")
+
+        return options.get('inside'), options.get('interface'), options.get('protocol')
+
+    def get_nat_translations(self, inside_address: str | None = None, interface_name: InterfaceName | None = None,
+                             protocol: str | None = None) -> Iterator[ConntrackEntry]:
+        """
+        Stream the active NAT translations from the kernel conntrack table.
+
+        Entries are decoded from ctnetlink as they arrive and filtered on the fly, so
+        memory use stays flat regardless of the number of tracked connections.
+
+        Args:
+            inside_address (str | None): Only translations of this inside local address.
+            interface_name (InterfaceName | None): Only translations whose inside local or inside
+                global address is within a network of this interface.
+            protocol (str | None): tcp | udp | icmp.
+
+        Yields:
+            ConntrackEntry: The matching translations.
+
+        Raises:
+            ConntrackError: If the conntrack table can not be read.
+        """
+        return Conntrack().dump(self._translation_filter(inside_address, interface_name, protocol))
+
+    def clear_nat_translations(self, inside_address: str | None = None, interface_name: InterfaceName | None = None,
+                               protocol: str | None = None) -> StatusResult:
+        """
+        Delete the active NAT translations matching the filter, every translation when no filter is given.
+
+        Only conntrack entries rewritten by NAT are deleted, one targeted delete per entry.
+
+        Returns:
+            StatusResult: STATUS_OK if the translations were deleted, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"clear_nat_translations() -> inside: {inside_address} "
+                       f"interface: {interface_name} protocol: {protocol}")
+        return Conntrack().clear(self._translation_filter(inside_address, interface_name, protocol))
+
     def flush_nat_configuration(self) -> None:
         """
         Flush NAT configurations and reset the NAT pool Data Base.
 
         This method performs the following actions:
-        1. Flush the NAT rules in the nat table.
-        2. Flush the NAT rules in the mangle table (if used for NAT).
-        3. Delete any user-defined chains in the nat table (optional).
-        4. Delete any user-defined chains in the mangle table (optional).
-        5. Flush the NAT rules in the nat table for IPv6.
-        6. Delete any user-defined chains in the nat table for IPv6 (optional).
-        7. Reset NatPool Database.
-
-        Note:
-        - This method uses the 'sudo' command to execute iptables and ip6tables commands.
-        - Ensure that your NatPoolDB class has a proper method or logic to destroy NatPoolDB.
+        1. Remove every RouterShell owned NAT, forward and input rule with a single
+           `nft -f -` / `iptables-restore --noflush` transaction per installed backend.
+        2. Reset NatPool Database.
 
         Returns:
         None
         """
-        # Flush the NAT rules in the nat table
-        self.run(['sudo', 'iptables', '-t', 'nat', '-F'], suppress_error=True)
+        for backend, command in ((NatRulesetBackend.NFTABLES, 'nft'), (NatRulesetBackend.IPTABLES, 'iptables-restore')):
+            if shutil.which(command):
+                self._flush_backend(backend)
+
+        NatDB().reset_db()
+
+    def _update_nat_binding(self, nat_pool_name: NatPoolName, interface_name: InterfaceName,
+                            direction: NATDirection, negate: bool) -> StatusResult:
+        """
+        Store or remove an interface NAT binding and re-apply the ruleset, reverting the DB on failure.
+        """
+        exists = NatDB().is_interface_direction_in_nat_pool(interface_name, nat_pool_name, direction.value).status
 
-        # Flush the NAT rules in the mangle table (if used for NAT)
-        self.run(['sudo', 'iptables', '-t', 'mangle', '-F'], suppress_error=True)
+        if exists != negate:
+            self.log.debug(f"Interface {interface_name} {'is not' if negate else 'is already'} "
+                           f"{direction.value} NAT pool {nat_pool_name}")
+            return STATUS_NOK
 
-        # Delete any user-defined chains in the nat table (optional)
-        self.run(['sudo', 'iptables', '-t', 'nat', '-X'], suppress_error=True)
+        if self._store_nat_binding(nat_pool_name, interface_name, direction, negate):
+            self.log.error(f"Unable to update {direction.value} interface: {interface_name} "
+                           f"in NAT pool: {nat_pool_name} via DB")
+            return STATUS_NOK
 
-        # Delete any user-defined chains in the mangle table (optional)
-        self.run(['sudo', 'iptables', '-t', 'mangle', '-X'], suppress_error=True)
+        if self.apply_nat_ruleset():
+            self.log.error(f"Failed to {'destroy' if negate else 'create'} {direction.value} NAT rule "
+                           f"for interface: {interface_name} via OS")
+            self._store_nat_binding(nat_pool_name, interface_name, direction, not negate)
+            return STATUS_NOK
 
-        # Flush the NAT rules in the nat table for IPv6
-        self.run(['sudo', 'ip6tables', '-t', 'nat', '-F'], suppress_error=True)
+        return STATUS_OK
 
-        # Delete any user-defined chains in the nat table for IPv6 (optional)
-        self.run(['sudo', 'ip6tables', '-t', 'nat', '-X'], suppress_error=True)
+    def _store_nat_binding(self, nat_pool_name: NatPoolName, interface_name: InterfaceName,
+                           direction: NATDirection, negate: bool) -> StatusResult:
+        match (direction, negate):
+            case (NATDirection.INSIDE, False):
+                return NatDB().add_inside_interface(nat_pool_name, interface_name)
+            case (NATDirection.INSIDE, True):
+                return NatDB().delete_inside_interface(nat_pool_name, interface_name)
+            case (NATDirection.OUTSIDE, False):
+                return NatDB().add_outside_interface(nat_pool_name, interface_name)
+            case _:
+                return NatDB().delete_outside_interface(nat_pool_name, interface_name)
+
+    def _apply_static_mapping(self, mapping: NatStaticMapping, negate: bool) -> StatusResult:
+        if self.get_nat_backend() is NatRulesetBackend.NFTABLES:
+            result = self.run(['nft', '-f', '-'], suppress_error=True,
+                              stdin=NatRuleset.compile_static_mapping_update(mapping, negate))
+            if not result.exit_code:
+                return STATUS_OK
+
+            self.log.debug(f"Static NAT element update failed, re-applying NAT ruleset: {result.stderr}")
+
+        return self.apply_nat_ruleset()
+
+    def _store_static_mapping(self, mapping: NatStaticMapping, negate: bool) -> StatusResult:
+        if negate:
+            return NatDB().delete_static_mapping(*mapping)
+        return NatDB().add_static_mapping(*mapping)
+
+    @staticmethod
+    def _static_mapping_conflicts(mapping: NatStaticMapping, mappings: list[NatStaticMapping]) -> bool:
+        for existing in mappings:
+            if existing.is_port_forward() != mapping.is_port_forward():
+                continue
+
+            if mapping.is_port_forward():
+                if (existing.protocol, existing.outside_address, existing.outside_port) == \
+                        (mapping.protocol, mapping.outside_address, mapping.outside_port):
+                    return True
+
+            elif existing.outside_address == mapping.outside_address or \
+                    existing.inside_address == mapping.inside_address:
+                return True
+
+        return False
+
+    def _translation_filter(self, inside_address: str | None, interface_name: InterfaceName | None,
+                            protocol: str | None) -> ConntrackFilter:
+        networks = None
+
+        if interface_name:
+            networks = [ipaddress.IPv4Network(f"{addr['local']}/{addr['prefixlen']}", strict=False)
+                        for link in self.get_ip_addr_info(interface_name) or []
+                        for addr in link.get('addr_info', []) if addr.get('family') == 'inet']
+
+        return ConntrackFilter(inside_address, networks,
+                               Conntrack.PROTOCOL_NUMBERS[protocol] if protocol else None)
+
+    def _flush_backend(self, backend: NatRulesetBackend) -> None:
+        self.run(NatRuleset.apply_command(backend), suppress_error=True, stdin=NatRuleset.compile_flush(backend))
+
+    def _get_iptables_jumps(self) -> set[tuple[str, str, str]]:
+        result = self.run(['iptables-save'], suppress_error=True)
+        return NatRuleset.parse_iptables_save_jumps(result.stdout)
 
-        NatDB().reset_db()
-        
     def getNatIpTable(self) -> str:
-        command = "iptables -t nat -L"
-        out = self.run(command.split())
+        match self.get_nat_backend():
+            case NatRulesetBackend.NFTABLES:
+                command = ['nft', 'list', 'table', NatRuleset.NFT_FAMILY, NatRuleset.NFT_TABLE]
+            case NatRulesetBackend.IPTABLES:
+                command = ['iptables', '-t', 'nat', '-L', '-n', '-v']
+        out = self.run(command, suppress_error=True)
         return out.stdout
\ No newline at end of file
@@ -0,0 +1,449 @@
+import json
+import shutil
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.types import InetAddressText, InterfaceName, NatPoolName
+
+
+class NatRulesetBackend(Enum):
+    """
+    Enumeration of the kernel interfaces a compiled NAT ruleset can be applied through.
+
+    - `NFTABLES`: Applied as one `nft -f -` transaction.
+    - `IPTABLES`: Applied as one `iptables-restore --noflush` transaction.
+    """
+    NFTABLES = 'nftables'
+    IPTABLES = 'iptables'
+
+
+class NatPoolBinding(NamedTuple):
+    """
+    The interfaces bound to a NAT pool, as stored in the `Nats`/`NatDirections` tables.
+
+    Attributes:
+        nat_pool_name (NatPoolName): The name of the NAT pool.
+        inside_interfaces (list[InterfaceName]): Interfaces configured with `ip nat inside`.
+        outside_interfaces (list[InterfaceName]): Interfaces configured with `ip nat outside`.
+    """
+    nat_pool_name: NatPoolName
+    inside_interfaces: list[InterfaceName]
+    outside_interfaces: list[InterfaceName]
+
+
+class NatStaticMapping(NamedTuple):
+    """
+    A static NAT mapping, as stored in the `NatStaticMappings` table.
+
+    Attributes:
+        protocol (str): `ip` for 1:1 static NAT, `tcp` or `udp` for a port forward.
+        inside_address (InetAddressText): The inside local address.
+        inside_port (int | None): The inside local port, None for 1:1 static NAT.
+        outside_address (InetAddressText): The inside global (outside) address.
+        outside_port (int | None): The inside global (outside) port, None for 1:1 static NAT.
+    """
+    protocol: str
+    inside_address: InetAddressText
+    inside_port: int | None
+    outside_address: InetAddressText
+    outside_port: int | None
+
+    def is_port_forward(self) -> bool:
+        return self.protocol != NatRuleset.STATIC_PROTOCOL_IP
+
+
+class NatRuleset:
+    """
+    Compile the complete RouterShell NAT state into a single ruleset document.
+
+    The document replaces every RouterShell owned NAT rule in one kernel transaction,
+    so there is never a window where traffic is evaluated against a partial ruleset.
+    All methods are static and free of side effects; applying the document is left
+    to the caller (see `Nat.apply_nat_ruleset()`).
+    """
+
+    NFT_FAMILY = 'ip'
+    NFT_TABLE = 'routershell_nat'
+
+    NFT_STATIC_PORT_MAP = 'static_dnat_port'
+    NFT_STATIC_DNAT_MAP = 'static_dnat'
+    NFT_STATIC_SNAT_MAP = 'static_snat'
+
+    NFT_FLOWTABLE = 'nat_offload'
+    NFT_SLOW_PATH_COUNTER = 'slow_path_packets'
+
+    STATIC_PROTOCOL_IP = 'ip'
+
+    IPT_NAT_PREROUTING_CHAIN = 'RS-NAT-PREROUTING'
+    IPT_NAT_POSTROUTING_CHAIN = 'RS-NAT-POSTROUTING'
+    IPT_FORWARD_CHAIN = 'RS-NAT-FORWARD'
+    IPT_INPUT_CHAIN = 'RS-NAT-INPUT'
+
+    IPT_JUMPS: list[tuple[str, str, str]] = [
+        ('nat', 'PREROUTING', IPT_NAT_PREROUTING_CHAIN),
+        ('nat', 'POSTROUTING', IPT_NAT_POSTROUTING_CHAIN),
+        ('filter', 'FORWARD', IPT_FORWARD_CHAIN),
+        ('filter', 'INPUT', IPT_INPUT_CHAIN),
+    ]
+
+    @staticmethod
+    def detect_backend() -> NatRulesetBackend:
+        """
+        Select the ruleset backend installed on this system, see `Nat.get_nat_backend()`
+        for the backend the ruleset is actually applied through.
+
+        Returns:
+            NatRulesetBackend: NFTABLES when the `nft` binary is installed, IPTABLES otherwise.
+        """
+        return NatRulesetBackend.NFTABLES if shutil.which('nft') else NatRulesetBackend.IPTABLES
+
+    @staticmethod
+    def apply_command(backend: NatRulesetBackend) -> list[str]:
+        """
+        Return the command that reads a compiled document from standard input and commits it atomically.
+
+        Args:
+            backend (NatRulesetBackend): The backend the document was compiled for.
+
+        Returns:
+            list[str]: The command and its arguments.
+        """
+        match backend:
+            case NatRulesetBackend.NFTABLES:
+                return ['nft', '-f', '-']
+            case NatRulesetBackend.IPTABLES:
+                return ['iptables-restore', '--noflush']
+
+    @staticmethod
+    def compile(bindings: list[NatPoolBinding], backend: NatRulesetBackend,
+                existing_jumps: set[tuple[str, str, str]] | None = None,
+                static_mappings: list[NatStaticMapping] | None = None,
+                flow_offload: bool = False) -> str:
+        """
+        Compile NAT pool bindings into a ruleset document for the selected backend.
+
+        Args:
+            bindings (list[NatPoolBinding]): NAT state read from the `Nats`/`NatDirections` tables.
+            backend (NatRulesetBackend): The backend to compile for.
+            existing_jumps (set[tuple[str, str, str]] | None): IPTABLES only, the (table, chain, target)
+                jumps already present in the kernel so they are not appended twice.
+            static_mappings (list[NatStaticMapping] | None): Static NAT mappings read from the
+                `NatStaticMappings` table.
+            flow_offload (bool): NFTABLES only, offload established connections through a flowtable.
+
+        Returns:
+            str: The ruleset document.
+        """
+        match backend:
+            case NatRulesetBackend.NFTABLES:
+                return NatRuleset.compile_nftables(bindings, static_mappings or [], flow_offload)
+            case NatRulesetBackend.IPTABLES:
+                return NatRuleset.compile_iptables_restore(bindings, existing_jumps or set(), static_mappings or [])
+
+    @staticmethod
+    def compile_flush(backend: NatRulesetBackend) -> str:
+        """
+        Compile a document that removes every RouterShell owned NAT rule in one transaction.
+
+        Args:
+            backend (NatRulesetBackend): The backend to compile for.
+
+        Returns:
+            str: The ruleset document.
+        """
+        match backend:
+            case NatRulesetBackend.NFTABLES:
+                return '\n'.join(NatRuleset._nft_table_reset()) + '\n'
+            case NatRulesetBackend.IPTABLES:
+                return NatRuleset.compile_iptables_restore([], set(NatRuleset.IPT_JUMPS))
+
+    @staticmethod
+    def compile_nftables(bindings: list[NatPoolBinding], static_mappings: list[NatStaticMapping] | None = None,
+                         flow_offload: bool = False) -> str:
+        """
+        Compile NAT pool bindings into an `nft -f` document.
+
+        The RouterShell table is declared, deleted and re-created inside the same document,
+        which nftables commits as one transaction. Interface lists are rendered as anonymous
+        sets so a rule matches any number of inside interfaces with a single lookup.
+
+        Static NAT mappings are elements of named maps consulted by one `dnat`/`snat`
+        rule each, so the per-packet cost does not grow with the number of mappings and
+        a mapping is added or removed with `compile_static_mapping_update()`.
+
+        With flow offload, a flowtable is declared over every NAT inside and outside
+        interface and established TCP/UDP connections are added to it, so their packets
+        are forwarded from the ingress hook without traversing the forward path. The
+        `slow_path_packets` counter counts the packets still evaluated by the forward chain;
+        the offloaded connections are those conntrack flags `[OFFLOAD]`
+        (see `Nat.count_offloaded_flows()`).
+
+        Args:
+            bindings (list[NatPoolBinding]): NAT state read from the database.
+            static_mappings (list[NatStaticMapping] | None): Static NAT mappings read from the database.
+            flow_offload (bool): Offload established connections through a flowtable.
+
+        Returns:
+            str: The nftables ruleset document.
+        """
+        static_mappings = static_mappings or []
+        postrouting: list[str] = [f'snat ip to ip saddr map @{NatRuleset.NFT_STATIC_SNAT_MAP}']
+        forward: list[str] = []
+        input_rules: list[str] = []
+
+        for binding in bindings:
+            comment = f'comment "nat-pool {binding.nat_pool_name}"'
+
+            if binding.outside_interfaces:
+                postrouting.append(
+                    f'oifname {NatRuleset._nft_set(binding.outside_interfaces)} masquerade {comment}')
+
+            if binding.inside_interfaces:
+                input_rules.append(f'iifname {NatRuleset._nft_set(binding.inside_interfaces)} accept {comment}')
+
+            if binding.inside_interfaces and binding.outside_interfaces:
+                forward.append(f'iifname {NatRuleset._nft_set(binding.inside_interfaces)} '
+                               f'oifname {NatRuleset._nft_set(binding.outside_interfaces)} accept {comment}')
+
+        lines = NatRuleset._nft_table_reset()
+        lines.append(f'table {NatRuleset.NFT_FAMILY} {NatRuleset.NFT_TABLE} {{')
+
+        static_maps = {NatRuleset.NFT_STATIC_PORT_MAP: ('ipv4_addr . inet_proto . inet_service : ipv4_addr . inet_service', []),
+                       NatRuleset.NFT_STATIC_DNAT_MAP: ('ipv4_addr : ipv4_addr', []),
+                       NatRuleset.NFT_STATIC_SNAT_MAP: ('ipv4_addr : ipv4_addr', [])}
+
+        for mapping in static_mappings:
+            for map_name, element in NatRuleset._nft_static_elements(mapping):
+                static_maps[map_name][1].append(element)
+
+        for map_name, (map_type, elements) in static_maps.items():
+            lines.extend(NatRuleset._nft_map(map_name, map_type, elements))
+
+        offload_devices = sorted({interface for binding in bindings
+                                  for interface in binding.inside_interfaces + binding.outside_interfaces})
+
+        if flow_offload and offload_devices:
+            lines.extend(NatRuleset._nft_flowtable(NatRuleset.NFT_FLOWTABLE, offload_devices))
+            lines.extend([f'\tcounter {NatRuleset.NFT_SLOW_PATH_COUNTER} {{', '\t}'])
+            forward = [f'counter name "{NatRuleset.NFT_SLOW_PATH_COUNTER}"',
+                       f'meta l4proto {{ tcp, udp }} ct state established flow add @{NatRuleset.NFT_FLOWTABLE}',
+                       'ct state established,related accept'] + forward
+
+        elif forward:
+            forward.insert(0, 'ct state established,related accept')
+
+        lines.extend(NatRuleset._nft_chain('prerouting', 'type nat hook prerouting priority dstnat; policy accept;',
+                                           [f'meta l4proto {{ tcp, udp }} dnat ip addr . port to '
+                                            f'ip daddr . meta l4proto . th dport map @{NatRuleset.NFT_STATIC_PORT_MAP}',
+                                            f'dnat ip to ip daddr map @{NatRuleset.NFT_STATIC_DNAT_MAP}']))
+
+        lines.extend(NatRuleset._nft_chain('postrouting', 'type nat hook postrouting priority srcnat; policy accept;',
+                                           postrouting))
+
+        if forward:
+            lines.extend(NatRuleset._nft_chain('forward', 'type filter hook forward priority filter; policy accept;',
+                                               forward))
+
+        if input_rules:
+            lines.extend(NatRuleset._nft_chain('input', 'type filter hook input priority filter; policy accept;',
+                                               ['ct state established,related accept'] + input_rules))
+
+        lines.append('}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def compile_iptables_restore(bindings: list[NatPoolBinding], existing_jumps: set[tuple[str, str, str]],
+                                 static_mappings: list[NatStaticMapping] | None = None) -> str:
+        """
+        Compile NAT pool bindings into an `iptables-restore --noflush` document.
+
+        RouterShell rules live in dedicated chains. Declaring a chain in a `--noflush`
+        restore empties it, so the whole document replaces the previous RouterShell
+        rules in one commit without touching rules owned by other software.
+
+        Args:
+            bindings (list[NatPoolBinding]): NAT state read from the database.
+            existing_jumps (set[tuple[str, str, str]]): (table, chain, target) jumps already in the kernel.
+            static_mappings (list[NatStaticMapping] | None): Static NAT mappings read from the database,
+                rendered as one DNAT (and SNAT for 1:1) rule each.
+
+        Returns:
+            str: The iptables-restore document.
+        """
+        prerouting_rules: list[str] = []
+        nat_rules: list[str] = []
+
+        for mapping in static_mappings or []:
+            if mapping.is_port_forward():
+                prerouting_rules.append(f'-A {NatRuleset.IPT_NAT_PREROUTING_CHAIN} -d {mapping.outside_address}/32 '
+                                        f'-p {mapping.protocol} --dport {mapping.outside_port} -j DNAT '
+                                        f'--to-destination {mapping.inside_address}:{mapping.inside_port}')
+            else:
+                prerouting_rules.append(f'-A {NatRuleset.IPT_NAT_PREROUTING_CHAIN} -d {mapping.outside_address}/32 '
+                                        f'-j DNAT --to-destination {mapping.inside_address}')
+                nat_rules.append(f'-A {NatRuleset.IPT_NAT_POSTROUTING_CHAIN} -s {mapping.inside_address}/32 '
+                                 f'-j SNAT --to-source {mapping.outside_address}')
+        forward_rules: list[str] = []
+        input_rules: list[str] = []
+
+        for binding in bindings:
+            for outside_if in binding.outside_interfaces:
+                nat_rules.append(f'-A {NatRuleset.IPT_NAT_POSTROUTING_CHAIN} -o {outside_if} -j MASQUERADE')
+
+            for inside_if in binding.inside_interfaces:
+                input_rules.append(f'-A {NatRuleset.IPT_INPUT_CHAIN} -i {inside_if} -j ACCEPT')
+
+                for outside_if in binding.outside_interfaces:
+                    forward_rules.append(f'-A {NatRuleset.IPT_FORWARD_CHAIN} -i {inside_if} -o {outside_if} -j ACCEPT')
+
+        established = '-m conntrack --ctstate ESTABLISHED,RELATED -j ACCEPT'
+
+        if forward_rules:
+            forward_rules.insert(0, f'-A {NatRuleset.IPT_FORWARD_CHAIN} {established}')
+
+        if input_rules:
+            input_rules.insert(0, f'-A {NatRuleset.IPT_INPUT_CHAIN} {established}')
+
+        jumps = {table: [f'-A {chain} -j {target}' for jump_table, chain, target in NatRuleset.IPT_JUMPS
+                         if jump_table == table and (jump_table, chain, target) not in existing_jumps]
+                 for table in ('nat', 'filter')}
+
+        lines = ['*nat', f':{NatRuleset.IPT_NAT_PREROUTING_CHAIN} - [0:0]', f':{NatRuleset.IPT_NAT_POSTROUTING_CHAIN} - [0:0]']
+        lines.extend(prerouting_rules + nat_rules + jumps['nat'])
+        lines.append('COMMIT')
+
+        lines.extend(['*filter', f':{NatRuleset.IPT_FORWARD_CHAIN} - [0:0]', f':{NatRuleset.IPT_INPUT_CHAIN} - [0:0]'])
+        lines.extend(forward_rules + input_rules + jumps['filter'])
+        lines.append('COMMIT')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def compile_static_mapping_update(mapping: NatStaticMapping, negate: bool = False) -> str:
+        """
+        Compile an `nft -f` document that adds or removes one static NAT mapping.
+
+        The mapping is a map element update of the live RouterShell table, no rule is
+        inserted or deleted. A 1:1 mapping updates the DNAT and SNAT maps in one transaction.
+
+        Args:
+            mapping (NatStaticMapping): The static NAT mapping.
+            negate (bool, optional): True to remove the mapping. Defaults to False.
+
+        Returns:
+            str: The nftables document.
+        """
+        lines = []
+
+        for map_name, element in NatRuleset._nft_static_elements(mapping):
+            if negate:
+                element = element.split(' : ')[0]
+            lines.append(f'{"delete" if negate else "add"} element {NatRuleset.NFT_FAMILY} {NatRuleset.NFT_TABLE} '
+                         f'{map_name} {{ {element} }}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def parse_nft_counters(nft_json: str) -> dict[str, tuple[int, int]]:
+        """
+        Extract the named counters of the RouterShell table from `nft -j list counters` output.
+
+        Args:
+            nft_json (str): Output of `nft -j list counters table ip routershell_nat`.
+
+        Returns:
+            dict[str, tuple[int, int]]: (packets, bytes) of each counter, empty if the output can not be parsed.
+        """
+        try:
+            objects = json.loads(nft_json).get('nftables', [])
+        except (ValueError, AttributeError):
+            return {}
+
+        return {entry['counter']['name']: (entry['counter'].get('packets', 0), entry['counter'].get('bytes', 0))
+                for entry in objects
+                if 'counter' in entry and entry['counter'].get('table') == NatRuleset.NFT_TABLE}
+
+    @staticmethod
+    def parse_iptables_chain_policy(iptables_s: str, chain: str) -> str | None:
+        """
+        Extract the policy of a built-in chain from `iptables -S <chain>` output.
+
+        Args:
+            iptables_s (str): Output of `iptables -S <chain>`.
+            chain (str): The built-in chain, e.g. `FORWARD`.
+
+        Returns:
+            str | None: The policy (`ACCEPT`, `DROP`), None if not found.
+        """
+        for line in iptables_s.splitlines():
+            parts = line.split()
+
+            if len(parts) == 3 and parts[:2] == ['-P', chain]:
+                return parts[2]
+
+        return None
+
+    @staticmethod
+    def parse_iptables_save_jumps(iptables_save: str) -> set[tuple[str, str, str]]:
+        """
+        Extract the RouterShell jump rules present in `iptables-save` output.
+
+        Args:
+            iptables_save (str): Output of `iptables-save`.
+
+        Returns:
+            set[tuple[str, str, str]]: The (table, chain, target) jumps found.
+        """
+        wanted = {(chain, target): table for table, chain, target in NatRuleset.IPT_JUMPS}
+        found: set[tuple[str, str, str]] = set()
+        table = ''
+
+        for line in iptables_save.splitlines():
+            if line.startswith('*'):
+                table = line[1:].strip()
+                continue
+
+            parts = line.split()
+
+            if len(parts) == 4 and parts[0] == '-A' and parts[2] == '-j' and wanted.get((parts[1], parts[3])) == table:
+                found.add((table, parts[1], parts[3]))
+
+        return found
+
+    @staticmethod
+    def _nft_set(interfaces: list[InterfaceName]) -> str:
+        if len(interfaces) == 1:
+            return f'"{interfaces[0]}"'
+        return '{ ' + ', '.join(f'"{interface}"' for interface in interfaces) + ' }'
+
+    @staticmethod
+    def _nft_static_elements(mapping: NatStaticMapping) -> list[tuple[str, str]]:
+        if mapping.is_port_forward():
+            return [(NatRuleset.NFT_STATIC_PORT_MAP,
+                     f'{mapping.outside_address} . {mapping.protocol} . {mapping.outside_port} : '
+                     f'{mapping.inside_address} . {mapping.inside_port}')]
+        return [(NatRuleset.NFT_STATIC_DNAT_MAP, f'{mapping.outside_address} : {mapping.inside_address}'),
+                (NatRuleset.NFT_STATIC_SNAT_MAP, f'{mapping.inside_address} : {mapping.outside_address}')]
+
+    @staticmethod
+    def _nft_map(name: str, map_type: str, elements: list[str]) -> list[str]:
+        lines = [f'\tmap {name} {{', f'\t\ttype {map_type};']
+        if elements:
+            lines.append(f'\t\telements = {{ {", ".join(elements)} }}')
+        return lines + ['\t}']
+
+    @staticmethod
+    def _nft_flowtable(name: str, devices: list[InterfaceName]) -> list[str]:
+        quoted = ', '.join(f'"{device}"' for device in devices)
+        return [f'\tflowtable {name} {{', '\t\thook ingress priority filter;',
+                f'\t\tdevices = {{ {quoted} }};', '\t\tcounter;', '\t}']
+
+    @staticmethod
+    def _nft_table_reset() -> list[str]:
+        return [f'table {NatRuleset.NFT_FAMILY} {NatRuleset.NFT_TABLE}',
+                f'delete table {NatRuleset.NFT_FAMILY} {NatRuleset.NFT_TABLE}']
+
+    @staticmethod
+    def _nft_chain(name: str, hook: str, rules: list[str]) -> list[str]:
+        return [f'\tchain {name} {{', f'\t\t{hook}'] + [f'\t\t{rule}' for rule in rules] + ['\t}']
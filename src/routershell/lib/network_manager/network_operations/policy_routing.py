@@ -0,0 +1,196 @@
+import ipaddress
+import logging
+from typing import NamedTuple
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InetCidrText, InterfaceName, StatusResult
+from routershell.lib.db.route_db import RouteDatabase
+from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
+from routershell.lib.network_manager.network_operations.route import Route
+
+
+class PolicyRule(NamedTuple):
+    """
+    A policy routing rule, the packets matching every selector are routed by `table`.
+
+    Attributes:
+        priority (int): The rule priority, rules are evaluated in ascending priority.
+        table (int): The routing table of the matching packets.
+        source (InetCidrText | None): The source prefix selector.
+        fwmark (int | None): The firewall mark selector.
+        fwmask (int | None): The mask applied to the firewall mark, all bits when None.
+        input_interface (InterfaceName | None): The incoming interface selector.
+    """
+    priority: int
+    table: int
+    source: InetCidrText | None = None
+    fwmark: int | None = None
+    fwmask: int | None = None
+    input_interface: InterfaceName | None = None
+
+
+class PolicyRouting(NetworkManager):
+    """
+    Policy routing rules (`ip policy`), programmed with `ip -batch` as `ip rule` entries.
+    """
+
+    # 0, 32766 and 32767 hold the local, main and default rules of the kernel
+    PRIORITY_RANGE = range(1, 32766)
+
+    def __init__(self):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ROUTE)
+
+    @classmethod
+    def parse_policy(cls, args: list[str]) -> PolicyRule:
+        """
+        Parse the arguments of `ip policy`.
+
+        Syntax:
+            <priority> [from <prefix>] [fwmark <mark>[/<mask>]] [iif <interface>] table <table>
+
+        Args:
+            args (list[str]): The arguments following `policy`.
+
+        Returns:
+            PolicyRule: The parsed rule.
+
+        Raises:
+            ValueError: If the arguments are malformed.
+        """
+        if len(args) < 3 or len(args) % 2 == 0:
+            raise ValueError("Expected '<priority> [from <prefix>] [fwmark <mark>[/<mask>]] [iif <interface>] table <table>'")
+
+        priority = int(args[0])
+
+        if priority not in cls.PRIORITY_RANGE:
+            raise ValueError(f"Invalid priority: {priority}")
+
+        options = dict(zip(args[1::2], args[2::2], strict=True))
+
+        if len(options) != len(args[1:]) // 2 or set(options) - {'from', 'fwmark', 'iif', 'table'}:
+            raise ValueError(f"Invalid or repeated option: {' '.join(args[1::2])}")
+
+        if 'table' not in options:
+            raise ValueError("Missing routing table")
+
+        source = str(ipaddress.IPv4Network(options['from'])) if 'from' in options else None
+        fwmark = fwmask = None
+
+        if 'fwmark' in options:
+            mark, _, mask = options['fwmark'].partition('/')
+            fwmark = int(mark, 0)
+            fwmask = int(mask, 0) if mask else None
+
+            if not 0 <= fwmark <= 0xffffffff or (fwmask is not None and not 0 < fwmask <= 0xffffffff):
+                raise ValueError(f"Invalid fwmark: {options['fwmark']}")
+
+        return PolicyRule(priority, Route.parse_table(options['table']), source, fwmark, fwmask, options.get('iif'))
+
+    @staticmethod
+    def batch_lines(rule: PolicyRule, add: bool) -> list[str]:
+        """
+        Return the `ip -batch` lines adding or deleting a rule.
+        """
+        line = f"rule {'add' if add else 'del'} priority {rule.priority}"
+
+        if rule.source:
+            line += f" from {rule.source}"
+
+        if rule.fwmark is not None:
+            line += f" fwmark {rule.fwmark:#x}" + ('' if rule.fwmask is None else f"/{rule.fwmask:#x}")
+
+        if rule.input_interface:
+            line += f" iif {rule.input_interface}"
+
+        return [f"{line} table {rule.table}"]
+
+    def get_policies(self) -> list[PolicyRule]:
+        """
+        Retrieve the policy routing rules stored in the DB.
+
+        Returns:
+            list[PolicyRule]: The rules in ascending priority.
+        """
+        return [PolicyRule(row['Priority'], row['RouteTable'], row['Source'], row['FwMark'], row['FwMask'],
+                           row['InputInterface'])
+                for row in RouteDatabase().get_policy_routes()]
+
+    def add_policy(self, rule: PolicyRule) -> StatusResult:
+        """
+        Add a policy routing rule, replacing the rule with the same priority.
+
+        The kernel keeps rules with identical priorities side by side, the new rule is added
+        and the replaced one deleted in the same `ip -batch`. If the batch fails, the replaced
+        rule is restored in the DB and the kernel.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was stored and installed, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"add_policy() -> {rule}")
+
+        previous = next((policy for policy in self.get_policies() if policy.priority == rule.priority), None)
+
+        if self._store_policy(rule):
+            return STATUS_NOK
+
+        if previous == rule:
+            # Re-entered rule, reinstall it in case it is missing from the kernel
+            self._run_ip_batch(self.batch_lines(previous, add=False), suppress_error=True)
+            lines = self.batch_lines(rule, add=True)
+        else:
+            # The batch stops at the first error, a rejected rule leaves the replaced one installed
+            lines = self.batch_lines(rule, add=True) + (self.batch_lines(previous, add=False) if previous else [])
+
+        if self._run_ip_batch(lines):
+            self._restore_policy(rule, previous)
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def del_policy(self, priority: int) -> StatusResult:
+        """
+        Remove the policy routing rule with the given priority.
+
+        Returns:
+            StatusResult: STATUS_OK if the rule was removed, STATUS_NOK if it does not exist.
+        """
+        self.log.debug(f"del_policy() -> {priority}")
+
+        rule = next((policy for policy in self.get_policies() if policy.priority == priority), None)
+
+        if not rule or RouteDatabase().del_policy_route(priority):
+            self.log.error(f"Policy {priority} does not exist")
+            return STATUS_NOK
+
+        self._run_ip_batch(self.batch_lines(rule, add=False), suppress_error=True)
+        return STATUS_OK
+
+    def _store_policy(self, rule: PolicyRule) -> StatusResult:
+        return RouteDatabase().add_policy_route(rule.priority, rule.source, rule.fwmark, rule.fwmask,
+                                                rule.input_interface, rule.table)
+
+    def _restore_policy(self, rule: PolicyRule, previous: PolicyRule | None) -> None:
+        """
+        Put back the rule replaced by a failed `add_policy()`, in the DB and the kernel.
+        """
+        self._run_ip_batch(self.batch_lines(rule, add=False), suppress_error=True)
+
+        if not previous:
+            RouteDatabase().del_policy_route(rule.priority)
+            return
+
+        self._store_policy(previous)
+        self._run_ip_batch(self.batch_lines(previous, add=True), suppress_error=True)
+
+    def _run_ip_batch(self, lines: list[str], suppress_error: bool = False) -> StatusResult:
+        result = self.run(['ip', '-batch', '-'], suppress_error=suppress_error, stdin='\n'.join(lines) + '\n')
+
+        if result.exit_code:
+            if not suppress_error:
+                self.log.error(f"ip -batch failed: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
@@ -0,0 +1,373 @@
+import json
+import logging
+import re
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InterfaceName, PredicateResult, StatusResult
+from routershell.lib.db.port_channel_db import PortChannelDatabase
+from routershell.lib.network_manager.common.interface import InterfaceType
+from routershell.lib.network_manager.common.run_commands import RunCommand
+
+
+class BondMode(Enum):
+    """
+    Enumeration of the supported bonding modes.
+
+    - `IEEE_802_3AD`: Dynamic link aggregation negotiated with LACP.
+    - `BALANCE_XOR`: Static link aggregation, the member is selected by the transmit hash.
+    - `ACTIVE_BACKUP`: One active member, the others take over on link failure.
+    """
+    IEEE_802_3AD = '802.3ad'
+    BALANCE_XOR = 'balance-xor'
+    ACTIVE_BACKUP = 'active-backup'
+
+
+class XmitHashPolicy(Enum):
+    """
+    Enumeration of the transmit hash policies of the 802.3ad and balance-xor modes.
+    """
+    LAYER2 = 'layer2'
+    LAYER2_3 = 'layer2+3'
+    LAYER3_4 = 'layer3+4'
+    ENCAP2_3 = 'encap2+3'
+    ENCAP3_4 = 'encap3+4'
+
+
+class LacpRate(Enum):
+    """
+    Enumeration of the LACPDU rates requested from the 802.3ad partner (every 30s or every 1s).
+    """
+    SLOW = 'slow'
+    FAST = 'fast'
+
+
+class PortChannelSettings(NamedTuple):
+    """
+    The bonding settings of a port-channel, as stored in the `PortChannels` table.
+    """
+    mode: BondMode = BondMode.IEEE_802_3AD
+    xmit_hash_policy: XmitHashPolicy = XmitHashPolicy.LAYER2
+    lacp_rate: LacpRate = LacpRate.SLOW
+
+
+class PortChannelBatch:
+    """
+    Compile port-channel changes into `ip -batch` lines, applied by a single `ip` process.
+
+    The kernel only changes the bonding mode of a bond that is down and has no members,
+    and the LACP rate of a bond that is down, so those changes release the members,
+    take the bond down and restore both afterwards.
+    """
+
+    MII_MONITOR_MS = 100
+
+    @staticmethod
+    def bond_options(settings: PortChannelSettings, mode: bool = True, xmit_hash_policy: bool = True,
+                     lacp_rate: bool = True) -> str:
+        """
+        Render the `type bond` options of the settings, leaving out those the mode does not support.
+
+        Returns:
+            str: e.g. `mode 802.3ad xmit_hash_policy layer3+4 lacp_rate fast`.
+        """
+        options = []
+
+        if mode:
+            options.append(f'mode {settings.mode.value}')
+
+        if xmit_hash_policy and settings.mode in (BondMode.IEEE_802_3AD, BondMode.BALANCE_XOR):
+            options.append(f'xmit_hash_policy {settings.xmit_hash_policy.value}')
+
+        if lacp_rate and settings.mode is BondMode.IEEE_802_3AD:
+            options.append(f'lacp_rate {settings.lacp_rate.value}')
+
+        return ' '.join(options)
+
+    @staticmethod
+    def create(port_channel_name: InterfaceName, settings: PortChannelSettings) -> list[str]:
+        """
+        Create a bond with link monitoring enabled, so a failed member is taken out of the bond.
+        """
+        return [f'link add name {port_channel_name} type bond miimon {PortChannelBatch.MII_MONITOR_MS} '
+                f'{PortChannelBatch.bond_options(settings)}']
+
+    @staticmethod
+    def update(port_channel_name: InterfaceName, current: PortChannelSettings, desired: PortChannelSettings,
+               members: list[InterfaceName], shutdown: bool) -> list[str]:
+        """
+        Move a bond from its current to its desired settings.
+
+        Args:
+            port_channel_name (InterfaceName): The bond.
+            current (PortChannelSettings): The settings in effect.
+            desired (PortChannelSettings): The new settings.
+            members (list[InterfaceName]): The member interfaces.
+            shutdown (bool): The bond is administratively down.
+
+        Returns:
+            list[str]: The batch lines, empty if nothing the kernel uses changed.
+        """
+        mode = current.mode != desired.mode
+        options = PortChannelBatch.bond_options(desired,
+                                                mode=mode,
+                                                xmit_hash_policy=mode or current.xmit_hash_policy != desired.xmit_hash_policy,
+                                                lacp_rate=mode or current.lacp_rate != desired.lacp_rate)
+        if not options:
+            return []
+
+        if_down = mode or 'lacp_rate' in options
+        lines = PortChannelBatch.release(members) if mode else []
+
+        if if_down:
+            lines.append(f'link set dev {port_channel_name} down')
+
+        lines.append(f'link set dev {port_channel_name} type bond {options}')
+
+        if mode:
+            lines.extend(PortChannelBatch.enslave(port_channel_name, members))
+
+        if if_down and not shutdown:
+            lines.append(f'link set dev {port_channel_name} up')
+
+        return lines
+
+    @staticmethod
+    def enslave(port_channel_name: InterfaceName, members: list[InterfaceName]) -> list[str]:
+        """
+        Add members to a bond, a member must be down to be enslaved and is brought up by the bond.
+        """
+        lines = []
+
+        for member in members:
+            lines.extend([f'link set dev {member} down', f'link set dev {member} master {port_channel_name}'])
+
+        return lines
+
+    @staticmethod
+    def release(members: list[InterfaceName]) -> list[str]:
+        return [f'link set dev {member} nomaster' for member in members]
+
+
+class PortChannelSummary:
+    """
+    Build the `show etherchannel summary` rows from `ip -j -d link show`.
+
+    Port-channel flags: `U` in use, `D` down.
+    Member flags: `P` bundled, `H` hot-standby (active-backup), `s` suspended (not in
+    the active 802.3ad aggregator), `D` down.
+    """
+
+    @staticmethod
+    def parse(ip_link_json: str) -> list[dict]:
+        """
+        Args:
+            ip_link_json (str): The `ip -j -d link show` output.
+
+        Returns:
+            list[dict]: One row per bond: {'PortChannel', 'Flags', 'Mode', 'Protocol', 'Ports'}, where
+                Ports is a list of (member, flag) tuples; empty on parse error.
+        """
+        try:
+            links = json.loads(ip_link_json or '[]')
+        except ValueError:
+            return []
+
+        bonds = [link for link in links if link.get('linkinfo', {}).get('info_kind') == 'bond']
+        summary = []
+
+        for bond in bonds:
+            mode = bond['linkinfo'].get('info_data', {}).get('mode', '')
+            ports = []
+
+            for link in links:
+                if link.get('master') != bond['ifname'] or link.get('linkinfo', {}).get('info_slave_kind') != 'bond':
+                    continue
+
+                slave = link['linkinfo'].get('info_slave_data', {})
+
+                if slave.get('mii_status') != 'UP':
+                    flag = 'D'
+                elif slave.get('state') == 'ACTIVE':
+                    flag = 'P'
+                else:
+                    flag = 's' if mode == BondMode.IEEE_802_3AD.value else 'H'
+
+                ports.append((link['ifname'], flag))
+
+            summary.append({
+                'PortChannel': bond['ifname'],
+                'Flags': 'U' if 'LOWER_UP' in bond.get('flags', []) else 'D',
+                'Mode': mode,
+                'Protocol': 'LACP' if mode == BondMode.IEEE_802_3AD.value else '-',
+                'Ports': ports,
+            })
+
+        return summary
+
+
+class PortChannel(RunCommand, PortChannelDatabase):
+    """
+    Link aggregation (`port-channel<N>`), backed by a Linux bond device.
+    """
+
+    PORT_CHANNEL_NAME_RE = re.compile(rf'^{InterfaceType.PORT_CHANNEL.value}\d+$')
+
+    def __init__(self):
+        super().__init__()
+        PortChannelDatabase().__init__()
+
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().PORT_CHANNEL)
+
+    @staticmethod
+    def is_port_channel_name_valid(port_channel_name: InterfaceName) -> PredicateResult:
+        return bool(PortChannel.PORT_CHANNEL_NAME_RE.match(port_channel_name))
+
+    def get_port_channel_settings(self, port_channel_name: InterfaceName) -> PortChannelSettings | None:
+        """
+        Get the bonding settings of a port-channel from the database.
+
+        Returns:
+            PortChannelSettings | None: The settings, None if the port-channel does not exist.
+        """
+        port_channel = self.get_port_channel_db(port_channel_name)
+
+        if port_channel is None:
+            return None
+
+        return PortChannelSettings(BondMode(port_channel['Mode']),
+                                   XmitHashPolicy(port_channel['XmitHashPolicy']),
+                                   LacpRate(port_channel['LacpRate']))
+
+    def add_port_channel(self, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Create a port-channel in the OS and the database, with the default settings (802.3ad, layer2, slow).
+
+        An existing port-channel is left as is.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if not self.is_port_channel_name_valid(port_channel_name):
+            self.log.error(f"Invalid port-channel name: {port_channel_name}")
+            return STATUS_NOK
+
+        if self.does_port_channel_exist_db(port_channel_name):
+            return STATUS_OK
+
+        if not self._does_port_channel_exist_os(port_channel_name):
+            if self._run_ip_batch(PortChannelBatch.create(port_channel_name, PortChannelSettings())):
+                self.log.error(f"Unable to add port-channel {port_channel_name} to OS")
+                return STATUS_NOK
+
+        return self.add_port_channel_db(port_channel_name)
+
+    def del_port_channel(self, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Delete a port-channel without members from the OS and the database.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if self.get_port_channel_members_db(port_channel_name):
+            self.log.error(f"Port-channel {port_channel_name} has members, remove them first")
+            return STATUS_NOK
+
+        if self._does_port_channel_exist_os(port_channel_name):
+            if self._run_ip_batch([f'link del dev {port_channel_name}']):
+                self.log.error(f"Unable to delete port-channel {port_channel_name} from OS")
+                return STATUS_NOK
+
+        return self.del_port_channel_db(port_channel_name)
+
+    def update_port_channel(self, port_channel_name: InterfaceName,
+                            mode: BondMode | None = None,
+                            xmit_hash_policy: XmitHashPolicy | None = None,
+                            lacp_rate: LacpRate | None = None) -> StatusResult:
+        """
+        Update the bonding settings of a port-channel, None leaves a setting unchanged.
+
+        The change is applied with one `ip -batch`, see `PortChannelBatch.update()`.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        current = self.get_port_channel_settings(port_channel_name)
+
+        if current is None:
+            self.log.error(f"Port-channel {port_channel_name} does not exist")
+            return STATUS_NOK
+
+        desired = PortChannelSettings(mode or current.mode,
+                                      xmit_hash_policy or current.xmit_hash_policy,
+                                      lacp_rate or current.lacp_rate)
+
+        lines = PortChannelBatch.update(port_channel_name, current, desired,
+                                        self.get_port_channel_members_db(port_channel_name),
+                                        self.get_port_channel_db(port_channel_name)['ShutdownStatus'])
+
+        if lines and self._run_ip_batch(lines):
+            self.log.error(f"Unable to update port-channel {port_channel_name} in OS")
+            return STATUS_NOK
+
+        return self.update_port_channel_db(port_channel_name,
+                                           mode=desired.mode.value,
+                                           xmit_hash_policy=desired.xmit_hash_policy.value,
+                                           lacp_rate=desired.lacp_rate.value)
+
+    def add_interface_to_port_channel_group(self, interface_name: InterfaceName, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Add an interface to a port-channel in the OS and the database.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if not self.does_port_channel_exist_db(port_channel_name):
+            self.log.error(f"Port-channel {port_channel_name} does not exist")
+            return STATUS_NOK
+
+        if self._run_ip_batch(PortChannelBatch.enslave(port_channel_name, [interface_name])):
+            self.log.error(f"Failed to add interface {interface_name} to port-channel {port_channel_name} to OS")
+            return STATUS_NOK
+
+        return self.update_interface_port_channel_group_db(interface_name, port_channel_name)
+
+    def del_interface_from_port_channel_group(self, interface_name: InterfaceName, port_channel_name: InterfaceName) -> StatusResult:
+        """
+        Remove an interface from a port-channel in the OS and the database.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if self._run_ip_batch(PortChannelBatch.release([interface_name])):
+            self.log.error(f"Failed to remove interface {interface_name} from port-channel {port_channel_name} in OS")
+            return STATUS_NOK
+
+        return self.update_interface_port_channel_group_db(interface_name, port_channel_name, remove=True)
+
+    def get_port_channel_summary_os(self) -> list[dict]:
+        """
+        Get the state of every port-channel and its members, see `PortChannelSummary.parse()`.
+        """
+        result = self.run(['ip', '-j', '-d', 'link', 'show'], sudo=False)
+
+        if result.exit_code:
+            self.log.error(f"Unable to get link details: {result.stderr}")
+            return []
+
+        return PortChannelSummary.parse(result.stdout)
+
+    def _does_port_channel_exist_os(self, port_channel_name: InterfaceName) -> PredicateResult:
+        return not self.run(['ip', 'link', 'show', 'dev', port_channel_name], suppress_error=True, sudo=False).exit_code
+
+    def _run_ip_batch(self, lines: list[str]) -> StatusResult:
+        result = self.run(['ip', '-batch', '-'], stdin='\n'.join(lines) + '\n')
+
+        if result.exit_code:
+            self.log.error(f"ip -batch failed: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
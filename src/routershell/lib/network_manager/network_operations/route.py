@@ -1,15 +1,57 @@
+import errno
 import ipaddress
 import logging
 import subprocess
+from typing import NamedTuple
 
 from tabulate import tabulate
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
-from routershell.lib.common.types import StatusResult
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.types import InetAddressText, InetCidrText, InterfaceName, StatusResult
+from routershell.lib.db.route_db import RouteDatabase
+from routershell.lib.network_manager.common.rtnetlink import Rtnetlink, RtnetlinkError
 from routershell.lib.network_manager.common.sysctl import SysCtl
+from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client_jobs import DHCPClientJobs
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
 
 
+class StaticRoute(NamedTuple):
+    """
+    A static IPv4 route.
+
+    Attributes:
+        destination (InetCidrText): The destination prefix, `a.b.c.d/len`.
+        next_hop (str): The next-hop address, or the outgoing interface of a device route.
+        metric (int): The route metric, the lowest metric of the routes to a destination is preferred.
+        track_id (int | None): The track the route follows, installed only while the track is up.
+        weight (int | None): The next-hop weight of a multipath route, None for a single path route.
+            The weighted routes sharing a table, destination and metric are installed as one multipath route.
+        table (int): The routing table, the main table by default.
+    """
+    destination: InetCidrText
+    next_hop: str
+    metric: int = 0
+    track_id: int | None = None
+    weight: int | None = None
+    table: int = Rtnetlink.RT_TABLE_MAIN
+
+    def gateway(self) -> InetAddressText | None:
+        """The next-hop address, None for a device route."""
+        try:
+            return str(ipaddress.IPv4Address(self.next_hop))
+        except ValueError:
+            return None
+
+    def interface_name(self) -> InterfaceName | None:
+        """The outgoing interface of a device route, None for a route via a next-hop address."""
+        return None if self.gateway() else self.next_hop
+
+    def key(self) -> tuple[int, InetCidrText, int]:
+        """The (table, destination, metric) identifying the kernel route, shared by the next hops of a multipath route."""
+        return self.table, self.destination, self.metric
+
+
 class Route(NetworkManager):
 
     def __init__(self, arg=None):
@@ -24,6 +66,7 @@ class Route(NetworkManager):
         """
         super().__init__()
         self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().ROUTE)
         self.arg = arg
 
     def set_default_gateway(self, gateway_ip) -> StatusResult:
@@ -123,6 +166,242 @@ class Route(NetworkManager):
 
         return STATUS_OK
 
+    TABLE_NAMES = {'main': Rtnetlink.RT_TABLE_MAIN}
+    RESERVED_TABLES = (253, 255)
+    WEIGHT_RANGE = range(1, 257)
+
+    @classmethod
+    def parse_table(cls, table: str) -> int:
+        """
+        Parse a routing table ID, `main` or 1 to 4294967294 apart from the reserved default (253) and local (255) tables.
+
+        Raises:
+            ValueError: If the table is not valid.
+        """
+        if table in cls.TABLE_NAMES:
+            return cls.TABLE_NAMES[table]
+
+        table_id = int(table)
+
+        if not 0 < table_id < 0xffffffff or table_id in cls.RESERVED_TABLES:
+            raise ValueError(f"Invalid routing table: {table}")
+
+        return table_id
+
+    @classmethod
+    def parse_static_route(cls, args: list[str]) -> StaticRoute:
+        """
+        Parse the arguments of `ip route`.
+
+        Syntax:
+            [table <table>] <prefix>|<network> <netmask>|default <next-hop-address>|<interface>
+                [weight <weight>] [metric <metric>] [track <track-id>]
+
+        Args:
+            args (list[str]): The arguments following `route`.
+
+        Returns:
+            StaticRoute: The parsed route, the destination normalized to `a.b.c.d/len`.
+
+        Raises:
+            ValueError: If the arguments are malformed.
+        """
+        table = Rtnetlink.RT_TABLE_MAIN
+
+        if args[:1] == ['table']:
+            if len(args) < 2:
+                raise ValueError("Missing routing table")
+
+            table, args = cls.parse_table(args[1]), args[2:]
+
+        if len(args) > 2 and '/' not in args[0]:
+            try:
+                args = [str(ipaddress.IPv4Network(f'{args[0]}/{args[1]}'))] + args[2:]
+            except ValueError:
+                pass
+
+        if len(args) < 2 or len(args) % 2:
+            raise ValueError("Expected '<prefix> <next-hop> [weight <weight>] [metric <metric>] [track <track-id>]'")
+
+        destination = str(ipaddress.IPv4Network('0.0.0.0/0' if args[0] == 'default' else args[0]))
+        options = dict(zip(args[2::2], args[3::2], strict=True))
+
+        if set(options) - {'weight', 'metric', 'track'}:
+            raise ValueError(f"Invalid option: {' '.join(sorted(set(options) - {'weight', 'metric', 'track'}))}")
+
+        metric = int(options.get('metric', 0))
+        weight = int(options['weight']) if 'weight' in options else None
+
+        if not 0 <= metric <= 0xffffffff:
+            raise ValueError(f"Invalid metric: {metric}")
+
+        if weight is not None and weight not in cls.WEIGHT_RANGE:
+            raise ValueError(f"Invalid weight: {weight}")
+
+        return StaticRoute(destination, args[1], metric,
+                           int(options['track']) if 'track' in options else None, weight, table)
+
+    def get_static_routes(self) -> list[StaticRoute]:
+        """
+        Retrieve the static routes stored in the DB.
+
+        Returns:
+            list[StaticRoute]: The static routes in configuration order.
+        """
+        return [StaticRoute(row['Destination'], row['NextHop'], row['Metric'], row['TrackID'],
+                            row['Weight'], row['RouteTable'])
+                for row in RouteDatabase().get_static_routes()]
+
+    def add_static_route(self, route: StaticRoute, negate: bool = False) -> StatusResult:
+        """
+        Add or remove a static route.
+
+        The route is stored in the DB. An untracked single path route is installed once the DHCP
+        clients it may depend on obtained their lease (or failed), see `_wait_for_dhcp_lease()`.
+        Tracked routes and the next hops of multipath routes are handed to the track monitor without
+        waiting, it installs each route with the next hops whose track is up.
+
+        Args:
+            route (StaticRoute): The static route.
+            negate (bool, optional): True to remove the route. Defaults to False.
+
+        Returns:
+            StatusResult: STATUS_OK if the route was stored and applied, STATUS_NOK otherwise.
+        """
+        from routershell.lib.network_manager.network_operations.track import Track
+
+        self.log.debug(f"add_static_route() -> {route} -> negate: {negate}")
+
+        route_db = RouteDatabase()
+
+        if negate:
+            if route_db.del_static_route(route.table, route.destination, route.next_hop, route.metric):
+                return STATUS_NOK
+
+            # Release the route from the track monitor first, else it restores the deleted route
+            Track().reload()
+
+            if route.weight is None:
+                self.apply_static_route(route, add=False)
+
+            elif not any(other.key() == route.key() for other in self.get_static_routes()):
+                self.apply_multipath_route(route.key(), [])
+
+            return STATUS_OK
+
+        if route.track_id is not None and route.track_id not in Track().get_track_ids():
+            self.log.error(f"Track {route.track_id} does not exist")
+            return STATUS_NOK
+
+        if any(other.key() == route.key() and (other.weight is None) != (route.weight is None)
+               for other in self.get_static_routes()):
+            self.log.error(f"Static route {route} mixes single path and multipath next hops")
+            return STATUS_NOK
+
+        if route_db.add_static_route(route.table, route.destination, route.next_hop, route.metric,
+                                     route.weight, route.track_id):
+            return STATUS_NOK
+
+        if route.track_id is None and route.weight is None:
+            self._wait_for_dhcp_lease(route)
+
+            if self.apply_static_route(route, add=True):
+                route_db.del_static_route(route.table, route.destination, route.next_hop, route.metric)
+                return STATUS_NOK
+
+        Track().reload()
+        return STATUS_OK
+
+    def _wait_for_dhcp_lease(self, route: StaticRoute) -> None:
+        """
+        Wait for the DHCP clients still requesting a lease that a route may depend on.
+
+        A device route waits for the client of its interface. A route via a next hop waits for the
+        clients of the interfaces whose connected subnet holds the next hop, or, when no connected
+        subnet holds it yet, for every client still requesting the lease that may bring it.
+        """
+        dhcp_client_jobs = DHCPClientJobs()
+
+        if not dhcp_client_jobs.get_requesting():
+            return
+
+        if route.interface_name():
+            dhcp_client_jobs.wait_ready([route.interface_name()])
+            return
+
+        next_hop = ipaddress.IPv4Address(route.gateway())
+        interface_names = [link['ifname'] for link in self.get_ip_addr_info() or []
+                           for addr_info in link.get('addr_info', []) if addr_info.get('family') == 'inet'
+                           and next_hop in ipaddress.IPv4Interface(f"{addr_info['local']}/{addr_info['prefixlen']}").network]
+
+        dhcp_client_jobs.wait_ready(interface_names or None)
+
+    def apply_static_route(self, route: StaticRoute, add: bool) -> StatusResult:
+        """
+        Install (create or replace) or remove a single path static route.
+
+        Args:
+            route (StaticRoute): The static route.
+            add (bool): True to install the route, False to remove it.
+
+        Returns:
+            StatusResult: STATUS_OK if the route was changed, STATUS_NOK otherwise.
+        """
+        return self._apply_route(add, route.key(), [route])
+
+    def apply_multipath_route(self, key: tuple[int, InetCidrText, int], routes: list[StaticRoute]) -> StatusResult:
+        """
+        Install (create or replace) a multipath route over the next hops of `routes`, or remove it
+        when `routes` is empty.
+
+        Args:
+            key (tuple[int, InetCidrText, int]): The (table, destination, metric) of the route.
+            routes (list[StaticRoute]): The weighted static routes giving the next hops.
+
+        Returns:
+            StatusResult: STATUS_OK if the route was changed, STATUS_NOK otherwise.
+        """
+        return self._apply_route(bool(routes), key, routes, multipath=True)
+
+    def _apply_route(self, add: bool, key: tuple[int, InetCidrText, int], routes: list[StaticRoute],
+                     multipath: bool = False) -> StatusResult:
+        """
+        Change a route with a single rtnetlink request, `ip route` is used when the process is not
+        permitted to change routes itself. Removing a route that is not installed succeeds.
+        """
+        table, destination, metric = key
+
+        try:
+            if multipath:
+                Rtnetlink().change_route(add, destination, metric=metric, table=table,
+                                         nexthops=[(route.gateway(), route.interface_name(), route.weight)
+                                                   for route in routes])
+            else:
+                Rtnetlink().change_route(add, destination, routes[0].gateway(), routes[0].interface_name(),
+                                         metric, table)
+            return STATUS_OK
+
+        except RtnetlinkError as e:
+            if not add and e.error_code == errno.ESRCH:
+                return STATUS_OK
+
+            if e.error_code != errno.EPERM:
+                self.log.error(f"Unable to {'install' if add else 'remove'} static route {destination} "
+                               f"table {table} metric {metric}: {e}")
+                return STATUS_NOK
+
+        command = ["ip", "route", "replace" if add else "del", destination, "table", str(table), "metric", str(metric)]
+
+        for route in routes if add or not multipath else []:
+            hop = ["via", route.next_hop] if route.gateway() else ["dev", route.next_hop]
+            command.extend(["nexthop", *hop, "weight", str(route.weight)] if multipath else hop)
+
+        if self.run(command, suppress_error=not add).exit_code and add:
+            self.log.error(f"Unable to install static route {destination} table {table} metric {metric}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
     def _get_route(self, destination_ip):
         """
         Get the route (interface) for a given destination IP address using the 'ip' command.
@@ -0,0 +1,553 @@
+import functools
+import ipaddress
+import logging
+import os
+import selectors
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import NamedTuple
+
+from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import InetAddressText, InterfaceName, StatusResult
+from routershell.lib.db.route_db import RouteDatabase
+from routershell.lib.network_manager.common.rtnetlink import LinkEvent, RouteEvent, Rtnetlink, RtnetlinkError
+from routershell.lib.network_manager.common.track_probe import ArpProbe, IcmpProbe, TrackProbe, TrackProbeError
+from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+
+
+class TrackType(Enum):
+    """
+    What a track follows.
+
+    - `INTERFACE`: The interface is administratively up and has carrier.
+    - `ICMP`: A target answers ICMP echo requests.
+    - `ARP`: A next hop on the link answers ARP requests.
+    """
+    INTERFACE = 'interface'
+    ICMP = 'icmp'
+    ARP = 'arp'
+
+
+class TrackState(Enum):
+    UP = 'Up'
+    DOWN = 'Down'
+
+
+class TrackConfig(NamedTuple):
+    """
+    A configured track.
+
+    Attributes:
+        track_id (int): The track ID.
+        track_type (TrackType): What the track follows.
+        interface_name (InterfaceName | None): The tracked interface, or the source interface of the probe.
+        target (InetAddressText | None): The probe target, None for an interface track.
+        interval (int): The probe interval in milliseconds.
+        threshold (int): The consecutive missed probes before the track goes down.
+    """
+    track_id: int
+    track_type: TrackType
+    interface_name: InterfaceName | None = None
+    target: InetAddressText | None = None
+    interval: int = 1000
+    threshold: int = 3
+
+
+class TrackStatus(NamedTuple):
+    """
+    A snapshot of a track for `show track`.
+
+    Attributes:
+        config (TrackConfig): The track configuration.
+        state (TrackState): The current state.
+        changes (int): The state changes since the track was configured.
+        transitions (list[tuple[float, TrackState]]): The latest states with their epoch timestamps, oldest first.
+        routes (list[StaticRoute]): The static routes following the track.
+    """
+    config: TrackConfig
+    state: TrackState
+    changes: int
+    transitions: list[tuple[float, TrackState]]
+    routes: list[StaticRoute]
+
+
+class _TrackEntry:
+    """
+    The runtime state of a track, owned by the monitor thread.
+    """
+
+    def __init__(self, config: TrackConfig, state: TrackState):
+        self.config = config
+        self.state = state
+        self.changes = 0
+        self.transitions: deque[tuple[float, TrackState]] = deque([(time.time(), state)],
+                                                                  maxlen=TrackMonitor.TRANSITION_HISTORY)
+        self.probe: TrackProbe | None = None
+        self.missed = 0
+        self.awaiting_reply = False
+        self.next_probe = time.monotonic()
+
+
+class TrackMonitor(metaclass=Singleton):
+    """
+    Follow link carrier and route events over rtnetlink, and the replies of the ICMP/ARP probes,
+    from one thread waiting on all of their sockets.
+
+    A track goes down as soon as the kernel reports the carrier loss of its interface, or after
+    `threshold` missed probes. The static routes following the track are then removed, so the
+    route with the next higher metric to the same destination (the backup) takes over; they are
+    installed again when the track comes back up, and restored if deleted while it is up.
+    A multipath route is installed with its next hops whose track is up, and removed when none is.
+
+    The thread never reads the DB, `configure()` hands it the tracks and routes to follow.
+    """
+
+    TRANSITION_HISTORY = 16
+    CONFIGURE_TIMEOUT = 2.0
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().TRACK_MONITOR)
+
+        self._lock = threading.RLock()
+        self._applied = threading.Event()
+        self._pending: tuple[list[TrackConfig], list[StaticRoute]] | None = None
+        self._entries: dict[int, _TrackEntry] = {}
+        self._routes: list[StaticRoute] = []
+        self._links: dict[InterfaceName, LinkEvent] = {}
+        self._thread: threading.Thread | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._wake: tuple[int, int] | None = None
+
+    def configure(self, tracks: list[TrackConfig], routes: list[StaticRoute]) -> StatusResult:
+        """
+        Replace the tracks and routes followed, and bring the tracked and multipath routes in line
+        with the state of their track. Tracks whose configuration did not change keep their state.
+
+        Args:
+            tracks (list[TrackConfig]): The configured tracks.
+            routes (list[StaticRoute]): The static routes, untracked single path routes are ignored.
+
+        Returns:
+            StatusResult: STATUS_OK if the monitor applied the configuration, STATUS_NOK otherwise.
+        """
+        routes = [route for route in routes if route.track_id is not None or route.weight is not None]
+
+        if not self._thread:
+            if not tracks:
+                # Nothing to follow, bring the multipath routes in line once
+                with self._lock:
+                    self._refresh_links()
+                    self._apply(tracks, routes)
+                return STATUS_OK
+
+            if self._start():
+                return STATUS_NOK
+
+        with self._lock:
+            self._pending = (tracks, routes)
+            self._applied.clear()
+
+        os.write(self._wake[1], b'\0')
+
+        if not self._applied.wait(self.CONFIGURE_TIMEOUT):
+            self.log.error("Track monitor did not apply the configuration")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def get_status(self) -> list[TrackStatus]:
+        """
+        Returns:
+            list[TrackStatus]: A snapshot of every track, ordered by track ID.
+        """
+        with self._lock:
+            return [TrackStatus(entry.config, entry.state, entry.changes, list(entry.transitions),
+                                [route for route in self._routes if route.track_id == track_id])
+                    for track_id, entry in sorted(self._entries.items())]
+
+    def _start(self) -> StatusResult:
+        """
+        Subscribe to the link and route events and start the monitor thread.
+        """
+        rtnetlink = Rtnetlink()
+
+        try:
+            # Subscribe ahead of the link dump, a change in between is then queued, not lost
+            monitor = rtnetlink.open_monitor()
+            self._links = {link.interface_name: link for link in rtnetlink.get_links().values()}
+
+        except RtnetlinkError as e:
+            self.log.error(f"Unable to start the track monitor: {e}")
+            return STATUS_NOK
+
+        self._wake = os.pipe()
+        os.set_blocking(self._wake[0], False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(monitor, selectors.EVENT_READ, functools.partial(self._read_events, monitor))
+        self._selector.register(self._wake[0], selectors.EVENT_READ, self._read_wake)
+
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        return STATUS_OK
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                deadline = min((entry.next_probe for entry in self._entries.values() if entry.probe), default=None)
+
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+            # A failing handler or probe pass is logged, the monitor keeps following the other tracks
+            for key, _ in self._selector.select(timeout):
+                with self._lock:
+                    try:
+                        key.data()
+                    except Exception:
+                        self.log.exception("Track monitor failed to handle an event")
+
+            with self._lock:
+                try:
+                    self._send_probes(time.monotonic())
+                except Exception:
+                    self.log.exception("Track monitor failed to send the probes")
+
+    def _read_wake(self) -> None:
+        try:
+            os.read(self._wake[0], 4096)
+        except BlockingIOError:
+            pass
+
+        if self._pending is not None:
+            try:
+                self._apply(*self._pending)
+            finally:
+                self._pending = None
+                self._applied.set()
+
+    def _read_events(self, monitor) -> None:
+        while True:
+            try:
+                data = monitor.recv(Rtnetlink.RECV_BUFFER_SIZE)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                # ENOBUFS: events were dropped, resynchronize the link state from a dump
+                self.log.warning(f"Track monitor lost events ({e}), resynchronizing")
+                self._refresh_links()
+                self._evaluate_links()
+                continue
+
+            for message_type, payload in Rtnetlink.iter_messages(data):
+                link = Rtnetlink.parse_link(message_type, payload)
+
+                if link:
+                    self._link_event(link)
+                    continue
+
+                route = Rtnetlink.parse_route(message_type, payload)
+
+                if route and route.deleted:
+                    self._route_deleted(route)
+
+    def _apply(self, tracks: list[TrackConfig], routes: list[StaticRoute]) -> None:
+        self.log.debug(f"_apply() -> tracks: {tracks} -> routes: {routes}")
+
+        entries: dict[int, _TrackEntry] = {}
+
+        for config in tracks:
+            entry = self._entries.pop(config.track_id, None)
+
+            if entry and entry.config == config:
+                entries[config.track_id] = entry
+                continue
+
+            if entry:
+                self._close_probe(entry)
+
+            entries[config.track_id] = self._new_entry(config)
+
+        for entry in self._entries.values():
+            self._close_probe(entry)
+
+        self._entries = entries
+        self._routes = routes
+        self._update_routes(self._routes)
+
+    def _new_entry(self, config: TrackConfig) -> _TrackEntry:
+        if config.track_type is TrackType.INTERFACE:
+            return _TrackEntry(config, self._link_state(config.interface_name))
+
+        entry = _TrackEntry(config, TrackState.DOWN)
+
+        try:
+            entry.probe = (IcmpProbe(config.target, config.interface_name) if config.track_type is TrackType.ICMP
+                           else ArpProbe(config.target, config.interface_name))
+            self._selector.register(entry.probe, selectors.EVENT_READ, functools.partial(self._probe_reply, entry))
+
+        except TrackProbeError as e:
+            self.log.error(f"Track {config.track_id} can not probe {config.target}: {e}")
+
+        return entry
+
+    def _close_probe(self, entry: _TrackEntry) -> None:
+        if entry.probe:
+            self._selector.unregister(entry.probe)
+            entry.probe.close()
+            entry.probe = None
+
+    def _refresh_links(self) -> None:
+        try:
+            self._links = {link.interface_name: link for link in Rtnetlink().get_links().values()}
+        except RtnetlinkError as e:
+            self.log.error(f"Unable to read the link state: {e}")
+
+    def _link_state(self, interface_name: InterfaceName | None) -> TrackState:
+        link = self._links.get(interface_name)
+        return TrackState.UP if link and link.is_up() else TrackState.DOWN
+
+    def _link_event(self, link: LinkEvent) -> None:
+        if link.deleted:
+            self._links.pop(link.interface_name, None)
+        else:
+            self._links[link.interface_name] = link
+
+        self.log.debug(f"_link_event() -> {link}")
+        self._evaluate_links(link.interface_name)
+        self._update_routes([route for route in self._routes if route.interface_name() == link.interface_name])
+
+    def _evaluate_links(self, interface_name: InterfaceName | None = None) -> None:
+        for entry in self._entries.values():
+            if not entry.config.interface_name or interface_name not in (None, entry.config.interface_name):
+                continue
+
+            link_state = self._link_state(entry.config.interface_name)
+
+            if entry.config.track_type is TrackType.INTERFACE:
+                self._set_state(entry, link_state)
+
+            elif link_state is TrackState.DOWN:
+                # The probes can not be answered without carrier, do not wait for them to time out
+                entry.missed = 0
+                entry.awaiting_reply = False
+                self._set_state(entry, TrackState.DOWN)
+
+            elif entry.state is TrackState.DOWN:
+                entry.next_probe = time.monotonic()
+
+    def _probe_reply(self, entry: _TrackEntry) -> None:
+        if entry.probe and entry.probe.receive():
+            entry.missed = 0
+            entry.awaiting_reply = False
+            self._set_state(entry, TrackState.UP)
+
+    def _send_probes(self, now: float) -> None:
+        for entry in self._entries.values():
+            if not entry.probe or now < entry.next_probe:
+                continue
+
+            if entry.awaiting_reply:
+                entry.missed += 1
+
+                if entry.missed >= entry.config.threshold:
+                    self._set_state(entry, TrackState.DOWN)
+
+            entry.probe.send()
+            entry.awaiting_reply = True
+            entry.next_probe = max(entry.next_probe + entry.config.interval / 1000, now)
+
+    def _set_state(self, entry: _TrackEntry, state: TrackState) -> None:
+        if entry.state is state:
+            return
+
+        entry.state = state
+        entry.changes += 1
+        entry.transitions.append((time.time(), state))
+
+        self.log.info(f"Track {entry.config.track_id} is {state.value}")
+
+        self._update_routes([route for route in self._routes if route.track_id == entry.config.track_id])
+
+    def _route_deleted(self, event: RouteEvent) -> None:
+        """
+        Restore a route deleted while it should be installed (e.g. by an interface flap or by hand).
+        """
+        self._update_routes([route for route in self._routes
+                             if route.key() == (event.table, event.destination, event.metric)
+                             and (route.weight is not None or route.gateway() == event.gateway)
+                             and self._is_active(route)])
+
+    def _is_active(self, route: StaticRoute) -> bool:
+        """
+        A route (or multipath next hop) is installed while its track is up, and for a device route
+        while its link has carrier.
+        """
+        if route.track_id is not None:
+            entry = self._entries.get(route.track_id)
+
+            if not entry or entry.state is TrackState.DOWN:
+                return False
+
+        return not route.interface_name() or self._link_state(route.interface_name()) is TrackState.UP
+
+    def _update_routes(self, routes: list[StaticRoute]) -> None:
+        multipath_keys = set()
+
+        for route in routes:
+            if route.weight is None:
+                Route().apply_static_route(route, add=self._is_active(route))
+
+            elif route.key() not in multipath_keys:
+                multipath_keys.add(route.key())
+                Route().apply_multipath_route(route.key(), [nexthop for nexthop in self._routes
+                                                            if nexthop.weight is not None
+                                                            and nexthop.key() == route.key()
+                                                            and self._is_active(nexthop)])
+
+
+class Track:
+    """
+    Configure tracks and hand them with the tracked static routes to the `TrackMonitor`.
+    """
+
+    TRACK_ID_RANGE = range(1, 1001)
+    INTERVAL_RANGE = range(10, 60001)
+    THRESHOLD_RANGE = range(1, 101)
+
+    def __init__(self):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().TRACK)
+
+    @classmethod
+    def parse_track(cls, args: list[str]) -> TrackConfig:
+        """
+        Parse the arguments of `track`.
+
+        Syntax:
+            <track-id> interface <interface>
+            <track-id> icmp <target> [source <interface>] [interval <ms>] [threshold <count>]
+            <track-id> arp <target> interface <interface> [interval <ms>] [threshold <count>]
+
+        Args:
+            args (list[str]): The arguments following `track`.
+
+        Returns:
+            TrackConfig: The parsed track.
+
+        Raises:
+            ValueError: If the arguments are malformed.
+        """
+        if len(args) < 3:
+            raise ValueError("Expected '<track-id> interface|icmp|arp ...'")
+
+        track_id, track_type = int(args[0]), TrackType(args[1])
+
+        if track_id not in cls.TRACK_ID_RANGE:
+            raise ValueError(f"Invalid track ID: {track_id}")
+
+        if track_type is TrackType.INTERFACE:
+            if len(args) != 3:
+                raise ValueError("Expected '<track-id> interface <interface>'")
+
+            return TrackConfig(track_id, track_type, args[2])
+
+        target = str(ipaddress.IPv4Address(args[2]))
+
+        if len(args) % 2 == 0:
+            raise ValueError(f"Missing value: {args[-1]}")
+
+        options = dict(zip(args[3::2], args[4::2], strict=True))
+        interface_option = 'source' if track_type is TrackType.ICMP else 'interface'
+
+        if set(options) - {interface_option, 'interval', 'threshold'}:
+            raise ValueError(f"Invalid option: {' '.join(sorted(set(options) - {interface_option, 'interval', 'threshold'}))}")
+
+        if track_type is TrackType.ARP and 'interface' not in options:
+            raise ValueError("An arp track requires 'interface <interface>'")
+
+        config = TrackConfig(track_id, track_type, options.get(interface_option), target,
+                             int(options.get('interval', TrackConfig._field_defaults['interval'])),
+                             int(options.get('threshold', TrackConfig._field_defaults['threshold'])))
+
+        if config.interval not in cls.INTERVAL_RANGE:
+            raise ValueError(f"Invalid interval: {config.interval} ms")
+
+        if config.threshold not in cls.THRESHOLD_RANGE:
+            raise ValueError(f"Invalid threshold: {config.threshold}")
+
+        return config
+
+    def get_tracks(self) -> list[TrackConfig]:
+        """
+        Returns:
+            list[TrackConfig]: The tracks stored in the DB, ordered by track ID.
+        """
+        return [TrackConfig(row['TrackID'], TrackType(row['Type']), row['InterfaceName'], row['Target'],
+                            row['Interval'], row['Threshold'])
+                for row in RouteDatabase().get_tracks()]
+
+    def get_track_ids(self) -> list[int]:
+        return [config.track_id for config in self.get_tracks()]
+
+    def add_track(self, config: TrackConfig) -> StatusResult:
+        """
+        Add a track, or replace the settings of an existing track.
+
+        Args:
+            config (TrackConfig): The track.
+
+        Returns:
+            StatusResult: STATUS_OK if the track was stored and handed to the monitor, STATUS_NOK otherwise.
+        """
+        self.log.debug(f"add_track() -> {config}")
+
+        if RouteDatabase().add_track(config.track_id, config.track_type.value, config.interface_name,
+                                     config.target, config.interval, config.threshold):
+            return STATUS_NOK
+
+        return self.reload()
+
+    def del_track(self, track_id: int) -> StatusResult:
+        """
+        Remove a track.
+
+        Args:
+            track_id (int): The track ID.
+
+        Returns:
+            StatusResult: STATUS_OK if the track was removed, STATUS_NOK if it does not exist
+                or static routes still follow it.
+        """
+        self.log.debug(f"del_track() -> {track_id}")
+
+        routes = [route for route in Route().get_static_routes() if route.track_id == track_id]
+
+        if routes:
+            self.log.error(f"Track {track_id} is used by {len(routes)} static route(s)")
+            return STATUS_NOK
+
+        if RouteDatabase().del_track(track_id):
+            return STATUS_NOK
+
+        return self.reload()
+
+    def reload(self) -> StatusResult:
+        """
+        Hand the tracks and the tracked static routes of the DB to the track monitor.
+        """
+        return TrackMonitor().configure(self.get_tracks(), Route().get_static_routes())
+
+    def get_status(self) -> list[TrackStatus]:
+        """
+        Returns:
+            list[TrackStatus]: The state of every track, the monitor is started if needed.
+        """
+        if not TrackMonitor().get_status() and self.get_tracks():
+            self.reload()
+
+        return TrackMonitor().get_status()
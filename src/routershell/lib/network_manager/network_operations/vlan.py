@@ -2,6 +2,7 @@ import json
 import logging
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+from routershell.lib.common.range_list import RangeList
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import BridgeName, InterfaceName, PredicateResult, StatusResult, VlanName
 from routershell.lib.db.sqlite_db.router_shell_db import Result
@@ -9,6 +10,11 @@ from routershell.lib.db.vlan_db import VlanDatabase
 from routershell.lib.network_manager.common.phy import State
 from routershell.lib.network_manager.common.run_commands import RunCommand
 from routershell.lib.network_manager.network_operations.bridge import Bridge
+from routershell.lib.network_manager.network_operations.bridge_vlan import (
+    BridgePortVlans,
+    BridgeVlanBatch,
+    SwitchportMode,
+)
 
 
 class Vlan(RunCommand):
@@ -36,6 +42,38 @@ class Vlan(RunCommand):
         """
         return vlan_id >= Vlan.VLAN_DEFAULT_START and vlan_id <= Vlan.VLAN_MAX_ID
 
+    @staticmethod
+    def parse_trunk_allowed_vlans(args: list[str], negate: bool = False) -> tuple[list[int], bool, bool]:
+        """
+        Parse the arguments of `[no] switchport trunk allowed vlan [add | remove] <vlan-list> | all`.
+
+        Args:
+            args (list[str]): The arguments following `vlan`.
+            negate (bool): The `no` form, which allows all VLANs again.
+
+        Returns:
+            tuple[list[int], bool, bool]: (VLAN IDs, add, remove), no VLAN IDs allows all VLANs.
+
+        Raises:
+            ValueError: If the arguments are malformed or a VLAN ID is out of range.
+        """
+        add = bool(args) and args[0] == 'add'
+        remove = bool(args) and args[0] == 'remove'
+
+        if add or remove:
+            args = args[1:]
+
+        if negate:
+            return [], False, False
+
+        if not args or (args[0] == 'all' and (add or remove)):
+            raise ValueError("Usage: switchport trunk allowed vlan [add | remove] <vlan-list> | all")
+
+        if args[0] == 'all':
+            return [], False, False
+
+        return RangeList.parse(''.join(args), Vlan.VLAN_DEFAULT_START, Vlan.VLAN_MAX_ID), add, remove
+
     def add_vlan_id(self, vlan_id: int) -> StatusResult:
         """
         Add a VLAN ID to the database using the VLANDatabase method.
@@ -176,6 +214,15 @@ class Vlan(RunCommand):
         if not self.does_vlan_id_exist_db(vlan_id):
             self.log.debug(f"add_interface_by_vlan_id({interface_name}) Error: VLAN ID {vlan_id} already exists.")
             return STATUS_NOK
+
+        bridge = VlanDatabase().get_bridge_vlan_filtering(interface_name)
+
+        if bridge and bridge[1]:
+            if VlanDatabase().add_interface_to_vlan(vlan_id, interface_name):
+                self.log.error(f'Unable to add interface {interface_name} to vlan-id: {vlan_id} to DB')
+                return STATUS_NOK
+
+            return self.apply_bridge_vlans(bridge[0])
         
         if self.add_interface_to_vlan_os(vlan_id, interface_name):
             self.log.error(f'Unable to add interface {interface_name} to vlan-id: {vlan_id} -> vlan-id: {vlan_id} to OS')
@@ -228,6 +275,165 @@ class Vlan(RunCommand):
     def delete_interface_from_vlan(self, interface_name: InterfaceName, vlan_id: int) -> StatusResult:
         return STATUS_OK
 
+    def set_switchport_mode(self, interface_name: InterfaceName, mode: SwitchportMode) -> StatusResult:
+        """
+        Set the switchport mode of an interface and reprogram its bridge VLAN entries.
+
+        Args:
+            interface_name (InterfaceName): The name of the interface.
+            mode (SwitchportMode): access | trunk.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if VlanDatabase().update_switchport_mode([interface_name], mode.value):
+            self.log.error(f"Unable to set switchport mode {mode.value} on interface {interface_name}")
+            return STATUS_NOK
+
+        return self._apply_port_bridge_vlans(interface_name)
+
+    def set_trunk_allowed_vlans(self, interface_name: InterfaceName, vlan_ids: list[int],
+                                add: bool = False, remove: bool = False) -> StatusResult:
+        """
+        Set, extend or reduce the VLANs allowed on a trunk port and reprogram its bridge VLAN entries.
+
+        Args:
+            interface_name (InterfaceName): The name of the interface.
+            vlan_ids (list[int]): The VLAN IDs, an empty list with neither `add` nor `remove` allows all VLANs.
+            add (bool): Add the VLANs to the allowed list.
+            remove (bool): Remove the VLANs from the allowed list.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        invalid = [vlan_id for vlan_id in vlan_ids if not Vlan.is_vlan_id_range_valid(vlan_id)]
+
+        if invalid:
+            self.log.error(f"Invalid VLAN ID(s): {invalid}")
+            return STATUS_NOK
+
+        if VlanDatabase().update_trunk_allowed_vlans([interface_name], vlan_ids, add, remove):
+            self.log.error(f"Unable to update trunk allowed VLANs on interface {interface_name}")
+            return STATUS_NOK
+
+        return self._apply_port_bridge_vlans(interface_name)
+
+    def add_vlan_ids(self, vlan_ids: list[int]) -> StatusResult:
+        """
+        Add a range of VLAN IDs in one database transaction and reprogram the vlan-filtering bridges.
+
+        Trunks without an allowed list carry every VLAN, so each vlan-filtering bridge
+        is reprogrammed with one `bridge -batch` afterwards.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs, already validated (see `RangeList.parse()`).
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if VlanDatabase().add_vlan_ids(vlan_ids):
+            self.log.error(f"Unable to add {len(vlan_ids)} VLAN ID(s) to DB")
+            return STATUS_NOK
+
+        return self.apply_vlan_filtering_bridges()
+
+    def update_vlans_description(self, vlan_ids: list[int], vlan_description: str) -> StatusResult:
+        """
+        Update the description of a range of VLANs in one database transaction.
+
+        Args:
+            vlan_ids (list[int]): The VLAN IDs.
+            vlan_description (str): The new description.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        return VlanDatabase().update_vlans_description(vlan_ids, vlan_description)
+
+    def apply_vlan_filtering_bridges(self, bridge_names: list[BridgeName] | None = None,
+                                     access_vlans: dict[InterfaceName, int] | None = None) -> StatusResult:
+        """
+        Reprogram the port VLANs of vlan-filtering bridges, one `bridge -batch` per bridge.
+
+        Args:
+            bridge_names (list[BridgeName] | None): The bridges, all vlan-filtering bridges if None.
+            access_vlans (dict[InterfaceName, int] | None): See `apply_bridge_vlans()`.
+
+        Returns:
+            StatusResult: STATUS_OK if successful, STATUS_NOK otherwise.
+        """
+        if bridge_names is None:
+            bridge_names = VlanDatabase().get_vlan_filtering_bridges()
+
+        status = STATUS_OK
+
+        for bridge_name in bridge_names:
+            if self.apply_bridge_vlans(bridge_name, access_vlans):
+                status = STATUS_NOK
+
+        return status
+
+    def apply_bridge_vlans(self, bridge_name: BridgeName,
+                           access_vlans: dict[InterfaceName, int] | None = None) -> StatusResult:
+        """
+        Program the VLAN membership of every port of a `vlan_filtering` bridge.
+
+        The desired membership is read from the database, diffed against
+        `bridge -j vlan show` and applied with a single `bridge -batch -`.
+
+        Args:
+            bridge_name (BridgeName): The name of the bridge.
+            access_vlans (dict[InterfaceName, int] | None): Access VLANs that override the database,
+                for a change stored only once the kernel accepted it.
+
+        Returns:
+            StatusResult: STATUS_OK if successful or nothing changed, STATUS_NOK otherwise.
+        """
+        ports: dict[InterfaceName, BridgePortVlans] = {}
+
+        for row in VlanDatabase().get_bridge_port_vlans(bridge_name):
+            port = ports.setdefault(row['InterfaceName'],
+                                    BridgePortVlans(row['InterfaceName'], SwitchportMode(row['Mode']), []))
+            if row['VlanID'] is not None:
+                port.vlan_ids.append(row['VlanID'])
+
+        for interface_name, vlan_id in (access_vlans or {}).items():
+            port = ports.get(interface_name)
+
+            if port and port.mode is SwitchportMode.ACCESS:
+                ports[interface_name] = port._replace(vlan_ids=[vlan_id])
+
+        result = self.run(['bridge', '-j', 'vlan', 'show'], suppress_error=True)
+
+        if result.exit_code:
+            self.log.error(f"Unable to read bridge VLAN table, error: {result.stderr}")
+            return STATUS_NOK
+
+        batch = BridgeVlanBatch.compile(bridge_name, list(ports.values()),
+                                        BridgeVlanBatch.parse_bridge_vlan_show(result.stdout))
+
+        if not batch:
+            self.log.debug(f"apply_bridge_vlans({bridge_name}) -> bridge VLAN table up to date")
+            return STATUS_OK
+
+        self.log.debug(f"apply_bridge_vlans({bridge_name}) -> batch:\n{batch}")
+        result = self.run(['bridge', '-batch', '-'], stdin=batch)
+
+        if result.exit_code:
+            self.log.error(f"Unable to program VLANs of bridge {bridge_name}, error: {result.stderr}")
+            return STATUS_NOK
+
+        return STATUS_OK
+
+    def _apply_port_bridge_vlans(self, interface_name: InterfaceName) -> StatusResult:
+        bridge = VlanDatabase().get_bridge_vlan_filtering(interface_name)
+
+        if not bridge or not bridge[1]:
+            self.log.debug(f"Interface {interface_name} is not on a vlan-filtering bridge, stored configuration only")
+            return STATUS_OK
+
+        return self.apply_bridge_vlans(bridge[0])
+
     def get_vlan_name_from_vlan_id(self, vlan_id: int) -> str | None:
         """
         Retrieves the VLAN name corresponding to a given VLAN ID.
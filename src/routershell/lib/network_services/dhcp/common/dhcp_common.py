@@ -1,4 +1,10 @@
+import ipaddress
+import re
+import string
+from collections.abc import Mapping
 from enum import Enum
+from types import MappingProxyType
+from typing import NamedTuple
 
 
 class DHCPVersion(Enum):
@@ -232,10 +238,7 @@ class DHCPOptionLookup:
         Returns:
             int or None: The option code for the specified option name, or None if not found.
         """
-        for code, option_info in self.dhcpv4_option_lookup.items():
-            if option_info["Name"] == option_name:
-                return code
-        return None
+        return DHCPV4_OPTION_CATALOG.get_code(option_name)
 
     def get_dhcpv6_option_code(self, option_name):
         """
@@ -247,7 +250,169 @@ class DHCPOptionLookup:
         Returns:
             int or None: The option code for the specified option name, or None if not found.
         """
-        for code, option_info in self.dhcpv6_option_lookup.items():
-            if option_info["Name"] == option_name:
-                return code
-        return None
+        return DHCPV6_OPTION_CATALOG.get_code(option_name)
+
+
+class DhcpOptionSpec(NamedTuple):
+    """
+    The definition of a DHCP option.
+
+    Attributes:
+        code (int): The option code.
+        name (str): The option name.
+        option_type (str): The type of the option value, as named by the Kea option tables.
+        array (bool): True if the value is a list of values of the type.
+        version (DHCPVersion): The DHCP version of the option.
+    """
+    code: int
+    name: str
+    option_type: str
+    array: bool
+    version: DHCPVersion
+
+
+class DhcpOptionCatalog:
+    """
+    The options of a DHCP version, indexed by name and by code once and never modified.
+
+    The catalog validates an option value against the declared type of the option and
+    encodes it as a DNSMasq dhcp-option value, so an invalid option is rejected when it
+    is configured rather than when DNSMasq loads it.
+    """
+
+    _INTEGER_BITS = {'uint8': (False, 8), 'uint16': (False, 16), 'uint32': (False, 32),
+                     'int8': (True, 8), 'int16': (True, 16), 'int32': (True, 32)}
+    _BOOLEANS = {'true': '1', 'on': '1', '1': '1', 'false': '0', 'off': '0', '0': '0'}
+    _FQDN_LABEL = re.compile(r'^(?!-)[A-Za-z0-9_-]{1,63}(?<!-)$')
+
+    def __init__(self, version: DHCPVersion, options: dict[int, dict]):
+        self.version = version
+        self._by_code: Mapping[int, DhcpOptionSpec] = MappingProxyType(
+            {code: DhcpOptionSpec(code, info['Name'], info['Type'], info['Array'], version)
+             for code, info in options.items()})
+        self._by_name: Mapping[str, DhcpOptionSpec] = MappingProxyType(
+            {spec.name: spec for spec in self._by_code.values()})
+
+    @staticmethod
+    def for_version(version: DHCPVersion) -> tuple['DhcpOptionCatalog', ...]:
+        """The catalogs of a DHCP version, both catalogs for an unknown version."""
+        if version == DHCPVersion.DHCP_V4:
+            return (DHCPV4_OPTION_CATALOG,)
+
+        if version == DHCPVersion.DHCP_V6:
+            return (DHCPV6_OPTION_CATALOG,)
+
+        return (DHCPV4_OPTION_CATALOG, DHCPV6_OPTION_CATALOG)
+
+    def __len__(self) -> int:
+        return len(self._by_code)
+
+    def __contains__(self, option: str | int) -> bool:
+        return self.get(option) is not None
+
+    def get(self, option: str | int) -> DhcpOptionSpec | None:
+        """
+        Look up an option by name, code or code text.
+
+        Returns:
+            DhcpOptionSpec | None: The option, None if unknown.
+        """
+        if isinstance(option, int):
+            return self._by_code.get(option)
+
+        if option.isdigit():
+            return self._by_code.get(int(option))
+
+        return self._by_name.get(option)
+
+    def get_code(self, option_name: str) -> int | None:
+        """The code of an option, None if unknown."""
+        spec = self._by_name.get(option_name)
+        return spec.code if spec else None
+
+    def encode(self, option: str | int, value: str) -> str:
+        """
+        Validate an option value and encode it as the value of a DNSMasq dhcp-option,
+        the values of an array option are separated by commas.
+
+        Returns:
+            str: The encoded value.
+
+        Raises:
+            ValueError: If the option is unknown or the value does not match its type.
+        """
+        spec = self.get(option)
+
+        if spec is None:
+            raise ValueError(f"Unknown {self.version.value} option: {option}")
+
+        values = value.split(',') if spec.array else [value]
+
+        if not all(values):
+            raise ValueError(f"Empty value for {self.version.value} option {spec.name}")
+
+        try:
+            return ','.join(self._encode_value(spec.option_type, item) for item in values)
+        except ValueError as e:
+            raise ValueError(f"Invalid value '{value}' for {self.version.value} option {spec.name} "
+                             f"({spec.option_type}{' array' if spec.array else ''}): {e}") from None
+
+    def _encode_value(self, option_type: str, value: str) -> str:
+        if option_type in self._INTEGER_BITS:
+            return self._encode_integer(value, option_type)
+
+        # The values of the other types (string, records, tuples) are passed to DNSMasq as they are
+        encoder = self._ENCODERS.get(option_type)
+
+        return encoder(self, value) if encoder else value
+
+    def _encode_ipv4_address(self, value: str) -> str:
+        return str(ipaddress.IPv4Address(value))
+
+    def _encode_ipv6_address(self, value: str) -> str:
+        # DNSMasq takes IPv6 option addresses in brackets
+        return f"[{ipaddress.IPv6Address(value.strip('[]'))}]"
+
+    def _encode_integer(self, value: str, option_type: str) -> str:
+        signed, bits = self._INTEGER_BITS[option_type]
+        number = int(value, 16) if value.lower().startswith('0x') else int(value)
+        low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if signed else (0, (1 << bits) - 1)
+
+        if not low <= number <= high:
+            raise ValueError(f"out of range {low}-{high}")
+
+        return str(number)
+
+    def _encode_boolean(self, value: str) -> str:
+        if value.lower() not in self._BOOLEANS:
+            raise ValueError("expected true or false")
+
+        return self._BOOLEANS[value.lower()]
+
+    def _encode_fqdn(self, value: str) -> str:
+        name = value.rstrip('.')
+
+        if len(name) > 253 or not all(self._FQDN_LABEL.match(label) for label in name.split('.')):
+            raise ValueError("not a domain name")
+
+        return name
+
+    def _encode_binary(self, value: str) -> str:
+        digits = value.replace(':', '')
+
+        if len(digits) % 2 or not all(digit in string.hexdigits for digit in digits):
+            raise ValueError("expected hexadecimal bytes")
+
+        return ':'.join(digits[offset:offset + 2].lower() for offset in range(0, len(digits), 2))
+
+    _ENCODERS = {
+        'ipv4-address': _encode_ipv4_address,
+        'ipv6-address': _encode_ipv6_address,
+        'boolean': _encode_boolean,
+        'fqdn': _encode_fqdn,
+        'binary': _encode_binary,
+    }
+
+
+DHCPV4_OPTION_CATALOG = DhcpOptionCatalog(DHCPVersion.DHCP_V4, DHCPOptionLookup.dhcpv4_option_lookup)
+DHCPV6_OPTION_CATALOG = DhcpOptionCatalog(DHCPVersion.DHCP_V6, DHCPOptionLookup.dhcpv6_option_lookup)
@@ -2,14 +2,23 @@ import logging
 import os
 from enum import Enum, auto
 
+from routershell.lib.common.atomic_file import AtomicFile
+from routershell.lib.common.config_change_bus import ConfigChanges, ConfigChangeTopic
 from routershell.lib.common.constants import DNSMASQ_CONFIG_DIR as DEFAULT_DNSMASQ_CONFIG_DIR
+from routershell.lib.common.constants import DNSMASQ_HOSTS_DIR as DEFAULT_DNSMASQ_HOSTS_DIR
+from routershell.lib.common.constants import DNSMASQ_OPTS_DIR as DEFAULT_DNSMASQ_OPTS_DIR
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.string_formats import StringFormats
 from routershell.lib.common.types import DhcpPoolName, InetCidrText, StatusResult
 from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+from routershell.lib.db.dns_db import DnsDB
 from routershell.lib.network_manager.network_operations.network_mgr import NetworkManager
-from routershell.lib.network_services.dhcp.common.dhcp_common import DHCPOptionLookup, DHCPVersion
+from routershell.lib.network_services.dhcp.common.dhcp_common import (
+    DHCPV4_OPTION_CATALOG,
+    DHCPV6_OPTION_CATALOG,
+    DHCPVersion,
+)
 from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_config_gen import DHCPv6Modes, DNSMasqConfigurator
 from routershell.lib.system.system_service_control.system_service_control import (
     SysServCntrlAction,
@@ -59,6 +68,19 @@ class DNSMasqDeploy(Enum):
     GLOBAL = auto()
     INTERFACE = auto()
     
+class DNSMasqReload(Enum):
+    """
+    How dnsmasq picks up a deployed configuration, in increasing order of disruption.
+
+    NONE - Only dhcp-hostsdir/dhcp-optsdir entries were added, dnsmasq reads them with inotify.
+    SIGHUP - dhcp-hostsdir/dhcp-optsdir entries were changed or removed, a SIGHUP re-reads them
+             (and clears the DNS cache) without dropping in-flight DHCP exchanges.
+    RESTART - The main configuration changed.
+    """
+    NONE = 0
+    SIGHUP = 1
+    RESTART = 2
+
 class DNSMasqRunStatus(Enum):
     RUNNING = auto()
     STOPPED = auto()
@@ -118,6 +140,63 @@ class DNSMasqService(NetworkManager):
         """
         return self.control_service(SysServCntrlAction.STOP)
 
+    def reload_dnsmasq(self) -> StatusResult:
+        """
+        Send SIGHUP to DNSMasq, which re-reads its hosts and options files and directories.
+
+        Returns:
+            StatusResult: STATUS_OK if the signal was sent, STATUS_NOK otherwise.
+        """
+        return SystemServiceControl().signal_service('dnsmasq', 'HUP')
+
+    def apply_reload(self, reload: DNSMasqReload, start: bool = True) -> StatusResult:
+        """
+        Make dnsmasq pick up a deployed configuration with the least disruptive action:
+        nothing, a SIGHUP or a restart.
+
+        Args:
+            reload (DNSMasqReload): The action the deployed configuration needs.
+            start (bool): Start a stopped dnsmasq, otherwise a stopped dnsmasq is left stopped.
+
+        Returns:
+            StatusResult: STATUS_OK if dnsmasq runs with the deployed configuration, or is left stopped, STATUS_NOK otherwise.
+        """
+        if reload == DNSMasqReload.NONE and not start:
+            return STATUS_OK
+
+        if (reload != DNSMasqReload.RESTART or not start) and self.check_dnsmasq_status() != DNSMasqRunStatus.RUNNING:
+            if not start:
+                return STATUS_OK
+
+            reload = DNSMasqReload.RESTART
+
+        self.log.debug(f"apply_reload() -> {reload.name}")
+
+        if reload == DNSMasqReload.SIGHUP and self.reload_dnsmasq() == STATUS_OK:
+            return STATUS_OK
+
+        if reload == DNSMasqReload.NONE:
+            return STATUS_OK
+
+        return self.control_service(SysServCntrlAction.RESTART)
+
+    def check_dnsmasq_status(self) -> DNSMasqRunStatus:
+        """
+        Check the status of DNSMasq using the 'systemctl is-active dnsmasq' command.
+
+        Returns:
+            DNSMasqRunStatus: An enum representing the DNSMasq status - STOPPED, RUNNING, or UNKNOWN.
+        """
+        try:
+            if SystemServiceControl().is_active('dnsmasq'):
+                return DNSMasqRunStatus.RUNNING
+            else:
+                return DNSMasqRunStatus.STOPPED
+        
+        except Exception as e:
+            self.log.error(f"Error: {str(e)}")
+            return DNSMasqRunStatus.UNKNOWN
+
 class DNSMasqInterfaceService(DNSMasqService):
     """
     Class for controlling the DNSMasq Interface Service.
@@ -136,6 +215,10 @@ class DNSMasqInterfaceService(DNSMasqService):
     DNSMASQ_FILENAME_SUFFIX = '_dnsmasq.conf'
     DNSMASQ_GLOBAL_FILENAME = 'dnsmasq.conf'
     DNSMASQ_CONFIG_DIR = DEFAULT_DNSMASQ_CONFIG_DIR
+    DNSMASQ_HOSTS_DIR = DEFAULT_DNSMASQ_HOSTS_DIR
+    DNSMASQ_OPTS_DIR = DEFAULT_DNSMASQ_OPTS_DIR
+    DNSMASQ_HOSTS_FILENAME = 'hosts'
+    DNSMASQ_OPTS_FILENAME = 'opts'
     DEFAULT_LEASE_TIME = 86400
     DEFAULT_DNS_LISTEN_PORT=5353 # '''Setting DNS to 5353 prevents conflict if there is already DNS running'''
 
@@ -150,19 +233,26 @@ class DNSMasqInterfaceService(DNSMasqService):
                 
         self.d_masq_if_config = DNSMasqConfigurator()
         self.d_masq_global_config = DNSMasqConfigurator()
+        self.dhcp_hosts: list[str] = []
+        self.dhcp_opts: list[str] = []
+        self.reload = DNSMasqReload.NONE
         self.dhcp_srv_db = DHCPServerDatabase()
         self._build_global_configuration()
 
     def _build_global_configuration(self) -> StatusResult:
-        self.d_masq_global_config.add_listen_port(self.DEFAULT_DNS_LISTEN_PORT)
+        global_service = DNSMasqGlobalService()
+        global_service.build_configuration()
+        self.d_masq_global_config = global_service.d_masq_global_config
         return STATUS_OK
     
     def build_interface_configuration(self) -> StatusResult:
         """
         Build the interface configuration for DNSMasq.
 
-        This method configures DNSMasq for the specified DHCP pool by setting the listen interfaces,
-        DHCP pool ranges, and DHCP host reservations.
+        This method configures DNSMasq for the specified DHCP pool by setting the listen interfaces
+        and DHCP pool ranges. The DHCP host reservations and the pool options go to the pool's
+        dhcp-hostsdir and dhcp-optsdir files, scoped to the pool ranges with a tag, so that changing
+        them does not need a dnsmasq restart.
 
         Returns:
             StatusResult: STATUS_OK if the configuration was successfully built, STATUS_NOK otherwise.
@@ -183,10 +273,14 @@ class DNSMasqInterfaceService(DNSMasqService):
         for interface_name in interface_names:
             self.d_masq_if_config.set_listen_interfaces(list(interface_name.values()))
 
-        if self.dhcp_srv_db.dhcp_pool_name_dhcp_version_db(self.dhcp_pool_name) == DHCPVersion.DHCP_V4:
+        tag = self.dhcp_pool_name
+
+        dhcp_version = self.dhcp_srv_db.dhcp_pool_name_dhcp_version_db(self.dhcp_pool_name)
+
+        if dhcp_version == DHCPVersion.DHCP_V4:
             for entry in dhcp_pool_ranges:
                 range_start, range_end, netmask = entry['inet_start'], entry['inet_end'], entry['inet_subnet']
-                self.d_masq_if_config.add_dhcp4_range_with_netmask(range_start, range_end, netmask, self.DEFAULT_LEASE_TIME)
+                self.d_masq_if_config.add_dhcp4_range_with_netmask(range_start, range_end, netmask, self.DEFAULT_LEASE_TIME, tag)
         
         else:
             for entry in dhcp_pool_ranges:
@@ -194,28 +288,32 @@ class DNSMasqInterfaceService(DNSMasqService):
                 StringFormats.modify_dict_value(entry, 'inet_subnet', '/', '')
                 
                 range_start, range_end, netmask = entry['inet_start'], entry['inet_end'], entry['inet_subnet']
-                self.d_masq_if_config.add_dhcp6_range_with_prefix_len(range_start, range_end, int(netmask), self.DEFAULT_LEASE_TIME, DHCPv6Modes.SLAAC)            
+                self.d_masq_if_config.add_dhcp6_range_with_prefix_len(range_start, range_end, int(netmask), self.DEFAULT_LEASE_TIME, DHCPv6Modes.SLAAC, tag)
+
+        self.d_masq_if_config.set_dhcp_hostsdir(self._pool_dir(self.DNSMASQ_HOSTS_DIR))
+        self.d_masq_if_config.set_dhcp_optsdir(self._pool_dir(self.DNSMASQ_OPTS_DIR))
 
         # Get DHCP pool options and add them to DNSMasq
         dhcp_pool_options = self.dhcp_srv_db.get_dhcp_pool_options_db(self.dhcp_pool_name)
+        catalog = DHCPV6_OPTION_CATALOG if dhcp_version == DHCPVersion.DHCP_V6 else DHCPV4_OPTION_CATALOG
+        option_prefix = 'option6:' if dhcp_version == DHCPVersion.DHCP_V6 else ''
         self.log.debug(f"DHCP-Pool-options: {dhcp_pool_options}")
         for option in dhcp_pool_options:
             
             self.log.debug(f"DHCP-Pool-option: {option} -> OPTION: {option['option']}")
             
-            option_code = DHCPOptionLookup().get_dhcpv4_option_code(option['option'])
-            
-            if option_code is not None:
-                self.d_masq_if_config.add_dhcp_option(option_code, option['value'])
+            try:
+                value = catalog.encode(option['option'], option['value'])
+            except ValueError as e:
+                self.log.error(f"Skipping option of DHCP pool {self.dhcp_pool_name}: {e}")
+                continue
+
+            spec = catalog.get(option['option'])
+            self.dhcp_opts.append(f"tag:{tag},{option_prefix}{spec.code},{value}")
         
-        # Add DHCP host reservations to DNSMasq
+        # Add DHCP host reservations to DNSMasq, a dhcp-hostsdir line is a dhcp-host value
         for host in dhcp_hosts:
-            if len(host) == 3:
-                ethernet_address, ip_address, lease_time = host.values()
-                self.d_masq_if_config.add_dhcp_host(ethernet_address, ip_address, lease_time)
-            else:
-                ethernet_address, ip_address = host.values()
-                self.d_masq_if_config.add_dhcp_host(ethernet_address, ip_address)               
+            self.dhcp_hosts.append(','.join(str(value) for value in host.values()))
         
         self.log.debug(self.d_masq_if_config.generate_configuration())
         
@@ -225,6 +323,10 @@ class DNSMasqInterfaceService(DNSMasqService):
         """
         Deploy the DNSMasq configuration.
 
+        The files are only written when their content hash changed, through a temporary file
+        renamed over the previous one. `self.reload` records how dnsmasq picks the changes up,
+        `apply_configuration()` acts on it.
+
         Args:
             deploy_type (DNSMasqDeploy): The type of DNSMasq configuration to deploy (DNSMasqDeploy.GLOBAL or DNSMasqDeploy.INTERFACE).
 
@@ -251,16 +353,45 @@ class DNSMasqInterfaceService(DNSMasqService):
         else:
             raise ValueError("Invalid deployment type")
 
-        destination_file = os.path.join(self.DNSMASQ_CONFIG_DIR, filename)
+        files = [(os.path.join(self.DNSMASQ_CONFIG_DIR, filename), config_text, DNSMasqReload.RESTART)]
 
-        if os.path.exists(destination_file):
-            os.remove(destination_file)
+        if deploy_type == DNSMasqDeploy.INTERFACE:
+            files.append((os.path.join(self._pool_dir(self.DNSMASQ_HOSTS_DIR), self.DNSMASQ_HOSTS_FILENAME),
+                          self._lines_text(self.dhcp_hosts), None))
+            files.append((os.path.join(self._pool_dir(self.DNSMASQ_OPTS_DIR), self.DNSMASQ_OPTS_FILENAME),
+                          self._lines_text(self.dhcp_opts), None))
 
-        with open(destination_file, "w") as file:
-            file.write(config_text)
+        for path, text, reload in files:
+            previous = AtomicFile.read(path)
+
+            try:
+                if not AtomicFile.write_if_changed(path, text):
+                    continue
+            except OSError as e:
+                self.log.error(f"Unable to write DNSMasq configuration {path}: {e}")
+                return STATUS_NOK
+
+            if reload is None:
+                # dnsmasq reads added entries by itself, changed or removed entries need a SIGHUP
+                added_only = set((previous or '').splitlines()) <= set(text.splitlines())
+                reload = DNSMasqReload.NONE if added_only else DNSMasqReload.SIGHUP
+
+            self.log.debug(f"Deployed {path} -> {reload.name}")
+            self.reload = max(self.reload, reload, key=lambda action: action.value)
 
         return STATUS_OK
 
+    def apply_configuration(self) -> StatusResult:
+        """
+        Make dnsmasq pick up the deployed configuration with the least disruptive action:
+        nothing, a SIGHUP or a restart. A stopped dnsmasq is started.
+
+        Returns:
+            StatusResult: STATUS_OK if dnsmasq runs with the deployed configuration, STATUS_NOK otherwise.
+        """
+        reload, self.reload = self.reload, DNSMasqReload.NONE
+        return self.apply_reload(reload)
+
     def clear_configurations(self) -> StatusResult:
         """
         Clear DNSMasq configurations for the DHCP pool.
@@ -268,58 +399,192 @@ class DNSMasqInterfaceService(DNSMasqService):
         Returns:
             StatusResult: STATUS_OK if configurations were successfully cleared, STATUS_NOK otherwise.
         """
-        config_dir = self.DNSMASQ_CONFIG_DIR
-        
-        if os.path.exists(config_dir) and os.is_dir(config_dir):
-            try:
-                for filename in os.listdir(config_dir):
-                    if filename.endswith(self.DNSMASQ_FILENAME_SUFFIX):
-                        file_path = os.path.join(config_dir, filename)
-                        os.remove(file_path)
-            except Exception as e:
-                self.log.debug(f"Error while clearing configurations: {str(e)}")
-                return STATUS_NOK
+        paths = [os.path.join(self.DNSMASQ_CONFIG_DIR, f"{self.dhcp_pool_name}{self.DNSMASQ_FILENAME_SUFFIX}"),
+                 os.path.join(self._pool_dir(self.DNSMASQ_HOSTS_DIR), self.DNSMASQ_HOSTS_FILENAME),
+                 os.path.join(self._pool_dir(self.DNSMASQ_OPTS_DIR), self.DNSMASQ_OPTS_FILENAME)]
+
+        try:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+                    self.reload = DNSMasqReload.RESTART
+
+            for directory in (self._pool_dir(self.DNSMASQ_HOSTS_DIR), self._pool_dir(self.DNSMASQ_OPTS_DIR)):
+                if os.path.isdir(directory) and not os.listdir(directory):
+                    os.rmdir(directory)
+
+        except OSError as e:
+            self.log.debug(f"Error while clearing configurations: {str(e)}")
+            return STATUS_NOK
 
         return STATUS_OK
 
-    def check_dnsmasq_status(self) -> DNSMasqRunStatus:
+    def _pool_dir(self, base_dir: str) -> str:
+        return os.path.join(base_dir, self.dhcp_pool_name)
+
+    @staticmethod
+    def _lines_text(lines: list[str]) -> str:
+        return ''.join(f"{line}\n" for line in lines)
+
+class DNSMasqGlobalService(DNSMasqService):
+    """
+    Class for controlling the global DNSMasq configuration, the DNS listen port and the DNS cache
+    settings (`ip dns cache ...`) shared by every DHCP pool.
+
+    Example:
+        service = DNSMasqGlobalService()
+        service.build_configuration()
+        service.deploy_configuration()
+        service.apply_configuration()
+    """
+
+    DNSMASQ_CONFIG_DIR = DEFAULT_DNSMASQ_CONFIG_DIR
+    DNSMASQ_GLOBAL_FILENAME = DNSMasqInterfaceService.DNSMASQ_GLOBAL_FILENAME
+    DNS_LISTEN_PORT = DNSMasqInterfaceService.DEFAULT_DNS_LISTEN_PORT
+
+    def __init__(self):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DNSMASQ_GLOBAL_SERVICE)
+
+        self.d_masq_global_config = DNSMasqConfigurator()
+        self.reload = DNSMasqReload.NONE
+
+    def build_configuration(self) -> StatusResult:
         """
-        Check the status of DNSMasq using 'systemctl status dnsmasq' command.
+        Build the global DNSMasq configuration from the DNS settings of the DB, a setting
+        left to the dnsmasq default is not rendered.
 
         Returns:
-            DNSMasqRunStatus: An enum representing the DNSMasq status - STOPPED, RUNNING, or UNKNOWN.
+            StatusResult: STATUS_OK if the configuration was successfully built.
         """
+        settings = DnsDB().get_settings()
+        self.log.debug(f"build_configuration() -> {settings}")
+
+        self.d_masq_global_config = DNSMasqConfigurator()
+        self.d_masq_global_config.add_listen_port(self.DNS_LISTEN_PORT)
+
+        if settings['CacheSize'] is not None:
+            self.d_masq_global_config.set_cache_size(settings['CacheSize'])
+
+        if not settings['NegativeCache']:
+            self.d_masq_global_config.disable_negative_cache()
+
+        if settings['MinCacheTtl'] is not None:
+            self.d_masq_global_config.set_min_cache_ttl(settings['MinCacheTtl'])
+
+        if settings['ForwardMax'] is not None:
+            self.d_masq_global_config.set_dns_forward_max(settings['ForwardMax'])
+
+        return STATUS_OK
+
+    def deploy_configuration(self) -> StatusResult:
+        """
+        Write the global DNSMasq configuration when its content changed. dnsmasq only reads
+        the cache settings at startup, a changed configuration records a restart in `self.reload`.
+
+        Returns:
+            StatusResult: STATUS_OK if the configuration was successfully deployed, STATUS_NOK otherwise.
+        """
+        path = os.path.join(self.DNSMASQ_CONFIG_DIR, self.DNSMASQ_GLOBAL_FILENAME)
+        text = self.d_masq_global_config.generate_configuration()
+
         try:
-            result = self.run(['systemctl', 'status', 'dnsmasq'])
+            if AtomicFile.write_if_changed(path, text):
+                self.log.debug(f"Deployed {path} -> {DNSMasqReload.RESTART.name}")
+                self.reload = DNSMasqReload.RESTART
 
-            if result.exit_code:
-                return DNSMasqRunStatus.STOPPED
-            else:
-                return DNSMasqRunStatus.RUNNING
-        
-        except Exception as e:
-            self.log.error(f"Error: {str(e)}")
-            return DNSMasqRunStatus.UNKNOWN
+        except OSError as e:
+            self.log.error(f"Unable to write DNSMasq configuration {path}: {e}")
+            return STATUS_NOK
 
-class DNSMasqGlobalService(DNSMasqService):
-    """
-    Class for controlling the DNSMasq Interface Service.
+        return STATUS_OK
 
-    Args:
-        dhcp_pool_name (str): Name of the DHCP pool.
-        dhcp_pool_subnet (str): Subnet configuration for the DHCP pool.
-        negate (bool): Whether to negate the configuration (default: False).
+    def apply_configuration(self) -> StatusResult:
+        """
+        Restart a running dnsmasq when the global configuration changed, a stopped dnsmasq
+        reads it when a DHCP pool starts it.
 
-    Attributes:
-        dhcp_pool_name (str): Name of the DHCP pool.
-        dhcp_pool_subnet (str): Subnet configuration for the DHCP pool.
-        negate (bool): Whether to negate the configuration.
+        Returns:
+            StatusResult: STATUS_OK if dnsmasq runs with the deployed configuration or is stopped, STATUS_NOK otherwise.
+        """
+        reload, self.reload = self.reload, DNSMasqReload.NONE
+        return self.apply_reload(reload, start=False)
+
+
+class DNSMasqConfigChanges(DNSMasqService):
+    """
+    Apply the DHCP pool and DNS setting changes published on the `ConfigChangeBus` to dnsmasq.
+
+    The configuration of every changed DHCP pool, and the global configuration, is deployed
+    first and dnsmasq is then reloaded once with the most disruptive action any of them needs.
 
     Example:
-        service = DNSMasqService("home", "192.168.1.0/24")
+        ConfigChangeBus().subscribe(DNSMasqConfigChanges.TOPICS, DNSMasqConfigChanges.handle)
     """
 
-    def __init__(self, dhcp_pool_name: DhcpPoolName, dhcp_pool_subnet: InetCidrText, negate=False):
+    TOPICS = [ConfigChangeTopic.DHCP_POOL, ConfigChangeTopic.DNS]
+
+    def __init__(self):
         super().__init__()
         self.log = logging.getLogger(self.__class__.__name__)
-        self.log.setLevel(RSLS().DNSMASQ_INTERFACE_SERVICE)    
+        self.log.setLevel(RSLS().DNSMASQ_SERVICE)
+
+    @staticmethod
+    def handle(changes: ConfigChanges) -> StatusResult:
+        """The `ConfigChangeBus` handler of dnsmasq."""
+        return DNSMasqConfigChanges().apply_changes(changes)
+
+    def apply_changes(self, changes: ConfigChanges) -> StatusResult:
+        """
+        Deploy the configuration of the changed DHCP pools and DNS settings and reload dnsmasq once.
+
+        A pool applied to interfaces is redeployed, the configuration of a pool removed from
+        every interface, or deleted, is cleared.
+
+        Args:
+            changes (ConfigChanges): The changed DHCP pool names and DNS settings.
+
+        Returns:
+            StatusResult: STATUS_OK if every change was applied, STATUS_NOK otherwise.
+        """
+        status = STATUS_OK
+        reload = DNSMasqReload.NONE
+        serving = False
+
+        if ConfigChangeTopic.DNS in changes:
+            global_service = DNSMasqGlobalService()
+
+            if global_service.build_configuration() or global_service.deploy_configuration():
+                status = STATUS_NOK
+
+            reload = global_service.reload
+
+        dhcp_srv_db = DHCPServerDatabase()
+
+        for dhcp_pool_name in sorted(changes.get(ConfigChangeTopic.DHCP_POOL, set()) - {None}):
+            DMIS = DNSMasqInterfaceService(dhcp_pool_name, dhcp_srv_db.get_dhcp_pool_subnet_name_db(dhcp_pool_name))
+
+            if dhcp_srv_db.get_dhcp_pool_interfaces_db(dhcp_pool_name):
+                if DMIS.build_interface_configuration() or DMIS.deploy_configuration(DNSMasqDeploy.INTERFACE):
+                    self.log.error(f"Unable to deploy DNSMasq configuration of DHCP pool {dhcp_pool_name}")
+                    status = STATUS_NOK
+                    continue
+
+                serving = True
+
+            elif DMIS.clear_configurations():
+                self.log.error(f"Unable to clear DNSMasq configuration of DHCP pool {dhcp_pool_name}")
+                status = STATUS_NOK
+                continue
+
+            reload = max(reload, DMIS.reload, key=lambda action: action.value)
+
+        self.log.debug(f"apply_changes() -> {reload.name}, serving DHCP: {serving}")
+
+        # A deployed DHCP pool needs dnsmasq running, other changes leave a stopped dnsmasq stopped
+        if self.apply_reload(reload, start=serving):
+            self.log.error("Unable to reload DNSMasq")
+            status = STATUS_NOK
+
+        return status
@@ -81,6 +81,40 @@ class DNSMasqConfigurator:
         '''
         self.config.append(f'port={port}')
 
+    def set_cache_size(self, cache_size: int):
+        '''
+        Set the number of names of the DNS cache in the DNSMasq configuration.
+
+        Args:
+            cache_size (int): The cache size, 0 disables caching (dnsmasq default: 150).
+        '''
+        self.config.append(f'cache-size={cache_size}')
+
+    def disable_negative_cache(self):
+        '''
+        Disable caching of negative (NXDOMAIN, NODATA) DNS answers in the DNSMasq configuration.
+        '''
+        self.config.append('no-negcache')
+
+    def set_min_cache_ttl(self, ttl: int):
+        '''
+        Set the minimum time a DNS answer stays in the cache in the DNSMasq configuration,
+        overriding a lower TTL of the answer.
+
+        Args:
+            ttl (int): The minimum TTL in seconds, dnsmasq caps it to 3600.
+        '''
+        self.config.append(f'min-cache-ttl={ttl}')
+
+    def set_dns_forward_max(self, forward_max: int):
+        '''
+        Set the maximum number of concurrent DNS queries forwarded upstream in the DNSMasq configuration.
+
+        Args:
+            forward_max (int): The maximum number of concurrent queries (dnsmasq default: 150).
+        '''
+        self.config.append(f'dns-forward-max={forward_max}')
+
     def enable_domain_filtering(self):
         '''
         Enable domain filtering in the DNSMasq configuration.
@@ -357,7 +391,7 @@ class DNSMasqConfigurator:
         self.config.append(
             f'dhcp-range={range_start},{range_end},{lease_time}')
 
-    def add_dhcp4_range_with_netmask(self, range_start: str, range_end: str, netmask: str, lease_time: int):
+    def add_dhcp4_range_with_netmask(self, range_start: str, range_end: str, netmask: str, lease_time: int, tag: str | None = None):
         '''
         Add a DHCP server range with netmask in the DNSMasq configuration for IPv4.
 
@@ -366,9 +400,11 @@ class DNSMasqConfigurator:
             range_end (str): The end IP address of the DHCP range.
             netmask (str): The netmask for the DHCP range.
             lease_time (int): The lease time for DHCP leases.
+            tag (str, optional): The tag set on the clients served from the range.
         '''
+        tag_prefix = f'set:{tag},' if tag else ''
         self.config.append(
-            f'dhcp-range={range_start},{range_end},{netmask},{lease_time}')
+            f'dhcp-range={tag_prefix}{range_start},{range_end},{netmask},{lease_time}')
 
     def add_dhcp4_range_with_tag(self, tag: str, range_start: str, range_end: str, lease_time: int):
         '''
@@ -396,7 +432,7 @@ class DNSMasqConfigurator:
         self.config.append(
             f'dhcp-range={range_start},{range_end},{lease_time},constructor:{self.interface},{mode.value}')
 
-    def add_dhcp6_range_with_prefix_len(self, range_start: str, range_end: str, prefix_len: int, lease_time: int, mode: DHCPv6Modes):
+    def add_dhcp6_range_with_prefix_len(self, range_start: str, range_end: str, prefix_len: int, lease_time: int, mode: DHCPv6Modes, tag: str | None = None):
         '''
         Add a DHCPv6 server range with prefix length in the DNSMasq configuration.
 
@@ -406,9 +442,11 @@ class DNSMasqConfigurator:
             prefix_len (int): The prefix length for the DHCPv6 range.
             lease_time (int): The lease time for DHCPv6 leases.
             mode (DHCPv6Modes): The DHCPv6 mode to configure.
+            tag (str, optional): The tag set on the clients served from the range.
         '''
+        tag_prefix = f'set:{tag},' if tag else ''
         self.config.append(
-            f'dhcp-range={range_start},{range_end},{mode.value},{prefix_len},{lease_time}')
+            f'dhcp-range={tag_prefix}{range_start},{range_end},{mode.value},{prefix_len},{lease_time}')
 
     def add_dhcp6_range_with_tag(self, tag: str, range_start: str, range_end: str, lease_time: int, mode: DHCPv6Modes):
         '''
@@ -424,6 +462,26 @@ class DNSMasqConfigurator:
         self.config.append(
             f'dhcp-range=set:{tag},{range_start},{range_end},{lease_time},constructor:{self.interface},{mode.value}')
 
+    def set_dhcp_hostsdir(self, hosts_dir: FilePath):
+        '''
+        Read the dhcp-host entries of the files of a directory, dnsmasq reads new or modified
+        files without a restart and drops removed entries on SIGHUP.
+
+        Args:
+            hosts_dir (str): The directory of the dhcp-host files.
+        '''
+        self.config.append(f'dhcp-hostsdir={hosts_dir}')
+
+    def set_dhcp_optsdir(self, opts_dir: FilePath):
+        '''
+        Read the dhcp-option entries of the files of a directory, dnsmasq reads new or modified
+        files without a restart and drops removed entries on SIGHUP.
+
+        Args:
+            opts_dir (str): The directory of the dhcp-option files.
+        '''
+        self.config.append(f'dhcp-optsdir={opts_dir}')
+
     def set_tftp_server(self, root_directory: str):
         '''
         Set a TFTP server in the DNSMasq configuration.
@@ -0,0 +1,344 @@
+import ipaddress
+import logging
+import os
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
+
+from routershell.lib.common.constants import DNSMASQ_LEASE_FILE_PATH
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import (
+    ClientIdText,
+    DhcpPoolName,
+    EpochSeconds,
+    FilePath,
+    HostnameText,
+    InetAddressText,
+    InetCidrText,
+    MacAddressText,
+)
+from routershell.lib.system.inotify import Inotify
+
+
+class DhcpLease(NamedTuple):
+    """
+    A lease of the dnsmasq lease file.
+
+    Attributes:
+        expires (EpochSeconds): The expiry time of the lease, 0 for an infinite lease.
+        mac_address (MacAddressText | None): The MAC address of the client, None for a DHCPv6 lease.
+        ip_address (InetAddressText): The leased address.
+        hostname (HostnameText | None): The hostname sent by the client.
+        client_id (ClientIdText | None): The client-id (DHCPv4) or the DUID (DHCPv6) of the client.
+        iaid (str | None): The identity association of a DHCPv6 lease.
+    """
+    expires: EpochSeconds
+    mac_address: MacAddressText | None
+    ip_address: InetAddressText
+    hostname: HostnameText | None
+    client_id: ClientIdText | None
+    iaid: str | None = None
+
+
+class DnsmasqLeaseStore(metaclass=Singleton):
+    """
+    The leases of the dnsmasq lease file, indexed by address, MAC address, hostname and DHCP pool.
+
+    The directory of the lease file is watched with inotify, a query re-reads the file only
+    after dnsmasq rewrote it, and then only parses and indexes the lines that changed. Without
+    inotify the file is re-read when its stat signature (mtime, size, inode) changes.
+    """
+
+    WATCH_MASK = (Inotify.IN_CLOSE_WRITE | Inotify.IN_MODIFY | Inotify.IN_MOVED_TO |
+                  Inotify.IN_MOVED_FROM | Inotify.IN_CREATE | Inotify.IN_DELETE)
+
+    def __init__(self, lease_file: FilePath = DNSMASQ_LEASE_FILE_PATH):
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DNSMASQ_LEASE_STORE)
+
+        self.lease_file = str(lease_file)
+        self._lock = threading.Lock()
+        self._lines: dict[str, DhcpLease | None] = {}
+        self._by_ip: dict[InetAddressText, DhcpLease] = {}
+        self._by_mac: dict[MacAddressText, dict[InetAddressText, DhcpLease]] = {}
+        self._by_hostname: dict[HostnameText, dict[InetAddressText, DhcpLease]] = {}
+        self._by_pool: dict[DhcpPoolName, dict[InetAddressText, DhcpLease]] = {}
+        self._pool_subnets: dict[DhcpPoolName, ipaddress.IPv4Network | ipaddress.IPv6Network] = {}
+        self._pool_subnets_loaded = False
+        self._server_duid: str | None = None
+        self._signature: tuple | None = None
+        self._loaded = False
+        self._inotify: Inotify | None = None
+        self._listeners: list[Callable[[list[DhcpLease], list[DhcpLease]], None]] = []
+        self._watch()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._by_ip)
+
+    @staticmethod
+    def parse_lease(line: str) -> DhcpLease | None:
+        """
+        Parse a lease line.
+
+        A DHCPv4 line is `<expires> <mac> <address> <hostname> <client-id>`, a DHCPv6 line
+        is `<expires> <iaid> <address> <hostname> <duid>`, `*` stands for an unknown field.
+
+        Returns:
+            DhcpLease | None: The lease, None if the line is malformed.
+        """
+        fields = line.split()
+
+        if len(fields) < 5:
+            return None
+
+        expires, second, address, hostname, client_id = fields[:5]
+
+        try:
+            ip = ipaddress.ip_address(address)
+            expires = int(expires)
+        except ValueError:
+            return None
+
+        hostname = None if hostname == '*' else hostname
+        client_id = None if client_id == '*' else client_id
+
+        if ip.version == 6:
+            return DhcpLease(expires, None, str(ip), hostname, client_id, second)
+
+        return DhcpLease(expires, second.lower(), str(ip), hostname, client_id)
+
+    def server_duid(self) -> str | None:
+        """The DHCPv6 server DUID recorded in the lease file."""
+        self.refresh()
+        return self._server_duid
+
+    def set_pool_subnets(self, pool_subnets: dict[DhcpPoolName, InetCidrText]) -> None:
+        """
+        Set the subnets of the DHCP pools, the leases are re-classified when they change.
+
+        Args:
+            pool_subnets (dict[DhcpPoolName, InetCidrText]): The subnet of each DHCP pool.
+        """
+        subnets = {}
+
+        for pool, subnet in pool_subnets.items():
+            try:
+                subnets[pool] = ipaddress.ip_network(subnet, strict=False)
+            except (TypeError, ValueError):
+                self.log.debug(f"Ignoring DHCP pool {pool} with subnet {subnet}")
+
+        with self._lock:
+            self._pool_subnets_loaded = True
+
+            if subnets == self._pool_subnets:
+                return
+
+            # Most specific subnet first, so nested pools claim their own leases
+            self._pool_subnets = dict(sorted(subnets.items(), key=lambda item: -item[1].prefixlen))
+            self._by_pool = {}
+
+            for lease in self._by_ip.values():
+                self._index(self._by_pool, self._pool_for(lease.ip_address), lease)
+
+    def pool_subnets_loaded(self) -> bool:
+        """
+        Returns:
+            bool: True if the pool subnets were set since the last `invalidate_pool_subnets()`.
+        """
+        return self._pool_subnets_loaded
+
+    def invalidate_pool_subnets(self) -> None:
+        """
+        Mark the pool subnets out of date, e.g. after a DHCP pool changed. The leases stay
+        classified by the previous subnets until `set_pool_subnets()` is called again.
+        """
+        self._pool_subnets_loaded = False
+
+    def add_listener(self, listener: Callable[[list[DhcpLease], list[DhcpLease]], None]) -> None:
+        """
+        Call `listener(added, removed)` with the leases that changed each time the lease file is re-read.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def leases(self) -> list[DhcpLease]:
+        """
+        Returns:
+            list[DhcpLease]: The leases in lease file order.
+        """
+        self.refresh()
+        return [lease for lease in self._lines.values() if lease]
+
+    def get_by_ip(self, ip_address: InetAddressText) -> DhcpLease | None:
+        self.refresh()
+
+        try:
+            return self._by_ip.get(str(ipaddress.ip_address(ip_address)))
+        except ValueError:
+            return None
+
+    def get_by_mac(self, mac_address: MacAddressText) -> list[DhcpLease]:
+        self.refresh()
+        return list(self._by_mac.get(mac_address.lower(), {}).values())
+
+    def get_by_hostname(self, hostname: HostnameText) -> list[DhcpLease]:
+        self.refresh()
+        return list(self._by_hostname.get(hostname.lower(), {}).values())
+
+    def get_by_pool(self, pool: DhcpPoolName) -> list[DhcpLease]:
+        self.refresh()
+        return list(self._by_pool.get(pool, {}).values())
+
+    def pool_of(self, lease: DhcpLease) -> DhcpPoolName | None:
+        """The DHCP pool whose subnet holds the leased address."""
+        return self._pool_for(lease.ip_address)
+
+    def refresh(self) -> bool:
+        """
+        Bring the indexes up to date with the lease file.
+
+        Returns:
+            bool: True if the lease file was re-read.
+        """
+        with self._lock:
+            if not self._changed():
+                return False
+
+            try:
+                with open(self.lease_file) as lease_file:
+                    lines = lease_file.read().splitlines()
+            except FileNotFoundError:
+                lines = []
+            except OSError as e:
+                self.log.error(f"Unable to read {self.lease_file}: {e}")
+                return False
+
+            added, removed = self._update(lines)
+            self._loaded = True
+            listeners = list(self._listeners)
+
+        if added or removed:
+            for listener in listeners:
+                listener(added, removed)
+
+        return True
+
+    def fileno(self) -> int | None:
+        """
+        Returns:
+            int | None: The inotify descriptor, readable once the directory of the lease file
+                changed, None when the lease file is polled.
+        """
+        inotify = self._inotify
+        return inotify.fileno() if inotify else None
+
+    def close(self) -> None:
+        """Stop watching the lease file."""
+        with self._lock:
+            if self._inotify:
+                self._inotify.close()
+                self._inotify = None
+
+    def _watch(self) -> None:
+        try:
+            inotify = Inotify()
+        except OSError as e:
+            self.log.debug(f"inotify is not available, polling {self.lease_file}: {e}")
+            return
+
+        try:
+            inotify.add_watch(os.path.dirname(os.path.abspath(self.lease_file)), self.WATCH_MASK)
+        except OSError as e:
+            self.log.debug(f"Unable to watch {self.lease_file}, polling instead: {e}")
+            inotify.close()
+            return
+
+        self._inotify = inotify
+
+    def _changed(self) -> bool:
+        if self._inotify:
+            name = os.path.basename(self.lease_file)
+            events = self._inotify.read_events()
+
+            # The events are drained before reading, a rewrite racing the read queues new events
+            return not self._loaded or any(event.name == name or event.mask & Inotify.IN_Q_OVERFLOW
+                                           for event in events)
+
+        try:
+            stat = os.stat(self.lease_file)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            signature = None
+
+        changed = not self._loaded or signature != self._signature
+        self._signature = signature
+        return changed
+
+    def _update(self, lines: list[str]) -> tuple[list[DhcpLease], list[DhcpLease]]:
+        current = dict.fromkeys(line for line in lines if line.strip())
+        added = []
+        removed = [lease for line, lease in self._lines.items() if line not in current and lease]
+
+        # Removals first, an address moving to a new line is then re-indexed by the new line
+        for lease in removed:
+            self._unindex(lease)
+
+        for line in current:
+            if line in self._lines:
+                current[line] = self._lines[line]
+                continue
+
+            fields = line.split()
+
+            if fields[0] == 'duid':
+                self._server_duid = fields[1] if len(fields) > 1 else None
+                continue
+
+            lease = self.parse_lease(line)
+
+            if not lease:
+                self.log.error(f"Malformed lease entry: {line.strip()}")
+                continue
+
+            current[line] = lease
+            self._by_ip[lease.ip_address] = lease
+            self._index(self._by_mac, lease.mac_address, lease)
+            self._index(self._by_hostname, lease.hostname and lease.hostname.lower(), lease)
+            self._index(self._by_pool, self._pool_for(lease.ip_address), lease)
+            added.append(lease)
+
+        self.log.debug(f"Lease file refreshed: {len(current)} lines, {len(added)} added, {len(removed)} removed")
+        self._lines = current
+
+        return added, removed
+
+    def _unindex(self, lease: DhcpLease) -> None:
+        if self._by_ip.get(lease.ip_address) is lease:
+            del self._by_ip[lease.ip_address]
+
+        for index, key in ((self._by_mac, lease.mac_address),
+                           (self._by_hostname, lease.hostname and lease.hostname.lower()),
+                           (self._by_pool, self._pool_for(lease.ip_address))):
+            entries = index.get(key)
+
+            if entries and entries.get(lease.ip_address) is lease:
+                del entries[lease.ip_address]
+
+                if not entries:
+                    del index[key]
+
+    @staticmethod
+    def _index(index: dict[str, dict[InetAddressText, DhcpLease]], key: str | None, lease: DhcpLease) -> None:
+        if key:
+            index.setdefault(key, {})[lease.ip_address] = lease
+
+    def _pool_for(self, ip_address: InetAddressText) -> DhcpPoolName | None:
+        if not self._pool_subnets:
+            return None
+
+        ip = ipaddress.ip_address(ip_address)
+
+        return next((pool for pool, subnet in self._pool_subnets.items() if ip in subnet), None)
@@ -0,0 +1,262 @@
+import logging
+import random
+import socket
+import struct
+import time
+from typing import NamedTuple
+
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqGlobalService
+
+
+class DNSMasqStatisticsError(Exception):
+    """Raised when the dnsmasq statistics can not be read."""
+
+
+class DNSMasqServerStatistics(NamedTuple):
+    """
+    The counters of an upstream DNS server of dnsmasq.
+
+    Attributes:
+        server (str): The server as `<address>#<port>`.
+        queries (int): The queries forwarded to the server.
+        failed (int): The queries the server failed to answer.
+    """
+    server: str
+    queries: int
+    failed: int
+
+
+class DNSMasqCacheStatistics(NamedTuple):
+    """
+    The DNS cache counters of dnsmasq, None for a counter dnsmasq did not answer.
+
+    Attributes:
+        cache_size (int | None): The number of names the cache holds.
+        insertions (int | None): The names inserted in the cache.
+        evictions (int | None): The names evicted from the full cache before their TTL expired.
+        misses (int | None): The queries not answered from the cache.
+        hits (int | None): The queries answered from the cache.
+        auth (int | None): The authoritative queries answered, when dnsmasq is built with auth support.
+        servers (list[DNSMasqServerStatistics]): The counters of the upstream servers.
+    """
+    cache_size: int | None
+    insertions: int | None
+    evictions: int | None
+    misses: int | None
+    hits: int | None
+    auth: int | None
+    servers: list[DNSMasqServerStatistics]
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """The share of the queries answered from the cache, None before any query."""
+        if not self.hits and not self.misses:
+            return None
+
+        return (self.hits or 0) / ((self.hits or 0) + (self.misses or 0))
+
+
+class DNSMasqStatistics:
+    """
+    Read the DNS cache counters of a running dnsmasq through its CHAOS class TXT `*.bind`
+    queries, the counters dnsmasq logs on SIGUSR1, without signalling or restarting it.
+
+    Every counter is queried over one UDP socket, the queries are sent at once and the
+    answers matched by their DNS ID.
+    """
+
+    COUNTERS = ('cachesize', 'insertions', 'evictions', 'misses', 'hits', 'auth', 'servers')
+
+    TYPE_TXT = 16
+    CLASS_CHAOS = 3
+    FLAG_RESPONSE = 0x8000
+    RCODE_MASK = 0x000F
+    POINTER_MASK = 0xC0
+
+    HEADER = struct.Struct('!HHHHHH')
+    QUESTION = struct.Struct('!HH')
+    RESOURCE_RECORD = struct.Struct('!HHIH')
+
+    def __init__(self, address: str = '127.0.0.1', port: int = DNSMasqGlobalService.DNS_LISTEN_PORT,
+                 timeout: float = 1.0):
+        """
+        Args:
+            address (str): The address dnsmasq answers DNS queries on.
+            port (int): The DNS port of dnsmasq.
+            timeout (float): The seconds to wait for the answers.
+        """
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().DNSMASQ_STATISTICS)
+        self.address = address
+        self.port = port
+        self.timeout = timeout
+
+    @classmethod
+    def build_query(cls, query_id: int, name: str) -> bytes:
+        """
+        Build a CHAOS class TXT query.
+
+        Args:
+            query_id (int): The DNS ID of the query.
+            name (str): The queried name, e.g. `hits.bind`.
+
+        Returns:
+            bytes: The DNS query message.
+        """
+        qname = b''.join(bytes([len(label)]) + label.encode('ascii') for label in name.split('.')) + b'\x00'
+        return cls.HEADER.pack(query_id, 0, 1, 0, 0, 0) + qname + cls.QUESTION.pack(cls.TYPE_TXT, cls.CLASS_CHAOS)
+
+    @classmethod
+    def parse_response(cls, message: bytes) -> tuple[int, list[str]]:
+        """
+        Parse the TXT answers of a DNS response.
+
+        Args:
+            message (bytes): The DNS response message.
+
+        Returns:
+            tuple[int, list[str]]: The DNS ID and the character-strings of the TXT records, empty
+                                   when the query was refused or the name is unknown.
+
+        Raises:
+            ValueError: If the message is not a well-formed DNS response.
+        """
+        try:
+            query_id, flags, questions, answers, _, _ = cls.HEADER.unpack_from(message)
+
+            if not flags & cls.FLAG_RESPONSE:
+                raise ValueError("not a DNS response")
+
+            if flags & cls.RCODE_MASK:
+                return query_id, []
+
+            offset = cls.HEADER.size
+
+            for _ in range(questions):
+                offset = cls._skip_name(message, offset) + cls.QUESTION.size
+
+            records = []
+
+            for _ in range(answers):
+                offset = cls._skip_name(message, offset)
+                record_type, record_class, _, length = cls.RESOURCE_RECORD.unpack_from(message, offset)
+                offset += cls.RESOURCE_RECORD.size
+                data = message[offset:offset + length]
+                offset += length
+
+                if len(data) != length:
+                    raise ValueError("truncated resource record")
+
+                if record_type == cls.TYPE_TXT and record_class == cls.CLASS_CHAOS:
+                    records.extend(cls._txt_strings(data))
+
+            return query_id, records
+
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"malformed DNS response: {e}") from e
+
+    @classmethod
+    def _skip_name(cls, message: bytes, offset: int) -> int:
+        while True:
+            length = message[offset]
+
+            if length & cls.POINTER_MASK == cls.POINTER_MASK:
+                return offset + 2
+
+            offset += length + 1
+
+            if not length:
+                return offset
+
+    @staticmethod
+    def _txt_strings(data: bytes) -> list[str]:
+        strings = []
+        offset = 0
+
+        while offset < len(data):
+            length = data[offset]
+            strings.append(data[offset + 1:offset + 1 + length].decode('ascii', errors='replace'))
+            offset += length + 1
+
+        return strings
+
+    def query(self, names: tuple[str, ...]) -> dict[str, list[str]]:
+        """
+        Send a CHAOS TXT query per name and collect the answers until every query is answered
+        or the timeout expires.
+
+        Returns:
+            dict[str, list[str]]: The TXT character-strings keyed by the answered names.
+
+        Raises:
+            DNSMasqStatisticsError: If the queries can not be sent.
+        """
+        base_id = random.getrandbits(16)
+        pending = {(base_id + index) & 0xFFFF: name for index, name in enumerate(names)}
+        answers = {}
+
+        try:
+            with socket.socket(socket.AF_INET6 if ':' in self.address else socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect((self.address, self.port))
+
+                for query_id, name in pending.items():
+                    sock.send(self.build_query(query_id, name))
+
+                deadline = time.monotonic() + self.timeout
+
+                while pending:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        break
+
+                    sock.settimeout(remaining)
+
+                    try:
+                        query_id, records = self.parse_response(sock.recv(4096))
+                    except TimeoutError:
+                        break
+                    except ValueError as e:
+                        self.log.debug(f"Ignoring DNS response: {e}")
+                        continue
+
+                    if query_id in pending:
+                        answers[pending.pop(query_id)] = records
+
+        except OSError as e:
+            raise DNSMasqStatisticsError(f"Unable to query dnsmasq on {self.address}#{self.port}: {e}") from e
+
+        self.log.debug(f"query() -> answered: {list(answers)}, unanswered: {list(pending.values())}")
+        return answers
+
+    def get_statistics(self) -> DNSMasqCacheStatistics:
+        """
+        Read the DNS cache counters of dnsmasq.
+
+        Returns:
+            DNSMasqCacheStatistics: The counters.
+
+        Raises:
+            DNSMasqStatisticsError: If dnsmasq did not answer.
+        """
+        answers = self.query(tuple(f"{counter}.bind" for counter in self.COUNTERS))
+
+        if not answers:
+            raise DNSMasqStatisticsError(f"dnsmasq did not answer on {self.address}#{self.port}")
+
+        def counter(name: str) -> int | None:
+            records = answers.get(f"{name}.bind")
+            return int(records[0]) if records and records[0].isdigit() else None
+
+        servers = []
+
+        # One character-string per upstream server: `<address>#<port> <queries> <failed>`
+        for record in answers.get('servers.bind', []):
+            fields = record.split()
+
+            if len(fields) >= 3 and fields[1].isdigit() and fields[2].isdigit():
+                servers.append(DNSMasqServerStatistics(fields[0], int(fields[1]), int(fields[2])))
+
+        return DNSMasqCacheStatistics(counter('cachesize'), counter('insertions'), counter('evictions'),
+                                      counter('misses'), counter('hits'), counter('auth'), servers)
@@ -1,11 +1,17 @@
 import logging
 
+from routershell.lib.common.config_change_bus import ConfigChanges
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK, TELNET_SYSV_CONFIG_FILE
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import FilePath, StatusResult
+from routershell.lib.db.system_db import SystemDatabase
 from routershell.lib.network_manager.common.run_commands import RunCommand
 from routershell.lib.network_services.common.network_ports import NetworkPorts
 from routershell.lib.system.init_system import InitSystem, InitSystemChecker
+from routershell.lib.system.system_service_control.system_service_control import (
+    SysServCntrlAction,
+    SystemServiceControl,
+)
 
 
 class TelnetService(RunCommand):
@@ -18,6 +24,9 @@ class TelnetService(RunCommand):
         init_system (InitSystem): The init system in use (SysV or Systemd).
     """
     
+    TELNET_SYSV_SERVICE = 'xinetd'
+    TELNET_SYSTEMD_SERVICE = 'telnet.service'
+
     _instance: 'TelnetService | None' = None
     init_system: InitSystem
     port: int
@@ -81,7 +90,8 @@ class TelnetService(RunCommand):
 
     def update_telnet_config(self) -> StatusResult:
         """
-        Updates the Telnet configuration file with the new port and restarts the service.
+        Updates the Telnet configuration file with the new port, the service is restarted by
+        `apply_server_configuration()`.
 
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
@@ -99,7 +109,7 @@ class TelnetService(RunCommand):
                         else:
                             file.write(line)
                             
-                return self.restart_service()
+                return STATUS_OK
             
             except OSError as e:
                 self.log.error(f"An error occurred while updating the config file: {e}")
@@ -107,28 +117,43 @@ class TelnetService(RunCommand):
             
         return STATUS_OK
 
+    @staticmethod
+    def handle(changes: ConfigChanges) -> StatusResult:
+        """The `ConfigChangeBus` handler of the telnet server."""
+        return TelnetService().apply_server_configuration()
+
+    def apply_server_configuration(self) -> StatusResult:
+        """
+        Apply the telnet server status stored in the DB: an enabled server is moved to its port
+        and restarted once, a disabled server is stopped.
+
+        Returns:
+            StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
+        """
+        status, telnet_server = SystemDatabase().get_telnet_server_status()
+
+        if status:
+            return STATUS_NOK
+
+        self.log.debug(f'apply_server_configuration() -> {telnet_server}')
+
+        if not telnet_server.get('Enable'):
+            return self.stop_service()
+
+        if self.set_port(telnet_server.get('Port') or NetworkPorts.TELNET):
+            self.log.error(f"Unable to update telnet server port: {telnet_server.get('Port')}")
+            return STATUS_NOK
+
+        return self.restart_service()
+
     def start_service(self) -> StatusResult:
         """
-        Starts the Telnet service.
+        Starts the Telnet service and waits until it is ready.
 
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        if self.init_system == InitSystem.SYSV:
-            rtn = self.run(['service', 'xinetd', 'start'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to start telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-            
-        elif self.init_system == InitSystem.SYSTEMD:
-            rtn = self.run(['systemctl', 'start', 'telnet.service'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to start telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-        
-        self.log.debug(f'Telnet-Server-Start message: {rtn.stdout}')
-        
-        return STATUS_OK
+        return self._control_service(SysServCntrlAction.START)
 
     def stop_service(self) -> StatusResult:
         """
@@ -137,65 +162,34 @@ class TelnetService(RunCommand):
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        if self.init_system == InitSystem.SYSV:
-            rtn = self.run(['service', 'xinetd', 'stop'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to stop telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-            
-        elif self.init_system == InitSystem.SYSTEMD:
-            rtn = self.run(['systemctl', 'stop', 'telnet.service'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to stop telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-        
-        self.log.debug(f'Telnet-Server-Stop message: {rtn.stdout}')
-            
-        return STATUS_OK
+        return self._control_service(SysServCntrlAction.STOP)
 
     def restart_service(self) -> StatusResult:
         """
-        Restarts the Telnet service.
+        Restarts the Telnet service and waits until it is ready.
 
         Returns:
             StatusResult: STATUS_OK if the operation was successful, STATUS_NOK otherwise.
         """
-        if self.init_system == InitSystem.SYSV:
-            rtn = self.run(['service', 'xinetd', 'restart'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to restart telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-            
-        elif self.init_system == InitSystem.SYSTEMD:
-            rtn = self.run(['systemctl', 'restart', 'telnet.service'])
-            if rtn.exit_code:
-                self.log.error(f'Unable to restart telnet server service, reason: {rtn.stderr}')
-                return STATUS_NOK
-            
-        self.log.debug(f'Telnet-Server-Restart message: {rtn.stdout}')
-            
-        return STATUS_OK
+        return self._control_service(SysServCntrlAction.RESTART)
 
     def status_service(self) -> StatusResult:
         """
         Checks the status of the Telnet service.
 
         Returns:
-            StatusResult: True if the service status check was successful, False otherwise.
+            StatusResult: STATUS_OK if the service is running, STATUS_NOK otherwise.
         """
-        if self.init_system == InitSystem.SYSV:
-            result = self.run(['service', 'xinetd', 'status'])
-        
-        elif self.init_system == InitSystem.SYSTEMD:
-            result = self.run(['systemctl', 'status', 'telnet.service'])
-            
-        else:
-            self.log.error('Unsupported init system')
-            return STATUS_NOK
+        return self._control_service(SysServCntrlAction.STATUS)
+
+    def _control_service(self, service_action: SysServCntrlAction) -> StatusResult:
+        """
+        Control the telnet server service, xinetd under SysV init, through `SystemServiceControl`.
+        """
+        service_name = self.TELNET_SYSV_SERVICE if self.init_system == InitSystem.SYSV else self.TELNET_SYSTEMD_SERVICE
 
-        if result.exit_code:
-            self.log.error(f'Unable to get status of telnet server service, reason: {result.stderr}')
+        if SystemServiceControl().service_control(service_name, service_action):
+            self.log.error(f'Unable to {service_action.value} telnet server service: {service_name}')
             return STATUS_NOK
 
-        self.log.debug(f'Telnet service status: {result.stdout}')
         return STATUS_OK
@@ -64,7 +64,7 @@ class CopyMode:
             shutil.copy2(config_file, backup_file)
             self.log.debug(f"Backup of startup configuration created: {backup_file}")
         
-        running_config = RouterConfiguration().get_running_configuration()
+        running_config = RouterConfiguration().get_running_configuration(compress_ranges=True)
         
         with open(config_file, 'w') as file:
             file.write('\n'.join(running_config))
@@ -0,0 +1,101 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+from typing import NamedTuple
+
+
+class InotifyEvent(NamedTuple):
+    """
+    A file system event of a watched path.
+
+    Attributes:
+        wd (int): The watch descriptor the event belongs to.
+        mask (int): The IN_* event bits.
+        cookie (int): Pairs the IN_MOVED_FROM and IN_MOVED_TO events of a rename.
+        name (str): The name of the file within a watched directory, empty for the directory itself.
+    """
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+class Inotify:
+    """
+    A non-blocking inotify instance, the kernel queues the events of the watched paths
+    until they are read, so a reader learns whether a file changed without stat'ing or
+    reading it.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self):
+        """
+        Raises:
+            OSError: If inotify is not available.
+        """
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_init1: {os.strerror(error)}")
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """
+        Watch a file or directory.
+
+        Returns:
+            int: The watch descriptor of the path.
+
+        Raises:
+            OSError: If the path can not be watched (e.g. it does not exist).
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_add_watch {path}: {os.strerror(error)}")
+
+        return wd
+
+    def read_events(self) -> list[InotifyEvent]:
+        """
+        Read the queued events without blocking.
+
+        Returns:
+            list[InotifyEvent]: The events in arrival order, empty when none are queued.
+        """
+        events = []
+
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return events
+
+            offset = 0
+
+            while offset < len(data):
+                wd, mask, cookie, length = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset:offset + length].split(b'\0', 1)[0].decode(errors='replace')
+                offset += length
+                events.append(InotifyEvent(wd, mask, cookie, name))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,425 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from routershell.lib.common.constants import SYSV_MESSAGES_LOG_FILE
+from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import FilePath
+from routershell.lib.system.init_system import InitSystemChecker
+
+
+class LogEntry(NamedTuple):
+    """
+    A log entry of the system journal or of a syslog file.
+
+    Attributes:
+        timestamp (str): The time of the entry, syslog formatted.
+        hostname (str | None): The host that logged the entry.
+        identifier (str | None): The syslog identifier of the program that logged the entry.
+        pid (int | None): The process that logged the entry.
+        message (str): The logged message.
+        cursor (str): The position right after the entry in its source.
+    """
+    timestamp: str
+    hostname: str | None
+    identifier: str | None
+    pid: int | None
+    message: str
+    cursor: str
+
+    def __str__(self) -> str:
+        source = f"{self.identifier}[{self.pid}]" if self.pid is not None else self.identifier
+
+        return ' '.join(field for field in (self.timestamp, self.hostname, source and f"{source}:", self.message)
+                        if field)
+
+
+class _LogView:
+    """The recent entries read by a consumer and the position it read up to."""
+
+    def __init__(self, entries: list[LogEntry], depth: int, cursor: str | None):
+        self.entries = deque(entries, maxlen=depth)
+        self.cursor = cursor
+
+
+class LogReader(ABC):
+    """
+    Read the entries of a log source logged by a set of programs, optionally matching a pattern.
+
+    Each consumer (a show command, a monitor) has its own view: the last entries it asked for
+    and a cursor into the source. A view is seeded once with the last entries of the source,
+    later reads only fetch the entries after the cursor.
+    """
+
+    DEFAULT_LAST = 20
+
+    def __init__(self, identifiers: tuple[str, ...] = (), pattern: str | None = None):
+        """
+        Args:
+            identifiers (tuple[str, ...]): The syslog identifiers to read, every entry when empty.
+            pattern (str | None): A regular expression the messages must match.
+        """
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().SYSTEM_LOG_READER)
+
+        self.identifiers = tuple(identifiers)
+        self._identifiers = frozenset(identifiers)
+        self._pattern = re.compile(pattern) if pattern else None
+        self._lock = threading.Lock()
+        self._views: dict[str, _LogView] = {}
+
+    def last(self, consumer: str, count: int = DEFAULT_LAST) -> list[LogEntry]:
+        """
+        Return the last entries of the source, reading only the entries logged since the
+        previous read of the consumer.
+
+        Args:
+            consumer (str): The name of the consumer.
+            count (int): The number of entries.
+
+        Returns:
+            list[LogEntry]: The entries, oldest first.
+        """
+        if count < 1:
+            return []
+
+        with self._lock:
+            view = self._views.get(consumer)
+
+            # A view is only as deep as the deepest read, a deeper one is seeded again
+            if view is None or view.cursor is None or view.entries.maxlen < count:
+                entries, cursor = self._read_last(count)
+                view = self._views[consumer] = _LogView(entries, count, cursor)
+
+            else:
+                entries, view.cursor = self._read_after(view.cursor)
+                view.entries.extend(entries)
+
+            return list(view.entries)[-count:]
+
+    def follow(self, consumer: str, count: int = DEFAULT_LAST, stop: threading.Event | None = None) -> Iterator[LogEntry]:
+        """
+        Yield the last entries of the source, then each new entry as it is logged.
+
+        Args:
+            consumer (str): The name of the consumer.
+            count (int): The number of past entries to yield first.
+            stop (threading.Event | None): Ends the iteration when set, the iteration otherwise
+                runs until the generator is closed.
+        """
+        yield from self.last(consumer, count)
+
+        with self._lock:
+            view = self._views.setdefault(consumer, _LogView([], self.DEFAULT_LAST, None))
+
+        for entry in self._follow(view, stop or threading.Event()):
+            view.entries.append(entry)
+            yield entry
+
+    def forget(self, consumer: str) -> None:
+        """Drop the view of a consumer."""
+        with self._lock:
+            self._views.pop(consumer, None)
+
+    def matches(self, entry: LogEntry) -> bool:
+        """True if the entry was logged by one of the identifiers and matches the pattern."""
+        if self._identifiers and entry.identifier not in self._identifiers:
+            return False
+
+        return not self._pattern or bool(self._pattern.search(entry.message))
+
+    @abstractmethod
+    def _read_last(self, count: int) -> tuple[list[LogEntry], str | None]:
+        """Return the last `count` matching entries and the cursor of the end of the source."""
+
+    @abstractmethod
+    def _read_after(self, cursor: str) -> tuple[list[LogEntry], str]:
+        """Return the matching entries after a cursor and the cursor of the end of the source."""
+
+    @abstractmethod
+    def _follow(self, view: _LogView, stop: threading.Event) -> Iterator[LogEntry]:
+        """Yield the matching entries logged after the view cursor, updating it."""
+
+
+class JournalLogReader(LogReader):
+    """
+    Read the systemd journal through `journalctl -o json`, filtered by syslog identifier by journald.
+
+    A view is seeded reading the journal backwards (`--reverse`) until enough entries matched,
+    then read with `--after-cursor` and followed with `--follow`.
+    """
+
+    def _journalctl(self, *args: str) -> list[str]:
+        command = ['journalctl', '--no-pager', '--output=json', *args]
+
+        for identifier in self.identifiers:
+            command.append(f'--identifier={identifier}')
+
+        return command
+
+    @staticmethod
+    def parse_entry(line: str) -> LogEntry | None:
+        """
+        Parse a `journalctl -o json` line.
+
+        Returns:
+            LogEntry | None: The entry, None if the line is not a journal entry.
+        """
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(record, dict) or '__CURSOR' not in record:
+            return None
+
+        message = record.get('MESSAGE', '')
+
+        # journald stores non UTF-8 messages as an array of bytes
+        if isinstance(message, list):
+            message = bytes(message).decode(errors='replace')
+
+        try:
+            timestamp = time.strftime('%b %d %H:%M:%S', time.localtime(int(record['__REALTIME_TIMESTAMP']) / 1e6))
+        except (KeyError, ValueError):
+            timestamp = ''
+
+        pid = record.get('SYSLOG_PID') or record.get('_PID')
+
+        return LogEntry(timestamp, record.get('_HOSTNAME'), record.get('SYSLOG_IDENTIFIER'),
+                        int(pid) if pid and str(pid).isdigit() else None, message, record['__CURSOR'])
+
+    def _entries(self, command: list[str], stop: threading.Event | None = None) -> Iterator[LogEntry]:
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except OSError as e:
+            self.log.error(f"Unable to read the journal: {e}")
+            return
+
+        watcher = None
+
+        # A follow blocks on the next line, the process is terminated to unblock it
+        if stop:
+            watcher = threading.Thread(target=lambda: stop.wait() or process.terminate(), daemon=True)
+            watcher.start()
+
+        try:
+            for line in process.stdout:
+                entry = self.parse_entry(line)
+
+                if entry:
+                    yield entry
+
+        finally:
+            process.terminate()
+            process.wait()
+
+            if stop and watcher:
+                stop.set()
+
+    def _read_last(self, count: int) -> tuple[list[LogEntry], str | None]:
+        entries = []
+        cursor = None
+
+        for entry in self._entries(self._journalctl('--reverse')):
+            cursor = cursor or entry.cursor
+
+            if self.matches(entry):
+                entries.append(entry)
+
+                if len(entries) == count:
+                    break
+
+        return entries[::-1], cursor
+
+    def _read_after(self, cursor: str) -> tuple[list[LogEntry], str]:
+        entries = []
+
+        for entry in self._entries(self._journalctl(f'--after-cursor={cursor}')):
+            cursor = entry.cursor
+
+            if self.matches(entry):
+                entries.append(entry)
+
+        return entries, cursor
+
+    def _follow(self, view: _LogView, stop: threading.Event) -> Iterator[LogEntry]:
+        start = f'--after-cursor={view.cursor}' if view.cursor else '--lines=0'
+
+        for entry in self._entries(self._journalctl('--follow', start), stop):
+            view.cursor = entry.cursor
+
+            if self.matches(entry):
+                yield entry
+
+
+class SyslogLogReader(LogReader):
+    """
+    Read a syslog file, the cursor of an entry being the inode and the offset of the file after it.
+
+    A view is seeded reading the file backwards from its end until enough entries matched, then
+    only the bytes appended after the cursor are read. A rotated (new inode) or truncated file
+    is read from its start.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+    SYSLOG_LINE = re.compile(r'^(?P<timestamp>\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}|\d{4}-\d{2}-\d{2}T\S+)\s+'
+                             r'(?P<hostname>\S+)\s+'
+                             r'(?:[a-z0-9]+\.[a-z]+\s+)?'
+                             r'(?P<identifier>[^\s\[:]+)(?:\[(?P<pid>\d+)\])?:\s?'
+                             r'(?P<message>.*)$')
+
+    def __init__(self, log_file: FilePath = SYSV_MESSAGES_LOG_FILE, identifiers: tuple[str, ...] = (),
+                 pattern: str | None = None, poll_interval: float = 0.5):
+        super().__init__(identifiers, pattern)
+        self.log_file = str(log_file)
+        self.poll_interval = poll_interval
+
+    @classmethod
+    def parse_line(cls, line: str, cursor: str = '') -> LogEntry:
+        """Parse a syslog line, a line without a syslog header is a message without identifier."""
+        match = cls.SYSLOG_LINE.match(line)
+
+        if not match:
+            return LogEntry('', None, None, None, line, cursor)
+
+        pid = match.group('pid')
+
+        return LogEntry(match.group('timestamp'), match.group('hostname'), match.group('identifier'),
+                        int(pid) if pid else None, match.group('message'), cursor)
+
+    def _read_last(self, count: int) -> tuple[list[LogEntry], str | None]:
+        try:
+            log_file = open(self.log_file, 'rb')
+        except OSError as e:
+            self.log.debug(f"Unable to read {self.log_file}: {e}")
+            return [], None
+
+        with log_file:
+            stat = os.fstat(log_file.fileno())
+            end = self._complete_end(log_file, stat.st_size)
+            entries: list[LogEntry] = []
+            buffer = b''
+            position = line_end = end
+
+            while position > 0 and len(entries) < count:
+                size = min(self.BLOCK_SIZE, position)
+                position -= size
+                log_file.seek(position)
+                buffer = log_file.read(size) + buffer
+
+                # The first line of a block may start before the block, it is completed by the next read
+                if position > 0:
+                    cut = buffer.find(b'\n') + 1
+
+                    if not cut:
+                        continue
+
+                    buffer, complete = buffer[:cut], buffer[cut:]
+                else:
+                    buffer, complete = b'', buffer
+
+                for line in reversed(complete.split(b'\n')[:-1]):
+                    entry = self._parse(line, stat.st_ino, line_end)
+                    line_end -= len(line) + 1
+
+                    if entry and self.matches(entry):
+                        entries.append(entry)
+
+                        if len(entries) == count:
+                            break
+
+            return entries[::-1], f"{stat.st_ino}:{end}"
+
+    def _read_after(self, cursor: str) -> tuple[list[LogEntry], str]:
+        inode, offset = (int(value) for value in cursor.split(':'))
+
+        try:
+            log_file = open(self.log_file, 'rb')
+        except OSError:
+            return [], cursor
+
+        with log_file:
+            stat = os.fstat(log_file.fileno())
+
+            if stat.st_ino != inode or stat.st_size < offset:
+                self.log.debug(f"{self.log_file} was rotated, reading it from its start")
+                offset = 0
+
+            log_file.seek(offset)
+            data = log_file.read()
+
+        complete = data.rfind(b'\n') + 1
+        entries = []
+
+        for line in data[:complete].split(b'\n')[:-1]:
+            offset += len(line) + 1
+            entry = self._parse(line, stat.st_ino, offset)
+
+            if entry and self.matches(entry):
+                entries.append(entry)
+
+        return entries, f"{stat.st_ino}:{offset}"
+
+    def _follow(self, view: _LogView, stop: threading.Event) -> Iterator[LogEntry]:
+        while not stop.is_set():
+            if view.cursor is None:
+                _, view.cursor = self._read_last(0)
+                entries = []
+            else:
+                entries, view.cursor = self._read_after(view.cursor)
+
+            yield from entries
+
+            if not entries:
+                stop.wait(self.poll_interval)
+
+    def _complete_end(self, log_file, size: int) -> int:
+        # An unterminated last line is still being written, it is read once complete
+        start = max(0, size - self.BLOCK_SIZE)
+        log_file.seek(start)
+
+        return start + log_file.read(size - start).rfind(b'\n') + 1
+
+    def _parse(self, line: bytes, inode: int, offset: int) -> LogEntry | None:
+        text = line.decode(errors='replace').rstrip('\r')
+        return self.parse_line(text, f"{inode}:{offset}") if text.strip() else None
+
+
+class SystemLogs(metaclass=Singleton):
+    """
+    The log readers of the system, one per log source name, so the views of their consumers
+    outlive the objects reading them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._readers: dict[str, LogReader] = {}
+
+    def reader(self, source: str, identifiers: tuple[str, ...] = (), pattern: str | None = None) -> LogReader:
+        """
+        Return the reader of a log source, the systemd journal when available, the syslog messages file otherwise.
+
+        Args:
+            source (str): The name of the log source.
+            identifiers (tuple[str, ...]): The syslog identifiers of the source.
+            pattern (str | None): A regular expression the messages of the source must match.
+        """
+        with self._lock:
+            if source not in self._readers:
+                if InitSystemChecker().is_systemd() and shutil.which('journalctl'):
+                    self._readers[source] = JournalLogReader(identifiers, pattern)
+                else:
+                    self._readers[source] = SyslogLogReader(SYSV_MESSAGES_LOG_FILE, identifiers, pattern)
+
+            return self._readers[source]
@@ -1,5 +1,6 @@
 import logging
 
+from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChangeTopic
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
 from routershell.lib.common.types import HostnameText, StatusResult
@@ -16,6 +17,9 @@ class System:
         """
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().SYSTEM)
+
+        # The telnet server status stored in the DB is applied once per batch
+        ConfigChangeBus().subscribe([ConfigChangeTopic.TELNET_SERVER], TelnetService.handle)
     
     def update_hostname(self, hostname: HostnameText) -> StatusResult:
         """
@@ -49,21 +53,8 @@ class System:
             StatusResult: STATUS_OK if the operation is successful, STATUS_NOK otherwise.
         """
         self.log.debug(f'update_telnet_server() - enable: {enable} -> port: {port}')
-        
-        if enable:
-            if TelnetService().set_port(port):
-                self.log.error(f'Unable to update telnet server port: {port} to OS')
-                return STATUS_NOK
-            
-            if TelnetService().restart_service():
-                self.log.error(f'Unable to restart telnet server on port: {port}')
-                return STATUS_NOK
-            
-        else:
-            if TelnetService().stop_service():
-                self.log.error('Unable to stop telnet server')
-                return STATUS_NOK                
 
+        # TelnetService restarts or stops the server from the published change
         if SystemDatabase().set_telnet_server_status(enable, port):
             self.log.error(f'Unable to add telnet server status: enable: {enable} and port: {port} to DB')
             return STATUS_NOK
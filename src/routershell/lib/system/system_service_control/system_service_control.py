@@ -1,10 +1,19 @@
+import asyncio
 import enum
 import logging
+import os
+import threading
+import time
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NamedTuple
 
 from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
 from routershell.lib.common.router_shell_log_control import RouterShellLoggerSettings as RSLS
-from routershell.lib.common.types import ServiceName, StatusResult
-from routershell.lib.network_manager.common.run_commands import RunCommand
+from routershell.lib.common.singleton import Singleton
+from routershell.lib.common.types import PredicateResult, ServiceName, StatusResult
+from routershell.lib.network_manager.common.run_commands import RunCommand, RunResult
 from routershell.lib.system.init_system import InitSystem, InitSystemChecker
 
 
@@ -17,46 +26,253 @@ class SysServCntrlAction(enum.Enum):
     STOP = 'stop'
     STATUS = 'status'
 
-class SystemServiceControl(RunCommand):
-    
+class ServiceState(enum.Enum):
+    """
+    The state of a service controlled by RouterShell.
+
+    - `STARTING`: The action was issued and the service is not ready yet.
+    - `ACTIVE`: The service is ready.
+    - `STOPPED`: The service was stopped.
+    - `FAILED`: The action failed or the service was not ready within the readiness timeout.
+    """
+    STARTING = 'Starting'
+    ACTIVE = 'Active'
+    STOPPED = 'Stopped'
+    FAILED = 'Failed'
+
+class ServiceControlStatus(NamedTuple):
+    """
+    The last action on a service for `show services`.
+
+    Attributes:
+        service_name (ServiceName): The service.
+        action (SysServCntrlAction): The last action issued.
+        state (ServiceState): The state of the service after the action.
+        main_pid (int | None): The main process of a ready service, when the init system reports it.
+        issued (float): The epoch time the action was issued.
+        latency (float | None): The seconds from the action to the readiness of the service.
+    """
+    service_name: ServiceName
+    action: SysServCntrlAction
+    state: ServiceState
+    main_pid: int | None
+    issued: float
+    latency: float | None
+
+class AsyncServiceControl(RunCommand, metaclass=Singleton):
+    """
+    Start, restart and stop the daemons (dnsmasq, hostapd, telnet) concurrently with asyncio and
+    wait for their readiness, so the start latency of a daemon is the slowest one instead of
+    the sum of all.
+
+    A service is ready once `systemctl show` reports it `active`, under SysV once its pidfile
+    names a running process or `service <name> status` succeeds.
+
+    Within a `batch()`, e.g. the startup configuration replay, the actions are deferred and the
+    daemons are controlled concurrently at the end of the outermost batch.
+    """
+
+    READY_TIMEOUT = 10.0
+    READY_POLL_INTERVAL = 0.05
+    PID_FILE_DIRS = ['/run', '/var/run']
+
     def __init__(self):
         super().__init__()
         self.log = logging.getLogger(self.__class__.__name__)
         self.log.setLevel(RSLS().SYSTEM_SERVICE_CTRL)
-        
+
         self.init_system = InitSystemChecker().get_init_system()
 
-    def service_control(self, service_name: ServiceName, service_action: SysServCntrlAction) -> StatusResult:
+        self._lock = threading.Lock()
+        self._status: dict[ServiceName, ServiceControlStatus] = {}
+        self._deferred: dict[ServiceName, SysServCntrlAction] = {}
+        self._batch_depth = 0
+
+    def control(self, actions: dict[ServiceName, SysServCntrlAction]) -> StatusResult:
         """
-        Controls a system service using the appropriate init system.
+        Control several services concurrently and wait until each one is ready.
 
         Args:
-            service_name (str): The name of the service to control.
-            service_action (SysServCntrlAction): The action to perform on the service.
+            actions (dict[ServiceName, SysServCntrlAction]): The action per service.
 
         Returns:
-            StatusResult: STATUS_OK if the command succeeds, STATUS_NOK otherwise.
+            StatusResult: STATUS_OK if every action succeeded, STATUS_NOK otherwise.
         """
-        if not service_name:
-            self.log.error('Service name is not defined')
-            return STATUS_NOK
-        
-        command = self._init_system_control(service_name, service_action)
+        if self._batch_depth:
+            for service_name, action in actions.items():
+                deferred = self._deferred.get(service_name)
+
+                # A start does not undo a pending restart of the new configuration
+                if not (deferred == SysServCntrlAction.RESTART and action == SysServCntrlAction.START):
+                    self._deferred[service_name] = action
+
+            self.log.debug(f"control() -> deferred: {', '.join(f'{n}: {a.value}' for n, a in actions.items())}")
+            return STATUS_OK
+
+        if not actions:
+            return STATUS_OK
+
+        return self._run_coroutine(self._control_all(actions))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer the service actions issued within the block, the services are controlled
+        concurrently at the end of the outermost batch.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield
+
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                actions, self._deferred = self._deferred, {}
+
+                if self.control(actions):
+                    self.log.error(f"Unable to control services: {', '.join(actions)}")
+
+    def get_status(self) -> list[ServiceControlStatus]:
+        """
+        Returns:
+            list[ServiceControlStatus]: The last action on every controlled service, ordered by service.
+        """
+        with self._lock:
+            return [status for _, status in sorted(self._status.items())]
+
+    def _run_coroutine(self, coroutine: Coroutine) -> StatusResult:
+        try:
+            asyncio.get_running_loop()
+
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Called back by the CLI event loop, e.g. a ConfigChangeBus poll, the loop can not be re-entered
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def _control_all(self, actions: dict[ServiceName, SysServCntrlAction]) -> StatusResult:
+        results = await asyncio.gather(*(self._control_service(service_name, action)
+                                         for service_name, action in actions.items()))
+        return STATUS_NOK if any(results) else STATUS_OK
+
+    async def _control_service(self, service_name: ServiceName, service_action: SysServCntrlAction) -> StatusResult:
+        command = self._control_command(service_name, service_action)
 
         if not command:
-            self.log.error('Service control command is not defined')
             return STATUS_NOK
-        
-        result = self.run(command)
-        
+
+        issued, started = time.time(), time.monotonic()
+        self._set_status(service_name, service_action, ServiceState.STARTING, None, issued, None)
+
+        result = await self._exec(command)
+
         if result.exit_code:
             self.log.error(f"Failed to {service_action.value} service {service_name}. Exit code: {result.exit_code}")
+            self._set_status(service_name, service_action, ServiceState.FAILED, None, issued, None)
+            return STATUS_NOK
+
+        if service_action == SysServCntrlAction.STOP:
+            self._set_status(service_name, service_action, ServiceState.STOPPED, None, issued,
+                             time.monotonic() - started)
+            return STATUS_OK
+
+        state, main_pid = await self._wait_ready(service_name)
+        latency = time.monotonic() - started
+        self._set_status(service_name, service_action, state, main_pid, issued, latency)
+
+        if state != ServiceState.ACTIVE:
+            self.log.error(f"Service {service_name} not ready {latency:.3f}s after {service_action.value}")
             return STATUS_NOK
 
-        self.log.debug(f"Service {service_name} {service_action.value}ed successfully.")
+        self.log.debug(f"Service {service_name} {service_action.value} ready in {latency:.3f}s")
         return STATUS_OK
 
-    def _init_system_control(self, service_name: ServiceName, service_action: SysServCntrlAction) -> list[str]:
+    async def _wait_ready(self, service_name: ServiceName) -> tuple[ServiceState, int | None]:
+        deadline = time.monotonic() + self.READY_TIMEOUT
+
+        while True:
+            state, main_pid = await self._probe(service_name)
+
+            if state != ServiceState.STARTING or time.monotonic() >= deadline:
+                return (ServiceState.FAILED if state == ServiceState.STARTING else state), main_pid
+
+            await asyncio.sleep(self.READY_POLL_INTERVAL)
+
+    async def _probe(self, service_name: ServiceName) -> tuple[ServiceState, int | None]:
+        """
+        Returns:
+            tuple[ServiceState, int | None]: STARTING until the service is ready or failed, and its main process.
+        """
+        if self.init_system == InitSystem.SYSTEMD:
+            result = await self._exec(['systemctl', 'show', '-p', 'ActiveState', '-p', 'MainPID', service_name])
+            properties = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+            main_pid = int(properties.get('MainPID') or 0) or None
+            active_state = properties.get('ActiveState')
+
+            if active_state == 'active':
+                return ServiceState.ACTIVE, main_pid
+
+            if active_state in ('failed', 'inactive'):
+                return ServiceState.FAILED, None
+
+            return ServiceState.STARTING, None
+
+        main_pid = self._read_pid_file(service_name)
+
+        if main_pid:
+            return ServiceState.ACTIVE, main_pid
+
+        result = await self._exec(['service', service_name, 'status'])
+        return (ServiceState.STARTING if result.exit_code else ServiceState.ACTIVE), None
+
+    def _read_pid_file(self, service_name: ServiceName) -> int | None:
+        for pid_file_dir in self.PID_FILE_DIRS:
+            try:
+                with open(os.path.join(pid_file_dir, f'{service_name}.pid')) as file:
+                    pid = int(file.read().split()[0])
+
+            except (OSError, ValueError, IndexError):
+                continue
+
+            if os.path.exists(f'/proc/{pid}'):
+                return pid
+
+        return None
+
+    async def _exec(self, command: list[str]) -> RunResult:
+        """
+        Run a command with sudo without blocking the event loop, as `RunCommand.run()` does.
+        """
+        command = ['sudo'] + command
+        cmd_str = ' '.join(command)
+
+        try:
+            process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE,
+                                                           stderr=asyncio.subprocess.PIPE)
+            stdout, stderr = await process.communicate()
+
+        except OSError as e:
+            self.log.error(f"Command failed: {e}: {cmd_str}")
+            RunCommand.run_cmds_failed.append(cmd_str)
+            return RunResult('', str(e), 1, command)
+
+        self.log.debug(f"_exec({process.returncode}) -> cmd -> {cmd_str}")
+        self.log_command(cmd_str)
+
+        if process.returncode:
+            RunCommand.run_cmds_failed.append(cmd_str)
+
+        return RunResult(stdout.decode('utf-8'), stderr.decode('utf-8'), process.returncode, command)
+
+    def _set_status(self, service_name: ServiceName, action: SysServCntrlAction, state: ServiceState,
+                    main_pid: int | None, issued: float, latency: float | None) -> None:
+        with self._lock:
+            self._status[service_name] = ServiceControlStatus(service_name, action, state, main_pid, issued, latency)
+
+    def _control_command(self, service_name: ServiceName, service_action: SysServCntrlAction) -> list[str]:
         """
         Constructs the appropriate command for the current init system.
 
@@ -73,4 +289,77 @@ class SystemServiceControl(RunCommand):
             return ['systemctl', service_action.value, service_name]
         else:
             self.log.error(f"Unsupported init system: {self.init_system}")
-            return []
\ No newline at end of file
+            return []
+
+class SystemServiceControl(RunCommand):
+    
+    def __init__(self):
+        super().__init__()
+        self.log = logging.getLogger(self.__class__.__name__)
+        self.log.setLevel(RSLS().SYSTEM_SERVICE_CTRL)
+        
+        self.init_system = InitSystemChecker().get_init_system()
+
+    def service_control(self, service_name: ServiceName, service_action: SysServCntrlAction) -> StatusResult:
+        """
+        Controls a system service using the appropriate init system and waits until it is ready,
+        see `AsyncServiceControl` to control several services concurrently.
+
+        Args:
+            service_name (str): The name of the service to control.
+            service_action (SysServCntrlAction): The action to perform on the service.
+
+        Returns:
+            StatusResult: STATUS_OK if the command succeeds, STATUS_NOK otherwise.
+        """
+        if not service_name:
+            self.log.error('Service name is not defined')
+            return STATUS_NOK
+        
+        if service_action == SysServCntrlAction.STATUS:
+            return STATUS_OK if self.is_active(service_name) else STATUS_NOK
+
+        return AsyncServiceControl().control({service_name: service_action})
+
+    def is_active(self, service_name: ServiceName) -> PredicateResult:
+        """
+        Checks whether a system service is running, with `systemctl is-active` rather than
+        parsing the output of `systemctl status`.
+
+        Args:
+            service_name (str): The name of the service to check.
+
+        Returns:
+            PredicateResult: True if the service is running, False otherwise.
+        """
+        if self.init_system == InitSystem.SYSTEMD:
+            command = ['systemctl', 'is-active', '--quiet', service_name]
+        else:
+            command = ['service', service_name, 'status']
+
+        return not self.run(command, suppress_error=True).exit_code
+
+    def signal_service(self, service_name: ServiceName, signal_name: str) -> StatusResult:
+        """
+        Send a signal to the main process of a system service (e.g. HUP to reload its configuration).
+
+        Args:
+            service_name (str): The name of the service to signal.
+            signal_name (str): The signal name without the SIG prefix.
+
+        Returns:
+            StatusResult: STATUS_OK if the signal was sent, STATUS_NOK otherwise.
+        """
+        if self.init_system == InitSystem.SYSTEMD:
+            command = ['systemctl', 'kill', f'--signal={signal_name}', '--kill-whom=main', service_name]
+        else:
+            command = ['pkill', f'-{signal_name}', '-x', service_name]
+
+        result = self.run(command, suppress_error=True)
+
+        if result.exit_code:
+            self.log.error(f"Failed to send SIG{signal_name} to service {service_name}. Exit code: {result.exit_code}")
+            return STATUS_NOK
+
+        self.log.debug(f"Service {service_name} sent SIG{signal_name}")
+        return STATUS_OK
@@ -29,6 +29,9 @@ class SystemStartUp(Interface):
         SystemCall().seed_hostname_db_from_os()
             
         self.set_os_rename_interface()
+
+        # Loopbacks of earlier releases are labels on lo, move them to their dummy interfaces
+        self.migrate_os_lo_labels()
         
         self.log.debug('Loading........')
         CopyStartRun().read_start_config()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_parse_rule_normalizes_addresses_and_ports() -> None:
+    from routershell.lib.network_manager.network_operations.access_control_list import (
+        AccessControlList,
+        AccessControlListError,
+    )
+
+    rule = AccessControlList.parse_rule(10, "permit tcp any host 10.0.0.5 eq 22".split())
+
+    assert rule.source is None
+    assert rule.destination == "10.0.0.5/32"
+    assert rule.destination_port == 22
+    assert rule.cli() == "permit tcp any host 10.0.0.5 eq 22"
+
+    with pytest.raises(AccessControlListError):
+        AccessControlList.parse_rule(20, "deny icmp any eq 7 any".split())
+
+
+def test_ruleset_folds_same_action_runs_into_sets() -> None:
+    from routershell.lib.network_manager.network_operations.access_control_list import AccessControlList
+    from routershell.lib.network_manager.network_operations.acl_ruleset import AclBinding, AclDirection, AclRuleset
+
+    rules = [
+        AccessControlList.parse_rule(10, "permit tcp any host 10.0.0.5 eq 22".split()),
+        AccessControlList.parse_rule(20, "permit tcp any host 10.0.0.6 eq 443".split()),
+        AccessControlList.parse_rule(30, "deny ip 192.168.0.0/16 any".split()),
+        AccessControlList.parse_rule(40, "permit ip any any".split()),
+    ]
+
+    ruleset = AclRuleset.compile({"WEB": rules}, [AclBinding("WEB", "eth0", AclDirection.IN)])
+
+    assert "elements = { 10.0.0.5/32 . tcp . 22, 10.0.0.6/32 . tcp . 443 }" in ruleset
+    assert "ip daddr . meta l4proto . th dport @acl_0_set_0 return" in ruleset
+    assert "ip saddr 192.168.0.0/16 drop" in ruleset
+    assert ruleset.index("@acl_0_set_0 return") < ruleset.index("192.168.0.0/16 drop") < ruleset.index(
+        "meta nfproto ipv4 return")
+    assert 'iifname vmap { "eth0" : jump acl_0 }' in ruleset
+
+    # The IPv4 access-list, its port matches and its implicit deny leave IPv6 alone
+    chain = [line.strip() for line in ruleset[ruleset.index("chain acl_0 {"):].split("}")[0].splitlines()]
+    assert chain[1] == "meta nfproto != ipv4 return"
+    assert chain[-2] == "meta nfproto ipv4 drop"
+
+
+def test_acl_rules_round_trip_through_running_config(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.acl_db import AccessControlListDB
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.network_operations.access_control_list import AccessControlList
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    AccessControlListDB.rsdb = RouterShellDB()
+    RouterConfigurationDatabase.rsdb = AccessControlListDB.rsdb
+
+    acl = AccessControlList()
+
+    assert acl.update_acl("WEB") == STATUS_OK
+    assert acl.add_acl_rule("WEB", "permit tcp any host 10.0.0.5 eq 22".split()) == STATUS_OK
+    assert acl.add_acl_rule("WEB", "deny ip any any".split()) == STATUS_OK
+    assert acl.delete_acl_rule("WEB", "deny ip any any".split()) == STATUS_OK
+
+    assert [rule.sequence for rule in acl.get_acls()["WEB"]] == [10]
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+
+    assert RouterConfiguration()._get_access_control_list() == [
+        "ip access-list WEB",
+        " permit tcp any host 10.0.0.5 eq 22",
+        "end",
+        "",
+    ]
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_fdb_dump_request_and_entry_decoding() -> None:
+    from routershell.lib.network_manager.common.bridge_fdb import BridgeFdb, FdbFilter
+
+    request = BridgeFdb.build_request(5, bridge_index=7, port_index=3)
+    [(message_type, payload)] = list(BridgeFdb.iter_messages(request))
+
+    assert message_type == BridgeFdb.RTM_GETNEIGH
+    assert BridgeFdb._NDMSG.unpack_from(payload)[:4] == (socket.AF_BRIDGE, 0, 0, 3)
+    assert struct.unpack("=I", BridgeFdb._attributes(payload, BridgeFdb._NDMSG.size)[BridgeFdb.NDA_MASTER]) == (7,)
+
+    names = {3: "Gig1", 7: "br0"}
+
+    def neighbour(state: int, master: bool = True) -> bytes:
+        return (BridgeFdb._NDMSG.pack(socket.AF_BRIDGE, 0, 0, 3, state, 0, 0) +
+                BridgeFdb._attribute(BridgeFdb.NDA_LLADDR, bytes.fromhex("02000000000a")) +
+                BridgeFdb._attribute(BridgeFdb.NDA_VLAN, struct.pack("=H", 10)) +
+                BridgeFdb._attribute(BridgeFdb.NDA_CACHEINFO, struct.pack("=IIII", 0, 0, 4250, 0)) +
+                (BridgeFdb._attribute(BridgeFdb.NDA_MASTER, struct.pack("=I", 7)) if master else b""))
+
+    dynamic = BridgeFdb.parse_entry(neighbour(0x02), names)
+
+    assert dynamic == ("02:00:00:00:00:0a", 10, "Gig1", "br0", "dynamic", 42)
+    assert BridgeFdb.parse_entry(neighbour(BridgeFdb.NUD_NOARP), names).entry_type == "static"
+    assert BridgeFdb.parse_entry(neighbour(BridgeFdb.NUD_PERMANENT), names)[4:] == ("self", 0)
+    assert BridgeFdb.parse_entry(neighbour(BridgeFdb.NUD_PERMANENT, master=False), names) is None
+
+    assert FdbFilter(vlan_id=10, mac_address="02:00:00:00:00:0A").matches(dynamic)
+    assert not FdbFilter(bridge_name="br1").matches(dynamic)
+    assert not FdbFilter(entry_type="static").matches(dynamic)
+
+
+def test_static_entries_and_show_filter() -> None:
+    from routershell.lib.cli.show.bridge_show import BridgeShow
+    from routershell.lib.network_manager.common.bridge_fdb import FdbFilter
+    from routershell.lib.network_manager.network_operations.mac_address_table import (
+        MacAddressTableBatch,
+        StaticMacAddress,
+    )
+
+    entries = [StaticMacAddress("02:00:00:00:00:01", "Gig1"), StaticMacAddress("02:00:00:00:00:02", "Gig2", 20)]
+
+    assert MacAddressTableBatch.static_entries(entries) == [
+        "fdb replace 02:00:00:00:00:01 dev Gig1 master static",
+        "fdb replace 02:00:00:00:00:02 dev Gig2 master static vlan 20",
+    ]
+    assert MacAddressTableBatch.static_entries(entries[1:], remove=True) == [
+        "fdb del 02:00:00:00:00:02 dev Gig2 master vlan 20",
+    ]
+    assert MacAddressTableBatch.learning(["Gig1"], enable=False) == ["link set dev Gig1 learning off"]
+    assert MacAddressTableBatch.ageing_time(300) == "30000"
+
+    assert BridgeShow.parse_mac_address_table_filter(
+        ["bridge", "br0", "vlan", "10", "address", "0200.0000.0001", "static", "count"]) == (
+        FdbFilter("br0", None, 10, "02:00:00:00:00:01", "static"), True)
+    assert BridgeShow.parse_mac_address_table_filter([]) == (FdbFilter(), False)
+
+
+def test_mac_address_table_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.bridge_db import BridgeDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    BridgeDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    bridge_db = BridgeDatabase()
+
+    assert bridge_db.add_bridge_db("br0") == STATUS_OK
+    assert bridge_db.get_mac_address_table_db("br0") == {
+        "AgingTime": 300, "MacLearning": True, "StaticMacAddresses": []}
+    assert "mac address-table" not in "\n".join(RouterConfiguration()._get_global_bridge_config())
+
+    assert bridge_db.update_bridge_db("br0", aging_time=60, mac_learning=False) == STATUS_OK
+    assert bridge_db.add_static_mac_address_db("br0", "02:00:00:00:00:02", "Gig2", 20) == STATUS_OK
+    assert bridge_db.add_static_mac_address_db("br0", "02:00:00:00:00:01", "Gig3") == STATUS_OK
+    assert bridge_db.add_static_mac_address_db("br0", "02:00:00:00:00:01", "Gig1") == STATUS_OK
+    assert bridge_db.add_static_mac_address_db("br9", "02:00:00:00:00:01", "Gig1") == STATUS_NOK
+
+    config = RouterConfiguration()._get_global_bridge_config()
+
+    assert [line for line in config if "mac address-table" in line] == [
+        " mac address-table aging-time 60",
+        " no mac address-table learning",
+        " mac address-table static 02:00:00:00:00:01 interface Gig1",
+        " mac address-table static 02:00:00:00:00:02 interface Gig2 vlan 20",
+    ]
+
+    assert bridge_db.del_static_mac_address_db("br0", "02:00:00:00:00:02") is None
+    assert bridge_db.del_static_mac_address_db("br0", "02:00:00:00:00:02", 20) == "Gig2"
+    assert len(bridge_db.get_mac_address_table_db("br0")["StaticMacAddresses"]) == 1
+
+
+def test_static_entry_is_kept_in_the_db_when_the_os_delete_fails(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.bridge_db import BridgeDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.network_operations.bridge import Bridge
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    BridgeDatabase.rsdb = RouterShellDB()
+
+    bridge = Bridge()
+    batches: list[list[str]] = []
+    batch_status = [STATUS_NOK]
+
+    monkeypatch.setattr(bridge, "_get_linked_interfaces", lambda bridge_name: ["Gig1"])
+    monkeypatch.setattr(bridge, "_run_bridge_batch", lambda lines: batches.append(lines) or batch_status[0])
+
+    assert bridge.add_bridge_db("br0") == STATUS_OK
+    assert bridge.add_static_mac_address_db("br0", "02:00:00:00:00:01", "Gig1", 10) == STATUS_OK
+
+    assert bridge.del_static_mac_address("br0", "02:00:00:00:00:01", 10) == STATUS_NOK
+    assert len(bridge.get_mac_address_table_db("br0")["StaticMacAddresses"]) == 1
+
+    batch_status[0] = STATUS_OK
+
+    assert bridge.del_static_mac_address("br0", "02:00:00:00:00:01", 10) == STATUS_OK
+    assert bridge.get_mac_address_table_db("br0")["StaticMacAddresses"] == []
+    assert batches[-1] == ["fdb del 02:00:00:00:00:01 dev Gig1 master vlan 10"]
+    assert bridge.del_static_mac_address("br0", "02:00:00:00:00:01", 10) == STATUS_NOK
+
+
+class _OverrunSocket(socket.socket):
+    """A datagram socket whose receive buffer overflows, as a dump of a large table can."""
+
+    def send(self, data: bytes, flags: int = 0) -> int:
+        return len(data)
+
+    def recv(self, bufsize: int, flags: int = 0) -> bytes:
+        import errno
+
+        raise OSError(errno.ENOBUFS, "No buffer space available")
+
+
+def test_socket_errors_are_reported_as_bridge_fdb_errors(monkeypatch) -> None:
+    import errno
+
+    import pytest
+
+    from routershell.lib.network_manager.common.bridge_fdb import BridgeFdb, BridgeFdbError
+
+    monkeypatch.setattr(BridgeFdb, "_open_socket", lambda self: _OverrunSocket(socket.AF_INET, socket.SOCK_DGRAM))
+
+    with pytest.raises(BridgeFdbError) as error:
+        list(BridgeFdb().dump())
+
+    assert error.value.error_code == errno.ENOBUFS
+    assert str(error.value).startswith("BridgeFdbError: unable to read rtnetlink socket")
+
+
+def test_mac_address_table_dump_in_a_network_namespace() -> None:
+    import pytest
+
+    if os.geteuid() != 0 or shutil.which("ip") is None or shutil.which("bridge") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    from routershell.lib.network_manager.network_operations.mac_address_table import (
+        MacAddressTableBatch,
+        StaticMacAddress,
+    )
+
+    netns = f"rs-fdb-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    script = (
+        "from routershell.lib.network_manager.common.bridge_fdb import BridgeFdb, FdbFilter\n"
+        "for entry in BridgeFdb().dump(FdbFilter(bridge_name='br1', entry_type='static')):\n"
+        "    print(entry.mac_address, entry.interface_name, entry.bridge_name)\n"
+    )
+
+    try:
+        for bridge, port in (("br0", "v0"), ("br1", "v2")):
+            assert subprocess.run(["ip", "-n", netns, "link", "add", bridge, "type", "bridge"]).returncode == 0
+            assert subprocess.run(["ip", "-n", netns, "link", "add", port, "type", "veth", "peer", "name", port + "p"]).returncode == 0
+            assert subprocess.run(["ip", "-n", netns, "link", "set", port, "master", bridge]).returncode == 0
+
+        lines = MacAddressTableBatch.static_entries([StaticMacAddress("02:00:00:00:00:01", "v0"),
+                                                     StaticMacAddress("02:00:00:00:00:02", "v2"),
+                                                     StaticMacAddress("02:00:00:00:00:03", "v2")])
+        lines += MacAddressTableBatch.learning(["v2"], enable=False)
+
+        assert subprocess.run(["ip", "netns", "exec", netns, "bridge", "-batch", "-"],
+                              input="\n".join(lines) + "\n", text=True).returncode == 0
+
+        result = subprocess.run(["ip", "netns", "exec", netns, sys.executable, "-c", script],
+                                capture_output=True, text=True, env={**os.environ, "PYTHONPATH": "src"})
+
+        assert result.returncode == 0, result.stderr
+        assert sorted(result.stdout.splitlines()) == ["02:00:00:00:00:02 v2 br1", "02:00:00:00:00:03 v2 br1"]
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import uuid
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_router_ports_and_mdb_decoding() -> None:
+    from routershell.lib.network_manager.network_operations.bridge_multicast import BridgeMulticast, MdbEntry
+
+    assert BridgeMulticast.router_ports(["Gig1"], enable=True) == ["link set dev Gig1 mcast_router 2"]
+    assert BridgeMulticast.router_ports(["Gig1"], enable=False) == ["link set dev Gig1 mcast_router 1"]
+
+    output = json.dumps([{
+        "mdb": [
+            {"index": 2, "dev": "br0", "port": "Gig1", "grp": "239.1.1.1", "state": "temp", "flags": [], "timer": " 259.99"},
+            {"index": 2, "dev": "br0", "port": "Gig2", "grp": "239.1.1.2", "state": "permanent", "vid": 10, "flags": []},
+        ],
+        "router": {"br0": [{"port": "Gig3"}]},
+    }])
+
+    assert BridgeMulticast.parse_mdb(output) == (
+        [MdbEntry("br0", "239.1.1.1", "Gig1", None, "temp", "259.99"),
+         MdbEntry("br0", "239.1.1.2", "Gig2", 10, "permanent")],
+        {"br0": ["Gig3"]})
+    assert BridgeMulticast.parse_mdb("") == ([], {})
+
+
+def test_multicast_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.bridge_db import BridgeDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    BridgeDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    bridge_db = BridgeDatabase()
+
+    assert bridge_db.add_bridge_db("br0") == STATUS_OK
+    assert bridge_db.add_bridge_db("br1") == STATUS_OK
+    assert bridge_db.get_multicast_db("br0") == {
+        "McastSnooping": True, "McastQuerier": False, "NetfilterBypass": False, "RouterPorts": []}
+    assert bridge_db.get_netfilter_bypass_bridges_db() == []
+
+    assert bridge_db.update_bridge_db("br0", multicast_snooping=False, multicast_querier=True) == STATUS_OK
+    assert bridge_db.update_bridge_db("br1", netfilter_bypass=True) == STATUS_OK
+    assert bridge_db.add_multicast_router_port_db("br0", "Gig2") == STATUS_OK
+    assert bridge_db.add_multicast_router_port_db("br0", "Gig1") == STATUS_OK
+    assert bridge_db.add_multicast_router_port_db("br0", "Gig1") == STATUS_OK
+    assert bridge_db.add_multicast_router_port_db("br9", "Gig1") == STATUS_NOK
+
+    assert bridge_db.get_netfilter_bypass_bridges_db() == ["br1"]
+
+    config = RouterConfiguration()._get_global_bridge_config()
+
+    assert [line for line in config if "multicast" in line or "netfilter" in line] == [
+        " no multicast snooping",
+        " multicast querier",
+        " multicast router-port Gig1",
+        " multicast router-port Gig2",
+        " netfilter bypass",
+    ]
+
+    assert bridge_db.del_multicast_router_port_db("br0", "Gig3") == STATUS_NOK
+    assert bridge_db.del_multicast_router_port_db("br0", "Gig2") == STATUS_OK
+    assert bridge_db.get_multicast_db("br0")["RouterPorts"] == ["Gig1"]
+
+    assert bridge_db.del_bridge_db("br0") == STATUS_OK
+    assert rsdb.connection.execute("SELECT COUNT(*) FROM BridgeMulticastRouterPorts").fetchone() == (0,)
+
+
+def test_multicast_router_port_in_a_network_namespace() -> None:
+    import pytest
+
+    if os.geteuid() != 0 or shutil.which("ip") is None or shutil.which("bridge") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    from routershell.lib.network_manager.network_operations.bridge_multicast import BridgeMulticast
+
+    netns = f"rs-mdb-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    try:
+        assert subprocess.run(["ip", "-n", netns, "link", "add", "br0", "type", "bridge",
+                               "mcast_snooping", "1"]).returncode == 0
+        assert subprocess.run(["ip", "-n", netns, "link", "add", "v0", "type", "veth", "peer", "name", "v0p"]).returncode == 0
+        assert subprocess.run(["ip", "-n", netns, "link", "set", "v0", "master", "br0"]).returncode == 0
+
+        for link in ("br0", "v0", "v0p"):
+            assert subprocess.run(["ip", "-n", netns, "link", "set", link, "up"]).returncode == 0
+
+        lines = BridgeMulticast.router_ports(["v0"], enable=True)
+        lines.append("mdb add dev br0 port v0 grp 239.1.1.1 permanent")
+
+        assert subprocess.run(["ip", "netns", "exec", netns, "bridge", "-batch", "-"],
+                              input="\n".join(lines) + "\n", text=True).returncode == 0
+
+        result = subprocess.run(["ip", "netns", "exec", netns, "bridge", "-json", "-details", "-statistics", "mdb", "show"],
+                                capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+        entries, router_ports = BridgeMulticast.parse_mdb(result.stdout)
+
+        assert [(entry.group, entry.interface_name, entry.state) for entry in entries
+                if entry.group == "239.1.1.1"] == [("239.1.1.1", "v0", "permanent")]
+        assert router_ports == {"br0": ["v0"]}
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
+
+
+def test_netfilter_bypass_keeps_other_bridges_filtering(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.bridge_db import BridgeDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.run_commands import RunResult
+    from routershell.lib.network_manager.common.sysctl import SysCtl
+    from routershell.lib.network_manager.network_operations import bridge as bridge_module
+    from routershell.lib.network_manager.network_operations.bridge import Bridge
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    BridgeDatabase.rsdb = RouterShellDB()
+
+    sysctls: dict[str, str] = {}
+    batches: list[str] = []
+
+    def run(command: list[str], suppress_error: bool = False, shell: bool = False, sudo: bool = True,
+            stdin: str | None = None) -> RunResult:
+        if command[:3] == ["ip", "-batch", "-"]:
+            batches.append(stdin or "")
+        return RunResult("", "", 0, command)
+
+    monkeypatch.setattr(bridge_module, "PROC_SYS_NET_BRIDGE_DIR", tmp_path)
+    monkeypatch.setattr(SysCtl, "write_sysctl", lambda self, param, value: sysctls.update({param: value}) or STATUS_OK)
+
+    bridge = Bridge()
+    monkeypatch.setattr(bridge, "run", run)
+    monkeypatch.setattr(bridge, "get_bridge_list_os", lambda: ["br0", "br1", "docker0"])
+
+    assert bridge.add_bridge_db("br0") == STATUS_OK
+    assert bridge.add_bridge_db("br1") == STATUS_OK
+    assert bridge.update_bridge_db("br1", netfilter_bypass=True) == STATUS_OK
+
+    assert bridge.apply_br_netfilter() == STATUS_OK
+    assert set(sysctls.values()) == {"0"}
+    assert batches == [
+        "link set dev br0 type bridge nf_call_iptables 1 nf_call_ip6tables 1 nf_call_arptables 1\n"
+        "link set dev docker0 type bridge nf_call_iptables 1 nf_call_ip6tables 1 nf_call_arptables 1\n"]
+
+    assert bridge.del_bridge("br1") == STATUS_OK
+    assert set(sysctls.values()) == {"1"}
+    assert len(batches) == 1
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_range_list_parses_and_compresses() -> None:
+    import pytest
+
+    from routershell.lib.common.range_list import RangeList
+
+    assert RangeList.parse("100-103, 300,101", 1, 4094) == [100, 101, 102, 103, 300]
+    assert RangeList.compress([30, 10, 20, 21, 22, 11]) == "10-11,20-22,30"
+
+    with pytest.raises(ValueError):
+        RangeList.parse("10-5", 1, 4094)
+
+    with pytest.raises(ValueError):
+        RangeList.parse("4095", 1, 4094)
+
+
+def test_batch_only_contains_vlan_table_difference() -> None:
+    from routershell.lib.network_manager.network_operations.bridge_vlan import (
+        BridgePortVlans,
+        BridgeVlanBatch,
+        SwitchportMode,
+    )
+
+    bridge_vlan_show = (
+        '[{"ifname": "Gig1", "vlans": [{"vlan": 10}, {"vlan": 12, "vlanEnd": 14}, {"vlan": 99}]},'
+        ' {"ifname": "Gig2", "vlans": [{"vlan": 1, "flags": ["PVID", "Egress Untagged"]}]},'
+        ' {"ifname": "br0", "vlans": [{"vlan": 1, "flags": ["PVID", "Egress Untagged"]}, {"vlan": 10}]}]'
+    )
+    current = BridgeVlanBatch.parse_bridge_vlan_show(bridge_vlan_show)
+
+    assert current["Gig1"][13] == frozenset()
+    assert current["Gig2"][1] == frozenset({"pvid", "untagged"})
+
+    ports = [
+        BridgePortVlans("Gig1", SwitchportMode.TRUNK, list(range(10, 21))),
+        BridgePortVlans("Gig2", SwitchportMode.ACCESS, [30]),
+    ]
+
+    assert BridgeVlanBatch.compile("br0", ports, current).splitlines() == [
+        "vlan add dev Gig1 vid 11",
+        "vlan add dev Gig1 vid 15-20",
+        "vlan del dev Gig1 vid 99",
+        "vlan add dev Gig2 vid 30 pvid untagged",
+        "vlan del dev Gig2 vid 1",
+        "vlan add dev br0 vid 11-20 self",
+        "vlan add dev br0 vid 30 self",
+    ]
+
+    up_to_date = BridgeVlanBatch.parse_bridge_vlan_show(
+        '[{"ifname": "Gig2", "vlans": [{"vlan": 30, "flags": ["PVID", "Egress Untagged"]}]},'
+        ' {"ifname": "br0", "vlans": [{"vlan": 30}]}]'
+    )
+
+    assert BridgeVlanBatch.compile("br0", ports[1:], up_to_date) == ""
+
+
+def test_trunk_ports_are_driven_by_vlan_tables(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.db.vlan_db import VlanDatabase
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    VlanDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    assert rsdb.insert_interface_bridge("br0").status == STATUS_OK
+    assert rsdb.update_bridge("br0", vlan_filtering=True).status == STATUS_OK
+
+    for interface_name in ("Gig1", "Gig2"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+        assert rsdb.insert_interface_bridge_group(interface_name, "br0").status == STATUS_OK
+
+    for vlan_id in (10, 20, 21):
+        assert rsdb.insert_vlan_id(vlan_id).status == STATUS_OK
+
+    vlan_db = VlanDatabase()
+
+    assert vlan_db.get_bridge_vlan_filtering("Gig1") == ("br0", True)
+    assert vlan_db.update_switchport_mode(["Gig1"], "trunk") == STATUS_OK
+    assert rsdb.insert_vlan_interface(10, "Gig2").status == STATUS_OK
+
+    assert [(row["InterfaceName"], row["Mode"], row["VlanID"]) for row in vlan_db.get_bridge_port_vlans("br0")] == [
+        ("Gig1", "trunk", 10), ("Gig1", "trunk", 20), ("Gig1", "trunk", 21), ("Gig2", "access", 10),
+    ]
+
+    assert vlan_db.update_trunk_allowed_vlans(["Gig1"], [20, 21, 22]) == STATUS_OK
+    assert vlan_db.update_trunk_allowed_vlans(["Gig1"], [30], add=True) == STATUS_OK
+
+    assert [row["VlanID"] for row in vlan_db.get_bridge_port_vlans("br0") if row["InterfaceName"] == "Gig1"] == [
+        20, 21, 22, 30]
+
+    assert RouterConfigurationDatabase().get_interface_switchport_trunk_configuration("Gig1") == (
+        STATUS_OK,
+        [{"SwitchportMode": "switchport mode trunk"}, {"TrunkAllowedVlans": "switchport trunk allowed vlan 20-22,30"}],
+    )
+    assert RouterConfigurationDatabase().get_interface_switchport_trunk_configuration("Gig2") == (STATUS_OK, [])
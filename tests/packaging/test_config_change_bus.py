@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+@pytest.fixture
+def bus():
+    from routershell.lib.common.config_change_bus import ConfigChangeBus
+    from routershell.lib.common.singleton import Singleton
+
+    Singleton._instances.pop(ConfigChangeBus, None)
+    yield ConfigChangeBus()
+    Singleton._instances.pop(ConfigChangeBus, None)
+
+
+def test_changes_are_coalesced_per_handler(bus, monkeypatch) -> None:
+    from routershell.lib.common.config_change_bus import ConfigChangeTopic
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+
+    calls = []
+    failing = {"telnet": False}
+
+    def dnsmasq(changes):
+        calls.append(("dnsmasq", changes))
+        return STATUS_OK
+
+    def telnet(changes):
+        calls.append(("telnet", changes))
+        return STATUS_NOK if failing["telnet"] else STATUS_OK
+
+    bus.subscribe([ConfigChangeTopic.DHCP_POOL, ConfigChangeTopic.DNS], dnsmasq)
+    bus.subscribe([ConfigChangeTopic.TELNET_SERVER], telnet)
+    bus.subscribe([ConfigChangeTopic.DHCP_POOL, ConfigChangeTopic.DNS], dnsmasq)
+
+    with bus.batch():
+        for index in range(20):
+            bus.publish(ConfigChangeTopic.DHCP_POOL, f"POOL{index % 3}")
+
+        with bus.batch():
+            bus.publish(ConfigChangeTopic.DNS, "CacheSize")
+
+        assert bus.is_batching() and bus.time_to_flush() is None and calls == []
+
+    assert calls == [("dnsmasq", {ConfigChangeTopic.DHCP_POOL: {"POOL0", "POOL1", "POOL2"},
+                                  ConfigChangeTopic.DNS: {"CacheSize"}})]
+    assert bus.flush() == STATUS_OK and len(calls) == 1
+
+    # Outside of a batch the changes wait for the debounce window
+    bus.publish(ConfigChangeTopic.TELNET_SERVER)
+    bus.publish(ConfigChangeTopic.TELNET_SERVER)
+    assert 0 < bus.time_to_flush() <= bus.DEBOUNCE_WINDOW
+    assert bus.poll() == STATUS_OK and len(calls) == 1
+
+    failing["telnet"] = True
+    assert bus.poll(force=True) == STATUS_NOK
+    assert calls[1:] == [("telnet", {ConfigChangeTopic.TELNET_SERVER: {None}})]
+
+    monkeypatch.setattr(bus, "DEBOUNCE_WINDOW", 0)
+    bus.publish(ConfigChangeTopic.DHCP_POOL, "POOL0")
+    assert bus.time_to_flush() == 0 and bus.poll() == STATUS_OK
+    assert calls[2:] == [("dnsmasq", {ConfigChangeTopic.DHCP_POOL: {"POOL0"}})]
+    assert bus.time_to_flush() is None
+
+
+@pytest.fixture
+def services(bus, monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.dns_db import DnsDB
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.db.system_db import SystemDatabase
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+        DhcpConflictIndex,
+    )
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import (
+        DNSMasqGlobalService,
+        DNSMasqInterfaceService,
+        DNSMasqRunStatus,
+        DNSMasqService,
+    )
+    from routershell.lib.network_services.telnet.telnet_server import TelnetService
+
+    for cls in (RouterShellDB, DhcpConflictIndex):
+        Singleton._instances.pop(cls, None)
+
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouterConfigurationDatabase.rsdb = DnsDB.rsdb = SystemDatabase.rsdb = RouterShellDB()
+
+    for attribute in ("DNSMASQ_CONFIG_DIR", "DNSMASQ_HOSTS_DIR", "DNSMASQ_OPTS_DIR"):
+        monkeypatch.setattr(DNSMasqInterfaceService, attribute, str(tmp_path / attribute.lower()))
+
+    monkeypatch.setattr(DNSMasqGlobalService, "DNSMASQ_CONFIG_DIR", str(tmp_path / "dnsmasq_config_dir"))
+
+    calls = []
+    monkeypatch.setattr(DNSMasqService, "check_dnsmasq_status", lambda self: DNSMasqRunStatus.RUNNING)
+    monkeypatch.setattr(DNSMasqService, "reload_dnsmasq", lambda self: calls.append("dnsmasq sighup") or STATUS_OK)
+    monkeypatch.setattr(DNSMasqService, "control_service",
+                        lambda self, action: calls.append(f"dnsmasq {action.value}") or STATUS_OK)
+    monkeypatch.setattr(TelnetService, "set_port", lambda self, port: calls.append(f"telnet port {port}") or STATUS_OK)
+    monkeypatch.setattr(TelnetService, "restart_service", lambda self: calls.append("telnet restart") or STATUS_OK)
+    monkeypatch.setattr(TelnetService, "stop_service", lambda self: calls.append("telnet stop") or STATUS_OK)
+
+    yield calls
+
+    Singleton._instances.pop(DhcpConflictIndex, None)
+
+
+def test_config_replay_reloads_each_daemon_once(bus, services, monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.interface import InterfaceType
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DHCPServer
+    from routershell.lib.network_manager.network_operations.dns_cache import DnsCache, DnsCacheSetting
+    from routershell.lib.system.system import System
+
+    calls = services
+    server, system = DHCPServer(), System()
+    config_dir = tmp_path / "dnsmasq_config_dir"
+
+    with bus.batch():
+        for index in range(20):
+            pool, subnet = f"POOL{index}", f"10.{index}.0.0/24"
+            assert RouterShellDB().insert_interface(f"Gig{index}", InterfaceType.ETHERNET).status == STATUS_OK
+            assert server.add_dhcp_pool_name(pool) == STATUS_OK
+            assert server.add_dhcp_pool_subnet(pool, subnet) == STATUS_OK
+            assert server.add_dhcp_pool_subnet_inet_range(pool, subnet, f"10.{index}.0.10", f"10.{index}.0.99",
+                                                          "255.255.255.0") == STATUS_OK
+            assert server.add_dhcp_pool_to_interface(pool, f"Gig{index}") == STATUS_OK
+
+        assert DnsCache().set_cache_setting(DnsCacheSetting.SIZE, 500) == STATUS_OK
+        assert system.update_telnet_server(True, 2323) == STATUS_OK
+        assert system.update_telnet_server(True, 2424) == STATUS_OK
+        assert calls == []
+
+    assert calls == ["dnsmasq restart", "telnet port 2424", "telnet restart"]
+    assert len(list(config_dir.glob("POOL*_dnsmasq.conf"))) == 20
+    assert "cache-size=500" in (config_dir / "dnsmasq.conf").read_text().splitlines()
+
+    # Interactive changes wait for the debounce window, added reservations need no reload
+    calls.clear()
+    assert server.add_dhcp_pool_reservation("POOL0", "10.0.0.0/24", "aa:bb:cc:00:00:01", "10.0.0.5") == STATUS_OK
+    assert server.add_dhcp_pool_reservation("POOL0", "10.0.0.0/24", "aa:bb:cc:00:00:02", "10.0.0.6") == STATUS_OK
+    assert bus.poll() == STATUS_OK and (tmp_path / "dnsmasq_hosts_dir" / "POOL0" / "hosts").read_text() == ""
+
+    monkeypatch.setattr(bus, "DEBOUNCE_WINDOW", 0)
+    assert bus.poll() == STATUS_OK and calls == []
+    assert (tmp_path / "dnsmasq_hosts_dir" / "POOL0" / "hosts").read_text() == \
+        "aa:bb:cc:00:00:01,10.0.0.5\naa:bb:cc:00:00:02,10.0.0.6\n"
+
+    # A pool removed from its interface is cleared
+    assert server.add_dhcp_pool_to_interface("POOL1", "Gig1", negate=True) == STATUS_OK
+    assert system.update_telnet_server(False) == STATUS_OK
+    assert bus.poll() == STATUS_OK
+    assert calls == ["dnsmasq restart", "telnet stop"]
+    assert not (config_dir / "POOL1_dnsmasq.conf").exists()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import socket
+import struct
+
+
+def _ct_new_message(conntrack, original, reply, status: int) -> bytes:
+    attributes = (conntrack.encode_tuple(conntrack.CTA_TUPLE_ORIG, original)
+                  + conntrack.encode_tuple(conntrack.CTA_TUPLE_REPLY, reply)
+                  + conntrack._attribute(conntrack.CTA_STATUS, struct.pack(">I", status))
+                  + conntrack._attribute(conntrack.CTA_TIMEOUT, struct.pack(">I", 120)))
+    body = struct.pack("=BBH", socket.AF_INET, 0, 0) + attributes
+    return struct.pack("=IHHII", 16 + len(body), conntrack.NFNL_SUBSYS_CTNETLINK << 8, 2, 1, 0) + body
+
+
+def test_dump_messages_decode_into_nat_translations() -> None:
+    from routershell.lib.network_manager.common.conntrack import (
+        Conntrack,
+        ConntrackFilter,
+        ConntrackStatistics,
+        ConntrackTuple,
+    )
+
+    masqueraded = _ct_new_message(
+        Conntrack,
+        ConntrackTuple(6, "192.168.1.10", "198.51.100.7", 40000, 443),
+        ConntrackTuple(6, "198.51.100.7", "203.0.113.1", 443, 61000),
+        Conntrack.IPS_SRC_NAT)
+    untranslated = _ct_new_message(
+        Conntrack,
+        ConntrackTuple(17, "192.168.1.11", "192.168.1.1", 5353, 53),
+        ConntrackTuple(17, "192.168.1.1", "192.168.1.11", 53, 5353),
+        0)
+    done = struct.pack("=IHHII", 20, Conntrack.NLMSG_DONE, 2, 1, 0) + b"\0" * 4
+
+    messages = list(Conntrack.iter_messages(masqueraded + untranslated + done))
+
+    assert [message_type for message_type, _ in messages][-1] == Conntrack.NLMSG_DONE
+
+    entries = [Conntrack.parse_entry(payload) for message_type, payload in messages[:-1]]
+    nat_filter = ConntrackFilter(inside_address="192.168.1.10", protocol=6)
+
+    assert [entry.translation() for entry in entries if nat_filter.matches(entry)] == [
+        ("203.0.113.1:61000", "192.168.1.10:40000", "198.51.100.7:443", "198.51.100.7:443")]
+    assert not ConntrackFilter().matches(entries[1])
+    assert entries[0].timeout == 120
+
+    statistics = ConntrackStatistics()
+    for entry in entries:
+        statistics.add(entry)
+
+    assert (statistics.entries, statistics.source_nat, statistics.protocols) == (2, 1, {"tcp": 1, "udp": 1})
+
+
+def test_translation_filter_arguments() -> None:
+    import pytest
+
+    from routershell.lib.network_manager.network_operations.nat import Nat
+
+    assert Nat.parse_translation_filter("inside 192.168.1.10 protocol udp".split()) == ("192.168.1.10", None, "udp")
+    assert Nat.parse_translation_filter([]) == (None, None, None)
+
+    with pytest.raises(ValueError):
+        Nat.parse_translation_filter("protocol gre".split())
+
+
+class _OverrunSocket(socket.socket):
+    """A datagram socket whose receive buffer overflows, as a dump of a large table can."""
+
+    def send(self, data: bytes, flags: int = 0) -> int:
+        return len(data)
+
+    def recv(self, bufsize: int, flags: int = 0) -> bytes:
+        import errno
+
+        raise OSError(errno.ENOBUFS, "No buffer space available")
+
+
+def test_socket_errors_are_reported_as_conntrack_errors(monkeypatch, capsys) -> None:
+    import errno
+
+    import pytest
+
+    from routershell.lib.cli.show.nat_show import NatShow
+    from routershell.lib.network_manager.common.conntrack import Conntrack, ConntrackError
+
+    monkeypatch.setattr(Conntrack, "_open_socket", lambda self: _OverrunSocket(socket.AF_INET, socket.SOCK_DGRAM))
+
+    with pytest.raises(ConntrackError) as error:
+        list(Conntrack().dump())
+
+    assert error.value.error_code == errno.ENOBUFS
+
+    NatShow().translations([])
+    assert capsys.readouterr().out.splitlines()[-1].startswith("Error: ConntrackError: unable to read ctnetlink socket")
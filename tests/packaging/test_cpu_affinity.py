@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_queues_are_spread_across_cpus() -> None:
+    from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinityBatch
+
+    assert CpuAffinityBatch.cpu_mask([0, 1, 2, 3]) == "f"
+    assert CpuAffinityBatch.cpu_mask([]) == "0"
+    assert CpuAffinityBatch.cpu_mask([1, 32]) == "1,00000002"
+    assert CpuAffinityBatch.parse_cpu_mask("1,00000002") == [1, 32]
+
+    # one receive queue, RPS spreads its processing over every CPU
+    single = CpuAffinityBatch.plan([0, 1, 2, 3], ["rx-0"], ["tx-0"], [40], rfs_flow_entries=4096)
+
+    assert single.irq_cpus == {40: [0]}
+    assert single.rps_cpus == {"rx-0": [0, 1, 2, 3]}
+    assert single.rps_flow_cnt == {"rx-0": 4096}
+    assert single.xps_cpus == {"tx-0": [0, 1, 2, 3]}
+    assert single.rps_sock_flow_entries == 4096
+
+    # two queues on four CPUs, each queue gets a group of CPUs
+    pair = CpuAffinityBatch.plan([0, 1, 2, 3], ["rx-0", "rx-1"], ["tx-0", "tx-1"], [40, 41], rfs_flow_entries=4096)
+
+    assert pair.irq_cpus == {40: [0], 41: [1]}
+    assert pair.rps_cpus == {"rx-0": [0, 2], "rx-1": [1, 3]}
+    assert pair.rps_flow_cnt == {"rx-0": 2048, "rx-1": 2048}
+
+    # one queue per CPU, hardware RSS already spreads, RPS/RFS stay off
+    rss = CpuAffinityBatch.plan([0, 1], ["rx-0", "rx-1", "rx-2"], ["tx-0", "tx-1", "tx-2"], [40, 41, 42])
+
+    assert rss.irq_cpus == {40: [0], 41: [1], 42: [0]}
+    assert rss.rps_cpus == {"rx-0": [], "rx-1": [], "rx-2": []}
+    assert rss.xps_cpus == {"tx-0": [0], "tx-1": [1], "tx-2": [0]}
+    assert rss.rps_sock_flow_entries == 0
+
+    writes = [(str(path), value) for path, value in CpuAffinityBatch.writes("eth0", single)]
+
+    assert writes == [
+        ("/proc/irq/40/smp_affinity", "1"),
+        ("/proc/sys/net/core/rps_sock_flow_entries", "4096"),
+        ("/sys/class/net/eth0/queues/rx-0/rps_cpus", "f"),
+        ("/sys/class/net/eth0/queues/rx-0/rps_flow_cnt", "4096"),
+        ("/sys/class/net/eth0/queues/tx-0/xps_cpus", "f"),
+    ]
+
+
+def test_write_script_attempts_every_write(tmp_path: Path) -> None:
+    from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinityBatch
+
+    good = tmp_path / "rps_cpus"
+    script = CpuAffinityBatch.script([(tmp_path / "missing" / "xps_cpus", "3"), (good, "f")])
+
+    result = subprocess.run(["sh", "-s"], input=script, capture_output=True, text=True)
+
+    assert result.returncode != 0
+    assert good.read_text() == "f\n"
+
+
+def test_queue_statistics_parsers() -> None:
+    from routershell.lib.network_manager.network_operations.cpu_affinity import QueueStatistics
+
+    interrupts = QueueStatistics.parse_proc_interrupts(
+        "           CPU0       CPU1       \n"
+        "  24:         10          0   PCI-MSI 1048576-edge      eth0\n"
+        "  25:        100        200   PCI-MSI 1048577-edge      eth0-TxRx-0\n"
+        "  26:        300        400   PCI-MSI 1048578-edge      eth0-TxRx-1\n"
+        "  27:          5          5   PCI-MSI 1050000-edge      eth01-TxRx-0\n"
+        " NMI:          0          0   Non-maskable interrupts\n"
+    )
+
+    assert interrupts[25] == {"Counts": {0: 100, 1: 200}, "Description": "PCI-MSI 1048577-edge      eth0-TxRx-0"}
+    assert "NMI" not in interrupts
+    assert QueueStatistics.find_interface_irqs("eth0", interrupts, []) == [24, 25, 26]
+    assert QueueStatistics.find_interface_irqs("enp1s0", interrupts, [26, 27, 99]) == [26, 27]
+
+    softnet = QueueStatistics.parse_softnet_stat(
+        "000021d5 00000001 00000002 00000000 00000000 00000000 00000000 00000000 00000000 00000010 00000000 00000000 00000000\n"
+        "00000100 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000003\n"
+    )
+
+    assert softnet == [
+        {"CPU": 0, "Processed": 0x21D5, "Dropped": 1, "TimeSqueeze": 2, "ReceivedRps": 0x10},
+        {"CPU": 3, "Processed": 0x100, "Dropped": 0, "TimeSqueeze": 0, "ReceivedRps": 0},
+    ]
+
+    assert QueueStatistics.parse_ethtool_queue_packets(
+        "NIC statistics:\n"
+        "     rx_packets: 900\n"
+        "     rx_queue_0_packets: 500\n"
+        "     rx_queue_1_packets: 400\n"
+        "     tx-0.packets: 70\n"
+        "     rx1_bytes: 1000\n"
+    ) == {"rx-0": 500, "rx-1": 400, "tx-0": 70}
+
+
+def test_cpu_affinity_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    InterfaceDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    interface_db = InterfaceDatabase()
+    rcdb = RouterConfigurationDatabase()
+
+    assert rsdb.insert_interface("Gig1", InterfaceType.ETHERNET).status == STATUS_OK
+    assert interface_db.update_db_cpu_affinity("Gig9", "auto") == STATUS_NOK
+    assert rcdb.get_interface_cpu_affinity_configuration("Gig1") == (STATUS_OK, [])
+
+    assert interface_db.update_db_cpu_affinity("Gig1", "auto") == STATUS_OK
+    assert rcdb.get_interface_cpu_affinity_configuration("Gig1") == (
+        STATUS_OK, [{"CpuAffinity": "cpu affinity auto"}])
+
+    assert interface_db.update_db_cpu_affinity("Gig1", "0-3", 65536) == STATUS_OK
+    assert rcdb.get_interface_cpu_affinity_configuration("Gig1") == (
+        STATUS_OK, [{"CpuAffinity": "cpu affinity cpus 0-3 rfs-flow-entries 65536"}])
+
+    assert interface_db.del_db_cpu_affinity("Gig1") == STATUS_OK
+    assert rcdb.get_interface_cpu_affinity_configuration("Gig1") == (STATUS_OK, [])
+
+
+def test_rps_sock_flow_entries_is_sized_from_every_interface_and_restored(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.interface import InterfaceType
+    from routershell.lib.network_manager.network_operations import cpu_affinity
+    from routershell.lib.network_manager.network_operations.cpu_affinity import CpuAffinity
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    InterfaceDatabase.rsdb = rsdb
+
+    net_dir = tmp_path / "net"
+    core_dir = tmp_path / "core"
+    core_dir.mkdir()
+    sock_flow_entries = core_dir / "rps_sock_flow_entries"
+    sock_flow_entries.write_text("0\n")
+
+    # Gig1 and Gig2 have one queue each (RPS), Gig3 one queue per CPU (RSS)
+    for name, queues in (("Gig1", 1), ("Gig2", 1), ("Gig3", 4)):
+        assert rsdb.insert_interface(name, InterfaceType.ETHERNET).status == STATUS_OK
+
+        for queue in range(queues):
+            (net_dir / name / "queues" / f"rx-{queue}").mkdir(parents=True)
+            (net_dir / name / "queues" / f"tx-{queue}").mkdir(parents=True)
+
+    monkeypatch.setattr(cpu_affinity, "SYS_CLASS_NET_DIR", net_dir)
+    monkeypatch.setattr(cpu_affinity, "PROC_SYS_NET_CORE_DIR", core_dir)
+    monkeypatch.setattr(CpuAffinity, "get_online_cpus", lambda self: [0, 1, 2, 3])
+    monkeypatch.setattr(CpuAffinity, "get_interface_irqs", lambda self, interface_name: [])
+
+    global_writes: list[str] = []
+
+    def run_writes(self, interface_name, writes):
+        for path, value in writes:
+            if path == sock_flow_entries:
+                global_writes.append(value)
+            path.write_text(f"{value}\n")
+        return STATUS_OK
+
+    monkeypatch.setattr(CpuAffinity, "_run_writes", run_writes)
+
+    affinity = CpuAffinity()
+
+    assert affinity.update_interface_cpu_affinity("Gig1", rfs_flow_entries=4096) == STATUS_OK
+    assert affinity.update_interface_cpu_affinity("Gig2", [0, 1], rfs_flow_entries=65536) == STATUS_OK
+    assert affinity.update_interface_cpu_affinity("Gig3") == STATUS_OK
+    assert global_writes == ["4096", "65536"]
+    assert InterfaceDatabase().get_db_saved_rps_sock_flow_entries() == 0
+
+    # Re-applying an interface does not rewrite the global table
+    assert affinity.update_interface_cpu_affinity("Gig1", rfs_flow_entries=4096) == STATUS_OK
+    assert global_writes == ["4096", "65536"]
+
+    # Shrinks to the interfaces still using RFS, restored once none does, also from a new process
+    assert affinity.update_interface_cpu_affinity("Gig2", negate=True) == STATUS_OK
+    affinity = CpuAffinity()
+    assert sock_flow_entries.read_text() == "4096\n"
+    assert affinity.update_interface_cpu_affinity("Gig3", negate=True) == STATUS_OK
+    assert affinity.update_interface_cpu_affinity("Gig1", negate=True) == STATUS_OK
+    assert global_writes == ["4096", "65536", "4096", "0"]
+    assert InterfaceDatabase().get_db_saved_rps_sock_flow_entries() is None
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+
+class FakeDhcpClient:
+
+    def __init__(self, interface_name: str, lease=None):
+        from routershell.lib.network_manager.network_operations.dhcp.client.supported_dhcp_clients import (
+            SupportedDhcpClients,
+        )
+        from routershell.lib.network_manager.network_operations.dhcp.common.dhcp_common import DHCPStackVersion
+
+        self.interface_name = interface_name
+        self.client = SupportedDhcpClients.DHCPCD
+        self.stack_version = DHCPStackVersion.DHCP_V4
+        self.lease = lease
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.result = False
+
+    def get_interface(self) -> str:
+        return self.interface_name
+
+    def get_dhcp_client(self):
+        return self.client
+
+    def get_dhcp_stack_version(self):
+        return self.stack_version
+
+    def get_lease(self, obtained: float):
+        return self.lease
+
+    def start(self) -> bool:
+        self.started.set()
+        self.release.wait(5)
+        return self.result
+
+
+@pytest.fixture
+def jobs():
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client_jobs import DHCPClientJobs
+
+    Singleton._instances.pop(DHCPClientJobs, None)
+    yield DHCPClientJobs()
+    Singleton._instances.pop(DHCPClientJobs, None)
+
+
+def test_dhcp_clients_request_leases_in_parallel(jobs) -> None:
+    from routershell.lib.common.constants import STATUS_NOK
+    from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client_jobs import DHCPClientState
+    from routershell.lib.network_manager.network_operations.dhcp.client.supported_dhcp_clients import (
+        DHCPClientLease,
+    )
+
+    lease = DHCPClientLease.from_times("192.0.2.10", 1000.0, 3600)
+    wan, lan = FakeDhcpClient("eth0", lease), FakeDhcpClient("eth1")
+
+    jobs.submit(wan, wan.start)
+    jobs.submit(lan, lan.start)
+
+    # Both clients are requesting at once, the caller is not blocked
+    assert wan.started.wait(2) and lan.started.wait(2)
+    assert jobs.get_state("eth0") == jobs.get_state("eth1") == DHCPClientState.REQUESTING
+    assert jobs.wait_ready(["eth0"], timeout=0.05) is False
+
+    wan.release.set()
+    assert jobs.wait_ready(["eth0"], timeout=2) is True
+    assert jobs.get_state("eth0") == DHCPClientState.BOUND
+    assert jobs.wait_ready(timeout=0.05) is False
+
+    lan.result = STATUS_NOK
+    lan.release.set()
+    assert jobs.wait_ready(timeout=2) is True
+
+    status = jobs.get_status()
+    assert [(s.interface_name, s.client, s.state) for s in status] == [
+        ("eth0", "dhcpcd", DHCPClientState.BOUND), ("eth1", "dhcpcd", DHCPClientState.FAILED)]
+    assert status[0].lease == DHCPClientLease("192.0.2.10", 3600, 2800.0, 4150.0, 4600.0)
+    assert status[1].lease is None and status[1].finished >= status[1].started
+
+
+def test_dhcp_client_stopped_or_restarted_while_requesting(jobs) -> None:
+    from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client_jobs import DHCPClientState
+
+    first, second = FakeDhcpClient("eth0"), FakeDhcpClient("eth0")
+    jobs.submit(first, first.start)
+    assert first.started.wait(2)
+
+    # A restart replaces the job, the outcome of the superseded one is ignored
+    jobs.submit(second, second.start)
+    assert second.started.wait(2)
+    first.release.set()
+    assert jobs.wait_ready(timeout=0.1) is False
+    assert jobs.get_state("eth0") == DHCPClientState.REQUESTING
+
+    waiter = threading.Thread(target=jobs.wait_ready, kwargs={"timeout": 5})
+    waiter.start()
+    jobs.discard("eth0")
+    waiter.join(2)
+
+    assert not waiter.is_alive()
+    assert jobs.get_state("eth0") is None and jobs.get_status() == []
+    second.release.set()
+
+
+def test_static_route_waits_only_for_the_dhcp_client_of_its_next_hop(jobs, monkeypatch) -> None:
+    from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+
+    wan, lan = FakeDhcpClient("eth0"), FakeDhcpClient("eth1")
+    jobs.submit(wan, wan.start)
+    jobs.submit(lan, lan.start)
+    assert wan.started.wait(2) and lan.started.wait(2)
+    assert sorted(jobs.get_requesting()) == ["eth0", "eth1"]
+
+    waits = []
+    monkeypatch.setattr(jobs, "wait_ready", lambda interface_names=None, timeout=0: waits.append(interface_names))
+
+    route = Route()
+    monkeypatch.setattr(route, "get_ip_addr_info", lambda interface_name=None: [
+        {"ifname": "eth2", "addr_info": [{"family": "inet", "local": "10.0.1.2", "prefixlen": 24}]},
+        {"ifname": "eth0", "addr_info": [{"family": "inet6", "local": "2001:db8::2", "prefixlen": 64},
+                                         {"family": "inet", "local": "192.0.2.10", "prefixlen": 24}]}])
+
+    route._wait_for_dhcp_lease(StaticRoute("0.0.0.0/0", "192.0.2.1"))
+    route._wait_for_dhcp_lease(StaticRoute("0.0.0.0/0", "10.0.1.1"))
+    route._wait_for_dhcp_lease(StaticRoute("0.0.0.0/0", "203.0.113.1"))
+    route._wait_for_dhcp_lease(StaticRoute("198.51.100.0/24", "eth1"))
+
+    assert waits == [["eth0"], ["eth2"], None, ["eth1"]]
+
+    wan.release.set()
+    lan.release.set()
+
+
+def test_dhcp_client_leases_are_parsed() -> None:
+    from routershell.lib.network_manager.network_operations.dhcp.client.supported_dhcp_clients import (
+        DHCPClientLease,
+        DHCPClientOperations_dhclient,
+        DHCPClientOperations_dhcpcd,
+    )
+
+    dump = "ip_address='192.0.2.20'\nsubnet_cidr='24'\ndhcp_lease_time='600'\ndhcp_renewal_time='200'\n"
+    assert DHCPClientOperations_dhcpcd.parse_dumplease(dump, 100.0) == DHCPClientLease(
+        "192.0.2.20", 600, 300.0, 625.0, 700.0)
+    assert DHCPClientOperations_dhcpcd.parse_dumplease("reason='FAIL'\n", 100.0) is None
+
+    leases = """
+lease {
+  interface "eth0";
+  fixed-address 192.0.2.30;
+  option dhcp-lease-time 600;
+  renew 4 2024/01/04 00:05:00;
+  rebind 4 2024/01/04 00:08:45;
+  expire 4 2024/01/04 00:10:00;
+}
+lease {
+  interface "eth1";
+  fixed-address 198.51.100.7;
+}
+lease {
+  interface "eth0";
+  fixed-address 192.0.2.31;
+  option dhcp-lease-time 3600;
+  renew 4 2024/01/04 00:30:00;
+  rebind 4 2024/01/04 00:52:30;
+  expire 4 2024/01/04 01:00:00;
+}
+"""
+    assert DHCPClientOperations_dhclient.parse_lease_file(leases, "eth0") == DHCPClientLease(
+        "192.0.2.31", 3600, 1704328200.0, 1704329550.0, 1704330000.0)
+    assert DHCPClientOperations_dhclient.parse_lease_file(leases, "eth1") == DHCPClientLease(
+        "198.51.100.7", None, None, None, None)
+    assert DHCPClientOperations_dhclient.parse_lease_file(leases, "eth2") is None
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import ipaddress
+import random
+import time
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+@pytest.fixture
+def dhcp_db(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+        DhcpConflictIndex,
+    )
+
+    for cls in (RouterShellDB, DhcpConflictIndex):
+        Singleton._instances.pop(cls, None)
+
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouterConfigurationDatabase.rsdb = RouterShellDB()
+
+    yield
+
+    Singleton._instances.pop(DhcpConflictIndex, None)
+
+
+def test_interval_tree_matches_a_linear_scan() -> None:
+    from routershell.lib.common.interval_tree import IntervalTree
+
+    generator = random.Random(7)
+    tree: IntervalTree[int] = IntervalTree()
+    intervals = []
+
+    for value in range(2000):
+        start = generator.randrange(10000)
+        interval = (start, start + generator.randrange(50), value)
+        intervals.append(interval)
+        tree.insert(*interval)
+
+    for interval in generator.sample(intervals, 1000):
+        assert tree.remove(*interval)
+        intervals.remove(interval)
+
+    assert not tree.remove(0, 0, -1)
+    assert len(tree) == len(intervals) == 1000
+    assert list(tree) == sorted(intervals, key=lambda interval: (interval[0], interval[1], interval[2]))
+
+    for _ in range(200):
+        start = generator.randrange(10000)
+        end = start + generator.randrange(100)
+        expected = [interval for interval in intervals if interval[0] <= end and interval[1] >= start]
+
+        assert sorted(tree.overlapping(start, end)) == sorted(expected)
+
+    with pytest.raises(ValueError):
+        tree.insert(2, 1, 0)
+
+
+def test_dhcp_server_rejects_conflicting_entries(dhcp_db, caplog) -> None:
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+        DhcpConflictIndex,
+        DhcpEntryType,
+    )
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DHCPServer
+
+    # Configured before the index is loaded, the index picks it up from the DB
+    dsd = DHCPServerDatabase()
+    assert dsd.add_dhcp_pool_name_db("LAN") == STATUS_OK
+    assert dsd.add_dhcp_pool_subnet_db("LAN", "192.168.1.0/24") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("192.168.1.0/24", "192.168.1.10", "192.168.1.50",
+                                                     "255.255.255.0") == STATUS_OK
+    assert dsd.add_dhcp_subnet_reservation_db("192.168.1.0/24", "aa:bb:cc:00:00:01", "192.168.1.20") == STATUS_OK
+
+    server = DHCPServer()
+    assert server.add_dhcp_pool_name("GUEST") == STATUS_OK
+
+    assert server.add_dhcp_pool_subnet("GUEST", "192.168.0.0/16") == STATUS_NOK
+    assert "subnet 192.168.0.0/16 of DHCP pool GUEST overlaps subnet 192.168.1.0/24 of DHCP pool LAN" in caplog.text
+    assert server.add_dhcp_pool_subnet("GUEST", "192.168.2.0/24") == STATUS_OK
+
+    conflicts = DhcpConflictIndex().check_range("GUEST", "192.168.1.40", "192.168.2.20")
+    assert [(conflict.existing.entry_type, conflict.existing.pool) for conflict in conflicts] == [
+        (DhcpEntryType.SUBNET, "LAN"), (DhcpEntryType.RANGE, "LAN")]
+
+    assert server.add_dhcp_pool_subnet_inet_range("LAN", "192.168.1.0/24", "192.168.1.50", "192.168.1.60",
+                                                  "255.255.255.0") == STATUS_NOK
+    assert "range 192.168.1.50-192.168.1.60 of DHCP pool LAN overlaps range 192.168.1.10-192.168.1.50" in caplog.text
+    assert server.add_dhcp_pool_subnet_inet_range("LAN", "192.168.1.0/24", "192.168.1.51", "192.168.1.60",
+                                                  "255.255.255.0") == STATUS_OK
+
+    # A reservation may sit in a range of its own pool, not on an address already reserved
+    assert server.add_dhcp_pool_reservation("LAN", "192.168.1.0/24", "aa:bb:cc:00:00:02", "192.168.1.55") == STATUS_OK
+    assert server.add_dhcp_pool_reservation("LAN", "192.168.1.0/24", "aa:bb:cc:00:00:03", "192.168.1.20") == STATUS_NOK
+    assert "reservation 192.168.1.20 (aa:bb:cc:00:00:03) of DHCP pool LAN overlaps " \
+           "reservation 192.168.1.20 (aa:bb:cc:00:00:01) of DHCP pool LAN" in caplog.text
+    assert DhcpConflictIndex().check_reservation("LAN", "AA:BB:CC:00:00:01", "192.168.1.20") == []
+    assert [str(conflict.existing) for conflict in DhcpConflictIndex().check_reservation("GUEST", "aa:bb:cc:00:00:04",
+                                                                                         "192.168.1.55")] == [
+        "subnet 192.168.1.0/24 of DHCP pool LAN", "range 192.168.1.51-192.168.1.60 of DHCP pool LAN",
+        "reservation 192.168.1.55 (aa:bb:cc:00:00:02) of DHCP pool LAN"]
+
+    assert server.del_dhcp_pool_name("LAN") == STATUS_OK
+    assert server.add_dhcp_pool_subnet("GUEST", "192.168.0.0/16") == STATUS_OK
+
+
+def test_conflict_checks_scale_to_many_reservations(dhcp_db) -> None:
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+        DhcpConflictIndex,
+    )
+
+    index = DhcpConflictIndex()
+    index.add_subnet("LAN", "10.0.0.0/16")
+    index.add_range("LAN", "10.0.0.1", "10.0.127.255")
+    base = int(ipaddress.ip_address("10.0.128.0"))
+
+    for offset in range(10000):
+        index.add_reservation("LAN", f"aa:bb:00:00:{offset >> 8:02x}:{offset & 0xff:02x}",
+                              str(ipaddress.ip_address(base + offset)))
+
+    started = time.perf_counter()
+
+    for offset in range(10000):
+        assert index.check_reservation("LAN", "aa:bb:cc:dd:ee:ff", str(ipaddress.ip_address(base + offset)))
+
+    assert index.check_reservation("LAN", "aa:bb:cc:dd:ee:ff", "10.0.255.254") == []
+    assert time.perf_counter() - started < 5
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+LEASES = [
+    "1700000000 AA:BB:CC:00:00:01 192.168.1.10 laptop 01:aa:bb:cc:00:00:01",
+    "0 aa:bb:cc:00:00:02 192.168.1.11 * *",
+    "duid 00:01:00:01:2c:1f:aa:bb:cc:dd:ee:ff",
+    "1700000500 305419896 2001:db8::10 Phone 00:03:00:01:aa:bb:cc:00:00:03",
+    "garbage line",
+    "1700000600 aa:bb:cc:00:00:04 10.0.0.20 printer *",
+]
+
+
+@pytest.fixture
+def lease_store_class():
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DnsmasqLeaseStore
+
+    stores = []
+
+    def create(lease_file: Path) -> DnsmasqLeaseStore:
+        Singleton._instances.pop(DnsmasqLeaseStore, None)
+        store = DnsmasqLeaseStore(lease_file)
+        stores.append(store)
+        return store
+
+    yield create
+
+    for store in stores:
+        store.close()
+
+    Singleton._instances.pop(DnsmasqLeaseStore, None)
+
+
+def rewrite(lease_file: Path, lines: list[str]) -> None:
+    # dnsmasq writes a new lease file and renames it over the old one
+    temporary = lease_file.with_suffix(".new")
+    temporary.write_text("".join(f"{line}\n" for line in lines))
+    os.replace(temporary, lease_file)
+
+
+def test_parse_lease() -> None:
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DhcpLease, DnsmasqLeaseStore
+
+    assert DnsmasqLeaseStore.parse_lease(LEASES[0]) == DhcpLease(
+        1700000000, "aa:bb:cc:00:00:01", "192.168.1.10", "laptop", "01:aa:bb:cc:00:00:01")
+    assert DnsmasqLeaseStore.parse_lease(LEASES[1]) == DhcpLease(0, "aa:bb:cc:00:00:02", "192.168.1.11", None, None)
+    assert DnsmasqLeaseStore.parse_lease(LEASES[3]) == DhcpLease(
+        1700000500, None, "2001:db8::10", "Phone", "00:03:00:01:aa:bb:cc:00:00:03", "305419896")
+
+    for line in ("garbage line", "soon aa:bb:cc:00:00:05 10.0.0.1 * *", "1 aa:bb:cc:00:00:05 10.0.0.300 * *"):
+        assert DnsmasqLeaseStore.parse_lease(line) is None
+
+
+def test_lease_store_indexes_and_incremental_refresh(tmp_path: Path, lease_store_class) -> None:
+    lease_file = tmp_path / "dnsmasq.leases"
+    rewrite(lease_file, LEASES)
+
+    store = lease_store_class(lease_file)
+    store.set_pool_subnets({"LAN": "192.168.1.0/24", "LAN6": "2001:db8::/64", "BROKEN": None})
+
+    assert [lease.ip_address for lease in store.leases()] == ["192.168.1.10", "192.168.1.11", "2001:db8::10",
+                                                            "10.0.0.20"]
+    assert len(store) == 4
+    assert store.server_duid() == "00:01:00:01:2c:1f:aa:bb:cc:dd:ee:ff"
+    assert store.get_by_ip("2001:0db8::0010").hostname == "Phone"
+    assert store.get_by_ip("not-an-address") is None
+    assert [lease.ip_address for lease in store.get_by_mac("AA:BB:CC:00:00:02")] == ["192.168.1.11"]
+    assert [lease.ip_address for lease in store.get_by_hostname("phone")] == ["2001:db8::10"]
+    assert [lease.ip_address for lease in store.get_by_pool("LAN")] == ["192.168.1.10", "192.168.1.11"]
+    assert store.pool_of(store.get_by_ip("10.0.0.20")) is None
+
+    laptop = store.get_by_ip("192.168.1.10")
+
+    assert not store.refresh()
+
+    # The printer renews and moves to a new address, the laptop lease line is unchanged
+    rewrite(lease_file, LEASES[:2] + ["1700009999 aa:bb:cc:00:00:04 192.168.1.20 printer *"])
+
+    assert [lease.ip_address for lease in store.leases()] == ["192.168.1.10", "192.168.1.11", "192.168.1.20"]
+    assert store.get_by_ip("192.168.1.10") is laptop
+    assert store.get_by_ip("10.0.0.20") is None
+    assert store.get_by_hostname("phone") == []
+    assert [lease.expires for lease in store.get_by_mac("aa:bb:cc:00:00:04")] == [1700009999]
+    assert [lease.ip_address for lease in store.get_by_pool("LAN")] == ["192.168.1.10", "192.168.1.11",
+                                                                      "192.168.1.20"]
+
+    store.set_pool_subnets({"HOSTS": "192.168.1.0/28", "LAN": "192.168.1.0/24"})
+
+    assert [lease.ip_address for lease in store.get_by_pool("HOSTS")] == ["192.168.1.10", "192.168.1.11"]
+    assert [lease.ip_address for lease in store.get_by_pool("LAN")] == ["192.168.1.20"]
+
+    lease_file.unlink()
+
+    assert store.leases() == []
+
+
+def test_lease_store_polls_without_inotify(tmp_path: Path, lease_store_class, monkeypatch) -> None:
+    from routershell.lib.network_services.dhcp.dnsmasq import dnsmasq_leases
+
+    def unavailable():
+        raise OSError("inotify is not available")
+
+    monkeypatch.setattr(dnsmasq_leases, "Inotify", unavailable)
+
+    lease_file = tmp_path / "dnsmasq.leases"
+    store = lease_store_class(lease_file)
+
+    assert store.leases() == []
+
+    rewrite(lease_file, LEASES[:2])
+
+    assert [lease.ip_address for lease in store.leases()] == ["192.168.1.10", "192.168.1.11"]
+    assert not store.refresh()
+
+
+def test_pool_subnets_are_read_again_after_a_pool_change(tmp_path: Path, lease_store_class, monkeypatch) -> None:
+    from routershell.lib.common.config_change_bus import ConfigChangeBus, ConfigChangeTopic
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DhcpServerManager
+
+    lease_file = tmp_path / "dnsmasq.leases"
+    rewrite(lease_file, LEASES)
+    store = lease_store_class(lease_file)
+
+    pools = {"LAN": "192.168.1.0/24"}
+    reads = []
+
+    def dhcp_pool_name_list(self) -> list[str]:
+        reads.append(sorted(pools))
+        return list(pools)
+
+    monkeypatch.setattr(DHCPServerDatabase, "dhcp_pool_name_list", dhcp_pool_name_list)
+    monkeypatch.setattr(DHCPServerDatabase, "get_dhcp_pool_subnet_name_db", lambda self, pool: pools[pool])
+
+    Singleton._instances.pop(ConfigChangeBus, None)
+    manager = DhcpServerManager()
+
+    try:
+        assert manager.lease_store() is store
+        assert manager.lease_store().get_by_pool("LAN")
+        assert reads == [["LAN"]]
+
+        pools["OFFICE"] = "10.0.0.0/24"
+        ConfigChangeBus().publish(ConfigChangeTopic.DHCP_POOL, "OFFICE")
+        ConfigChangeBus().poll(force=True)
+
+        assert [lease.ip_address for lease in manager.lease_store().get_by_pool("OFFICE")] == ["10.0.0.20"]
+        assert reads == [["LAN"], ["LAN", "OFFICE"]]
+
+    finally:
+        Singleton._instances.pop(ConfigChangeBus, None)
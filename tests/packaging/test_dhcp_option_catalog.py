@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_option_catalog_indexes_and_encodes_by_type() -> None:
+    from routershell.lib.network_services.dhcp.common.dhcp_common import (
+        DHCPV4_OPTION_CATALOG,
+        DHCPV6_OPTION_CATALOG,
+        DhcpOptionCatalog,
+        DHCPOptionLookup,
+        DHCPVersion,
+    )
+
+    assert DHCPOptionLookup().get_dhcpv4_option_code("routers") == 3
+    assert DHCPOptionLookup().get_dhcpv6_option_code("dns-servers") == 23
+    assert DHCPV4_OPTION_CATALOG.get("26") == DHCPV4_OPTION_CATALOG.get("interface-mtu")
+    assert DHCPV4_OPTION_CATALOG.get(26).option_type == "uint16" and "nope" not in DHCPV4_OPTION_CATALOG
+    assert DhcpOptionCatalog.for_version(DHCPVersion.UNKNOWN) == (DHCPV4_OPTION_CATALOG, DHCPV6_OPTION_CATALOG)
+
+    with pytest.raises(TypeError):
+        DHCPV4_OPTION_CATALOG._by_name["routers"] = None
+
+    assert DHCPV4_OPTION_CATALOG.encode("domain-name-servers", "8.8.8.8,1.1.1.1") == "8.8.8.8,1.1.1.1"
+    assert DHCPV4_OPTION_CATALOG.encode("interface-mtu", "0x5dc") == "1500"
+    assert DHCPV4_OPTION_CATALOG.encode("domain-search", "example.com.,lab.example.com") == \
+        "example.com,lab.example.com"
+    assert DHCPV4_OPTION_CATALOG.encode("ip-forwarding", "off") == "0"
+    assert DHCPV4_OPTION_CATALOG.encode("tftp-server-name", "tftp.lan") == "tftp.lan"
+    assert DHCPV6_OPTION_CATALOG.encode("dns-servers", "fd00::1,[FD00::2]") == "[fd00::1],[fd00::2]"
+    assert DHCPV6_OPTION_CATALOG.encode("subscriber-id", "0A:0b0C") == "0a:0b:0c"
+
+    for option, value in (("routers", "192.168.1"), ("routers", "192.168.1.1,"), ("swap-server", "10.0.0.1,10.0.0.2"),
+                          ("interface-mtu", "65536"), ("time-offset", "2147483648"), ("domain-name", "-lan-.com"),
+                          ("ip-forwarding", "maybe"), ("routers-typo", "192.168.1.1")):
+        with pytest.raises(ValueError):
+            DHCPV4_OPTION_CATALOG.encode(option, value)
+
+
+def test_pool_options_are_validated_and_scoped_by_version(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_conflict_index import (
+        DhcpConflictIndex,
+    )
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DHCPServer
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqInterfaceService
+
+    for cls in (RouterShellDB, DhcpConflictIndex):
+        Singleton._instances.pop(cls, None)
+
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouterConfigurationDatabase.rsdb = RouterShellDB()
+
+    dsd = DHCPServerDatabase()
+    assert dsd.add_dhcp_pool_name_db("LAN6") == STATUS_OK
+    assert dsd.add_dhcp_pool_subnet_db("LAN6", "2001:db8::/64") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("2001:db8::/64", "2001:db8::100", "2001:db8::1ff",
+                                                     "/64") == STATUS_OK
+
+    server = DHCPServer()
+    assert server.add_dhcp_pool_option("LAN6", "2001:db8::/64", "routers", "2001:db8::1") == STATUS_NOK
+    assert server.add_dhcp_pool_option("LAN6", "2001:db8::/64", "dns-servers", "2001:db8::53,192.0.2.1") == STATUS_NOK
+    assert server.add_dhcp_pool_option("LAN6", "2001:db8::/64", "dns-servers", "2001:db8::53,2001:db8::54") == STATUS_OK
+    assert server.add_dhcp_pool_option("LAN6", "2001:db8::/64", "domain-search", "lab.example.com") == STATUS_OK
+
+    monkeypatch.setattr(DHCPServerDatabase, "get_dhcp_pool_interfaces_db",
+                        lambda self, dhcp_pool_name: [{"InterfaceName": "Gig0"}])
+
+    dmis = DNSMasqInterfaceService("LAN6", "2001:db8::/64")
+    assert dmis.build_interface_configuration() == STATUS_OK
+    assert dmis.dhcp_opts == ["tag:LAN6,option6:23,[2001:db8::53],[2001:db8::54]",
+                              "tag:LAN6,option6:24,lab.example.com"]
+
+    Singleton._instances.pop(DhcpConflictIndex, None)
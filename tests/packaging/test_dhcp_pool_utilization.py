@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def rewrite(lease_file: Path, lines: list[str]) -> None:
+    temporary = lease_file.with_suffix(".new")
+    temporary.write_text("".join(f"{line}\n" for line in lines))
+    os.replace(temporary, lease_file)
+
+
+@pytest.fixture
+def dhcp_db(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_pool_utilization import (
+        DhcpPoolUtilization,
+    )
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_leases import DnsmasqLeaseStore
+
+    for cls in (RouterShellDB, DnsmasqLeaseStore, DhcpPoolUtilization):
+        Singleton._instances.pop(cls, None)
+
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouterConfigurationDatabase.rsdb = RouterShellDB()
+
+    lease_file = tmp_path / "dnsmasq.leases"
+    store = DnsmasqLeaseStore(lease_file)
+
+    yield lease_file
+
+    store.close()
+
+    for cls in (DnsmasqLeaseStore, DhcpPoolUtilization):
+        Singleton._instances.pop(cls, None)
+
+
+def test_bitmap_allocator_next_free() -> None:
+    from routershell.lib.common.bitmap_allocator import BitmapAllocator
+
+    allocator = BitmapAllocator(1, 3)
+
+    assert allocator.next_free() == 1 and len(allocator) == 0
+    assert allocator.reserve(1) and allocator.reserve(3)
+    assert allocator.next_free() == 2 == allocator.allocate()
+    assert allocator.next_free() is None
+
+
+def test_dhcp_pool_utilization(dhcp_db: Path, caplog, capsys) -> None:
+    from routershell.lib.cli.show.dhcp_show import DHCPServerShow
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_pool_utilization import (
+        DhcpPoolUtilization,
+    )
+
+    dsd = DHCPServerDatabase()
+
+    assert dsd.add_dhcp_pool_name_db("LAN") == STATUS_OK
+    assert dsd.add_dhcp_pool_subnet_db("LAN", "192.168.1.0/24") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("192.168.1.0/24", "192.168.1.10", "192.168.1.13",
+                                                     "255.255.255.0") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("192.168.1.0/24", "192.168.1.100", "192.168.1.103",
+                                                     "255.255.255.0") == STATUS_OK
+    assert dsd.add_dhcp_subnet_reservation_db("192.168.1.0/24", "aa:bb:cc:00:00:09", "192.168.1.11") == STATUS_OK
+    assert dsd.add_dhcp_pool_name_db("LAN6") == STATUS_OK
+    assert dsd.add_dhcp_pool_subnet_db("LAN6", "2001:db8::/64") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("2001:db8::/64", "2001:db8::1", "2001:db8::ffff:ffff:ffff",
+                                                     "/64") == STATUS_OK
+
+    assert dsd.update_dhcp_pool_utilization_alert_db("LAN", 60) == STATUS_OK
+    assert dsd.update_dhcp_pool_utilization_alert_db("WAN", 60) == STATUS_NOK
+    assert dsd.get_dhcp_pool_utilization_alert_db("LAN") == 60
+
+    rewrite(dhcp_db, ["0 aa:bb:cc:00:00:01 192.168.1.10 a *",
+                      "0 aa:bb:cc:00:00:09 192.168.1.11 b *",
+                      "0 1 2001:db8::1 c *"])
+
+    utilization = DhcpPoolUtilization()
+    lan, lan6 = utilization.utilization()
+
+    assert [(r.size, r.leased, r.reserved, r.used, r.next_free) for r in lan.ranges] == [
+        (4, 2, 1, 2, "192.168.1.12"), (4, 0, 0, 0, "192.168.1.100")]
+    assert (lan.size, lan.used, lan.free, lan.percent, lan.next_free, lan.alert) == (
+        8, 2, 6, 25.0, "192.168.1.12", False)
+    assert (lan6.size, lan6.used, lan6.next_free, lan6.alert_percent) == (2 ** 48 - 1, 1, "2001:db8::2", None)
+
+    with caplog.at_level(logging.WARNING):
+        rewrite(dhcp_db, ["0 aa:bb:cc:00:00:01 192.168.1.10 a *",
+                          "0 aa:bb:cc:00:00:02 192.168.1.12 d *",
+                          "0 aa:bb:cc:00:00:03 192.168.1.13 e *",
+                          "0 aa:bb:cc:00:00:04 192.168.1.100 f *",
+                          "0 aa:bb:cc:00:00:05 192.168.1.101 g *"])
+        [lan] = utilization.utilization("LAN")
+
+    # The reservation stays used once its lease is gone
+    assert [(r.leased, r.used, r.next_free) for r in lan.ranges] == [(3, 4, None), (2, 2, "192.168.1.102")]
+    assert (lan.percent, lan.alert) == (75.0, True)
+    assert [record.message for record in caplog.records if "alert threshold" in record.message] == [
+        "DHCP pool LAN utilization 75.0% exceeds the 60% alert threshold, 2 addresses free"]
+    assert utilization.utilization("WAN") == []
+
+    DHCPServerShow().utilization(["LAN", "utilization"])
+    total = next(line for line in capsys.readouterr().out.splitlines() if "Total" in line).split()
+
+    assert total == ["LAN", "Total", "8", "5", "1", "2", "75", "192.168.1.102", "60%", "EXCEEDED"]
+    assert " utilization alert 60" in RouterConfiguration()._get_global_dhcp_server_config()
+
+
+def test_utilization_alert_is_raised_without_a_show_command(dhcp_db: Path, caplog) -> None:
+    import time
+
+    from routershell.lib.common.config_change_bus import ConfigChangeBus
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.dhcp_server_db import DHCPServerDatabase
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_pool_utilization import (
+        DhcpPoolUtilization,
+    )
+    from routershell.lib.network_manager.network_operations.dhcp.server.dhcp_server import DHCPServer
+
+    Singleton._instances.pop(ConfigChangeBus, None)
+    dsd = DHCPServerDatabase()
+
+    assert dsd.add_dhcp_pool_name_db("LAN") == STATUS_OK
+    assert dsd.add_dhcp_pool_subnet_db("LAN", "192.168.1.0/24") == STATUS_OK
+    assert dsd.add_dhcp_subnet_inet_address_range_db("192.168.1.0/24", "192.168.1.10", "192.168.1.13",
+                                                     "255.255.255.0") == STATUS_OK
+
+    rewrite(dhcp_db, ["0 aa:bb:cc:00:00:01 192.168.1.10 a *"])
+    assert DHCPServer().update_dhcp_pool_utilization_alert("LAN", 50) == STATUS_OK
+
+    try:
+        with caplog.at_level(logging.WARNING):
+            rewrite(dhcp_db, ["0 aa:bb:cc:00:00:01 192.168.1.10 a *",
+                              "0 aa:bb:cc:00:00:02 192.168.1.11 b *",
+                              "0 aa:bb:cc:00:00:03 192.168.1.12 c *"])
+
+            deadline = time.monotonic() + 2 * DhcpPoolUtilization.POLL_INTERVAL
+
+            while "alert threshold" not in caplog.text and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+        assert [record.message for record in caplog.records if "alert threshold" in record.message] == [
+            "DHCP pool LAN utilization 75.0% exceeds the 50% alert threshold, 1 addresses free"]
+
+    finally:
+        DhcpPoolUtilization().stop()
+        Singleton._instances.pop(ConfigChangeBus, None)
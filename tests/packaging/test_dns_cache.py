@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+@pytest.fixture
+def dns_db(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.dns_db import DnsDB
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouterConfigurationDatabase.rsdb = DnsDB.rsdb = RouterShellDB()
+
+
+def test_dns_cache_settings_are_rendered_and_applied(dns_db, monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.network_manager.network_operations.dns_cache import (
+        DnsCache,
+        DnsCacheSetting,
+        DnsCacheSettings,
+    )
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqGlobalService, DNSMasqRunStatus
+
+    monkeypatch.setattr(DNSMasqGlobalService, "DNSMASQ_CONFIG_DIR", str(tmp_path))
+    calls = []
+    status = {"running": DNSMasqRunStatus.RUNNING, "restart": STATUS_OK}
+    monkeypatch.setattr(DNSMasqGlobalService, "check_dnsmasq_status", lambda self: status["running"])
+    monkeypatch.setattr(DNSMasqGlobalService, "control_service",
+                        lambda self, action: calls.append(action.value) or status["restart"])
+
+    assert DnsCache.parse_cache_setting(["size", "2000"]) == (DnsCacheSetting.SIZE, 2000)
+    assert DnsCache.parse_cache_setting(["negative"], negate=True) == (DnsCacheSetting.NEGATIVE, False)
+    assert DnsCache.parse_cache_setting(["ttl"], negate=True) == (DnsCacheSetting.TTL, None)
+
+    for args in ([], ["size"], ["size", "10001"], ["ttl", "3601"], ["forward-max", "0"], ["negative", "1"], ["hits"]):
+        with pytest.raises(ValueError):
+            DnsCache.parse_cache_setting(args)
+
+    cache = DnsCache()
+    config = tmp_path / "dnsmasq.conf"
+
+    assert cache.set_cache_setting(DnsCacheSetting.SIZE, 2000) == STATUS_OK
+    assert cache.set_cache_setting(DnsCacheSetting.NEGATIVE, False) == STATUS_OK
+    assert cache.set_cache_setting(DnsCacheSetting.TTL, 60) == STATUS_OK
+    assert cache.set_cache_setting(DnsCacheSetting.FORWARD_MAX, 300) == STATUS_OK
+    assert config.read_text().splitlines() == ["port=5353", "cache-size=2000", "no-negcache", "min-cache-ttl=60",
+                                               "dns-forward-max=300"]
+    assert calls == ["restart"] * 4
+
+    # An unchanged setting is not re-applied, a stopped dnsmasq is not started
+    assert cache.set_cache_setting(DnsCacheSetting.SIZE, 2000) == STATUS_OK and len(calls) == 4
+    status["running"] = DNSMasqRunStatus.STOPPED
+    assert cache.set_cache_setting(DnsCacheSetting.TTL, None) == STATUS_OK and len(calls) == 4
+    assert "min-cache-ttl=60" not in config.read_text()
+
+    assert cache.get_settings() == DnsCacheSettings(2000, False, None, 300)
+    assert [line for line in RouterConfiguration().get_running_configuration() if "dns" in line] == [
+        "ip dns cache size 2000", "no ip dns cache negative", "ip dns cache forward-max 300"]
+
+    # A setting dnsmasq fails to restart with is rolled back
+    status.update(running=DNSMasqRunStatus.RUNNING, restart=STATUS_NOK)
+    assert cache.set_cache_setting(DnsCacheSetting.SIZE, 0) == STATUS_NOK
+    assert cache.get_settings().cache_size == 2000 and "cache-size=2000" in config.read_text()
+
+
+CHAOS_ANSWERS = {
+    "cachesize.bind": ["2000"],
+    "insertions.bind": ["412"],
+    "evictions.bind": ["7"],
+    "misses.bind": ["430"],
+    "hits.bind": ["1290"],
+    "servers.bind": ["9.9.9.9#53 300 2", "1.1.1.1#53 130 0"],
+}
+
+
+def serve_chaos(sock: socket.socket, stop: threading.Event) -> None:
+    sock.settimeout(0.05)
+
+    while not stop.is_set():
+        try:
+            query, client = sock.recvfrom(512)
+        except TimeoutError:
+            continue
+
+        query_id = struct.unpack_from("!H", query)[0]
+        offset, labels = 12, []
+
+        while query[offset]:
+            labels.append(query[offset + 1:offset + 1 + query[offset]].decode())
+            offset += query[offset] + 1
+
+        question = query[12:offset + 5]
+        records = CHAOS_ANSWERS.get(".".join(labels))
+
+        if records is None:
+            sock.sendto(struct.pack("!HHHHHH", query_id, 0x8405, 1, 0, 0, 0) + question, client)
+            continue
+
+        # Like dnsmasq, one TXT record holding a character-string per counter (per server),
+        # the owner name a compression pointer to the question
+        data = b"".join(bytes([len(record)]) + record.encode() for record in records)
+        answer = struct.pack("!HHHIH", 0xC00C, 16, 3, 0, len(data)) + data
+
+        sock.sendto(struct.pack("!HHHHHH", query_id, 0x8400, 1, 1, 0, 0) + question + answer, client)
+
+
+def test_dnsmasq_statistics_are_read_through_chaos_queries() -> None:
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq_statistics import (
+        DNSMasqServerStatistics,
+        DNSMasqStatistics,
+        DNSMasqStatisticsError,
+    )
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    stop = threading.Event()
+    thread = threading.Thread(target=serve_chaos, args=(server, stop), daemon=True)
+    thread.start()
+
+    try:
+        statistics = DNSMasqStatistics(port=server.getsockname()[1], timeout=2).get_statistics()
+    finally:
+        stop.set()
+        thread.join()
+        server.close()
+
+    assert statistics[:6] == (2000, 412, 7, 430, 1290, None)
+    assert statistics.servers == [DNSMasqServerStatistics("9.9.9.9#53", 300, 2),
+                                  DNSMasqServerStatistics("1.1.1.1#53", 130, 0)]
+    assert statistics.hit_ratio == 1290 / 1720
+
+    query = DNSMasqStatistics.build_query(0x1234, "hits.bind")
+    assert query == bytes.fromhex("123400000001000000000000") + b"\x04hits\x04bind\x00" + bytes.fromhex("00100003")
+
+    with pytest.raises(ValueError):
+        DNSMasqStatistics.parse_response(query)
+
+    unused = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    unused.bind(("127.0.0.1", 0))
+    port = unused.getsockname()[1]
+    unused.close()
+
+    with pytest.raises(DNSMasqStatisticsError):
+        DNSMasqStatistics(port=port, timeout=0.2).get_statistics()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+
+def test_atomic_file_writes_only_changed_content(tmp_path: Path) -> None:
+    from routershell.lib.common.atomic_file import AtomicFile
+
+    path = tmp_path / "conf.d" / "pool.conf"
+
+    assert AtomicFile.read(path) is None
+    assert AtomicFile.write_if_changed(path, "a\n")
+
+    inode = path.stat().st_ino
+
+    assert not AtomicFile.write_if_changed(path, "a\n")
+    assert path.stat().st_ino == inode
+    assert AtomicFile.write_if_changed(path, "b\n")
+    assert path.stat().st_ino != inode
+    assert (AtomicFile.read(path), oct(path.stat().st_mode & 0o777)) == ("b\n", "0o644")
+    assert os.listdir(path.parent) == ["pool.conf"]
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path: Path):
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqInterfaceService, DNSMasqRunStatus
+
+    for attribute in ("DNSMASQ_CONFIG_DIR", "DNSMASQ_HOSTS_DIR", "DNSMASQ_OPTS_DIR"):
+        monkeypatch.setattr(DNSMasqInterfaceService, attribute, str(tmp_path / attribute.lower()))
+
+    calls = []
+    status = {"running": DNSMasqRunStatus.RUNNING, "sighup": STATUS_OK}
+
+    monkeypatch.setattr(DNSMasqInterfaceService, "check_dnsmasq_status", lambda self: status["running"])
+    monkeypatch.setattr(DNSMasqInterfaceService, "reload_dnsmasq",
+                        lambda self: calls.append("sighup") or status["sighup"])
+    monkeypatch.setattr(DNSMasqInterfaceService, "control_service",
+                        lambda self, action: calls.append(action.value) or STATUS_OK)
+
+    def create(hosts: list[str], opts: list[str]) -> DNSMasqInterfaceService:
+        dmis = DNSMasqInterfaceService("LAN", "192.168.1.0/24")
+        dmis.d_masq_if_config.set_listen_interfaces(["Gig0"])
+        dmis.d_masq_if_config.add_dhcp4_range_with_netmask("192.168.1.10", "192.168.1.20", "255.255.255.0", 86400, "LAN")
+        dmis.d_masq_if_config.set_dhcp_hostsdir(dmis._pool_dir(dmis.DNSMASQ_HOSTS_DIR))
+        dmis.dhcp_hosts = hosts
+        dmis.dhcp_opts = opts
+        return dmis
+
+    return create, calls, status
+
+
+def deploy(dmis) -> str:
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqDeploy
+
+    assert not dmis.deploy_configuration(DNSMasqDeploy.INTERFACE)
+    reload = dmis.reload.name
+    assert not dmis.apply_configuration()
+    return reload
+
+
+def test_dnsmasq_deploy_reloads_only_what_changed(service, tmp_path: Path) -> None:
+    from routershell.lib.common.constants import STATUS_NOK
+    from routershell.lib.network_services.dhcp.dnsmasq.dnsmasq import DNSMasqRunStatus
+
+    create, calls, status = service
+    host = "aa:bb:cc:00:00:01,192.168.1.11"
+    option = "tag:LAN,3,192.168.1.1"
+
+    assert deploy(create([host], [option])) == "RESTART" and calls == ["restart"]
+    assert "dhcp-range=set:LAN,192.168.1.10,192.168.1.20,255.255.255.0,86400" in (
+        tmp_path / "dnsmasq_config_dir" / "LAN_dnsmasq.conf").read_text().splitlines()
+    assert (tmp_path / "dnsmasq_hosts_dir" / "LAN" / "hosts").read_text() == f"{host}\n"
+    assert (tmp_path / "dnsmasq_opts_dir" / "LAN" / "opts").read_text() == f"{option}\n"
+
+    # Unchanged, and added reservations are read by dnsmasq from the dhcp-hostsdir
+    assert deploy(create([host], [option])) == "NONE"
+    assert deploy(create([host, "aa:bb:cc:00:00:02,192.168.1.12"], [option])) == "NONE"
+    assert calls == ["restart"]
+
+    # A removed reservation or a changed option needs a SIGHUP, a restart when the SIGHUP fails
+    assert deploy(create([host], [option])) == "SIGHUP" and calls[1:] == ["sighup"]
+    status["sighup"] = STATUS_NOK
+    assert deploy(create([host], ["tag:LAN,3,192.168.1.254"])) == "SIGHUP" and calls[2:] == ["sighup", "restart"]
+
+    # A stopped dnsmasq is started
+    status["running"] = DNSMasqRunStatus.STOPPED
+    assert deploy(create([host], ["tag:LAN,3,192.168.1.254"])) == "NONE" and calls[4:] == ["restart"]
+
+    dmis = create([], [])
+    assert not dmis.clear_configurations()
+    assert dmis.reload.name == "RESTART"
+    assert not (tmp_path / "dnsmasq_hosts_dir" / "LAN").exists()
+    assert os.listdir(tmp_path / "dnsmasq_config_dir") == []
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_bitset_round_trip_and_request_encoding() -> None:
+    from routershell.lib.network_manager.common.ethtool_netlink import EthtoolNetlink
+
+    bitset = EthtoolNetlink.encode_bitset({"rx-gro": True, "rx-lro": False})
+    attributes = EthtoolNetlink._attributes(bitset)
+
+    assert EthtoolNetlink.ETHTOOL_A_BITSET_BITS in attributes
+    assert EthtoolNetlink.parse_bitset(bitset) == frozenset({"rx-gro"})
+
+    header = EthtoolNetlink.encode_header("eth0", EthtoolNetlink.ETHTOOL_FLAG_OMIT_REPLY)
+    nested = EthtoolNetlink._attributes(EthtoolNetlink._attributes(header)[EthtoolNetlink.ETHTOOL_A_HEADER])
+
+    assert bytes(nested[EthtoolNetlink.ETHTOOL_A_HEADER_DEV_NAME]) == b"eth0\0"
+
+    request = EthtoolNetlink.build_request(30, EthtoolNetlink.ETHTOOL_MSG_RINGS_SET, 7, header)
+    messages = list(EthtoolNetlink.iter_messages(request))
+
+    assert [message_type for message_type, _ in messages] == [30]
+    assert bytes(messages[0][1][:1]) == bytes([EthtoolNetlink.ETHTOOL_MSG_RINGS_SET])
+
+
+def test_offload_and_coalesce_profiles() -> None:
+    from routershell.lib.network_manager.common.ethtool_netlink import EthtoolNetlink
+    from routershell.lib.network_manager.common.phy import CoalesceProfile, Offload
+
+    assert Offload.GRO.feature_names() == ("rx-gro",)
+    assert "tx-tcp6-segmentation" in Offload.TSO.feature_names()
+
+    assert CoalesceProfile.LATENCY.settings()[EthtoolNetlink.ETHTOOL_A_COALESCE_RX_USECS] == 0
+    assert CoalesceProfile.ADAPTIVE.settings()[EthtoolNetlink.ETHTOOL_A_COALESCE_USE_ADAPTIVE_RX] == 1
+
+
+def test_socket_errors_are_reported_as_ethtool_errors(monkeypatch) -> None:
+    import errno
+    import socket
+
+    import pytest
+
+    from routershell.lib.common.constants import STATUS_NOK
+    from routershell.lib.network_manager.common.ethtool_netlink import EthtoolError, EthtoolNetlink
+    from routershell.lib.network_manager.common.phy import Offload, PhyServiceLayer
+
+    class _OverrunSocket(socket.socket):
+        def send(self, data: bytes, flags: int = 0) -> int:
+            return len(data)
+
+        def recv(self, bufsize: int, flags: int = 0) -> bytes:
+            raise OSError(errno.ENOBUFS, "No buffer space available")
+
+    monkeypatch.setattr(EthtoolNetlink, "_open_socket", lambda self: _OverrunSocket(socket.AF_INET, socket.SOCK_DGRAM))
+    monkeypatch.setattr(EthtoolNetlink, "_family_id", 20)
+
+    with pytest.raises(EthtoolError) as error:
+        EthtoolNetlink().get_features("eth0")
+
+    assert error.value.error_code == errno.ENOBUFS
+    assert PhyServiceLayer().set_offload("eth0", Offload.GRO, True) == STATUS_NOK
+
+
+def test_nic_options_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    InterfaceDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    interface_db = InterfaceDatabase()
+    rcdb = RouterConfigurationDatabase()
+
+    assert rsdb.insert_interface("Gig1", InterfaceType.ETHERNET).status == STATUS_OK
+    assert interface_db.update_db_nic_options("Gig9", {"Gro": True}) == STATUS_NOK
+    assert interface_db.update_db_nic_options("Gig1", {"Speed": 10}) == STATUS_NOK
+    assert rcdb.get_interface_nic_configuration("Gig1") == (STATUS_OK, [])
+
+    assert interface_db.update_db_nic_options("Gig1", {"Gro": False, "Tso": True}) == STATUS_OK
+    assert interface_db.update_db_nic_options("Gig1", {"RingRx": "max", "Coalesce": "latency"}) == STATUS_OK
+
+    status, lines = rcdb.get_interface_nic_configuration("Gig1")
+
+    assert status == STATUS_OK
+    assert [line for entry in lines for line in entry.values()] == [
+        "no offload gro", "offload tso", "ring rx max", "coalesce latency"]
+
+    assert interface_db.update_db_nic_options("Gig1", {"Gro": None, "Tso": None, "RingRx": None, "Coalesce": None}) == STATUS_OK
+    assert rcdb.get_interface_nic_configuration("Gig1") == (STATUS_OK, [])
+
+
+def test_features_over_veth_in_a_network_namespace() -> None:
+    import pytest
+
+    if os.geteuid() != 0 or shutil.which("ip") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    netns = f"rs-eth-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    script = (
+        "from routershell.lib.network_manager.common.ethtool_netlink import EthtoolNetlink\n"
+        "ethtool = EthtoolNetlink()\n"
+        "ethtool.set_features('v0', {'rx-gro': True})\n"
+        "assert 'rx-gro' in ethtool.get_features('v0').active\n"
+        "ethtool.set_features('v0', {'rx-gro': False})\n"
+        "assert 'rx-gro' not in ethtool.get_features('v0').active\n"
+    )
+
+    try:
+        assert subprocess.run(["ip", "-n", netns, "link", "add", "v0", "type", "veth", "peer", "name", "v1"],
+                              capture_output=True).returncode == 0
+
+        result = subprocess.run(["ip", "netns", "exec", netns, sys.executable, "-c", script],
+                                capture_output=True, text=True, env={**os.environ, "PYTHONPATH": "src"})
+
+        if "ethtool netlink family is not available" in result.stderr:
+            pytest.skip("ethtool netlink is not available in this kernel")
+
+        assert result.returncode == 0, result.stderr
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
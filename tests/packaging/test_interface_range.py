@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def _fresh_db(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.db.vlan_db import VlanDatabase
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    InterfaceDatabase.rsdb = rsdb
+    VlanDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+    return rsdb
+
+
+def test_interface_range_parses_and_compresses() -> None:
+    import pytest
+
+    from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
+
+    assert InterfaceRange.parse("Gig0-3,8, eth1-2,5") == ["Gig0", "Gig1", "Gig2", "Gig3", "Gig8", "eth1", "eth2", "eth5"]
+    assert InterfaceRange.compress(["Gig3", "Gig0", "Gig1", "Gig2", "Gig8", "eth1"]) == "Gig0-3,8,eth1"
+    assert InterfaceRange.compress(["Gig1", "br-lan"]) is None
+
+    with pytest.raises(ValueError):
+        InterfaceRange.parse("0-3")
+
+    with pytest.raises(ValueError):
+        InterfaceRange.parse("Gig3-0")
+
+
+def test_range_is_validated_and_written_in_one_transaction(monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.vlan_db import VlanDatabase
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    rsdb = _fresh_db(monkeypatch, tmp_path)
+
+    for interface_name in ("Gig0", "Gig1", "Gig2"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+
+    assert InterfaceDatabase().get_db_existing_interfaces(["Gig0", "Gig1", "Gig7"]) == ["Gig0", "Gig1"]
+
+    assert InterfaceDatabase().update_db_range_shutdown_status(["Gig0", "Gig1"], False) == STATUS_OK
+    assert InterfaceDatabase().update_db_range_shutdown_status(["Gig2", "Gig7"], False) == STATUS_NOK
+    assert InterfaceDatabase().update_db_range_description(["Gig0", "Gig1"], "uplink") == STATUS_OK
+
+    assert VlanDatabase().add_vlan_ids([100, 101, 102, 300]) == STATUS_OK
+    assert VlanDatabase().add_vlan_ids([101, 102]) == STATUS_OK
+    assert VlanDatabase().add_interfaces_to_vlan(100, ["Gig0", "Gig1"]) == STATUS_OK
+
+    configs = [rsdb.select_interface_configuration(interface_name).result for interface_name in ("Gig0", "Gig1", "Gig2")]
+
+    assert [config["Shutdown"] for config in configs] == ["no shutdown", "no shutdown", "shutdown"]
+    assert [config["Description"] for config in configs] == ["description uplink", "description uplink", None]
+
+
+def test_running_configuration_compresses_ranges(monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.db.interface_db import InterfaceDatabase
+    from routershell.lib.db.vlan_db import VlanDatabase
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    rsdb = _fresh_db(monkeypatch, tmp_path)
+
+    for interface_name in ("Gig0", "Gig1", "Gig2", "Gig5"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+
+    assert InterfaceDatabase().update_db_range_description(["Gig0", "Gig1", "Gig2"], "access") == STATUS_OK
+    assert VlanDatabase().add_vlan_ids([100, 101, 102, 300]) == STATUS_OK
+    assert VlanDatabase().add_vlan_ids([200]) == STATUS_OK
+    assert VlanDatabase().update_vlans_description([200], "voice") == STATUS_OK
+
+    vlan_lines = RouterConfiguration()._get_global_vlan_config(compress_ranges=True)
+
+    assert "vlan 100-102,300" in vlan_lines
+    assert "vlan 200" in vlan_lines and " description voice" in vlan_lines
+    assert "vlan 101" not in vlan_lines
+    assert "vlan 101" in RouterConfiguration()._get_global_vlan_config()
+
+    interface_lines = RouterConfiguration()._get_interface_settings(compress_ranges=True)
+
+    assert "interface range Gig0-2" in interface_lines
+    assert "interface Gig5" in interface_lines
+    assert "interface Gig1" not in interface_lines
+
+
+def test_access_vlan_is_one_batch_and_stored_after_the_kernel_accepted_it(monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.db.vlan_db import VlanDatabase
+    from routershell.lib.network_manager.common.interface import InterfaceType
+    from routershell.lib.network_manager.common.run_commands import RunCommand, RunResult
+    from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
+
+    rsdb = _fresh_db(monkeypatch, tmp_path)
+
+    assert rsdb.insert_interface_bridge("br0").status == STATUS_OK
+    assert rsdb.update_bridge("br0", vlan_filtering=True).status == STATUS_OK
+
+    for interface_name in ("Gig1", "Gig2", "Gig3"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+
+    assert rsdb.insert_interface_bridge_group("Gig1", "br0").status == STATUS_OK
+    assert VlanDatabase().add_vlan_ids([10, 200]) == STATUS_OK
+    assert VlanDatabase().add_interfaces_to_vlan(10, ["Gig1"]) == STATUS_OK
+
+    commands: list[tuple[str, str]] = []
+    failing: set[str] = set()
+
+    def run(self, command, suppress_error=False, shell=False, sudo=True, stdin=None):
+        commands.append((" ".join(command), stdin or ""))
+        exit_code = 1 if " ".join(command[:2]) in failing else 0
+        return RunResult("[]" if command[:2] == ["bridge", "-j"] else "", "", exit_code, command)
+
+    monkeypatch.setattr(RunCommand, "run", run)
+    monkeypatch.setattr(InterfaceRange, "does_os_interface_exist", lambda self, name, *args: name == "Gig3.200")
+
+    def access_vlans() -> dict[str, int | None]:
+        return {row["InterfaceName"]: row["VlanID"] for row in VlanDatabase().get_bridge_port_vlans("br0")}
+
+    interface_range = InterfaceRange(["Gig1", "Gig2", "Gig3"])
+
+    # The bridge rejects the batch: the created subinterface and the bridge table are rolled back
+    failing.add("bridge -batch")
+    assert interface_range.set_access_vlan(200) == STATUS_NOK
+    assert access_vlans() == {"Gig1": 10}
+    assert commands[0] == ("ip -batch -", "link add link Gig2 name Gig2.200 type vlan id 200\n"
+                                          "link set dev Gig2.200 up\nlink set dev Gig3.200 up\n")
+    assert ("bridge -batch -", "vlan add dev Gig1 vid 200 pvid untagged\nvlan add dev br0 vid 200 self\n") in commands
+    assert ("bridge -batch -", "vlan add dev Gig1 vid 10 pvid untagged\nvlan add dev br0 vid 10 self\n") in commands
+    assert commands[-1] == ("ip -force -batch -", "link del dev Gig2.200\n")
+
+    # ip rejects the batch: the bridges are not touched
+    commands.clear()
+    failing = {"ip -batch"}
+    assert interface_range.set_access_vlan(200) == STATUS_NOK
+    assert [command for command, _ in commands] == ["ip -batch -", "ip -force -batch -"]
+
+    failing.clear()
+    commands.clear()
+    assert interface_range.set_access_vlan(200) == STATUS_OK
+    assert [command for command, _ in commands] == ["ip -batch -", "bridge -j vlan show", "bridge -batch -"]
+    assert access_vlans() == {"Gig1": 200}
+
+    rows = rsdb.connection.execute("""
+        SELECT I.InterfaceName, V.VlanID FROM VlanInterfaces AS V JOIN Interfaces AS I ON I.ID = V.Interfaces_FK
+        ORDER BY I.InterfaceName""").fetchall()
+    assert [tuple(row) for row in rows] == [("Gig1", 200), ("Gig2", 200), ("Gig3", 200)]
+
+
+def test_shutdown_is_stored_after_the_kernel_accepted_it(monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.network_manager.common.interface import InterfaceType
+    from routershell.lib.network_manager.common.phy import State
+    from routershell.lib.network_manager.common.run_commands import RunCommand, RunResult
+    from routershell.lib.network_manager.network_operations.interface_range import InterfaceRange
+
+    rsdb = _fresh_db(monkeypatch, tmp_path)
+
+    for interface_name in ("Gig0", "Gig1"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+
+    batches: list[str] = []
+    exit_code = {"ip": 1}
+
+    def run(self, command, suppress_error=False, shell=False, sudo=True, stdin=None):
+        batches.append(stdin or "")
+        return RunResult("", "", exit_code["ip"], command)
+
+    monkeypatch.setattr(RunCommand, "run", run)
+
+    def shutdown() -> list[str]:
+        return [rsdb.select_interface_configuration(name).result["Shutdown"] for name in ("Gig0", "Gig1")]
+
+    assert InterfaceRange(["Gig0", "Gig1"]).update_shutdown(State.UP) == STATUS_NOK
+    assert shutdown() == ["shutdown", "shutdown"]
+
+    exit_code["ip"] = 0
+    assert InterfaceRange(["Gig0", "Gig1"]).update_shutdown(State.UP) == STATUS_OK
+    assert shutdown() == ["no shutdown", "no shutdown"]
+    assert batches[-1] == "link set dev Gig0 up\nlink set dev Gig1 up\n"
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+SYSLOG = [
+    "Jul 26 14:48:40 Router dnsmasq[572]: started, version 2.89",
+    "Jul 26 14:48:41 Router daemon.info dnsmasq-dhcp[573]: DHCPDISCOVER(eth4) 94:c6:91:15:14:3e",
+    "Jul 26 14:48:41 Router daemon.info dnsmasq-dhcp[573]: DHCPOFFER(eth4) 192.168.100.90 94:c6:91:15:14:3e",
+    "Jul 26 14:48:42 Router kernel: eth4: link up",
+    "Jul 26 14:48:43 Router daemon.info dnsmasq-dhcp[573]: DHCPREQUEST(eth4) 192.168.100.90 94:c6:91:15:14:3e",
+    "Jul 26 14:48:43 Router daemon.info dnsmasq-dhcp[573]: DHCPACK(eth4) 192.168.100.90 94:c6:91:15:14:3e host1",
+]
+
+
+def write(path: Path, lines: list[str], mode: str = "w") -> None:
+    with open(path, mode) as log_file:
+        log_file.write("".join(f"{line}\n" for line in lines))
+
+
+def test_syslog_reader_reads_only_new_entries(tmp_path: Path) -> None:
+    from routershell.lib.system.log_reader import SyslogLogReader
+
+    messages = tmp_path / "messages"
+    write(messages, SYSLOG)
+
+    reader = SyslogLogReader(messages, ("dnsmasq-dhcp",))
+    reader.BLOCK_SIZE = 64
+
+    entries = reader.last("show", 3)
+
+    assert [entry.message.split("(")[0] for entry in entries] == ["DHCPOFFER", "DHCPREQUEST", "DHCPACK"]
+    assert (entries[-1].identifier, entries[-1].pid, entries[-1].hostname) == ("dnsmasq-dhcp", 573, "Router")
+    assert str(entries[0]) == "Jul 26 14:48:41 Router dnsmasq-dhcp[573]: DHCPOFFER(eth4) 192.168.100.90 94:c6:91:15:14:3e"
+    assert entries[-1].cursor == f"{messages.stat().st_ino}:{messages.stat().st_size}"
+
+    # Only the appended bytes are read, the unterminated last line once completed
+    reads = []
+    read_after = reader._read_after
+    reader._read_after = lambda cursor: reads.append(cursor) or read_after(cursor)
+
+    with open(messages, "a") as log_file:
+        log_file.write("Jul 26 14:50:00 Router dnsmasq-dhcp[573]: DHCPRELEASE(eth4) 192.168.100.90\n"
+                       "Jul 26 14:50:01 Router dnsmasq-dhcp[573]: DHCPDISC")
+
+    assert [entry.message for entry in reader.last("show", 2)] == [
+        "DHCPACK(eth4) 192.168.100.90 94:c6:91:15:14:3e host1", "DHCPRELEASE(eth4) 192.168.100.90"]
+    assert reads == [entries[-1].cursor]
+
+    with open(messages, "a") as log_file:
+        log_file.write("OVER(eth4) 94:c6:91:15:14:3f\n")
+
+    assert reader.last("show", 1)[0].message == "DHCPDISCOVER(eth4) 94:c6:91:15:14:3f"
+
+    # A deeper view is seeded again, a rotated file is read from its start
+    assert len(reader.last("show", 10)) == 6
+    assert reader.last("other", 1)[0].message == "DHCPDISCOVER(eth4) 94:c6:91:15:14:3f"
+
+    rotated = tmp_path / "messages.new"
+    write(rotated, SYSLOG[4:])
+    os.replace(rotated, messages)
+
+    assert [entry.message.split("(")[0] for entry in reader.last("show", 10)[-3:]] == [
+        "DHCPDISCOVER", "DHCPREQUEST", "DHCPACK"]
+    assert SyslogLogReader(tmp_path / "missing").last("show") == []
+
+
+def test_syslog_reader_follows_new_entries(tmp_path: Path) -> None:
+    from routershell.lib.system.log_reader import SyslogLogReader
+
+    messages = tmp_path / "messages"
+    write(messages, SYSLOG[:2])
+
+    reader = SyslogLogReader(messages, ("dnsmasq-dhcp",), r"DHCP(?:DISCOVER|OFFER|REQUEST|ACK)\(", poll_interval=0.01)
+    stop = threading.Event()
+    followed = []
+
+    for entry in reader.follow("follow", 5, stop):
+        followed.append(entry.message.split("(")[0])
+
+        if len(followed) == 1:
+            write(messages, SYSLOG[2:], "a")
+
+        if len(followed) == 4:
+            stop.set()
+
+    assert followed == ["DHCPDISCOVER", "DHCPOFFER", "DHCPREQUEST", "DHCPACK"]
+
+
+FAKE_JOURNALCTL = textwrap.dedent("""
+    import json, sys
+
+    entries = [json.loads(line) for line in open({journal!r})]
+    args = sys.argv[1:]
+    open({calls!r}, "a").write(" ".join(args) + "\\n")
+
+    identifiers = [arg.split("=", 1)[1] for arg in args if arg.startswith("--identifier=")]
+    entries = [entry for entry in entries if not identifiers or entry["SYSLOG_IDENTIFIER"] in identifiers]
+
+    for arg in args:
+        if arg.startswith("--after-cursor="):
+            cursors = [entry["__CURSOR"] for entry in entries]
+            entries = entries[cursors.index(arg.split("=", 1)[1]) + 1:]
+
+    for entry in reversed(entries) if "--reverse" in args else entries:
+        print(json.dumps(entry), flush=True)
+""")
+
+
+def test_journal_reader_uses_cursors(tmp_path: Path, monkeypatch) -> None:
+    from routershell.lib.network_manager.network_operations.dhcp.client.dhcp_client import DHCPClientLogParser
+    from routershell.lib.system.log_reader import JournalLogReader
+
+    journal = tmp_path / "journal.json"
+    calls = tmp_path / "calls"
+
+    def log(*records: tuple[str, str]) -> None:
+        with open(journal, "a") as journal_file:
+            for identifier, message in records:
+                index = sum(1 for _ in open(journal)) if journal.exists() else 0
+                journal_file.write(json.dumps({"__CURSOR": f"s=1;i={index}", "__REALTIME_TIMESTAMP": "1722005321000000",
+                                               "_HOSTNAME": "Router", "SYSLOG_IDENTIFIER": identifier,
+                                               "SYSLOG_PID": "573", "MESSAGE": message}) + "\n")
+                journal_file.flush()
+
+    log(("dnsmasq", "started"), ("dnsmasq-dhcp", "DHCPDISCOVER(eth4) 94:c6:91:15:14:3e"),
+        ("dnsmasq-dhcp", "DHCPOFFER(eth4) 192.168.100.90 94:c6:91:15:14:3e"))
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "journalctl"
+    script.write_text(f"#!{sys.executable}\n" + FAKE_JOURNALCTL.format(journal=str(journal), calls=str(calls)))
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    reader = JournalLogReader(("dnsmasq-dhcp",))
+    entries = reader.last("show", 2)
+
+    assert [entry.message for entry in entries] == ["DHCPDISCOVER(eth4) 94:c6:91:15:14:3e",
+                                                    "DHCPOFFER(eth4) 192.168.100.90 94:c6:91:15:14:3e"]
+    assert (entries[-1].pid, entries[-1].cursor) == (573, "s=1;i=2")
+    assert DHCPClientLogParser.parse_entry(entries[-1])["ip_address"] == "192.168.100.90"
+
+    log(("dnsmasq-dhcp", "DHCPREQUEST(eth4) 192.168.100.90 94:c6:91:15:14:3e"), ("dnsmasq", "read /etc/hosts"))
+
+    assert [entry.cursor for entry in reader.last("show", 2)] == ["s=1;i=2", "s=1;i=3"]
+    assert calls.read_text().splitlines() == [
+        "--no-pager --output=json --reverse --identifier=dnsmasq-dhcp",
+        "--no-pager --output=json --after-cursor=s=1;i=2 --identifier=dnsmasq-dhcp"]
+
+    assert JournalLogReader.parse_entry('{"MESSAGE": "no cursor"}') is None
+    assert JournalLogReader.parse_entry('{"__CURSOR": "c", "MESSAGE": [104, 105]}').message == "hi"
+
+
+def test_log_show_arguments() -> None:
+    from routershell.lib.cli.show.log_show import LogShow
+
+    assert LogShow.parse_args(None) == (20, False)
+    assert LogShow.parse_args(["last", "5"]) == (5, False)
+    assert LogShow.parse_args(["follow"]) == (20, True)
+
+    for args in (["last"], ["last", "0"], ["last", "x"], ["tail"]):
+        with pytest.raises(ValueError):
+            LogShow.parse_args(args)
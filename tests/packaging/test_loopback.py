@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+import uuid
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_bitmap_allocator_hands_out_lowest_free_value() -> None:
+    from routershell.lib.common.bitmap_allocator import BitmapAllocator
+
+    allocator = BitmapAllocator(10, 14)
+
+    assert allocator.reserve(10) and allocator.reserve(12)
+    assert not allocator.reserve(12) and not allocator.reserve(20)
+    assert [allocator.allocate() for _ in range(4)] == [11, 13, 14, None]
+
+    allocator.release(12)
+    allocator.release(99)
+
+    assert 12 not in allocator and 13 in allocator
+    assert (len(allocator), allocator.size()) == (4, 5)
+    assert allocator.allocate() == 12
+
+    with pytest.raises(ValueError):
+        BitmapAllocator(2, 1)
+
+
+def test_explicit_loopback_addresses_are_not_auto_assigned(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.network_manager.common.run_commands import RunResult
+    from routershell.lib.network_manager.network_operations.interface import Interface
+
+    addresses = [{"ifname": "lo", "addr_info": [{"local": "127.0.0.1", "prefixlen": 8}]}]
+
+    def run(self, command: list[str], suppress_error: bool = False, shell: bool = False, sudo: bool = True,
+            stdin: str | None = None) -> RunResult:
+        return RunResult(json.dumps(addresses) if "-json" in command else "", "", 0, command)
+
+    monkeypatch.setattr(Interface, "run", run)
+    monkeypatch.setattr(Interface, "_loopback_addresses", None)
+
+    interface = Interface()
+
+    assert interface.get_next_loopback_address() == "127.0.0.2/32"
+    assert not interface.set_inet_address_loopback("loopback3", "127.0.0.3/32")
+    assert not interface.set_inet_address_loopback("loopback3", "2001:db8::3/128")
+    assert interface.get_next_loopback_address() == "127.0.0.4/32"
+
+    assert not interface.del_inet_address_loopback("loopback3", "127.0.0.3/32")
+    assert interface.get_next_loopback_address() == "127.0.0.3/32"
+
+
+LOOPBACK_SCRIPT = textwrap.dedent("""
+    import json, subprocess
+
+    from routershell.lib.network_manager.common.interface import InterfaceType
+    from routershell.lib.network_manager.common.run_commands import RunCommand
+    from routershell.lib.network_manager.network_operations.interface import Interface
+
+    # The namespace runs as root without sudo
+    run = RunCommand.run
+    RunCommand.run = lambda self, command, suppress_error=False, shell=False, sudo=True, stdin=None: run(
+        self, command, suppress_error, shell, False, stdin)
+
+    def addresses(interface_name):
+        output = subprocess.run(["ip", "-json", "-4", "addr", "show", "dev", interface_name],
+                                capture_output=True, text=True).stdout
+        return [f"{info['local']}/{info['prefixlen']}" for link in json.loads(output) for info in link["addr_info"]]
+
+    subprocess.run(["ip", "link", "set", "lo", "up"], check=True)
+    subprocess.run(["ip", "addr", "add", "10.10.10.1/32", "label", "lo:loopback1", "dev", "lo"], check=True)
+
+    interface = Interface()
+    result = {"labels": sorted(set(interface.get_os_lo_labels()))}
+
+    assert not interface.migrate_os_lo_labels()
+    result["migrated"] = [addresses("lo"), addresses("loopback1")]
+
+    assert not interface.update_interface_loopback_inet("loopback2")
+    assert not interface.create_os_loopback("loopback3", "10.10.10.3")
+    assert interface.create_os_loopback("loopback3")
+    result["auto"] = addresses("loopback2")
+    result["next"] = interface.get_next_loopback_address()
+
+    result["exists"] = [interface.does_os_interface_exist("loopback2"),
+                        interface.does_os_interface_exist("loopback2", include_loopbacks=False),
+                        interface.does_os_interface_exist("loopback9")]
+    result["type"] = interface.get_os_interface_type("loopback3").value
+    result["loopbacks"] = interface.get_os_network_interfaces(InterfaceType.LOOPBACK)
+    result["others"] = interface.get_os_network_interfaces()
+
+    assert not interface.destroy_os_loopback("loopback2")
+    result["reused"] = interface.get_next_loopback_address()
+    result["destroyed"] = interface.get_os_ifindex("loopback2")
+
+    print(json.dumps(result))
+""")
+
+
+def test_loopbacks_are_dummy_interfaces_in_a_network_namespace(tmp_path: Path) -> None:
+    if os.geteuid() != 0 or shutil.which("ip") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    netns = f"rs-lo-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    try:
+        if subprocess.run(["ip", "-n", netns, "link", "add", "probe0", "type", "dummy"], capture_output=True).returncode:
+            pytest.skip("dummy interfaces are not available in this kernel")
+
+        assert subprocess.run(["ip", "-n", netns, "link", "del", "probe0"]).returncode == 0
+
+        source = str(Path(__file__).resolve().parents[2] / "src")
+        result = subprocess.run(["ip", "netns", "exec", netns, sys.executable, "-c", LOOPBACK_SCRIPT],
+                                capture_output=True, text=True, timeout=30,
+                                env={**os.environ, "PYTHONPATH": source,
+                                     TEST_DB_FILE_ENV: str(tmp_path / "routershell.db")})
+
+        assert result.returncode == 0, result.stderr
+
+        outcome = json.loads(result.stdout.splitlines()[-1])
+
+        assert outcome["labels"] == ["lo", "loopback1"]
+        assert outcome["migrated"] == [["127.0.0.1/8"], ["10.10.10.1/32"]]
+        assert outcome["auto"] == ["127.0.0.2/32"]
+        assert outcome["next"] == "127.0.0.3/32"
+        assert outcome["exists"] == [True, False, False]
+        assert outcome["type"] == "loopback"
+        assert outcome["loopbacks"] == ["lo", "loopback1", "loopback2", "loopback3"]
+        assert outcome["others"] == []
+        assert outcome["reused"] == "127.0.0.2/32"
+        assert outcome["destroyed"] is None
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+
+def test_nftables_ruleset_replaces_table_in_one_document() -> None:
+    from routershell.lib.network_manager.network_operations.nat_ruleset import (
+        NatPoolBinding,
+        NatRuleset,
+        NatRulesetBackend,
+    )
+
+    bindings = [NatPoolBinding("pool1", ["Gig0", "Gig2"], ["Gig1"])]
+    ruleset = NatRuleset.compile(bindings, NatRulesetBackend.NFTABLES)
+    lines = ruleset.splitlines()
+
+    assert lines[0] == "table ip routershell_nat"
+    assert lines[1] == "delete table ip routershell_nat"
+    assert 'oifname "Gig1" masquerade comment "nat-pool pool1"' in ruleset
+    assert 'iifname { "Gig0", "Gig2" } oifname "Gig1" accept comment "nat-pool pool1"' in ruleset
+    assert ruleset.count("ct state established,related accept") == 2
+
+
+def test_iptables_restore_ruleset_only_appends_missing_jumps() -> None:
+    from routershell.lib.network_manager.network_operations.nat_ruleset import (
+        NatPoolBinding,
+        NatRuleset,
+        NatRulesetBackend,
+    )
+
+    iptables_save = "*nat\n-A POSTROUTING -j RS-NAT-POSTROUTING\nCOMMIT\n*filter\n-A INPUT -j RS-NAT-INPUT\nCOMMIT\n"
+    existing = NatRuleset.parse_iptables_save_jumps(iptables_save)
+
+    assert existing == {("nat", "POSTROUTING", "RS-NAT-POSTROUTING"), ("filter", "INPUT", "RS-NAT-INPUT")}
+
+    ruleset = NatRuleset.compile([NatPoolBinding("pool1", ["Gig0"], ["Gig1"])], NatRulesetBackend.IPTABLES, existing)
+
+    assert "-A RS-NAT-POSTROUTING -o Gig1 -j MASQUERADE" in ruleset
+    assert "-A RS-NAT-FORWARD -i Gig0 -o Gig1 -j ACCEPT" in ruleset
+    assert "-A FORWARD -j RS-NAT-FORWARD" in ruleset
+    assert "-A POSTROUTING -j RS-NAT-POSTROUTING" not in ruleset
+    assert "-A INPUT -j RS-NAT-INPUT" not in ruleset
+    assert ruleset.count("COMMIT") == 2
+
+
+def test_apply_nat_ruleset_runs_single_transaction(monkeypatch) -> None:
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.db.nat_db import NatDB
+    from routershell.lib.network_manager.common.run_commands import RunResult
+    from routershell.lib.network_manager.network_operations.nat import Nat
+    from routershell.lib.network_manager.network_operations.nat_ruleset import (
+        NatPoolBinding,
+        NatRuleset,
+        NatRulesetBackend,
+    )
+
+    calls = []
+
+    def fake_run(self, command, suppress_error=False, shell=False, sudo=True, stdin=None):
+        calls.append((command, stdin))
+        return RunResult("", "", 0, command)
+
+    monkeypatch.setattr(NatRuleset, "detect_backend", staticmethod(lambda: NatRulesetBackend.NFTABLES))
+    monkeypatch.setattr("shutil.which", lambda command: None)
+    monkeypatch.setattr(Nat, "run", fake_run)
+    monkeypatch.setattr(
+        Nat, "get_nat_pool_bindings", lambda self: [NatPoolBinding("pool1", ["Gig0"], ["Gig1"])]
+    )
+    monkeypatch.setattr(Nat, "get_nat_static_mappings", lambda self: [])
+    monkeypatch.setattr(NatDB, "is_flow_offload_enabled", lambda self: False)
+
+    assert Nat().apply_nat_ruleset() == STATUS_OK
+    assert len(calls) == 1
+    assert calls[0][0] == ["nft", "-f", "-"]
+    assert 'oifname "Gig1" masquerade' in calls[0][1]
+
+
+def test_iptables_backend_is_used_when_the_forward_policy_drops(monkeypatch) -> None:
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.db.nat_db import NatDB
+    from routershell.lib.network_manager.common.run_commands import RunResult
+    from routershell.lib.network_manager.network_operations.nat import Nat
+    from routershell.lib.network_manager.network_operations.nat_ruleset import (
+        NatPoolBinding,
+        NatRuleset,
+        NatRulesetBackend,
+    )
+
+    forward = {"policy": "DROP"}
+    calls = []
+
+    def fake_run(self, command, suppress_error=False, shell=False, sudo=True, stdin=None):
+        calls.append((command, stdin))
+
+        if command == ["iptables", "-S", "FORWARD"]:
+            return RunResult(f"-P FORWARD {forward['policy']}\n-A FORWARD -j DOCKER-USER\n", "", 0, command)
+
+        if command == ["iptables-save"]:
+            return RunResult("*filter\n-A FORWARD -j RS-NAT-FORWARD\nCOMMIT\n", "", 0, command)
+
+        return RunResult("", "", 0, command)
+
+    monkeypatch.setattr(NatRuleset, "detect_backend", staticmethod(lambda: NatRulesetBackend.NFTABLES))
+    monkeypatch.setattr("shutil.which", lambda command: f"/usr/sbin/{command}")
+    monkeypatch.setattr(Nat, "run", fake_run)
+    monkeypatch.setattr(Nat, "get_nat_pool_bindings", lambda self: [NatPoolBinding("pool1", ["Gig0"], ["Gig1"])])
+    monkeypatch.setattr(Nat, "get_nat_static_mappings", lambda self: [])
+    monkeypatch.setattr(NatDB, "is_flow_offload_enabled", lambda self: False)
+
+    assert NatRuleset.parse_iptables_chain_policy("-P FORWARD DROP\n", "FORWARD") == "DROP"
+    assert NatRuleset.parse_iptables_chain_policy("-P INPUT DROP\n", "FORWARD") is None
+
+    # The NAT forward rules are jumped to from the FORWARD chain, the nftables table is removed
+    assert Nat().get_nat_backend() is NatRulesetBackend.IPTABLES
+    calls.clear()
+    assert Nat().apply_nat_ruleset() == STATUS_OK
+
+    restores = [stdin for command, stdin in calls if command == ["iptables-restore", "--noflush"]]
+    assert len(restores) == 1 and "-A RS-NAT-FORWARD -i Gig0 -o Gig1 -j ACCEPT" in restores[0]
+    assert calls[-1] == (["nft", "-f", "-"], "table ip routershell_nat\ndelete table ip routershell_nat\n")
+
+    # Once the policy is ACCEPT again, nftables is used and the iptables chains are emptied
+    forward["policy"] = "ACCEPT"
+    calls.clear()
+    assert Nat().apply_nat_ruleset() == STATUS_OK
+
+    applied = [command for command, _ in calls if command in (["nft", "-f", "-"], ["iptables-restore", "--noflush"])]
+    assert applied == [["nft", "-f", "-"], ["iptables-restore", "--noflush"]]
+    assert "-A RS-NAT-FORWARD" not in calls[-1][1]
+
+
+def test_static_mappings_are_map_elements() -> None:
+    from routershell.lib.network_manager.network_operations.nat import Nat
+    from routershell.lib.network_manager.network_operations.nat_ruleset import NatRuleset, NatRulesetBackend
+
+    port_forward = Nat.parse_static_mapping("tcp 192.168.1.10 8080 203.0.113.1 80".split())
+    one_to_one = Nat.parse_static_mapping("192.168.1.20 203.0.113.2".split())
+
+    ruleset = NatRuleset.compile([], NatRulesetBackend.NFTABLES, static_mappings=[port_forward, one_to_one])
+
+    assert "elements = { 203.0.113.1 . tcp . 80 : 192.168.1.10 . 8080 }" in ruleset
+    assert "elements = { 192.168.1.20 : 203.0.113.2 }" in ruleset
+    assert ruleset.count("map @static_") == 3
+
+    assert NatRuleset.compile_static_mapping_update(port_forward) == (
+        "add element ip routershell_nat static_dnat_port { 203.0.113.1 . tcp . 80 : 192.168.1.10 . 8080 }\n"
+    )
+    assert NatRuleset.compile_static_mapping_update(one_to_one, negate=True) == (
+        "delete element ip routershell_nat static_dnat { 203.0.113.2 }\n"
+        "delete element ip routershell_nat static_snat { 192.168.1.20 }\n"
+    )
+
+
+def test_flow_offload_adds_flowtable_over_nat_interfaces() -> None:
+    from routershell.lib.network_manager.network_operations.nat_ruleset import (
+        NatPoolBinding,
+        NatRuleset,
+        NatRulesetBackend,
+    )
+
+    bindings = [NatPoolBinding("pool1", ["Gig2", "Gig0"], ["Gig1"])]
+
+    assert "flowtable" not in NatRuleset.compile(bindings, NatRulesetBackend.NFTABLES)
+
+    ruleset = NatRuleset.compile(bindings, NatRulesetBackend.NFTABLES, flow_offload=True)
+    forward = ruleset[ruleset.index("chain forward"):]
+
+    assert 'devices = { "Gig0", "Gig1", "Gig2" };' in ruleset
+    assert forward.index('counter name "slow_path_packets"') < forward.index("flow add @nat_offload") < forward.index(
+        "ct state established,related accept")
+    assert "flow add @nat_offload\n" in forward
+    assert "offloaded_flows" not in ruleset
+
+    nft_json = ('{"nftables": [{"metainfo": {"json_schema_version": 1}}, '
+                '{"counter": {"family": "ip", "name": "slow_path_packets", "table": "routershell_nat", '
+                '"handle": 4, "packets": 12, "bytes": 840}}]}')
+
+    assert NatRuleset.parse_nft_counters(nft_json) == {"slow_path_packets": (12, 840)}
+    assert NatRuleset.parse_nft_counters("Error: No such file or directory") == {}
+
+
+def test_offloaded_flows_are_counted_from_conntrack(monkeypatch) -> None:
+    from routershell.lib.network_manager.common.conntrack import Conntrack, ConntrackEntry, ConntrackTuple
+    from routershell.lib.network_manager.network_operations.nat import Nat
+
+    flow = ConntrackTuple(6, "192.168.1.10", "198.51.100.1", 40000, 443)
+    entries = [ConntrackEntry(flow, flow, Conntrack.IPS_SRC_NAT | Conntrack.IPS_OFFLOAD),
+               ConntrackEntry(flow, flow, Conntrack.IPS_SRC_NAT),
+               ConntrackEntry(flow, flow, Conntrack.IPS_OFFLOAD)]
+
+    monkeypatch.setattr(Conntrack, "dump", lambda self, conntrack_filter=None: iter(entries))
+
+    assert Nat().count_offloaded_flows() == 2
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import textwrap
+import uuid
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_multipath_route_request() -> None:
+    from routershell.lib.network_manager.common.rtnetlink import RouteEvent, Rtnetlink
+
+    request = Rtnetlink.build_route_request(9, True, "0.0.0.0/0", table=1000,
+                                            nexthops=[("10.0.1.1", 3, 3), ("10.0.2.1", 4, 1)])
+    body = request[Rtnetlink._NLMSGHDR.size:]
+
+    assert body[4] == Rtnetlink.RT_TABLE_UNSPEC
+    assert Rtnetlink.parse_route(Rtnetlink.RTM_NEWROUTE, body) == RouteEvent("0.0.0.0/0", 1000, 0, None, 0)
+
+    offset = Rtnetlink._RTMSG.size
+    attributes = {}
+
+    while offset < len(body):
+        length, attribute_type = struct.unpack_from("=HH", body, offset)
+        attributes[attribute_type] = body[offset + 4:offset + length]
+        offset += (length + 3) & ~3
+
+    multipath = attributes[Rtnetlink.RTA_MULTIPATH]
+    hops = []
+
+    while multipath:
+        length, _, hops_minus_one, index = Rtnetlink._RTNEXTHOP.unpack_from(multipath)
+        hops.append((index, hops_minus_one + 1, multipath[Rtnetlink._RTNEXTHOP.size + 4:length]))
+        multipath = multipath[length:]
+
+    assert hops == [(3, 3, bytes([10, 0, 1, 1])), (4, 1, bytes([10, 0, 2, 1]))]
+
+
+def test_parse_policy_and_table_route() -> None:
+    from routershell.lib.network_manager.network_operations.policy_routing import PolicyRouting, PolicyRule
+    from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+
+    rule = PolicyRouting.parse_policy("100 from 192.168.10.0/24 fwmark 0x2/0xff iif Gig2 table 101".split())
+
+    assert rule == PolicyRule(100, 101, "192.168.10.0/24", 2, 0xff, "Gig2")
+    assert PolicyRouting.batch_lines(rule, add=True) == [
+        "rule add priority 100 from 192.168.10.0/24 fwmark 0x2/0xff iif Gig2 table 101"]
+    assert PolicyRouting.parse_policy("5 table main".split()) == PolicyRule(5, 254)
+
+    for args in ("100 from 10.0.0.0/8", "0 table 101", "32766 table 101", "100 table 255",
+                 "100 fwmark 0x1/0 table 101", "100 table 101 table 102", "100 tos 4 table 101"):
+        with pytest.raises(ValueError):
+            PolicyRouting.parse_policy(args.split())
+
+    assert Route.parse_static_route("table 101 default 10.0.1.1 weight 3 track 1".split()) == StaticRoute(
+        "0.0.0.0/0", "10.0.1.1", 0, 1, 3, 101)
+
+    for args in ("table 253 default 10.0.1.1", "table", "default 10.0.1.1 weight 257"):
+        with pytest.raises(ValueError):
+            Route.parse_static_route(args.split())
+
+
+def test_policy_routing_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.route_db import RouteDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    RouteDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    route_db = RouteDatabase()
+
+    assert route_db.add_policy_route(110, None, 2, None, None, 102) == STATUS_OK
+    assert route_db.add_policy_route(100, "192.168.10.0/24", None, None, "Gig2", 101) == STATUS_OK
+    assert route_db.add_policy_route(110, None, 2, 0xff, None, 102) == STATUS_OK
+    assert route_db.add_static_route(101, "0.0.0.0/0", "10.0.1.1", 0, None, None) == STATUS_OK
+    assert route_db.add_static_route(254, "0.0.0.0/0", "10.0.1.1", 0, 3, None) == STATUS_OK
+    assert route_db.add_static_route(254, "0.0.0.0/0", "10.0.2.1", 0, 1, None) == STATUS_OK
+
+    assert RouterConfiguration()._get_global_route_config() == [
+        "ip policy 100 from 192.168.10.0/24 iif Gig2 table 101",
+        "ip policy 110 fwmark 0x2/0xff table 102",
+        "ip route table 101 0.0.0.0/0 10.0.1.1",
+        "ip route 0.0.0.0/0 10.0.1.1 weight 3",
+        "ip route 0.0.0.0/0 10.0.2.1 weight 1",
+        "",
+    ]
+
+    assert route_db.del_static_route(101, "0.0.0.0/0", "10.0.2.1", 0) == STATUS_NOK
+    assert route_db.del_policy_route(120) == STATUS_NOK
+    assert route_db.del_policy_route(110) == STATUS_OK
+    assert [row["Priority"] for row in route_db.get_policy_routes()] == [100]
+
+
+def test_failed_policy_replacement_restores_the_previous_rule(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.route_db import RouteDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.run_commands import RunResult
+    from routershell.lib.network_manager.network_operations.policy_routing import PolicyRouting, PolicyRule
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    RouteDatabase.rsdb = RouterShellDB()
+
+    batches: list[str] = []
+
+    def run(command: list[str], suppress_error: bool = False, shell: bool = False, sudo: bool = True,
+            stdin: str | None = None) -> RunResult:
+        batches.append(stdin or "")
+        first_line = (stdin or "").partition("\n")[0]
+        # The kernel rejects rules of table 666, as it would with a missing input interface
+        return RunResult("", "", 2 if first_line.startswith("rule add") and first_line.endswith("table 666") else 0, command)
+
+    policy_routing = PolicyRouting()
+    monkeypatch.setattr(policy_routing, "run", run)
+
+    previous = PolicyRule(100, 101)
+
+    assert policy_routing.add_policy(previous) == STATUS_OK
+    assert policy_routing.add_policy(PolicyRule(100, 102)) == STATUS_OK
+    assert batches[-1] == "rule add priority 100 table 102\nrule del priority 100 table 101\n"
+
+    assert policy_routing.add_policy(PolicyRule(100, 666)) == STATUS_NOK
+    assert policy_routing.get_policies() == [PolicyRule(100, 102)]
+    assert batches[-3:] == ["rule add priority 100 table 666\nrule del priority 100 table 102\n",
+                            "rule del priority 100 table 666\n",
+                            "rule add priority 100 table 102\n"]
+
+    assert policy_routing.add_policy(PolicyRule(110, 666)) == STATUS_NOK
+    assert policy_routing.get_policies() == [PolicyRule(100, 102)]
+
+
+MULTIPATH_SCRIPT = textwrap.dedent("""
+    import json, subprocess, time
+
+    from routershell.lib.network_manager.network_operations.policy_routing import PolicyRouting, PolicyRule
+    from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+    from routershell.lib.network_manager.network_operations.track import TrackConfig, TrackMonitor, TrackType
+
+    def nexthops():
+        output = subprocess.run(["ip", "-json", "-4", "route", "show", "default"], capture_output=True, text=True).stdout
+        routes = json.loads(output)
+        return sorted([hop["gateway"], hop["weight"]] for route in routes
+                      for hop in route.get("nexthops", [{"gateway": route.get("gateway"), "weight": 1}]))
+
+    def wait_for(expected):
+        deadline = time.monotonic() + 1
+        while nexthops() != expected and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return nexthops()
+
+    result = {}
+
+    assert not Route().apply_static_route(StaticRoute("0.0.0.0/0", "10.0.1.1", table=101), add=True)
+    output = subprocess.run(["ip", "-json", "route", "show", "table", "101"], capture_output=True, text=True).stdout
+    result["table"] = [route["gateway"] for route in json.loads(output)]
+
+    def batch(lines):
+        subprocess.run(["ip", "-batch", "-"], input="\\n".join(lines) + "\\n", text=True, check=True)
+
+    rule = PolicyRule(100, 101, "192.168.10.0/24", 2, 0xff, "wan2")
+    batch(PolicyRouting.batch_lines(rule, add=True))
+    output = subprocess.run(["ip", "-json", "rule", "show", "priority", "100"], capture_output=True, text=True).stdout
+    installed = json.loads(output)[0]
+    result["rule"] = [installed["src"], installed["srclen"], installed["fwmark"], installed["fwmask"],
+                      installed["iif"], installed["table"]]
+    batch(PolicyRouting.batch_lines(rule, add=False))
+    result["rule_removed"] = subprocess.run(["ip", "rule", "show", "priority", "100"],
+                                            capture_output=True, text=True).stdout.strip()
+
+    monitor = TrackMonitor()
+    assert not monitor.configure([TrackConfig(1, TrackType.INTERFACE, "wan1")],
+                                 [StaticRoute("0.0.0.0/0", "10.0.1.1", track_id=1, weight=3),
+                                  StaticRoute("0.0.0.0/0", "10.0.2.1", weight=1)])
+    result["initial"] = nexthops()
+
+    subprocess.run(["ip", "link", "set", "wan1p", "down"], check=True)
+    result["failover"] = wait_for([["10.0.2.1", 1]])
+
+    subprocess.run(["ip", "link", "set", "wan1p", "up"], check=True)
+    result["restore"] = wait_for([["10.0.1.1", 3], ["10.0.2.1", 1]])
+
+    print(json.dumps(result))
+""")
+
+
+def test_policy_routing_and_multipath_in_a_network_namespace() -> None:
+    if os.geteuid() != 0 or shutil.which("ip") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    netns = f"rs-pbr-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    try:
+        for uplink, address in (("wan1", "10.0.1.2/24"), ("wan2", "10.0.2.2/24")):
+            assert subprocess.run(["ip", "-n", netns, "link", "add", uplink, "type", "veth",
+                                   "peer", "name", f"{uplink}p"]).returncode == 0
+            assert subprocess.run(["ip", "-n", netns, "addr", "add", address, "dev", uplink]).returncode == 0
+
+            for link in (uplink, f"{uplink}p"):
+                assert subprocess.run(["ip", "-n", netns, "link", "set", link, "up"]).returncode == 0
+
+        source = str(Path(__file__).resolve().parents[2] / "src")
+        result = subprocess.run(["ip", "netns", "exec", netns, sys.executable, "-c", MULTIPATH_SCRIPT],
+                                capture_output=True, text=True, timeout=30,
+                                env={**os.environ, "PYTHONPATH": source})
+
+        assert result.returncode == 0, result.stderr
+
+        outcome = json.loads(result.stdout.splitlines()[-1])
+
+        assert outcome["table"] == ["10.0.1.1"]
+        assert outcome["rule"] == ["192.168.10.0", 24, "0x2", "0xff", "wan2", "101"]
+        assert outcome["rule_removed"] == ""
+        assert outcome["initial"] == [["10.0.1.1", 3], ["10.0.2.1", 1]]
+        assert outcome["failover"] == [["10.0.2.1", 1]]
+        assert outcome["restore"] == [["10.0.1.1", 3], ["10.0.2.1", 1]]
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import uuid
+from pathlib import Path
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_batch_releases_members_only_for_a_mode_change() -> None:
+    from routershell.lib.network_manager.network_operations.port_channel import (
+        BondMode,
+        LacpRate,
+        PortChannelBatch,
+        PortChannelSettings,
+        XmitHashPolicy,
+    )
+
+    lacp = PortChannelSettings()
+    active_backup = PortChannelSettings(BondMode.ACTIVE_BACKUP)
+
+    assert PortChannelBatch.create("port-channel1", lacp) == [
+        "link add name port-channel1 type bond miimon 100 mode 802.3ad xmit_hash_policy layer2 lacp_rate slow",
+    ]
+
+    assert PortChannelBatch.update("port-channel1", lacp, active_backup, ["Gig1", "Gig2"], shutdown=False) == [
+        "link set dev Gig1 nomaster",
+        "link set dev Gig2 nomaster",
+        "link set dev port-channel1 down",
+        "link set dev port-channel1 type bond mode active-backup",
+        "link set dev Gig1 down",
+        "link set dev Gig1 master port-channel1",
+        "link set dev Gig2 down",
+        "link set dev Gig2 master port-channel1",
+        "link set dev port-channel1 up",
+    ]
+
+    assert PortChannelBatch.update("port-channel1", lacp, lacp._replace(lacp_rate=LacpRate.FAST), ["Gig1"], shutdown=True) == [
+        "link set dev port-channel1 down",
+        "link set dev port-channel1 type bond lacp_rate fast",
+    ]
+
+    assert PortChannelBatch.update("port-channel1", lacp, lacp._replace(xmit_hash_policy=XmitHashPolicy.LAYER3_4),
+                                   ["Gig1"], shutdown=False) == [
+        "link set dev port-channel1 type bond xmit_hash_policy layer3+4",
+    ]
+
+    # active-backup does not hash, the policy is only stored
+    assert PortChannelBatch.update("port-channel1", active_backup,
+                                   active_backup._replace(xmit_hash_policy=XmitHashPolicy.LAYER3_4), ["Gig1"], False) == []
+
+
+def test_etherchannel_summary_flags() -> None:
+    from routershell.lib.cli.show.port_channel_show import PortChannelShow
+    from routershell.lib.network_manager.network_operations.port_channel import PortChannelSummary
+
+    ip_link_show = (
+        '[{"ifname": "port-channel1", "flags": ["BROADCAST", "MASTER", "UP", "LOWER_UP"],'
+        '  "linkinfo": {"info_kind": "bond", "info_data": {"mode": "802.3ad"}}},'
+        ' {"ifname": "Gig1", "master": "port-channel1", "linkinfo": {"info_slave_kind": "bond",'
+        '  "info_slave_data": {"state": "ACTIVE", "mii_status": "UP"}}},'
+        ' {"ifname": "Gig2", "master": "port-channel1", "linkinfo": {"info_slave_kind": "bond",'
+        '  "info_slave_data": {"state": "BACKUP", "mii_status": "UP"}}},'
+        ' {"ifname": "Gig3", "master": "port-channel1", "linkinfo": {"info_slave_kind": "bond",'
+        '  "info_slave_data": {"state": "BACKUP", "mii_status": "DOWN"}}},'
+        ' {"ifname": "port-channel2", "flags": ["BROADCAST", "MASTER"],'
+        '  "linkinfo": {"info_kind": "bond", "info_data": {"mode": "active-backup"}}},'
+        ' {"ifname": "Gig4", "master": "br0", "linkinfo": {"info_slave_kind": "bridge"}}]'
+    )
+
+    summary = PortChannelSummary.parse(ip_link_show)
+
+    assert summary == [
+        {"PortChannel": "port-channel1", "Flags": "U", "Mode": "802.3ad", "Protocol": "LACP",
+         "Ports": [("Gig1", "P"), ("Gig2", "s"), ("Gig3", "D")]},
+        {"PortChannel": "port-channel2", "Flags": "D", "Mode": "active-backup", "Protocol": "-", "Ports": []},
+    ]
+    assert "port-channel1(U)" in PortChannelShow.format_summary(summary)
+    assert "Gig1(P) Gig2(s) Gig3(D)" in PortChannelShow.format_summary(summary)
+
+
+def test_port_channel_membership_and_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.port_channel_db import PortChannelDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+    from routershell.lib.network_manager.common.interface import InterfaceType
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    PortChannelDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    pc_db = PortChannelDatabase()
+
+    assert pc_db.add_port_channel_db("port-channel1") == STATUS_OK
+    assert pc_db.add_port_channel_db("port-channel1") == STATUS_NOK
+
+    for interface_name in ("Gig1", "Gig2"):
+        assert rsdb.insert_interface(interface_name, InterfaceType.ETHERNET).status == STATUS_OK
+        assert pc_db.update_interface_port_channel_group_db(interface_name, "port-channel1") == STATUS_OK
+
+    assert pc_db.update_interface_port_channel_group_db("Gig1", "port-channel9") == STATUS_NOK
+    assert pc_db.get_port_channel_members_db("port-channel1") == ["Gig1", "Gig2"]
+    assert pc_db.update_port_channel_db("port-channel1", mode="balance-xor", xmit_hash_policy="layer3+4") == STATUS_OK
+    assert pc_db.get_port_channel_db("port-channel1") == {
+        "Mode": "balance-xor", "XmitHashPolicy": "layer3+4", "LacpRate": "slow", "ShutdownStatus": True}
+
+    assert RouterConfiguration()._get_global_port_channel_config() == [
+        "", "interface port-channel1", " mode balance-xor", " xmit hash-policy layer3+4", " shutdown", "end", "",
+    ]
+    assert " channel group port-channel1" in RouterConfiguration()._get_interface_settings()
+    assert "interface port-channel1" not in RouterConfiguration()._get_interface_settings()
+
+    assert pc_db.del_port_channel_db("port-channel1") == STATUS_NOK
+
+    for interface_name in ("Gig1", "Gig2"):
+        assert pc_db.update_interface_port_channel_group_db(interface_name, "port-channel1", remove=True) == STATUS_OK
+
+    assert pc_db.del_port_channel_db("port-channel1") == STATUS_OK
+    assert not pc_db.does_port_channel_exist_db("port-channel1")
+
+
+def test_port_channel_over_veth_pairs_in_a_network_namespace() -> None:
+    import pytest
+
+    from routershell.lib.network_manager.network_operations.port_channel import (
+        BondMode,
+        PortChannelBatch,
+        PortChannelSettings,
+        PortChannelSummary,
+    )
+
+    if os.geteuid() != 0 or shutil.which("ip") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    netns = f"rs-pc-{uuid.uuid4().hex[:8]}"
+
+    def ip(*args: str, stdin: str | None = None) -> subprocess.CompletedProcess:
+        return subprocess.run(["ip", "-n", netns, *args], input=stdin, capture_output=True, text=True)
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    try:
+        for index in (0, 1):
+            assert ip("link", "add", f"m{index}", "type", "veth", "peer", "name", f"p{index}").returncode == 0
+            assert ip("link", "set", "dev", f"p{index}", "up").returncode == 0
+
+        lines = PortChannelBatch.create("port-channel1", PortChannelSettings(BondMode.ACTIVE_BACKUP))
+
+        if ip("-batch", "-", stdin="\n".join(lines) + "\n").returncode:
+            pytest.skip("bonding is not available in this kernel")
+
+        lines = PortChannelBatch.enslave("port-channel1", ["m0", "m1"]) + ["link set dev port-channel1 up"]
+        assert ip("-batch", "-", stdin="\n".join(lines) + "\n").returncode == 0
+
+        summary = PortChannelSummary.parse(ip("-j", "-d", "link", "show").stdout)
+
+        assert [row["PortChannel"] for row in summary] == ["port-channel1"]
+        assert summary[0]["Mode"] == "active-backup"
+        assert sorted(port for port, _ in summary[0]["Ports"]) == ["m0", "m1"]
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)
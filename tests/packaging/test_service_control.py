@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+
+class FakeSystemctl:
+    """Each unit takes `delay` seconds to start and `ready` more seconds to report active."""
+
+    def __init__(self, units: dict[str, tuple[float, float]]):
+        self.units = units
+        self.active: dict[str, float] = {}
+        self.commands: list[list[str]] = []
+        self.failed: set[str] = set()
+
+    async def __call__(self, command: list[str]):
+        from routershell.lib.network_manager.common.run_commands import RunResult
+
+        self.commands.append(command)
+        verb, unit = command[1], command[-1]
+
+        if verb in ('start', 'restart'):
+            delay, ready = self.units[unit]
+            await asyncio.sleep(delay)
+
+            if unit in self.failed:
+                return RunResult('', 'Job failed', 1, command)
+
+            self.active[unit] = time.monotonic() + ready
+
+        elif verb == 'stop':
+            self.active.pop(unit, None)
+
+        elif verb == 'show':
+            ready_at = self.active.get(unit)
+
+            if ready_at is None:
+                return RunResult('ActiveState=inactive\nMainPID=0\n', '', 0, command)
+
+            if time.monotonic() < ready_at:
+                return RunResult('ActiveState=activating\nMainPID=0\n', '', 0, command)
+
+            return RunResult(f'ActiveState=active\nMainPID={1000 + len(unit)}\n', '', 0, command)
+
+        return RunResult('', '', 0, command)
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.system.init_system import InitSystem
+    from routershell.lib.system.system_service_control.system_service_control import AsyncServiceControl
+
+    Singleton._instances.pop(AsyncServiceControl, None)
+    controller = AsyncServiceControl()
+    controller.init_system = InitSystem.SYSTEMD
+    monkeypatch.setattr(controller, "READY_POLL_INTERVAL", 0.01)
+
+    yield controller
+
+    Singleton._instances.pop(AsyncServiceControl, None)
+
+
+def test_services_start_concurrently_and_wait_for_readiness(controller, monkeypatch, capsys) -> None:
+    from routershell.lib.cli.show.services_show import ServicesShow
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.system.system_service_control.system_service_control import (
+        ServiceState,
+        SysServCntrlAction,
+    )
+
+    systemctl = FakeSystemctl({"dnsmasq": (0.2, 0.1), "hostapd": (0.2, 0.1), "telnet.service": (0.2, 0.1)})
+    monkeypatch.setattr(controller, "_exec", systemctl)
+
+    ServicesShow().services()
+    assert capsys.readouterr().out == "No services started\n"
+
+    started = time.monotonic()
+    assert controller.control({name: SysServCntrlAction.START for name in systemctl.units}) == STATUS_OK
+    elapsed = time.monotonic() - started
+
+    # Three daemons of 0.3s each are ready in about 0.3s, not 0.9s
+    assert 0.3 <= elapsed < 0.6
+
+    status = controller.get_status()
+    assert [(s.service_name, s.action, s.state, s.main_pid) for s in status] == [
+        ("dnsmasq", SysServCntrlAction.START, ServiceState.ACTIVE, 1007),
+        ("hostapd", SysServCntrlAction.START, ServiceState.ACTIVE, 1007),
+        ("telnet.service", SysServCntrlAction.START, ServiceState.ACTIVE, 1014)]
+    assert all(0.3 <= s.latency < 0.6 for s in status)
+
+    ServicesShow().services()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ["Service", "Action", "State", "PID", "Issued", "Latency", "(ms)"]
+    assert lines[2].split()[:4] == ["dnsmasq", "start", "Active", "1007"]
+
+    # A failed start and a service that never becomes ready are reported
+    systemctl.failed.add("hostapd")
+    monkeypatch.setattr(controller, "READY_TIMEOUT", 0.05)
+    systemctl.units["dnsmasq"] = (0.0, 5.0)
+    assert controller.control({"dnsmasq": SysServCntrlAction.RESTART, "hostapd": SysServCntrlAction.RESTART,
+                               "telnet.service": SysServCntrlAction.STOP}) == STATUS_NOK
+
+    assert [(s.service_name, s.action, s.state, s.main_pid) for s in controller.get_status()] == [
+        ("dnsmasq", SysServCntrlAction.RESTART, ServiceState.FAILED, None),
+        ("hostapd", SysServCntrlAction.RESTART, ServiceState.FAILED, None),
+        ("telnet.service", SysServCntrlAction.STOP, ServiceState.STOPPED, None)]
+    assert controller.get_status()[1].latency is None
+
+
+def test_service_actions_are_deferred_within_a_batch(controller, monkeypatch) -> None:
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.system.system_service_control.system_service_control import (
+        SysServCntrlAction,
+        SystemServiceControl,
+    )
+
+    systemctl = FakeSystemctl({"dnsmasq": (0.0, 0.0), "telnet.service": (0.0, 0.0)})
+    monkeypatch.setattr(controller, "_exec", systemctl)
+
+    with controller.batch():
+        assert SystemServiceControl().service_control("dnsmasq", SysServCntrlAction.RESTART) == STATUS_OK
+
+        with controller.batch():
+            assert SystemServiceControl().service_control("dnsmasq", SysServCntrlAction.START) == STATUS_OK
+            assert SystemServiceControl().service_control("telnet.service", SysServCntrlAction.START) == STATUS_OK
+
+        assert systemctl.commands == []
+
+    assert sorted(c for c in systemctl.commands if c[1] != "show") == [
+        ["systemctl", "restart", "dnsmasq"], ["systemctl", "start", "telnet.service"]]
+
+    # A ConfigChangeBus handler runs within the CLI event loop
+    systemctl.commands.clear()
+
+    async def from_event_loop():
+        return SystemServiceControl().service_control("dnsmasq", SysServCntrlAction.STOP)
+
+    assert asyncio.run(from_event_loop()) == STATUS_OK
+    assert systemctl.commands == [["systemctl", "stop", "dnsmasq"]]
+
+
+def test_sysv_readiness_from_pid_file(controller, monkeypatch, tmp_path: Path) -> None:
+    from routershell.lib.system.init_system import InitSystem
+    from routershell.lib.system.system_service_control.system_service_control import (
+        ServiceState,
+        SysServCntrlAction,
+    )
+
+    controller.init_system = InitSystem.SYSV
+    monkeypatch.setattr(controller, "PID_FILE_DIRS", [str(tmp_path)])
+    (tmp_path / "hostapd.pid").write_text(f"{os.getpid()}\n")
+
+    async def no_status(command):
+        from routershell.lib.network_manager.common.run_commands import RunResult
+        return RunResult('', '', 3, command)
+
+    monkeypatch.setattr(controller, "_exec", no_status)
+
+    assert asyncio.run(controller._probe("hostapd")) == (ServiceState.ACTIVE, os.getpid())
+    assert asyncio.run(controller._probe("xinetd")) == (ServiceState.STARTING, None)
+    assert controller._control_command("xinetd", SysServCntrlAction.RESTART) == ["service", "xinetd", "restart"]
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import textwrap
+import uuid
+from pathlib import Path
+
+import pytest
+
+TEST_DB_FILE_ENV = "ROUTERSHELL_DB_FILE"
+
+
+def test_rtnetlink_route_and_link_messages() -> None:
+    from routershell.lib.network_manager.common.rtnetlink import LinkEvent, RouteEvent, Rtnetlink
+
+    request = Rtnetlink.build_route_request(7, True, "0.0.0.0/0", "10.0.1.1", 3, 10)
+    length, message_type, flags, sequence, _ = Rtnetlink._NLMSGHDR.unpack_from(request)
+
+    assert (length, message_type, sequence) == (len(request), Rtnetlink.RTM_NEWROUTE, 7)
+    assert flags & Rtnetlink.NLM_F_CREATE and flags & Rtnetlink.NLM_F_REPLACE
+    assert Rtnetlink.parse_route(message_type, request[Rtnetlink._NLMSGHDR.size:]) == RouteEvent(
+        "0.0.0.0/0", Rtnetlink.RT_TABLE_MAIN, 10, "10.0.1.1", 3)
+
+    request = Rtnetlink.build_route_request(8, False, "192.168.2.0/24", interface_index=4)
+    _, message_type, _, _, _ = Rtnetlink._NLMSGHDR.unpack_from(request)
+
+    assert Rtnetlink.parse_route(message_type, request[Rtnetlink._NLMSGHDR.size:]) == RouteEvent(
+        "192.168.2.0/24", Rtnetlink.RT_TABLE_MAIN, 0, None, 4, deleted=True)
+
+    payload = (Rtnetlink._IFINFOMSG.pack(socket.AF_UNSPEC, 1, 5, Rtnetlink.IFF_UP, 0)
+               + Rtnetlink._attribute(Rtnetlink.IFLA_IFNAME, b"Gig0\0"))
+
+    assert Rtnetlink.parse_link(Rtnetlink.RTM_NEWLINK, payload) == LinkEvent(5, "Gig0", True, False)
+    assert not Rtnetlink.parse_link(Rtnetlink.RTM_NEWLINK, payload).is_up()
+    assert Rtnetlink.parse_link(Rtnetlink.RTM_NEWROUTE, payload) is None
+
+
+def test_probe_requests() -> None:
+    from routershell.lib.network_manager.common.track_probe import ArpProbe, IcmpProbe
+
+    request = IcmpProbe.build_echo_request(0x1234, 1)
+
+    assert struct.unpack_from("!BBHHH", request)[0:1] == (IcmpProbe.ICMP_ECHO_REQUEST,)
+    assert IcmpProbe.checksum(request) == 0
+
+    request = ArpProbe.build_request(b"\x02\x00\x00\x00\x00\x01", "10.0.1.2", "10.0.1.1")
+
+    assert len(request) == 28
+    assert struct.unpack_from("!HHBBH", request) == (1, 0x0800, 6, 4, ArpProbe.ARPOP_REQUEST)
+    assert request[24:28] == socket.inet_aton("10.0.1.1")
+
+
+def test_track_monitor_survives_a_failing_handler(monkeypatch) -> None:
+    import selectors
+    import threading
+
+    from routershell.lib.common.constants import STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.network_manager.network_operations.track import TrackMonitor
+
+    Singleton._instances.pop(TrackMonitor, None)
+    monitor = TrackMonitor()
+    Singleton._instances.pop(TrackMonitor, None)
+
+    applied: list[tuple[list, list]] = []
+    probe_passes = threading.Event()
+
+    def apply(tracks: list, routes: list) -> None:
+        if not applied:
+            applied.append(([], []))
+            raise RuntimeError("apply failed")
+        applied.append((tracks, routes))
+
+    def send_probes(now: float) -> None:
+        probe_passes.set()
+        raise RuntimeError("probe failed")
+
+    monkeypatch.setattr(monitor, "_apply", apply)
+    monkeypatch.setattr(monitor, "_send_probes", send_probes)
+
+    monitor._wake = os.pipe()
+    os.set_blocking(monitor._wake[0], False)
+    monitor._selector = selectors.DefaultSelector()
+    monitor._selector.register(monitor._wake[0], selectors.EVENT_READ, monitor._read_wake)
+    monitor._thread = threading.Thread(target=monitor._run, daemon=True)
+    monitor._thread.start()
+
+    assert monitor.configure([], []) == STATUS_OK
+    assert probe_passes.wait(1.0)
+    assert monitor.configure([], []) == STATUS_OK
+    assert monitor._thread.is_alive()
+    assert len(applied) == 2
+
+
+def test_parse_track_and_static_route() -> None:
+    from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+    from routershell.lib.network_manager.network_operations.track import Track, TrackConfig, TrackType
+
+    assert Track.parse_track(["1", "interface", "Gig0"]) == TrackConfig(1, TrackType.INTERFACE, "Gig0")
+    assert Track.parse_track("2 icmp 8.8.8.8 source Gig0 interval 500".split()) == TrackConfig(
+        2, TrackType.ICMP, "Gig0", "8.8.8.8", 500, 3)
+    assert Track.parse_track("3 arp 10.0.1.1 interface Gig0 threshold 2".split()) == TrackConfig(
+        3, TrackType.ARP, "Gig0", "10.0.1.1", 1000, 2)
+
+    for args in ("0 interface Gig0", "1 icmp 8.8.8.300", "1 arp 10.0.1.1", "1 icmp 8.8.8.8 interval 1",
+                 "1 icmp 8.8.8.8 source", "1 icmp 8.8.8.8 interface Gig0", "1 bfd 10.0.1.1"):
+        with pytest.raises(ValueError):
+            Track.parse_track(args.split())
+
+    assert Route.parse_static_route("default 10.0.1.1 metric 10 track 1".split()) == StaticRoute(
+        "0.0.0.0/0", "10.0.1.1", 10, 1)
+    assert Route.parse_static_route("192.168.2.0 255.255.255.0 10.0.0.1".split()) == StaticRoute(
+        "192.168.2.0/24", "10.0.0.1")
+    assert Route.parse_static_route("10.9.0.0/16 Gig1".split()).interface_name() == "Gig1"
+
+    for args in ("10.9.0.1/16 Gig1", "10.9.0.0/16", "10.9.0.0/16 Gig1 metric", "10.9.0.0/16 Gig1 weight 0"):
+        with pytest.raises(ValueError):
+            Route.parse_static_route(args.split())
+
+
+def test_track_running_configuration(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(TEST_DB_FILE_ENV, str(tmp_path / "routershell.db"))
+
+    from routershell.lib.cli.show.router_configuration import RouterConfiguration
+    from routershell.lib.common.constants import STATUS_NOK, STATUS_OK
+    from routershell.lib.common.singleton import Singleton
+    from routershell.lib.db.route_db import RouteDatabase
+    from routershell.lib.db.router_config_db import RouterConfigurationDatabase
+    from routershell.lib.db.sqlite_db.router_shell_db import RouterShellDB
+
+    Singleton._instances.pop(RouterShellDB, None)
+    RouterShellDB.connection = None
+    RouterShellDB.connection_created = False
+    rsdb = RouterShellDB()
+    RouteDatabase.rsdb = rsdb
+    RouterConfigurationDatabase.rsdb = rsdb
+
+    route_db = RouteDatabase()
+
+    assert route_db.add_track(2, "icmp", "Gig0", "8.8.8.8", 500, 3) == STATUS_OK
+    assert route_db.add_track(1, "interface", "Gig0", None, 1000, 3) == STATUS_OK
+    assert route_db.add_track(3, "arp", "Gig1", "10.0.2.1", 1000, 3) == STATUS_OK
+    assert route_db.add_track(3, "arp", "Gig1", "10.0.2.1", 1000, 5) == STATUS_OK
+    assert route_db.add_static_route(254, "0.0.0.0/0", "10.0.1.1", 10, None, 1) == STATUS_OK
+    assert route_db.add_static_route(254, "0.0.0.0/0", "10.0.2.1", 20, None, None) == STATUS_OK
+    assert route_db.add_static_route(254, "0.0.0.0/0", "10.0.2.1", 20, None, 3) == STATUS_OK
+
+    assert RouterConfiguration()._get_global_route_config() == [
+        "track 1 interface Gig0",
+        "track 2 icmp 8.8.8.8 source Gig0 interval 500",
+        "track 3 arp 10.0.2.1 interface Gig1 threshold 5",
+        "ip route 0.0.0.0/0 10.0.1.1 metric 10 track 1",
+        "ip route 0.0.0.0/0 10.0.2.1 metric 20 track 3",
+        "",
+    ]
+
+    assert route_db.del_static_route(254, "0.0.0.0/0", "10.0.2.1", 30) == STATUS_NOK
+    assert route_db.del_static_route(254, "0.0.0.0/0", "10.0.2.1", 20) == STATUS_OK
+    assert route_db.del_track(4) == STATUS_NOK
+    assert route_db.del_track(3) == STATUS_OK
+    assert [row["TrackID"] for row in route_db.get_tracks()] == [1, 2]
+
+
+FAILOVER_SCRIPT = textwrap.dedent("""
+    import json, subprocess, time
+
+    from routershell.lib.network_manager.common.track_probe import IcmpProbe
+    from routershell.lib.network_manager.network_operations.route import Route, StaticRoute
+    from routershell.lib.network_manager.network_operations.track import TrackConfig, TrackMonitor, TrackType
+
+    def gateways():
+        output = subprocess.run(["ip", "-json", "-4", "route", "show", "default"], capture_output=True, text=True).stdout
+        return sorted(route["gateway"] for route in json.loads(output))
+
+    def wait_for(expected):
+        deadline = time.monotonic() + 1
+        while gateways() != expected and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return gateways()
+
+    backup = StaticRoute("0.0.0.0/0", "10.0.2.1", 20)
+    assert not Route().apply_static_route(backup, add=True)
+
+    monitor = TrackMonitor()
+    assert not monitor.configure([TrackConfig(1, TrackType.INTERFACE, "wan1")],
+                                 [StaticRoute("0.0.0.0/0", "10.0.1.1", 10, 1), backup])
+    result = {"initial": gateways()}
+
+    subprocess.run(["ip", "link", "set", "wan1p", "down"], check=True)
+    result["failover"] = wait_for(["10.0.2.1"])
+
+    subprocess.run(["ip", "link", "set", "wan1p", "up"], check=True)
+    result["restore"] = wait_for(["10.0.1.1", "10.0.2.1"])
+
+    subprocess.run(["ip", "route", "del", "default", "via", "10.0.1.1"], check=True)
+    result["repair"] = wait_for(["10.0.1.1", "10.0.2.1"])
+
+    status = monitor.get_status()[0]
+    result["state"] = status.state.value
+    result["transitions"] = [state.value for _, state in status.transitions]
+
+    probe = IcmpProbe("127.0.0.1")
+    probe.send()
+    time.sleep(0.1)
+    result["probe"] = probe.receive()
+
+    print(json.dumps(result))
+""")
+
+
+def test_wan_failover_in_a_network_namespace() -> None:
+    if os.geteuid() != 0 or shutil.which("ip") is None:
+        pytest.skip("needs root and iproute2 to create network namespaces")
+
+    netns = f"rs-track-{uuid.uuid4().hex[:8]}"
+
+    if subprocess.run(["ip", "netns", "add", netns], capture_output=True).returncode:
+        pytest.skip("unable to create a network namespace")
+
+    try:
+        for uplink, address in (("wan1", "10.0.1.2/24"), ("wan2", "10.0.2.2/24")):
+            assert subprocess.run(["ip", "-n", netns, "link", "add", uplink, "type", "veth",
+                                   "peer", "name", f"{uplink}p"]).returncode == 0
+            assert subprocess.run(["ip", "-n", netns, "addr", "add", address, "dev", uplink]).returncode == 0
+
+            for link in (uplink, f"{uplink}p"):
+                assert subprocess.run(["ip", "-n", netns, "link", "set", link, "up"]).returncode == 0
+
+        assert subprocess.run(["ip", "-n", netns, "link", "set", "lo", "up"]).returncode == 0
+
+        source = str(Path(__file__).resolve().parents[2] / "src")
+        result = subprocess.run(["ip", "netns", "exec", netns, sys.executable, "-c", FAILOVER_SCRIPT],
+                                capture_output=True, text=True, timeout=30,
+                                env={**os.environ, "PYTHONPATH": source})
+
+        assert result.returncode == 0, result.stderr
+
+        outcome = json.loads(result.stdout.splitlines()[-1])
+
+        assert outcome["initial"] == ["10.0.1.1", "10.0.2.1"]
+        assert outcome["failover"] == ["10.0.2.1"]
+        assert outcome["restore"] == ["10.0.1.1", "10.0.2.1"]
+        assert outcome["repair"] == ["10.0.1.1", "10.0.2.1"]
+        assert outcome["state"] == "Up"
+        assert outcome["transitions"] == ["Up", "Down", "Up"]
+        assert outcome["probe"] is True
+
+    finally:
+        subprocess.run(["ip", "netns", "del", netns], capture_output=True)